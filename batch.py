@@ -0,0 +1,207 @@
+"""
+Run a list update without the input() menus, like from cron:
+
+    (venv) $ python3 -m pizzapy.batch update --table guru_stock --list sp500 --workers 16
+    (venv) $ python3 -m pizzapy.batch update --table zacks_stock --symbols AMD NVDA --force
+    (venv) $ python3 -m pizzapy.batch resume --table guru_stock
+    (venv) $ python3 -m pizzapy.batch resume --table guru_stock --failed
+    (venv) $ python3 -m pizzapy.batch jobs --table guru_stock
+
+The progress is written to stdout as one JSON object per line, so a log collector or jq can read it:
+    {"event": "start", "table": "guru_stock", "list": "sp500", "total": 503}
+    {"event": "symbol", "i": 1, "total": 503, "symbol": "AMD", "result": "..."}
+    {"event": "summary", "total": 503, "succeeded": 500, "failed": 3, ...}
+Everything else printed by the model modules goes to stderr.
+
+Exit codes:
+    0   the failure rate is not above --max-failure-rate, or there is nothing to resume
+    1   the failure rate is above --max-failure-rate
+    2   invalid arguments, or the stock list of --list is empty
+
+A resume with nothing to resume writes a nothing_to_resume line and exits with 0, a cron retry of a finished job is not an error.
+
+List slugs are the keys of list_slug_dict in stock_list_model.py.
+
+"""
+
+# STANDARD LIBS
+
+import argparse
+from contextlib import redirect_stdout
+import json
+import sys
+from typing import Any, Dict, List, Optional, TextIO
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.general_terminal_model import upsert_symbols_terminal
+from pizzapy.database_update.job_state_model import find_latest_job, get_job_summaries, get_job_symbols, resume_status_tuple, retry_status_tuple
+from pizzapy.database_update.postgres_connection_model import close_database_resources
+from pizzapy.database_update.stock_list_model import list_slug_dict, table_function_dict
+from pizzapy.general_update.executor_model import shutdown_executors
+from pizzapy.general_update.http_client_model import close_http_sessions
+
+
+
+def write_json(stream: TextIO, event: str, **fields: Any) -> None:
+    """
+    * INDEPENDENT *
+    USED BY: run_update(), run_resume(), run_jobs()
+
+    default=str writes the dates and timestamps of the job summaries as strings.
+    """
+    stream.write(json.dumps({'event': event, **fields}, default=str) + '\n')
+    stream.flush()
+
+
+
+def get_failure_rate(summary: Dict[str, Any]) -> float:
+    """
+    * INDEPENDENT *
+    USED BY: finish_run()
+
+    A failed symbol and a buffered row which failed to be written both count as a failure.
+    A symbol whose table function returned a SymbolFailure, like a guru proxy without wealth_pc, is in summary['failed'] already.
+    """
+    total: int = summary['total']
+    return (summary['failed'] + summary.get('buffer_errors', 0)) / total if total else 0.0
+
+
+
+def finish_run(stream: TextIO, summary: Dict[str, Any], max_failure_rate: float) -> int:
+    """
+    DEPENDS ON: write_json(), get_failure_rate()
+    USED BY: run_update(), run_resume()
+    """
+    failure_rate: float = get_failure_rate(summary)
+    write_json(stream, 'summary', **summary, failure_rate=round(failure_rate, 4), max_failure_rate=max_failure_rate)
+    return 1 if failure_rate > max_failure_rate else 0
+
+
+
+def run_symbols(stream: TextIO, args: argparse.Namespace, symbols: List[str], list_name: Optional[str], job_id: Optional[str]) -> Dict[str, Any]:
+    """
+    DEPENDS ON: write_json()
+    IMPORTS: upsert_symbols_terminal()
+    USED BY: run_update(), run_resume()
+
+    stdout is redirected to stderr during the update, only the JSON lines are written to stream, which is the original stdout.
+    """
+    def on_result(i: int, length: int, symbol: str, result: str) -> None:
+        write_json(stream, 'symbol', i=i, total=length, symbol=symbol, result=result)
+
+    with redirect_stdout(sys.stderr):
+        summary: Dict[str, Any] = upsert_symbols_terminal(args.table, symbols, workers=args.workers, list_name=list_name, job_id=job_id, force=getattr(args, 'force', False), on_result=on_result)
+    return summary
+
+
+
+def run_update(args: argparse.Namespace, stream: TextIO) -> int:
+    """
+    DEPENDS ON: run_symbols(), finish_run(), write_json()
+    IMPORTS: list_slug_dict
+    USED BY: main()
+
+    An empty list is rejected with code 2 before a job is created, a job of no symbols would count as a successful update.
+    """
+    symbols: List[str] = args.symbols if args.symbols else list_slug_dict[args.list]
+    list_name: str = args.list if not args.symbols else 'symbols'
+    if not symbols:
+        print(f'the stock list {list_name} is empty, regenerate generated_stock_list.json', file=sys.stderr)
+        return 2
+    write_json(stream, 'start', table=args.table, list=list_name, total=len(symbols))
+    summary: Dict[str, Any] = run_symbols(stream, args, [symbol.upper() for symbol in symbols], list_name, None)
+    return finish_run(stream, summary, args.max_failure_rate)
+
+
+
+def run_resume(args: argparse.Namespace, stream: TextIO) -> int:
+    """
+    DEPENDS ON: run_symbols(), finish_run(), write_json()
+    IMPORTS: find_latest_job(), get_job_symbols()
+    USED BY: main()
+
+    --failed retries the failed symbols of the latest job, otherwise the latest interrupted job continues.
+    """
+    statuses = retry_status_tuple if args.failed else resume_status_tuple
+    job_id: Optional[str] = find_latest_job(args.table, statuses)
+    symbols: List[str] = get_job_symbols(job_id, statuses) if job_id is not None else []
+    if not symbols:
+        write_json(stream, 'nothing_to_resume', table=args.table, statuses=list(statuses))
+        return 0
+    write_json(stream, 'start', table=args.table, job_id=job_id, statuses=list(statuses), total=len(symbols))
+    summary: Dict[str, Any] = run_symbols(stream, args, symbols, None, job_id)
+    return finish_run(stream, summary, args.max_failure_rate)
+
+
+
+def run_jobs(args: argparse.Namespace, stream: TextIO) -> int:
+    """
+    DEPENDS ON: write_json()
+    IMPORTS: get_job_summaries()
+    USED BY: main()
+    """
+    for summary in get_job_summaries(args.table, limit=args.limit):
+        write_json(stream, 'job', **summary)
+    return 0
+
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """
+    * INDEPENDENT *
+    IMPORTS: list_slug_dict, table_function_dict
+    USED BY: main()
+    """
+    parser = argparse.ArgumentParser(prog='python3 -m pizzapy.batch', description='Run pizzapy list updates without the interactive menus.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    update_parser = subparsers.add_parser('update', help='update a stock list or some symbols')
+    update_parser.add_argument('--table', required=True, choices=sorted(table_function_dict))
+    target_group = update_parser.add_mutually_exclusive_group(required=True)
+    target_group.add_argument('--list', choices=sorted(list_slug_dict))
+    target_group.add_argument('--symbols', nargs='+', metavar='SYMBOL')
+    update_parser.add_argument('--force', action='store_true', help='update the symbols already updated on the current trading day too')
+
+    resume_parser = subparsers.add_parser('resume', help='continue the latest interrupted job of a table')
+    resume_parser.add_argument('--table', required=True, choices=sorted(table_function_dict))
+    resume_parser.add_argument('--failed', action='store_true', help='retry the failed symbols of the latest job instead')
+
+    for subparser in (update_parser, resume_parser):
+        subparser.add_argument('--workers', type=int, default=None, help='symbols updated at the same time (default LIST_UPDATE_WORKERS in /etc/config.json)')
+        subparser.add_argument('--max-failure-rate', type=float, default=0.05, help='exit with code 1 when the failed fraction is above this (default 0.05)')
+
+    jobs_parser = subparsers.add_parser('jobs', help='show the latest jobs of a table')
+    jobs_parser.add_argument('--table', required=True, choices=sorted(table_function_dict))
+    jobs_parser.add_argument('--limit', type=int, default=10)
+    return parser
+
+
+
+command_function_dict: Dict[str, Any] = {
+    'update': run_update,
+    'resume': run_resume,
+    'jobs': run_jobs,
+}
+
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    DEPENDS ON: make_parser(), command_function_dict
+    IMPORTS: shutdown_executors(), close_http_sessions(), close_database_resources()
+
+    The shared worker executors, http sessions and database connections are closed before exit, same as quit_program() in cli.py.
+    """
+    args: argparse.Namespace = make_parser().parse_args(argv)
+    try:
+        return command_function_dict[args.command](args, sys.stdout)
+    finally:
+        shutdown_executors()
+        close_http_sessions()
+        close_database_resources()
+
+
+
+if __name__ == '__main__':
+    sys.exit(main())
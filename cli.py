@@ -2,6 +2,12 @@
 Run the program:
 (venv) $ python3 -m pizzapy.cli
 
+Run a list update without the menus, like from cron, see batch.py:
+(venv) $ python3 -m pizzapy.batch update --table guru_stock --list sp500
+
+Run the daily updates after the US market close as a service, see scheduler.py:
+(venv) $ python3 -m pizzapy.scheduler
+
 
 generate_file_model cannot be directly run in this CLI module because the auto generated file is a component of this CLI program, we cannot overwrite it when CLI is running.
 
@@ -17,8 +23,25 @@ from typing import List
 
 from pizzapy.database_update.general_terminal_model import operate_stock_table
 
+from pizzapy.database_update.postgres_connection_model import close_database_resources
+
 from pizzapy.database_update.postgres_manage_database_script import manage_postgres_database
 
+from pizzapy.general_update.executor_model import shutdown_executors
+
+from pizzapy.general_update.http_client_model import close_http_sessions
+
+
+
+def quit_program() -> None:
+    """
+    The shared worker executors, http sessions and database connections are closed before exit.
+    """
+    shutdown_executors()
+    close_http_sessions()
+    close_database_resources()
+    exit()
+
 
 
 def start():
@@ -29,7 +52,7 @@ def start():
         '4': lambda: operate_stock_table('stock_technical'),
         '5': lambda: operate_stock_table('technical_one'),
         '9': lambda: manage_postgres_database(),
-        '0': lambda: exit(),
+        '0': lambda: quit_program(),
     }
     while True:
         subprocess.run(['clear'])
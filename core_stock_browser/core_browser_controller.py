@@ -1,7 +1,7 @@
 """
 AIM OF THIS MODULE: To create CoreBrowserController class. All other classes and functions are helpers of CoreBrowserController class.
 
-DEPENDS ON: core_browser_view.py, qt_model.py
+DEPENDS ON: core_browser_view.py, core_browser_query_model.py, qt_model.py
 
 USED BY: main_dock_controller.py
 """
@@ -9,7 +9,7 @@ USED BY: main_dock_controller.py
 
 from functools import partial
 import re
-from typing import Any, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 
 # THIRD PARTY LIBS
@@ -17,6 +17,7 @@ from pandas import DataFrame
 from PySide6.QtCore import QCoreApplication, QRegularExpression
 from PySide6.QtGui import QAction, QCloseEvent
 from PySide6.QtWidgets import QApplication, QCheckBox ,QGridLayout, QLineEdit ,QWidget
+from sqlalchemy.exc import SQLAlchemyError
 
 
 
@@ -29,7 +30,8 @@ from dimsumpy.qt.functions import closeEvent
 from pizzapy.database_update.stock_list_model import stock_list_dict
 from pizzapy.database_update.postgres_connection_model import execute_pandas_read
 
-from pizzapy.general_update.qt_model import MySortFilterProxyModel 
+from pizzapy.general_update.qt_model import DataFrameSortFilterProxyModel
+from pizzapy.core_stock_browser.core_browser_query_model import get_key_columns, get_page_size, get_table_columns, make_count_query, make_select_query
 from pizzapy.core_stock_browser.core_browser_view import CoreBrowserView
 
 
@@ -51,6 +53,7 @@ def make_dataframe(self) -> None:
 
     """
     self.clear()
+    self.query_loaded = False
     self.symbols_tuple_str = str(tuple(self.symbols_list)) if len(self.symbols_list) > 1 else str(tuple(self.symbols_list)).replace(',', '') # replace() is for single tuple
     self.table_name = self.table_list_combobox.currentText()
     query_clause: str = f' WHERE symbol IN {self.symbols_tuple_str} '  # prevent empty LineEdit
@@ -62,13 +65,14 @@ def make_dataframe(self) -> None:
 def make_tableview(self) -> None:
     """
         DEPENDS ON: make_dataframe()
-        IMPORTS: pandas, dimsumpy(DataFrameModel), MySortFilterProxyModel
+        IMPORTS: pandas, dimsumpy(DataFrameModel), DataFrameSortFilterProxyModel
         USED BY: load_stock_table(), load_stock_list_table()
 
         This function needs make_dataframe() to prepare self.df property.
+        The proxy model filters and sorts the typed columns of self.df, the filters of MySortFilterProxyModel compared the strings of every cell.
     """
     dataframe_model: DataFrameModel = DataFrameModel(self.df)
-    self.sort_filter_model = MySortFilterProxyModel()
+    self.sort_filter_model = DataFrameSortFilterProxyModel(self.df)
     self.sort_filter_model.setSourceModel(dataframe_model)
     self.pandas_tableview.setModel(self.sort_filter_model)
     self.statusbar.showMessage(f'{len(self.df)} rows')
@@ -76,16 +80,17 @@ def make_tableview(self) -> None:
 
 
 
-def make_grid(self) -> None:
+def make_grid(self, columns: List[str] = None) -> None:
     """
         DEPENDS ON: make_dataframe(), self.on_checkbox_changed(), self.on_floor_lineedit_changed(), self.on_ceiling_lineedit_changed()
         IMPORTS: pandas
-        USED BY: load_stock_table(), load_stock_list_table()
+        USED BY: load_stock_table(), load_stock_list_table(), load_query_table()
 
         This function needs make_dataframe() to prepare self.df property.
+        In the query mode there is no self.df yet, the columns of the table are given instead.
     """
     grid: QGridLayout = QGridLayout()   # If the Grid was created in the view, it will get deleted
-    dock_checkboxes: List[QCheckBox] = [QCheckBox(x) for x in self.df.columns]
+    dock_checkboxes: List[QCheckBox] = [QCheckBox(x) for x in (self.df.columns if columns is None else columns)]
     for count, checkbox in enumerate(dock_checkboxes):
         checkbox.setChecked(True)
         checkbox.stateChanged.connect(partial(self.on_checkbox_changed, index=count))
@@ -105,6 +110,108 @@ def make_grid(self) -> None:
 
 
 
+def read_grid_filters(self) -> Tuple[List[str], Dict[str, str], Dict[str, str]]:
+    """
+        USED BY: load_query_page()
+
+        returns the checked columns, and {column: text} of the floor and ceiling lineedits of the dock grid.
+    """
+    columns: List[str] = []
+    floor_dict: Dict[str, str] = {}
+    ceiling_dict: Dict[str, str] = {}
+    layout = self.dockwin.layout()
+    row_count: int = layout.count() // 3 if layout else 0
+    for i in range(row_count):
+        checkbox: QCheckBox = layout.itemAtPosition(i, 0).widget()
+        column: str = checkbox.text()
+        if checkbox.isChecked():
+            columns.append(column)
+        floor_dict[column] = layout.itemAtPosition(i, 1).widget().text()
+        ceiling_dict[column] = layout.itemAtPosition(i, 2).widget().text()
+    return columns, floor_dict, ceiling_dict
+
+
+
+def load_query_page(self) -> None:
+    """
+        DEPENDS ON: read_grid_filters(), make_tableview()
+        IMPORTS: make_select_query(), make_count_query(), get_page_size(), execute_pandas_read()
+        USED BY: load_query_table(), previous_page(), next_page(), self.query_timer
+
+        Only self.query_page is loaded, make_select_query() reads one more row than the page size, so the extra row tells if there is a next page.
+        Sorting by the column header only sorts the rows of the page.
+    """
+    columns, floor_dict, ceiling_dict = read_grid_filters(self)
+    page_size: int = get_page_size()
+    select_cmd, select_params = make_select_query(self.table_name, self.column_type_dict, columns, self.symbols_list, floor_dict, ceiling_dict, self.key_columns, self.query_page, page_size)
+    count_cmd, count_params = make_count_query(self.table_name, self.column_type_dict, self.symbols_list, floor_dict, ceiling_dict)
+    try:
+        df: DataFrame = execute_pandas_read(select_cmd, params=select_params)
+        row_count: int = int(execute_pandas_read(count_cmd, params=count_params).iloc[0, 0])
+    except SQLAlchemyError as error:
+        self.statusbar.showMessage(f'{self.table_name} query failed: {error}')
+        return
+    self.has_next_page = len(df) > page_size
+    self.df = df.iloc[:page_size]
+    make_tableview(self)
+    for i in range(len(self.df.columns)):
+        self.pandas_tableview.setColumnHidden(i, False)   # the unchecked columns are not selected, the hidden columns of the previous page must show again
+    first_row: int = self.query_page * page_size
+    self.page_label.setText(f'page {self.query_page + 1} / {max(1, -(-row_count // page_size))}')
+    self.previous_page_button.setEnabled(self.query_page > 0)
+    self.next_page_button.setEnabled(self.has_next_page)
+    self.statusbar.showMessage(f'rows {first_row + 1 if len(self.df) else 0} - {first_row + len(self.df)} of {row_count}')
+
+
+
+def load_query_table(self) -> None:
+    """
+        DEPENDS ON: make_grid(), load_query_page()
+        IMPORTS: get_table_columns(), get_key_columns()
+        USED BY: load_stock_table(), load_list_table()
+
+        The dock grid is made from the columns of the table, then the first page is loaded.
+    """
+    self.clear()
+    self.table_name = self.table_list_combobox.currentText()
+    try:
+        self.column_type_dict: Dict[str, str] = get_table_columns(self.table_name)
+        self.key_columns: Tuple[str, ...] = get_key_columns(self.table_name)
+    except SQLAlchemyError as error:
+        self.statusbar.showMessage(f'{self.table_name} columns failed: {error}')
+        return
+    self.query_loaded = True
+    self.query_page = 0
+    make_grid(self, list(self.column_type_dict))
+    load_query_page(self)
+
+
+
+def schedule_query_page(self) -> None:
+    """
+        USED BY: on_checkbox_changed(), on_floor_lineedit_changed(), on_ceiling_lineedit_changed()
+
+        A changed filter starts again from the first page, the timer restarts on every change, so only the last change sends a query.
+    """
+    self.query_page = 0
+    self.query_timer.start()
+
+
+
+def previous_page(self) -> None:
+    if self.query_loaded and self.query_page > 0:
+        self.query_page -= 1
+        load_query_page(self)
+
+
+
+def next_page(self) -> None:
+    if self.query_loaded and self.has_next_page:
+        self.query_page += 1
+        load_query_page(self)
+
+
+
 def load_stock_table(self) -> None:
     """
         DEPENDS ON: make_dataframe(), make_tableview(), make_grid()
@@ -114,7 +221,9 @@ def load_stock_table(self) -> None:
     """
     lineedit_str: str = self.symbols_lineedit.text().upper().strip()
     self.symbols_list: List[str] = re.split(r'[ ,]+', lineedit_str) if lineedit_str else []
-    if self.symbols_list:      # prevent empty lineedit string
+    if self.symbols_list and self.query_mode_checkbox.isChecked():
+        load_query_table(self)
+    elif self.symbols_list:      # prevent empty lineedit string
         make_dataframe(self)
         make_tableview(self)
         make_grid(self) 
@@ -125,12 +234,15 @@ def load_stock_table(self) -> None:
 
 def load_list_table(self) -> None:
     """
-    DEPENDS ON: make_dataframe(), make_tableview(), make_grid()
+    DEPENDS ON: make_dataframe(), make_tableview(), make_grid(), load_query_table()
     IMPORTS: stock_list_dict
     USED BY: CoreBrowserController
     """
     list_name: str = self.stock_list_combobox.currentText()
     self.symbols_list: List[str] = stock_list_dict.get(list_name)
+    if self.query_mode_checkbox.isChecked():
+        load_query_table(self)
+        return
     make_dataframe(self)
     make_tableview(self)
     make_grid(self)    
@@ -138,6 +250,10 @@ def load_list_table(self) -> None:
 
 def clear(self) -> None:
     self.pandas_tableview.setModel(None)
+    self.query_timer.stop()
+    self.page_label.setText('')
+    self.previous_page_button.setEnabled(False)
+    self.next_page_button.setEnabled(False)
     QWidget().setLayout(self.dockwin.layout()) # re-assign the existing layout
 
 
@@ -168,8 +284,12 @@ def table_list_combobox_changed(self) -> None:
 def on_checkbox_changed(self, value: int, index: int) -> None:
     """ 
     USED BY: make_grid() 
+
+    In the query mode, an unchecked column is not selected, the page is loaded again.
     """
-    if value == 2:    # value is 2 for checked state
+    if self.query_loaded:
+        schedule_query_page(self)
+    elif value == 2:    # value is 2 for checked state
         self.pandas_tableview.setColumnHidden(index, False)
     else:
         self.pandas_tableview.setColumnHidden(index, True)
@@ -184,7 +304,10 @@ def on_floor_lineedit_changed(self, text, col) -> None:
     the floor_lineedit is for input a number so as to filter out all numbers below that threshold. For example, I want to get rid of all stocks that have a earn_pc lower that 5%, I can input 5 to floor_lineedit.
 
     In string columns like 'symbol', when the symbol is matched, the row will be hidden. 
+    In the query mode, the floor is a condition of the WHERE clause instead.
     """
+    if self.query_loaded:
+        return schedule_query_page(self)
     self.sort_filter_model.setFilterByColumn(
         QRegularExpression(text, QRegularExpression.CaseInsensitiveOption), col)
 
@@ -195,6 +318,8 @@ def on_ceiling_lineedit_changed(self, text, col) -> None:
 
     As this method's Regular Expression does not have CaseInsensitiveOption, so it will fall into the else-clause in MySortFilterProxyModel's filterAcceptsRow() built-in virtual function.
     """
+    if self.query_loaded:
+        return schedule_query_page(self)
     self.sort_filter_model.setFilterByColumn(
         QRegularExpression(text), col)
 
@@ -206,14 +331,23 @@ class MakeConnects:
     USED BY: CoreBrowserController
 
     Run self.table_list_combobox_changed() once for filling placeholder text.
+    self.query_loaded is True when the table in the view is loaded in the query mode.
     """
     def __init__(ego, self) -> None:
+        self.query_loaded = False
+        self.previous_page_button.setEnabled(False)
+        self.next_page_button.setEnabled(False)
+
         self.table_list_combobox.currentIndexChanged.connect(self.table_list_combobox_changed)
         self.table_list_combobox_changed()
 
         self.load_list_button.clicked.connect(self.load_list_table)
         self.load_symbols_button.clicked.connect(self.load_stock_table)
 
+        self.previous_page_button.clicked.connect(self.previous_page)
+        self.next_page_button.clicked.connect(self.next_page)
+        self.query_timer.timeout.connect(self.load_query_page)
+
         self.show_columns_action.triggered.connect(self.show_columns)
         self.hide_columns_action.triggered.connect(self.hide_columns)
         self.clear_action.triggered.connect(self.clear)
@@ -224,7 +358,7 @@ class MakeConnects:
 
 class CoreBrowserController(CoreBrowserView):
     """
-    DEPENDS ON: MakeConnects, load_stock_list_table(), load_stock_table()
+    DEPENDS ON: MakeConnects, load_stock_list_table(), load_stock_table(), load_query_page(), previous_page(), next_page()
     IMPORTS: CoreBrowserView
 
     wrapper methods like self.load_list_table are necessary redundancies. I cannot skip them and directly call outer functions.
@@ -241,6 +375,15 @@ class CoreBrowserController(CoreBrowserView):
     def load_stock_table(self) -> None:
         return load_stock_table(self)
 
+    def load_query_page(self) -> None:
+        return load_query_page(self)
+
+    def previous_page(self) -> None:
+        return previous_page(self)
+
+    def next_page(self) -> None:
+        return next_page(self)
+
     def on_checkbox_changed(self, value: int, index: int) -> None:
         return on_checkbox_changed(self, value, index)
     
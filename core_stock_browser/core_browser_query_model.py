@@ -0,0 +1,179 @@
+"""
+USED BY: core_browser_controller.py
+
+The query mode of Core Browser. Without it, a list of 11k symbols loads every column of every row into pandas,
+and MySortFilterProxyModel compares the floor and ceiling of every cell in python.
+In the query mode, the column checkboxes become the SELECT list, the floor and ceiling lineedits become a parameterized WHERE clause,
+and only one page of rows is read with LIMIT / OFFSET, so the filtering uses the Postgres indexes and the table view only holds the visible page.
+
+The filters keep the meaning of MySortFilterProxyModel.filterAcceptsRow():
+    a number in the floor lineedit of a numeric column hides the rows below it, a number in the ceiling lineedit hides the rows above it
+    NULL is not a number, so the rows with a NULL cell are kept, same as the nan cells of the proxy model
+    'nan' or 'None' hides the NULL cells
+    any other text hides the rows whose cell is that text, like a symbol
+
+Optional keys in /etc/config.json:
+    CORE_BROWSER_PAGE_SIZE      (default 500) rows of one page in the query mode
+
+"""
+
+# STANDARD LIBS
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# THIRD PARTY LIBS
+from pandas import DataFrame
+
+
+# CUSTOM LIBS
+from batterypy.string.read import is_floatable
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.postgres_connection_model import execute_pandas_read
+from pizzapy.general_update.config_model import get_config_value
+
+
+
+numeric_type_set = {'smallint', 'integer', 'bigint', 'numeric', 'real', 'double precision'}
+
+null_text_set = {'nan', 'none', 'null'}
+
+
+
+@lru_cache(maxsize=None)
+def get_table_columns(table: str) -> Dict[str, str]:
+    """
+    * INDEPENDENT *
+    IMPORTS: execute_pandas_read()
+    USED BY: core_browser_controller.py
+
+    returns {column_name: data_type} in the order of the table, the column types decide how a floor or ceiling text is compared.
+    An unknown table returns an empty dict, so make_select_query() never puts an unknown name in the query.
+    """
+    cmd: str = 'SELECT column_name, data_type FROM information_schema.columns WHERE table_name = %(table)s ORDER BY ordinal_position'
+    df: DataFrame = execute_pandas_read(cmd, params={'table': table})
+    return dict(zip(df['column_name'], df['data_type']))
+
+
+
+@lru_cache(maxsize=None)
+def get_key_columns(table: str) -> Tuple[str, ...]:
+    """
+    * INDEPENDENT *
+    IMPORTS: execute_pandas_read()
+    USED BY: core_browser_controller.py
+
+    The primary key columns, like ('symbol', 'td'), they are the ORDER BY of the query mode, the pages need a stable order for OFFSET.
+    """
+    cmd: str = """SELECT kcu.column_name FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage kcu ON tc.constraint_name = kcu.constraint_name AND tc.table_name = kcu.table_name
+        WHERE tc.table_name = %(table)s AND tc.constraint_type = 'PRIMARY KEY' ORDER BY kcu.ordinal_position"""
+    df: DataFrame = execute_pandas_read(cmd, params={'table': table})
+    return tuple(df['column_name'])
+
+
+
+def quote_identifier(name: str) -> str:
+    """
+    * INDEPENDENT *
+    USED BY: make_filter_condition(), make_select_query()
+
+    The names come from information_schema, the quotes keep the upper case and special characters of a column name.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+
+def make_filter_condition(column: str, data_type: str, text: str, is_floor: bool, param: str) -> Tuple[Optional[str], Optional[Any]]:
+    """
+    DEPENDS ON: quote_identifier(), numeric_type_set, null_text_set
+    IMPORTS: is_floatable()
+    USED BY: make_where_clause()
+
+    returns (condition, value) of one lineedit, the value is passed as the parameter %(param)s, (None, None) means no filter.
+    """
+    text = text.strip()
+    if not text:
+        return None, None
+    quoted: str = quote_identifier(column)
+    if text.lower() in null_text_set:
+        return f'{quoted} IS NOT NULL', None
+    if data_type in numeric_type_set:
+        if not is_floatable(text):
+            return None, None
+        operator: str = '>=' if is_floor else '<='
+        return f'({quoted} {operator} %({param})s OR {quoted} IS NULL)', float(text)
+    return f'{quoted}::text IS DISTINCT FROM %({param})s', text
+
+
+
+def make_where_clause(column_type_dict: Dict[str, str], symbols: List[str], floor_dict: Dict[str, str], ceiling_dict: Dict[str, str]) -> Tuple[str, Dict[str, Any]]:
+    """
+    DEPENDS ON: make_filter_condition()
+    USED BY: make_select_query(), make_count_query()
+
+    The symbols are ONE array parameter, `symbol = ANY(%(symbols)s)` replaces the IN list of up to 11k literals.
+    floor_dict and ceiling_dict are {column: lineedit text}, a column which is not in column_type_dict is ignored.
+    """
+    conditions: List[str] = ['symbol = ANY(%(symbols)s)']
+    params: Dict[str, Any] = {'symbols': list(symbols)}
+    for prefix, text_dict, is_floor in (('floor', floor_dict, True), ('ceiling', ceiling_dict, False)):
+        for i, (column, text) in enumerate(text_dict.items()):
+            if column not in column_type_dict:
+                continue
+            param: str = f'{prefix}_{i}'
+            condition, value = make_filter_condition(column, column_type_dict[column], text, is_floor, param)
+            if condition is None:
+                continue
+            conditions.append(condition)
+            if value is not None:
+                params[param] = value
+    return ' WHERE ' + ' AND '.join(conditions), params
+
+
+
+def make_select_query(table: str, column_type_dict: Dict[str, str], columns: List[str], symbols: List[str], floor_dict: Dict[str, str], ceiling_dict: Dict[str, str],
+                      order_columns: Tuple[str, ...], page: int, page_size: int) -> Tuple[str, Dict[str, Any]]:
+    """
+    DEPENDS ON: make_where_clause(), quote_identifier()
+    USED BY: core_browser_controller.py
+
+    table is one of table_list_dict, the columns are checked against column_type_dict, symbol is always selected, a page without it is unreadable.
+    One more row than page_size is read, so the controller knows whether there is a next page without counting again.
+    """
+    selected_columns: List[str] = [column for column in column_type_dict if column in columns or column == 'symbol']
+    select_list: str = ', '.join(quote_identifier(column) for column in selected_columns)
+    where_clause, params = make_where_clause(column_type_dict, symbols, floor_dict, ceiling_dict)
+    order_by: str = ', '.join(quote_identifier(column) for column in order_columns if column in column_type_dict) or 'symbol'
+    params.update({'limit': page_size + 1, 'offset': page * page_size})
+    cmd: str = f'SELECT {select_list} FROM {quote_identifier(table)}{where_clause} ORDER BY {order_by} LIMIT %(limit)s OFFSET %(offset)s'
+    return cmd, params
+
+
+
+def make_count_query(table: str, column_type_dict: Dict[str, str], symbols: List[str], floor_dict: Dict[str, str], ceiling_dict: Dict[str, str]) -> Tuple[str, Dict[str, Any]]:
+    """
+    DEPENDS ON: make_where_clause(), quote_identifier()
+    USED BY: core_browser_controller.py
+    """
+    where_clause, params = make_where_clause(column_type_dict, symbols, floor_dict, ceiling_dict)
+    return f'SELECT count(*) FROM {quote_identifier(table)}{where_clause}', params
+
+
+
+def get_page_size() -> int:
+    """
+    * INDEPENDENT *
+    IMPORTS: get_config_value()
+    USED BY: core_browser_controller.py
+    """
+    return int(get_config_value('CORE_BROWSER_PAGE_SIZE', 500))
+
+
+
+
+if __name__ == '__main__':
+    column_type_dict = get_table_columns('guru_stock')
+    print(make_select_query('guru_stock', column_type_dict, list(column_type_dict), ['AMD', 'NVDA'], {'zscore': '3'}, {}, get_key_columns('guru_stock'), 0, get_page_size()))
@@ -12,9 +12,9 @@ USED BY: core_browser_controller.py
 
 
 # THIRD PARTY LIBS
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction
-from PySide6.QtWidgets import (QApplication, QComboBox, QDockWidget,
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDockWidget,
                                QHBoxLayout, QLabel, QLineEdit,
                                QMainWindow, QMenu, QMenuBar,
                                QPushButton,
@@ -100,6 +100,36 @@ class SymbolsRow:
 
 
 
+class QueryRow:
+    """
+    USED BY: CoreBrowserView
+
+    In the query mode, the dock filters are sent to Postgres and only one page of rows is loaded, see core_browser_query_model.py.
+    query_timer waits for the typing in the dock to stop before it reloads the page, so a query is not sent for every key.
+    """
+    def __init__(ego, self):
+        self.query_mode_checkbox: QCheckBox = QCheckBox('Query Mode')
+        self.query_mode_checkbox.setToolTip('Filter and page the rows in Postgres, only the visible page is loaded')
+        self.previous_page_button: QPushButton = QPushButton('< Previous')
+        self.previous_page_button.setAccessibleName('previous_page_button')
+        self.page_label: QLabel = QLabel('')
+        self.next_page_button: QPushButton = QPushButton('Next >')
+        self.next_page_button.setAccessibleName('next_page_button')
+        self.query_timer: QTimer = QTimer(self)
+        self.query_timer.setSingleShot(True)
+        self.query_timer.setInterval(400)
+
+        hbox: QHBoxLayout = QHBoxLayout()
+        hbox.addWidget(self.query_mode_checkbox)
+        hbox.addWidget(self.previous_page_button)
+        hbox.addWidget(self.page_label)
+        hbox.addWidget(self.next_page_button)
+        self.mainbox.addLayout(hbox)
+
+
+
+
+
 class MakeActions:
     """
     USED BY: CoreBrowserView
@@ -185,7 +215,7 @@ class MakeDock:
 
 class CoreBrowserView(QMainWindow):
     """
-    DEPENDS ON: SetupWindow, MakeActions, MakeMenuBar, MakeToolBar, MakeDock, TableRow, TableListRow, SymbolsRow
+    DEPENDS ON: SetupWindow, MakeActions, MakeMenuBar, MakeToolBar, MakeDock, TableRow, TableListRow, SymbolsRow, QueryRow
     IMPORTS: QMainWindow
     USED BY: core_browser_controller.py, main()
     """
@@ -200,6 +230,7 @@ class CoreBrowserView(QMainWindow):
         TableRow(self)     # Rows must be placed after mainbox creation in SetupWindow
         TableListRow(self)  
         SymbolsRow(self)
+        QueryRow(self)
 
 
 
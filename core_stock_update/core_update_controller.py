@@ -10,6 +10,7 @@ USED BY: main_dock_controller.py
 
 # STANDARD LIBS
 
+from functools import partial
 from itertools import dropwhile
 import re
 import time
@@ -31,7 +32,10 @@ from dimsumpy.qt.threads import MyThread
 
 # PROGRAM MODULES
 from pizzapy.core_stock_update.core_update_view import CoreUpdateView
-from pizzapy.database_update.stock_list_model import stock_list_dict, table_function_dict
+from pizzapy.database_update.fresh_symbol_model import remove_fresh_symbols
+from pizzapy.database_update.job_state_model import create_job, find_latest_job, get_job_symbols, make_flush_marker, resume_status_tuple, retry_status_tuple, run_tracked_symbol
+from pizzapy.database_update.postgres_buffer_model import UpsertBuffer, make_upsert_buffer
+from pizzapy.database_update.stock_list_model import stock_list_dict, table_function_dict, table_prepare_dict
 
 
 
@@ -65,12 +69,12 @@ def thread_finished(self, tid: float, box) -> None:
 
 
 
-def call_upsert(self, stockgen: Generator[str, None, None], progress_bar, progress_label) -> None:  
+def call_upsert(self, stockgen: Generator[str, None, None], progress_bar, progress_label, list_name: Optional[str], job_id: Optional[str], force: bool) -> None:  
     
     """
     * INDEPENDENT *
-    IMPORTS: table_function_dict, try_str()
-    USED BY: start_thread()
+    IMPORTS: table_function_dict, table_prepare_dict, try_str(), make_upsert_buffer(), create_job(), run_tracked_symbol(), make_flush_marker(), remove_fresh_symbols()
+    USED BY: launch_thread()
     
     # return type is not None
     This func runs in the QThread
@@ -80,13 +84,34 @@ def call_upsert(self, stockgen: Generator[str, None, None], progress_bar, progre
     
         debug_text: str = f"{i} / {self.list_length} {symbol} {result}"
             #QCoreApplication.processEvents()  # this line will crash the progrom for 2+ active threads
+
+    Each thread has its own UpsertBuffer for guru, zacks and option tables, the last batch is flushed when the loop ends.
+    stockgen is turned into a list, so that the prepare function of the table can run once for the whole list before the loop.
+
+    A list update becomes a new job of the job_state table here, so the insert does not block the window, a resumed job passes its job_id.
+    Without the Force checkbox, a new list update skips the symbols already updated on the current trading day, the progress bar range is shortened to the remaining symbols.
+    The symbols typed in the lineedit have no list_name, they are always updated, an explicit update of one symbol must not be dropped.
     """
-    func = table_function_dict.get(self.table_name) 
-    for i, symbol in enumerate(stockgen, start=1): # if the list is too long, program will crash
-        print(i, symbol)
-        result = try_str(func, symbol)
-        progress_bar.setValue(i)
-        progress_label.setText(f'{i}  {symbol} ')
+    symbols: List[str] = list(stockgen)
+    if job_id is None and list_name is not None:
+        symbols = remove_fresh_symbols(self.table_name, symbols, force=force)
+        progress_bar.setMaximum(len(symbols))
+    if self.table_name in table_prepare_dict:
+        try_str(table_prepare_dict[self.table_name], symbols)
+    if job_id is None and list_name is not None:
+        job_id = create_job(self.table_name, list_name, symbols)
+    buffer: Optional[UpsertBuffer] = make_upsert_buffer(self.table_name, on_flush=make_flush_marker(job_id))
+    func = table_function_dict.get(self.table_name) if buffer is None else partial(table_function_dict.get(self.table_name), buffer=buffer)
+    try:
+        for i, symbol in enumerate(symbols, start=1): # if the list is too long, program will crash
+            print(i, symbol)
+            result = try_str(run_tracked_symbol, job_id, func, symbol, is_buffered=buffer is not None)
+            progress_bar.setValue(i)
+            progress_label.setText(f'{i}  {symbol} ')
+    finally:
+        if buffer is not None:
+            errors: List[str] = buffer.flush()
+            print(f'{self.table_name} buffer: {buffer.upserted} rows upserted, {len(buffer.errors)} rows failed {errors}')
 
 
 
@@ -96,11 +121,24 @@ def call_upsert(self, stockgen: Generator[str, None, None], progress_bar, progre
 @list_confirmation
 def start_thread(self, stock_list: List[str]) -> None:
     """
-    DEPENDS ON: self.calendar_get_dates(), self.call_upsert(), self.thread_finished()
-    IMPORTS: MyThread, list_confiramtion()
+    DEPENDS ON: launch_thread()
+    IMPORTS: list_confiramtion()
     USED BY: update_core(), update_core_list()
 
-    [stockgen] is the arguments for self.call_upsert in MyThread
+    Only the Update List button makes a job in the job_state table, the symbols in the lineedit are not tracked.
+    """
+    list_name: Optional[str] = self.stock_list_combobox_text if self.sender().accessibleName() == 'update_list_button' else None
+    launch_thread(self, stock_list, list_name, None, self.force_checkbox.isChecked())
+
+
+
+def launch_thread(self, stock_list: List[str], list_name: Optional[str], job_id: Optional[str], force: bool) -> None:
+    """
+    DEPENDS ON: self.call_upsert(), self.thread_finished()
+    IMPORTS: MyThread
+    USED BY: start_thread(), resume_core_job()
+
+    [stockgen, progress_bar, progress_label, list_name, job_id, force] is the arguments for self.call_upsert in MyThread
 
     thread_id should NOT be self.thread_id as I may have multiple threads. If I use self.thread_id, it will overwrite the previous one.
 
@@ -113,11 +151,11 @@ def start_thread(self, stock_list: List[str]) -> None:
     For empty line_edit, the stock_list will be ['']
     """
     thread_id: float = time.time()
-    job_id: str = str(thread_id)[-3:]  
+    thread_job_id: str = str(thread_id)[-3:]  
     list_length = len(stock_list)
     progress_bar = QProgressBar()
     progress_bar.setRange(0, list_length)
-    progress_job_label = QLabel(f'JOB {job_id}: ')
+    progress_job_label = QLabel(f'JOB {thread_job_id}: ')
     progress_label = QLabel('               ')
     hbox = QHBoxLayout()
 
@@ -127,11 +165,11 @@ def start_thread(self, stock_list: List[str]) -> None:
     self.progress_box.addLayout(hbox)
 
     stockgen = (x for x in stock_list)
-    thread: MyThread = MyThread(self.call_upsert, lambda tid=thread_id, box=hbox: self.thread_finished(tid, box), [stockgen, progress_bar, progress_label])
+    thread: MyThread = MyThread(self.call_upsert, lambda tid=thread_id, box=hbox: self.thread_finished(tid, box), [stockgen, progress_bar, progress_label, list_name, job_id, force])
     self.threads_dict[thread_id] = thread
     thread.start()  # start the run() in QThread
     thread.wait(2) # prevent crash
-    message = f'JOB {job_id}: Update {list_length} stocks ({self.table_name}) \n'
+    message = f'JOB {thread_job_id}: Update {list_length} stocks ({self.table_name}) \n'
     self.browser.append(message)
     self.statusbar.showMessage(message)
 
@@ -183,6 +221,29 @@ def update_core_list(self) -> None:
 
 
 
+def resume_core_job(self) -> None:
+    """
+    DEPENDS ON: launch_thread()
+    IMPORTS: find_latest_job(), get_job_symbols(), QMessageBox
+    USED BY: CoreUpdateController
+
+    The Resume Job button continues the latest interrupted job of the selected table, the Retry Failed button runs the failed symbols of the latest job again.
+    It replaces typing a start index or a symbol in starting_lineedit, which still works for a new list update.
+    """
+    statuses = retry_status_tuple if self.sender().accessibleName() == 'retry_job_button' else resume_status_tuple
+    job_id: Optional[str] = find_latest_job(self.table_name, statuses)
+    stock_list: List[str] = get_job_symbols(job_id, statuses) if job_id is not None else []
+    if not stock_list:
+        self.statusbar.showMessage(f'No {" or ".join(statuses)} symbols in the {self.table_name} jobs')
+        return
+    question: str = f'Update {len(stock_list)} {" or ".join(statuses)} stocks of job {job_id} ({self.table_name}), starting from {stock_list[0]}?'
+    reply = QMessageBox.question(self, 'Resume Job', question, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+    if reply == QMessageBox.StandardButton.Yes:
+        launch_thread(self, stock_list, None, job_id, True)
+
+
+
+
 def table_list_combobox_changed(self) -> None:
     """
     """
@@ -227,6 +288,8 @@ class MakeConnects:
         self.stock_list_combobox_changed() 
         
         self.update_list_button.clicked.connect(self.update_core_list)
+        self.resume_job_button.clicked.connect(self.resume_core_job)
+        self.retry_job_button.clicked.connect(self.resume_core_job)
         self.update_symbols_button.clicked.connect(self.update_core)
         
         self.clear_button.clicked.connect(self.clear)
@@ -259,8 +322,11 @@ class CoreUpdateController(CoreUpdateView):
         return thread_finished(self, thread_id, box)
 
 
-    def call_upsert(self, stockgen: Generator[str, None, None], progress_bar, progress_label) -> None:  
-        return call_upsert(self, stockgen, progress_bar, progress_label)  
+    def call_upsert(self, stockgen: Generator[str, None, None], progress_bar, progress_label, list_name: Optional[str], job_id: Optional[str], force: bool) -> None:  
+        return call_upsert(self, stockgen, progress_bar, progress_label, list_name, job_id, force)  
+
+    def resume_core_job(self) -> None:
+        return resume_core_job(self)
 
 
     def update_core(self) -> None:
@@ -15,7 +15,7 @@ from typing import Tuple
 
 
 # THIRD PARTY LIBS
-from PySide6.QtWidgets import (QApplication, QComboBox,
+from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox,
                                QHBoxLayout, QLabel, QLineEdit, QMainWindow, QProgressBar, QPushButton,
                                QTextBrowser, QVBoxLayout, QWidget)
 
@@ -68,14 +68,23 @@ class StockListRow:
         self.stock_list_combobox.addItems(stock_list_dict.keys())
 
         self.starting_lineedit = QLineEdit()
+        self.force_checkbox = QCheckBox('Force')
+        self.force_checkbox.setToolTip('Update the stocks already updated on the current trading day too')
         self.update_list_button = QPushButton('Update List')
         self.update_list_button.setAccessibleName('update_list_button')
+        self.resume_job_button = QPushButton('Resume Job')
+        self.resume_job_button.setAccessibleName('resume_job_button')
+        self.retry_job_button = QPushButton('Retry Failed')
+        self.retry_job_button.setAccessibleName('retry_job_button')
 
         hbox = QHBoxLayout()
         hbox.addWidget(self.table_list_combobox)
         hbox.addWidget(self.stock_list_combobox)
         hbox.addWidget(self.starting_lineedit)
+        hbox.addWidget(self.force_checkbox)
         hbox.addWidget(self.update_list_button)
+        hbox.addWidget(self.resume_job_button)
+        hbox.addWidget(self.retry_job_button)
         self.mainbox.addLayout(hbox) 
 
 
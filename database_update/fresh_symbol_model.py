@@ -0,0 +1,75 @@
+"""
+
+USED BY:
+    database_update/general_terminal_model.py
+    core_stock_update/core_update_controller.py
+
+guru_stock, zacks_stock and technical_one keep one row per symbol with the td of its last update, but a list update scraped every symbol again.
+Before a new list update, ONE query finds the symbols whose td is already the current trading day, they are removed from the list unless the update is forced.
+With two updates a day, the second update only scrapes the symbols which failed or were added after the first one.
+
+"""
+
+# STANDARD LIBS
+
+from datetime import date
+from typing import List, Optional, Set
+
+
+# THIRD PARTY LIBS
+from pandas import DataFrame
+from sqlalchemy.exc import SQLAlchemyError
+
+
+# CUSTOM LIBS
+from batterypy.time.cal import get_trading_day_utc
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.postgres_connection_model import execute_pandas_read
+
+
+
+# tables with one row per symbol and a td column, the table names are put in the query, so only these names are accepted
+fresh_table_set: Set[str] = {'guru_stock', 'zacks_stock', 'technical_one'}
+
+
+
+def get_fresh_symbols(table: str, symbols: List[str], td: date) -> Set[str]:
+    """
+    * INDEPENDENT *
+    IMPORTS: execute_pandas_read()
+    USED BY: remove_fresh_symbols()
+    """
+    cmd: str = f'SELECT symbol FROM {table} WHERE td = %(td)s AND symbol = ANY(%(symbols)s)'
+    df: DataFrame = execute_pandas_read(cmd, params={'td': td, 'symbols': list(symbols)})
+    return set(df['symbol'])
+
+
+
+def remove_fresh_symbols(table: str, symbols: List[str], force: bool = False, td: Optional[date] = None) -> List[str]:
+    """
+    DEPENDS ON: fresh_table_set, get_fresh_symbols()
+    IMPORTS: get_trading_day_utc()
+    USED BY: upsert_symbols_terminal(), call_upsert()
+
+    returns the symbols which are not updated on td yet, in the original order, td is the current trading day by default.
+    A forced update, a table not in fresh_table_set or a failed query returns all symbols.
+    """
+    if force or table not in fresh_table_set or not symbols:
+        return symbols
+    td = td or get_trading_day_utc()
+    try:
+        fresh_symbols: Set[str] = get_fresh_symbols(table, symbols, td)
+    except SQLAlchemyError as error:
+        print(f'{table} freshness check skipped: {error}')
+        return symbols
+    remaining_symbols: List[str] = [symbol for symbol in symbols if symbol not in fresh_symbols]
+    print(f'{table}: {len(symbols) - len(remaining_symbols)} / {len(symbols)} symbols are already updated on {td}, they are skipped.')
+    return remaining_symbols
+
+
+
+
+if __name__ == '__main__':
+    print(remove_fresh_symbols('guru_stock', ['AMD', 'NVDA', 'MMM']))
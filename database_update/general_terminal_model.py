@@ -6,9 +6,9 @@ USED BY:
 
 # STANDARD LIBS
 
-
+from functools import partial
 from timeit import default_timer
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 
 # THIRD PARTY LIBS
@@ -18,27 +18,56 @@ from batterypy.control.trys import try_str
 
 
 # PROGRAM MODULES
-from pizzapy.database_update.stock_list_model import all_stocks, table_function_dict
+from pizzapy.database_update.stock_list_model import get_all_stocks, list_slug_dict, table_function_dict, table_host_dict, table_prepare_dict
+from pizzapy.database_update.postgres_buffer_model import UpsertBuffer, make_upsert_buffer
 from pizzapy.database_update.postgres_read_model import view_vertical_terminal
-from pizzapy.database_update.generated_stock_list import nasdaq_100_stocks, sp_500_stocks, sp_nasdaq_stocks, nasdaq_listed_stocks, nasdaq_traded_stocks
+from pizzapy.database_update.fresh_symbol_model import fresh_table_set, remove_fresh_symbols
+from pizzapy.database_update.job_state_model import create_job, find_latest_job, get_job_summaries, get_job_symbols, make_flush_marker, resume_status_tuple, retry_status_tuple, run_tracked_symbol
+from pizzapy.general_update.list_runner_model import print_symbol_result, run_symbols_concurrently
 
 
 
-def upsert_symbols_terminal(table: str, symbols: List[str]) -> None:
-    """
-    IMPORTS: table_function_dict
-    USED BY: upsert_symbols_interactive()
+def upsert_symbols_terminal(table: str, symbols: List[str], workers: Optional[int] = None, list_name: Optional[str] = None, job_id: Optional[str] = None, force: bool = False, on_result: Callable[[int, int, str, str], None] = print_symbol_result) -> Dict[str, Any]:
     """
-    length: int = len(symbols)
-    func = table_function_dict.get(table)
-    for i, symbol in enumerate(symbols, start=1):
-        result: str = try_str(func, symbol)
-        output: str = f'{i} / {length} {symbol} {result}'
-        print(output)
+    IMPORTS: table_function_dict, table_host_dict, table_prepare_dict, make_upsert_buffer(), run_symbols_concurrently(), create_job(), run_tracked_symbol(), make_flush_marker(), remove_fresh_symbols()
+    USED BY: upsert_symbols_interactive(), resume_job_interactive(), batch.py
+
+    guru, zacks and option rows are collected in an UpsertBuffer and written in batches, the finally clause flushes the last batch even when the loop is interrupted.
+    The prepare function of the table runs once for the whole list, like one grouped query for the latest stock_price dates.
 
+    Several symbols are updated at the same time (LIST_UPDATE_WORKERS in /etc/config.json, or the workers argument), the 'i / length SYMBOL result' lines are printed in the finishing order.
+    returns the summary of run_symbols_concurrently(), it is printed at the end too.
 
+    A list update with a list_name becomes a new job of the job_state table, a resumed or retried job passes its job_id instead.
+    The job_id is in the summary, it is None when the job is not tracked, buffer_errors is the number of buffered rows which failed to be written.
+    A buffered symbol of the job is marked done or failed by the flush which writes its row, not when its table function returns.
 
-def upsert_symbols_interactive(table: str, symbols: List[str]) -> None:
+    A new update of guru_stock, zacks_stock or technical_one skips the symbols already updated on the current trading day, unless force is True.
+    A resumed or retried job is not filtered, its symbols are chosen by their job status.
+    """
+    if job_id is None:
+        symbols = remove_fresh_symbols(table, symbols, force=force)
+    if table in table_prepare_dict:
+        try_str(table_prepare_dict[table], symbols)
+    if job_id is None and list_name is not None:
+        job_id = create_job(table, list_name, symbols)
+    buffer: Optional[UpsertBuffer] = make_upsert_buffer(table, on_flush=make_flush_marker(job_id))
+    table_func = table_function_dict.get(table) if buffer is None else partial(table_function_dict.get(table), buffer=buffer)
+    func = partial(run_tracked_symbol, job_id, table_func, is_buffered=buffer is not None)
+    try:
+        summary: Dict[str, Any] = run_symbols_concurrently(func, symbols, host=table_host_dict.get(table), workers=workers, on_result=on_result)
+        summary['job_id'] = job_id
+        print(f"{table}: {summary['succeeded']} / {summary['total']} succeeded in {summary['seconds']} seconds, failed: {list(summary['failed_symbols'])}, job: {job_id}")
+    finally:
+        if buffer is not None:
+            errors: List[str] = buffer.flush()
+            print(f'{table} buffer: {buffer.upserted} rows upserted, {len(buffer.errors)} rows failed {errors}')
+    summary['buffer_errors'] = len(buffer.errors) if buffer is not None else 0
+    return summary
+
+
+
+def upsert_symbols_interactive(table: str, symbols: List[str], list_name: Optional[str] = None) -> None:
     """
     DEPENDS ON: upsert_symbols_terminal()
     USED BY: make_actions_dict()
@@ -47,19 +76,53 @@ def upsert_symbols_interactive(table: str, symbols: List[str]) -> None:
     reply: str = input(f'\n\nAre you really want to UPDATE {length} stocks to {table} table (yes/no)? ')
     REPLY: str = reply.upper()
     if REPLY == 'YES':
-        upsert_symbols_terminal(table, symbols)
+        force: bool = table in fresh_table_set and input('Update the stocks already updated today too (y/N)? ').upper() == 'Y'
+        upsert_symbols_terminal(table, symbols, list_name=list_name, force=force)
     else:
         print(f'{table} - {length} stocks update cancelled.')
 
 
 
+def resume_job_interactive(table: str, statuses: Tuple[str, ...]) -> None:
+    """
+    DEPENDS ON: upsert_symbols_terminal()
+    IMPORTS: find_latest_job(), get_job_symbols()
+    USED BY: make_actions_dict()
+
+    statuses is resume_status_tuple to continue an interrupted job, or retry_status_tuple to run the failed symbols again.
+    """
+    job_id: Optional[str] = find_latest_job(table, statuses)
+    symbols: List[str] = get_job_symbols(job_id, statuses) if job_id is not None else []
+    if not symbols:
+        print(f'{table} - no job has {" or ".join(statuses)} symbols.')
+        return
+    reply: str = input(f'\n\nAre you really want to UPDATE {len(symbols)} {" or ".join(statuses)} stocks of job {job_id}, starting from {symbols[0]} (yes/no)? ')
+    if reply.upper() == 'YES':
+        upsert_symbols_terminal(table, symbols, job_id=job_id)
+    else:
+        print(f'{table} - job {job_id} cancelled.')
+
+
+
+def show_jobs_terminal(table: str) -> None:
+    """
+    * INDEPENDENT *
+    IMPORTS: get_job_summaries()
+    USED BY: make_actions_dict()
+    """
+    for summary in get_job_summaries(table):
+        print(f"{summary['job_id']}  {summary['list_name']}  total {summary['total']}  done {summary['done']}  failed {summary['failed']}  pending {summary['pending'] + summary['running']}  finished {summary['finished']}")
+
+
+
 def browse_symbol_loop(table: str) -> None:
     """
     * INDEPENDENT *
-    IMPORTS: all_stocks, view_vertical_terminal()
+    IMPORTS: get_all_stocks(), view_vertical_terminal()
     USED BY: make_actions_dict()
     """
     func = table_function_dict.get(table)
+    all_stocks: List[str] = get_all_stocks()
     while True:
         symbol: str = input(f'\n\nWhich SYMBOL do you want to check from {table} (input * before the symbol to update, input 0 to quit)? ')
         SYMBOL: str = symbol.upper()
@@ -80,10 +143,11 @@ def browse_symbol_loop(table: str) -> None:
 
 def upsert_symbol_loop(table: str) -> None:
     """
-    IMPORTS: all_stocks, table_function_dict, view_vertical_terminal()
+    IMPORTS: get_all_stocks(), table_function_dict, view_vertical_terminal()
     USED BY: make_actions_dict()
     """
     func = table_function_dict.get(table)
+    all_stocks: List[str] = get_all_stocks()
     while True:
         symbol: str = input(f'\n\nWhich SYMBOL do you want to UPSERT to {table} (input 0 to quit)? ')
         SYMBOL: str = symbol.upper()
@@ -118,6 +182,11 @@ def make_text_menu(table: str) -> str:
         11) Update {table} for Nasdaq 100
         12) Update {table} for S&P 500 + S&P 400 + Nasdaq 100
         13) Update {table} for Nasdaq Traded Stocks
+
+        Job operations:
+        20) Resume the latest interrupted {table} job
+        21) Retry the failed symbols of the latest {table} job
+        22) Show the latest {table} jobs
         
         0)  quit
         Choose your action: """
@@ -127,17 +196,22 @@ def make_text_menu(table: str) -> str:
 
 def make_actions_dict(table: str) -> Dict[str, Any]:
     """
-    DEPENDS ON: browse_symbol_loop(), upsert_symbol_loop(), upsert_symbols_interactive()
-    IMPORTS: get_sp_500(), get_nasdaq_100(), get_sp_nasdaq()
+    DEPENDS ON: browse_symbol_loop(), upsert_symbol_loop(), upsert_symbols_interactive(), resume_job_interactive(), show_jobs_terminal()
+    IMPORTS: list_slug_dict
     USED BY: operate_table()
+
+    The stock lists are read in the lambdas, so the menu does not read generated_stock_list.json before a list is chosen.
     """
     actions_dict: Dict[str, Any] = {
         '1': lambda: browse_symbol_loop(table),
         '2': lambda: upsert_symbol_loop(table),
-        '10': lambda: upsert_symbols_interactive(table, sp_500_stocks),
-        '11': lambda: upsert_symbols_interactive(table, nasdaq_100_stocks),
-        '12': lambda: upsert_symbols_interactive(table, sp_nasdaq_stocks),
-        '13': lambda: upsert_symbols_interactive(table, nasdaq_traded_stocks),
+        '10': lambda: upsert_symbols_interactive(table, list_slug_dict['sp500'], 'S&P 500'),
+        '11': lambda: upsert_symbols_interactive(table, list_slug_dict['nasdaq100'], 'Nasdaq 100'),
+        '12': lambda: upsert_symbols_interactive(table, list_slug_dict['sp_nasdaq'], 'S&P 500, 400 + Nasdaq 100'),
+        '13': lambda: upsert_symbols_interactive(table, list_slug_dict['nasdaq_traded'], 'Nasdaq Traded'),
+        '20': lambda: resume_job_interactive(table, resume_status_tuple),
+        '21': lambda: resume_job_interactive(table, retry_status_tuple),
+        '22': lambda: show_jobs_terminal(table),
     }
     return actions_dict
 
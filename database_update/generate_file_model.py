@@ -1,22 +1,24 @@
 """
-*** INDEPENDENT MODULE ***
-
 I can run this mode directly:
 
-    (venv) $ python3 generate_file_model.py
+    (venv) $ python3 -m pizzapy.database_update.generate_file_model
 
+generate_stock_list_file() fetches every source once and at the same time, the wikipedia pages through the shared sessions of http_client_model,
+so RESPONSE_CACHE_PATH in /etc/config.json also caches them, and the nasdaqtrader files by ftp.
+The old generated_stock_list.json is compared with the new one, the added and removed symbols of every list are printed.
 
 """
 
 # STANDARD LIBS
-import sys;sys.path.append('..')
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from io import StringIO
-import re
-import subprocess
+import json
+import math
+from pathlib import Path
 from timeit import timeit
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Callable, Dict, Iterable, List, Set, Union
 import urllib.request as request
 
 
@@ -26,8 +28,8 @@ import pandas
 from pandas.core.frame import DataFrame
 import requests
 
-# CUSTOM LIBS
-from dimsumpy.web.crawler import get_html_dataframes, get_html_soup
+# PROGRAM MODULES
+from pizzapy.general_update.http_client_model import get_html_dataframes, get_html_soup
 
 
 
@@ -44,7 +46,7 @@ bank_stocks_set: Set[str] = set(bank_stocks)
 def get_sp_400() -> Dict:
     """
     * INDEPENDENT *
-    IMPORTS: dimsumpy
+    IMPORTS: get_html_dataframes()
     execution time: 1 second
     """
     sp_400_url: str = 'https://en.wikipedia.org/wiki/List_of_S%26P_400_companies'
@@ -58,7 +60,7 @@ def get_sp_400() -> Dict:
 def get_sp_500() -> Dict:
     """
     * INDEPENDENT *
-    IMPORTS: dimsumpy
+    IMPORTS: get_html_dataframes()
     execution time: 1 second
 
     The S&P 500 index undergoes a quarterly rebalancing to ensure it accurately reflects the U.S. large-cap equity market. These rebalancing events typically occur after third Friday of March, June, September, and December. 
@@ -75,7 +77,7 @@ def get_sp_500() -> Dict:
 def get_nasdaq_100() -> Any:
     """
     * INDEPENDENT *
-    IMPORTS: dimsumpy
+    IMPORTS: get_html_soup()
     execution time: 1 second
 
     Note: 
@@ -98,22 +100,30 @@ def get_nasdaq_100() -> Any:
 
 
 
-def get_sp_nasdaq() -> List[str]:
+def make_sp_nasdaq(sp_500_stocks: List[str], sp_400_stocks: List[str], nasdaq_100_stocks: List[str]) -> List[str]:
     """
-    DEPENDS ON: get_sp_500(), get_nasdaq_100()
-    USED BY: guru_operation_script.py
+    * INDEPENDENT *
+    USED BY: get_sp_nasdaq(), prepare_stock_list_data()
 
     The result is not including bank stocks.
     """
-    sp_500_stocks: List[str] = list(get_sp_500().keys())
-    sp_400_stocks: List[str] = list(get_sp_400().keys())
-    nasdaq_100_stocks: List[str] = list(get_nasdaq_100().keys())
     sp_nasdaq_set: Set[str] = set(sp_500_stocks + sp_400_stocks + nasdaq_100_stocks)
     sp_nasdaq_stocks: List[str] = sorted(list(sp_nasdaq_set - bank_stocks_set))
     return sp_nasdaq_stocks
 
 
 
+def get_sp_nasdaq() -> List[str]:
+    """
+    DEPENDS ON: get_sp_500(), get_sp_400(), get_nasdaq_100(), make_sp_nasdaq()
+    USED BY: guru_operation_script.py
+
+    prepare_stock_list_data() does not call this function, it makes the list from the pages it has fetched already.
+    """
+    return make_sp_nasdaq(list(get_sp_500().keys()), list(get_sp_400().keys()), list(get_nasdaq_100().keys()))
+
+
+
 
 
 def get_nasdaq_listed() -> List[str]:
@@ -152,142 +162,235 @@ def get_nasdaq_traded() -> List[str]:
     return stock_list
 
 
-def get_option_traded() -> List[str]:
+def read_option_roots(lines: Iterable[bytes]) -> Set[str]:
     """
     * INDEPENDENT *
-    IMPORTS: urllib, pandas
-    execution time: 2 minutes
-    file size is about 50mb, need several minutes to process, unique symbols are about 3129
+    USED BY: get_option_traded()
+
+    options.txt has one line per option series, like b'AAPL|N|C|12/20/2024|150|AAPL|Apple Inc. - Common Stock|N\\r\\n',
+    only the root symbol before the first | is kept, so the memory is the set of about 3000 symbols, not the 50mb file.
+    The first line is the header and the last line is like b'File Creation Time: 1119202417:14||||||'.
+    """
+    roots: Set[str] = set()
+    for i, line in enumerate(lines):
+        root: bytes = line.split(b'|', 1)[0].strip()
+        if i == 0 or not root or root.startswith(b'File Creation Time'):
+            continue
+        roots.add(root.decode())
+    return roots
+
+
+
+def get_option_traded() -> List[str]:
+    """
+    DEPENDS ON: read_option_roots()
+    IMPORTS: urllib
+    USED BY: prepare_stock_list_data(), update_option_traded_file()
+    execution time: seconds, limited by the download
+
+    The response is read line by line as the bytes arrive, the old code decoded the whole 50mb file into a DataFrame, which took 2 minutes.
+    unique symbols are about 3129
     """
     url1 = 'ftp://ftp.nasdaqtrader.com/SymbolDirectory/options.txt'
     with request.urlopen(url1) as r:
-        text = r.read().decode()
-    df_nasdaq: DataFrame = pandas.read_csv(StringIO(text), sep='|', header=0)
-    stocks: List[str] = list(df_nasdaq.iloc[:-1, 0])
-    option_stocks: List[str] = sorted(list(set(stocks)))
+        option_stocks: List[str] = sorted(read_option_roots(r))
     return option_stocks
 
 
 
-def prepare_stock_list_file_content() -> str:
+def replace_nan(stocks_dict: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    * INDEPENDENT *
+    USED BY: prepare_stock_list_data()
+
+    the empty cells of the wikipedia tables are nan, json.dump() would write NaN which is not valid JSON, so they become None (null)
+    """
+    return {symbol: {k: (None if isinstance(v, float) and math.isnan(v) else v) for k, v in row.items()} for symbol, row in stocks_dict.items()}
+
+
+
+# data name => the function which fetches it, every source is fetched once by fetch_sources()
+source_function_dict: Dict[str, Callable[[], Any]] = {
+    'sp_500_dict': get_sp_500,
+    'sp_400_dict': get_sp_400,
+    'nasdaq_100_dict': get_nasdaq_100,
+    'nasdaq_listed_stocks': get_nasdaq_listed,
+    'nasdaq_traded_stocks': get_nasdaq_traded,
+    'option_traded_stocks': get_option_traded,
+}
+
+
+STOCK_LIST_PATH: Path = Path(__file__).with_name('generated_stock_list.json')
+
+
+
+def fetch_sources() -> Dict[str, Any]:
+    """
+    DEPENDS ON: source_function_dict
+    USED BY: prepare_stock_list_data()
+
+    The sources are on 3 different hosts and each one waits for its download, so threads fetch all of them at the same time,
+    the regeneration takes as long as the slowest source instead of the sum of all.
+    A failed source fails the whole regeneration, a file with a missing list is never written.
+    """
+    with ThreadPoolExecutor(max_workers=len(source_function_dict)) as executor:
+        future_dict: Dict[str, Future] = {name: executor.submit(func) for name, func in source_function_dict.items()}
+        source_dict: Dict[str, Any] = {}
+        for name, future in future_dict.items():
+            try:
+                source_dict[name] = future.result()
+            except Exception as error:
+                print(f'{name} failed: {error}')
+                raise
+    return source_dict
+
+
+
+def prepare_stock_list_data() -> Dict[str, Any]:
     """
-    DEPENDS ON: get_sp_500(), get_sp_nasdaq(), get_nasdaq_100(),  get_nasdaq_listed(), get_nasdaq_traded(), get_option_traded()
+    DEPENDS ON: fetch_sources(), make_sp_nasdaq(), replace_nan()
     IMPORTS: datetime
     USED BY: generate_stock_list_file() 
 
-    when I replace string BY re or replace('nan,', 'None,'), it will miss some items with special comma char, so I have to use ': nan'
+    The keys are the names of stock_list_name_list in generated_stock_list.py.
+    sp_nasdaq_stocks is made from the fetched S&P 500, S&P 400 and Nasdaq 100 pages, get_sp_nasdaq() downloaded them a second time.
     """
     current_time: datetime = datetime.now().replace(second=0, microsecond=0)
-    file_comment: str = f'""" THIS FILE IS GENERATED AT {current_time} BY generate_stock_list_file() FUNCTION IN generate_file_model.py """'
-    file_import: str = 'from typing import Dict, List'
-
-    sp_500_dict: Dict =  get_sp_500()
-    sp_500_dict_comment: str = f'# {len(sp_500_dict)}'
-    sp_500_raw_string: str = f'sp_500_dict: Dict = {sp_500_dict}'
-    sp_500_dict_variable: str = re.sub(': nan', ': None', sp_500_raw_string)
-
-    sp_400_dict: Dict =  get_sp_400()
-    sp_400_dict_comment: str = f'# {len(sp_400_dict)}'
-    sp_400_raw_string: str = f'sp_400_dict: Dict = {sp_400_dict}'
-    sp_400_dict_variable: str = re.sub(': nan', ': None', sp_400_raw_string)
-
-    nasdaq_100_dict: Dict =  get_nasdaq_100()
-    nasdaq_100_dict_comment: str = f'# {len(nasdaq_100_dict)}'
-    nasdaq_100_dict_variable: str = f'nasdaq_100_dict: Dict = {nasdaq_100_dict}'
-
-    sp_500: List[str] =  list(sp_500_dict.keys())
-    sp_500_comment: str = f'# {len(sp_500)}'
-    sp_500_variable: str = f'sp_500_stocks: List[str] = {sp_500}'
-    
-    sp_400: List[str] =  list(sp_400_dict.keys())
-    sp_400_comment: str = f'# {len(sp_400)}'
-    sp_400_variable: str = f'sp_400_stocks: List[str] = {sp_400}'
-
-    nasdaq_100: List[str] = list(nasdaq_100_dict.keys())
-    nasdaq_100_comment: str = f'# {len(nasdaq_100)}'
-    nasdaq_100_variable: str = f'nasdaq_100_stocks: List[str] = {nasdaq_100}'
+    source_dict: Dict[str, Any] = fetch_sources()
+    sp_500_dict: Dict = replace_nan(source_dict['sp_500_dict'])
+    sp_400_dict: Dict = replace_nan(source_dict['sp_400_dict'])
+    nasdaq_100_dict: Dict = source_dict['nasdaq_100_dict']
+    sp_500_stocks: List[str] = list(sp_500_dict.keys())
+    sp_400_stocks: List[str] = list(sp_400_dict.keys())
+    nasdaq_100_stocks: List[str] = list(nasdaq_100_dict.keys())
+
+    data: Dict[str, Any] = {
+        'generated': str(current_time),
+        'sp_500_dict': sp_500_dict,
+        'sp_400_dict': sp_400_dict,
+        'nasdaq_100_dict': nasdaq_100_dict,
+        'sp_500_stocks': sp_500_stocks,
+        'sp_400_stocks': sp_400_stocks,
+        'nasdaq_100_stocks': nasdaq_100_stocks,
+        'sp_nasdaq_stocks': make_sp_nasdaq(sp_500_stocks, sp_400_stocks, nasdaq_100_stocks),
+        'nasdaq_listed_stocks': source_dict['nasdaq_listed_stocks'],
+        'nasdaq_traded_stocks': source_dict['nasdaq_traded_stocks'],
+        'option_traded_stocks': source_dict['option_traded_stocks'],
+    }
+    return data
+
+
+
+def read_stock_list_file() -> Dict[str, Any]:
+    """
+    * INDEPENDENT *
+    IMPORTS: STOCK_LIST_PATH
+    USED BY: generate_stock_list_file(), update_option_traded_file()
 
-    sp_nasdaq: List[str] = get_sp_nasdaq()
-    sp_nasdaq_comment: str = f'# {len(sp_nasdaq)}'
-    sp_nasdaq_variable: str = f'sp_nasdaq_stocks: List[str] = {sp_nasdaq}'
+    returns an empty dict when there is no file yet, then every symbol is reported as added.
+    """
+    if not STOCK_LIST_PATH.exists():
+        return {}
+    with open(STOCK_LIST_PATH) as f:
+        return json.load(f)
 
-    nasdaq_listed: List[str] = get_nasdaq_listed()
-    nasdaq_listed_comment: str = f'# {len(nasdaq_listed)}'
-    nasdaq_listed_variable: str = f'nasdaq_listed_stocks: List[str] = {nasdaq_listed}'
-    
-    nasdaq_traded: List[str] = get_nasdaq_traded()
-    nasdaq_traded_comment: str = f'# {len(nasdaq_traded)}'
-    nasdaq_traded_variable: str = f'nasdaq_traded_stocks: List[str] = {nasdaq_traded}'
 
-    #option_traded: List[str] = get_option_traded()
-    #option_traded_comment: str = f'# {len(option_traded)}'
-    #option_traded_variable: str = f'option_traded_stocks: List[str] = {option_traded}'
-    
-    content: str = f'''
-{file_comment}\n\n
-{file_import}\n\n
 
-{sp_500_dict_comment}
-{sp_500_dict_variable}\n\n
+def write_stock_list_file(data: Dict[str, Any]) -> None:
+    """
+    * INDEPENDENT *
+    IMPORTS: STOCK_LIST_PATH
+    USED BY: generate_stock_list_file(), update_option_traded_file()
 
-{sp_400_dict_comment}
-{sp_400_dict_variable}\n\n
+    The file is written to a temporary file first and then renamed, a running CLI never reads half a file.
+    """
+    temp_path: Path = STOCK_LIST_PATH.with_suffix('.json.tmp')
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+        f.write('\n')
+    temp_path.replace(STOCK_LIST_PATH)
 
-{nasdaq_100_dict_comment}
-{nasdaq_100_dict_variable}\n\n
 
-{sp_500_comment}
-{sp_500_variable}\n\n
 
-{sp_400_comment}
-{sp_400_variable}\n\n
+def diff_stock_lists(old_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    * INDEPENDENT *
+    USED BY: print_diff_report()
 
-{nasdaq_100_comment}
-{nasdaq_100_variable}\n\n
+    returns {name: {'added': [...], 'removed': [...]}} of the symbol lists, the dicts have the same symbols as their lists.
+    """
+    diff_dict: Dict[str, Dict[str, List[str]]] = {}
+    for name, new_value in new_data.items():
+        if not name.endswith('_stocks'):
+            continue
+        old_set: Set[str] = set(old_data.get(name, []))
+        new_set: Set[str] = set(new_value)
+        diff_dict[name] = {'added': sorted(new_set - old_set), 'removed': sorted(old_set - new_set)}
+    return diff_dict
 
-{sp_nasdaq_comment}
-{sp_nasdaq_variable}\n\n
 
-{nasdaq_listed_comment}
-{nasdaq_listed_variable}\n\n
 
-{nasdaq_traded_comment}
-{nasdaq_traded_variable}\n\n
+def print_diff_report(old_data: Dict[str, Any], new_data: Dict[str, Any], max_symbols: int = 30) -> None:
+    """
+    DEPENDS ON: diff_stock_lists()
+    USED BY: generate_stock_list_file(), update_option_traded_file()
 
-'''
-    return content
+    The long lists like nasdaq_traded_stocks change by hundreds of symbols, only the first max_symbols symbols are printed.
+    """
+    print(f"{old_data.get('generated')} => {new_data.get('generated')}")
+    for name, diff in diff_stock_lists(old_data, new_data).items():
+        print(f"{name}: {len(old_data.get(name, []))} => {len(new_data[name])}, +{len(diff['added'])} -{len(diff['removed'])}")
+        for sign, key in (('+', 'added'), ('-', 'removed')):
+            symbols: List[str] = diff[key]
+            if symbols:
+                more: str = f' ... {len(symbols) - max_symbols} more' if len(symbols) > max_symbols else ''
+                print(f"    {sign} {' '.join(symbols[:max_symbols])}{more}")
 
 
 
 def generate_stock_list_file() -> None:
     """
-    DEPENDS ON: prepare_stock_list_file_content()
+    DEPENDS ON: prepare_stock_list_data(), read_stock_list_file(), write_stock_list_file(), print_diff_report()
     USED BY: terminal_scripts/central_script.py
 
-    execution time: 4 minutes due to get_option_traded() and black command
-    When I re-run this file, it will overwrite the original content
-    """
-    filename = 'generated_stock_list.py'
-    print(f'Generated {filename} now ...')
-    content: str = prepare_stock_list_file_content()
-    with open(filename, 'w') as f:
-        f.write(content)
-    print(f'write {filename} done, now using black to format it according to PEP8...')
-    black_cmd = f'black {filename}'
-    subprocess.run(black_cmd, stdin=True, shell=True)
+    execution time: seconds, the slowest source is options.txt
+    When I re-run this file, it will overwrite the original content.
+    The lists used to be written as a python module and formatted by black, the compact JSON file is a third smaller and loads about 20 times faster.
+    """
+    print(f'Generated {STOCK_LIST_PATH} now ...')
+    old_data: Dict[str, Any] = read_stock_list_file()
+    data: Dict[str, Any] = prepare_stock_list_data()
+    write_stock_list_file(data)
+    print_diff_report(old_data, data)
     print('ALL DONE')
     return None
 
 
 
+def update_option_traded_file() -> None:
+    """
+    DEPENDS ON: get_option_traded(), read_stock_list_file(), write_stock_list_file(), print_diff_report()
+    USED BY: test_generated()
+
+    Only option_traded_stocks of generated_stock_list.json is replaced, the other lists are kept, so the option universe is regenerated in seconds.
+    """
+    old_data: Dict[str, Any] = read_stock_list_file()
+    data: Dict[str, Any] = {**old_data, 'option_traded_stocks': get_option_traded()}
+    write_stock_list_file(data)
+    print_diff_report(old_data, {'generated': old_data.get('generated'), 'option_traded_stocks': data['option_traded_stocks']})
+
+
+
 
 
 def test_generated() -> None:
     def run() -> None:
-        reply: str = input('Do you want to generate stock list module (yes/no)?')
+        reply: str = input('Do you want to generate stock list module (yes/no), or only the option stocks (options)?')
         if reply == 'yes': 
             x =  generate_stock_list_file()
             print(x)
+        elif reply == 'options':
+            update_option_traded_file()
 
     seconds = timeit(run, number=1)
     print(seconds)
@@ -1,25694 +1,69 @@
-""" THIS FILE IS GENERATED AT 2024-11-19 17:14:00 BY generate_stock_list_file() FUNCTION IN generate_file_model.py """
+"""
+USED BY:
+    database_update/stock_list_model.py
 
-from typing import Dict, List
+The stock lists are generated into generated_stock_list.json by generate_stock_list_file() in generate_file_model.py, this module only reads them.
 
+The lists used to be a 25k-line generated module, which every CLI and GUI start had to unmarshal (about 95 ms with a cached .pyc, loading the JSON file takes about 4 ms).
+The JSON file is read once, on the first access of any of the names below, by the module __getattr__() (PEP 562):
+    from pizzapy.database_update import generated_stock_list
+    generated_stock_list.sp_500_stocks      # reads the file now
 
-# 503
-sp_500_dict: Dict = {
-    "MMM": {
-        "Company": "3M",
-        "Sector": "Industrials",
-        "Industry": "Industrial Conglomerates",
-        "Headquarters": "Saint Paul, Minnesota",
-        "Added": "1957-03-04",
-        "CIK": 66740,
-        "Founded": "1902",
-    },
-    "AOS": {
-        "Company": "A. O. Smith",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Milwaukee, Wisconsin",
-        "Added": "2017-07-26",
-        "CIK": 91142,
-        "Founded": "1916",
-    },
-    "ABT": {
-        "Company": "Abbott Laboratories",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "North Chicago, Illinois",
-        "Added": "1957-03-04",
-        "CIK": 1800,
-        "Founded": "1888",
-    },
-    "ABBV": {
-        "Company": "AbbVie",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "North Chicago, Illinois",
-        "Added": "2012-12-31",
-        "CIK": 1551152,
-        "Founded": "2013 (1888)",
-    },
-    "ACN": {
-        "Company": "Accenture",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "2011-07-06",
-        "CIK": 1467373,
-        "Founded": "1989",
-    },
-    "ADBE": {
-        "Company": "Adobe Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "San Jose, California",
-        "Added": "1997-05-05",
-        "CIK": 796343,
-        "Founded": "1982",
-    },
-    "AMD": {
-        "Company": "Advanced Micro Devices",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Santa Clara, California",
-        "Added": "2017-03-20",
-        "CIK": 2488,
-        "Founded": "1969",
-    },
-    "AES": {
-        "Company": "AES Corporation",
-        "Sector": "Utilities",
-        "Industry": "Independent Power Producers & Energy Traders",
-        "Headquarters": "Arlington, Virginia",
-        "Added": "1998-10-02",
-        "CIK": 874761,
-        "Founded": "1981",
-    },
-    "AFL": {
-        "Company": "Aflac",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "Columbus, Georgia",
-        "Added": "1999-05-28",
-        "CIK": 4977,
-        "Founded": "1955",
-    },
-    "A": {
-        "Company": "Agilent Technologies",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Santa Clara, California",
-        "Added": "2000-06-05",
-        "CIK": 1090872,
-        "Founded": "1999",
-    },
-    "APD": {
-        "Company": "Air Products",
-        "Sector": "Materials",
-        "Industry": "Industrial Gases",
-        "Headquarters": "Upper Macungie Township, Pennsylvania",
-        "Added": "1985-04-30",
-        "CIK": 2969,
-        "Founded": "1940",
-    },
-    "ABNB": {
-        "Company": "Airbnb",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "San Francisco, California",
-        "Added": "2023-09-18",
-        "CIK": 1559720,
-        "Founded": "2008",
-    },
-    "AKAM": {
-        "Company": "Akamai Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Internet Services & Infrastructure",
-        "Headquarters": "Cambridge, Massachusetts",
-        "Added": "2007-07-12",
-        "CIK": 1086222,
-        "Founded": "1998",
-    },
-    "ALB": {
-        "Company": "Albemarle Corporation",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Charlotte, North Carolina",
-        "Added": "2016-07-01",
-        "CIK": 915913,
-        "Founded": "1994",
-    },
-    "ARE": {
-        "Company": "Alexandria Real Estate Equities",
-        "Sector": "Real Estate",
-        "Industry": "Office REITs",
-        "Headquarters": "Pasadena, California",
-        "Added": "2017-03-20",
-        "CIK": 1035443,
-        "Founded": "1994",
-    },
-    "ALGN": {
-        "Company": "Align Technology",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": "Tempe, Arizona",
-        "Added": "2017-06-19",
-        "CIK": 1097149,
-        "Founded": "1997",
-    },
-    "ALLE": {
-        "Company": "Allegion",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "2013-12-02",
-        "CIK": 1579241,
-        "Founded": "1908",
-    },
-    "LNT": {
-        "Company": "Alliant Energy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Madison, Wisconsin",
-        "Added": "2016-07-01",
-        "CIK": 352541,
-        "Founded": "1917",
-    },
-    "ALL": {
-        "Company": "Allstate",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Northbrook, Illinois",
-        "Added": "1995-07-13",
-        "CIK": 899051,
-        "Founded": "1931",
-    },
-    "GOOGL": {
-        "Company": "Alphabet Inc. (Class A)",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-        "Headquarters": "Mountain View, California",
-        "Added": "2014-04-03",
-        "CIK": 1652044,
-        "Founded": "1998",
-    },
-    "GOOG": {
-        "Company": "Alphabet Inc. (Class C)",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-        "Headquarters": "Mountain View, California",
-        "Added": "2006-04-03",
-        "CIK": 1652044,
-        "Founded": "1998",
-    },
-    "MO": {
-        "Company": "Altria",
-        "Sector": "Consumer Staples",
-        "Industry": "Tobacco",
-        "Headquarters": "Richmond, Virginia",
-        "Added": "1957-03-04",
-        "CIK": 764180,
-        "Founded": "1985",
-    },
-    "AMZN": {
-        "Company": "Amazon",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-        "Headquarters": "Seattle, Washington",
-        "Added": "2005-11-18",
-        "CIK": 1018724,
-        "Founded": "1994",
-    },
-    "AMCR": {
-        "Company": "Amcor",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Warmley, Bristol, United Kingdom",
-        "Added": "2019-06-07",
-        "CIK": 1748790,
-        "Founded": "2019 (1860)",
-    },
-    "AMTM": {
-        "Company": "Amentum",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Chantilly, Virginia",
-        "Added": "2024-09-30",
-        "CIK": 2011286,
-        "Founded": "2020",
-    },
-    "AEE": {
-        "Company": "Ameren",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "St. Louis, Missouri",
-        "Added": "1991-09-19",
-        "CIK": 1002910,
-        "Founded": "1902",
-    },
-    "AEP": {
-        "Company": "American Electric Power",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Columbus, Ohio",
-        "Added": "1957-03-04",
-        "CIK": 4904,
-        "Founded": "1906",
-    },
-    "AXP": {
-        "Company": "American Express",
-        "Sector": "Financials",
-        "Industry": "Consumer Finance",
-        "Headquarters": "New York City, New York",
-        "Added": "1976-06-30",
-        "CIK": 4962,
-        "Founded": "1850",
-    },
-    "AIG": {
-        "Company": "American International Group",
-        "Sector": "Financials",
-        "Industry": "Multi-line Insurance",
-        "Headquarters": "New York City, New York",
-        "Added": "1980-03-31",
-        "CIK": 5272,
-        "Founded": "1919",
-    },
-    "AMT": {
-        "Company": "American Tower",
-        "Sector": "Real Estate",
-        "Industry": "Telecom Tower REITs",
-        "Headquarters": "Boston, Massachusetts",
-        "Added": "2007-11-19",
-        "CIK": 1053507,
-        "Founded": "1995",
-    },
-    "AWK": {
-        "Company": "American Water Works",
-        "Sector": "Utilities",
-        "Industry": "Water Utilities",
-        "Headquarters": "Camden, New Jersey",
-        "Added": "2016-03-04",
-        "CIK": 1410636,
-        "Founded": "1886",
-    },
-    "AMP": {
-        "Company": "Ameriprise Financial",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Minneapolis, Minnesota",
-        "Added": "2005-10-03",
-        "CIK": 820027,
-        "Founded": "1894",
-    },
-    "AME": {
-        "Company": "Ametek",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Berwyn, Pennsylvania",
-        "Added": "2013-09-23",
-        "CIK": 1037868,
-        "Founded": "1930",
-    },
-    "AMGN": {
-        "Company": "Amgen",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Thousand Oaks, California",
-        "Added": "1992-01-02",
-        "CIK": 318154,
-        "Founded": "1980",
-    },
-    "APH": {
-        "Company": "Amphenol",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Components",
-        "Headquarters": "Wallingford, Connecticut",
-        "Added": "2008-09-30",
-        "CIK": 820313,
-        "Founded": "1932",
-    },
-    "ADI": {
-        "Company": "Analog Devices",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Wilmington, Massachusetts",
-        "Added": "1999-10-12",
-        "CIK": 6281,
-        "Founded": "1965",
-    },
-    "ANSS": {
-        "Company": "Ansys",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Canonsburg, Pennsylvania",
-        "Added": "2017-06-19",
-        "CIK": 1013462,
-        "Founded": "1969",
-    },
-    "AON": {
-        "Company": "Aon",
-        "Sector": "Financials",
-        "Industry": "Insurance Brokers",
-        "Headquarters": "London, UK",
-        "Added": "1996-04-23",
-        "CIK": 315293,
-        "Founded": "1982 (1919)",
-    },
-    "APA": {
-        "Company": "APA Corporation",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Added": "1997-07-28",
-        "CIK": 1841666,
-        "Founded": "1954",
-    },
-    "AAPL": {
-        "Company": "Apple Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "Cupertino, California",
-        "Added": "1982-11-30",
-        "CIK": 320193,
-        "Founded": "1977",
-    },
-    "AMAT": {
-        "Company": "Applied Materials",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Materials & Equipment",
-        "Headquarters": "Santa Clara, California",
-        "Added": "1995-03-16",
-        "CIK": 6951,
-        "Founded": "1967",
-    },
-    "APTV": {
-        "Company": "Aptiv",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Parts & Equipment",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "2012-12-24",
-        "CIK": 1521332,
-        "Founded": "1994",
-    },
-    "ACGL": {
-        "Company": "Arch Capital Group",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Hamilton, Bermuda",
-        "Added": "2022-11-01",
-        "CIK": 947484,
-        "Founded": "1995",
-    },
-    "ADM": {
-        "Company": "Archer Daniels Midland",
-        "Sector": "Consumer Staples",
-        "Industry": "Agricultural Products & Services",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1957-03-04",
-        "CIK": 7084,
-        "Founded": "1902",
-    },
-    "ANET": {
-        "Company": "Arista Networks",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-        "Headquarters": "Santa Clara, California",
-        "Added": "2018-08-28",
-        "CIK": 1596532,
-        "Founded": "2004",
-    },
-    "AJG": {
-        "Company": "Arthur J. Gallagher & Co.",
-        "Sector": "Financials",
-        "Industry": "Insurance Brokers",
-        "Headquarters": "Rolling Meadows, Illinois",
-        "Added": "2016-05-31",
-        "CIK": 354190,
-        "Founded": "1927",
-    },
-    "AIZ": {
-        "Company": "Assurant",
-        "Sector": "Financials",
-        "Industry": "Multi-line Insurance",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "2007-04-10",
-        "CIK": 1267238,
-        "Founded": "1892",
-    },
-    "T": {
-        "Company": "AT&T",
-        "Sector": "Communication Services",
-        "Industry": "Integrated Telecommunication Services",
-        "Headquarters": "Dallas, Texas",
-        "Added": "1983-11-30",
-        "CIK": 732717,
-        "Founded": "1983 (1885)",
-    },
-    "ATO": {
-        "Company": "Atmos Energy",
-        "Sector": "Utilities",
-        "Industry": "Gas Utilities",
-        "Headquarters": "Dallas, Texas",
-        "Added": "2019-02-15",
-        "CIK": 731802,
-        "Founded": "1906",
-    },
-    "ADSK": {
-        "Company": "Autodesk",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "San Francisco, California",
-        "Added": "1989-12-01",
-        "CIK": 769397,
-        "Founded": "1982",
-    },
-    "ADP": {
-        "Company": "Automatic Data Processing",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-        "Headquarters": "Roseland, New Jersey",
-        "Added": "1981-03-31",
-        "CIK": 8670,
-        "Founded": "1949",
-    },
-    "AZO": {
-        "Company": "AutoZone",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "Memphis, Tennessee",
-        "Added": "1997-01-02",
-        "CIK": 866787,
-        "Founded": "1979",
-    },
-    "AVB": {
-        "Company": "AvalonBay Communities",
-        "Sector": "Real Estate",
-        "Industry": "Multi-Family Residential REITs",
-        "Headquarters": "Arlington, Virginia",
-        "Added": "2007-01-10",
-        "CIK": 915912,
-        "Founded": "1978",
-    },
-    "AVY": {
-        "Company": "Avery Dennison",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Mentor, Ohio",
-        "Added": "1987-12-31",
-        "CIK": 8818,
-        "Founded": "1990",
-    },
-    "AXON": {
-        "Company": "Axon Enterprise",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Scottsdale, Arizona",
-        "Added": "2023-05-04",
-        "CIK": 1069183,
-        "Founded": "1993",
-    },
-    "BKR": {
-        "Company": "Baker Hughes",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Equipment & Services",
-        "Headquarters": "Houston, Texas",
-        "Added": "2017-07-07",
-        "CIK": 1701605,
-        "Founded": "2017",
-    },
-    "BALL": {
-        "Company": "Ball Corporation",
-        "Sector": "Materials",
-        "Industry": "Metal, Glass & Plastic Containers",
-        "Headquarters": "Broomfield, Colorado",
-        "Added": "1984-10-31",
-        "CIK": 9389,
-        "Founded": "1880",
-    },
-    "BAC": {
-        "Company": "Bank of America",
-        "Sector": "Financials",
-        "Industry": "Diversified Banks",
-        "Headquarters": "Charlotte, North Carolina",
-        "Added": "1976-06-30",
-        "CIK": 70858,
-        "Founded": "1998 (1923 / 1874)",
-    },
-    "BAX": {
-        "Company": "Baxter International",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Deerfield, Illinois",
-        "Added": "1972-09-30",
-        "CIK": 10456,
-        "Founded": "1931",
-    },
-    "BDX": {
-        "Company": "Becton Dickinson",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Franklin Lakes, New Jersey",
-        "Added": "1972-09-30",
-        "CIK": 10795,
-        "Founded": "1897",
-    },
-    "BRK.B": {
-        "Company": "Berkshire Hathaway",
-        "Sector": "Financials",
-        "Industry": "Multi-Sector Holdings",
-        "Headquarters": "Omaha, Nebraska",
-        "Added": "2010-02-16",
-        "CIK": 1067983,
-        "Founded": "1839",
-    },
-    "BBY": {
-        "Company": "Best Buy",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Computer & Electronics Retail",
-        "Headquarters": "Richfield, Minnesota",
-        "Added": "1999-06-29",
-        "CIK": 764478,
-        "Founded": "1966",
-    },
-    "TECH": {
-        "Company": "Bio-Techne",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Minneapolis, Minnesota",
-        "Added": "2021-08-30",
-        "CIK": 842023,
-        "Founded": "1976",
-    },
-    "BIIB": {
-        "Company": "Biogen",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Cambridge, Massachusetts",
-        "Added": "2003-11-13",
-        "CIK": 875045,
-        "Founded": "1978",
-    },
-    "BLK": {
-        "Company": "BlackRock",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "New York City, New York",
-        "Added": "2011-04-04",
-        "CIK": 2012383,
-        "Founded": "1988",
-    },
-    "BX": {
-        "Company": "Blackstone Inc.",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "New York City, New York",
-        "Added": "2023-09-18",
-        "CIK": 1393818,
-        "Founded": "1985",
-    },
-    "BK": {
-        "Company": "BNY Mellon",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "New York City, New York",
-        "Added": "1995-03-31",
-        "CIK": 1390777,
-        "Founded": "1784",
-    },
-    "BA": {
-        "Company": "Boeing",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Arlington, Virginia",
-        "Added": "1957-03-04",
-        "CIK": 12927,
-        "Founded": "1916",
-    },
-    "BKNG": {
-        "Company": "Booking Holdings",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Norwalk, Connecticut",
-        "Added": "2009-11-06",
-        "CIK": 1075531,
-        "Founded": "1996",
-    },
-    "BWA": {
-        "Company": "BorgWarner",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Parts & Equipment",
-        "Headquarters": "Auburn Hills, Michigan",
-        "Added": "2011-12-19",
-        "CIK": 908255,
-        "Founded": "1880",
-    },
-    "BSX": {
-        "Company": "Boston Scientific",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Marlborough, Massachusetts",
-        "Added": "1995-02-24",
-        "CIK": 885725,
-        "Founded": "1979",
-    },
-    "BMY": {
-        "Company": "Bristol Myers Squibb",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "New York City, New York",
-        "Added": "1957-03-04",
-        "CIK": 14272,
-        "Founded": "1989 (1887)",
-    },
-    "AVGO": {
-        "Company": "Broadcom",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Palo Alto, California",
-        "Added": "2014-05-08",
-        "CIK": 1730168,
-        "Founded": "1961",
-    },
-    "BR": {
-        "Company": "Broadridge Financial Solutions",
-        "Sector": "Industrials",
-        "Industry": "Data Processing & Outsourced Services",
-        "Headquarters": "Lake Success, New York",
-        "Added": "2018-06-18",
-        "CIK": 1383312,
-        "Founded": "1962",
-    },
-    "BRO": {
-        "Company": "Brown & Brown",
-        "Sector": "Financials",
-        "Industry": "Insurance Brokers",
-        "Headquarters": "Daytona Beach, Florida",
-        "Added": "2021-09-20",
-        "CIK": 79282,
-        "Founded": "1939",
-    },
-    "BF.B": {
-        "Company": "Brown–Forman",
-        "Sector": "Consumer Staples",
-        "Industry": "Distillers & Vintners",
-        "Headquarters": "Louisville, Kentucky",
-        "Added": "1982-10-31",
-        "CIK": 14693,
-        "Founded": "1870",
-    },
-    "BLDR": {
-        "Company": "Builders FirstSource",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Irving, Texas",
-        "Added": "2023-12-18",
-        "CIK": 1316835,
-        "Founded": "1998",
-    },
-    "BG": {
-        "Company": "Bunge Global",
-        "Sector": "Consumer Staples",
-        "Industry": "Agricultural Products & Services",
-        "Headquarters": "Chesterfield, Missouri",
-        "Added": "2023-03-15",
-        "CIK": 1996862,
-        "Founded": "1818",
-    },
-    "BXP": {
-        "Company": "BXP, Inc.",
-        "Sector": "Real Estate",
-        "Industry": "Office REITs",
-        "Headquarters": "Boston, Massachusetts",
-        "Added": "2006-04-03",
-        "CIK": 1037540,
-        "Founded": "1970",
-    },
-    "CHRW": {
-        "Company": "C.H. Robinson",
-        "Sector": "Industrials",
-        "Industry": "Air Freight & Logistics",
-        "Headquarters": "Eden Prairie, Minnesota",
-        "Added": "2007-03-02",
-        "CIK": 1043277,
-        "Founded": "1905",
-    },
-    "CDNS": {
-        "Company": "Cadence Design Systems",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "San Jose, California",
-        "Added": "2017-09-18",
-        "CIK": 813672,
-        "Founded": "1988",
-    },
-    "CZR": {
-        "Company": "Caesars Entertainment",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Casinos & Gaming",
-        "Headquarters": "Reno, Nevada",
-        "Added": "2021-03-22",
-        "CIK": 1590895,
-        "Founded": "1973",
-    },
-    "CPT": {
-        "Company": "Camden Property Trust",
-        "Sector": "Real Estate",
-        "Industry": "Multi-Family Residential REITs",
-        "Headquarters": "Houston, Texas",
-        "Added": "2022-04-04",
-        "CIK": 906345,
-        "Founded": "1981",
-    },
-    "CPB": {
-        "Company": "Campbell Soup Company",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Camden, New Jersey",
-        "Added": "1957-03-04",
-        "CIK": 16732,
-        "Founded": "1869",
-    },
-    "COF": {
-        "Company": "Capital One",
-        "Sector": "Financials",
-        "Industry": "Consumer Finance",
-        "Headquarters": "Tysons Corner, Virginia",
-        "Added": "1998-07-01",
-        "CIK": 927628,
-        "Founded": "1994",
-    },
-    "CAH": {
-        "Company": "Cardinal Health",
-        "Sector": "Health Care",
-        "Industry": "Health Care Distributors",
-        "Headquarters": "Dublin, Ohio",
-        "Added": "1997-05-27",
-        "CIK": 721371,
-        "Founded": "1971",
-    },
-    "KMX": {
-        "Company": "CarMax",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "Richmond, Virginia",
-        "Added": "2010-06-28",
-        "CIK": 1170010,
-        "Founded": "1993",
-    },
-    "CCL": {
-        "Company": "Carnival",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Miami, Florida",
-        "Added": "1998-12-22",
-        "CIK": 815097,
-        "Founded": "1972",
-    },
-    "CARR": {
-        "Company": "Carrier Global",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Palm Beach Gardens, Florida",
-        "Added": "2020-04-03",
-        "CIK": 1783180,
-        "Founded": "2020 (1915, United Technologies spinoff)",
-    },
-    "CTLT": {
-        "Company": "Catalent",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "Somerset, New Jersey",
-        "Added": "2020-09-21",
-        "CIK": 1596783,
-        "Founded": "2007",
-    },
-    "CAT": {
-        "Company": "Caterpillar Inc.",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-        "Headquarters": "Irving, Texas",
-        "Added": "1957-03-04",
-        "CIK": 18230,
-        "Founded": "1925",
-    },
-    "CBOE": {
-        "Company": "Cboe Global Markets",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2017-03-01",
-        "CIK": 1374310,
-        "Founded": "1973",
-    },
-    "CBRE": {
-        "Company": "CBRE Group",
-        "Sector": "Real Estate",
-        "Industry": "Real Estate Services",
-        "Headquarters": "Dallas, Texas",
-        "Added": "2006-11-10",
-        "CIK": 1138118,
-        "Founded": "1906",
-    },
-    "CDW": {
-        "Company": "CDW",
-        "Sector": "Information Technology",
-        "Industry": "Technology Distributors",
-        "Headquarters": "Vernon Hills, Illinois",
-        "Added": "2019-09-23",
-        "CIK": 1402057,
-        "Founded": "1984",
-    },
-    "CE": {
-        "Company": "Celanese",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Irving, Texas",
-        "Added": "2018-12-24",
-        "CIK": 1306830,
-        "Founded": "1918",
-    },
-    "COR": {
-        "Company": "Cencora",
-        "Sector": "Health Care",
-        "Industry": "Health Care Distributors",
-        "Headquarters": "Conshohocken, Pennsylvania",
-        "Added": "2001-08-30",
-        "CIK": 1140859,
-        "Founded": "1985",
-    },
-    "CNC": {
-        "Company": "Centene Corporation",
-        "Sector": "Health Care",
-        "Industry": "Managed Health Care",
-        "Headquarters": "St. Louis, Missouri",
-        "Added": "2016-03-30",
-        "CIK": 1071739,
-        "Founded": "1984",
-    },
-    "CNP": {
-        "Company": "CenterPoint Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Houston, Texas",
-        "Added": "1985-07-31",
-        "CIK": 1130310,
-        "Founded": "1882",
-    },
-    "CF": {
-        "Company": "CF Industries",
-        "Sector": "Materials",
-        "Industry": "Fertilizers & Agricultural Chemicals",
-        "Headquarters": "Deerfield, Illinois",
-        "Added": "2008-08-27",
-        "CIK": 1324404,
-        "Founded": "1946",
-    },
-    "CRL": {
-        "Company": "Charles River Laboratories",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Wilmington, Massachusetts",
-        "Added": "2021-05-14",
-        "CIK": 1100682,
-        "Founded": "1947",
-    },
-    "SCHW": {
-        "Company": "Charles Schwab Corporation",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "Westlake, Texas",
-        "Added": "1997-06-02",
-        "CIK": 316709,
-        "Founded": "1971",
-    },
-    "CHTR": {
-        "Company": "Charter Communications",
-        "Sector": "Communication Services",
-        "Industry": "Cable & Satellite",
-        "Headquarters": "Stamford, Connecticut",
-        "Added": "2016-09-08",
-        "CIK": 1091667,
-        "Founded": "1993",
-    },
-    "CVX": {
-        "Company": "Chevron Corporation",
-        "Sector": "Energy",
-        "Industry": "Integrated Oil & Gas",
-        "Headquarters": "San Ramon, California",
-        "Added": "1957-03-04",
-        "CIK": 93410,
-        "Founded": "1879",
-    },
-    "CMG": {
-        "Company": "Chipotle Mexican Grill",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Newport Beach, California",
-        "Added": "2011-04-28",
-        "CIK": 1058090,
-        "Founded": "1993",
-    },
-    "CB": {
-        "Company": "Chubb Limited",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Zurich, Switzerland",
-        "Added": "2010-07-15",
-        "CIK": 896159,
-        "Founded": "1985",
-    },
-    "CHD": {
-        "Company": "Church & Dwight",
-        "Sector": "Consumer Staples",
-        "Industry": "Household Products",
-        "Headquarters": "Ewing, New Jersey",
-        "Added": "2015-12-29",
-        "CIK": 313927,
-        "Founded": "1847",
-    },
-    "CI": {
-        "Company": "Cigna",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Bloomfield, Connecticut",
-        "Added": "1976-06-30",
-        "CIK": 1739940,
-        "Founded": "1982",
-    },
-    "CINF": {
-        "Company": "Cincinnati Financial",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Fairfield, Ohio",
-        "Added": "1997-12-18",
-        "CIK": 20286,
-        "Founded": "1950",
-    },
-    "CTAS": {
-        "Company": "Cintas",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Mason, Ohio",
-        "Added": "2001-03-01",
-        "CIK": 723254,
-        "Founded": "1929",
-    },
-    "CSCO": {
-        "Company": "Cisco",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-        "Headquarters": "San Jose, California",
-        "Added": "1993-12-01",
-        "CIK": 858877,
-        "Founded": "1984",
-    },
-    "C": {
-        "Company": "Citigroup",
-        "Sector": "Financials",
-        "Industry": "Diversified Banks",
-        "Headquarters": "New York City, New York",
-        "Added": "1988-05-31",
-        "CIK": 831001,
-        "Founded": "1998",
-    },
-    "CFG": {
-        "Company": "Citizens Financial Group",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Providence, Rhode Island",
-        "Added": "2016-01-29",
-        "CIK": 759944,
-        "Founded": "1828",
-    },
-    "CLX": {
-        "Company": "Clorox",
-        "Sector": "Consumer Staples",
-        "Industry": "Household Products",
-        "Headquarters": "Oakland, California",
-        "Added": "1969-03-31",
-        "CIK": 21076,
-        "Founded": "1913",
-    },
-    "CME": {
-        "Company": "CME Group",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2006-08-11",
-        "CIK": 1156375,
-        "Founded": "1848",
-    },
-    "CMS": {
-        "Company": "CMS Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Jackson, Michigan",
-        "Added": "1957-03-04",
-        "CIK": 811156,
-        "Founded": "1886",
-    },
-    "KO": {
-        "Company": "Coca-Cola Company (The)",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "1957-03-04",
-        "CIK": 21344,
-        "Founded": "1886",
-    },
-    "CTSH": {
-        "Company": "Cognizant",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "Teaneck, New Jersey",
-        "Added": "2006-11-17",
-        "CIK": 1058290,
-        "Founded": "1994",
-    },
-    "CL": {
-        "Company": "Colgate-Palmolive",
-        "Sector": "Consumer Staples",
-        "Industry": "Household Products",
-        "Headquarters": "New York City, New York",
-        "Added": "1957-03-04",
-        "CIK": 21665,
-        "Founded": "1806",
-    },
-    "CMCSA": {
-        "Company": "Comcast",
-        "Sector": "Communication Services",
-        "Industry": "Cable & Satellite",
-        "Headquarters": "Philadelphia, Pennsylvania",
-        "Added": "2002-11-19",
-        "CIK": 1166691,
-        "Founded": "1963",
-    },
-    "CAG": {
-        "Company": "Conagra Brands",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1983-08-31",
-        "CIK": 23217,
-        "Founded": "1919",
-    },
-    "COP": {
-        "Company": "ConocoPhillips",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Added": "1957-03-04",
-        "CIK": 1163165,
-        "Founded": "2002",
-    },
-    "ED": {
-        "Company": "Consolidated Edison",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "New York City, New York",
-        "Added": "1957-03-04",
-        "CIK": 1047862,
-        "Founded": "1823",
-    },
-    "STZ": {
-        "Company": "Constellation Brands",
-        "Sector": "Consumer Staples",
-        "Industry": "Distillers & Vintners",
-        "Headquarters": "Rochester, New York",
-        "Added": "2005-07-01",
-        "CIK": 16918,
-        "Founded": "1945",
-    },
-    "CEG": {
-        "Company": "Constellation Energy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Baltimore, Maryland",
-        "Added": "2022-02-02",
-        "CIK": 1868275,
-        "Founded": "1999",
-    },
-    "COO": {
-        "Company": "Cooper Companies (The)",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": "San Ramon, California",
-        "Added": "2016-09-23",
-        "CIK": 711404,
-        "Founded": "1958",
-    },
-    "CPRT": {
-        "Company": "Copart",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Dallas, Texas",
-        "Added": "2018-07-02",
-        "CIK": 900075,
-        "Founded": "1982",
-    },
-    "GLW": {
-        "Company": "Corning Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Components",
-        "Headquarters": "Corning, New York",
-        "Added": "1995-02-27",
-        "CIK": 24741,
-        "Founded": "1851",
-    },
-    "CPAY": {
-        "Company": "Corpay",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "2018-06-20",
-        "CIK": 1175454,
-        "Founded": "2000",
-    },
-    "CTVA": {
-        "Company": "Corteva",
-        "Sector": "Materials",
-        "Industry": "Fertilizers & Agricultural Chemicals",
-        "Headquarters": "Indianapolis, Indiana",
-        "Added": "2019-06-03",
-        "CIK": 1755672,
-        "Founded": "2019",
-    },
-    "CSGP": {
-        "Company": "CoStar Group",
-        "Sector": "Real Estate",
-        "Industry": "Real Estate Services",
-        "Headquarters": "Washington, D.C.",
-        "Added": "2022-09-19",
-        "CIK": 1057352,
-        "Founded": "1987",
-    },
-    "COST": {
-        "Company": "Costco",
-        "Sector": "Consumer Staples",
-        "Industry": "Consumer Staples Merchandise Retail",
-        "Headquarters": "Issaquah, Washington",
-        "Added": "1993-10-01",
-        "CIK": 909832,
-        "Founded": "1976",
-    },
-    "CTRA": {
-        "Company": "Coterra",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Added": "2008-06-23",
-        "CIK": 858470,
-        "Founded": "2021 (1989)",
-    },
-    "CRWD": {
-        "Company": "CrowdStrike",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Austin, Texas",
-        "Added": "2024-06-24",
-        "CIK": 1535527,
-        "Founded": "2011",
-    },
-    "CCI": {
-        "Company": "Crown Castle",
-        "Sector": "Real Estate",
-        "Industry": "Telecom Tower REITs",
-        "Headquarters": "Houston, Texas",
-        "Added": "2012-03-14",
-        "CIK": 1051470,
-        "Founded": "1994",
-    },
-    "CSX": {
-        "Company": "CSX Corporation",
-        "Sector": "Industrials",
-        "Industry": "Rail Transportation",
-        "Headquarters": "Jacksonville, Florida",
-        "Added": "1957-03-04",
-        "CIK": 277948,
-        "Founded": "1980",
-    },
-    "CMI": {
-        "Company": "Cummins",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-        "Headquarters": "Columbus, Indiana",
-        "Added": "1965-03-31",
-        "CIK": 26172,
-        "Founded": "1919",
-    },
-    "CVS": {
-        "Company": "CVS Health",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Woonsocket, Rhode Island",
-        "Added": "1957-03-04",
-        "CIK": 64803,
-        "Founded": "1996",
-    },
-    "DHR": {
-        "Company": "Danaher Corporation",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Washington, D.C.",
-        "Added": "1998-11-18",
-        "CIK": 313616,
-        "Founded": "1969",
-    },
-    "DRI": {
-        "Company": "Darden Restaurants",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Orlando, Florida",
-        "Added": "1995-05-31",
-        "CIK": 940944,
-        "Founded": "1938",
-    },
-    "DVA": {
-        "Company": "DaVita",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Denver, Colorado",
-        "Added": "2008-07-31",
-        "CIK": 927066,
-        "Founded": "1979",
-    },
-    "DAY": {
-        "Company": "Dayforce",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-        "Headquarters": "Minneapolis, Minnesota",
-        "Added": "2021-09-20",
-        "CIK": 1725057,
-        "Founded": "1992",
-    },
-    "DECK": {
-        "Company": "Deckers Brands",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Footwear",
-        "Headquarters": "Goleta, California",
-        "Added": "2024-03-18",
-        "CIK": 910521,
-        "Founded": "1973",
-    },
-    "DE": {
-        "Company": "Deere & Company",
-        "Sector": "Industrials",
-        "Industry": "Agricultural & Farm Machinery",
-        "Headquarters": "Moline, Illinois",
-        "Added": "1957-03-04",
-        "CIK": 315189,
-        "Founded": "1837",
-    },
-    "DELL": {
-        "Company": "Dell Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "Round Rock, Texas",
-        "Added": "2024-09-23",
-        "CIK": 1571996,
-        "Founded": "2016",
-    },
-    "DAL": {
-        "Company": "Delta Air Lines",
-        "Sector": "Industrials",
-        "Industry": "Passenger Airlines",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "2013-09-11",
-        "CIK": 27904,
-        "Founded": "1929",
-    },
-    "DVN": {
-        "Company": "Devon Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Oklahoma City, Oklahoma",
-        "Added": "2000-08-30",
-        "CIK": 1090012,
-        "Founded": "1971",
-    },
-    "DXCM": {
-        "Company": "Dexcom",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "San Diego, California",
-        "Added": "2020-05-12",
-        "CIK": 1093557,
-        "Founded": "1999",
-    },
-    "FANG": {
-        "Company": "Diamondback Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Midland, Texas",
-        "Added": "2018-12-03",
-        "CIK": 1539838,
-        "Founded": "2007",
-    },
-    "DLR": {
-        "Company": "Digital Realty",
-        "Sector": "Real Estate",
-        "Industry": "Data Center REITs",
-        "Headquarters": "Austin, Texas",
-        "Added": "2016-05-18",
-        "CIK": 1297996,
-        "Founded": "2004",
-    },
-    "DFS": {
-        "Company": "Discover Financial",
-        "Sector": "Financials",
-        "Industry": "Consumer Finance",
-        "Headquarters": "Riverwoods, Illinois",
-        "Added": "2007-07-02",
-        "CIK": 1393612,
-        "Founded": "1985",
-    },
-    "DG": {
-        "Company": "Dollar General",
-        "Sector": "Consumer Staples",
-        "Industry": "Consumer Staples Merchandise Retail",
-        "Headquarters": "Goodlettsville, Tennessee",
-        "Added": "2012-12-03",
-        "CIK": 29534,
-        "Founded": "1939",
-    },
-    "DLTR": {
-        "Company": "Dollar Tree",
-        "Sector": "Consumer Staples",
-        "Industry": "Consumer Staples Merchandise Retail",
-        "Headquarters": "Chesapeake, Virginia",
-        "Added": "2011-12-19",
-        "CIK": 935703,
-        "Founded": "1986",
-    },
-    "D": {
-        "Company": "Dominion Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Richmond, Virginia",
-        "Added": "2016-11-30",
-        "CIK": 715957,
-        "Founded": "1983",
-    },
-    "DPZ": {
-        "Company": "Domino's",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Ann Arbor, Michigan",
-        "Added": "2020-05-12",
-        "CIK": 1286681,
-        "Founded": "1960",
-    },
-    "DOV": {
-        "Company": "Dover Corporation",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Downers Grove, Illinois",
-        "Added": "1985-10-31",
-        "CIK": 29905,
-        "Founded": "1955",
-    },
-    "DOW": {
-        "Company": "Dow Inc.",
-        "Sector": "Materials",
-        "Industry": "Commodity Chemicals",
-        "Headquarters": "Midland, Michigan",
-        "Added": "2019-04-01",
-        "CIK": 1751788,
-        "Founded": "2019 (1897)",
-    },
-    "DHI": {
-        "Company": "D. R. Horton",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": "Arlington, Texas",
-        "Added": "2005-06-22",
-        "CIK": 882184,
-        "Founded": "1978",
-    },
-    "DTE": {
-        "Company": "DTE Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Detroit, Michigan",
-        "Added": "1957-03-04",
-        "CIK": 936340,
-        "Founded": "1995",
-    },
-    "DUK": {
-        "Company": "Duke Energy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Charlotte, North Carolina",
-        "Added": "1976-06-30",
-        "CIK": 1326160,
-        "Founded": "1904",
-    },
-    "DD": {
-        "Company": "DuPont",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Wilmington, Delaware",
-        "Added": "2019-04-02",
-        "CIK": 1666700,
-        "Founded": "2017 (1802)",
-    },
-    "EMN": {
-        "Company": "Eastman Chemical Company",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Kingsport, Tennessee",
-        "Added": "1994-01-01",
-        "CIK": 915389,
-        "Founded": "1920",
-    },
-    "ETN": {
-        "Company": "Eaton Corporation",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "1957-03-04",
-        "CIK": 1551182,
-        "Founded": "1911",
-    },
-    "EBAY": {
-        "Company": "eBay",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-        "Headquarters": "San Jose, California",
-        "Added": "2002-07-22",
-        "CIK": 1065088,
-        "Founded": "1995",
-    },
-    "ECL": {
-        "Company": "Ecolab",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Saint Paul, Minnesota",
-        "Added": "1989-01-31",
-        "CIK": 31462,
-        "Founded": "1923",
-    },
-    "EIX": {
-        "Company": "Edison International",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Rosemead, California",
-        "Added": "1957-03-04",
-        "CIK": 827052,
-        "Founded": "1886",
-    },
-    "EW": {
-        "Company": "Edwards Lifesciences",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Irvine, California",
-        "Added": "2011-04-01",
-        "CIK": 1099800,
-        "Founded": "1958",
-    },
-    "EA": {
-        "Company": "Electronic Arts",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Home Entertainment",
-        "Headquarters": "Redwood City, California",
-        "Added": "2002-07-22",
-        "CIK": 712515,
-        "Founded": "1982",
-    },
-    "ELV": {
-        "Company": "Elevance Health",
-        "Sector": "Health Care",
-        "Industry": "Managed Health Care",
-        "Headquarters": "Indianapolis, Indiana",
-        "Added": "2002-07-25",
-        "CIK": 1156039,
-        "Founded": "2014 (1946)",
-    },
-    "EMR": {
-        "Company": "Emerson Electric",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Ferguson, Missouri",
-        "Added": "1965-03-31",
-        "CIK": 32604,
-        "Founded": "1890",
-    },
-    "ENPH": {
-        "Company": "Enphase Energy",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Materials & Equipment",
-        "Headquarters": "Fremont, California",
-        "Added": "2021-01-07",
-        "CIK": 1463101,
-        "Founded": "2006",
-    },
-    "ETR": {
-        "Company": "Entergy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "New Orleans, Louisiana",
-        "Added": "1957-03-04",
-        "CIK": 65984,
-        "Founded": "1913",
-    },
-    "EOG": {
-        "Company": "EOG Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Added": "2000-11-02",
-        "CIK": 821189,
-        "Founded": "1999",
-    },
-    "EPAM": {
-        "Company": "EPAM Systems",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "Newtown, Pennsylvania",
-        "Added": "2021-12-14",
-        "CIK": 1352010,
-        "Founded": "1993",
-    },
-    "EQT": {
-        "Company": "EQT Corporation",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Added": "2022-10-03",
-        "CIK": 33213,
-        "Founded": "1888",
-    },
-    "EFX": {
-        "Company": "Equifax",
-        "Sector": "Industrials",
-        "Industry": "Research & Consulting Services",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "1997-06-19",
-        "CIK": 33185,
-        "Founded": "1899",
-    },
-    "EQIX": {
-        "Company": "Equinix",
-        "Sector": "Real Estate",
-        "Industry": "Data Center REITs",
-        "Headquarters": "Redwood City, California",
-        "Added": "2015-03-20",
-        "CIK": 1101239,
-        "Founded": "1998",
-    },
-    "EQR": {
-        "Company": "Equity Residential",
-        "Sector": "Real Estate",
-        "Industry": "Multi-Family Residential REITs",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2001-12-03",
-        "CIK": 906107,
-        "Founded": "1969",
-    },
-    "ERIE": {
-        "Company": "Erie Indemnity",
-        "Sector": "Financials",
-        "Industry": "Insurance Brokers",
-        "Headquarters": "Erie, Pennsylvania",
-        "Added": "2024-09-23",
-        "CIK": 922621,
-        "Founded": "1925",
-    },
-    "ESS": {
-        "Company": "Essex Property Trust",
-        "Sector": "Real Estate",
-        "Industry": "Multi-Family Residential REITs",
-        "Headquarters": "San Mateo, California",
-        "Added": "2014-04-02",
-        "CIK": 920522,
-        "Founded": "1971",
-    },
-    "EL": {
-        "Company": "Estée Lauder Companies (The)",
-        "Sector": "Consumer Staples",
-        "Industry": "Personal Care Products",
-        "Headquarters": "New York City, New York",
-        "Added": "2006-01-05",
-        "CIK": 1001250,
-        "Founded": "1946",
-    },
-    "EG": {
-        "Company": "Everest Group",
-        "Sector": "Financials",
-        "Industry": "Reinsurance",
-        "Headquarters": "Hamilton, Bermuda",
-        "Added": "2017-06-19",
-        "CIK": 1095073,
-        "Founded": "1973",
-    },
-    "EVRG": {
-        "Company": "Evergy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Kansas City, Missouri",
-        "Added": "2018-06-05",
-        "CIK": 1711269,
-        "Founded": "1909",
-    },
-    "ES": {
-        "Company": "Eversource Energy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Hartford, Connecticut",
-        "Added": "2009-07-24",
-        "CIK": 72741,
-        "Founded": "1966",
-    },
-    "EXC": {
-        "Company": "Exelon",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1957-03-04",
-        "CIK": 1109357,
-        "Founded": "2000",
-    },
-    "EXPE": {
-        "Company": "Expedia Group",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Seattle, Washington",
-        "Added": "2007-10-02",
-        "CIK": 1324424,
-        "Founded": "1996",
-    },
-    "EXPD": {
-        "Company": "Expeditors International",
-        "Sector": "Industrials",
-        "Industry": "Air Freight & Logistics",
-        "Headquarters": "Seattle, Washington",
-        "Added": "2007-10-10",
-        "CIK": 746515,
-        "Founded": "1979",
-    },
-    "EXR": {
-        "Company": "Extra Space Storage",
-        "Sector": "Real Estate",
-        "Industry": "Self-Storage REITs",
-        "Headquarters": "Salt Lake City, Utah",
-        "Added": "2016-01-19",
-        "CIK": 1289490,
-        "Founded": "1977",
-    },
-    "XOM": {
-        "Company": "ExxonMobil",
-        "Sector": "Energy",
-        "Industry": "Integrated Oil & Gas",
-        "Headquarters": "Irving, Texas",
-        "Added": "1957-03-04",
-        "CIK": 34088,
-        "Founded": "1999",
-    },
-    "FFIV": {
-        "Company": "F5, Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-        "Headquarters": "Seattle, Washington",
-        "Added": "2010-12-20",
-        "CIK": 1048695,
-        "Founded": "1996",
-    },
-    "FDS": {
-        "Company": "FactSet",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "Norwalk, Connecticut",
-        "Added": "2021-12-20",
-        "CIK": 1013237,
-        "Founded": "1978",
-    },
-    "FICO": {
-        "Company": "Fair Isaac",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Bozeman, Montana",
-        "Added": "2023-03-20",
-        "CIK": 814547,
-        "Founded": "1956",
-    },
-    "FAST": {
-        "Company": "Fastenal",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-        "Headquarters": "Winona, Minnesota",
-        "Added": "2008-09-15",
-        "CIK": 815556,
-        "Founded": "1967",
-    },
-    "FRT": {
-        "Company": "Federal Realty Investment Trust",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "Rockville, Maryland",
-        "Added": "2016-02-01",
-        "CIK": 34903,
-        "Founded": "1962",
-    },
-    "FDX": {
-        "Company": "FedEx",
-        "Sector": "Industrials",
-        "Industry": "Air Freight & Logistics",
-        "Headquarters": "Memphis, Tennessee",
-        "Added": "1980-12-31",
-        "CIK": 1048911,
-        "Founded": "1971",
-    },
-    "FIS": {
-        "Company": "Fidelity National Information Services",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Jacksonville, Florida",
-        "Added": "2006-11-10",
-        "CIK": 1136893,
-        "Founded": "1968",
-    },
-    "FITB": {
-        "Company": "Fifth Third Bancorp",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Cincinnati, Ohio",
-        "Added": "1996-03-29",
-        "CIK": 35527,
-        "Founded": "1858",
-    },
-    "FSLR": {
-        "Company": "First Solar",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Tempe, Arizona",
-        "Added": "2022-12-19",
-        "CIK": 1274494,
-        "Founded": "1999",
-    },
-    "FE": {
-        "Company": "FirstEnergy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Akron, Ohio",
-        "Added": "1997-11-28",
-        "CIK": 1031296,
-        "Founded": "1997",
-    },
-    "FI": {
-        "Company": "Fiserv",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Brookfield, Wisconsin",
-        "Added": "2001-04-02",
-        "CIK": 798354,
-        "Founded": "1984",
-    },
-    "FMC": {
-        "Company": "FMC Corporation",
-        "Sector": "Materials",
-        "Industry": "Fertilizers & Agricultural Chemicals",
-        "Headquarters": "Philadelphia, Pennsylvania",
-        "Added": "2009-08-19",
-        "CIK": 37785,
-        "Founded": "1883",
-    },
-    "F": {
-        "Company": "Ford Motor Company",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automobile Manufacturers",
-        "Headquarters": "Dearborn, Michigan",
-        "Added": "1957-03-04",
-        "CIK": 37996,
-        "Founded": "1903",
-    },
-    "FTNT": {
-        "Company": "Fortinet",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Sunnyvale, California",
-        "Added": "2018-10-11",
-        "CIK": 1262039,
-        "Founded": "2000",
-    },
-    "FTV": {
-        "Company": "Fortive",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Everett, Washington",
-        "Added": "2016-07-01",
-        "CIK": 1659166,
-        "Founded": "2016",
-    },
-    "FOXA": {
-        "Company": "Fox Corporation (Class A)",
-        "Sector": "Communication Services",
-        "Industry": "Broadcasting",
-        "Headquarters": "New York City, New York",
-        "Added": "2019-03-04",
-        "CIK": 1754301,
-        "Founded": "2019",
-    },
-    "FOX": {
-        "Company": "Fox Corporation (Class B)",
-        "Sector": "Communication Services",
-        "Industry": "Broadcasting",
-        "Headquarters": "New York City, New York",
-        "Added": "2019-03-04",
-        "CIK": 1754301,
-        "Founded": "2019",
-    },
-    "BEN": {
-        "Company": "Franklin Resources",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "San Mateo, California",
-        "Added": "1998-04-30",
-        "CIK": 38777,
-        "Founded": "1947",
-    },
-    "FCX": {
-        "Company": "Freeport-McMoRan",
-        "Sector": "Materials",
-        "Industry": "Copper",
-        "Headquarters": "Phoenix, Arizona",
-        "Added": "2011-07-01",
-        "CIK": 831259,
-        "Founded": "1912",
-    },
-    "GRMN": {
-        "Company": "Garmin",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Consumer Electronics",
-        "Headquarters": "Schaffhausen, Switzerland",
-        "Added": "2012-12-12",
-        "CIK": 1121788,
-        "Founded": "1989",
-    },
-    "IT": {
-        "Company": "Gartner",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "Stamford, Connecticut",
-        "Added": "2017-04-05",
-        "CIK": 749251,
-        "Founded": "1979",
-    },
-    "GE": {
-        "Company": "GE Aerospace",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Evendale, Ohio",
-        "Added": "1957-03-04",
-        "CIK": 40545,
-        "Founded": "1892",
-    },
-    "GEHC": {
-        "Company": "GE HealthCare",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2023-01-04",
-        "CIK": 1932393,
-        "Founded": "1994",
-    },
-    "GEV": {
-        "Company": "GE Vernova",
-        "Sector": "Industrials",
-        "Industry": "Heavy Electrical Equipment",
-        "Headquarters": "Cambridge, Massachusetts",
-        "Added": "2024-04-02",
-        "CIK": 1996810,
-        "Founded": "2024",
-    },
-    "GEN": {
-        "Company": "Gen Digital",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Tempe, Arizona",
-        "Added": "2003-03-25",
-        "CIK": 849399,
-        "Founded": "1982",
-    },
-    "GNRC": {
-        "Company": "Generac",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Waukesha, Wisconsin",
-        "Added": "2021-03-22",
-        "CIK": 1474735,
-        "Founded": "1959",
-    },
-    "GD": {
-        "Company": "General Dynamics",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Falls Church, Virginia",
-        "Added": "1957-03-04",
-        "CIK": 40533,
-        "Founded": "1899",
-    },
-    "GIS": {
-        "Company": "General Mills",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Golden Valley, Minnesota",
-        "Added": "1957-03-04",
-        "CIK": 40704,
-        "Founded": "1856",
-    },
-    "GM": {
-        "Company": "General Motors",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automobile Manufacturers",
-        "Headquarters": "Detroit, Michigan",
-        "Added": "2013-06-06",
-        "CIK": 1467858,
-        "Founded": "1908",
-    },
-    "GPC": {
-        "Company": "Genuine Parts Company",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Distributors",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "1973-12-31",
-        "CIK": 40987,
-        "Founded": "1925",
-    },
-    "GILD": {
-        "Company": "Gilead Sciences",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Foster City, California",
-        "Added": "2004-07-01",
-        "CIK": 882095,
-        "Founded": "1987",
-    },
-    "GPN": {
-        "Company": "Global Payments",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "2016-04-25",
-        "CIK": 1123360,
-        "Founded": "2000",
-    },
-    "GL": {
-        "Company": "Globe Life",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "McKinney, Texas",
-        "Added": "1989-04-30",
-        "CIK": 320335,
-        "Founded": "1900",
-    },
-    "GDDY": {
-        "Company": "GoDaddy",
-        "Sector": "Information Technology",
-        "Industry": "Internet Services & Infrastructure",
-        "Headquarters": "Tempe, Arizona",
-        "Added": "2024-06-24",
-        "CIK": 1609711,
-        "Founded": "1997",
-    },
-    "GS": {
-        "Company": "Goldman Sachs",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "New York City, New York",
-        "Added": "2002-07-22",
-        "CIK": 886982,
-        "Founded": "1869",
-    },
-    "HAL": {
-        "Company": "Halliburton",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Equipment & Services",
-        "Headquarters": "Houston, Texas",
-        "Added": "1957-03-04",
-        "CIK": 45012,
-        "Founded": "1919",
-    },
-    "HIG": {
-        "Company": "Hartford (The)",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Hartford, Connecticut",
-        "Added": "1957-03-04",
-        "CIK": 874766,
-        "Founded": "1810",
-    },
-    "HAS": {
-        "Company": "Hasbro",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Leisure Products",
-        "Headquarters": "Pawtucket, Rhode Island",
-        "Added": "1984-09-30",
-        "CIK": 46080,
-        "Founded": "1923",
-    },
-    "HCA": {
-        "Company": "HCA Healthcare",
-        "Sector": "Health Care",
-        "Industry": "Health Care Facilities",
-        "Headquarters": "Nashville, Tennessee",
-        "Added": "2015-01-27",
-        "CIK": 860730,
-        "Founded": "1968",
-    },
-    "DOC": {
-        "Company": "Healthpeak Properties",
-        "Sector": "Real Estate",
-        "Industry": "Health Care REITs",
-        "Headquarters": "Denver, Colorado",
-        "Added": "2008-03-31",
-        "CIK": 765880,
-        "Founded": "1985",
-    },
-    "HSIC": {
-        "Company": "Henry Schein",
-        "Sector": "Health Care",
-        "Industry": "Health Care Distributors",
-        "Headquarters": "Melville, New York",
-        "Added": "2015-03-17",
-        "CIK": 1000228,
-        "Founded": "1932",
-    },
-    "HSY": {
-        "Company": "Hershey Company (The)",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Hershey, Pennsylvania",
-        "Added": "1957-03-04",
-        "CIK": 47111,
-        "Founded": "1894",
-    },
-    "HES": {
-        "Company": "Hess Corporation",
-        "Sector": "Energy",
-        "Industry": "Integrated Oil & Gas",
-        "Headquarters": "New York City, New York",
-        "Added": "1984-05-31",
-        "CIK": 4447,
-        "Founded": "1919",
-    },
-    "HPE": {
-        "Company": "Hewlett Packard Enterprise",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "Houston, Texas",
-        "Added": "2015-11-02",
-        "CIK": 1645590,
-        "Founded": "2015",
-    },
-    "HLT": {
-        "Company": "Hilton Worldwide",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Tysons Corner, Virginia",
-        "Added": "2017-06-19",
-        "CIK": 1585689,
-        "Founded": "1919",
-    },
-    "HOLX": {
-        "Company": "Hologic",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Marlborough, Massachusetts",
-        "Added": "2016-03-30",
-        "CIK": 859737,
-        "Founded": "1985",
-    },
-    "HD": {
-        "Company": "Home Depot (The)",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Home Improvement Retail",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "1988-03-31",
-        "CIK": 354950,
-        "Founded": "1978",
-    },
-    "HON": {
-        "Company": "Honeywell",
-        "Sector": "Industrials",
-        "Industry": "Industrial Conglomerates",
-        "Headquarters": "Charlotte, North Carolina",
-        "Added": "1957-03-04",
-        "CIK": 773840,
-        "Founded": "1906",
-    },
-    "HRL": {
-        "Company": "Hormel Foods",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Austin, Minnesota",
-        "Added": "2009-03-04",
-        "CIK": 48465,
-        "Founded": "1891",
-    },
-    "HST": {
-        "Company": "Host Hotels & Resorts",
-        "Sector": "Real Estate",
-        "Industry": "Hotel & Resort REITs",
-        "Headquarters": "Bethesda, Maryland",
-        "Added": "2007-03-20",
-        "CIK": 1070750,
-        "Founded": "1993",
-    },
-    "HWM": {
-        "Company": "Howmet Aerospace",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Added": "2016-10-21",
-        "CIK": 4281,
-        "Founded": "1888",
-    },
-    "HPQ": {
-        "Company": "HP Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "Palo Alto, California",
-        "Added": "1974-12-31",
-        "CIK": 47217,
-        "Founded": "1939 (2015)",
-    },
-    "HUBB": {
-        "Company": "Hubbell Incorporated",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Shelton, Connecticut",
-        "Added": "2023-10-18",
-        "CIK": 48898,
-        "Founded": "1888",
-    },
-    "HUM": {
-        "Company": "Humana",
-        "Sector": "Health Care",
-        "Industry": "Managed Health Care",
-        "Headquarters": "Louisville, Kentucky",
-        "Added": "2012-12-10",
-        "CIK": 49071,
-        "Founded": "1961",
-    },
-    "HBAN": {
-        "Company": "Huntington Bancshares",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Columbus, Ohio; Detroit, Michigan",
-        "Added": "1997-08-28",
-        "CIK": 49196,
-        "Founded": "1866",
-    },
-    "HII": {
-        "Company": "Huntington Ingalls Industries",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Newport News, Virginia",
-        "Added": "2018-01-03",
-        "CIK": 1501585,
-        "Founded": "2011",
-    },
-    "IBM": {
-        "Company": "IBM",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "Armonk, New York",
-        "Added": "1957-03-04",
-        "CIK": 51143,
-        "Founded": "1911",
-    },
-    "IEX": {
-        "Company": "IDEX Corporation",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Lake Forest, Illinois",
-        "Added": "2019-08-09",
-        "CIK": 832101,
-        "Founded": "1988",
-    },
-    "IDXX": {
-        "Company": "Idexx Laboratories",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Westbrook, Maine",
-        "Added": "2017-01-05",
-        "CIK": 874716,
-        "Founded": "1983",
-    },
-    "ITW": {
-        "Company": "Illinois Tool Works",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Glenview, Illinois",
-        "Added": "1986-02-28",
-        "CIK": 49826,
-        "Founded": "1912",
-    },
-    "INCY": {
-        "Company": "Incyte",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Wilmington, Delaware",
-        "Added": "2017-02-28",
-        "CIK": 879169,
-        "Founded": "1991",
-    },
-    "IR": {
-        "Company": "Ingersoll Rand",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Davidson, North Carolina",
-        "Added": "2020-03-03",
-        "CIK": 1699150,
-        "Founded": "1859",
-    },
-    "PODD": {
-        "Company": "Insulet Corporation",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Acton, Massachusetts",
-        "Added": "2023-03-15",
-        "CIK": 1145197,
-        "Founded": "2000",
-    },
-    "INTC": {
-        "Company": "Intel",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Santa Clara, California",
-        "Added": "1976-12-31",
-        "CIK": 50863,
-        "Founded": "1968",
-    },
-    "ICE": {
-        "Company": "Intercontinental Exchange",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "2007-09-26",
-        "CIK": 1571949,
-        "Founded": "2000",
-    },
-    "IFF": {
-        "Company": "International Flavors & Fragrances",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "New York City, New York",
-        "Added": "1976-03-31",
-        "CIK": 51253,
-        "Founded": "1958 (1889)",
-    },
-    "IP": {
-        "Company": "International Paper",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Memphis, Tennessee",
-        "Added": "1957-03-04",
-        "CIK": 51434,
-        "Founded": "1898",
-    },
-    "IPG": {
-        "Company": "Interpublic Group of Companies (The)",
-        "Sector": "Communication Services",
-        "Industry": "Advertising",
-        "Headquarters": "New York City, New York",
-        "Added": "1992-10-01",
-        "CIK": 51644,
-        "Founded": "1961 (1930)",
-    },
-    "INTU": {
-        "Company": "Intuit",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Mountain View, California",
-        "Added": "2000-12-05",
-        "CIK": 896878,
-        "Founded": "1983",
-    },
-    "ISRG": {
-        "Company": "Intuitive Surgical",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Sunnyvale, California",
-        "Added": "2008-06-02",
-        "CIK": 1035267,
-        "Founded": "1995",
-    },
-    "IVZ": {
-        "Company": "Invesco",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "2008-08-21",
-        "CIK": 914208,
-        "Founded": "1935",
-    },
-    "INVH": {
-        "Company": "Invitation Homes",
-        "Sector": "Real Estate",
-        "Industry": "Single-Family Residential REITs",
-        "Headquarters": "Dallas, Texas",
-        "Added": "2022-09-19",
-        "CIK": 1687229,
-        "Founded": "2012",
-    },
-    "IQV": {
-        "Company": "IQVIA",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Durham, North Carolina",
-        "Added": "2017-08-29",
-        "CIK": 1478242,
-        "Founded": "1982",
-    },
-    "IRM": {
-        "Company": "Iron Mountain",
-        "Sector": "Real Estate",
-        "Industry": "Other Specialized REITs",
-        "Headquarters": "Boston, Massachusetts",
-        "Added": "2009-01-06",
-        "CIK": 1020569,
-        "Founded": "1951",
-    },
-    "JBHT": {
-        "Company": "J.B. Hunt",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-        "Headquarters": "Lowell, Arkansas",
-        "Added": "2015-07-01",
-        "CIK": 728535,
-        "Founded": "1961",
-    },
-    "JBL": {
-        "Company": "Jabil",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Manufacturing Services",
-        "Headquarters": "St. Petersburg, Florida",
-        "Added": "2023-12-18",
-        "CIK": 898293,
-        "Founded": "1966",
-    },
-    "JKHY": {
-        "Company": "Jack Henry & Associates",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Monett, Missouri",
-        "Added": "2018-11-13",
-        "CIK": 779152,
-        "Founded": "1976",
-    },
-    "J": {
-        "Company": "Jacobs Solutions",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Dallas, Texas",
-        "Added": "2007-10-26",
-        "CIK": 52988,
-        "Founded": "1947",
-    },
-    "JNJ": {
-        "Company": "Johnson & Johnson",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "New Brunswick, New Jersey",
-        "Added": "1973-06-30",
-        "CIK": 200406,
-        "Founded": "1886",
-    },
-    "JCI": {
-        "Company": "Johnson Controls",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Cork, Ireland",
-        "Added": "2010-08-27",
-        "CIK": 833444,
-        "Founded": "1885",
-    },
-    "JPM": {
-        "Company": "JPMorgan Chase",
-        "Sector": "Financials",
-        "Industry": "Diversified Banks",
-        "Headquarters": "New York City, New York",
-        "Added": "1975-06-30",
-        "CIK": 19617,
-        "Founded": "2000 (1799 / 1871)",
-    },
-    "JNPR": {
-        "Company": "Juniper Networks",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-        "Headquarters": "Sunnyvale, California",
-        "Added": "2006-06-02",
-        "CIK": 1043604,
-        "Founded": "1996",
-    },
-    "K": {
-        "Company": "Kellanova",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1989-09-11",
-        "CIK": 55067,
-        "Founded": "1906",
-    },
-    "KVUE": {
-        "Company": "Kenvue",
-        "Sector": "Consumer Staples",
-        "Industry": "Personal Care Products",
-        "Headquarters": "Skillman, New Jersey",
-        "Added": "2023-08-25",
-        "CIK": 1944048,
-        "Founded": "2022 (Johnson & Johnson spinoff)",
-    },
-    "KDP": {
-        "Company": "Keurig Dr Pepper",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-        "Headquarters": "Burlington, Massachusetts",
-        "Added": "2022-06-21",
-        "CIK": 1418135,
-        "Founded": "1981",
-    },
-    "KEY": {
-        "Company": "KeyCorp",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Cleveland, Ohio",
-        "Added": "1994-03-01",
-        "CIK": 91576,
-        "Founded": "1825",
-    },
-    "KEYS": {
-        "Company": "Keysight Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Santa Rosa, California",
-        "Added": "2018-11-06",
-        "CIK": 1601046,
-        "Founded": "2014 (1939)",
-    },
-    "KMB": {
-        "Company": "Kimberly-Clark",
-        "Sector": "Consumer Staples",
-        "Industry": "Household Products",
-        "Headquarters": "Irving, Texas",
-        "Added": "1957-03-04",
-        "CIK": 55785,
-        "Founded": "1872",
-    },
-    "KIM": {
-        "Company": "Kimco Realty",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "Jericho, New York",
-        "Added": "2006-04-04",
-        "CIK": 879101,
-        "Founded": "1958",
-    },
-    "KMI": {
-        "Company": "Kinder Morgan",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Storage & Transportation",
-        "Headquarters": "Houston, Texas",
-        "Added": "2012-05-25",
-        "CIK": 1506307,
-        "Founded": "1997",
-    },
-    "KKR": {
-        "Company": "KKR",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "New York City, New York",
-        "Added": "2024-06-24",
-        "CIK": 1404912,
-        "Founded": "1976",
-    },
-    "KLAC": {
-        "Company": "KLA Corporation",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Materials & Equipment",
-        "Headquarters": "Milpitas, California",
-        "Added": "1997-09-30",
-        "CIK": 319201,
-        "Founded": "1975/1977 (1997)",
-    },
-    "KHC": {
-        "Company": "Kraft Heinz",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Chicago, Illinois; Pittsburgh, Pennsylvania",
-        "Added": "2015-07-06",
-        "CIK": 1637459,
-        "Founded": "2015 (1869)",
-    },
-    "KR": {
-        "Company": "Kroger",
-        "Sector": "Consumer Staples",
-        "Industry": "Food Retail",
-        "Headquarters": "Cincinnati, Ohio",
-        "Added": "1957-03-04",
-        "CIK": 56873,
-        "Founded": "1883",
-    },
-    "LHX": {
-        "Company": "L3Harris",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Melbourne, Florida",
-        "Added": "2008-09-22",
-        "CIK": 202058,
-        "Founded": "2019 (L3 1997, Harris 1895)",
-    },
-    "LH": {
-        "Company": "LabCorp",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Burlington, North Carolina",
-        "Added": "2004-11-01",
-        "CIK": 920148,
-        "Founded": "1978",
-    },
-    "LRCX": {
-        "Company": "Lam Research",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Materials & Equipment",
-        "Headquarters": "Fremont, California",
-        "Added": "2012-06-29",
-        "CIK": 707549,
-        "Founded": "1980",
-    },
-    "LW": {
-        "Company": "Lamb Weston",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Eagle, Idaho",
-        "Added": "2018-12-03",
-        "CIK": 1679273,
-        "Founded": "2016 (1950)",
-    },
-    "LVS": {
-        "Company": "Las Vegas Sands",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Casinos & Gaming",
-        "Headquarters": "Las Vegas, Nevada",
-        "Added": "2019-10-03",
-        "CIK": 1300514,
-        "Founded": "1988",
-    },
-    "LDOS": {
-        "Company": "Leidos",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Reston, Virginia",
-        "Added": "2019-08-09",
-        "CIK": 1336920,
-        "Founded": "1969",
-    },
-    "LEN": {
-        "Company": "Lennar",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": "Miami, Florida",
-        "Added": "2005-10-04",
-        "CIK": 920760,
-        "Founded": "1954",
-    },
-    "LLY": {
-        "Company": "Lilly (Eli)",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "Indianapolis, Indiana",
-        "Added": "1970-12-31",
-        "CIK": 59478,
-        "Founded": "1876",
-    },
-    "LIN": {
-        "Company": "Linde plc",
-        "Sector": "Materials",
-        "Industry": "Industrial Gases",
-        "Headquarters": "Guildford, United Kingdom",
-        "Added": "1992-07-01",
-        "CIK": 1707925,
-        "Founded": "1879",
-    },
-    "LYV": {
-        "Company": "Live Nation Entertainment",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-        "Headquarters": "Beverly Hills, California",
-        "Added": "2019-12-23",
-        "CIK": 1335258,
-        "Founded": "2010",
-    },
-    "LKQ": {
-        "Company": "LKQ Corporation",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Distributors",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2016-05-23",
-        "CIK": 1065696,
-        "Founded": "1998",
-    },
-    "LMT": {
-        "Company": "Lockheed Martin",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Bethesda, Maryland",
-        "Added": "1957-03-04",
-        "CIK": 936468,
-        "Founded": "1995",
-    },
-    "L": {
-        "Company": "Loews Corporation",
-        "Sector": "Financials",
-        "Industry": "Multi-line Insurance",
-        "Headquarters": "New York City, New York",
-        "Added": "1995-05-31",
-        "CIK": 60086,
-        "Founded": "1959",
-    },
-    "LOW": {
-        "Company": "Lowe's",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Home Improvement Retail",
-        "Headquarters": "Mooresville, North Carolina",
-        "Added": "1984-02-29",
-        "CIK": 60667,
-        "Founded": "1904/1946/1959",
-    },
-    "LULU": {
-        "Company": "Lululemon Athletica",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "Vancouver, Canada",
-        "Added": "2023-10-18",
-        "CIK": 1397187,
-        "Founded": "1998",
-    },
-    "LYB": {
-        "Company": "LyondellBasell",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Rotterdam, Netherlands",
-        "Added": "2012-09-05",
-        "CIK": 1489393,
-        "Founded": "2007",
-    },
-    "MTB": {
-        "Company": "M&T Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Buffalo, New York",
-        "Added": "2004-02-23",
-        "CIK": 36270,
-        "Founded": "1856",
-    },
-    "MRO": {
-        "Company": "Marathon Oil",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Added": "1957-03-04",
-        "CIK": 101778,
-        "Founded": "1887",
-    },
-    "MPC": {
-        "Company": "Marathon Petroleum",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Refining & Marketing",
-        "Headquarters": "Findlay, Ohio",
-        "Added": "2011-07-01",
-        "CIK": 1510295,
-        "Founded": "2009 (1887)",
-    },
-    "MKTX": {
-        "Company": "MarketAxess",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "New York City, New York",
-        "Added": "2019-07-01",
-        "CIK": 1278021,
-        "Founded": "2000",
-    },
-    "MAR": {
-        "Company": "Marriott International",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Bethesda, Maryland",
-        "Added": "1998-05-29",
-        "CIK": 1048286,
-        "Founded": "1927",
-    },
-    "MMC": {
-        "Company": "Marsh McLennan",
-        "Sector": "Financials",
-        "Industry": "Insurance Brokers",
-        "Headquarters": "New York City, New York",
-        "Added": "1987-08-31",
-        "CIK": 62709,
-        "Founded": "1905",
-    },
-    "MLM": {
-        "Company": "Martin Marietta Materials",
-        "Sector": "Materials",
-        "Industry": "Construction Materials",
-        "Headquarters": "Raleigh, North Carolina",
-        "Added": "2014-07-02",
-        "CIK": 916076,
-        "Founded": "1993",
-    },
-    "MAS": {
-        "Company": "Masco",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Livonia, Michigan",
-        "Added": "1981-06-30",
-        "CIK": 62996,
-        "Founded": "1929",
-    },
-    "MA": {
-        "Company": "Mastercard",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Harrison, New York",
-        "Added": "2008-07-18",
-        "CIK": 1141391,
-        "Founded": "1966",
-    },
-    "MTCH": {
-        "Company": "Match Group",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-        "Headquarters": "Dallas, Texas",
-        "Added": "2021-09-20",
-        "CIK": 891103,
-        "Founded": "1986",
-    },
-    "MKC": {
-        "Company": "McCormick & Company",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Hunt Valley, Maryland",
-        "Added": "2003-03-20",
-        "CIK": 63754,
-        "Founded": "1889",
-    },
-    "MCD": {
-        "Company": "McDonald's",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1970-06-30",
-        "CIK": 63908,
-        "Founded": "1940",
-    },
-    "MCK": {
-        "Company": "McKesson Corporation",
-        "Sector": "Health Care",
-        "Industry": "Health Care Distributors",
-        "Headquarters": "Irving, Texas",
-        "Added": "1999-01-13",
-        "CIK": 927653,
-        "Founded": "1833",
-    },
-    "MDT": {
-        "Company": "Medtronic",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "1986-10-31",
-        "CIK": 1613103,
-        "Founded": "1949",
-    },
-    "MRK": {
-        "Company": "Merck & Co.",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "Kenilworth, New Jersey",
-        "Added": "1957-03-04",
-        "CIK": 310158,
-        "Founded": "1891",
-    },
-    "META": {
-        "Company": "Meta Platforms",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-        "Headquarters": "Menlo Park, California",
-        "Added": "2013-12-23",
-        "CIK": 1326801,
-        "Founded": "2004",
-    },
-    "MET": {
-        "Company": "MetLife",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "New York City, New York",
-        "Added": "2000-12-11",
-        "CIK": 1099219,
-        "Founded": "1868",
-    },
-    "MTD": {
-        "Company": "Mettler Toledo",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Columbus, Ohio",
-        "Added": "2016-09-06",
-        "CIK": 1037646,
-        "Founded": "1945",
-    },
-    "MGM": {
-        "Company": "MGM Resorts",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Casinos & Gaming",
-        "Headquarters": "Paradise, Nevada",
-        "Added": "2017-07-26",
-        "CIK": 789570,
-        "Founded": "1986",
-    },
-    "MCHP": {
-        "Company": "Microchip Technology",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Chandler, Arizona",
-        "Added": "2007-09-07",
-        "CIK": 827054,
-        "Founded": "1989",
-    },
-    "MU": {
-        "Company": "Micron Technology",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Boise, Idaho",
-        "Added": "1994-09-27",
-        "CIK": 723125,
-        "Founded": "1978",
-    },
-    "MSFT": {
-        "Company": "Microsoft",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Redmond, Washington",
-        "Added": "1994-06-01",
-        "CIK": 789019,
-        "Founded": "1975",
-    },
-    "MAA": {
-        "Company": "Mid-America Apartment Communities",
-        "Sector": "Real Estate",
-        "Industry": "Multi-Family Residential REITs",
-        "Headquarters": "Memphis, Tennessee",
-        "Added": "2016-12-02",
-        "CIK": 912595,
-        "Founded": "1977",
-    },
-    "MRNA": {
-        "Company": "Moderna",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Cambridge, Massachusetts",
-        "Added": "2021-07-21",
-        "CIK": 1682852,
-        "Founded": "2010",
-    },
-    "MHK": {
-        "Company": "Mohawk Industries",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Home Furnishings",
-        "Headquarters": "Calhoun, Georgia",
-        "Added": "2013-12-23",
-        "CIK": 851968,
-        "Founded": "1878",
-    },
-    "MOH": {
-        "Company": "Molina Healthcare",
-        "Sector": "Health Care",
-        "Industry": "Managed Health Care",
-        "Headquarters": "Long Beach, California",
-        "Added": "2022-03-02",
-        "CIK": 1179929,
-        "Founded": "1980",
-    },
-    "TAP": {
-        "Company": "Molson Coors Beverage Company",
-        "Sector": "Consumer Staples",
-        "Industry": "Brewers",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1976-06-30",
-        "CIK": 24545,
-        "Founded": "2005 (Molson 1786, Coors 1873)",
-    },
-    "MDLZ": {
-        "Company": "Mondelez International",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2012-10-02",
-        "CIK": 1103982,
-        "Founded": "2012",
-    },
-    "MPWR": {
-        "Company": "Monolithic Power Systems",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Kirkland, Washington",
-        "Added": "2021-02-12",
-        "CIK": 1280452,
-        "Founded": "1997",
-    },
-    "MNST": {
-        "Company": "Monster Beverage",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-        "Headquarters": "Corona, California",
-        "Added": "2012-06-28",
-        "CIK": 865752,
-        "Founded": "2012 (1935)",
-    },
-    "MCO": {
-        "Company": "Moody's Corporation",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "New York City, New York",
-        "Added": "1998-07-01",
-        "CIK": 1059556,
-        "Founded": "1909",
-    },
-    "MS": {
-        "Company": "Morgan Stanley",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "New York City, New York",
-        "Added": "1993-07-29",
-        "CIK": 895421,
-        "Founded": "1935",
-    },
-    "MOS": {
-        "Company": "Mosaic Company (The)",
-        "Sector": "Materials",
-        "Industry": "Fertilizers & Agricultural Chemicals",
-        "Headquarters": "Tampa, Florida",
-        "Added": "2011-09-26",
-        "CIK": 1285785,
-        "Founded": "2004 (1865 / 1909)",
-    },
-    "MSI": {
-        "Company": "Motorola Solutions",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1957-03-04",
-        "CIK": 68505,
-        "Founded": "1928 (2011)",
-    },
-    "MSCI": {
-        "Company": "MSCI",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "New York City, New York",
-        "Added": "2018-04-04",
-        "CIK": 1408198,
-        "Founded": "1969",
-    },
-    "NDAQ": {
-        "Company": "Nasdaq, Inc.",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "New York City, New York",
-        "Added": "2008-10-22",
-        "CIK": 1120193,
-        "Founded": "1971",
-    },
-    "NTAP": {
-        "Company": "NetApp",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "San Jose, California",
-        "Added": "1999-06-25",
-        "CIK": 1002047,
-        "Founded": "1992",
-    },
-    "NFLX": {
-        "Company": "Netflix",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-        "Headquarters": "Los Gatos, California",
-        "Added": "2010-12-20",
-        "CIK": 1065280,
-        "Founded": "1997",
-    },
-    "NEM": {
-        "Company": "Newmont",
-        "Sector": "Materials",
-        "Industry": "Gold",
-        "Headquarters": "Denver, Colorado",
-        "Added": "1969-06-30",
-        "CIK": 1164727,
-        "Founded": "1921",
-    },
-    "NWSA": {
-        "Company": "News Corp (Class A)",
-        "Sector": "Communication Services",
-        "Industry": "Publishing",
-        "Headquarters": "New York City, New York",
-        "Added": "2013-08-01",
-        "CIK": 1564708,
-        "Founded": "2013 (News Corporation 1980)",
-    },
-    "NWS": {
-        "Company": "News Corp (Class B)",
-        "Sector": "Communication Services",
-        "Industry": "Publishing",
-        "Headquarters": "New York City, New York",
-        "Added": "2015-09-18",
-        "CIK": 1564708,
-        "Founded": "2013 (News Corporation 1980)",
-    },
-    "NEE": {
-        "Company": "NextEra Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Juno Beach, Florida",
-        "Added": "1976-06-30",
-        "CIK": 753308,
-        "Founded": "1984 (1925)",
-    },
-    "NKE": {
-        "Company": "Nike, Inc.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "Washington County, Oregon",
-        "Added": "1988-11-30",
-        "CIK": 320187,
-        "Founded": "1964",
-    },
-    "NI": {
-        "Company": "NiSource",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Merrillville, Indiana",
-        "Added": "2000-11-02",
-        "CIK": 1111711,
-        "Founded": "1912",
-    },
-    "NDSN": {
-        "Company": "Nordson Corporation",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Westlake, Ohio",
-        "Added": "2022-02-15",
-        "CIK": 72331,
-        "Founded": "1935",
-    },
-    "NSC": {
-        "Company": "Norfolk Southern Railway",
-        "Sector": "Industrials",
-        "Industry": "Rail Transportation",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "1957-03-04",
-        "CIK": 702165,
-        "Founded": "1881/1894 (1980)",
-    },
-    "NTRS": {
-        "Company": "Northern Trust",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "1998-01-30",
-        "CIK": 73124,
-        "Founded": "1889",
-    },
-    "NOC": {
-        "Company": "Northrop Grumman",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "West Falls Church, Virginia",
-        "Added": "1957-03-04",
-        "CIK": 1133421,
-        "Founded": "1994 (Northrop 1939, Grumman 1930)",
-    },
-    "NCLH": {
-        "Company": "Norwegian Cruise Line Holdings",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Miami, Florida",
-        "Added": "2017-10-13",
-        "CIK": 1513761,
-        "Founded": "2011 (1966)",
-    },
-    "NRG": {
-        "Company": "NRG Energy",
-        "Sector": "Utilities",
-        "Industry": "Independent Power Producers & Energy Traders",
-        "Headquarters": "Houston, Texas",
-        "Added": "2010-01-29",
-        "CIK": 1013871,
-        "Founded": "1992",
-    },
-    "NUE": {
-        "Company": "Nucor",
-        "Sector": "Materials",
-        "Industry": "Steel",
-        "Headquarters": "Charlotte, North Carolina",
-        "Added": "1985-04-30",
-        "CIK": 73309,
-        "Founded": "1940",
-    },
-    "NVDA": {
-        "Company": "Nvidia",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Santa Clara, California",
-        "Added": "2001-11-30",
-        "CIK": 1045810,
-        "Founded": "1993",
-    },
-    "NVR": {
-        "Company": "NVR, Inc.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": "Reston, Virginia",
-        "Added": "2019-09-26",
-        "CIK": 906163,
-        "Founded": "1980",
-    },
-    "NXPI": {
-        "Company": "NXP Semiconductors",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Eindhoven, Netherlands",
-        "Added": "2021-03-22",
-        "CIK": 1413447,
-        "Founded": "1953",
-    },
-    "ORLY": {
-        "Company": "O'Reilly Auto Parts",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "Springfield, Missouri",
-        "Added": "2009-03-27",
-        "CIK": 898173,
-        "Founded": "1957",
-    },
-    "OXY": {
-        "Company": "Occidental Petroleum",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Added": "1957-03-04",
-        "CIK": 797468,
-        "Founded": "1920",
-    },
-    "ODFL": {
-        "Company": "Old Dominion",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-        "Headquarters": "Thomasville, North Carolina",
-        "Added": "2019-12-09",
-        "CIK": 878927,
-        "Founded": "1934",
-    },
-    "OMC": {
-        "Company": "Omnicom Group",
-        "Sector": "Communication Services",
-        "Industry": "Advertising",
-        "Headquarters": "New York City, New York",
-        "Added": "1997-12-31",
-        "CIK": 29989,
-        "Founded": "1986",
-    },
-    "ON": {
-        "Company": "ON Semiconductor",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Phoenix, Arizona",
-        "Added": "2022-06-21",
-        "CIK": 1097864,
-        "Founded": "1999",
-    },
-    "OKE": {
-        "Company": "ONEOK",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Storage & Transportation",
-        "Headquarters": "Tulsa, Oklahoma",
-        "Added": "2010-03-15",
-        "CIK": 1039684,
-        "Founded": "1906",
-    },
-    "ORCL": {
-        "Company": "Oracle Corporation",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Austin, Texas",
-        "Added": "1989-08-31",
-        "CIK": 1341439,
-        "Founded": "1977",
-    },
-    "OTIS": {
-        "Company": "Otis Worldwide",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Farmington, Connecticut",
-        "Added": "2020-04-03",
-        "CIK": 1781335,
-        "Founded": "2020 (1853, United Technologies spinoff)",
-    },
-    "PCAR": {
-        "Company": "Paccar",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-        "Headquarters": "Bellevue, Washington",
-        "Added": "1980-12-31",
-        "CIK": 75362,
-        "Founded": "1905",
-    },
-    "PKG": {
-        "Company": "Packaging Corporation of America",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Lake Forest, Illinois",
-        "Added": "2017-07-26",
-        "CIK": 75677,
-        "Founded": "1959",
-    },
-    "PLTR": {
-        "Company": "Palantir Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Internet Services & Infrastructure",
-        "Headquarters": "Denver, Colorado",
-        "Added": "2024-09-23",
-        "CIK": 1321655,
-        "Founded": "2003",
-    },
-    "PANW": {
-        "Company": "Palo Alto Networks",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Santa Clara, California",
-        "Added": "2023-06-20",
-        "CIK": 1327567,
-        "Founded": "2005",
-    },
-    "PARA": {
-        "Company": "Paramount Global",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-        "Headquarters": "New York City, New York",
-        "Added": "1994-09-30",
-        "CIK": 813828,
-        "Founded": "2019 (Paramount Pictures 1912)",
-    },
-    "PH": {
-        "Company": "Parker Hannifin",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Cleveland, Ohio",
-        "Added": "1985-11-30",
-        "CIK": 76334,
-        "Founded": "1917",
-    },
-    "PAYX": {
-        "Company": "Paychex",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-        "Headquarters": "Penfield, New York",
-        "Added": "1998-10-01",
-        "CIK": 723531,
-        "Founded": "1971",
-    },
-    "PAYC": {
-        "Company": "Paycom",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-        "Headquarters": "Oklahoma City, Oklahoma",
-        "Added": "2020-01-28",
-        "CIK": 1590955,
-        "Founded": "1998",
-    },
-    "PYPL": {
-        "Company": "PayPal",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "San Jose, California",
-        "Added": "2015-07-20",
-        "CIK": 1633917,
-        "Founded": "1998",
-    },
-    "PNR": {
-        "Company": "Pentair",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Worsley, United Kingdom",
-        "Added": "2012-10-01",
-        "CIK": 77360,
-        "Founded": "1966",
-    },
-    "PEP": {
-        "Company": "PepsiCo",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-        "Headquarters": "Purchase, New York",
-        "Added": "1957-03-04",
-        "CIK": 77476,
-        "Founded": "1898",
-    },
-    "PFE": {
-        "Company": "Pfizer",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "New York City, New York",
-        "Added": "1957-03-04",
-        "CIK": 78003,
-        "Founded": "1849",
-    },
-    "PCG": {
-        "Company": "PG&E Corporation",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Oakland, California",
-        "Added": "2022-10-03",
-        "CIK": 1004980,
-        "Founded": "1905",
-    },
-    "PM": {
-        "Company": "Philip Morris International",
-        "Sector": "Consumer Staples",
-        "Industry": "Tobacco",
-        "Headquarters": "New York City, New York",
-        "Added": "2008-03-31",
-        "CIK": 1413329,
-        "Founded": "2008 (1847)",
-    },
-    "PSX": {
-        "Company": "Phillips 66",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Refining & Marketing",
-        "Headquarters": "Houston, Texas",
-        "Added": "2012-05-01",
-        "CIK": 1534701,
-        "Founded": "2012 (1917)",
-    },
-    "PNW": {
-        "Company": "Pinnacle West",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Phoenix, Arizona",
-        "Added": "1999-10-04",
-        "CIK": 764622,
-        "Founded": "1985",
-    },
-    "PNC": {
-        "Company": "PNC Financial Services",
-        "Sector": "Financials",
-        "Industry": "Diversified Banks",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Added": "1988-04-30",
-        "CIK": 713676,
-        "Founded": "1845",
-    },
-    "POOL": {
-        "Company": "Pool Corporation",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Distributors",
-        "Headquarters": "Covington, Louisiana",
-        "Added": "2020-10-07",
-        "CIK": 945841,
-        "Founded": "1993",
-    },
-    "PPG": {
-        "Company": "PPG Industries",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Added": "1957-03-04",
-        "CIK": 79879,
-        "Founded": "1883",
-    },
-    "PPL": {
-        "Company": "PPL Corporation",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Allentown, Pennsylvania",
-        "Added": "2001-10-01",
-        "CIK": 922224,
-        "Founded": "1920",
-    },
-    "PFG": {
-        "Company": "Principal Financial Group",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "Des Moines, Iowa",
-        "Added": "2002-07-22",
-        "CIK": 1126328,
-        "Founded": "1879",
-    },
-    "PG": {
-        "Company": "Procter & Gamble",
-        "Sector": "Consumer Staples",
-        "Industry": "Personal Care Products",
-        "Headquarters": "Cincinnati, Ohio",
-        "Added": "1957-03-04",
-        "CIK": 80424,
-        "Founded": "1837",
-    },
-    "PGR": {
-        "Company": "Progressive Corporation",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Mayfield Village, Ohio",
-        "Added": "1997-08-04",
-        "CIK": 80661,
-        "Founded": "1937",
-    },
-    "PLD": {
-        "Company": "Prologis",
-        "Sector": "Real Estate",
-        "Industry": "Industrial REITs",
-        "Headquarters": "San Francisco, California",
-        "Added": "2003-07-17",
-        "CIK": 1045609,
-        "Founded": "1983",
-    },
-    "PRU": {
-        "Company": "Prudential Financial",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "Newark, New Jersey",
-        "Added": "2002-07-22",
-        "CIK": 1137774,
-        "Founded": "1875",
-    },
-    "PEG": {
-        "Company": "Public Service Enterprise Group",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Newark, New Jersey",
-        "Added": "1957-03-04",
-        "CIK": 788784,
-        "Founded": "1903",
-    },
-    "PTC": {
-        "Company": "PTC Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Boston, Massachusetts",
-        "Added": "2021-04-20",
-        "CIK": 857005,
-        "Founded": "1985",
-    },
-    "PSA": {
-        "Company": "Public Storage",
-        "Sector": "Real Estate",
-        "Industry": "Self-Storage REITs",
-        "Headquarters": "Glendale, California",
-        "Added": "2005-08-19",
-        "CIK": 1393311,
-        "Founded": "1972",
-    },
-    "PHM": {
-        "Company": "PulteGroup",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "1984-04-30",
-        "CIK": 822416,
-        "Founded": "1956",
-    },
-    "QRVO": {
-        "Company": "Qorvo",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Greensboro, North Carolina",
-        "Added": "2015-06-11",
-        "CIK": 1604778,
-        "Founded": "2015",
-    },
-    "PWR": {
-        "Company": "Quanta Services",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Houston, Texas",
-        "Added": "2009-07-01",
-        "CIK": 1050915,
-        "Founded": "1997",
-    },
-    "QCOM": {
-        "Company": "Qualcomm",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "San Diego, California",
-        "Added": "1999-07-22",
-        "CIK": 804328,
-        "Founded": "1985",
-    },
-    "DGX": {
-        "Company": "Quest Diagnostics",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Secaucus, New Jersey",
-        "Added": "2002-12-12",
-        "CIK": 1022079,
-        "Founded": "1967",
-    },
-    "RL": {
-        "Company": "Ralph Lauren Corporation",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "New York City, New York",
-        "Added": "2007-02-02",
-        "CIK": 1037038,
-        "Founded": "1967",
-    },
-    "RJF": {
-        "Company": "Raymond James Financial",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "St. Petersburg, Florida",
-        "Added": "2017-03-20",
-        "CIK": 720005,
-        "Founded": "1962",
-    },
-    "RTX": {
-        "Company": "RTX Corporation",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Waltham, Massachusetts",
-        "Added": "1957-03-04",
-        "CIK": 101829,
-        "Founded": "1922",
-    },
-    "O": {
-        "Company": "Realty Income",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "San Diego, California",
-        "Added": "2015-04-07",
-        "CIK": 726728,
-        "Founded": "1969",
-    },
-    "REG": {
-        "Company": "Regency Centers",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "Jacksonville, Florida",
-        "Added": "2017-03-02",
-        "CIK": 910606,
-        "Founded": "1963",
-    },
-    "REGN": {
-        "Company": "Regeneron Pharmaceuticals",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Tarrytown, New York",
-        "Added": "2013-05-01",
-        "CIK": 872589,
-        "Founded": "1988",
-    },
-    "RF": {
-        "Company": "Regions Financial Corporation",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Birmingham, Alabama",
-        "Added": "1998-08-28",
-        "CIK": 1281761,
-        "Founded": "1971",
-    },
-    "RSG": {
-        "Company": "Republic Services",
-        "Sector": "Industrials",
-        "Industry": "Environmental & Facilities Services",
-        "Headquarters": "Phoenix, Arizona",
-        "Added": "2008-12-05",
-        "CIK": 1060391,
-        "Founded": "1998 (1981)",
-    },
-    "RMD": {
-        "Company": "ResMed",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "San Diego, California",
-        "Added": "2017-07-26",
-        "CIK": 943819,
-        "Founded": "1989",
-    },
-    "RVTY": {
-        "Company": "Revvity",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Waltham, Massachusetts",
-        "Added": "1985-05-31",
-        "CIK": 31791,
-        "Founded": "1937",
-    },
-    "ROK": {
-        "Company": "Rockwell Automation",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Milwaukee, Wisconsin",
-        "Added": "2000-03-12",
-        "CIK": 1024478,
-        "Founded": "1903",
-    },
-    "ROL": {
-        "Company": "Rollins, Inc.",
-        "Sector": "Industrials",
-        "Industry": "Environmental & Facilities Services",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "2018-10-01",
-        "CIK": 84839,
-        "Founded": "1948",
-    },
-    "ROP": {
-        "Company": "Roper Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Sarasota, Florida",
-        "Added": "2009-12-23",
-        "CIK": 882835,
-        "Founded": "1981",
-    },
-    "ROST": {
-        "Company": "Ross Stores",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel Retail",
-        "Headquarters": "Dublin, California",
-        "Added": "2009-12-21",
-        "CIK": 745732,
-        "Founded": "1982",
-    },
-    "RCL": {
-        "Company": "Royal Caribbean Group",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Miami, Florida",
-        "Added": "2014-12-05",
-        "CIK": 884887,
-        "Founded": "1997",
-    },
-    "SPGI": {
-        "Company": "S&P Global",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "New York City, New York",
-        "Added": "1957-03-04",
-        "CIK": 64040,
-        "Founded": "1917",
-    },
-    "CRM": {
-        "Company": "Salesforce",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "San Francisco, California",
-        "Added": "2008-09-15",
-        "CIK": 1108524,
-        "Founded": "1999",
-    },
-    "SBAC": {
-        "Company": "SBA Communications",
-        "Sector": "Real Estate",
-        "Industry": "Telecom Tower REITs",
-        "Headquarters": "Boca Raton, Florida",
-        "Added": "2017-09-01",
-        "CIK": 1034054,
-        "Founded": "1989",
-    },
-    "SLB": {
-        "Company": "Schlumberger",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Equipment & Services",
-        "Headquarters": "Houston, Texas",
-        "Added": "1957-03-04",
-        "CIK": 87347,
-        "Founded": "1926",
-    },
-    "STX": {
-        "Company": "Seagate Technology",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "2012-07-02",
-        "CIK": 1137789,
-        "Founded": "1979",
-    },
-    "SRE": {
-        "Company": "Sempra",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "San Diego, California",
-        "Added": "2017-03-17",
-        "CIK": 1032208,
-        "Founded": "1998",
-    },
-    "NOW": {
-        "Company": "ServiceNow",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Santa Clara, California",
-        "Added": "2019-11-21",
-        "CIK": 1373715,
-        "Founded": "2003",
-    },
-    "SHW": {
-        "Company": "Sherwin-Williams",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Cleveland, Ohio",
-        "Added": "1964-06-30",
-        "CIK": 89800,
-        "Founded": "1866",
-    },
-    "SPG": {
-        "Company": "Simon Property Group",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "Indianapolis, Indiana",
-        "Added": "2002-06-26",
-        "CIK": 1063761,
-        "Founded": "2003",
-    },
-    "SWKS": {
-        "Company": "Skyworks Solutions",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Irvine, California",
-        "Added": "2015-03-12",
-        "CIK": 4127,
-        "Founded": "2002",
-    },
-    "SJM": {
-        "Company": "J.M. Smucker Company (The)",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Orrville, Ohio",
-        "Added": "2008-11-06",
-        "CIK": 91419,
-        "Founded": "1897",
-    },
-    "SW": {
-        "Company": "Smurfit WestRock",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "2024-07-08",
-        "CIK": 2005951,
-        "Founded": "1934",
-    },
-    "SNA": {
-        "Company": "Snap-on",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Kenosha, Wisconsin",
-        "Added": "1982-09-30",
-        "CIK": 91440,
-        "Founded": "1920",
-    },
-    "SOLV": {
-        "Company": "Solventum",
-        "Sector": "Health Care",
-        "Industry": "Health Care Technology",
-        "Headquarters": "Saint Paul, Minnesota",
-        "Added": "2024-04-01",
-        "CIK": 1964738,
-        "Founded": "2023",
-    },
-    "SO": {
-        "Company": "Southern Company",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Atlanta, Georgia",
-        "Added": "1957-03-04",
-        "CIK": 92122,
-        "Founded": "1945",
-    },
-    "LUV": {
-        "Company": "Southwest Airlines",
-        "Sector": "Industrials",
-        "Industry": "Passenger Airlines",
-        "Headquarters": "Dallas, Texas",
-        "Added": "1994-07-01",
-        "CIK": 92380,
-        "Founded": "1967",
-    },
-    "SWK": {
-        "Company": "Stanley Black & Decker",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "New Britain, Connecticut",
-        "Added": "1982-09-30",
-        "CIK": 93556,
-        "Founded": "1843",
-    },
-    "SBUX": {
-        "Company": "Starbucks",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Seattle, Washington",
-        "Added": "2000-06-07",
-        "CIK": 829224,
-        "Founded": "1971",
-    },
-    "STT": {
-        "Company": "State Street Corporation",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Boston, Massachusetts",
-        "Added": "2003-03-14",
-        "CIK": 93751,
-        "Founded": "1792",
-    },
-    "STLD": {
-        "Company": "Steel Dynamics",
-        "Sector": "Materials",
-        "Industry": "Steel",
-        "Headquarters": "Fort Wayne, Indiana",
-        "Added": "2022-12-22",
-        "CIK": 1022671,
-        "Founded": "1993",
-    },
-    "STE": {
-        "Company": "Steris",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "2019-12-23",
-        "CIK": 1757898,
-        "Founded": "1985",
-    },
-    "SYK": {
-        "Company": "Stryker Corporation",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Kalamazoo, Michigan",
-        "Added": "2000-12-12",
-        "CIK": 310764,
-        "Founded": "1941",
-    },
-    "SMCI": {
-        "Company": "Supermicro",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "San Jose, California",
-        "Added": "2024-03-18",
-        "CIK": 1375365,
-        "Founded": "1993",
-    },
-    "SYF": {
-        "Company": "Synchrony Financial",
-        "Sector": "Financials",
-        "Industry": "Consumer Finance",
-        "Headquarters": "Stamford, Connecticut",
-        "Added": "2015-11-18",
-        "CIK": 1601712,
-        "Founded": "2003",
-    },
-    "SNPS": {
-        "Company": "Synopsys",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Sunnyvale, California",
-        "Added": "2017-03-16",
-        "CIK": 883241,
-        "Founded": "1986",
-    },
-    "SYY": {
-        "Company": "Sysco",
-        "Sector": "Consumer Staples",
-        "Industry": "Food Distributors",
-        "Headquarters": "Houston, Texas",
-        "Added": "1986-12-31",
-        "CIK": 96021,
-        "Founded": "1969",
-    },
-    "TMUS": {
-        "Company": "T-Mobile US",
-        "Sector": "Communication Services",
-        "Industry": "Wireless Telecommunication Services",
-        "Headquarters": "Bellevue, Washington",
-        "Added": "2019-07-15",
-        "CIK": 1283699,
-        "Founded": "1994",
-    },
-    "TROW": {
-        "Company": "T. Rowe Price",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Baltimore, Maryland",
-        "Added": "2019-07-29",
-        "CIK": 1113169,
-        "Founded": "1937",
-    },
-    "TTWO": {
-        "Company": "Take-Two Interactive",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Home Entertainment",
-        "Headquarters": "New York City, New York",
-        "Added": "2018-03-19",
-        "CIK": 946581,
-        "Founded": "1993",
-    },
-    "TPR": {
-        "Company": "Tapestry, Inc.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "New York City, New York",
-        "Added": "2004-09-01",
-        "CIK": 1116132,
-        "Founded": "2017",
-    },
-    "TRGP": {
-        "Company": "Targa Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Storage & Transportation",
-        "Headquarters": "Houston, Texas",
-        "Added": "2022-10-12",
-        "CIK": 1389170,
-        "Founded": "2005",
-    },
-    "TGT": {
-        "Company": "Target Corporation",
-        "Sector": "Consumer Staples",
-        "Industry": "Consumer Staples Merchandise Retail",
-        "Headquarters": "Minneapolis, Minnesota",
-        "Added": "1976-12-31",
-        "CIK": 27419,
-        "Founded": "1902",
-    },
-    "TEL": {
-        "Company": "TE Connectivity",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Manufacturing Services",
-        "Headquarters": "Galway, Ireland",
-        "Added": "2011-10-17",
-        "CIK": 1385157,
-        "Founded": "2007",
-    },
-    "TDY": {
-        "Company": "Teledyne Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Thousand Oaks, California",
-        "Added": "2020-06-22",
-        "CIK": 1094285,
-        "Founded": "1960",
-    },
-    "TFX": {
-        "Company": "Teleflex",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Wayne, Pennsylvania",
-        "Added": "2019-01-18",
-        "CIK": 96943,
-        "Founded": "1943",
-    },
-    "TER": {
-        "Company": "Teradyne",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Materials & Equipment",
-        "Headquarters": "North Reading, Massachusetts",
-        "Added": "2020-09-21",
-        "CIK": 97210,
-        "Founded": "1960",
-    },
-    "TSLA": {
-        "Company": "Tesla, Inc.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automobile Manufacturers",
-        "Headquarters": "Austin, Texas",
-        "Added": "2020-12-21",
-        "CIK": 1318605,
-        "Founded": "2003",
-    },
-    "TXN": {
-        "Company": "Texas Instruments",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Dallas, Texas",
-        "Added": "2001-03-12",
-        "CIK": 97476,
-        "Founded": "1930",
-    },
-    "TXT": {
-        "Company": "Textron",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Providence, Rhode Island",
-        "Added": "1978-12-31",
-        "CIK": 217346,
-        "Founded": "1923",
-    },
-    "TMO": {
-        "Company": "Thermo Fisher Scientific",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Waltham, Massachusetts",
-        "Added": "2004-08-03",
-        "CIK": 97745,
-        "Founded": "2006 (1902)",
-    },
-    "TJX": {
-        "Company": "TJX Companies",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel Retail",
-        "Headquarters": "Framingham, Massachusetts",
-        "Added": "1985-09-30",
-        "CIK": 109198,
-        "Founded": "1987",
-    },
-    "TSCO": {
-        "Company": "Tractor Supply",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Other Specialty Retail",
-        "Headquarters": "Brentwood, Tennessee",
-        "Added": "2014-01-24",
-        "CIK": 916365,
-        "Founded": "1938",
-    },
-    "TT": {
-        "Company": "Trane Technologies",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Dublin, Ireland",
-        "Added": "2010-11-17",
-        "CIK": 1466258,
-        "Founded": "1871",
-    },
-    "TDG": {
-        "Company": "TransDigm Group",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Cleveland, Ohio",
-        "Added": "2016-06-03",
-        "CIK": 1260221,
-        "Founded": "1993",
-    },
-    "TRV": {
-        "Company": "Travelers Companies (The)",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "New York City, New York",
-        "Added": "2002-08-21",
-        "CIK": 86312,
-        "Founded": "1853",
-    },
-    "TRMB": {
-        "Company": "Trimble Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Westminster, Colorado",
-        "Added": "2021-01-21",
-        "CIK": 864749,
-        "Founded": "1978",
-    },
-    "TFC": {
-        "Company": "Truist Financial",
-        "Sector": "Financials",
-        "Industry": "Diversified Banks",
-        "Headquarters": "Charlotte, North Carolina",
-        "Added": "1997-12-04",
-        "CIK": 92230,
-        "Founded": "1872",
-    },
-    "TYL": {
-        "Company": "Tyler Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Plano, Texas",
-        "Added": "2020-06-22",
-        "CIK": 860731,
-        "Founded": "1966",
-    },
-    "TSN": {
-        "Company": "Tyson Foods",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Springdale, Arkansas",
-        "Added": "2005-08-10",
-        "CIK": 100493,
-        "Founded": "1935",
-    },
-    "USB": {
-        "Company": "U.S. Bancorp",
-        "Sector": "Financials",
-        "Industry": "Diversified Banks",
-        "Headquarters": "Minneapolis, Minnesota",
-        "Added": "1999-11-01",
-        "CIK": 36104,
-        "Founded": "1968",
-    },
-    "UBER": {
-        "Company": "Uber",
-        "Sector": "Industrials",
-        "Industry": "Passenger Ground Transportation",
-        "Headquarters": "San Francisco, California",
-        "Added": "2023-12-18",
-        "CIK": 1543151,
-        "Founded": "2009",
-    },
-    "UDR": {
-        "Company": "UDR, Inc.",
-        "Sector": "Real Estate",
-        "Industry": "Multi-Family Residential REITs",
-        "Headquarters": "Highlands Ranch, Colorado",
-        "Added": "2016-03-07",
-        "CIK": 74208,
-        "Founded": "1972",
-    },
-    "ULTA": {
-        "Company": "Ulta Beauty",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Other Specialty Retail",
-        "Headquarters": "Bolingbrook, Illinois",
-        "Added": "2016-04-18",
-        "CIK": 1403568,
-        "Founded": "1990",
-    },
-    "UNP": {
-        "Company": "Union Pacific Corporation",
-        "Sector": "Industrials",
-        "Industry": "Rail Transportation",
-        "Headquarters": "Omaha, Nebraska",
-        "Added": "1957-03-04",
-        "CIK": 100885,
-        "Founded": "1862",
-    },
-    "UAL": {
-        "Company": "United Airlines Holdings",
-        "Sector": "Industrials",
-        "Industry": "Passenger Airlines",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2015-09-03",
-        "CIK": 100517,
-        "Founded": "1967",
-    },
-    "UPS": {
-        "Company": "United Parcel Service",
-        "Sector": "Industrials",
-        "Industry": "Air Freight & Logistics",
-        "Headquarters": "Sandy Springs, Georgia",
-        "Added": "2002-07-22",
-        "CIK": 1090727,
-        "Founded": "1907",
-    },
-    "URI": {
-        "Company": "United Rentals",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-        "Headquarters": "Stamford, Connecticut",
-        "Added": "2014-09-20",
-        "CIK": 1067701,
-        "Founded": "1997",
-    },
-    "UNH": {
-        "Company": "UnitedHealth Group",
-        "Sector": "Health Care",
-        "Industry": "Managed Health Care",
-        "Headquarters": "Minnetonka, Minnesota",
-        "Added": "1994-07-01",
-        "CIK": 731766,
-        "Founded": "1977",
-    },
-    "UHS": {
-        "Company": "Universal Health Services",
-        "Sector": "Health Care",
-        "Industry": "Health Care Facilities",
-        "Headquarters": "King of Prussia, Pennsylvania",
-        "Added": "2014-09-20",
-        "CIK": 352915,
-        "Founded": "1979",
-    },
-    "VLO": {
-        "Company": "Valero Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Refining & Marketing",
-        "Headquarters": "San Antonio, Texas",
-        "Added": "2002-12-20",
-        "CIK": 1035002,
-        "Founded": "1980",
-    },
-    "VTR": {
-        "Company": "Ventas",
-        "Sector": "Real Estate",
-        "Industry": "Health Care REITs",
-        "Headquarters": "Chicago, Illinois",
-        "Added": "2009-03-04",
-        "CIK": 740260,
-        "Founded": "1998",
-    },
-    "VLTO": {
-        "Company": "Veralto",
-        "Sector": "Industrials",
-        "Industry": "Environmental & Facilities Services",
-        "Headquarters": "Waltham, Massachusetts",
-        "Added": "2023-10-02",
-        "CIK": 1967680,
-        "Founded": "2023",
-    },
-    "VRSN": {
-        "Company": "Verisign",
-        "Sector": "Information Technology",
-        "Industry": "Internet Services & Infrastructure",
-        "Headquarters": "Dulles, Virginia",
-        "Added": "2006-02-01",
-        "CIK": 1014473,
-        "Founded": "1995",
-    },
-    "VRSK": {
-        "Company": "Verisk Analytics",
-        "Sector": "Industrials",
-        "Industry": "Research & Consulting Services",
-        "Headquarters": "Jersey City, New Jersey",
-        "Added": "2015-10-08",
-        "CIK": 1442145,
-        "Founded": "1971",
-    },
-    "VZ": {
-        "Company": "Verizon",
-        "Sector": "Communication Services",
-        "Industry": "Integrated Telecommunication Services",
-        "Headquarters": "New York City, New York",
-        "Added": "1983-11-30",
-        "CIK": 732712,
-        "Founded": "1983 (1877)",
-    },
-    "VRTX": {
-        "Company": "Vertex Pharmaceuticals",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Boston, Massachusetts",
-        "Added": "2013-09-23",
-        "CIK": 875320,
-        "Founded": "1989",
-    },
-    "VTRS": {
-        "Company": "Viatris",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Added": "2004-04-23",
-        "CIK": 1792044,
-        "Founded": "1961",
-    },
-    "VICI": {
-        "Company": "Vici Properties",
-        "Sector": "Real Estate",
-        "Industry": "Hotel & Resort REITs",
-        "Headquarters": "New York City, New York",
-        "Added": "2022-06-08",
-        "CIK": 1705696,
-        "Founded": "2017",
-    },
-    "V": {
-        "Company": "Visa Inc.",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "San Francisco, California",
-        "Added": "2009-12-21",
-        "CIK": 1403161,
-        "Founded": "1958",
-    },
-    "VST": {
-        "Company": "Vistra Corp.",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Irving, Texas",
-        "Added": "2024-05-08",
-        "CIK": 1692819,
-        "Founded": "2016",
-    },
-    "VMC": {
-        "Company": "Vulcan Materials Company",
-        "Sector": "Materials",
-        "Industry": "Construction Materials",
-        "Headquarters": "Birmingham, Alabama",
-        "Added": "1999-06-30",
-        "CIK": 1396009,
-        "Founded": "1909",
-    },
-    "WRB": {
-        "Company": "W. R. Berkley Corporation",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Greenwich, Connecticut",
-        "Added": "2019-12-05",
-        "CIK": 11544,
-        "Founded": "1967",
-    },
-    "GWW": {
-        "Company": "W. W. Grainger",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Lake Forest, Illinois",
-        "Added": "1981-06-30",
-        "CIK": 277135,
-        "Founded": "1927",
-    },
-    "WAB": {
-        "Company": "Wabtec",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Added": "2019-02-27",
-        "CIK": 943452,
-        "Founded": "1999 (1869)",
-    },
-    "WBA": {
-        "Company": "Walgreens Boots Alliance",
-        "Sector": "Consumer Staples",
-        "Industry": "Drug Retail",
-        "Headquarters": "Deerfield, Illinois",
-        "Added": "1979-12-31",
-        "CIK": 1618921,
-        "Founded": "2014",
-    },
-    "WMT": {
-        "Company": "Walmart",
-        "Sector": "Consumer Staples",
-        "Industry": "Consumer Staples Merchandise Retail",
-        "Headquarters": "Bentonville, Arkansas",
-        "Added": "1982-08-31",
-        "CIK": 104169,
-        "Founded": "1962",
-    },
-    "DIS": {
-        "Company": "Walt Disney Company (The)",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-        "Headquarters": "Burbank, California",
-        "Added": "1976-06-30",
-        "CIK": 1744489,
-        "Founded": "1923",
-    },
-    "WBD": {
-        "Company": "Warner Bros. Discovery",
-        "Sector": "Communication Services",
-        "Industry": "Broadcasting",
-        "Headquarters": "New York City, New York",
-        "Added": "2022-04-11",
-        "CIK": 1437107,
-        "Founded": "2022 (Warner Bros. 1923)",
-    },
-    "WM": {
-        "Company": "Waste Management",
-        "Sector": "Industrials",
-        "Industry": "Environmental & Facilities Services",
-        "Headquarters": "Houston, Texas",
-        "Added": "1998-08-31",
-        "CIK": 823768,
-        "Founded": "1968",
-    },
-    "WAT": {
-        "Company": "Waters Corporation",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Milford, Massachusetts",
-        "Added": "2002-01-02",
-        "CIK": 1000697,
-        "Founded": "1958",
-    },
-    "WEC": {
-        "Company": "WEC Energy Group",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Milwaukee, Wisconsin",
-        "Added": "2008-10-31",
-        "CIK": 783325,
-        "Founded": "1896",
-    },
-    "WFC": {
-        "Company": "Wells Fargo",
-        "Sector": "Financials",
-        "Industry": "Diversified Banks",
-        "Headquarters": "San Francisco, California",
-        "Added": "1976-06-30",
-        "CIK": 72971,
-        "Founded": "1852",
-    },
-    "WELL": {
-        "Company": "Welltower",
-        "Sector": "Real Estate",
-        "Industry": "Health Care REITs",
-        "Headquarters": "Toledo, Ohio",
-        "Added": "2009-01-30",
-        "CIK": 766704,
-        "Founded": "1970",
-    },
-    "WST": {
-        "Company": "West Pharmaceutical Services",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": "Exton, Pennsylvania",
-        "Added": "2020-05-22",
-        "CIK": 105770,
-        "Founded": "1923",
-    },
-    "WDC": {
-        "Company": "Western Digital",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "San Jose, California",
-        "Added": "2009-07-01",
-        "CIK": 106040,
-        "Founded": "1970",
-    },
-    "WY": {
-        "Company": "Weyerhaeuser",
-        "Sector": "Real Estate",
-        "Industry": "Timber REITs",
-        "Headquarters": "Seattle, Washington",
-        "Added": "1979-10-01",
-        "CIK": 106535,
-        "Founded": "1900",
-    },
-    "WMB": {
-        "Company": "Williams Companies",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Storage & Transportation",
-        "Headquarters": "Tulsa, Oklahoma",
-        "Added": "1975-03-31",
-        "CIK": 107263,
-        "Founded": "1908",
-    },
-    "WTW": {
-        "Company": "Willis Towers Watson",
-        "Sector": "Financials",
-        "Industry": "Insurance Brokers",
-        "Headquarters": "London, United Kingdom",
-        "Added": "2016-01-05",
-        "CIK": 1140536,
-        "Founded": "2016",
-    },
-    "WYNN": {
-        "Company": "Wynn Resorts",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Casinos & Gaming",
-        "Headquarters": "Paradise, Nevada",
-        "Added": "2008-11-14",
-        "CIK": 1174922,
-        "Founded": "2002",
-    },
-    "XEL": {
-        "Company": "Xcel Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Minneapolis, Minnesota",
-        "Added": "1957-03-04",
-        "CIK": 72903,
-        "Founded": "1909",
-    },
-    "XYL": {
-        "Company": "Xylem Inc.",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "White Plains, New York",
-        "Added": "2011-11-01",
-        "CIK": 1524472,
-        "Founded": "2011",
-    },
-    "YUM": {
-        "Company": "Yum! Brands",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Louisville, Kentucky",
-        "Added": "1997-10-06",
-        "CIK": 1041061,
-        "Founded": "1997",
-    },
-    "ZBRA": {
-        "Company": "Zebra Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Lincolnshire, Illinois",
-        "Added": "2019-12-23",
-        "CIK": 877212,
-        "Founded": "1969",
-    },
-    "ZBH": {
-        "Company": "Zimmer Biomet",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Warsaw, Indiana",
-        "Added": "2001-08-07",
-        "CIK": 1136869,
-        "Founded": "1927",
-    },
-    "ZTS": {
-        "Company": "Zoetis",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "Parsippany, New Jersey",
-        "Added": "2013-06-21",
-        "CIK": 1555280,
-        "Founded": "1952",
-    },
-}
+`from pizzapy.database_update.generated_stock_list import sp_500_stocks` still works, it reads the file at import time.
 
+"""
 
-# 401
-sp_400_dict: Dict = {
-    "AA": {
-        "Company": "Alcoa",
-        "Sector": "Materials",
-        "Industry": "Aluminum",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Filing": "reports",
-    },
-    "AAL": {
-        "Company": "American Airlines Group",
-        "Sector": "Industrials",
-        "Industry": "Passenger Airlines",
-        "Headquarters": "Fort Worth, Texas",
-        "Filing": "reports",
-    },
-    "AAON": {
-        "Company": "AAON",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Tulsa, Oklahoma",
-        "Filing": "reports",
-    },
-    "ACHC": {
-        "Company": "Acadia Healthcare",
-        "Sector": "Health Care",
-        "Industry": "Health Care Facilities",
-        "Headquarters": "Franklin, Tennessee",
-        "Filing": "reports",
-    },
-    "ACM": {
-        "Company": "AECOM",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Dallas, Texas",
-        "Filing": "reports",
-    },
-    "ADC": {
-        "Company": "Agree Realty",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "Bloomfield Hills, Michigan",
-        "Filing": "reports",
-    },
-    "AFG": {
-        "Company": "American Financial Group",
-        "Sector": "Financials",
-        "Industry": "Multi-line Insurance",
-        "Headquarters": "Cincinnati, Ohio",
-        "Filing": "reports",
-    },
-    "AGCO": {
-        "Company": "AGCO",
-        "Sector": "Industrials",
-        "Industry": "Agricultural & Farm Machinery",
-        "Headquarters": "Duluth, Georgia",
-        "Filing": "reports",
-    },
-    "AIT": {
-        "Company": "Applied Industrial Technologies",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-        "Headquarters": "Cleveland, Ohio",
-        "Filing": "reports",
-    },
-    "ALE": {
-        "Company": "ALLETE",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Duluth, Minnesota",
-        "Filing": "reports",
-    },
-    "ALGM": {
-        "Company": "Allegro MicroSystems",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Manchester, New Hampshire",
-        "Filing": "reports",
-    },
-    "ALLY": {
-        "Company": "Ally Financial",
-        "Sector": "Financials",
-        "Industry": "Consumer Finance",
-        "Headquarters": "Detroit, Michigan",
-        "Filing": "reports",
-    },
-    "ALTM": {
-        "Company": "Arcadium Lithium",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Shannon, Ireland",
-        "Filing": "reports",
-    },
-    "ALTR": {
-        "Company": "Altair Engineering",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Troy, Michigan",
-        "Filing": "reports",
-    },
-    "ALV": {
-        "Company": "Autoliv",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Parts & Equipment",
-        "Headquarters": "Stockholm, Sweden",
-        "Filing": "reports",
-    },
-    "AM": {
-        "Company": "Antero Midstream",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Storage & Transportation",
-        "Headquarters": "Denver, Colorado",
-        "Filing": "reports",
-    },
-    "AMED": {
-        "Company": "Amedisys",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Baton Rouge, Louisiana",
-        "Filing": "reports",
-    },
-    "AMG": {
-        "Company": "Affiliated Managers Group",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "West Palm Beach, Florida",
-        "Filing": "reports",
-    },
-    "AMH": {
-        "Company": "American Homes 4 Rent",
-        "Sector": "Real Estate",
-        "Industry": "Single-Family Residential REITs",
-        "Headquarters": "Las Vegas, Nevada",
-        "Filing": "reports",
-    },
-    "AMKR": {
-        "Company": "Amkor Technology",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Tempe, Arizona",
-        "Filing": "reports",
-    },
-    "AN": {
-        "Company": "AutoNation",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "Fort Lauderdale, Florida",
-        "Filing": "reports",
-    },
-    "ANF": {
-        "Company": "Abercrombie & Fitch",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel Retail",
-        "Headquarters": "New Albany, Ohio",
-        "Filing": "reports",
-    },
-    "APPF": {
-        "Company": "AppFolio",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Goleta, California",
-        "Filing": "reports",
-    },
-    "AR": {
-        "Company": "Antero Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Denver, Colorado",
-        "Filing": "reports",
-    },
-    "ARMK": {
-        "Company": "Aramark",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Distributors",
-        "Headquarters": "Philadelphia, Pennsylvania",
-        "Filing": "reports",
-    },
-    "ARW": {
-        "Company": "Arrow Electronics",
-        "Sector": "Information Technology",
-        "Industry": "Technology Distributors",
-        "Headquarters": "Centennial, Colorado",
-        "Filing": "reports",
-    },
-    "ARWR": {
-        "Company": "Arrowhead Pharmaceuticals",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Pasadena, California",
-        "Filing": "reports",
-    },
-    "ASB": {
-        "Company": "Associated Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Green Bay, Wisconsin",
-        "Filing": "reports",
-    },
-    "ASGN": {
-        "Company": "ASGN Inc.",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "Glen Allen, Virginia",
-        "Filing": "reports",
-    },
-    "ASH": {
-        "Company": "Ashland Global",
-        "Sector": "Materials",
-        "Industry": "Diversified Chemicals",
-        "Headquarters": "Wilmington, Delaware",
-        "Filing": "reports",
-    },
-    "ATR": {
-        "Company": "AptarGroup",
-        "Sector": "Materials",
-        "Industry": "Metal, Glass & Plastic Containers",
-        "Headquarters": "Crystal Lake, Illinois",
-        "Filing": "reports",
-    },
-    "AVNT": {
-        "Company": "Avient",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Avon Lake, Ohio",
-        "Filing": "reports",
-    },
-    "AVT": {
-        "Company": "Avnet",
-        "Sector": "Information Technology",
-        "Industry": "Technology Distributors",
-        "Headquarters": "Phoenix, Arizona",
-        "Filing": "reports",
-    },
-    "AVTR": {
-        "Company": "Avantor",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Radnor, Pennsylvania",
-        "Filing": "reports",
-    },
-    "AXTA": {
-        "Company": "Axalta",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Philadelphia, Pennsylvania",
-        "Filing": "reports",
-    },
-    "AYI": {
-        "Company": "Acuity Brands",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Atlanta, Georgia",
-        "Filing": "reports",
-    },
-    "AZPN": {
-        "Company": "Aspen Technology",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Bedford, Massachusetts",
-        "Filing": "reports",
-    },
-    "AZTA": {
-        "Company": "Azenta",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Chelmsford, Massachusetts",
-        "Filing": "reports",
-    },
-    "BC": {
-        "Company": "Brunswick",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Leisure Products",
-        "Headquarters": "Mettawa, Illinois",
-        "Filing": "reports",
-    },
-    "BCO": {
-        "Company": "Brink's",
-        "Sector": "Industrials",
-        "Industry": "Security & Alarm Services",
-        "Headquarters": "Richmond, Virginia",
-        "Filing": "reports",
-    },
-    "BDC": {
-        "Company": "Belden",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Components",
-        "Headquarters": "St. Louis, Missouri",
-        "Filing": "reports",
-    },
-    "BERY": {
-        "Company": "Berry Global",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Evansville, Indiana",
-        "Filing": "reports",
-    },
-    "BHF": {
-        "Company": "Brighthouse Financial",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "Charlotte, North Carolina",
-        "Filing": "reports",
-    },
-    "BIO": {
-        "Company": "Bio-Rad Laboratories",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "Hercules, California",
-        "Filing": "reports",
-    },
-    "BJ": {
-        "Company": "BJ's Wholesale Club",
-        "Sector": "Consumer Staples",
-        "Industry": "Hypermarkets & Super Centers",
-        "Headquarters": "Marlborough, Massachusetts",
-        "Filing": "reports",
-    },
-    "BKH": {
-        "Company": "Black Hills Corporation",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Rapid City, South Dakota",
-        "Filing": "reports",
-    },
-    "BLD": {
-        "Company": "TopBuild Corp.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "BLKB": {
-        "Company": "Blackbaud",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Charleston, South Carolina",
-        "Filing": "reports",
-    },
-    "BMRN": {
-        "Company": "BioMarin Pharmaceutical",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "San Rafael, California",
-        "Filing": "reports",
-    },
-    "BRBR": {
-        "Company": "BellRing Brands",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "BRKR": {
-        "Company": "Bruker",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Billerica, Massachusetts",
-        "Filing": "reports",
-    },
-    "BRX": {
-        "Company": "Brixmor Property Group",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "BURL": {
-        "Company": "Burlington",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel Retail",
-        "Headquarters": "Burlington, New Jersey",
-        "Filing": "reports",
-    },
-    "BWXT": {
-        "Company": "BWX Technologies",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Lynchburg, Virginia",
-        "Filing": "reports",
-    },
-    "BYD": {
-        "Company": "Boyd Gaming",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Casinos & Gaming",
-        "Headquarters": "Las Vegas, Nevada",
-        "Filing": "reports",
-    },
-    "CACI": {
-        "Company": "CACI International",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Reston, Virginia",
-        "Filing": "reports",
-    },
-    "CADE": {
-        "Company": "Cadence Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Tupelo, Mississippi Houston, Texas",
-        "Filing": "reports",
-    },
-    "CAR": {
-        "Company": "Avis Budget Group",
-        "Sector": "Industrials",
-        "Industry": "Passenger Ground Transportation",
-        "Headquarters": "Parsippany, New Jersey",
-        "Filing": "reports",
-    },
-    "CASY": {
-        "Company": "Casey's General Stores",
-        "Sector": "Consumer Staples",
-        "Industry": "Food Retail",
-        "Headquarters": "Ankeny, Iowa",
-        "Filing": "reports",
-    },
-    "CBSH": {
-        "Company": "Commerce Bancshares",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Kansas City, Missouri",
-        "Filing": "reports",
-    },
-    "CBT": {
-        "Company": "Cabot Corp",
-        "Sector": "Materials",
-        "Industry": "Diversified Chemicals",
-        "Headquarters": "Boston, Massachusetts",
-        "Filing": "reports",
-    },
-    "CC": {
-        "Company": "Chemours",
-        "Sector": "Materials",
-        "Industry": "Diversified Chemicals",
-        "Headquarters": "Wilmington, Delaware",
-        "Filing": "reports",
-    },
-    "CCK": {
-        "Company": "Crown Holdings",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Yardley, Pennsylvania",
-        "Filing": "reports",
-    },
-    "CDP": {
-        "Company": "COPT Defense Properties",
-        "Sector": "Real Estate",
-        "Industry": "Office REITs",
-        "Headquarters": "Columbia, Maryland",
-        "Filing": "reports",
-    },
-    "CELH": {
-        "Company": "Celsius Holdings",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "CFR": {
-        "Company": "Frost Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "San Antonio, Texas",
-        "Filing": "reports",
-    },
-    "CG": {
-        "Company": "Carlyle Group",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Washington, D.C.",
-        "Filing": "reports",
-    },
-    "CGNX": {
-        "Company": "Cognex",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Natick, Massachusetts",
-        "Filing": "reports",
-    },
-    "CHDN": {
-        "Company": "Churchill Downs Inc.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Casinos & Gaming",
-        "Headquarters": "Louisville, Kentucky",
-        "Filing": "reports",
-    },
-    "CHE": {
-        "Company": "Chemed Corp.",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Cincinnati, Ohio",
-        "Filing": "reports",
-    },
-    "CHH": {
-        "Company": "Choice Hotels",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Rockville, Maryland",
-        "Filing": "reports",
-    },
-    "CHRD": {
-        "Company": "Chord Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "CHWY": {
-        "Company": "Chewy",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Other Specialty Retail",
-        "Headquarters": "Plantation, Florida",
-        "Filing": "reports",
-    },
-    "CHX": {
-        "Company": "ChampionX",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Equipment & Services",
-        "Headquarters": "The Woodlands, Texas",
-        "Filing": "reports",
-    },
-    "CIEN": {
-        "Company": "Ciena",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-        "Headquarters": "Hanover, Maryland",
-        "Filing": "reports",
-    },
-    "CIVI": {
-        "Company": "Civitas Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Denver, Colorado",
-        "Filing": "reports",
-    },
-    "CLF": {
-        "Company": "Cleveland-Cliffs",
-        "Sector": "Materials",
-        "Industry": "Steel",
-        "Headquarters": "Cleveland, Ohio",
-        "Filing": "reports",
-    },
-    "CLH": {
-        "Company": "Clean Harbors",
-        "Sector": "Industrials",
-        "Industry": "Environmental & Facilities Services",
-        "Headquarters": "Norwell, Massachusetts",
-        "Filing": "reports",
-    },
-    "CMC": {
-        "Company": "Commercial Metals",
-        "Sector": "Materials",
-        "Industry": "Steel",
-        "Headquarters": "Irving, Texas",
-        "Filing": "reports",
-    },
-    "CNH": {
-        "Company": "CNH Industrial",
-        "Sector": "Industrials",
-        "Industry": "Agricultural & Farm Machinery",
-        "Headquarters": "Amsterdam, Netherlands",
-        "Filing": "reports",
-    },
-    "CNM": {
-        "Company": "Core & Main",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-        "Headquarters": "St. Louis, Missouri",
-        "Filing": "reports",
-    },
-    "CNO": {
-        "Company": "CNO Financial Group",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "Carmel, Indiana",
-        "Filing": "reports",
-    },
-    "CNX": {
-        "Company": "CNX Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Filing": "reports",
-    },
-    "CNXC": {
-        "Company": "Concentrix",
-        "Sector": "Industrials",
-        "Industry": "Data Processing & Outsourced Services",
-        "Headquarters": "Newark, California",
-        "Filing": "reports",
-    },
-    "COHR": {
-        "Company": "Coherent Corp.",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Components",
-        "Headquarters": "Saxonburg, Pennsylvania",
-        "Filing": "reports",
-    },
-    "COKE": {
-        "Company": "Coca-Cola Consolidated",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-        "Headquarters": "Charlotte, North Carolina",
-        "Filing": "reports",
-    },
-    "COLB": {
-        "Company": "Columbia Banking System",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Tacoma, Washington",
-        "Filing": "reports",
-    },
-    "COLM": {
-        "Company": "Columbia Sportswear",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "Portland, Oregon",
-        "Filing": "reports",
-    },
-    "COTY": {
-        "Company": "Coty",
-        "Sector": "Consumer Staples",
-        "Industry": "Personal Care Products",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "CPRI": {
-        "Company": "Capri Holdings",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "CR": {
-        "Company": "Crane",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Stamford, Connecticut",
-        "Filing": "reports",
-    },
-    "CRI": {
-        "Company": "Carter's",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "Atlanta, Georgia",
-        "Filing": "reports",
-    },
-    "CROX": {
-        "Company": "Crocs",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Footwear",
-        "Headquarters": "Broomfield, Colorado",
-        "Filing": "reports",
-    },
-    "CRUS": {
-        "Company": "Cirrus Logic",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Austin, Texas",
-        "Filing": "reports",
-    },
-    "CSL": {
-        "Company": "Carlisle Companies",
-        "Sector": "Industrials",
-        "Industry": "Industrial Conglomerates",
-        "Headquarters": "Phoenix, Arizona",
-        "Filing": "reports",
-    },
-    "CUBE": {
-        "Company": "CubeSmart",
-        "Sector": "Real Estate",
-        "Industry": "Industrial REITs",
-        "Headquarters": "Malvern, Pennsylvania",
-        "Filing": "reports",
-    },
-    "CUZ": {
-        "Company": "Cousins Properties",
-        "Sector": "Real Estate",
-        "Industry": "Office REITs",
-        "Headquarters": "Atlanta, Georgia",
-        "Filing": "reports",
-    },
-    "CVLT": {
-        "Company": "CommVault Systems",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Tinton Falls, New Jersey",
-        "Filing": "reports",
-    },
-    "CW": {
-        "Company": "Curtiss-Wright",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Davidson, North Carolina",
-        "Filing": "reports",
-    },
-    "CXT": {
-        "Company": "Crane NXT",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Stamford, Connecticut",
-        "Filing": "reports",
-    },
-    "CYTK": {
-        "Company": "Cytokinetics",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "South San Francisco, California",
-        "Filing": "reports",
-    },
-    "DAR": {
-        "Company": "Darling Ingredients",
-        "Sector": "Consumer Staples",
-        "Industry": "Agricultural Products & Services",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "DBX": {
-        "Company": "Dropbox",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "San Francisco, California",
-        "Filing": "reports",
-    },
-    "DCI": {
-        "Company": "Donaldson",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Bloomington, Minnesota",
-        "Filing": "reports",
-    },
-    "DINO": {
-        "Company": "HF Sinclair",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Refining & Marketing",
-        "Headquarters": "Dallas, Texas",
-        "Filing": "reports",
-    },
-    "DKS": {
-        "Company": "Dick's Sporting Goods",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Specialty Stores",
-        "Headquarters": "Coraopolis, Pennsylvania",
-        "Filing": "reports",
-    },
-    "DLB": {
-        "Company": "Dolby",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "San Francisco, California",
-        "Filing": "reports",
-    },
-    "DOCS": {
-        "Company": "Doximity",
-        "Sector": "Health Care",
-        "Industry": "Health Care Technology",
-        "Headquarters": "San Francisco, California",
-        "Filing": "reports",
-    },
-    "DOCU": {
-        "Company": "Docusign",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "San Francisco, California",
-        "Filing": "reports",
-    },
-    "DT": {
-        "Company": "Dynatrace",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Waltham, Massachusetts",
-        "Filing": "reports",
-    },
-    "DTM": {
-        "Company": "DT Midstream",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Storage & Transportation",
-        "Headquarters": "Detroit, Michigan",
-        "Filing": "reports",
-    },
-    "DUOL": {
-        "Company": "Duolingo",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Education Services",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Filing": "reports",
-    },
-    "EEFT": {
-        "Company": "Euronet Worldwide",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Leawood, Kansas",
-        "Filing": "reports",
-    },
-    "EGP": {
-        "Company": "EastGroup Properties",
-        "Sector": "Real Estate",
-        "Industry": "Industrial REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "EHC": {
-        "Company": "Encompass Health",
-        "Sector": "Health Care",
-        "Industry": "Health Care Facilities",
-        "Headquarters": "Birmingham, Alabama",
-        "Filing": "reports",
-    },
-    "ELF": {
-        "Company": "e.l.f. Beauty",
-        "Sector": "Consumer Staples",
-        "Industry": "Personal Care Products",
-        "Headquarters": "Oakland, California",
-        "Filing": "reports",
-    },
-    "ELS": {
-        "Company": "Equity Lifestyle Properties",
-        "Sector": "Real Estate",
-        "Industry": "Single-Family Residential REITs",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "EME": {
-        "Company": "Emcor",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Norwalk, Connecticut",
-        "Filing": "reports",
-    },
-    "ENOV": {
-        "Company": "Enovis",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Wilmington, Delaware",
-        "Filing": "reports",
-    },
-    "ENS": {
-        "Company": "EnerSys",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Reading, Pennsylvania",
-        "Filing": "reports",
-    },
-    "ENSG": {
-        "Company": "Ensign Group",
-        "Sector": "Health Care",
-        "Industry": "Health Care Facilities",
-        "Headquarters": "San Juan Capistrano, California",
-        "Filing": "reports",
-    },
-    "EPR": {
-        "Company": "EPR Properties",
-        "Sector": "Real Estate",
-        "Industry": "Other Specialized REITs",
-        "Headquarters": "Kansas City, Missouri",
-        "Filing": "reports",
-    },
-    "EQH": {
-        "Company": "Equitable Holdings",
-        "Sector": "Financials",
-        "Industry": "Diversified Financial Services",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "ESAB": {
-        "Company": "ESAB",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "North Bethesda, Maryland",
-        "Filing": "reports",
-    },
-    "ESNT": {
-        "Company": "Essent Group Ltd.",
-        "Sector": "Financials",
-        "Industry": "Commercial & Residential Mortgage Finance",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "EVR": {
-        "Company": "Evercore",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "EWBC": {
-        "Company": "East West Bancorp",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "EXE": {
-        "Company": "Expand Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Oklahoma City, Oklahoma",
-        "Filing": "reports",
-    },
-    "EXEL": {
-        "Company": "Exelixis",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Alameda, California",
-        "Filing": "reports",
-    },
-    "EXLS": {
-        "Company": "EXL Service",
-        "Sector": "Industrials",
-        "Industry": "Data Processing & Outsourced Services",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "EXP": {
-        "Company": "Eagle Materials",
-        "Sector": "Materials",
-        "Industry": "Construction Materials",
-        "Headquarters": "Dallas, Texas",
-        "Filing": "reports",
-    },
-    "EXPO": {
-        "Company": "Exponent, Inc.",
-        "Sector": "Industrials",
-        "Industry": "Research & Consulting Services",
-        "Headquarters": "Menlo Park, California",
-        "Filing": "reports",
-    },
-    "FAF": {
-        "Company": "First American Financial Corporation",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Santa Ana, California",
-        "Filing": "reports",
-    },
-    "FBIN": {
-        "Company": "Fortune Brands Innovations",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Deerfield, Illinois",
-        "Filing": "reports",
-    },
-    "FCFS": {
-        "Company": "FirstCash",
-        "Sector": "Financials",
-        "Industry": "Consumer Finance",
-        "Headquarters": "Fort Worth, Texas",
-        "Filing": "reports",
-    },
-    "FCN": {
-        "Company": "FTI Consulting",
-        "Sector": "Industrials",
-        "Industry": "Research & Consulting Services",
-        "Headquarters": "Washington, D.C.",
-        "Filing": "reports",
-    },
-    "FFIN": {
-        "Company": "First Financial Bankshares",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Cincinnati, Ohio",
-        "Filing": "reports",
-    },
-    "FHI": {
-        "Company": "Federated Hermes",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Filing": "reports",
-    },
-    "FHN": {
-        "Company": "First Horizon",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Memphis, Tennessee",
-        "Filing": "reports",
-    },
-    "FIVE": {
-        "Company": "Five Below",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Specialty Stores",
-        "Headquarters": "Philadelphia, Pennsylvania",
-        "Filing": "reports",
-    },
-    "FIX": {
-        "Company": "Comfort Systems USA",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "FLO": {
-        "Company": "Flowers Foods",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Thomasville, Georgia",
-        "Filing": "reports",
-    },
-    "FLR": {
-        "Company": "Fluor",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Irving, Texas",
-        "Filing": "reports",
-    },
-    "FLS": {
-        "Company": "Flowserve",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Irving, Texas",
-        "Filing": "reports",
-    },
-    "FN": {
-        "Company": "Fabrinet",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Manufacturing Services",
-        "Headquarters": "Santa Clara, California",
-        "Filing": "reports",
-    },
-    "FNB": {
-        "Company": "FNB Corporation",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Filing": "reports",
-    },
-    "FND": {
-        "Company": "Floor & Decor",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Home Improvement Retail",
-        "Headquarters": "Smyrna, Georgia",
-        "Filing": "reports",
-    },
-    "FNF": {
-        "Company": "Fidelity National Financial",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Jacksonville, Florida",
-        "Filing": "reports",
-    },
-    "FR": {
-        "Company": "First Industrial Realty Trust",
-        "Sector": "Real Estate",
-        "Industry": "Industrial REITs",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "FYBR": {
-        "Company": "Frontier Communications",
-        "Sector": "Communication Services",
-        "Industry": "Integrated Telecommunication Services",
-        "Headquarters": "Norwalk, Connecticut",
-        "Filing": "reports",
-    },
-    "G": {
-        "Company": "Genpact",
-        "Sector": "Industrials",
-        "Industry": "Data Processing & Outsourced Services",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "GAP": {
-        "Company": "Gap Inc.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel Retail",
-        "Headquarters": "San Francisco, California",
-        "Filing": "reports",
-    },
-    "GATX": {
-        "Company": "GATX",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "GBCI": {
-        "Company": "Glacier Bancorp",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Kalispell, Montana",
-        "Filing": "reports",
-    },
-    "GEF": {
-        "Company": "Greif, Inc.",
-        "Sector": "Materials",
-        "Industry": "Metal, Glass & Plastic Containers",
-        "Headquarters": "Delaware, Ohio",
-        "Filing": "reports",
-    },
-    "GGG": {
-        "Company": "Graco",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Minneapolis, Minnesota",
-        "Filing": "reports",
-    },
-    "GHC": {
-        "Company": "Graham Holdings",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Education Services",
-        "Headquarters": "Arlington County, Virginia",
-        "Filing": "reports",
-    },
-    "GLPI": {
-        "Company": "Gaming and Leisure Properties",
-        "Sector": "Real Estate",
-        "Industry": "Specialized REITs",
-        "Headquarters": "Wyomissing, Pennsylvania",
-        "Filing": "reports",
-    },
-    "GME": {
-        "Company": "GameStop",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Computer & Electronics Retail",
-        "Headquarters": "Grapevine, Texas",
-        "Filing": "reports",
-    },
-    "GMED": {
-        "Company": "Globus Medical",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Audubon, Pennsylvania",
-        "Filing": "reports",
-    },
-    "GNTX": {
-        "Company": "Gentex",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Parts & Equipment",
-        "Headquarters": "Zeeland, Michigan",
-        "Filing": "reports",
-    },
-    "GPK": {
-        "Company": "Graphic Packaging",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Atlanta, Georgia",
-        "Filing": "reports",
-    },
-    "GT": {
-        "Company": "Goodyear Tire & Rubber",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Tires & Rubber",
-        "Headquarters": "Akron, Ohio",
-        "Filing": "reports",
-    },
-    "GTLS": {
-        "Company": "Chart Industries",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "GXO": {
-        "Company": "GXO Logistics",
-        "Sector": "Industrials",
-        "Industry": "Air Freight & Logistics",
-        "Headquarters": "Greenwich, Connecticut",
-        "Filing": "reports",
-    },
-    "H": {
-        "Company": "Hyatt",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "HAE": {
-        "Company": "Haemonetics",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": "Boston, Massachusetts",
-        "Filing": "reports",
-    },
-    "HALO": {
-        "Company": "Halozyme",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "San Diego, California",
-        "Filing": "reports",
-    },
-    "HGV": {
-        "Company": "Hilton Grand Vacations",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Orlando, Florida",
-        "Filing": "reports",
-    },
-    "HLI": {
-        "Company": "Houlihan Lokey",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "Los Angeles, California",
-        "Filing": "reports",
-    },
-    "HLNE": {
-        "Company": "Hamilton Lane",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Conshohocken, Pennsylvania",
-        "Filing": "reports",
-    },
-    "HOG": {
-        "Company": "Harley-Davidson",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Motorcycle Manufacturers",
-        "Headquarters": "Milwaukee, Wisconsin",
-        "Filing": "reports",
-    },
-    "HOMB": {
-        "Company": "Home BancShares",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Conway, Arkansas",
-        "Filing": "reports",
-    },
-    "HQY": {
-        "Company": "HealthEquity",
-        "Sector": "Health Care",
-        "Industry": "Managed Health Care",
-        "Headquarters": "Draper, Utah",
-        "Filing": "reports",
-    },
-    "HR": {
-        "Company": "Healthcare Realty Trust",
-        "Sector": "Real Estate",
-        "Industry": "Health Care REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "HRB": {
-        "Company": "H&R Block",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Specialized Consumer Services",
-        "Headquarters": "Kansas City, Missouri",
-        "Filing": "reports",
-    },
-    "HWC": {
-        "Company": "Hancock Whitney",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Gulfport, Mississippi",
-        "Filing": "reports",
-    },
-    "HXL": {
-        "Company": "Hexcel",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Stamford, Connecticut",
-        "Filing": "reports",
-    },
-    "IBKR": {
-        "Company": "Interactive Brokers",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "Greenwich, Connecticut",
-        "Filing": "reports",
-    },
-    "IBOC": {
-        "Company": "Intl Bancshares Corp",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Laredo, Texas",
-        "Filing": "reports",
-    },
-    "IDA": {
-        "Company": "Idacorp",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Boise, Idaho",
-        "Filing": "reports",
-    },
-    "ILMN": {
-        "Company": "Illumina, Inc.",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-        "Headquarters": "San Diego, California",
-        "Filing": "reports",
-    },
-    "INGR": {
-        "Company": "Ingredion",
-        "Sector": "Consumer Staples",
-        "Industry": "Agricultural Products & Services",
-        "Headquarters": "Westchester, Illinois",
-        "Filing": "reports",
-    },
-    "IPGP": {
-        "Company": "IPG Photonics",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Manufacturing Services",
-        "Headquarters": "Oxford, Massachusetts",
-        "Filing": "reports",
-    },
-    "IRDM": {
-        "Company": "Iridium Communications",
-        "Sector": "Communication Services",
-        "Industry": "Alternative Carriers",
-        "Headquarters": "McLean, Virginia",
-        "Filing": "reports",
-    },
-    "IRT": {
-        "Company": "IRT Living",
-        "Sector": "Real Estate",
-        "Industry": "Multi-Family Residential REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "ITT": {
-        "Company": "ITT",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Stamford, Connecticut",
-        "Filing": "reports",
-    },
-    "JAZZ": {
-        "Company": "Jazz Pharmaceuticals",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "Dublin, Ireland",
-        "Filing": "reports",
-    },
-    "JEF": {
-        "Company": "Jefferies",
-        "Sector": "Financials",
-        "Industry": "Multi-Sector Holdings",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "JHG": {
-        "Company": "Janus Henderson",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "JLL": {
-        "Company": "Jones Lang LaSalle",
-        "Sector": "Real Estate",
-        "Industry": "Real Estate Services",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "JWN": {
-        "Company": "Nordstrom",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-        "Headquarters": "Seattle, Washington",
-        "Filing": "reports",
-    },
-    "KBH": {
-        "Company": "KB Home",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": "Los Angeles, California",
-        "Filing": "reports",
-    },
-    "KBR": {
-        "Company": "KBR",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "KD": {
-        "Company": "Kyndryl",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "KEX": {
-        "Company": "Kirby",
-        "Sector": "Industrials",
-        "Industry": "Marine",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "KMPR": {
-        "Company": "Kemper",
-        "Sector": "Financials",
-        "Industry": "Multi-line Insurance",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "KNF": {
-        "Company": "Knife River Corporation",
-        "Sector": "Materials",
-        "Industry": "Construction Materials",
-        "Headquarters": "Bismarck, North Dakota",
-        "Filing": "reports",
-    },
-    "KNSL": {
-        "Company": "Kinsale Capital Group",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "KNX": {
-        "Company": "Knight-Swift",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-        "Headquarters": "Phoenix, Arizona",
-        "Filing": "reports",
-    },
-    "KRC": {
-        "Company": "Kilroy Realty Corp",
-        "Sector": "Real Estate",
-        "Industry": "Office REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "KRG": {
-        "Company": "Kite Realty Group Trust",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "LAD": {
-        "Company": "Lithia Motors",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "Medford, Oregon",
-        "Filing": "reports",
-    },
-    "LAMR": {
-        "Company": "Lamar Advertising Company",
-        "Sector": "Real Estate",
-        "Industry": "Other Specialized REITs",
-        "Headquarters": "Baton Rouge, Louisiana",
-        "Filing": "reports",
-    },
-    "LANC": {
-        "Company": "Lancaster Colony Corp",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "LEA": {
-        "Company": "Lear",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Parts & Equipment",
-        "Headquarters": "Southfield, Michigan",
-        "Filing": "reports",
-    },
-    "LECO": {
-        "Company": "Lincoln Electric",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Euclid, Ohio",
-        "Filing": "reports",
-    },
-    "LFUS": {
-        "Company": "Littelfuse",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Components",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "LII": {
-        "Company": "Lennox International",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Richardson, Texas",
-        "Filing": "reports",
-    },
-    "LITE": {
-        "Company": "Lumentum Holdings",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "LIVN": {
-        "Company": "LivaNova",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "LNTH": {
-        "Company": "Lantheus Holdings",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "LNW": {
-        "Company": "Light & Wonder",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Casinos & Gaming",
-        "Headquarters": "Las Vegas, Nevada",
-        "Filing": "reports",
-    },
-    "LOPE": {
-        "Company": "Grand Canyon Education",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Education Services",
-        "Headquarters": "Phoenix, Arizona",
-        "Filing": "reports",
-    },
-    "LPX": {
-        "Company": "Louisiana-Pacific",
-        "Sector": "Materials",
-        "Industry": "Forest Products",
-        "Headquarters": "Nashville, Tennessee",
-        "Filing": "reports",
-    },
-    "LSCC": {
-        "Company": "Lattice Semiconductor",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Hillsboro, Oregon",
-        "Filing": "reports",
-    },
-    "LSTR": {
-        "Company": "Landstar System",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-        "Headquarters": "Jacksonville, Florida",
-        "Filing": "reports",
-    },
-    "M": {
-        "Company": "Macy's",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "MAN": {
-        "Company": "ManpowerGroup",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-        "Headquarters": "Milwaukee, Wisconsin",
-        "Filing": "reports",
-    },
-    "MANH": {
-        "Company": "Manhattan Associates",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-        "Headquarters": "Atlanta, Georgia",
-        "Filing": "reports",
-    },
-    "MASI": {
-        "Company": "Masimo",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": "Irvine, California",
-        "Filing": "reports",
-    },
-    "MAT": {
-        "Company": "Mattel",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Leisure Products",
-        "Headquarters": "El Segundo, California",
-        "Filing": "reports",
-    },
-    "MEDP": {
-        "Company": "Medpace",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Cincinnati, Ohio",
-        "Filing": "reports",
-    },
-    "MIDD": {
-        "Company": "Middleby",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Elgin, Illinois",
-        "Filing": "reports",
-    },
-    "MKSI": {
-        "Company": "MKS Instruments",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Materials & Equipment",
-        "Headquarters": "Andover, Massachusetts",
-        "Filing": "reports",
-    },
-    "MMS": {
-        "Company": "Maximus Inc.",
-        "Sector": "Industrials",
-        "Industry": "Data Processing & Outsourced Services",
-        "Headquarters": "Tysons, Virginia",
-        "Filing": "reports",
-    },
-    "MORN": {
-        "Company": "Morningstar, Inc.",
-        "Sector": "Financials",
-        "Industry": "Financial Exchanges & Data",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "MSA": {
-        "Company": "MSA Safety",
-        "Sector": "Industrials",
-        "Industry": "Office Services & Supplies",
-        "Headquarters": "Cranberry Township, Pennsylvania",
-        "Filing": "reports",
-    },
-    "MSM": {
-        "Company": "MSC Industrial Direct",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-        "Headquarters": "Melville, New York Davidson, North Carolina",
-        "Filing": "reports",
-    },
-    "MTDR": {
-        "Company": "Matador Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "MTG": {
-        "Company": "MGIC Investment Corporation",
-        "Sector": "Financials",
-        "Industry": "Reinsurance",
-        "Headquarters": "Milwaukee, Wisconsin",
-        "Filing": "reports",
-    },
-    "MTN": {
-        "Company": "Vail Resorts",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Broomfield, Colorado",
-        "Filing": "reports",
-    },
-    "MTSI": {
-        "Company": "MACOM Technology Solutions",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Lowell, Massachusetts",
-        "Filing": "reports",
-    },
-    "MTZ": {
-        "Company": "MasTec",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Coral Gables, Florida",
-        "Filing": "reports",
-    },
-    "MUR": {
-        "Company": "Murphy Oil",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "MUSA": {
-        "Company": "Murphy USA",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "El Dorado, Arkansas",
-        "Filing": "reports",
-    },
-    "NBIX": {
-        "Company": "Neurocrine Biosciences",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "San Diego, California",
-        "Filing": "reports",
-    },
-    "NEOG": {
-        "Company": "Neogen",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": "Lansing, Michigan",
-        "Filing": "reports",
-    },
-    "NEU": {
-        "Company": "NewMarket Corporation",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Richmond, Virginia",
-        "Filing": "reports",
-    },
-    "NFG": {
-        "Company": "National Fuel Gas",
-        "Sector": "Utilities",
-        "Industry": "Gas Utilities",
-        "Headquarters": "Williamsville, New York",
-        "Filing": "reports",
-    },
-    "NJR": {
-        "Company": "New Jersey Resources",
-        "Sector": "Utilities",
-        "Industry": "Gas Utilities",
-        "Headquarters": "Wall Township, New Jersey",
-        "Filing": "reports",
-    },
-    "NLY": {
-        "Company": "Annaly Capital Management",
-        "Sector": "Financials",
-        "Industry": "Mortgage REITs",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "NNN": {
-        "Company": "NNN Reit",
-        "Sector": "Real Estate",
-        "Industry": "Retail REITs",
-        "Headquarters": "Orlando, Florida",
-        "Filing": "reports",
-    },
-    "NOV": {
-        "Company": "Nov",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Equipment & Services",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "NOVT": {
-        "Company": "Novanta",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "NSA": {
-        "Company": "National Storage Affiliates Trust",
-        "Sector": "Real Estate",
-        "Industry": "Self-Storage REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "NSP": {
-        "Company": "Insperity",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "NVST": {
-        "Company": "Envista Holdings",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "NVT": {
-        "Company": "nVent Electric plc",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "NWE": {
-        "Company": "NorthWestern Corporation",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Sioux Falls, South Dakota",
-        "Filing": "reports",
-    },
-    "NXST": {
-        "Company": "Nexstar Media Group",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-        "Headquarters": "Irving, Texas",
-        "Filing": "reports",
-    },
-    "NXT": {
-        "Company": "Nextracker",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Fremont, California",
-        "Filing": "reports",
-    },
-    "NYCB": {
-        "Company": "New York Community Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Hicksville, New York",
-        "Filing": "reports",
-    },
-    "NYT": {
-        "Company": "New York Times Company",
-        "Sector": "Communication Services",
-        "Industry": "Publishing",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "OC": {
-        "Company": "Owens Corning",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Toledo, Ohio",
-        "Filing": "reports",
-    },
-    "OGE": {
-        "Company": "OGE Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-        "Headquarters": "Oklahoma City, Oklahoma",
-        "Filing": "reports",
-    },
-    "OGS": {
-        "Company": "ONE Gas",
-        "Sector": "Utilities",
-        "Industry": "Gas Utilities",
-        "Headquarters": "Tulsa, Oklahoma",
-        "Filing": "reports",
-    },
-    "OHI": {
-        "Company": "Omega Healthcare Investors",
-        "Sector": "Real Estate",
-        "Industry": "Health Care REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "OLED": {
-        "Company": "Universal Display",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Ewing, New Jersey",
-        "Filing": "reports",
-    },
-    "OLLI": {
-        "Company": "Ollie's Bargain Outlet",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-        "Headquarters": "Harrisburg, Pennsylvania",
-        "Filing": "reports",
-    },
-    "OLN": {
-        "Company": "Olin",
-        "Sector": "Materials",
-        "Industry": "Diversified Chemicals",
-        "Headquarters": "Clayton, Missouri",
-        "Filing": "reports",
-    },
-    "ONB": {
-        "Company": "Old National Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Evansville, Indiana",
-        "Filing": "reports",
-    },
-    "ONTO": {
-        "Company": "Onto Innovation",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Materials & Equipment",
-        "Headquarters": "Wilmington, Massachusetts",
-        "Filing": "reports",
-    },
-    "OPCH": {
-        "Company": "Option Care Health",
-        "Sector": "Health Care",
-        "Industry": "Health Care Facilities",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "ORA": {
-        "Company": "Ormat Technologies",
-        "Sector": "Utilities",
-        "Industry": "Renewable Electricity",
-        "Headquarters": "Reno, Nevada",
-        "Filing": "reports",
-    },
-    "ORI": {
-        "Company": "Old Republic International",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "OSK": {
-        "Company": "Oshkosh",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-        "Headquarters": "Oshkosh, Wisconsin",
-        "Filing": "reports",
-    },
-    "OVV": {
-        "Company": "Ovintiv",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Denver, Colorado",
-        "Filing": "reports",
-    },
-    "OZK": {
-        "Company": "Bank OZK",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Little Rock, Arkansas",
-        "Filing": "reports",
-    },
-    "PAG": {
-        "Company": "Penske Automotive Group",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "Bloomfield Hills, Michigan",
-        "Filing": "reports",
-    },
-    "PB": {
-        "Company": "Prosperity Bancshares",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "PBF": {
-        "Company": "PBF Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Refining & Marketing",
-        "Headquarters": "Parsippany, New Jersey",
-        "Filing": "reports",
-    },
-    "PCH": {
-        "Company": "PotlatchDeltic",
-        "Sector": "Real Estate",
-        "Industry": "Timber REITs",
-        "Headquarters": "Spokane, Washington",
-        "Filing": "reports",
-    },
-    "PCTY": {
-        "Company": "Paylocity",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-        "Headquarters": "Schaumburg, Illinois",
-        "Filing": "reports",
-    },
-    "PEN": {
-        "Company": "Penumbra",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "PFGC": {
-        "Company": "Performance Food Group",
-        "Sector": "Consumer Staples",
-        "Industry": "Food Distributors",
-        "Headquarters": "Richmond, Virginia",
-        "Filing": "reports",
-    },
-    "PII": {
-        "Company": "Polaris",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Leisure Products",
-        "Headquarters": "Medina, Minnesota",
-        "Filing": "reports",
-    },
-    "PK": {
-        "Company": "Park Hotels & Resorts",
-        "Sector": "Real Estate",
-        "Industry": "Hotel & Resort REITs",
-        "Headquarters": "Tysons, Virginia",
-        "Filing": "reports",
-    },
-    "PLNT": {
-        "Company": "Planet Fitness",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Leisure Facilities",
-        "Headquarters": "Hampton, New Hampshire",
-        "Filing": "reports",
-    },
-    "PNFP": {
-        "Company": "Pinnacle Financial Partners",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Nashville, Tennessee",
-        "Filing": "reports",
-    },
-    "PNM": {
-        "Company": "PNM Resources",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Albuquerque, New Mexico",
-        "Filing": "reports",
-    },
-    "POR": {
-        "Company": "Portland General Electric",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-        "Headquarters": "Portland, Oregon",
-        "Filing": "reports",
-    },
-    "POST": {
-        "Company": "Post Holdings",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "St Louis, Missouri",
-        "Filing": "reports",
-    },
-    "POWI": {
-        "Company": "Power Integrations",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "PPC": {
-        "Company": "Pilgrim's Pride",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-        "Headquarters": "Greeley, Colorado",
-        "Filing": "reports",
-    },
-    "PR": {
-        "Company": "Permian Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Midland, Texas",
-        "Filing": "reports",
-    },
-    "PRGO": {
-        "Company": "Perrigo",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-        "Headquarters": "Grand Rapids, Michigan",
-        "Filing": "reports",
-    },
-    "PRI": {
-        "Company": "Primerica",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "Duluth, Georgia",
-        "Filing": "reports",
-    },
-    "PSN": {
-        "Company": "Parsons Corporation",
-        "Sector": "Industrials",
-        "Industry": "Aerospace & Defense",
-        "Headquarters": "Chantilly, Virginia",
-        "Filing": "reports",
-    },
-    "PSTG": {
-        "Company": "Pure Storage",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-        "Headquarters": "Santa Clara, California",
-        "Filing": "reports",
-    },
-    "PVH": {
-        "Company": "PVH",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "QLYS": {
-        "Company": "Qualys",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-        "Headquarters": "Foster City, California",
-        "Filing": "reports",
-    },
-    "R": {
-        "Company": "Ryder",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-        "Headquarters": "Miami, Florida",
-        "Filing": "reports",
-    },
-    "RBA": {
-        "Company": "RB Global",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Westchester, Illinois",
-        "Filing": "reports",
-    },
-    "RBC": {
-        "Company": "RBC Bearings",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Oxford, Connecticut",
-        "Filing": "reports",
-    },
-    "RCM": {
-        "Company": "R1 RCM",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Murray, Utah",
-        "Filing": "reports",
-    },
-    "REXR": {
-        "Company": "Rexford Industrial Realty",
-        "Sector": "Real Estate",
-        "Industry": "Industrial REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "RGA": {
-        "Company": "Reinsurance Group of America",
-        "Sector": "Financials",
-        "Industry": "Reinsurance",
-        "Headquarters": "Chesterfield, Missouri",
-        "Filing": "reports",
-    },
-    "RGEN": {
-        "Company": "Repligen",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Waltham, Massachusetts",
-        "Filing": "reports",
-    },
-    "RGLD": {
-        "Company": "Royal Gold",
-        "Sector": "Materials",
-        "Industry": "Gold",
-        "Headquarters": "Denver, Colorado",
-        "Filing": "reports",
-    },
-    "RH": {
-        "Company": "RH",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homefurnishing Retail",
-        "Headquarters": "Corte Madera, California",
-        "Filing": "reports",
-    },
-    "RLI": {
-        "Company": "RLI",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Peoria, Illinois",
-        "Filing": "reports",
-    },
-    "RMBS": {
-        "Company": "Rambus",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "San Jose, California",
-        "Filing": "reports",
-    },
-    "RNR": {
-        "Company": "RenaissanceRe",
-        "Sector": "Financials",
-        "Industry": "Reinsurance",
-        "Headquarters": "Bermuda",
-        "Filing": "reports",
-    },
-    "ROIV": {
-        "Company": "Roivant Sciences",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "London, United Kingdom",
-        "Filing": "reports",
-    },
-    "RPM": {
-        "Company": "RPM International",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Medina, Ohio",
-        "Filing": "reports",
-    },
-    "RRC": {
-        "Company": "Range Resources",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Fort Worth, Texas",
-        "Filing": "reports",
-    },
-    "RRX": {
-        "Company": "Regal Rexnord",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Beloit, Wisconsin",
-        "Filing": "reports",
-    },
-    "RS": {
-        "Company": "Reliance Steel & Aluminum Co.",
-        "Sector": "Materials",
-        "Industry": "Steel",
-        "Headquarters": "Scottsdale, Arizona",
-        "Filing": "reports",
-    },
-    "RYAN": {
-        "Company": "Ryan Specialty",
-        "Sector": "Financials",
-        "Industry": "Insurance Brokers",
-        "Headquarters": "Chicago, Illinois",
-        "Filing": "reports",
-    },
-    "RYN": {
-        "Company": "Rayonier",
-        "Sector": "Real Estate",
-        "Industry": "Timber REITs",
-        "Headquarters": "Wildlight, Florida",
-        "Filing": "reports",
-    },
-    "SAIA": {
-        "Company": "Saia",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-        "Headquarters": "Johns Creek, Georgia",
-        "Filing": "reports",
-    },
-    "SAIC": {
-        "Company": "Science Applications Intl Corp",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-        "Headquarters": "Reston, Virginia",
-        "Filing": "reports",
-    },
-    "SAM": {
-        "Company": "Boston Beer Company",
-        "Sector": "Consumer Staples",
-        "Industry": "Brewers",
-        "Headquarters": "Boston, Massachusetts",
-        "Filing": "reports",
-    },
-    "SBRA": {
-        "Company": "Sabra Health Care REIT",
-        "Sector": "Real Estate",
-        "Industry": "Health Care REITs",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "SCI": {
-        "Company": "Service Corp Intl",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Specialized Consumer Services",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "SEIC": {
-        "Company": "SEI",
-        "Sector": "Financials",
-        "Industry": "Asset Management & Custody Banks",
-        "Headquarters": "Oaks, Pennsylvania",
-        "Filing": "reports",
-    },
-    "SF": {
-        "Company": "Stifel",
-        "Sector": "Financials",
-        "Industry": "Investment Banking & Brokerage",
-        "Headquarters": "St. Louis, Missouri",
-        "Filing": "reports",
-    },
-    "SFM": {
-        "Company": "Sprouts Farmers Market",
-        "Sector": "Consumer Staples",
-        "Industry": "Food Retail",
-        "Headquarters": "Phoenix, Arizona",
-        "Filing": "reports",
-    },
-    "SHC": {
-        "Company": "Sotera Health",
-        "Sector": "Health Care",
-        "Industry": "Health Care Services",
-        "Headquarters": "Broadview Heights, Ohio",
-        "Filing": "reports",
-    },
-    "SIGI": {
-        "Company": "Selective Insurance Group",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "SKX": {
-        "Company": "Skechers",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Footwear",
-        "Headquarters": "Manhattan Beach, California",
-        "Filing": "reports",
-    },
-    "SLAB": {
-        "Company": "Silicon Labs",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "Austin, Texas",
-        "Filing": "reports",
-    },
-    "SLGN": {
-        "Company": "Silgan Holdings",
-        "Sector": "Materials",
-        "Industry": "Metal, Glass & Plastic Containers",
-        "Headquarters": "Stamford, Connecticut",
-        "Filing": "reports",
-    },
-    "SLM": {
-        "Company": "SLM Corp",
-        "Sector": "Financials",
-        "Industry": "Consumer Finance",
-        "Headquarters": "Newark, Delaware",
-        "Filing": "reports",
-    },
-    "SMG": {
-        "Company": "Scotts Miracle-Gro Company",
-        "Sector": "Materials",
-        "Industry": "Fertilizers & Agricultural Chemicals",
-        "Headquarters": "Marysville, Ohio",
-        "Filing": "reports",
-    },
-    "SNV": {
-        "Company": "Synovus",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Columbus, Georgia",
-        "Filing": "reports",
-    },
-    "SNX": {
-        "Company": "TD Synnex",
-        "Sector": "Information Technology",
-        "Industry": "Technology Distributors",
-        "Headquarters": "Fremont, California Clearwater, Florida",
-        "Filing": "reports",
-    },
-    "SON": {
-        "Company": "Sonoco",
-        "Sector": "Materials",
-        "Industry": "Paper & Plastic Packaging Products & Materials",
-        "Headquarters": "Hartsville, South Carolina",
-        "Filing": "reports",
-    },
-    "SR": {
-        "Company": "Spire",
-        "Sector": "Utilities",
-        "Industry": "Gas Utilities",
-        "Headquarters": "St. Louis, Missouri",
-        "Filing": "reports",
-    },
-    "SRPT": {
-        "Company": "Sarepta Therapeutics",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": "Cambridge, Massachusetts",
-        "Filing": "reports",
-    },
-    "SSB": {
-        "Company": "South State Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Winter Haven, Florida",
-        "Filing": "reports",
-    },
-    "SSD": {
-        "Company": "Simpson Manufacturing",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Pleasanton, California",
-        "Filing": "reports",
-    },
-    "ST": {
-        "Company": "Sensata Technologies",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Attleboro, Massachusetts",
-        "Filing": "reports",
-    },
-    "STAG": {
-        "Company": "STAG Industrial",
-        "Sector": "Real Estate",
-        "Industry": "Industrial REITs",
-        "Headquarters": "Boston, Massachusetts",
-        "Filing": "reports",
-    },
-    "STWD": {
-        "Company": "Starwood Property Trust",
-        "Sector": "Financials",
-        "Industry": "Mortgage REITs",
-        "Headquarters": "Greenwich, Connecticut",
-        "Filing": "reports",
-    },
-    "SWX": {
-        "Company": "Southwest Gas Corp",
-        "Sector": "Utilities",
-        "Industry": "Gas Utilities",
-        "Headquarters": "Las Vegas, Nevada",
-        "Filing": "reports",
-    },
-    "SYNA": {
-        "Company": "Synaptics",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-        "Headquarters": "San Jose, California",
-        "Filing": "reports",
-    },
-    "TCBI": {
-        "Company": "Texas Capital Bancshares",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Dallas, Texas",
-        "Filing": "reports",
-    },
-    "TDC": {
-        "Company": "Teradata",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-        "Headquarters": "San Diego, California",
-        "Filing": "reports",
-    },
-    "TEX": {
-        "Company": "Terex",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-        "Headquarters": "Norwalk, Connecticut",
-        "Filing": "reports",
-    },
-    "THC": {
-        "Company": "Tenet Health",
-        "Sector": "Health Care",
-        "Industry": "Health Care Facilities",
-        "Headquarters": "Dallas, Texas",
-        "Filing": "reports",
-    },
-    "THG": {
-        "Company": "Hanover Insurance",
-        "Sector": "Financials",
-        "Industry": "Property & Casualty Insurance",
-        "Headquarters": "Worcester, Massachusetts",
-        "Filing": "reports",
-    },
-    "THO": {
-        "Company": "Thor Industries",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Leisure Products",
-        "Headquarters": "Elkhart, Indiana",
-        "Filing": "reports",
-    },
-    "TKO": {
-        "Company": "TKO Group Holdings",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "TKR": {
-        "Company": "Timken",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "North Canton, Ohio",
-        "Filing": "reports",
-    },
-    "TMHC": {
-        "Company": "Taylor Morrison",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": "Scottsdale, Arizona",
-        "Filing": "reports",
-    },
-    "TNL": {
-        "Company": "Travel + Leisure Co.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Orlando, Florida",
-        "Filing": "reports",
-    },
-    "TOL": {
-        "Company": "Toll Brothers",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homebuilding",
-        "Headquarters": "Fort Washington, Pennsylvania",
-        "Filing": "reports",
-    },
-    "TPL": {
-        "Company": "Texas Pacific Land",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-        "Headquarters": "Dallas, Texas",
-        "Filing": "reports",
-    },
-    "TPX": {
-        "Company": "Tempur Sealy",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Home Furnishings",
-        "Headquarters": "Lexington, Kentucky",
-        "Filing": "reports",
-    },
-    "TREX": {
-        "Company": "Trex",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Winchester, Virginia",
-        "Filing": "reports",
-    },
-    "TTC": {
-        "Company": "Toro",
-        "Sector": "Industrials",
-        "Industry": "Agricultural & Farm Machinery",
-        "Headquarters": "Bloomington, Minnesota",
-        "Filing": "reports",
-    },
-    "TTEK": {
-        "Company": "Tetra Tech",
-        "Sector": "Industrials",
-        "Industry": "Construction & Engineering",
-        "Headquarters": "Pasadena, California",
-        "Filing": "reports",
-    },
-    "TXRH": {
-        "Company": "Texas Roadhouse",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Louisville, Kentucky",
-        "Filing": "reports",
-    },
-    "UA": {
-        "Company": "Under Armour (Class C)",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "Baltimore, Maryland",
-        "Filing": "reports",
-    },
-    "UAA": {
-        "Company": "Under Armour (Class A)",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-        "Headquarters": "Baltimore, Maryland",
-        "Filing": "reports",
-    },
-    "UBSI": {
-        "Company": "United Bankshares",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Charleston, West Virginia",
-        "Filing": "reports",
-    },
-    "UFPI": {
-        "Company": "UFP Industries",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Grand Rapids, Michigan",
-        "Filing": "reports",
-    },
-    "UGI": {
-        "Company": "UGI Corp",
-        "Sector": "Utilities",
-        "Industry": "Gas Utilities",
-        "Headquarters": "King of Prussia, Pennsylvania",
-        "Filing": "reports",
-    },
-    "UMBF": {
-        "Company": "UMB Financial Corp.",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Kansas City, Missouri",
-        "Filing": "reports",
-    },
-    "UNM": {
-        "Company": "Unum",
-        "Sector": "Financials",
-        "Industry": "Life & Health Insurance",
-        "Headquarters": "Chattanooga, Tennessee",
-        "Filing": "reports",
-    },
-    "USFD": {
-        "Company": "US Foods",
-        "Sector": "Consumer Staples",
-        "Industry": "Food Distributors",
-        "Headquarters": "Rosemont, Illinois",
-        "Filing": "reports",
-    },
-    "UTHR": {
-        "Company": "United Therapeutics",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "VAC": {
-        "Company": "Marriott Vacations Worldwide",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Orlando, Florida",
-        "Filing": "reports",
-    },
-    "VAL": {
-        "Company": "Valaris",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Drilling",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "VC": {
-        "Company": "Visteon",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Parts & Equipment",
-        "Headquarters": "Van Buren Township, Michigan",
-        "Filing": "reports",
-    },
-    "VLY": {
-        "Company": "Valley Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Morristown, New Jersey",
-        "Filing": "reports",
-    },
-    "VMI": {
-        "Company": "Valmont",
-        "Sector": "Industrials",
-        "Industry": "Industrial Machinery & Supplies & Components",
-        "Headquarters": "Omaha, Nebraska",
-        "Filing": "reports",
-    },
-    "VNO": {
-        "Company": "Vornado Realty Trust",
-        "Sector": "Real Estate",
-        "Industry": "Office REITs",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "VNOM": {
-        "Company": "Viper Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Storage & Transportation",
-        "Headquarters": "Midland, Texas",
-        "Filing": "reports",
-    },
-    "VNT": {
-        "Company": "Vontier",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-        "Headquarters": "Raleigh, North Carolina",
-        "Filing": "reports",
-    },
-    "VOYA": {
-        "Company": "Voya Financial",
-        "Sector": "Financials",
-        "Industry": "Multi-Sector Holdings",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "VSH": {
-        "Company": "Vishay",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Components",
-        "Headquarters": "Malvern, Pennsylvania",
-        "Filing": "reports",
-    },
-    "VVV": {
-        "Company": "Valvoline",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-        "Headquarters": "Lexington, Kentucky",
-        "Filing": "reports",
-    },
-    "WAL": {
-        "Company": "Western Alliance Bancorporation",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Phoenix, Arizona",
-        "Filing": "reports",
-    },
-    "WBS": {
-        "Company": "Webster Bank",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Stamford, Connecticut",
-        "Filing": "reports",
-    },
-    "WCC": {
-        "Company": "WESCO International",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Filing": "reports",
-    },
-    "WEN": {
-        "Company": "Wendy's",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Dublin, Ohio",
-        "Filing": "reports",
-    },
-    "WEX": {
-        "Company": "WEX Inc.",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "South Portland, Maine",
-        "Filing": "reports",
-    },
-    "WFRD": {
-        "Company": "Weatherford International",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Equipment & Services",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "WH": {
-        "Company": "Wyndham Hotels & Resorts",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-        "Headquarters": "Parsippany, New Jersey",
-        "Filing": "reports",
-    },
-    "WHR": {
-        "Company": "Whirlpool",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Household Appliances",
-        "Headquarters": "Benton Harbor, Michigan",
-        "Filing": "reports",
-    },
-    "WING": {
-        "Company": "Wingstop",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-        "Headquarters": "Addison, Texas",
-        "Filing": "reports",
-    },
-    "WLK": {
-        "Company": "Westlake",
-        "Sector": "Materials",
-        "Industry": "Specialty Chemicals",
-        "Headquarters": "Houston, Texas",
-        "Filing": "reports",
-    },
-    "WMG": {
-        "Company": "Warner Music Group",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "WMS": {
-        "Company": "Advanced Drainage Systems",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": "Hilliard, Ohio",
-        "Filing": "reports",
-    },
-    "WPC": {
-        "Company": "W. P. Carey",
-        "Sector": "Real Estate",
-        "Industry": "Diversified REITs",
-        "Headquarters": "New York City, New York",
-        "Filing": "reports",
-    },
-    "WSM": {
-        "Company": "Williams-Sonoma",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Homefurnishing Retail",
-        "Headquarters": "San Francisco, California",
-        "Filing": "reports",
-    },
-    "WSO": {
-        "Company": "Watsco",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-        "Headquarters": "Miami, Florida",
-        "Filing": "reports",
-    },
-    "WTFC": {
-        "Company": "Wintrust",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Rosemont, Illinois",
-        "Filing": "reports",
-    },
-    "WTRG": {
-        "Company": "Essential Utilities",
-        "Sector": "Utilities",
-        "Industry": "Water Utilities",
-        "Headquarters": "Bryn Mawr, Pennsylvania",
-        "Filing": "reports",
-    },
-    "WTS": {
-        "Company": "Watts Water Technologies",
-        "Sector": "Industrials",
-        "Industry": "Building Products",
-        "Headquarters": None,
-        "Filing": "reports",
-    },
-    "WU": {
-        "Company": "Western Union",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-        "Headquarters": "Denver, Colorado",
-        "Filing": "reports",
-    },
-    "WWD": {
-        "Company": "Woodward",
-        "Sector": "Industrials",
-        "Industry": "Electrical Components & Equipment",
-        "Headquarters": "Fort Collins, Colorado",
-        "Filing": "reports",
-    },
-    "X": {
-        "Company": "U.S. Steel",
-        "Sector": "Materials",
-        "Industry": "Steel",
-        "Headquarters": "Pittsburgh, Pennsylvania",
-        "Filing": "reports",
-    },
-    "XPO": {
-        "Company": "XPO, Inc.",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-        "Headquarters": "Greenwich, Connecticut",
-        "Filing": "reports",
-    },
-    "XRAY": {
-        "Company": "Dentsply Sirona",
-        "Sector": "Health Care",
-        "Industry": "Health Care Supplies",
-        "Headquarters": "Charlotte, North Carolina",
-        "Filing": "reports",
-    },
-    "YETI": {
-        "Company": "Yeti",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Leisure Products",
-        "Headquarters": "Austin, Texas",
-        "Filing": "reports",
-    },
-    "ZI": {
-        "Company": "ZoomInfo",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-        "Headquarters": "Vancouver, Washington",
-        "Filing": "reports",
-    },
-    "ZION": {
-        "Company": "Zions Bancorporation",
-        "Sector": "Financials",
-        "Industry": "Regional Banks",
-        "Headquarters": "Salt Lake City, Utah",
-        "Filing": "reports",
-    },
-}
+# STANDARD LIBS
+from functools import lru_cache
+import json
+from pathlib import Path
+from typing import Any, Dict, List
 
 
-# 101
-nasdaq_100_dict: Dict = {
-    "ADBE": {
-        "Company": "Adobe Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "AMD": {
-        "Company": "Advanced Micro Devices",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "ABNB": {
-        "Company": "Airbnb",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-    },
-    "GOOGL": {
-        "Company": "Alphabet Inc. (Class A)",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-    },
-    "GOOG": {
-        "Company": "Alphabet Inc. (Class C)",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-    },
-    "AMZN": {
-        "Company": "Amazon",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-    },
-    "AEP": {
-        "Company": "American Electric Power",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-    },
-    "AMGN": {"Company": "Amgen", "Sector": "Health Care", "Industry": "Biotechnology"},
-    "ADI": {
-        "Company": "Analog Devices",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "ANSS": {
-        "Company": "Ansys",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "AAPL": {
-        "Company": "Apple Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-    },
-    "AMAT": {
-        "Company": "Applied Materials",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Equipment",
-    },
-    "ARM": {
-        "Company": "Arm Holdings",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "ASML": {
-        "Company": "ASML Holding",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Equipment",
-    },
-    "AZN": {
-        "Company": "AstraZeneca",
-        "Sector": "Health Care",
-        "Industry": "Pharmaceuticals",
-    },
-    "TEAM": {
-        "Company": "Atlassian",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "ADSK": {
-        "Company": "Autodesk",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "ADP": {
-        "Company": "Automatic Data Processing",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-    },
-    "BKR": {
-        "Company": "Baker Hughes",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Equipment & Services",
-    },
-    "BIIB": {"Company": "Biogen", "Sector": "Health Care", "Industry": "Biotechnology"},
-    "BKNG": {
-        "Company": "Booking Holdings",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-    },
-    "AVGO": {
-        "Company": "Broadcom Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "CDNS": {
-        "Company": "Cadence Design Systems",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "CDW": {
-        "Company": "CDW Corporation",
-        "Sector": "Information Technology",
-        "Industry": "Technology Distributors",
-    },
-    "CHTR": {
-        "Company": "Charter Communications",
-        "Sector": "Communication Services",
-        "Industry": "Cable & Satellite",
-    },
-    "CTAS": {
-        "Company": "Cintas",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-    },
-    "CSCO": {
-        "Company": "Cisco",
-        "Sector": "Information Technology",
-        "Industry": "Communications Equipment",
-    },
-    "CCEP": {
-        "Company": "Coca-Cola Europacific Partners",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-    },
-    "CTSH": {
-        "Company": "Cognizant",
-        "Sector": "Information Technology",
-        "Industry": "IT Consulting & Other Services",
-    },
-    "CMCSA": {
-        "Company": "Comcast",
-        "Sector": "Communication Services",
-        "Industry": "Cable & Satellite",
-    },
-    "CEG": {
-        "Company": "Constellation Energy",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-    },
-    "CPRT": {
-        "Company": "Copart",
-        "Sector": "Industrials",
-        "Industry": "Diversified Support Services",
-    },
-    "CSGP": {
-        "Company": "CoStar Group",
-        "Sector": "Real Estate",
-        "Industry": "Real Estate Services",
-    },
-    "COST": {
-        "Company": "Costco",
-        "Sector": "Consumer Staples",
-        "Industry": "Consumer Staples Merchandise Retail",
-    },
-    "CRWD": {
-        "Company": "CrowdStrike",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-    },
-    "CSX": {
-        "Company": "CSX Corporation",
-        "Sector": "Industrials",
-        "Industry": "Rail Transportation",
-    },
-    "DDOG": {
-        "Company": "Datadog",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "DXCM": {
-        "Company": "DexCom",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-    },
-    "FANG": {
-        "Company": "Diamondback Energy",
-        "Sector": "Energy",
-        "Industry": "Oil & Gas Exploration & Production",
-    },
-    "DLTR": {
-        "Company": "Dollar Tree",
-        "Sector": "Consumer Staples",
-        "Industry": "Consumer Staples Merchandise Retail",
-    },
-    "DASH": {
-        "Company": "DoorDash",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Specialized Consumer Services",
-    },
-    "EA": {
-        "Company": "Electronic Arts",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Home Entertainment",
-    },
-    "EXC": {
-        "Company": "Exelon",
-        "Sector": "Utilities",
-        "Industry": "Electric Utilities",
-    },
-    "FAST": {
-        "Company": "Fastenal",
-        "Sector": "Industrials",
-        "Industry": "Trading Companies & Distributors",
-    },
-    "FTNT": {
-        "Company": "Fortinet",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-    },
-    "GEHC": {
-        "Company": "GE HealthCare",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-    },
-    "GILD": {
-        "Company": "Gilead Sciences",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-    },
-    "GFS": {
-        "Company": "GlobalFoundries",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "HON": {
-        "Company": "Honeywell",
-        "Sector": "Industrials",
-        "Industry": "Industrial Conglomerates",
-    },
-    "IDXX": {
-        "Company": "Idexx Laboratories",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-    },
-    "ILMN": {
-        "Company": "Illumina, Inc.",
-        "Sector": "Health Care",
-        "Industry": "Life Sciences Tools & Services",
-    },
-    "INTC": {
-        "Company": "Intel",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "INTU": {
-        "Company": "Intuit",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "ISRG": {
-        "Company": "Intuitive Surgical",
-        "Sector": "Health Care",
-        "Industry": "Health Care Equipment",
-    },
-    "KDP": {
-        "Company": "Keurig Dr Pepper",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-    },
-    "KLAC": {
-        "Company": "KLA Corporation",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Equipment",
-    },
-    "KHC": {
-        "Company": "Kraft Heinz",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-    },
-    "LRCX": {
-        "Company": "Lam Research",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductor Equipment",
-    },
-    "LIN": {
-        "Company": "Linde plc",
-        "Sector": "Materials",
-        "Industry": "Industrial Gases",
-    },
-    "LULU": {
-        "Company": "Lululemon Athletica",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel, Accessories & Luxury Goods",
-    },
-    "MAR": {
-        "Company": "Marriott International",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Hotels, Resorts & Cruise Lines",
-    },
-    "MRVL": {
-        "Company": "Marvell Technology",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "MELI": {
-        "Company": "MercadoLibre",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-    },
-    "META": {
-        "Company": "Meta Platforms",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Media & Services",
-    },
-    "MCHP": {
-        "Company": "Microchip Technology",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "MU": {
-        "Company": "Micron Technology",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "MSFT": {
-        "Company": "Microsoft",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-    },
-    "MRNA": {
-        "Company": "Moderna",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-    },
-    "MDLZ": {
-        "Company": "Mondelez International",
-        "Sector": "Consumer Staples",
-        "Industry": "Packaged Foods & Meats",
-    },
-    "MDB": {
-        "Company": "MongoDB Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-    },
-    "MNST": {
-        "Company": "Monster Beverage",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-    },
-    "NFLX": {
-        "Company": "Netflix",
-        "Sector": "Communication Services",
-        "Industry": "Movies & Entertainment",
-    },
-    "NVDA": {
-        "Company": "Nvidia",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "NXPI": {
-        "Company": "NXP Semiconductors",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "ORLY": {
-        "Company": "O'Reilly Automotive",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automotive Retail",
-    },
-    "ODFL": {
-        "Company": "Old Dominion Freight Line",
-        "Sector": "Industrials",
-        "Industry": "Cargo Ground Transportation",
-    },
-    "ON": {
-        "Company": "Onsemi",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "PCAR": {
-        "Company": "Paccar",
-        "Sector": "Industrials",
-        "Industry": "Construction Machinery & Heavy Transportation Equipment",
-    },
-    "PANW": {
-        "Company": "Palo Alto Networks",
-        "Sector": "Information Technology",
-        "Industry": "Systems Software",
-    },
-    "PAYX": {
-        "Company": "Paychex",
-        "Sector": "Industrials",
-        "Industry": "Human Resource & Employment Services",
-    },
-    "PYPL": {
-        "Company": "PayPal",
-        "Sector": "Financials",
-        "Industry": "Transaction & Payment Processing Services",
-    },
-    "PDD": {
-        "Company": "PDD Holdings",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Broadline Retail",
-    },
-    "PEP": {
-        "Company": "PepsiCo",
-        "Sector": "Consumer Staples",
-        "Industry": "Soft Drinks & Non-alcoholic Beverages",
-    },
-    "QCOM": {
-        "Company": "Qualcomm",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "REGN": {
-        "Company": "Regeneron Pharmaceuticals",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-    },
-    "ROP": {
-        "Company": "Roper Technologies",
-        "Sector": "Information Technology",
-        "Industry": "Electronic Equipment & Instruments",
-    },
-    "ROST": {
-        "Company": "Ross Stores",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Apparel Retail",
-    },
-    "SBUX": {
-        "Company": "Starbucks",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Restaurants",
-    },
-    "SMCI": {
-        "Company": "Supermicro",
-        "Sector": "Information Technology",
-        "Industry": "Technology Hardware, Storage & Peripherals",
-    },
-    "SNPS": {
-        "Company": "Synopsys",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "TTWO": {
-        "Company": "Take-Two Interactive",
-        "Sector": "Communication Services",
-        "Industry": "Interactive Home Entertainment",
-    },
-    "TMUS": {
-        "Company": "T-Mobile US",
-        "Sector": "Communication Services",
-        "Industry": "Wireless Telecommunication Services",
-    },
-    "TSLA": {
-        "Company": "Tesla, Inc.",
-        "Sector": "Consumer Discretionary",
-        "Industry": "Automobile Manufacturers",
-    },
-    "TXN": {
-        "Company": "Texas Instruments",
-        "Sector": "Information Technology",
-        "Industry": "Semiconductors",
-    },
-    "TTD": {
-        "Company": "Trade Desk (The)",
-        "Sector": "Communication Services",
-        "Industry": "Advertising",
-    },
-    "VRSK": {
-        "Company": "Verisk Analytics",
-        "Sector": "Industrials",
-        "Industry": "Research & Consulting Services",
-    },
-    "VRTX": {
-        "Company": "Vertex Pharmaceuticals",
-        "Sector": "Health Care",
-        "Industry": "Biotechnology",
-    },
-    "WBD": {
-        "Company": "Warner Bros. Discovery",
-        "Sector": "Communication Services",
-        "Industry": "Broadcasting",
-    },
-    "WDAY": {
-        "Company": "Workday, Inc.",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-    "XEL": {
-        "Company": "Xcel Energy",
-        "Sector": "Utilities",
-        "Industry": "Multi-Utilities",
-    },
-    "ZS": {
-        "Company": "Zscaler",
-        "Sector": "Information Technology",
-        "Industry": "Application Software",
-    },
-}
+STOCK_LIST_PATH: Path = Path(__file__).with_name('generated_stock_list.json')
 
 
-# 503
-sp_500_stocks: List[str] = [
-    "MMM",
-    "AOS",
-    "ABT",
-    "ABBV",
-    "ACN",
-    "ADBE",
-    "AMD",
-    "AES",
-    "AFL",
-    "A",
-    "APD",
-    "ABNB",
-    "AKAM",
-    "ALB",
-    "ARE",
-    "ALGN",
-    "ALLE",
-    "LNT",
-    "ALL",
-    "GOOGL",
-    "GOOG",
-    "MO",
-    "AMZN",
-    "AMCR",
-    "AMTM",
-    "AEE",
-    "AEP",
-    "AXP",
-    "AIG",
-    "AMT",
-    "AWK",
-    "AMP",
-    "AME",
-    "AMGN",
-    "APH",
-    "ADI",
-    "ANSS",
-    "AON",
-    "APA",
-    "AAPL",
-    "AMAT",
-    "APTV",
-    "ACGL",
-    "ADM",
-    "ANET",
-    "AJG",
-    "AIZ",
-    "T",
-    "ATO",
-    "ADSK",
-    "ADP",
-    "AZO",
-    "AVB",
-    "AVY",
-    "AXON",
-    "BKR",
-    "BALL",
-    "BAC",
-    "BAX",
-    "BDX",
-    "BRK.B",
-    "BBY",
-    "TECH",
-    "BIIB",
-    "BLK",
-    "BX",
-    "BK",
-    "BA",
-    "BKNG",
-    "BWA",
-    "BSX",
-    "BMY",
-    "AVGO",
-    "BR",
-    "BRO",
-    "BF.B",
-    "BLDR",
-    "BG",
-    "BXP",
-    "CHRW",
-    "CDNS",
-    "CZR",
-    "CPT",
-    "CPB",
-    "COF",
-    "CAH",
-    "KMX",
-    "CCL",
-    "CARR",
-    "CTLT",
-    "CAT",
-    "CBOE",
-    "CBRE",
-    "CDW",
-    "CE",
-    "COR",
-    "CNC",
-    "CNP",
-    "CF",
-    "CRL",
-    "SCHW",
-    "CHTR",
-    "CVX",
-    "CMG",
-    "CB",
-    "CHD",
-    "CI",
-    "CINF",
-    "CTAS",
-    "CSCO",
-    "C",
-    "CFG",
-    "CLX",
-    "CME",
-    "CMS",
-    "KO",
-    "CTSH",
-    "CL",
-    "CMCSA",
-    "CAG",
-    "COP",
-    "ED",
-    "STZ",
-    "CEG",
-    "COO",
-    "CPRT",
-    "GLW",
-    "CPAY",
-    "CTVA",
-    "CSGP",
-    "COST",
-    "CTRA",
-    "CRWD",
-    "CCI",
-    "CSX",
-    "CMI",
-    "CVS",
-    "DHR",
-    "DRI",
-    "DVA",
-    "DAY",
-    "DECK",
-    "DE",
-    "DELL",
-    "DAL",
-    "DVN",
-    "DXCM",
-    "FANG",
-    "DLR",
-    "DFS",
-    "DG",
-    "DLTR",
-    "D",
-    "DPZ",
-    "DOV",
-    "DOW",
-    "DHI",
-    "DTE",
-    "DUK",
-    "DD",
-    "EMN",
-    "ETN",
-    "EBAY",
-    "ECL",
-    "EIX",
-    "EW",
-    "EA",
-    "ELV",
-    "EMR",
-    "ENPH",
-    "ETR",
-    "EOG",
-    "EPAM",
-    "EQT",
-    "EFX",
-    "EQIX",
-    "EQR",
-    "ERIE",
-    "ESS",
-    "EL",
-    "EG",
-    "EVRG",
-    "ES",
-    "EXC",
-    "EXPE",
-    "EXPD",
-    "EXR",
-    "XOM",
-    "FFIV",
-    "FDS",
-    "FICO",
-    "FAST",
-    "FRT",
-    "FDX",
-    "FIS",
-    "FITB",
-    "FSLR",
-    "FE",
-    "FI",
-    "FMC",
-    "F",
-    "FTNT",
-    "FTV",
-    "FOXA",
-    "FOX",
-    "BEN",
-    "FCX",
-    "GRMN",
-    "IT",
-    "GE",
-    "GEHC",
-    "GEV",
-    "GEN",
-    "GNRC",
-    "GD",
-    "GIS",
-    "GM",
-    "GPC",
-    "GILD",
-    "GPN",
-    "GL",
-    "GDDY",
-    "GS",
-    "HAL",
-    "HIG",
-    "HAS",
-    "HCA",
-    "DOC",
-    "HSIC",
-    "HSY",
-    "HES",
-    "HPE",
-    "HLT",
-    "HOLX",
-    "HD",
-    "HON",
-    "HRL",
-    "HST",
-    "HWM",
-    "HPQ",
-    "HUBB",
-    "HUM",
-    "HBAN",
-    "HII",
-    "IBM",
-    "IEX",
-    "IDXX",
-    "ITW",
-    "INCY",
-    "IR",
-    "PODD",
-    "INTC",
-    "ICE",
-    "IFF",
-    "IP",
-    "IPG",
-    "INTU",
-    "ISRG",
-    "IVZ",
-    "INVH",
-    "IQV",
-    "IRM",
-    "JBHT",
-    "JBL",
-    "JKHY",
-    "J",
-    "JNJ",
-    "JCI",
-    "JPM",
-    "JNPR",
-    "K",
-    "KVUE",
-    "KDP",
-    "KEY",
-    "KEYS",
-    "KMB",
-    "KIM",
-    "KMI",
-    "KKR",
-    "KLAC",
-    "KHC",
-    "KR",
-    "LHX",
-    "LH",
-    "LRCX",
-    "LW",
-    "LVS",
-    "LDOS",
-    "LEN",
-    "LLY",
-    "LIN",
-    "LYV",
-    "LKQ",
-    "LMT",
-    "L",
-    "LOW",
-    "LULU",
-    "LYB",
-    "MTB",
-    "MRO",
-    "MPC",
-    "MKTX",
-    "MAR",
-    "MMC",
-    "MLM",
-    "MAS",
-    "MA",
-    "MTCH",
-    "MKC",
-    "MCD",
-    "MCK",
-    "MDT",
-    "MRK",
-    "META",
-    "MET",
-    "MTD",
-    "MGM",
-    "MCHP",
-    "MU",
-    "MSFT",
-    "MAA",
-    "MRNA",
-    "MHK",
-    "MOH",
-    "TAP",
-    "MDLZ",
-    "MPWR",
-    "MNST",
-    "MCO",
-    "MS",
-    "MOS",
-    "MSI",
-    "MSCI",
-    "NDAQ",
-    "NTAP",
-    "NFLX",
-    "NEM",
-    "NWSA",
-    "NWS",
-    "NEE",
-    "NKE",
-    "NI",
-    "NDSN",
-    "NSC",
-    "NTRS",
-    "NOC",
-    "NCLH",
-    "NRG",
-    "NUE",
-    "NVDA",
-    "NVR",
-    "NXPI",
-    "ORLY",
-    "OXY",
-    "ODFL",
-    "OMC",
-    "ON",
-    "OKE",
-    "ORCL",
-    "OTIS",
-    "PCAR",
-    "PKG",
-    "PLTR",
-    "PANW",
-    "PARA",
-    "PH",
-    "PAYX",
-    "PAYC",
-    "PYPL",
-    "PNR",
-    "PEP",
-    "PFE",
-    "PCG",
-    "PM",
-    "PSX",
-    "PNW",
-    "PNC",
-    "POOL",
-    "PPG",
-    "PPL",
-    "PFG",
-    "PG",
-    "PGR",
-    "PLD",
-    "PRU",
-    "PEG",
-    "PTC",
-    "PSA",
-    "PHM",
-    "QRVO",
-    "PWR",
-    "QCOM",
-    "DGX",
-    "RL",
-    "RJF",
-    "RTX",
-    "O",
-    "REG",
-    "REGN",
-    "RF",
-    "RSG",
-    "RMD",
-    "RVTY",
-    "ROK",
-    "ROL",
-    "ROP",
-    "ROST",
-    "RCL",
-    "SPGI",
-    "CRM",
-    "SBAC",
-    "SLB",
-    "STX",
-    "SRE",
-    "NOW",
-    "SHW",
-    "SPG",
-    "SWKS",
-    "SJM",
-    "SW",
-    "SNA",
-    "SOLV",
-    "SO",
-    "LUV",
-    "SWK",
-    "SBUX",
-    "STT",
-    "STLD",
-    "STE",
-    "SYK",
-    "SMCI",
-    "SYF",
-    "SNPS",
-    "SYY",
-    "TMUS",
-    "TROW",
-    "TTWO",
-    "TPR",
-    "TRGP",
-    "TGT",
-    "TEL",
-    "TDY",
-    "TFX",
-    "TER",
-    "TSLA",
-    "TXN",
-    "TXT",
-    "TMO",
-    "TJX",
-    "TSCO",
-    "TT",
-    "TDG",
-    "TRV",
-    "TRMB",
-    "TFC",
-    "TYL",
-    "TSN",
-    "USB",
-    "UBER",
-    "UDR",
-    "ULTA",
-    "UNP",
-    "UAL",
-    "UPS",
-    "URI",
-    "UNH",
-    "UHS",
-    "VLO",
-    "VTR",
-    "VLTO",
-    "VRSN",
-    "VRSK",
-    "VZ",
-    "VRTX",
-    "VTRS",
-    "VICI",
-    "V",
-    "VST",
-    "VMC",
-    "WRB",
-    "GWW",
-    "WAB",
-    "WBA",
-    "WMT",
-    "DIS",
-    "WBD",
-    "WM",
-    "WAT",
-    "WEC",
-    "WFC",
-    "WELL",
-    "WST",
-    "WDC",
-    "WY",
-    "WMB",
-    "WTW",
-    "WYNN",
-    "XEL",
-    "XYL",
-    "YUM",
-    "ZBRA",
-    "ZBH",
-    "ZTS",
+# the names of generated_stock_list.json, the dicts are {symbol: {column: value}} of the wikipedia tables, the lists are symbols
+stock_list_name_list: List[str] = [
+    'sp_500_dict',
+    'sp_400_dict',
+    'nasdaq_100_dict',
+    'sp_500_stocks',
+    'sp_400_stocks',
+    'nasdaq_100_stocks',
+    'sp_nasdaq_stocks',
+    'nasdaq_listed_stocks',
+    'nasdaq_traded_stocks',
+    'option_traded_stocks',
 ]
 
 
-# 401
-sp_400_stocks: List[str] = [
-    "AA",
-    "AAL",
-    "AAON",
-    "ACHC",
-    "ACM",
-    "ADC",
-    "AFG",
-    "AGCO",
-    "AIT",
-    "ALE",
-    "ALGM",
-    "ALLY",
-    "ALTM",
-    "ALTR",
-    "ALV",
-    "AM",
-    "AMED",
-    "AMG",
-    "AMH",
-    "AMKR",
-    "AN",
-    "ANF",
-    "APPF",
-    "AR",
-    "ARMK",
-    "ARW",
-    "ARWR",
-    "ASB",
-    "ASGN",
-    "ASH",
-    "ATR",
-    "AVNT",
-    "AVT",
-    "AVTR",
-    "AXTA",
-    "AYI",
-    "AZPN",
-    "AZTA",
-    "BC",
-    "BCO",
-    "BDC",
-    "BERY",
-    "BHF",
-    "BIO",
-    "BJ",
-    "BKH",
-    "BLD",
-    "BLKB",
-    "BMRN",
-    "BRBR",
-    "BRKR",
-    "BRX",
-    "BURL",
-    "BWXT",
-    "BYD",
-    "CACI",
-    "CADE",
-    "CAR",
-    "CASY",
-    "CBSH",
-    "CBT",
-    "CC",
-    "CCK",
-    "CDP",
-    "CELH",
-    "CFR",
-    "CG",
-    "CGNX",
-    "CHDN",
-    "CHE",
-    "CHH",
-    "CHRD",
-    "CHWY",
-    "CHX",
-    "CIEN",
-    "CIVI",
-    "CLF",
-    "CLH",
-    "CMC",
-    "CNH",
-    "CNM",
-    "CNO",
-    "CNX",
-    "CNXC",
-    "COHR",
-    "COKE",
-    "COLB",
-    "COLM",
-    "COTY",
-    "CPRI",
-    "CR",
-    "CRI",
-    "CROX",
-    "CRUS",
-    "CSL",
-    "CUBE",
-    "CUZ",
-    "CVLT",
-    "CW",
-    "CXT",
-    "CYTK",
-    "DAR",
-    "DBX",
-    "DCI",
-    "DINO",
-    "DKS",
-    "DLB",
-    "DOCS",
-    "DOCU",
-    "DT",
-    "DTM",
-    "DUOL",
-    "EEFT",
-    "EGP",
-    "EHC",
-    "ELF",
-    "ELS",
-    "EME",
-    "ENOV",
-    "ENS",
-    "ENSG",
-    "EPR",
-    "EQH",
-    "ESAB",
-    "ESNT",
-    "EVR",
-    "EWBC",
-    "EXE",
-    "EXEL",
-    "EXLS",
-    "EXP",
-    "EXPO",
-    "FAF",
-    "FBIN",
-    "FCFS",
-    "FCN",
-    "FFIN",
-    "FHI",
-    "FHN",
-    "FIVE",
-    "FIX",
-    "FLO",
-    "FLR",
-    "FLS",
-    "FN",
-    "FNB",
-    "FND",
-    "FNF",
-    "FR",
-    "FYBR",
-    "G",
-    "GAP",
-    "GATX",
-    "GBCI",
-    "GEF",
-    "GGG",
-    "GHC",
-    "GLPI",
-    "GME",
-    "GMED",
-    "GNTX",
-    "GPK",
-    "GT",
-    "GTLS",
-    "GXO",
-    "H",
-    "HAE",
-    "HALO",
-    "HGV",
-    "HLI",
-    "HLNE",
-    "HOG",
-    "HOMB",
-    "HQY",
-    "HR",
-    "HRB",
-    "HWC",
-    "HXL",
-    "IBKR",
-    "IBOC",
-    "IDA",
-    "ILMN",
-    "INGR",
-    "IPGP",
-    "IRDM",
-    "IRT",
-    "ITT",
-    "JAZZ",
-    "JEF",
-    "JHG",
-    "JLL",
-    "JWN",
-    "KBH",
-    "KBR",
-    "KD",
-    "KEX",
-    "KMPR",
-    "KNF",
-    "KNSL",
-    "KNX",
-    "KRC",
-    "KRG",
-    "LAD",
-    "LAMR",
-    "LANC",
-    "LEA",
-    "LECO",
-    "LFUS",
-    "LII",
-    "LITE",
-    "LIVN",
-    "LNTH",
-    "LNW",
-    "LOPE",
-    "LPX",
-    "LSCC",
-    "LSTR",
-    "M",
-    "MAN",
-    "MANH",
-    "MASI",
-    "MAT",
-    "MEDP",
-    "MIDD",
-    "MKSI",
-    "MMS",
-    "MORN",
-    "MSA",
-    "MSM",
-    "MTDR",
-    "MTG",
-    "MTN",
-    "MTSI",
-    "MTZ",
-    "MUR",
-    "MUSA",
-    "NBIX",
-    "NEOG",
-    "NEU",
-    "NFG",
-    "NJR",
-    "NLY",
-    "NNN",
-    "NOV",
-    "NOVT",
-    "NSA",
-    "NSP",
-    "NVST",
-    "NVT",
-    "NWE",
-    "NXST",
-    "NXT",
-    "NYCB",
-    "NYT",
-    "OC",
-    "OGE",
-    "OGS",
-    "OHI",
-    "OLED",
-    "OLLI",
-    "OLN",
-    "ONB",
-    "ONTO",
-    "OPCH",
-    "ORA",
-    "ORI",
-    "OSK",
-    "OVV",
-    "OZK",
-    "PAG",
-    "PB",
-    "PBF",
-    "PCH",
-    "PCTY",
-    "PEN",
-    "PFGC",
-    "PII",
-    "PK",
-    "PLNT",
-    "PNFP",
-    "PNM",
-    "POR",
-    "POST",
-    "POWI",
-    "PPC",
-    "PR",
-    "PRGO",
-    "PRI",
-    "PSN",
-    "PSTG",
-    "PVH",
-    "QLYS",
-    "R",
-    "RBA",
-    "RBC",
-    "RCM",
-    "REXR",
-    "RGA",
-    "RGEN",
-    "RGLD",
-    "RH",
-    "RLI",
-    "RMBS",
-    "RNR",
-    "ROIV",
-    "RPM",
-    "RRC",
-    "RRX",
-    "RS",
-    "RYAN",
-    "RYN",
-    "SAIA",
-    "SAIC",
-    "SAM",
-    "SBRA",
-    "SCI",
-    "SEIC",
-    "SF",
-    "SFM",
-    "SHC",
-    "SIGI",
-    "SKX",
-    "SLAB",
-    "SLGN",
-    "SLM",
-    "SMG",
-    "SNV",
-    "SNX",
-    "SON",
-    "SR",
-    "SRPT",
-    "SSB",
-    "SSD",
-    "ST",
-    "STAG",
-    "STWD",
-    "SWX",
-    "SYNA",
-    "TCBI",
-    "TDC",
-    "TEX",
-    "THC",
-    "THG",
-    "THO",
-    "TKO",
-    "TKR",
-    "TMHC",
-    "TNL",
-    "TOL",
-    "TPL",
-    "TPX",
-    "TREX",
-    "TTC",
-    "TTEK",
-    "TXRH",
-    "UA",
-    "UAA",
-    "UBSI",
-    "UFPI",
-    "UGI",
-    "UMBF",
-    "UNM",
-    "USFD",
-    "UTHR",
-    "VAC",
-    "VAL",
-    "VC",
-    "VLY",
-    "VMI",
-    "VNO",
-    "VNOM",
-    "VNT",
-    "VOYA",
-    "VSH",
-    "VVV",
-    "WAL",
-    "WBS",
-    "WCC",
-    "WEN",
-    "WEX",
-    "WFRD",
-    "WH",
-    "WHR",
-    "WING",
-    "WLK",
-    "WMG",
-    "WMS",
-    "WPC",
-    "WSM",
-    "WSO",
-    "WTFC",
-    "WTRG",
-    "WTS",
-    "WU",
-    "WWD",
-    "X",
-    "XPO",
-    "XRAY",
-    "YETI",
-    "ZI",
-    "ZION",
-]
 
+@lru_cache(maxsize=None)
+def read_stock_lists() -> Dict[str, Any]:
+    """
+    * INDEPENDENT *
+    IMPORTS: STOCK_LIST_PATH
+    USED BY: __getattr__()
+    """
+    with open(STOCK_LIST_PATH) as f:
+        return json.load(f)
 
-# 101
-nasdaq_100_stocks: List[str] = [
-    "ADBE",
-    "AMD",
-    "ABNB",
-    "GOOGL",
-    "GOOG",
-    "AMZN",
-    "AEP",
-    "AMGN",
-    "ADI",
-    "ANSS",
-    "AAPL",
-    "AMAT",
-    "ARM",
-    "ASML",
-    "AZN",
-    "TEAM",
-    "ADSK",
-    "ADP",
-    "BKR",
-    "BIIB",
-    "BKNG",
-    "AVGO",
-    "CDNS",
-    "CDW",
-    "CHTR",
-    "CTAS",
-    "CSCO",
-    "CCEP",
-    "CTSH",
-    "CMCSA",
-    "CEG",
-    "CPRT",
-    "CSGP",
-    "COST",
-    "CRWD",
-    "CSX",
-    "DDOG",
-    "DXCM",
-    "FANG",
-    "DLTR",
-    "DASH",
-    "EA",
-    "EXC",
-    "FAST",
-    "FTNT",
-    "GEHC",
-    "GILD",
-    "GFS",
-    "HON",
-    "IDXX",
-    "ILMN",
-    "INTC",
-    "INTU",
-    "ISRG",
-    "KDP",
-    "KLAC",
-    "KHC",
-    "LRCX",
-    "LIN",
-    "LULU",
-    "MAR",
-    "MRVL",
-    "MELI",
-    "META",
-    "MCHP",
-    "MU",
-    "MSFT",
-    "MRNA",
-    "MDLZ",
-    "MDB",
-    "MNST",
-    "NFLX",
-    "NVDA",
-    "NXPI",
-    "ORLY",
-    "ODFL",
-    "ON",
-    "PCAR",
-    "PANW",
-    "PAYX",
-    "PYPL",
-    "PDD",
-    "PEP",
-    "QCOM",
-    "REGN",
-    "ROP",
-    "ROST",
-    "SBUX",
-    "SMCI",
-    "SNPS",
-    "TTWO",
-    "TMUS",
-    "TSLA",
-    "TXN",
-    "TTD",
-    "VRSK",
-    "VRTX",
-    "WBD",
-    "WDAY",
-    "XEL",
-    "ZS",
-]
 
 
-# 870
-sp_nasdaq_stocks: List[str] = [
-    "A",
-    "AA",
-    "AAL",
-    "AAON",
-    "AAPL",
-    "ABBV",
-    "ABNB",
-    "ABT",
-    "ACGL",
-    "ACHC",
-    "ACM",
-    "ACN",
-    "ADBE",
-    "ADC",
-    "ADI",
-    "ADM",
-    "ADP",
-    "ADSK",
-    "AEE",
-    "AEP",
-    "AES",
-    "AFG",
-    "AFL",
-    "AGCO",
-    "AIG",
-    "AIT",
-    "AIZ",
-    "AJG",
-    "AKAM",
-    "ALB",
-    "ALE",
-    "ALGM",
-    "ALGN",
-    "ALL",
-    "ALLE",
-    "ALLY",
-    "ALTM",
-    "ALTR",
-    "ALV",
-    "AM",
-    "AMAT",
-    "AMCR",
-    "AMD",
-    "AME",
-    "AMED",
-    "AMG",
-    "AMGN",
-    "AMH",
-    "AMKR",
-    "AMP",
-    "AMT",
-    "AMTM",
-    "AMZN",
-    "AN",
-    "ANET",
-    "ANF",
-    "ANSS",
-    "AON",
-    "AOS",
-    "APA",
-    "APD",
-    "APH",
-    "APPF",
-    "APTV",
-    "AR",
-    "ARE",
-    "ARM",
-    "ARMK",
-    "ARW",
-    "ARWR",
-    "ASGN",
-    "ASH",
-    "ASML",
-    "ATO",
-    "ATR",
-    "AVB",
-    "AVGO",
-    "AVNT",
-    "AVT",
-    "AVTR",
-    "AVY",
-    "AWK",
-    "AXON",
-    "AXP",
-    "AXTA",
-    "AYI",
-    "AZN",
-    "AZO",
-    "AZPN",
-    "AZTA",
-    "BA",
-    "BALL",
-    "BAX",
-    "BBY",
-    "BC",
-    "BCO",
-    "BDC",
-    "BDX",
-    "BEN",
-    "BERY",
-    "BF.B",
-    "BG",
-    "BHF",
-    "BIIB",
-    "BIO",
-    "BJ",
-    "BKH",
-    "BKNG",
-    "BKR",
-    "BLD",
-    "BLDR",
-    "BLK",
-    "BLKB",
-    "BMRN",
-    "BMY",
-    "BR",
-    "BRBR",
-    "BRK.B",
-    "BRKR",
-    "BRO",
-    "BRX",
-    "BSX",
-    "BURL",
-    "BWA",
-    "BWXT",
-    "BX",
-    "BXP",
-    "BYD",
-    "CACI",
-    "CAG",
-    "CAH",
-    "CAR",
-    "CARR",
-    "CASY",
-    "CAT",
-    "CB",
-    "CBOE",
-    "CBRE",
-    "CBT",
-    "CC",
-    "CCEP",
-    "CCI",
-    "CCK",
-    "CCL",
-    "CDNS",
-    "CDP",
-    "CDW",
-    "CE",
-    "CEG",
-    "CELH",
-    "CF",
-    "CG",
-    "CGNX",
-    "CHD",
-    "CHDN",
-    "CHE",
-    "CHH",
-    "CHRD",
-    "CHRW",
-    "CHTR",
-    "CHWY",
-    "CHX",
-    "CI",
-    "CIEN",
-    "CINF",
-    "CIVI",
-    "CL",
-    "CLF",
-    "CLH",
-    "CLX",
-    "CMC",
-    "CMCSA",
-    "CME",
-    "CMG",
-    "CMI",
-    "CMS",
-    "CNC",
-    "CNH",
-    "CNM",
-    "CNO",
-    "CNP",
-    "CNX",
-    "CNXC",
-    "COHR",
-    "COKE",
-    "COLM",
-    "COO",
-    "COP",
-    "COR",
-    "COST",
-    "COTY",
-    "CPAY",
-    "CPB",
-    "CPRI",
-    "CPRT",
-    "CPT",
-    "CR",
-    "CRI",
-    "CRL",
-    "CRM",
-    "CROX",
-    "CRUS",
-    "CRWD",
-    "CSCO",
-    "CSGP",
-    "CSL",
-    "CSX",
-    "CTAS",
-    "CTLT",
-    "CTRA",
-    "CTSH",
-    "CTVA",
-    "CUBE",
-    "CUZ",
-    "CVLT",
-    "CVS",
-    "CVX",
-    "CW",
-    "CXT",
-    "CYTK",
-    "CZR",
-    "D",
-    "DAL",
-    "DAR",
-    "DASH",
-    "DAY",
-    "DBX",
-    "DCI",
-    "DD",
-    "DDOG",
-    "DE",
-    "DECK",
-    "DELL",
-    "DG",
-    "DGX",
-    "DHI",
-    "DHR",
-    "DINO",
-    "DIS",
-    "DKS",
-    "DLB",
-    "DLR",
-    "DLTR",
-    "DOC",
-    "DOCS",
-    "DOCU",
-    "DOV",
-    "DOW",
-    "DPZ",
-    "DRI",
-    "DT",
-    "DTE",
-    "DTM",
-    "DUK",
-    "DUOL",
-    "DVA",
-    "DVN",
-    "DXCM",
-    "EA",
-    "EBAY",
-    "ECL",
-    "ED",
-    "EEFT",
-    "EFX",
-    "EG",
-    "EGP",
-    "EHC",
-    "EIX",
-    "EL",
-    "ELF",
-    "ELS",
-    "ELV",
-    "EME",
-    "EMN",
-    "EMR",
-    "ENOV",
-    "ENPH",
-    "ENS",
-    "ENSG",
-    "EOG",
-    "EPAM",
-    "EPR",
-    "EQH",
-    "EQIX",
-    "EQR",
-    "EQT",
-    "ERIE",
-    "ES",
-    "ESAB",
-    "ESNT",
-    "ESS",
-    "ETN",
-    "ETR",
-    "EVR",
-    "EVRG",
-    "EW",
-    "EXC",
-    "EXE",
-    "EXEL",
-    "EXLS",
-    "EXP",
-    "EXPD",
-    "EXPE",
-    "EXPO",
-    "EXR",
-    "F",
-    "FAF",
-    "FANG",
-    "FAST",
-    "FBIN",
-    "FCFS",
-    "FCN",
-    "FCX",
-    "FDS",
-    "FDX",
-    "FE",
-    "FFIV",
-    "FHI",
-    "FI",
-    "FICO",
-    "FIS",
-    "FIVE",
-    "FIX",
-    "FLO",
-    "FLR",
-    "FLS",
-    "FMC",
-    "FN",
-    "FND",
-    "FNF",
-    "FOX",
-    "FOXA",
-    "FR",
-    "FRT",
-    "FSLR",
-    "FTNT",
-    "FTV",
-    "FYBR",
-    "G",
-    "GAP",
-    "GATX",
-    "GD",
-    "GDDY",
-    "GE",
-    "GEF",
-    "GEHC",
-    "GEN",
-    "GEV",
-    "GFS",
-    "GGG",
-    "GHC",
-    "GILD",
-    "GIS",
-    "GL",
-    "GLPI",
-    "GLW",
-    "GM",
-    "GME",
-    "GMED",
-    "GNRC",
-    "GNTX",
-    "GOOG",
-    "GOOGL",
-    "GPC",
-    "GPK",
-    "GPN",
-    "GRMN",
-    "GT",
-    "GTLS",
-    "GWW",
-    "GXO",
-    "H",
-    "HAE",
-    "HAL",
-    "HALO",
-    "HAS",
-    "HCA",
-    "HD",
-    "HES",
-    "HGV",
-    "HIG",
-    "HII",
-    "HLI",
-    "HLNE",
-    "HLT",
-    "HOG",
-    "HOLX",
-    "HON",
-    "HPE",
-    "HPQ",
-    "HQY",
-    "HR",
-    "HRB",
-    "HRL",
-    "HSIC",
-    "HST",
-    "HSY",
-    "HUBB",
-    "HUM",
-    "HWM",
-    "HXL",
-    "IBKR",
-    "IBM",
-    "ICE",
-    "IDA",
-    "IDXX",
-    "IEX",
-    "IFF",
-    "ILMN",
-    "INCY",
-    "INGR",
-    "INTC",
-    "INTU",
-    "INVH",
-    "IP",
-    "IPG",
-    "IPGP",
-    "IQV",
-    "IR",
-    "IRDM",
-    "IRM",
-    "IRT",
-    "ISRG",
-    "IT",
-    "ITT",
-    "ITW",
-    "IVZ",
-    "J",
-    "JAZZ",
-    "JBHT",
-    "JBL",
-    "JCI",
-    "JEF",
-    "JHG",
-    "JKHY",
-    "JLL",
-    "JNJ",
-    "JNPR",
-    "JWN",
-    "K",
-    "KBH",
-    "KBR",
-    "KD",
-    "KDP",
-    "KEX",
-    "KEYS",
-    "KHC",
-    "KIM",
-    "KKR",
-    "KLAC",
-    "KMB",
-    "KMI",
-    "KMPR",
-    "KMX",
-    "KNF",
-    "KNSL",
-    "KNX",
-    "KO",
-    "KR",
-    "KRC",
-    "KRG",
-    "KVUE",
-    "L",
-    "LAD",
-    "LAMR",
-    "LANC",
-    "LDOS",
-    "LEA",
-    "LECO",
-    "LEN",
-    "LFUS",
-    "LH",
-    "LHX",
-    "LII",
-    "LIN",
-    "LITE",
-    "LIVN",
-    "LKQ",
-    "LLY",
-    "LMT",
-    "LNT",
-    "LNTH",
-    "LNW",
-    "LOPE",
-    "LOW",
-    "LPX",
-    "LRCX",
-    "LSCC",
-    "LSTR",
-    "LULU",
-    "LUV",
-    "LVS",
-    "LW",
-    "LYB",
-    "LYV",
-    "M",
-    "MA",
-    "MAA",
-    "MAN",
-    "MANH",
-    "MAR",
-    "MAS",
-    "MASI",
-    "MAT",
-    "MCD",
-    "MCHP",
-    "MCK",
-    "MCO",
-    "MDB",
-    "MDLZ",
-    "MDT",
-    "MEDP",
-    "MELI",
-    "MET",
-    "META",
-    "MGM",
-    "MHK",
-    "MIDD",
-    "MKC",
-    "MKSI",
-    "MKTX",
-    "MLM",
-    "MMC",
-    "MMM",
-    "MMS",
-    "MNST",
-    "MO",
-    "MOH",
-    "MORN",
-    "MOS",
-    "MPC",
-    "MPWR",
-    "MRK",
-    "MRNA",
-    "MRO",
-    "MRVL",
-    "MSA",
-    "MSCI",
-    "MSFT",
-    "MSI",
-    "MSM",
-    "MTCH",
-    "MTD",
-    "MTDR",
-    "MTG",
-    "MTN",
-    "MTSI",
-    "MTZ",
-    "MU",
-    "MUR",
-    "MUSA",
-    "NBIX",
-    "NCLH",
-    "NDAQ",
-    "NDSN",
-    "NEE",
-    "NEM",
-    "NEOG",
-    "NEU",
-    "NFG",
-    "NFLX",
-    "NI",
-    "NJR",
-    "NKE",
-    "NLY",
-    "NNN",
-    "NOC",
-    "NOV",
-    "NOVT",
-    "NOW",
-    "NRG",
-    "NSA",
-    "NSC",
-    "NSP",
-    "NTAP",
-    "NUE",
-    "NVDA",
-    "NVR",
-    "NVST",
-    "NVT",
-    "NWE",
-    "NWS",
-    "NWSA",
-    "NXPI",
-    "NXST",
-    "NXT",
-    "NYT",
-    "O",
-    "OC",
-    "ODFL",
-    "OGE",
-    "OGS",
-    "OHI",
-    "OKE",
-    "OLED",
-    "OLLI",
-    "OLN",
-    "OMC",
-    "ON",
-    "ONTO",
-    "OPCH",
-    "ORA",
-    "ORCL",
-    "ORI",
-    "ORLY",
-    "OSK",
-    "OTIS",
-    "OVV",
-    "OXY",
-    "PAG",
-    "PANW",
-    "PARA",
-    "PAYC",
-    "PAYX",
-    "PBF",
-    "PCAR",
-    "PCG",
-    "PCH",
-    "PCTY",
-    "PDD",
-    "PEG",
-    "PEN",
-    "PEP",
-    "PFE",
-    "PFG",
-    "PFGC",
-    "PG",
-    "PGR",
-    "PH",
-    "PHM",
-    "PII",
-    "PK",
-    "PKG",
-    "PLD",
-    "PLNT",
-    "PLTR",
-    "PM",
-    "PNM",
-    "PNR",
-    "PNW",
-    "PODD",
-    "POOL",
-    "POR",
-    "POST",
-    "POWI",
-    "PPC",
-    "PPG",
-    "PPL",
-    "PR",
-    "PRGO",
-    "PRI",
-    "PRU",
-    "PSA",
-    "PSN",
-    "PSTG",
-    "PSX",
-    "PTC",
-    "PVH",
-    "PWR",
-    "PYPL",
-    "QCOM",
-    "QLYS",
-    "QRVO",
-    "R",
-    "RBA",
-    "RBC",
-    "RCL",
-    "RCM",
-    "REG",
-    "REGN",
-    "REXR",
-    "RGA",
-    "RGEN",
-    "RGLD",
-    "RH",
-    "RJF",
-    "RL",
-    "RLI",
-    "RMBS",
-    "RMD",
-    "RNR",
-    "ROIV",
-    "ROK",
-    "ROL",
-    "ROP",
-    "ROST",
-    "RPM",
-    "RRC",
-    "RRX",
-    "RS",
-    "RSG",
-    "RTX",
-    "RVTY",
-    "RYAN",
-    "RYN",
-    "SAIA",
-    "SAIC",
-    "SAM",
-    "SBAC",
-    "SBRA",
-    "SBUX",
-    "SCI",
-    "SEIC",
-    "SF",
-    "SFM",
-    "SHC",
-    "SHW",
-    "SIGI",
-    "SJM",
-    "SKX",
-    "SLAB",
-    "SLB",
-    "SLGN",
-    "SLM",
-    "SMCI",
-    "SMG",
-    "SNA",
-    "SNPS",
-    "SNX",
-    "SO",
-    "SOLV",
-    "SON",
-    "SPG",
-    "SPGI",
-    "SR",
-    "SRE",
-    "SRPT",
-    "SSD",
-    "ST",
-    "STAG",
-    "STE",
-    "STLD",
-    "STWD",
-    "STX",
-    "STZ",
-    "SW",
-    "SWK",
-    "SWKS",
-    "SWX",
-    "SYK",
-    "SYNA",
-    "SYY",
-    "T",
-    "TAP",
-    "TDC",
-    "TDG",
-    "TDY",
-    "TEAM",
-    "TECH",
-    "TEL",
-    "TER",
-    "TEX",
-    "TFX",
-    "TGT",
-    "THC",
-    "THG",
-    "THO",
-    "TJX",
-    "TKO",
-    "TKR",
-    "TMHC",
-    "TMO",
-    "TMUS",
-    "TNL",
-    "TOL",
-    "TPL",
-    "TPR",
-    "TPX",
-    "TREX",
-    "TRGP",
-    "TRMB",
-    "TROW",
-    "TRV",
-    "TSCO",
-    "TSLA",
-    "TSN",
-    "TT",
-    "TTC",
-    "TTD",
-    "TTEK",
-    "TTWO",
-    "TXN",
-    "TXRH",
-    "TXT",
-    "TYL",
-    "UA",
-    "UAA",
-    "UAL",
-    "UBER",
-    "UDR",
-    "UFPI",
-    "UGI",
-    "UHS",
-    "ULTA",
-    "UNH",
-    "UNM",
-    "UNP",
-    "UPS",
-    "URI",
-    "USFD",
-    "UTHR",
-    "V",
-    "VAC",
-    "VAL",
-    "VC",
-    "VICI",
-    "VLO",
-    "VLTO",
-    "VMC",
-    "VMI",
-    "VNO",
-    "VNOM",
-    "VNT",
-    "VOYA",
-    "VRSK",
-    "VRSN",
-    "VRTX",
-    "VSH",
-    "VST",
-    "VTR",
-    "VTRS",
-    "VVV",
-    "VZ",
-    "WAB",
-    "WAL",
-    "WAT",
-    "WBA",
-    "WBD",
-    "WCC",
-    "WDAY",
-    "WDC",
-    "WEC",
-    "WELL",
-    "WEN",
-    "WEX",
-    "WFRD",
-    "WH",
-    "WHR",
-    "WING",
-    "WLK",
-    "WM",
-    "WMB",
-    "WMG",
-    "WMS",
-    "WMT",
-    "WPC",
-    "WRB",
-    "WSM",
-    "WSO",
-    "WST",
-    "WTRG",
-    "WTS",
-    "WTW",
-    "WU",
-    "WWD",
-    "WY",
-    "WYNN",
-    "X",
-    "XEL",
-    "XOM",
-    "XPO",
-    "XRAY",
-    "XYL",
-    "YETI",
-    "YUM",
-    "ZBH",
-    "ZBRA",
-    "ZI",
-    "ZS",
-    "ZTS",
-]
+def __getattr__(name: str) -> Any:
+    """
+    DEPENDS ON: read_stock_lists(), stock_list_name_list
+    Python calls this function only for the names which are not defined in this module.
+    A list which is not in the file yet, like option_traded_stocks of a file generated before it was added, is empty.
+    """
+    if name in stock_list_name_list:
+        return read_stock_lists().get(name, [])
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
-# 4809
-nasdaq_listed_stocks: List[str] = [
-    "AACG",
-    "AADI",
-    "AADR",
-    "AAL",
-    "AAME",
-    "AAOI",
-    "AAON",
-    "AAPB",
-    "AAPD",
-    "AAPL",
-    "AAPU",
-    "AAXJ",
-    "ABAT",
-    "ABCL",
-    "ABCS",
-    "ABEO",
-    "ABL",
-    "ABLLL",
-    "ABLLW",
-    "ABLV",
-    "ABLVW",
-    "ABNB",
-    "ABOS",
-    "ABP",
-    "ABPWW",
-    "ABSI",
-    "ABTS",
-    "ABUS",
-    "ABVC",
-    "ABVE",
-    "ABVEW",
-    "ABVX",
-    "ACAD",
-    "ACB",
-    "ACCD",
-    "ACDC",
-    "ACET",
-    "ACGL",
-    "ACGLN",
-    "ACGLO",
-    "ACHC",
-    "ACHL",
-    "ACHV",
-    "ACIC",
-    "ACIU",
-    "ACIW",
-    "ACLS",
-    "ACLX",
-    "ACMR",
-    "ACNB",
-    "ACNT",
-    "ACOG",
-    "ACON",
-    "ACONW",
-    "ACRS",
-    "ACRV",
-    "ACT",
-    "ACTG",
-    "ACTU",
-    "ACVA",
-    "ACWI",
-    "ACWX",
-    "ACXP",
-    "ADAG",
-    "ADAP",
-    "ADBE",
-    "ADD",
-    "ADEA",
-    "ADGM",
-    "ADI",
-    "ADIL",
-    "ADMA",
-    "ADN",
-    "ADNWW",
-    "ADP",
-    "ADPT",
-    "ADSE",
-    "ADSEW",
-    "ADSK",
-    "ADTN",
-    "ADTX",
-    "ADUR",
-    "ADUS",
-    "ADV",
-    "ADVM",
-    "ADVWW",
-    "ADXN",
-    "AEHL",
-    "AEHR",
-    "AEI",
-    "AEIS",
-    "AEMD",
-    "AENT",
-    "AENTW",
-    "AEP",
-    "AERT",
-    "AERTW",
-    "AEYE",
-    "AFBI",
-    "AFCG",
-    "AFJK",
-    "AFJKR",
-    "AFJKU",
-    "AFMD",
-    "AFRI",
-    "AFRIW",
-    "AFRM",
-    "AFYA",
-    "AGAE",
-    "AGEN",
-    "AGFY",
-    "AGIO",
-    "AGIX",
-    "AGMH",
-    "AGMI",
-    "AGNC",
-    "AGNCL",
-    "AGNCM",
-    "AGNCN",
-    "AGNCO",
-    "AGNCP",
-    "AGNG",
-    "AGRI",
-    "AGYS",
-    "AGZD",
-    "AHCO",
-    "AHG",
-    "AIA",
-    "AIEV",
-    "AIFF",
-    "AIFU",
-    "AIHS",
-    "AILE",
-    "AILEW",
-    "AIMAU",
-    "AIMAW",
-    "AIMBU",
-    "AIMD",
-    "AIMDW",
-    "AIOT",
-    "AIP",
-    "AIPI",
-    "AIQ",
-    "AIRE",
-    "AIRG",
-    "AIRJ",
-    "AIRJW",
-    "AIRL",
-    "AIRR",
-    "AIRS",
-    "AIRT",
-    "AIRTP",
-    "AISP",
-    "AISPW",
-    "AITR",
-    "AITRR",
-    "AITRU",
-    "AIXI",
-    "AKAM",
-    "AKAN",
-    "AKBA",
-    "AKRO",
-    "AKTS",
-    "AKTX",
-    "AKYA",
-    "ALAB",
-    "ALAR",
-    "ALBT",
-    "ALCE",
-    "ALCO",
-    "ALCY",
-    "ALCYU",
-    "ALCYW",
-    "ALDFU",
-    "ALDX",
-    "ALEC",
-    "ALF",
-    "ALFUU",
-    "ALFUW",
-    "ALGM",
-    "ALGN",
-    "ALGS",
-    "ALGT",
-    "ALHC",
-    "ALKS",
-    "ALKT",
-    "ALLK",
-    "ALLO",
-    "ALLR",
-    "ALLT",
-    "ALMS",
-    "ALNT",
-    "ALNY",
-    "ALOT",
-    "ALRM",
-    "ALRN",
-    "ALRS",
-    "ALSA",
-    "ALSAR",
-    "ALSAU",
-    "ALSAW",
-    "ALT",
-    "ALTI",
-    "ALTO",
-    "ALTR",
-    "ALTS",
-    "ALTY",
-    "ALVO",
-    "ALVOW",
-    "ALVR",
-    "ALXO",
-    "ALZN",
-    "AMAL",
-    "AMAT",
-    "AMBA",
-    "AMCX",
-    "AMD",
-    "AMDL",
-    "AMDS",
-    "AMED",
-    "AMGN",
-    "AMID",
-    "AMIX",
-    "AMKR",
-    "AMLI",
-    "AMLX",
-    "AMPG",
-    "AMPGW",
-    "AMPH",
-    "AMPL",
-    "AMRK",
-    "AMRN",
-    "AMRX",
-    "AMSC",
-    "AMSF",
-    "AMST",
-    "AMTX",
-    "AMWD",
-    "AMZD",
-    "AMZN",
-    "AMZU",
-    "AMZZ",
-    "ANAB",
-    "ANDE",
-    "ANEB",
-    "ANGH",
-    "ANGHW",
-    "ANGI",
-    "ANGL",
-    "ANGO",
-    "ANIK",
-    "ANIP",
-    "ANIX",
-    "ANL",
-    "ANNX",
-    "ANSC",
-    "ANSCU",
-    "ANSCW",
-    "ANSS",
-    "ANTE",
-    "ANTX",
-    "ANY",
-    "AOSL",
-    "AOTG",
-    "AOUT",
-    "APA",
-    "APCX",
-    "APCXW",
-    "APDN",
-    "APEI",
-    "APGE",
-    "API",
-    "APLD",
-    "APLM",
-    "APLMW",
-    "APLS",
-    "APLT",
-    "APM",
-    "APOG",
-    "APP",
-    "APPF",
-    "APPN",
-    "APPS",
-    "APRE",
-    "APTO",
-    "APVO",
-    "APWC",
-    "APXI",
-    "APYX",
-    "AQB",
-    "AQMS",
-    "AQST",
-    "AQU",
-    "AQUNR",
-    "AQUNU",
-    "AQWA",
-    "ARAY",
-    "ARBB",
-    "ARBE",
-    "ARBEW",
-    "ARBK",
-    "ARBKL",
-    "ARCB",
-    "ARCC",
-    "ARCT",
-    "ARDX",
-    "AREB",
-    "AREBW",
-    "AREC",
-    "ARGX",
-    "ARHS",
-    "ARKO",
-    "ARKOW",
-    "ARKR",
-    "ARLP",
-    "ARM",
-    "AROW",
-    "ARQ",
-    "ARQQ",
-    "ARQQW",
-    "ARQT",
-    "ARRY",
-    "ARTL",
-    "ARTNA",
-    "ARTV",
-    "ARTW",
-    "ARVN",
-    "ARVR",
-    "ARWR",
-    "ASET",
-    "ASLE",
-    "ASMB",
-    "ASML",
-    "ASND",
-    "ASNS",
-    "ASO",
-    "ASPCU",
-    "ASPI",
-    "ASPS",
-    "ASRT",
-    "ASRV",
-    "ASST",
-    "ASTC",
-    "ASTE",
-    "ASTH",
-    "ASTI",
-    "ASTL",
-    "ASTLW",
-    "ASTS",
-    "ASUR",
-    "ASYS",
-    "ATAI",
-    "ATAT",
-    "ATCOL",
-    "ATEC",
-    "ATER",
-    "ATEX",
-    "ATGL",
-    "ATHA",
-    "ATHE",
-    "ATIF",
-    "ATLC",
-    "ATLCL",
-    "ATLCP",
-    "ATLCZ",
-    "ATLO",
-    "ATLX",
-    "ATMC",
-    "ATMCR",
-    "ATMCU",
-    "ATMCW",
-    "ATMV",
-    "ATMVR",
-    "ATMVU",
-    "ATNF",
-    "ATNFW",
-    "ATNI",
-    "ATOM",
-    "ATOS",
-    "ATPC",
-    "ATRA",
-    "ATRC",
-    "ATRO",
-    "ATSG",
-    "ATXG",
-    "ATXI",
-    "ATXS",
-    "ATYR",
-    "AUBN",
-    "AUDC",
-    "AUID",
-    "AUMI",
-    "AUPH",
-    "AUR",
-    "AURA",
-    "AUROW",
-    "AUTL",
-    "AUUD",
-    "AUUDW",
-    "AVAH",
-    "AVAV",
-    "AVBP",
-    "AVDL",
-    "AVDX",
-    "AVGO",
-    "AVGR",
-    "AVGX",
-    "AVIR",
-    "AVL",
-    "AVNW",
-    "AVO",
-    "AVPT",
-    "AVPTW",
-    "AVS",
-    "AVT",
-    "AVTE",
-    "AVTX",
-    "AVXC",
-    "AVXL",
-    "AWH",
-    "AWRE",
-    "AXDX",
-    "AXGN",
-    "AXON",
-    "AXSM",
-    "AXTI",
-    "AY",
-    "AYRO",
-    "AYTU",
-    "AZ",
-    "AZI",
-    "AZN",
-    "AZPN",
-    "AZTA",
-    "BABX",
-    "BACK",
-    "BACQU",
-    "BAER",
-    "BAERW",
-    "BAFE",
-    "BAFN",
-    "BAND",
-    "BANF",
-    "BANFP",
-    "BANL",
-    "BANR",
-    "BANX",
-    "BAOS",
-    "BASE",
-    "BATRA",
-    "BATRK",
-    "BAYA",
-    "BAYAR",
-    "BAYAU",
-    "BBCP",
-    "BBGI",
-    "BBH",
-    "BBIO",
-    "BBLG",
-    "BBLGW",
-    "BBSI",
-    "BCAB",
-    "BCAL",
-    "BCAN",
-    "BCAX",
-    "BCBP",
-    "BCDA",
-    "BCG",
-    "BCGWW",
-    "BCLI",
-    "BCML",
-    "BCOV",
-    "BCOW",
-    "BCPC",
-    "BCRX",
-    "BCTX",
-    "BCTXW",
-    "BCYC",
-    "BDGS",
-    "BDMD",
-    "BDMDW",
-    "BDRX",
-    "BDSX",
-    "BDTX",
-    "BEAGU",
-    "BEAM",
-    "BEAT",
-    "BEATW",
-    "BECN",
-    "BEEM",
-    "BEEZ",
-    "BELFA",
-    "BELFB",
-    "BELT",
-    "BENF",
-    "BENFW",
-    "BETR",
-    "BETRW",
-    "BFC",
-    "BFIN",
-    "BFRG",
-    "BFRGW",
-    "BFRI",
-    "BFRIW",
-    "BFST",
-    "BGC",
-    "BGFV",
-    "BGLC",
-    "BGM",
-    "BGNE",
-    "BGRN",
-    "BGRO",
-    "BHAT",
-    "BHF",
-    "BHFAL",
-    "BHFAM",
-    "BHFAN",
-    "BHFAO",
-    "BHFAP",
-    "BHIL",
-    "BHRB",
-    "BHST",
-    "BIAF",
-    "BIAFW",
-    "BIB",
-    "BIDU",
-    "BIGC",
-    "BIIB",
-    "BILI",
-    "BIOA",
-    "BIOR",
-    "BIOX",
-    "BIRD",
-    "BIS",
-    "BITF",
-    "BITS",
-    "BIVI",
-    "BJDX",
-    "BJK",
-    "BJRI",
-    "BKCH",
-    "BKHA",
-    "BKHAR",
-    "BKHAU",
-    "BKIV",
-    "BKNG",
-    "BKR",
-    "BKWO",
-    "BKYI",
-    "BL",
-    "BLAC",
-    "BLACR",
-    "BLACU",
-    "BLACW",
-    "BLBD",
-    "BLBX",
-    "BLCN",
-    "BLCR",
-    "BLDE",
-    "BLDEW",
-    "BLDP",
-    "BLEU",
-    "BLEUR",
-    "BLEUU",
-    "BLEUW",
-    "BLFS",
-    "BLFY",
-    "BLIN",
-    "BLKB",
-    "BLLD",
-    "BLMN",
-    "BLMZ",
-    "BLNK",
-    "BLRX",
-    "BLTE",
-    "BLUE",
-    "BLZE",
-    "BMBL",
-    "BMDL",
-    "BMEA",
-    "BMR",
-    "BMRA",
-    "BMRC",
-    "BMRN",
-    "BNAI",
-    "BNAIW",
-    "BND",
-    "BNDW",
-    "BNDX",
-    "BNGO",
-    "BNIX",
-    "BNIXR",
-    "BNIXW",
-    "BNOX",
-    "BNR",
-    "BNRG",
-    "BNTC",
-    "BNTX",
-    "BNZI",
-    "BNZIW",
-    "BOCN",
-    "BOCNU",
-    "BOCNW",
-    "BOF",
-    "BOKF",
-    "BOLD",
-    "BOLT",
-    "BON",
-    "BOOM",
-    "BOSC",
-    "BOTJ",
-    "BOTT",
-    "BOTZ",
-    "BOWN",
-    "BOWNR",
-    "BOWNU",
-    "BOXL",
-    "BPMC",
-    "BPOP",
-    "BPOPM",
-    "BPRN",
-    "BPTH",
-    "BPYPM",
-    "BPYPN",
-    "BPYPO",
-    "BPYPP",
-    "BRAC",
-    "BRACR",
-    "BRACU",
-    "BRAG",
-    "BREA",
-    "BRFH",
-    "BRHY",
-    "BRID",
-    "BRKH",
-    "BRKHU",
-    "BRKHW",
-    "BRKL",
-    "BRKR",
-    "BRLS",
-    "BRLSW",
-    "BRLT",
-    "BRNS",
-    "BRNY",
-    "BROG",
-    "BROGW",
-    "BRRR",
-    "BRTR",
-    "BRTX",
-    "BRY",
-    "BRZE",
-    "BSBK",
-    "BSCO",
-    "BSCP",
-    "BSCQ",
-    "BSCR",
-    "BSCS",
-    "BSCT",
-    "BSCU",
-    "BSCV",
-    "BSCW",
-    "BSCX",
-    "BSCY",
-    "BSET",
-    "BSFC",
-    "BSGM",
-    "BSII",
-    "BSIIU",
-    "BSIIW",
-    "BSJO",
-    "BSJP",
-    "BSJQ",
-    "BSJR",
-    "BSJS",
-    "BSJT",
-    "BSJU",
-    "BSJV",
-    "BSJW",
-    "BSLK",
-    "BSLKW",
-    "BSMO",
-    "BSMP",
-    "BSMQ",
-    "BSMR",
-    "BSMS",
-    "BSMT",
-    "BSMU",
-    "BSMV",
-    "BSMW",
-    "BSMY",
-    "BSRR",
-    "BSSX",
-    "BSVN",
-    "BSVO",
-    "BSY",
-    "BTAI",
-    "BTBD",
-    "BTBDW",
-    "BTBT",
-    "BTCS",
-    "BTCT",
-    "BTCTW",
-    "BTDR",
-    "BTF",
-    "BTFX",
-    "BTGD",
-    "BTM",
-    "BTMD",
-    "BTMWW",
-    "BTOC",
-    "BTOG",
-    "BTSG",
-    "BTSGU",
-    "BUFC",
-    "BUG",
-    "BUJA",
-    "BUJAR",
-    "BUJAU",
-    "BUJAW",
-    "BULD",
-    "BUSE",
-    "BVFL",
-    "BVS",
-    "BWAY",
-    "BWB",
-    "BWBBP",
-    "BWEN",
-    "BWFG",
-    "BWIN",
-    "BWMN",
-    "BYFC",
-    "BYND",
-    "BYNO",
-    "BYNOU",
-    "BYNOW",
-    "BYRN",
-    "BYSI",
-    "BYU",
-    "BZ",
-    "BZFD",
-    "BZFDW",
-    "BZUN",
-    "CA",
-    "CAAS",
-    "CABA",
-    "CAC",
-    "CACC",
-    "CADL",
-    "CAFG",
-    "CAKE",
-    "CALC",
-    "CALI",
-    "CALM",
-    "CAMP",
-    "CAMT",
-    "CAN",
-    "CANC",
-    "CANQ",
-    "CAPN",
-    "CAPNR",
-    "CAPNU",
-    "CAPR",
-    "CAPT",
-    "CAPTW",
-    "CAR",
-    "CARA",
-    "CARE",
-    "CARG",
-    "CARM",
-    "CART",
-    "CARV",
-    "CARZ",
-    "CASH",
-    "CASI",
-    "CASS",
-    "CASY",
-    "CATH",
-    "CATY",
-    "CBAT",
-    "CBFV",
-    "CBLL",
-    "CBNK",
-    "CBRL",
-    "CBSH",
-    "CBUS",
-    "CCAP",
-    "CCB",
-    "CCBG",
-    "CCCC",
-    "CCCS",
-    "CCD",
-    "CCEC",
-    "CCEP",
-    "CCG",
-    "CCGWW",
-    "CCIRU",
-    "CCIX",
-    "CCIXU",
-    "CCIXW",
-    "CCLD",
-    "CCLDO",
-    "CCLDP",
-    "CCNE",
-    "CCNEP",
-    "CCNR",
-    "CCOI",
-    "CCRN",
-    "CCSB",
-    "CCSI",
-    "CCSO",
-    "CCTG",
-    "CDC",
-    "CDIO",
-    "CDIOW",
-    "CDL",
-    "CDLX",
-    "CDMO",
-    "CDNA",
-    "CDNS",
-    "CDRO",
-    "CDROW",
-    "CDT",
-    "CDTG",
-    "CDTTW",
-    "CDTX",
-    "CDW",
-    "CDXC",
-    "CDXS",
-    "CDZI",
-    "CDZIP",
-    "CEAD",
-    "CEADW",
-    "CECO",
-    "CEFA",
-    "CEG",
-    "CELC",
-    "CELH",
-    "CELU",
-    "CELUW",
-    "CELZ",
-    "CENN",
-    "CENT",
-    "CENTA",
-    "CENX",
-    "CEP",
-    "CERO",
-    "CEROW",
-    "CERS",
-    "CERT",
-    "CETX",
-    "CETY",
-    "CEVA",
-    "CFA",
-    "CFB",
-    "CFBK",
-    "CFFI",
-    "CFFN",
-    "CFFS",
-    "CFFSU",
-    "CFFSW",
-    "CFLT",
-    "CFO",
-    "CFSB",
-    "CG",
-    "CGABL",
-    "CGBD",
-    "CGBDL",
-    "CGBS",
-    "CGBSW",
-    "CGC",
-    "CGEM",
-    "CGEN",
-    "CGNT",
-    "CGNX",
-    "CGO",
-    "CGON",
-    "CGTX",
-    "CHARU",
-    "CHCI",
-    "CHCO",
-    "CHDN",
-    "CHEF",
-    "CHEK",
-    "CHI",
-    "CHKP",
-    "CHMG",
-    "CHNR",
-    "CHPS",
-    "CHR",
-    "CHRD",
-    "CHRS",
-    "CHRW",
-    "CHSCL",
-    "CHSCM",
-    "CHSCN",
-    "CHSCO",
-    "CHSCP",
-    "CHSN",
-    "CHTR",
-    "CHW",
-    "CHX",
-    "CHY",
-    "CIBR",
-    "CIFR",
-    "CIFRW",
-    "CIGI",
-    "CIL",
-    "CINF",
-    "CING",
-    "CINGW",
-    "CISO",
-    "CISS",
-    "CITE",
-    "CITEU",
-    "CITEW",
-    "CIVB",
-    "CJET",
-    "CJJD",
-    "CKPT",
-    "CLAR",
-    "CLBK",
-    "CLBT",
-    "CLDX",
-    "CLEU",
-    "CLFD",
-    "CLGN",
-    "CLIK",
-    "CLIR",
-    "CLLS",
-    "CLMB",
-    "CLMT",
-    "CLNE",
-    "CLNN",
-    "CLNNW",
-    "CLOA",
-    "CLOD",
-    "CLOU",
-    "CLOV",
-    "CLPS",
-    "CLPT",
-    "CLRB",
-    "CLRC",
-    "CLRCR",
-    "CLRCU",
-    "CLRCW",
-    "CLRO",
-    "CLSD",
-    "CLSK",
-    "CLSKW",
-    "CLSM",
-    "CLST",
-    "CLWT",
-    "CLYM",
-    "CMAX",
-    "CMAXW",
-    "CMBM",
-    "CMCO",
-    "CMCSA",
-    "CMCT",
-    "CME",
-    "CMLS",
-    "CMMB",
-    "CMND",
-    "CMPO",
-    "CMPOW",
-    "CMPR",
-    "CMPS",
-    "CMPX",
-    "CMRX",
-    "CMTL",
-    "CNCR",
-    "CNDT",
-    "CNET",
-    "CNEY",
-    "CNFR",
-    "CNFRZ",
-    "CNOB",
-    "CNOBP",
-    "CNSL",
-    "CNSP",
-    "CNTA",
-    "CNTB",
-    "CNTM",
-    "CNTX",
-    "CNTY",
-    "CNVS",
-    "CNXC",
-    "CNXN",
-    "COCH",
-    "COCHW",
-    "COCO",
-    "COCP",
-    "CODA",
-    "CODX",
-    "COEP",
-    "COEPW",
-    "COFS",
-    "COGT",
-    "COHU",
-    "COIN",
-    "COKE",
-    "COLB",
-    "COLL",
-    "COLM",
-    "COMM",
-    "COMT",
-    "CONI",
-    "CONL",
-    "COO",
-    "COOP",
-    "COOT",
-    "COOTW",
-    "COPJ",
-    "COPP",
-    "CORT",
-    "CORZ",
-    "CORZW",
-    "CORZZ",
-    "COSM",
-    "COST",
-    "COWG",
-    "COWS",
-    "COYA",
-    "CPB",
-    "CPBI",
-    "CPHC",
-    "CPIX",
-    "CPLS",
-    "CPOP",
-    "CPRT",
-    "CPRX",
-    "CPSH",
-    "CPSS",
-    "CPTN",
-    "CPTNW",
-    "CPZ",
-    "CRAI",
-    "CRBP",
-    "CRBU",
-    "CRCT",
-    "CRDF",
-    "CRDL",
-    "CRDO",
-    "CREG",
-    "CRESW",
-    "CRESY",
-    "CREV",
-    "CREVW",
-    "CREX",
-    "CRGO",
-    "CRGOW",
-    "CRGX",
-    "CRIS",
-    "CRKN",
-    "CRMD",
-    "CRML",
-    "CRMLW",
-    "CRMT",
-    "CRNC",
-    "CRNT",
-    "CRNX",
-    "CRON",
-    "CROX",
-    "CRSP",
-    "CRSR",
-    "CRTO",
-    "CRUS",
-    "CRVL",
-    "CRVO",
-    "CRVS",
-    "CRWD",
-    "CRWL",
-    "CRWS",
-    "CSA",
-    "CSB",
-    "CSBR",
-    "CSCI",
-    "CSCO",
-    "CSF",
-    "CSGP",
-    "CSGS",
-    "CSIQ",
-    "CSLM",
-    "CSLMR",
-    "CSLMU",
-    "CSLMW",
-    "CSLR",
-    "CSLRW",
-    "CSPI",
-    "CSQ",
-    "CSTE",
-    "CSTL",
-    "CSWC",
-    "CSWCZ",
-    "CSWI",
-    "CSX",
-    "CTAS",
-    "CTBI",
-    "CTCX",
-    "CTCXW",
-    "CTEC",
-    "CTHR",
-    "CTKB",
-    "CTLP",
-    "CTMX",
-    "CTNM",
-    "CTNT",
-    "CTOR",
-    "CTRM",
-    "CTRN",
-    "CTSH",
-    "CTSO",
-    "CTXR",
-    "CUB",
-    "CUBA",
-    "CUBWU",
-    "CUBWW",
-    "CUE",
-    "CURI",
-    "CURIW",
-    "CURR",
-    "CUTR",
-    "CVAC",
-    "CVBF",
-    "CVCO",
-    "CVGI",
-    "CVGW",
-    "CVKD",
-    "CVLT",
-    "CVRX",
-    "CVV",
-    "CWBC",
-    "CWCO",
-    "CWD",
-    "CWST",
-    "CXAI",
-    "CXAIW",
-    "CXDO",
-    "CXSE",
-    "CYBR",
-    "CYCC",
-    "CYCCP",
-    "CYCN",
-    "CYN",
-    "CYRX",
-    "CYTH",
-    "CYTHW",
-    "CYTK",
-    "CYTO",
-    "CZAR",
-    "CZFS",
-    "CZNC",
-    "CZR",
-    "CZWI",
-    "DADA",
-    "DAIO",
-    "DAKT",
-    "DALI",
-    "DALN",
-    "DAPP",
-    "DARE",
-    "DASH",
-    "DATS",
-    "DATSW",
-    "DAVE",
-    "DAVEW",
-    "DAWN",
-    "DAX",
-    "DBGI",
-    "DBGIW",
-    "DBVT",
-    "DBX",
-    "DCAP",
-    "DCBO",
-    "DCGO",
-    "DCOM",
-    "DCOMG",
-    "DCOMP",
-    "DCTH",
-    "DDI",
-    "DDIV",
-    "DDOG",
-    "DECA",
-    "DECAU",
-    "DECAW",
-    "DECO",
-    "DEMZ",
-    "DENN",
-    "DERM",
-    "DEVS",
-    "DFGP",
-    "DFGX",
-    "DFLI",
-    "DFLIW",
-    "DGCB",
-    "DGHI",
-    "DGICA",
-    "DGICB",
-    "DGII",
-    "DGLY",
-    "DGRE",
-    "DGRS",
-    "DGRW",
-    "DH",
-    "DHAI",
-    "DHAIW",
-    "DHC",
-    "DHCNI",
-    "DHCNL",
-    "DHIL",
-    "DIBS",
-    "DIOD",
-    "DIST",
-    "DISTR",
-    "DISTW",
-    "DIVD",
-    "DJCO",
-    "DJT",
-    "DJTWW",
-    "DKNG",
-    "DLHC",
-    "DLO",
-    "DLPN",
-    "DLTH",
-    "DLTR",
-    "DMAC",
-    "DMAT",
-    "DMLP",
-    "DMN",
-    "DMRC",
-    "DMXF",
-    "DNLI",
-    "DNTH",
-    "DNUT",
-    "DOCU",
-    "DOGZ",
-    "DOMH",
-    "DOMO",
-    "DOOO",
-    "DORM",
-    "DOX",
-    "DOYU",
-    "DPRO",
-    "DRCT",
-    "DRIO",
-    "DRIV",
-    "DRMA",
-    "DRMAW",
-    "DRRX",
-    "DRS",
-    "DRTS",
-    "DRTSW",
-    "DRUG",
-    "DRVN",
-    "DSGN",
-    "DSGR",
-    "DSGX",
-    "DSP",
-    "DSWL",
-    "DSY",
-    "DSYWW",
-    "DTCK",
-    "DTCR",
-    "DTI",
-    "DTIL",
-    "DTSQ",
-    "DTSQR",
-    "DTSQU",
-    "DTSS",
-    "DTST",
-    "DTSTW",
-    "DUET",
-    "DUETU",
-    "DUETW",
-    "DUKH",
-    "DUKX",
-    "DUO",
-    "DUOL",
-    "DUOT",
-    "DVAL",
-    "DVAX",
-    "DVLU",
-    "DVOL",
-    "DVY",
-    "DWAS",
-    "DWAW",
-    "DWSH",
-    "DWSN",
-    "DWTX",
-    "DWUS",
-    "DXCM",
-    "DXJS",
-    "DXLG",
-    "DXPE",
-    "DXR",
-    "DYAI",
-    "DYCQ",
-    "DYCQR",
-    "DYCQU",
-    "DYFI",
-    "DYN",
-    "DYNI",
-    "DYTA",
-    "EA",
-    "EAST",
-    "EBAY",
-    "EBC",
-    "EBIZ",
-    "EBMT",
-    "EBON",
-    "EBTC",
-    "ECBK",
-    "ECDA",
-    "ECDAW",
-    "ECOR",
-    "ECOW",
-    "ECPG",
-    "ECX",
-    "ECXWW",
-    "EDAP",
-    "EDBL",
-    "EDBLW",
-    "EDIT",
-    "EDOC",
-    "EDRY",
-    "EDSA",
-    "EDTK",
-    "EDUC",
-    "EEFT",
-    "EEIQ",
-    "EEMA",
-    "EFAS",
-    "EFOI",
-    "EFRA",
-    "EFSC",
-    "EFSCP",
-    "EGAN",
-    "EGBN",
-    "EGHT",
-    "EH",
-    "EHGO",
-    "EHLS",
-    "EHTH",
-    "EJH",
-    "EKG",
-    "EKSO",
-    "ELAB",
-    "ELBM",
-    "ELDN",
-    "ELEV",
-    "ELSE",
-    "ELTK",
-    "ELTX",
-    "ELUT",
-    "ELVA",
-    "ELVN",
-    "ELWS",
-    "EM",
-    "EMB",
-    "EMBC",
-    "EMCB",
-    "EMCG",
-    "EMCGR",
-    "EMCGU",
-    "EMCGW",
-    "EMEQ",
-    "EMIF",
-    "EMKR",
-    "EML",
-    "EMXC",
-    "EMXF",
-    "ENG",
-    "ENGN",
-    "ENGNW",
-    "ENLT",
-    "ENLV",
-    "ENPH",
-    "ENSC",
-    "ENSG",
-    "ENTA",
-    "ENTG",
-    "ENTO",
-    "ENTX",
-    "ENVB",
-    "ENVX",
-    "ENZL",
-    "EOLS",
-    "EOSE",
-    "EOSEW",
-    "EPIX",
-    "EPOW",
-    "EPRX",
-    "EPSN",
-    "EQ",
-    "EQIX",
-    "EQRR",
-    "ERAS",
-    "ERET",
-    "ERIC",
-    "ERIE",
-    "ERII",
-    "ERNA",
-    "ERNZ",
-    "ESCA",
-    "ESEA",
-    "ESGD",
-    "ESGE",
-    "ESGL",
-    "ESGLW",
-    "ESGR",
-    "ESGRO",
-    "ESGRP",
-    "ESGU",
-    "ESHA",
-    "ESHAR",
-    "ESLA",
-    "ESLAW",
-    "ESLT",
-    "ESMV",
-    "ESN",
-    "ESOA",
-    "ESPO",
-    "ESPR",
-    "ESQ",
-    "ESSA",
-    "ESTA",
-    "ETEC",
-    "ETHA",
-    "ETNB",
-    "ETON",
-    "ETSY",
-    "EU",
-    "EUDA",
-    "EUDAW",
-    "EUFN",
-    "EURK",
-    "EURKR",
-    "EURKU",
-    "EVAX",
-    "EVCM",
-    "EVER",
-    "EVGN",
-    "EVGO",
-    "EVGOW",
-    "EVGR",
-    "EVGRU",
-    "EVGRW",
-    "EVLV",
-    "EVLVW",
-    "EVMT",
-    "EVO",
-    "EVOK",
-    "EVRG",
-    "EVSD",
-    "EVTV",
-    "EWBC",
-    "EWCZ",
-    "EWJV",
-    "EWTX",
-    "EWZS",
-    "EXAI",
-    "EXAS",
-    "EXC",
-    "EXE",
-    "EXEEL",
-    "EXEEW",
-    "EXEEZ",
-    "EXEL",
-    "EXFY",
-    "EXLS",
-    "EXPE",
-    "EXPI",
-    "EXPO",
-    "EXTR",
-    "EYE",
-    "EYEG",
-    "EYEN",
-    "EYPT",
-    "EZFL",
-    "EZGO",
-    "EZPW",
-    "FA",
-    "FAAR",
-    "FAAS",
-    "FAASW",
-    "FAB",
-    "FAD",
-    "FALN",
-    "FAMI",
-    "FANG",
-    "FARM",
-    "FARO",
-    "FAST",
-    "FAT",
-    "FATBB",
-    "FATBP",
-    "FATBW",
-    "FATE",
-    "FBIO",
-    "FBIOP",
-    "FBIZ",
-    "FBL",
-    "FBLA",
-    "FBLG",
-    "FBNC",
-    "FBOT",
-    "FBRX",
-    "FBYD",
-    "FBYDW",
-    "FBZ",
-    "FCA",
-    "FCAL",
-    "FCAP",
-    "FCBC",
-    "FCCO",
-    "FCEF",
-    "FCEL",
-    "FCFS",
-    "FCNCA",
-    "FCNCO",
-    "FCNCP",
-    "FCTE",
-    "FCUV",
-    "FCVT",
-    "FDBC",
-    "FDCF",
-    "FDFF",
-    "FDIF",
-    "FDIG",
-    "FDIV",
-    "FDMT",
-    "FDNI",
-    "FDSB",
-    "FDT",
-    "FDTS",
-    "FDTX",
-    "FDUS",
-    "FEAM",
-    "FEBO",
-    "FEIM",
-    "FELE",
-    "FEM",
-    "FEMB",
-    "FEMS",
-    "FEMY",
-    "FENC",
-    "FEP",
-    "FEPI",
-    "FER",
-    "FEUZ",
-    "FEX",
-    "FFBC",
-    "FFIC",
-    "FFIE",
-    "FFIEW",
-    "FFIN",
-    "FFIV",
-    "FFNW",
-    "FGBI",
-    "FGBIP",
-    "FGEN",
-    "FGF",
-    "FGFPP",
-    "FGI",
-    "FGIWW",
-    "FGL",
-    "FGM",
-    "FHB",
-    "FHTX",
-    "FIBK",
-    "FICS",
-    "FID",
-    "FINE",
-    "FINW",
-    "FINX",
-    "FIP",
-    "FISI",
-    "FITB",
-    "FITBI",
-    "FITBO",
-    "FITBP",
-    "FIVE",
-    "FIVN",
-    "FIXD",
-    "FIZZ",
-    "FJP",
-    "FKU",
-    "FKWL",
-    "FLD",
-    "FLDB",
-    "FLDDU",
-    "FLDDW",
-    "FLEX",
-    "FLGC",
-    "FLGT",
-    "FLIC",
-    "FLL",
-    "FLN",
-    "FLNC",
-    "FLNT",
-    "FLUX",
-    "FLWS",
-    "FLX",
-    "FLXS",
-    "FLYE",
-    "FLYW",
-    "FMAO",
-    "FMB",
-    "FMBH",
-    "FMED",
-    "FMET",
-    "FMHI",
-    "FMNB",
-    "FMST",
-    "FMSTW",
-    "FNGR",
-    "FNK",
-    "FNKO",
-    "FNLC",
-    "FNWB",
-    "FNWD",
-    "FNX",
-    "FNY",
-    "FOLD",
-    "FONR",
-    "FORA",
-    "FORD",
-    "FORL",
-    "FORLU",
-    "FORLW",
-    "FORM",
-    "FORR",
-    "FORTY",
-    "FOSL",
-    "FOSLL",
-    "FOX",
-    "FOXA",
-    "FOXF",
-    "FOXX",
-    "FOXXW",
-    "FPA",
-    "FPAY",
-    "FPXE",
-    "FPXI",
-    "FRAF",
-    "FRBA",
-    "FRES",
-    "FRGT",
-    "FRHC",
-    "FRME",
-    "FRMEP",
-    "FROG",
-    "FRPH",
-    "FRPT",
-    "FRSH",
-    "FRST",
-    "FRSX",
-    "FSBC",
-    "FSBW",
-    "FSCS",
-    "FSEA",
-    "FSFG",
-    "FSHP",
-    "FSHPR",
-    "FSHPU",
-    "FSLR",
-    "FSTR",
-    "FSUN",
-    "FSV",
-    "FSZ",
-    "FTA",
-    "FTAG",
-    "FTAI",
-    "FTAIM",
-    "FTAIN",
-    "FTAIO",
-    "FTC",
-    "FTCI",
-    "FTCS",
-    "FTDR",
-    "FTDS",
-    "FTEK",
-    "FTEL",
-    "FTFT",
-    "FTGC",
-    "FTGS",
-    "FTHI",
-    "FTHM",
-    "FTII",
-    "FTIIU",
-    "FTIIW",
-    "FTLF",
-    "FTNT",
-    "FTQI",
-    "FTRE",
-    "FTRI",
-    "FTSL",
-    "FTSM",
-    "FTXG",
-    "FTXH",
-    "FTXL",
-    "FTXN",
-    "FTXO",
-    "FTXR",
-    "FUFU",
-    "FUFUW",
-    "FULC",
-    "FULT",
-    "FULTP",
-    "FUNC",
-    "FUND",
-    "FUSB",
-    "FUTU",
-    "FV",
-    "FVC",
-    "FVCB",
-    "FVN",
-    "FVNNR",
-    "FVNNU",
-    "FWONA",
-    "FWONK",
-    "FWRD",
-    "FWRG",
-    "FXNC",
-    "FYBR",
-    "FYC",
-    "FYT",
-    "FYX",
-    "GABC",
-    "GAIA",
-    "GAIN",
-    "GAINL",
-    "GAINN",
-    "GAINZ",
-    "GALT",
-    "GAMB",
-    "GAME",
-    "GAN",
-    "GANX",
-    "GASS",
-    "GATE",
-    "GATEU",
-    "GATEW",
-    "GAUZ",
-    "GBBK",
-    "GBBKR",
-    "GBBKW",
-    "GBDC",
-    "GBIO",
-    "GCBC",
-    "GCMG",
-    "GCMGW",
-    "GCT",
-    "GCTK",
-    "GDC",
-    "GDEN",
-    "GDEV",
-    "GDEVW",
-    "GDHG",
-    "GDRX",
-    "GDS",
-    "GDST",
-    "GDSTR",
-    "GDSTU",
-    "GDSTW",
-    "GDTC",
-    "GDYN",
-    "GECC",
-    "GECCH",
-    "GECCI",
-    "GECCO",
-    "GECCZ",
-    "GEG",
-    "GEGGL",
-    "GEHC",
-    "GELS",
-    "GEN",
-    "GENE",
-    "GENK",
-    "GEOS",
-    "GERN",
-    "GEVO",
-    "GFAI",
-    "GFAIW",
-    "GFGF",
-    "GFS",
-    "GGAL",
-    "GGLL",
-    "GGLS",
-    "GGR",
-    "GGROW",
-    "GH",
-    "GHIX",
-    "GHIXU",
-    "GHIXW",
-    "GHRS",
-    "GIFI",
-    "GIFT",
-    "GIG",
-    "GIGGU",
-    "GIGGW",
-    "GIGM",
-    "GIII",
-    "GILD",
-    "GILT",
-    "GINX",
-    "GIPR",
-    "GIPRW",
-    "GLAC",
-    "GLACR",
-    "GLACU",
-    "GLAD",
-    "GLADZ",
-    "GLBE",
-    "GLBS",
-    "GLBZ",
-    "GLDD",
-    "GLDI",
-    "GLE",
-    "GLLI",
-    "GLLIR",
-    "GLLIU",
-    "GLLIW",
-    "GLMD",
-    "GLNG",
-    "GLOW",
-    "GLPG",
-    "GLPI",
-    "GLRE",
-    "GLSI",
-    "GLST",
-    "GLSTR",
-    "GLSTU",
-    "GLSTW",
-    "GLTO",
-    "GLUE",
-    "GLXG",
-    "GLYC",
-    "GMAB",
-    "GMGI",
-    "GMM",
-    "GNFT",
-    "GNLN",
-    "GNLX",
-    "GNMA",
-    "GNOM",
-    "GNPX",
-    "GNSS",
-    "GNTA",
-    "GNTX",
-    "GO",
-    "GOCO",
-    "GODN",
-    "GODNR",
-    "GODNU",
-    "GOEV",
-    "GOEVW",
-    "GOGL",
-    "GOGO",
-    "GOOD",
-    "GOODN",
-    "GOODO",
-    "GOOG",
-    "GOOGL",
-    "GORV",
-    "GOSS",
-    "GOVI",
-    "GOVX",
-    "GOVXW",
-    "GP",
-    "GPAT",
-    "GPATU",
-    "GPATW",
-    "GPCR",
-    "GPIQ",
-    "GPIX",
-    "GPRE",
-    "GPRF",
-    "GPRO",
-    "GQQQ",
-    "GRAB",
-    "GRABW",
-    "GRAL",
-    "GRCE",
-    "GREE",
-    "GREEL",
-    "GRFS",
-    "GRI",
-    "GRID",
-    "GRNQ",
-    "GROW",
-    "GRPN",
-    "GRRR",
-    "GRRRW",
-    "GRVY",
-    "GRWG",
-    "GRYP",
-    "GSBC",
-    "GSHD",
-    "GSIB",
-    "GSIT",
-    "GSIW",
-    "GSM",
-    "GSMGW",
-    "GSRTU",
-    "GSUN",
-    "GT",
-    "GTBP",
-    "GTEC",
-    "GTI",
-    "GTIM",
-    "GTLB",
-    "GTR",
-    "GTX",
-    "GURE",
-    "GUTS",
-    "GV",
-    "GVH",
-    "GWAV",
-    "GWRS",
-    "GXAI",
-    "GXTG",
-    "GYRE",
-    "GYRO",
-    "HAFC",
-    "HAIA",
-    "HAIAU",
-    "HAIAW",
-    "HAIN",
-    "HALO",
-    "HAO",
-    "HAS",
-    "HAYN",
-    "HBAN",
-    "HBANL",
-    "HBANM",
-    "HBANP",
-    "HBCP",
-    "HBIO",
-    "HBNC",
-    "HBT",
-    "HCAT",
-    "HCKT",
-    "HCM",
-    "HCOW",
-    "HCP",
-    "HCSG",
-    "HCTI",
-    "HCVI",
-    "HCVIU",
-    "HCVIW",
-    "HCWB",
-    "HDL",
-    "HDSN",
-    "HEAR",
-    "HECO",
-    "HEES",
-    "HEJD",
-    "HELE",
-    "HEPA",
-    "HEPS",
-    "HERD",
-    "HERO",
-    "HFBL",
-    "HFFG",
-    "HFSP",
-    "HFWA",
-    "HGBL",
-    "HHS",
-    "HIDE",
-    "HIFS",
-    "HIHO",
-    "HIMX",
-    "HISF",
-    "HITI",
-    "HIVE",
-    "HKIT",
-    "HLAL",
-    "HLIT",
-    "HLMN",
-    "HLNE",
-    "HLP",
-    "HLVX",
-    "HLXB",
-    "HMST",
-    "HNDL",
-    "HNNA",
-    "HNNAZ",
-    "HNRG",
-    "HNST",
-    "HNVR",
-    "HOFT",
-    "HOFV",
-    "HOFVW",
-    "HOLO",
-    "HOLOW",
-    "HOLX",
-    "HON",
-    "HOND",
-    "HONDU",
-    "HONDW",
-    "HONE",
-    "HOOD",
-    "HOOK",
-    "HOPE",
-    "HOTH",
-    "HOUR",
-    "HOVNP",
-    "HOVR",
-    "HOVRW",
-    "HOWL",
-    "HPAI",
-    "HPAIW",
-    "HPH",
-    "HPK",
-    "HPKEW",
-    "HQGO",
-    "HQI",
-    "HQY",
-    "HRMY",
-    "HROW",
-    "HROWL",
-    "HROWM",
-    "HRTS",
-    "HRTX",
-    "HRYU",
-    "HRZN",
-    "HSAI",
-    "HSCS",
-    "HSCSW",
-    "HSDT",
-    "HSIC",
-    "HSII",
-    "HSON",
-    "HSPO",
-    "HSPOR",
-    "HSPOU",
-    "HSPOW",
-    "HSPTU",
-    "HST",
-    "HSTM",
-    "HTBI",
-    "HTBK",
-    "HTCO",
-    "HTCR",
-    "HTHT",
-    "HTIA",
-    "HTIBP",
-    "HTLD",
-    "HTLF",
-    "HTLFP",
-    "HTLM",
-    "HTOO",
-    "HTOOW",
-    "HTZ",
-    "HTZWW",
-    "HUBC",
-    "HUBCW",
-    "HUBCZ",
-    "HUBG",
-    "HUDA",
-    "HUDAR",
-    "HUDAU",
-    "HUDI",
-    "HUHU",
-    "HUIZ",
-    "HUMA",
-    "HUMAW",
-    "HURA",
-    "HURC",
-    "HURN",
-    "HUT",
-    "HWAY",
-    "HWBK",
-    "HWC",
-    "HWCPZ",
-    "HWH",
-    "HWKN",
-    "HYBI",
-    "HYDR",
-    "HYFM",
-    "HYLS",
-    "HYMC",
-    "HYMCL",
-    "HYMCW",
-    "HYPR",
-    "HYXF",
-    "HYZD",
-    "HYZN",
-    "HYZNW",
-    "IAC",
-    "IART",
-    "IAS",
-    "IBAC",
-    "IBACR",
-    "IBAT",
-    "IBB",
-    "IBBQ",
-    "IBCP",
-    "IBEX",
-    "IBG",
-    "IBGA",
-    "IBGK",
-    "IBIT",
-    "IBKR",
-    "IBOC",
-    "IBOT",
-    "IBRX",
-    "IBTE",
-    "IBTF",
-    "IBTG",
-    "IBTH",
-    "IBTI",
-    "IBTJ",
-    "IBTK",
-    "IBTL",
-    "IBTM",
-    "IBTO",
-    "IBTP",
-    "IBTX",
-    "ICAD",
-    "ICCC",
-    "ICCH",
-    "ICCM",
-    "ICCT",
-    "ICFI",
-    "ICG",
-    "ICHR",
-    "ICLK",
-    "ICLN",
-    "ICLR",
-    "ICMB",
-    "ICON",
-    "ICOP",
-    "ICU",
-    "ICUCW",
-    "ICUI",
-    "IDAI",
-    "IDCC",
-    "IDN",
-    "IDXX",
-    "IDYA",
-    "IEF",
-    "IEI",
-    "IEP",
-    "IESC",
-    "IEUS",
-    "IFBD",
-    "IFGL",
-    "IFRX",
-    "IFV",
-    "IGF",
-    "IGIB",
-    "IGIC",
-    "IGMS",
-    "IGOV",
-    "IGSB",
-    "IGTA",
-    "IGTAR",
-    "IGTAU",
-    "IGTAW",
-    "IHRT",
-    "IHYF",
-    "III",
-    "IIIV",
-    "IINN",
-    "IINNW",
-    "IJT",
-    "IKNA",
-    "IKT",
-    "ILAG",
-    "ILIT",
-    "ILLR",
-    "ILLRW",
-    "ILMN",
-    "ILPT",
-    "IMAB",
-    "IMCC",
-    "IMCR",
-    "IMCV",
-    "IMG",
-    "IMKTA",
-    "IMMP",
-    "IMMR",
-    "IMMX",
-    "IMNM",
-    "IMNN",
-    "IMOM",
-    "IMOS",
-    "IMPP",
-    "IMPPP",
-    "IMRN",
-    "IMRX",
-    "IMTE",
-    "IMTX",
-    "IMTXW",
-    "IMUX",
-    "IMVT",
-    "IMXI",
-    "INAB",
-    "INAQ",
-    "INAQU",
-    "INAQW",
-    "INBK",
-    "INBKZ",
-    "INBS",
-    "INBX",
-    "INCR",
-    "INCY",
-    "INDB",
-    "INDH",
-    "INDI",
-    "INDP",
-    "INDV",
-    "INDY",
-    "INFN",
-    "INFR",
-    "INGN",
-    "INHD",
-    "INKT",
-    "INM",
-    "INMB",
-    "INMD",
-    "INNV",
-    "INO",
-    "INOD",
-    "INRO",
-    "INSE",
-    "INSG",
-    "INSM",
-    "INTA",
-    "INTC",
-    "INTG",
-    "INTJ",
-    "INTR",
-    "INTS",
-    "INTU",
-    "INTZ",
-    "INV",
-    "INVA",
-    "INVE",
-    "INVZ",
-    "INVZW",
-    "INZY",
-    "IOBT",
-    "IONR",
-    "IONS",
-    "IOSP",
-    "IOVA",
-    "IPA",
-    "IPAR",
-    "IPDN",
-    "IPGP",
-    "IPHA",
-    "IPKW",
-    "IPSC",
-    "IPW",
-    "IPWR",
-    "IPX",
-    "IPXX",
-    "IPXXU",
-    "IPXXW",
-    "IQ",
-    "IQQQ",
-    "IRBT",
-    "IRD",
-    "IRDM",
-    "IREN",
-    "IRIX",
-    "IRMD",
-    "IROH",
-    "IROHR",
-    "IROHU",
-    "IROHW",
-    "IRON",
-    "IROQ",
-    "IRTC",
-    "IRWD",
-    "ISHG",
-    "ISHP",
-    "ISPC",
-    "ISPO",
-    "ISPOW",
-    "ISPR",
-    "ISRG",
-    "ISRL",
-    "ISRLU",
-    "ISRLW",
-    "ISSC",
-    "ISTB",
-    "ISTR",
-    "ITCI",
-    "ITIC",
-    "ITOS",
-    "ITRI",
-    "ITRM",
-    "ITRN",
-    "IUS",
-    "IUSB",
-    "IUSG",
-    "IUSV",
-    "IVA",
-    "IVAC",
-    "IVAL",
-    "IVCA",
-    "IVCAU",
-    "IVCAW",
-    "IVCB",
-    "IVCBU",
-    "IVCBW",
-    "IVCP",
-    "IVCPU",
-    "IVCPW",
-    "IVDA",
-    "IVDAW",
-    "IVEG",
-    "IVP",
-    "IVVD",
-    "IWTR",
-    "IXHL",
-    "IXUS",
-    "IZEA",
-    "IZM",
-    "IZTC",
-    "JACK",
-    "JAGX",
-    "JAKK",
-    "JAMF",
-    "JANX",
-    "JAZZ",
-    "JBDI",
-    "JBHT",
-    "JBLU",
-    "JBSS",
-    "JCSE",
-    "JCTC",
-    "JD",
-    "JDOC",
-    "JDZG",
-    "JEPQ",
-    "JFBR",
-    "JFBRW",
-    "JFIN",
-    "JFU",
-    "JG",
-    "JGLO",
-    "JIVE",
-    "JJSF",
-    "JKHY",
-    "JL",
-    "JMID",
-    "JMSB",
-    "JNVR",
-    "JOUT",
-    "JPEF",
-    "JRSH",
-    "JRVR",
-    "JSM",
-    "JSMD",
-    "JSML",
-    "JSPR",
-    "JSPRW",
-    "JTAI",
-    "JTEK",
-    "JUNE",
-    "JVA",
-    "JVSA",
-    "JVSAR",
-    "JVSAU",
-    "JWEL",
-    "JXJT",
-    "JYD",
-    "JYNT",
-    "JZ",
-    "JZXN",
-    "KACL",
-    "KACLR",
-    "KACLU",
-    "KACLW",
-    "KALA",
-    "KALU",
-    "KALV",
-    "KARO",
-    "KAVL",
-    "KBWB",
-    "KBWD",
-    "KBWP",
-    "KBWR",
-    "KBWY",
-    "KC",
-    "KDLY",
-    "KDLYW",
-    "KDP",
-    "KE",
-    "KEAT",
-    "KELYA",
-    "KELYB",
-    "KEQU",
-    "KFFB",
-    "KGEI",
-    "KHC",
-    "KIDS",
-    "KINS",
-    "KIRK",
-    "KITT",
-    "KITTW",
-    "KLAC",
-    "KLIC",
-    "KLTO",
-    "KLTOW",
-    "KLTR",
-    "KLXE",
-    "KMDA",
-    "KNDI",
-    "KNGZ",
-    "KNSA",
-    "KOD",
-    "KOPN",
-    "KOSS",
-    "KPLT",
-    "KPLTW",
-    "KPRX",
-    "KPTI",
-    "KQQQ",
-    "KRKR",
-    "KRMA",
-    "KRMD",
-    "KRNT",
-    "KRNY",
-    "KRON",
-    "KROP",
-    "KROS",
-    "KRRO",
-    "KRT",
-    "KRUS",
-    "KRYS",
-    "KSCP",
-    "KSPI",
-    "KTCC",
-    "KTOS",
-    "KTTA",
-    "KTTAW",
-    "KURA",
-    "KVAC",
-    "KVACU",
-    "KVACW",
-    "KVHI",
-    "KWE",
-    "KWESW",
-    "KXIN",
-    "KYMR",
-    "KYTX",
-    "KZIA",
-    "KZR",
-    "LAB",
-    "LAES",
-    "LAKE",
-    "LAMR",
-    "LANC",
-    "LAND",
-    "LANDM",
-    "LANDO",
-    "LANDP",
-    "LARK",
-    "LASE",
-    "LASR",
-    "LATG",
-    "LATGU",
-    "LAUR",
-    "LAZR",
-    "LBGJ",
-    "LBPH",
-    "LBRDA",
-    "LBRDK",
-    "LBRDP",
-    "LBTYA",
-    "LBTYB",
-    "LBTYK",
-    "LCDS",
-    "LCFY",
-    "LCFYW",
-    "LCID",
-    "LCNB",
-    "LCUT",
-    "LDEM",
-    "LDSF",
-    "LDTC",
-    "LDTCW",
-    "LDWY",
-    "LE",
-    "LECO",
-    "LEDS",
-    "LEE",
-    "LEGH",
-    "LEGN",
-    "LEGR",
-    "LENZ",
-    "LESL",
-    "LEXX",
-    "LEXXW",
-    "LFCR",
-    "LFLY",
-    "LFLYW",
-    "LFMD",
-    "LFMDP",
-    "LFSC",
-    "LFST",
-    "LFUS",
-    "LFVN",
-    "LFWD",
-    "LGCB",
-    "LGCL",
-    "LGHL",
-    "LGHLW",
-    "LGIH",
-    "LGMK",
-    "LGND",
-    "LGO",
-    "LGRO",
-    "LGTY",
-    "LGVN",
-    "LI",
-    "LICN",
-    "LIDR",
-    "LIDRW",
-    "LIEN",
-    "LIF",
-    "LIFW",
-    "LIFWW",
-    "LIFWZ",
-    "LILA",
-    "LILAK",
-    "LIN",
-    "LINC",
-    "LIND",
-    "LINE",
-    "LINK",
-    "LION",
-    "LIPO",
-    "LIQT",
-    "LITE",
-    "LITM",
-    "LITP",
-    "LIVE",
-    "LIVN",
-    "LIVR",
-    "LIXT",
-    "LIXTW",
-    "LKCO",
-    "LKFN",
-    "LKQ",
-    "LLYVA",
-    "LLYVK",
-    "LMAT",
-    "LMB",
-    "LMBS",
-    "LMFA",
-    "LMNR",
-    "LNKB",
-    "LNSR",
-    "LNT",
-    "LNTH",
-    "LNW",
-    "LNZA",
-    "LNZAW",
-    "LOAN",
-    "LOBO",
-    "LOCO",
-    "LOGC",
-    "LOGI",
-    "LOOP",
-    "LOPE",
-    "LOT",
-    "LOTWW",
-    "LOVE",
-    "LPAA",
-    "LPAAU",
-    "LPAAW",
-    "LPBBU",
-    "LPCN",
-    "LPLA",
-    "LPRO",
-    "LPSN",
-    "LPTH",
-    "LPTX",
-    "LQDA",
-    "LQDT",
-    "LQR",
-    "LRCX",
-    "LRE",
-    "LRFC",
-    "LRGE",
-    "LRHC",
-    "LRMR",
-    "LRND",
-    "LSAK",
-    "LSB",
-    "LSBK",
-    "LSBPW",
-    "LSCC",
-    "LSEA",
-    "LSEAW",
-    "LSH",
-    "LSTA",
-    "LSTR",
-    "LTBR",
-    "LTRN",
-    "LTRX",
-    "LTRY",
-    "LTRYW",
-    "LUCD",
-    "LUCY",
-    "LUCYW",
-    "LULU",
-    "LUMO",
-    "LUNA",
-    "LUNG",
-    "LUNR",
-    "LUNRW",
-    "LUXH",
-    "LUXHP",
-    "LVHD",
-    "LVLU",
-    "LVO",
-    "LVRO",
-    "LVROW",
-    "LVTX",
-    "LWAY",
-    "LWLG",
-    "LX",
-    "LXEH",
-    "LXEO",
-    "LXRX",
-    "LYEL",
-    "LYFT",
-    "LYRA",
-    "LYT",
-    "LYTS",
-    "LZ",
-    "MACI",
-    "MACIU",
-    "MACIW",
-    "MAGQ",
-    "MAGS",
-    "MAGX",
-    "MAMA",
-    "MAMO",
-    "MANH",
-    "MAPS",
-    "MAPSW",
-    "MAR",
-    "MARA",
-    "MARPS",
-    "MARX",
-    "MARXR",
-    "MARXU",
-    "MASI",
-    "MASS",
-    "MAT",
-    "MATH",
-    "MATW",
-    "MAXI",
-    "MAXN",
-    "MAYS",
-    "MBAV",
-    "MBAVU",
-    "MBAVW",
-    "MBB",
-    "MBCN",
-    "MBIN",
-    "MBINM",
-    "MBINN",
-    "MBINO",
-    "MBIO",
-    "MBLY",
-    "MBNKP",
-    "MBOT",
-    "MBRX",
-    "MBUU",
-    "MBWM",
-    "MBX",
-    "MCAG",
-    "MCAGR",
-    "MCAGU",
-    "MCBS",
-    "MCDS",
-    "MCFT",
-    "MCHI",
-    "MCHP",
-    "MCHS",
-    "MCHX",
-    "MCRB",
-    "MCRI",
-    "MCSE",
-    "MCVT",
-    "MDAI",
-    "MDAIW",
-    "MDB",
-    "MDBH",
-    "MDCP",
-    "MDCX",
-    "MDCXW",
-    "MDGL",
-    "MDIA",
-    "MDIV",
-    "MDJH",
-    "MDLZ",
-    "MDRR",
-    "MDRRP",
-    "MDWD",
-    "MDXG",
-    "MDXH",
-    "ME",
-    "MEDP",
-    "MEDX",
-    "MEGL",
-    "MEIP",
-    "MELI",
-    "MEMS",
-    "MEOH",
-    "MERC",
-    "MESA",
-    "MESO",
-    "META",
-    "METC",
-    "METCB",
-    "METCL",
-    "METD",
-    "METU",
-    "MFH",
-    "MFI",
-    "MFIC",
-    "MFICL",
-    "MFIN",
-    "MFLX",
-    "MGEE",
-    "MGIC",
-    "MGIH",
-    "MGNI",
-    "MGNX",
-    "MGOL",
-    "MGPI",
-    "MGRC",
-    "MGRM",
-    "MGRX",
-    "MGTX",
-    "MGX",
-    "MGYR",
-    "MHLD",
-    "MHUA",
-    "MIDD",
-    "MIGI",
-    "MILN",
-    "MIND",
-    "MIRA",
-    "MIRM",
-    "MIST",
-    "MITA",
-    "MITAU",
-    "MITAW",
-    "MITK",
-    "MKAM",
-    "MKDW",
-    "MKDWW",
-    "MKSI",
-    "MKTW",
-    "MKTX",
-    "MKZR",
-    "MLAB",
-    "MLCO",
-    "MLEC",
-    "MLECW",
-    "MLGO",
-    "MLKN",
-    "MLTX",
-    "MLYS",
-    "MMLP",
-    "MMSI",
-    "MMV",
-    "MMVWW",
-    "MMYT",
-    "MNDO",
-    "MNDR",
-    "MNDY",
-    "MNKD",
-    "MNMD",
-    "MNOV",
-    "MNPR",
-    "MNRO",
-    "MNSB",
-    "MNSBP",
-    "MNST",
-    "MNTK",
-    "MNTL",
-    "MNTS",
-    "MNTSW",
-    "MNTX",
-    "MNY",
-    "MNYWW",
-    "MOB",
-    "MOBBW",
-    "MOBX",
-    "MOBXW",
-    "MODD",
-    "MODL",
-    "MODV",
-    "MOFG",
-    "MOGO",
-    "MOLN",
-    "MOMO",
-    "MOND",
-    "MOOD",
-    "MORN",
-    "MOVE",
-    "MPAA",
-    "MPB",
-    "MPWR",
-    "MQ",
-    "MQQQ",
-    "MRAM",
-    "MRBK",
-    "MRCC",
-    "MRCY",
-    "MREO",
-    "MRIN",
-    "MRKR",
-    "MRM",
-    "MRNA",
-    "MRNO",
-    "MRNOW",
-    "MRNS",
-    "MRSN",
-    "MRTN",
-    "MRUS",
-    "MRVI",
-    "MRVL",
-    "MRX",
-    "MSAI",
-    "MSAIW",
-    "MSBI",
-    "MSBIP",
-    "MSEX",
-    "MSFD",
-    "MSFL",
-    "MSFT",
-    "MSFU",
-    "MSGM",
-    "MSS",
-    "MSSA",
-    "MSSAR",
-    "MSSAU",
-    "MSSAW",
-    "MSTR",
-    "MSTX",
-    "MTC",
-    "MTCH",
-    "MTEK",
-    "MTEKW",
-    "MTEM",
-    "MTEN",
-    "MTEX",
-    "MTLS",
-    "MTRX",
-    "MTSI",
-    "MTTR",
-    "MU",
-    "MUD",
-    "MULL",
-    "MULN",
-    "MURA",
-    "MUU",
-    "MVBF",
-    "MVIS",
-    "MVST",
-    "MVSTW",
-    "MXCT",
-    "MXL",
-    "MYCF",
-    "MYCG",
-    "MYCH",
-    "MYCI",
-    "MYCJ",
-    "MYCK",
-    "MYCL",
-    "MYCM",
-    "MYCN",
-    "MYFW",
-    "MYGN",
-    "MYMF",
-    "MYMG",
-    "MYMH",
-    "MYMI",
-    "MYMJ",
-    "MYNA",
-    "MYNZ",
-    "MYPS",
-    "MYPSW",
-    "MYRG",
-    "MYSZ",
-    "NAAS",
-    "NAII",
-    "NAMS",
-    "NAMSW",
-    "NAOV",
-    "NARI",
-    "NATH",
-    "NATO",
-    "NATR",
-    "NAUT",
-    "NAVI",
-    "NAYA",
-    "NB",
-    "NBBK",
-    "NBIS",
-    "NBIX",
-    "NBN",
-    "NBTB",
-    "NBTX",
-    "NCI",
-    "NCMI",
-    "NCNA",
-    "NCNC",
-    "NCNCW",
-    "NCNO",
-    "NCPB",
-    "NCPL",
-    "NCPLW",
-    "NCRA",
-    "NCSM",
-    "NCTY",
-    "NDAA",
-    "NDAQ",
-    "NDLS",
-    "NDRA",
-    "NDSN",
-    "NECB",
-    "NEGG",
-    "NEO",
-    "NEOG",
-    "NEON",
-    "NEOV",
-    "NEOVW",
-    "NEPH",
-    "NERD",
-    "NERV",
-    "NESR",
-    "NESRW",
-    "NETD",
-    "NETDU",
-    "NETDW",
-    "NEWT",
-    "NEWTG",
-    "NEWTH",
-    "NEWTI",
-    "NEWTZ",
-    "NEWZ",
-    "NEXN",
-    "NEXT",
-    "NFBK",
-    "NFE",
-    "NFLX",
-    "NFTY",
-    "NFXL",
-    "NFXS",
-    "NGNE",
-    "NHTC",
-    "NICE",
-    "NIKL",
-    "NIOBW",
-    "NIPG",
-    "NISN",
-    "NITO",
-    "NIU",
-    "NIVF",
-    "NIVFW",
-    "NIXT",
-    "NIXX",
-    "NIXXW",
-    "NKGN",
-    "NKGNW",
-    "NKLA",
-    "NKSH",
-    "NKTR",
-    "NKTX",
-    "NLSP",
-    "NLSPW",
-    "NMFC",
-    "NMFCZ",
-    "NMHI",
-    "NMHIW",
-    "NMIH",
-    "NMRA",
-    "NMRK",
-    "NMTC",
-    "NN",
-    "NNAVW",
-    "NNBR",
-    "NNDM",
-    "NNE",
-    "NNOX",
-    "NODK",
-    "NOTV",
-    "NOVT",
-    "NOVV",
-    "NOVVR",
-    "NOVVU",
-    "NOVVW",
-    "NPCE",
-    "NPFI",
-    "NRBO",
-    "NRC",
-    "NRDS",
-    "NRES",
-    "NRIM",
-    "NRIX",
-    "NRSN",
-    "NRSNW",
-    "NRXP",
-    "NRXPW",
-    "NSCR",
-    "NSI",
-    "NSIT",
-    "NSPR",
-    "NSSC",
-    "NSTS",
-    "NSYS",
-    "NTAP",
-    "NTCT",
-    "NTES",
-    "NTGR",
-    "NTIC",
-    "NTLA",
-    "NTNX",
-    "NTRA",
-    "NTRB",
-    "NTRBW",
-    "NTRP",
-    "NTRS",
-    "NTRSO",
-    "NTWK",
-    "NTWOU",
-    "NUKK",
-    "NUKKW",
-    "NURO",
-    "NUSB",
-    "NUTX",
-    "NUVL",
-    "NUWE",
-    "NVA",
-    "NVAC",
-    "NVACR",
-    "NVACW",
-    "NVAWW",
-    "NVAX",
-    "NVCR",
-    "NVCT",
-    "NVD",
-    "NVDA",
-    "NVDD",
-    "NVDL",
-    "NVDS",
-    "NVDU",
-    "NVDW",
-    "NVEC",
-    "NVEE",
-    "NVFY",
-    "NVMI",
-    "NVNI",
-    "NVNIW",
-    "NVNO",
-    "NVTS",
-    "NVVE",
-    "NVVEW",
-    "NVX",
-    "NWBI",
-    "NWE",
-    "NWFL",
-    "NWGL",
-    "NWL",
-    "NWPX",
-    "NWS",
-    "NWSA",
-    "NWTN",
-    "NWTNW",
-    "NXGL",
-    "NXGLW",
-    "NXL",
-    "NXLIW",
-    "NXPI",
-    "NXPL",
-    "NXPLW",
-    "NXST",
-    "NXT",
-    "NXTC",
-    "NXTG",
-    "NXTT",
-    "NXU",
-    "NYAX",
-    "NYMT",
-    "NYMTI",
-    "NYMTL",
-    "NYMTM",
-    "NYMTN",
-    "NYMTZ",
-    "NYXH",
-    "NZAC",
-    "NZUS",
-    "OABI",
-    "OABIW",
-    "OACCU",
-    "OAKU",
-    "OAKUR",
-    "OAKUU",
-    "OAKUW",
-    "OB",
-    "OBIL",
-    "OBIO",
-    "OBLG",
-    "OBT",
-    "OCC",
-    "OCCI",
-    "OCCIM",
-    "OCCIN",
-    "OCCIO",
-    "OCEA",
-    "OCEAW",
-    "OCFC",
-    "OCFCP",
-    "OCG",
-    "OCGN",
-    "OCS",
-    "OCSAW",
-    "OCSL",
-    "OCTA",
-    "OCTO",
-    "OCUL",
-    "OCX",
-    "ODD",
-    "ODDS",
-    "ODFL",
-    "ODP",
-    "ODVWZ",
-    "OESX",
-    "OFIX",
-    "OFLX",
-    "OFS",
-    "OFSSH",
-    "OGI",
-    "OKTA",
-    "OKUR",
-    "OKYO",
-    "OLB",
-    "OLED",
-    "OLLI",
-    "OLMA",
-    "OLPX",
-    "OM",
-    "OMAB",
-    "OMCC",
-    "OMCL",
-    "OMER",
-    "OMEX",
-    "OMGA",
-    "OMH",
-    "OMIC",
-    "ON",
-    "ONB",
-    "ONBPO",
-    "ONBPP",
-    "ONCO",
-    "ONCT",
-    "ONCY",
-    "ONDS",
-    "ONEQ",
-    "ONEW",
-    "ONFO",
-    "ONFOW",
-    "ONMD",
-    "ONMDW",
-    "ONVO",
-    "OP",
-    "OPAL",
-    "OPBK",
-    "OPCH",
-    "OPEN",
-    "OPHC",
-    "OPI",
-    "OPINL",
-    "OPK",
-    "OPOF",
-    "OPRA",
-    "OPRT",
-    "OPRX",
-    "OPT",
-    "OPTN",
-    "OPTX",
-    "OPTXW",
-    "OPTZ",
-    "OPXS",
-    "ORGN",
-    "ORGNW",
-    "ORGO",
-    "ORIC",
-    "ORIS",
-    "ORKA",
-    "ORKT",
-    "ORLY",
-    "ORMP",
-    "ORRF",
-    "OS",
-    "OSBC",
-    "OSIS",
-    "OSPN",
-    "OSS",
-    "OST",
-    "OSUR",
-    "OSW",
-    "OTEX",
-    "OTLK",
-    "OTLY",
-    "OTRK",
-    "OTTR",
-    "OVBC",
-    "OVID",
-    "OVLY",
-    "OXBR",
-    "OXBRW",
-    "OXLC",
-    "OXLCI",
-    "OXLCL",
-    "OXLCN",
-    "OXLCO",
-    "OXLCP",
-    "OXLCZ",
-    "OXSQ",
-    "OXSQG",
-    "OXSQZ",
-    "OZEM",
-    "OZK",
-    "OZKAP",
-    "PAA",
-    "PABD",
-    "PABU",
-    "PACB",
-    "PAGP",
-    "PAHC",
-    "PAL",
-    "PALI",
-    "PALT",
-    "PAMT",
-    "PANL",
-    "PANW",
-    "PARA",
-    "PARAA",
-    "PASG",
-    "PATK",
-    "PATN",
-    "PAVM",
-    "PAVMZ",
-    "PAVS",
-    "PAX",
-    "PAYO",
-    "PAYS",
-    "PAYX",
-    "PBBK",
-    "PBFS",
-    "PBHC",
-    "PBM",
-    "PBMWW",
-    "PBPB",
-    "PBYI",
-    "PC",
-    "PCAR",
-    "PCB",
-    "PCH",
-    "PCRX",
-    "PCSA",
-    "PCSC",
-    "PCT",
-    "PCTTU",
-    "PCTTW",
-    "PCTY",
-    "PCVX",
-    "PCYO",
-    "PDBA",
-    "PDBC",
-    "PDCO",
-    "PDD",
-    "PDEX",
-    "PDFS",
-    "PDLB",
-    "PDP",
-    "PDSB",
-    "PDYN",
-    "PDYNW",
-    "PEBK",
-    "PEBO",
-    "PECO",
-    "PEGA",
-    "PENG",
-    "PENN",
-    "PEP",
-    "PEPG",
-    "PEPS",
-    "PERI",
-    "PESI",
-    "PET",
-    "PETS",
-    "PETWW",
-    "PETZ",
-    "PEV",
-    "PEY",
-    "PEZ",
-    "PFBC",
-    "PFC",
-    "PFF",
-    "PFG",
-    "PFI",
-    "PFIE",
-    "PFIS",
-    "PFM",
-    "PFMT",
-    "PFTA",
-    "PFTAU",
-    "PFTAW",
-    "PFX",
-    "PFXNZ",
-    "PGC",
-    "PGEN",
-    "PGHL",
-    "PGJ",
-    "PGNY",
-    "PGY",
-    "PGYWW",
-    "PHAR",
-    "PHAT",
-    "PHIO",
-    "PHO",
-    "PHUN",
-    "PHVS",
-    "PI",
-    "PID",
-    "PIE",
-    "PIII",
-    "PIIIW",
-    "PIK",
-    "PINC",
-    "PIO",
-    "PIRS",
-    "PITA",
-    "PITAW",
-    "PIZ",
-    "PKBK",
-    "PKOH",
-    "PKW",
-    "PLAB",
-    "PLAO",
-    "PLAY",
-    "PLBC",
-    "PLBY",
-    "PLCE",
-    "PLL",
-    "PLMJ",
-    "PLMJU",
-    "PLMJW",
-    "PLMR",
-    "PLPC",
-    "PLRX",
-    "PLRZ",
-    "PLSE",
-    "PLTK",
-    "PLUG",
-    "PLUR",
-    "PLUS",
-    "PLXS",
-    "PLYA",
-    "PMAX",
-    "PMBS",
-    "PMCB",
-    "PMD",
-    "PMEC",
-    "PMN",
-    "PMTS",
-    "PMVP",
-    "PNBK",
-    "PNFP",
-    "PNFPP",
-    "PNQI",
-    "PNRG",
-    "PNTG",
-    "POAI",
-    "POCI",
-    "PODC",
-    "PODD",
-    "POET",
-    "POLA",
-    "POLE",
-    "POLEU",
-    "POLEW",
-    "POOL",
-    "POWI",
-    "POWL",
-    "POWW",
-    "POWWP",
-    "PPBI",
-    "PPBT",
-    "PPC",
-    "PPH",
-    "PPI",
-    "PPIH",
-    "PPSI",
-    "PPTA",
-    "PPYA",
-    "PPYAU",
-    "PPYAW",
-    "PRAA",
-    "PRAX",
-    "PRCH",
-    "PRCT",
-    "PRDO",
-    "PRE",
-    "PRENW",
-    "PRFX",
-    "PRFZ",
-    "PRGS",
-    "PRLD",
-    "PRLH",
-    "PRLHU",
-    "PRLHW",
-    "PRME",
-    "PRN",
-    "PROC",
-    "PROCW",
-    "PROF",
-    "PROK",
-    "PROP",
-    "PROV",
-    "PRPH",
-    "PRPL",
-    "PRPO",
-    "PRQR",
-    "PRSO",
-    "PRTA",
-    "PRTC",
-    "PRTG",
-    "PRTH",
-    "PRTS",
-    "PRVA",
-    "PRZO",
-    "PSC",
-    "PSCC",
-    "PSCD",
-    "PSCE",
-    "PSCF",
-    "PSCH",
-    "PSCI",
-    "PSCM",
-    "PSCT",
-    "PSCU",
-    "PSEC",
-    "PSET",
-    "PSHG",
-    "PSIG",
-    "PSL",
-    "PSMT",
-    "PSNL",
-    "PSNY",
-    "PSNYW",
-    "PSTR",
-    "PSTV",
-    "PSTX",
-    "PSWD",
-    "PT",
-    "PTC",
-    "PTCT",
-    "PTEC",
-    "PTEN",
-    "PTF",
-    "PTGX",
-    "PTH",
-    "PTHL",
-    "PTIR",
-    "PTIX",
-    "PTIXW",
-    "PTLE",
-    "PTLO",
-    "PTMN",
-    "PTNQ",
-    "PTON",
-    "PTPI",
-    "PTVE",
-    "PUBM",
-    "PUI",
-    "PULM",
-    "PVBC",
-    "PWM",
-    "PWOD",
-    "PWP",
-    "PWUP",
-    "PWUPU",
-    "PWUPW",
-    "PXI",
-    "PXLW",
-    "PXS",
-    "PXSAW",
-    "PY",
-    "PYCR",
-    "PYPD",
-    "PYPL",
-    "PYXS",
-    "PYZ",
-    "PZZA",
-    "QABA",
-    "QAT",
-    "QBUF",
-    "QCLN",
-    "QCLR",
-    "QCOM",
-    "QCRH",
-    "QDEL",
-    "QETA",
-    "QETAR",
-    "QETAU",
-    "QFIN",
-    "QH",
-    "QHDG",
-    "QIPT",
-    "QLGN",
-    "QLYS",
-    "QMCO",
-    "QMID",
-    "QMMM",
-    "QMOM",
-    "QNCX",
-    "QNRX",
-    "QNST",
-    "QNTM",
-    "QNXT",
-    "QOMO",
-    "QOMOR",
-    "QOMOU",
-    "QOMOW",
-    "QOWZ",
-    "QQA",
-    "QQEW",
-    "QQJG",
-    "QQMG",
-    "QQQ",
-    "QQQA",
-    "QQQE",
-    "QQQG",
-    "QQQI",
-    "QQQJ",
-    "QQQM",
-    "QQQP",
-    "QQQS",
-    "QQQT",
-    "QQQW",
-    "QQQX",
-    "QQQY",
-    "QQXT",
-    "QRHC",
-    "QRMI",
-    "QRTEA",
-    "QRTEB",
-    "QRTEP",
-    "QRVO",
-    "QSG",
-    "QSI",
-    "QSIAW",
-    "QSIX",
-    "QSML",
-    "QTEC",
-    "QTI",
-    "QTOP",
-    "QTR",
-    "QTRX",
-    "QTTB",
-    "QTUM",
-    "QUBT",
-    "QUIK",
-    "QURE",
-    "QVAL",
-    "QXO",
-    "QXQ",
-    "QYLD",
-    "QYLE",
-    "QYLG",
-    "RAIL",
-    "RAND",
-    "RANI",
-    "RAPP",
-    "RAPT",
-    "RARE",
-    "RAVE",
-    "RAY",
-    "RAYA",
-    "RAYS",
-    "RBB",
-    "RBBN",
-    "RBCAA",
-    "RBKB",
-    "RCAT",
-    "RCEL",
-    "RCKT",
-    "RCKTW",
-    "RCKY",
-    "RCM",
-    "RCMT",
-    "RCON",
-    "RDACU",
-    "RDCM",
-    "RDFN",
-    "RDHL",
-    "RDI",
-    "RDIB",
-    "RDNT",
-    "RDUS",
-    "RDVT",
-    "RDVY",
-    "RDWR",
-    "RDZN",
-    "RDZNW",
-    "REAI",
-    "REAL",
-    "REAX",
-    "REBN",
-    "RECT",
-    "REE",
-    "REFI",
-    "REFR",
-    "REG",
-    "REGCO",
-    "REGCP",
-    "REGN",
-    "REIT",
-    "REKR",
-    "RELI",
-    "RELIW",
-    "RELL",
-    "RELY",
-    "RENB",
-    "RENE",
-    "RENEU",
-    "RENEW",
-    "RENT",
-    "REPL",
-    "RETO",
-    "REVB",
-    "REVBW",
-    "REYN",
-    "RFAC",
-    "RFACR",
-    "RFACU",
-    "RFACW",
-    "RFAI",
-    "RFAIR",
-    "RFAIU",
-    "RFDI",
-    "RFEM",
-    "RFEU",
-    "RFIL",
-    "RGC",
-    "RGCO",
-    "RGEN",
-    "RGF",
-    "RGLD",
-    "RGLS",
-    "RGNX",
-    "RGP",
-    "RGS",
-    "RGTI",
-    "RGTIW",
-    "RICK",
-    "RIGL",
-    "RILY",
-    "RILYG",
-    "RILYK",
-    "RILYL",
-    "RILYM",
-    "RILYN",
-    "RILYP",
-    "RILYT",
-    "RILYZ",
-    "RIME",
-    "RING",
-    "RIOT",
-    "RITR",
-    "RIVN",
-    "RKDA",
-    "RKLB",
-    "RLAY",
-    "RLMD",
-    "RLYB",
-    "RMBI",
-    "RMBL",
-    "RMBS",
-    "RMCF",
-    "RMCO",
-    "RMCOW",
-    "RMNI",
-    "RMR",
-    "RMTI",
-    "RNA",
-    "RNAC",
-    "RNAZ",
-    "RNEM",
-    "RNEW",
-    "RNRG",
-    "RNSC",
-    "RNW",
-    "RNWWW",
-    "RNXT",
-    "ROAD",
-    "ROBT",
-    "ROCK",
-    "ROCL",
-    "ROCLU",
-    "ROCLW",
-    "ROE",
-    "ROIC",
-    "ROIV",
-    "ROKU",
-    "ROMA",
-    "ROOT",
-    "ROP",
-    "ROST",
-    "RPAY",
-    "RPD",
-    "RPID",
-    "RPRX",
-    "RPTX",
-    "RR",
-    "RRBI",
-    "RRGB",
-    "RRR",
-    "RSLS",
-    "RSSS",
-    "RSVR",
-    "RSVRW",
-    "RTC",
-    "RTH",
-    "RUM",
-    "RUMBW",
-    "RUN",
-    "RUNN",
-    "RUSHA",
-    "RUSHB",
-    "RVMD",
-    "RVMDW",
-    "RVNC",
-    "RVPH",
-    "RVPHW",
-    "RVSB",
-    "RVSN",
-    "RVSNW",
-    "RVYL",
-    "RWAY",
-    "RWAYL",
-    "RWAYZ",
-    "RXRX",
-    "RXST",
-    "RXT",
-    "RYAAY",
-    "RYTM",
-    "RZLT",
-    "RZLV",
-    "RZLVW",
-    "SABR",
-    "SABS",
-    "SABSW",
-    "SAFT",
-    "SAG",
-    "SAGE",
-    "SAIA",
-    "SAIC",
-    "SAIH",
-    "SAIHW",
-    "SAMG",
-    "SANA",
-    "SANG",
-    "SANM",
-    "SANW",
-    "SARK",
-    "SASR",
-    "SATL",
-    "SATLW",
-    "SATS",
-    "SAVA",
-    "SBAC",
-    "SBC",
-    "SBCF",
-    "SBCWW",
-    "SBET",
-    "SBFG",
-    "SBFM",
-    "SBFMW",
-    "SBGI",
-    "SBLK",
-    "SBRA",
-    "SBT",
-    "SBUX",
-    "SCDS",
-    "SCHL",
-    "SCKT",
-    "SCLX",
-    "SCLXW",
-    "SCNI",
-    "SCNX",
-    "SCOR",
-    "SCPH",
-    "SCSC",
-    "SCVL",
-    "SCWO",
-    "SCWX",
-    "SCYX",
-    "SCZ",
-    "SDA",
-    "SDAWW",
-    "SDG",
-    "SDGR",
-    "SDIG",
-    "SDOT",
-    "SDSI",
-    "SDST",
-    "SDSTW",
-    "SDVY",
-    "SEAT",
-    "SEATW",
-    "SEDG",
-    "SEED",
-    "SEEM",
-    "SEER",
-    "SEIC",
-    "SEIE",
-    "SEIS",
-    "SELF",
-    "SELX",
-    "SENEA",
-    "SENEB",
-    "SEPN",
-    "SERA",
-    "SERV",
-    "SETM",
-    "SEVN",
-    "SEZL",
-    "SFBC",
-    "SFHG",
-    "SFIX",
-    "SFLO",
-    "SFM",
-    "SFNC",
-    "SFST",
-    "SFWL",
-    "SGA",
-    "SGBX",
-    "SGC",
-    "SGD",
-    "SGHT",
-    "SGLY",
-    "SGMA",
-    "SGML",
-    "SGMO",
-    "SGMT",
-    "SGRP",
-    "SGRY",
-    "SHBI",
-    "SHC",
-    "SHEN",
-    "SHFS",
-    "SHFSW",
-    "SHIM",
-    "SHIP",
-    "SHLS",
-    "SHLT",
-    "SHMD",
-    "SHMDW",
-    "SHOO",
-    "SHOT",
-    "SHOTW",
-    "SHPH",
-    "SHRY",
-    "SHV",
-    "SHY",
-    "SHYF",
-    "SIBN",
-    "SIDU",
-    "SIEB",
-    "SIFY",
-    "SIGA",
-    "SIGI",
-    "SIGIP",
-    "SILC",
-    "SILO",
-    "SIMA",
-    "SIMAU",
-    "SIMAW",
-    "SIMO",
-    "SINT",
-    "SIRI",
-    "SISI",
-    "SITM",
-    "SIXG",
-    "SJ",
-    "SJCP",
-    "SJLD",
-    "SJW",
-    "SKGR",
-    "SKGRU",
-    "SKGRW",
-    "SKIN",
-    "SKK",
-    "SKOR",
-    "SKRE",
-    "SKWD",
-    "SKYE",
-    "SKYQ",
-    "SKYT",
-    "SKYU",
-    "SKYW",
-    "SKYX",
-    "SKYY",
-    "SLAB",
-    "SLDB",
-    "SLDP",
-    "SLDPW",
-    "SLE",
-    "SLGL",
-    "SLM",
-    "SLMBP",
-    "SLN",
-    "SLNG",
-    "SLNH",
-    "SLNHP",
-    "SLNO",
-    "SLP",
-    "SLQD",
-    "SLRC",
-    "SLRN",
-    "SLRX",
-    "SLS",
-    "SLVO",
-    "SLXN",
-    "SLXNW",
-    "SMBC",
-    "SMCF",
-    "SMCI",
-    "SMCO",
-    "SMCP",
-    "SMCX",
-    "SMH",
-    "SMHX",
-    "SMID",
-    "SMLR",
-    "SMMT",
-    "SMPL",
-    "SMRI",
-    "SMSI",
-    "SMST",
-    "SMTC",
-    "SMTI",
-    "SMTK",
-    "SMX",
-    "SMXT",
-    "SMXWW",
-    "SNAL",
-    "SNAX",
-    "SNAXW",
-    "SNBR",
-    "SNCR",
-    "SNCRL",
-    "SNCY",
-    "SND",
-    "SNDL",
-    "SNDX",
-    "SNES",
-    "SNEX",
-    "SNFCA",
-    "SNGX",
-    "SNOA",
-    "SNPS",
-    "SNPX",
-    "SNRE",
-    "SNSE",
-    "SNSR",
-    "SNT",
-    "SNTG",
-    "SNTI",
-    "SNY",
-    "SNYR",
-    "SOBR",
-    "SOCL",
-    "SOFI",
-    "SOGP",
-    "SOHO",
-    "SOHOB",
-    "SOHON",
-    "SOHOO",
-    "SOHU",
-    "SOND",
-    "SONDW",
-    "SONM",
-    "SONN",
-    "SONO",
-    "SOPA",
-    "SOPH",
-    "SOTK",
-    "SOUN",
-    "SOUNW",
-    "SOWG",
-    "SOXM",
-    "SOXQ",
-    "SOXW",
-    "SOXX",
-    "SPAI",
-    "SPAM",
-    "SPAQ",
-    "SPBC",
-    "SPC",
-    "SPCB",
-    "SPCX",
-    "SPFI",
-    "SPGC",
-    "SPHL",
-    "SPI",
-    "SPKL",
-    "SPKLU",
-    "SPKLW",
-    "SPNS",
-    "SPOK",
-    "SPPL",
-    "SPRB",
-    "SPRC",
-    "SPRO",
-    "SPRX",
-    "SPRY",
-    "SPSC",
-    "SPT",
-    "SPTN",
-    "SPWH",
-    "SPYB",
-    "SPYM",
-    "SPYQ",
-    "SQFT",
-    "SQFTP",
-    "SQFTW",
-    "SQLV",
-    "SQQQ",
-    "SRAD",
-    "SRBK",
-    "SRCE",
-    "SRDX",
-    "SRET",
-    "SRM",
-    "SRPT",
-    "SRRK",
-    "SRTS",
-    "SRZN",
-    "SRZNW",
-    "SSBI",
-    "SSBK",
-    "SSKN",
-    "SSNC",
-    "SSP",
-    "SSRM",
-    "SSSS",
-    "SSSSL",
-    "SSTI",
-    "SSYS",
-    "STAA",
-    "STAF",
-    "STBA",
-    "STBX",
-    "STCN",
-    "STEC",
-    "STEP",
-    "STFS",
-    "STGW",
-    "STHO",
-    "STI",
-    "STIM",
-    "STKH",
-    "STKL",
-    "STKS",
-    "STLD",
-    "STNE",
-    "STOK",
-    "STRA",
-    "STRL",
-    "STRM",
-    "STRO",
-    "STRR",
-    "STRRP",
-    "STRS",
-    "STRT",
-    "STSB",
-    "STSS",
-    "STSSW",
-    "STTK",
-    "STX",
-    "SUGP",
-    "SUNE",
-    "SUNS",
-    "SUPN",
-    "SURG",
-    "SUSB",
-    "SUSC",
-    "SUSL",
-    "SUUN",
-    "SVA",
-    "SVC",
-    "SVCO",
-    "SVII",
-    "SVIIR",
-    "SVIIU",
-    "SVIIW",
-    "SVMH",
-    "SVMHW",
-    "SVRA",
-    "SVRE",
-    "SVREW",
-    "SWAG",
-    "SWAGW",
-    "SWBI",
-    "SWIM",
-    "SWIN",
-    "SWKH",
-    "SWKHL",
-    "SWKS",
-    "SWP",
-    "SWTX",
-    "SWVL",
-    "SWVLW",
-    "SXTC",
-    "SXTP",
-    "SXTPW",
-    "SY",
-    "SYBT",
-    "SYBX",
-    "SYM",
-    "SYNA",
-    "SYPR",
-    "SYRA",
-    "SYRE",
-    "SYRS",
-    "SYT",
-    "SYTA",
-    "SYTAW",
-    "TACT",
-    "TAIT",
-    "TALK",
-    "TALKW",
-    "TANH",
-    "TAOP",
-    "TARA",
-    "TARK",
-    "TARS",
-    "TASK",
-    "TATT",
-    "TAXE",
-    "TAYD",
-    "TBBK",
-    "TBIL",
-    "TBLA",
-    "TBLAW",
-    "TBLD",
-    "TBMC",
-    "TBMCR",
-    "TBNK",
-    "TBPH",
-    "TBRG",
-    "TC",
-    "TCBI",
-    "TCBIO",
-    "TCBK",
-    "TCBP",
-    "TCBPW",
-    "TCBS",
-    "TCBX",
-    "TCHI",
-    "TCMD",
-    "TCOM",
-    "TCPC",
-    "TCRT",
-    "TCRX",
-    "TCTM",
-    "TCX",
-    "TDI",
-    "TDIV",
-    "TDSB",
-    "TDSC",
-    "TDTH",
-    "TDUP",
-    "TEAM",
-    "TECH",
-    "TECTP",
-    "TECX",
-    "TEKX",
-    "TELA",
-    "TELO",
-    "TEM",
-    "TENB",
-    "TENX",
-    "TER",
-    "TERN",
-    "TETE",
-    "TETEU",
-    "TETEW",
-    "TFFP",
-    "TFIN",
-    "TFINP",
-    "TFSL",
-    "TGAA",
-    "TGAAU",
-    "TGAAW",
-    "TGL",
-    "TGTX",
-    "TH",
-    "THAR",
-    "THCH",
-    "THCP",
-    "THCPU",
-    "THCPW",
-    "THFF",
-    "THRD",
-    "THRM",
-    "THRY",
-    "THTX",
-    "TIGO",
-    "TIGR",
-    "TIL",
-    "TILE",
-    "TIPT",
-    "TIRX",
-    "TITN",
-    "TIVC",
-    "TKLF",
-    "TKNO",
-    "TLF",
-    "TLGY",
-    "TLGYU",
-    "TLGYW",
-    "TLN",
-    "TLPH",
-    "TLRY",
-    "TLS",
-    "TLSA",
-    "TLSI",
-    "TLSIW",
-    "TLT",
-    "TLTM",
-    "TLTQ",
-    "TLX",
-    "TMC",
-    "TMCI",
-    "TMCWW",
-    "TMDX",
-    "TMET",
-    "TMTC",
-    "TMTCR",
-    "TMTCU",
-    "TMUS",
-    "TNDM",
-    "TNFA",
-    "TNGX",
-    "TNON",
-    "TNONW",
-    "TNXP",
-    "TNYA",
-    "TOI",
-    "TOIIW",
-    "TOMZ",
-    "TOP",
-    "TORO",
-    "TOUR",
-    "TOWN",
-    "TOYO",
-    "TPCS",
-    "TPG",
-    "TPGXL",
-    "TPIC",
-    "TPST",
-    "TQQQ",
-    "TRAW",
-    "TRDA",
-    "TREE",
-    "TRIB",
-    "TRIN",
-    "TRINI",
-    "TRINL",
-    "TRINZ",
-    "TRIP",
-    "TRMB",
-    "TRMD",
-    "TRMK",
-    "TRML",
-    "TRNR",
-    "TRNS",
-    "TROO",
-    "TROW",
-    "TRS",
-    "TRSG",
-    "TRST",
-    "TRUE",
-    "TRUG",
-    "TRUP",
-    "TRVG",
-    "TRVI",
-    "TSAT",
-    "TSBK",
-    "TSBX",
-    "TSCO",
-    "TSDD",
-    "TSEM",
-    "TSHA",
-    "TSL",
-    "TSLA",
-    "TSLL",
-    "TSLQ",
-    "TSLR",
-    "TSLS",
-    "TSLT",
-    "TSLW",
-    "TSLZ",
-    "TSMU",
-    "TSMX",
-    "TSMZ",
-    "TSPY",
-    "TSSI",
-    "TSVT",
-    "TTD",
-    "TTEC",
-    "TTEK",
-    "TTEQ",
-    "TTGT",
-    "TTMI",
-    "TTNP",
-    "TTOO",
-    "TTSH",
-    "TTWO",
-    "TUG",
-    "TUGN",
-    "TUR",
-    "TURB",
-    "TURN",
-    "TUSK",
-    "TVGN",
-    "TVGNW",
-    "TVTX",
-    "TW",
-    "TWFG",
-    "TWG",
-    "TWIN",
-    "TWST",
-    "TXG",
-    "TXMD",
-    "TXN",
-    "TXRH",
-    "TXSS",
-    "TYGO",
-    "TYRA",
-    "TZOO",
-    "TZUP",
-    "UAE",
-    "UAL",
-    "UBCP",
-    "UBFO",
-    "UBND",
-    "UBRL",
-    "UBSI",
-    "UBX",
-    "UBXG",
-    "UCAR",
-    "UCL",
-    "UCRD",
-    "UCTT",
-    "UCYB",
-    "UDMY",
-    "UEIC",
-    "UEVM",
-    "UFCS",
-    "UFIV",
-    "UFO",
-    "UFPI",
-    "UFPT",
-    "UG",
-    "UGRO",
-    "UHG",
-    "UHGWW",
-    "UITB",
-    "UIVM",
-    "UK",
-    "UKOMW",
-    "ULBI",
-    "ULCC",
-    "ULH",
-    "ULTA",
-    "ULVM",
-    "ULY",
-    "UMBF",
-    "UMMA",
-    "UNB",
-    "UNCY",
-    "UNIT",
-    "UNIY",
-    "UNTY",
-    "UONE",
-    "UONEK",
-    "UPB",
-    "UPBD",
-    "UPC",
-    "UPGR",
-    "UPLD",
-    "UPST",
-    "UPWK",
-    "UPXI",
-    "URBN",
-    "URGN",
-    "URNJ",
-    "UROY",
-    "USAP",
-    "USAU",
-    "USCB",
-    "USCF",
-    "USCL",
-    "USDX",
-    "USEA",
-    "USEG",
-    "USFI",
-    "USGO",
-    "USGOW",
-    "USIG",
-    "USIN",
-    "USIO",
-    "USLM",
-    "USMC",
-    "USOI",
-    "USOY",
-    "USRD",
-    "USSH",
-    "USTB",
-    "USVM",
-    "USVN",
-    "USXF",
-    "UTEN",
-    "UTHR",
-    "UTHY",
-    "UTMD",
-    "UTRE",
-    "UTSI",
-    "UTWO",
-    "UTWY",
-    "UVSP",
-    "UXIN",
-    "VABK",
-    "VACH",
-    "VACHU",
-    "VACHW",
-    "VALN",
-    "VALU",
-    "VANI",
-    "VBFC",
-    "VBNK",
-    "VBTX",
-    "VC",
-    "VCEL",
-    "VCIC",
-    "VCICU",
-    "VCICW",
-    "VCIG",
-    "VCIT",
-    "VCLT",
-    "VCNX",
-    "VCRB",
-    "VCSA",
-    "VCSH",
-    "VCTR",
-    "VCYT",
-    "VECO",
-    "VEEA",
-    "VEEAW",
-    "VEEE",
-    "VEON",
-    "VERA",
-    "VERB",
-    "VERI",
-    "VERO",
-    "VERU",
-    "VERV",
-    "VERX",
-    "VFF",
-    "VFLO",
-    "VFS",
-    "VFSWW",
-    "VGAS",
-    "VGASW",
-    "VGIT",
-    "VGLT",
-    "VGSH",
-    "VGSR",
-    "VIASP",
-    "VIAV",
-    "VICR",
-    "VIGI",
-    "VIGL",
-    "VINC",
-    "VINO",
-    "VINP",
-    "VIOT",
-    "VIR",
-    "VIRC",
-    "VIRT",
-    "VIRX",
-    "VISL",
-    "VITL",
-    "VIVK",
-    "VKTX",
-    "VLCN",
-    "VLGEA",
-    "VLY",
-    "VLYPN",
-    "VLYPO",
-    "VLYPP",
-    "VMAR",
-    "VMBS",
-    "VMCA",
-    "VMCAU",
-    "VMCAW",
-    "VMD",
-    "VMEO",
-    "VMOT",
-    "VNDA",
-    "VNET",
-    "VNOM",
-    "VNQI",
-    "VOD",
-    "VONE",
-    "VONG",
-    "VONV",
-    "VOR",
-    "VOXR",
-    "VOXX",
-    "VPLS",
-    "VRA",
-    "VRAR",
-    "VRAX",
-    "VRCA",
-    "VRDN",
-    "VREX",
-    "VRIG",
-    "VRM",
-    "VRME",
-    "VRMEW",
-    "VRNA",
-    "VRNS",
-    "VRNT",
-    "VRPX",
-    "VRRM",
-    "VRSK",
-    "VRSN",
-    "VRTX",
-    "VS",
-    "VSAT",
-    "VSDA",
-    "VSEC",
-    "VSEE",
-    "VSEEW",
-    "VSME",
-    "VSMV",
-    "VSSYW",
-    "VSTA",
-    "VSTE",
-    "VSTEW",
-    "VSTM",
-    "VTC",
-    "VTGN",
-    "VTHR",
-    "VTIP",
-    "VTRS",
-    "VTSI",
-    "VTVT",
-    "VTWG",
-    "VTWO",
-    "VTWV",
-    "VTYX",
-    "VUZI",
-    "VVOS",
-    "VVPR",
-    "VWOB",
-    "VXRT",
-    "VXUS",
-    "VYGR",
-    "VYMI",
-    "VYNE",
-    "WABC",
-    "WABF",
-    "WAFD",
-    "WAFDP",
-    "WAFU",
-    "WAI",
-    "WALD",
-    "WALDW",
-    "WASH",
-    "WATT",
-    "WAVE",
-    "WAVS",
-    "WAVSU",
-    "WAVSW",
-    "WAY",
-    "WB",
-    "WBA",
-    "WBD",
-    "WBND",
-    "WBTN",
-    "WBUY",
-    "WCBR",
-    "WCLD",
-    "WCT",
-    "WDAY",
-    "WDC",
-    "WDFC",
-    "WEEI",
-    "WEN",
-    "WERN",
-    "WEST",
-    "WETH",
-    "WEYS",
-    "WFCF",
-    "WFRD",
-    "WGMI",
-    "WGS",
-    "WGSWW",
-    "WHF",
-    "WHFCL",
-    "WHLM",
-    "WHLR",
-    "WHLRD",
-    "WHLRL",
-    "WHLRP",
-    "WILC",
-    "WIMI",
-    "WINA",
-    "WINC",
-    "WING",
-    "WINT",
-    "WINV",
-    "WINVR",
-    "WINVU",
-    "WINVW",
-    "WISA",
-    "WISE",
-    "WIX",
-    "WKEY",
-    "WKHS",
-    "WKSP",
-    "WLACU",
-    "WLDN",
-    "WLDS",
-    "WLDSW",
-    "WLFC",
-    "WLGS",
-    "WMG",
-    "WMPN",
-    "WNDY",
-    "WNEB",
-    "WNW",
-    "WOK",
-    "WOOD",
-    "WOOF",
-    "WORX",
-    "WPRT",
-    "WRAP",
-    "WRD",
-    "WRLD",
-    "WRND",
-    "WSBC",
-    "WSBCP",
-    "WSBF",
-    "WSC",
-    "WSFS",
-    "WTBA",
-    "WTBN",
-    "WTFC",
-    "WTFCM",
-    "WTFCP",
-    "WTMA",
-    "WTMAR",
-    "WTMAU",
-    "WTO",
-    "WTW",
-    "WULF",
-    "WVE",
-    "WVVI",
-    "WVVIP",
-    "WW",
-    "WWD",
-    "WYNN",
-    "XAIR",
-    "XAIX",
-    "XBIL",
-    "XBIO",
-    "XBIT",
-    "XBP",
-    "XBPEW",
-    "XCH",
-    "XCNY",
-    "XCUR",
-    "XEL",
-    "XELB",
-    "XENE",
-    "XERS",
-    "XFIX",
-    "XFOR",
-    "XGN",
-    "XHG",
-    "XLO",
-    "XMAG",
-    "XMTR",
-    "XNCR",
-    "XNET",
-    "XOMA",
-    "XOMAO",
-    "XOMAP",
-    "XOS",
-    "XOSWW",
-    "XOVR",
-    "XP",
-    "XPEL",
-    "XPON",
-    "XRAY",
-    "XRTX",
-    "XRX",
-    "XT",
-    "XTIA",
-    "XTKG",
-    "XTLB",
-    "XWEL",
-    "XXII",
-    "XYLO",
-    "YGMZ",
-    "YHGJ",
-    "YHNA",
-    "YHNAR",
-    "YHNAU",
-    "YI",
-    "YIBO",
-    "YJ",
-    "YLDE",
-    "YMAB",
-    "YORW",
-    "YOSH",
-    "YOTA",
-    "YOTAR",
-    "YOTAU",
-    "YOTAW",
-    "YQ",
-    "YQQQ",
-    "YTRA",
-    "YXT",
-    "YY",
-    "YYAI",
-    "YYGH",
-    "Z",
-    "ZAPP",
-    "ZAPPW",
-    "ZAZZT",
-    "ZBAO",
-    "ZBIO",
-    "ZBRA",
-    "ZBZZT",
-    "ZCAR",
-    "ZCARW",
-    "ZCMD",
-    "ZCZZT",
-    "ZD",
-    "ZENA",
-    "ZENV",
-    "ZEO",
-    "ZEOWW",
-    "ZEUS",
-    "ZG",
-    "ZI",
-    "ZIMV",
-    "ZION",
-    "ZIONL",
-    "ZIONO",
-    "ZIONP",
-    "ZJK",
-    "ZJYL",
-    "ZJZZT",
-    "ZKIN",
-    "ZLAB",
-    "ZM",
-    "ZNTL",
-    "ZOOZ",
-    "ZOOZW",
-    "ZS",
-    "ZTEK",
-    "ZUMZ",
-    "ZURA",
-    "ZVRA",
-    "ZVSA",
-    "ZVZZT",
-    "ZWZZT",
-    "ZXYZ.A",
-    "ZXZZT",
-    "ZYME",
-    "ZYXI",
-    "ZZZ",
-]
 
 
-# 11131
-nasdaq_traded_stocks: List[str] = [
-    "A",
-    "AA",
-    "AAA",
-    "AAAU",
-    "AACG",
-    "AACT",
-    "AACT.U",
-    "AACT.W",
-    "AADI",
-    "AADR",
-    "AAL",
-    "AAM",
-    "AAM.U",
-    "AAM.W",
-    "AAME",
-    "AAOI",
-    "AAON",
-    "AAP",
-    "AAPB",
-    "AAPD",
-    "AAPL",
-    "AAPR",
-    "AAPU",
-    "AAPX",
-    "AAPY",
-    "AAT",
-    "AAXJ",
-    "AB",
-    "ABAT",
-    "ABBV",
-    "ABCB",
-    "ABCL",
-    "ABCS",
-    "ABEO",
-    "ABEQ",
-    "ABEV",
-    "ABG",
-    "ABL",
-    "ABLLL",
-    "ABLLW",
-    "ABLV",
-    "ABLVW",
-    "ABM",
-    "ABNB",
-    "ABNY",
-    "ABOS",
-    "ABP",
-    "ABPWW",
-    "ABR",
-    "ABR$D",
-    "ABR$E",
-    "ABR$F",
-    "ABSI",
-    "ABT",
-    "ABTS",
-    "ABUS",
-    "ABVC",
-    "ABVE",
-    "ABVEW",
-    "ABVX",
-    "AC",
-    "ACA",
-    "ACAD",
-    "ACB",
-    "ACCD",
-    "ACCO",
-    "ACDC",
-    "ACEL",
-    "ACES",
-    "ACET",
-    "ACGL",
-    "ACGLN",
-    "ACGLO",
-    "ACHC",
-    "ACHL",
-    "ACHR",
-    "ACHR.W",
-    "ACHV",
-    "ACI",
-    "ACIC",
-    "ACIO",
-    "ACIU",
-    "ACIW",
-    "ACLO",
-    "ACLS",
-    "ACLX",
-    "ACM",
-    "ACMR",
-    "ACN",
-    "ACNB",
-    "ACNT",
-    "ACOG",
-    "ACON",
-    "ACONW",
-    "ACP",
-    "ACP$A",
-    "ACR",
-    "ACR$C",
-    "ACR$D",
-    "ACRE",
-    "ACRS",
-    "ACRV",
-    "ACSI",
-    "ACT",
-    "ACTG",
-    "ACTU",
-    "ACTV",
-    "ACU",
-    "ACV",
-    "ACVA",
-    "ACVF",
-    "ACWI",
-    "ACWV",
-    "ACWX",
-    "ACXP",
-    "ADAG",
-    "ADAP",
-    "ADBE",
-    "ADC",
-    "ADC$A",
-    "ADCT",
-    "ADD",
-    "ADEA",
-    "ADFI",
-    "ADGM",
-    "ADI",
-    "ADIL",
-    "ADIV",
-    "ADM",
-    "ADMA",
-    "ADME",
-    "ADN",
-    "ADNT",
-    "ADNWW",
-    "ADP",
-    "ADPT",
-    "ADPV",
-    "ADSE",
-    "ADSEW",
-    "ADSK",
-    "ADT",
-    "ADTN",
-    "ADTX",
-    "ADUR",
-    "ADUS",
-    "ADV",
-    "ADVE",
-    "ADVM",
-    "ADVWW",
-    "ADX",
-    "ADXN",
-    "AE",
-    "AEE",
-    "AEF",
-    "AEFC",
-    "AEG",
-    "AEHL",
-    "AEHR",
-    "AEI",
-    "AEIS",
-    "AEM",
-    "AEMD",
-    "AENT",
-    "AENTW",
-    "AEO",
-    "AEON",
-    "AEP",
-    "AER",
-    "AERT",
-    "AERTW",
-    "AES",
-    "AESI",
-    "AESR",
-    "AETH",
-    "AEVA",
-    "AEVA.W",
-    "AEYE",
-    "AFB",
-    "AFBI",
-    "AFCG",
-    "AFG",
-    "AFGB",
-    "AFGC",
-    "AFGD",
-    "AFGE",
-    "AFIF",
-    "AFJK",
-    "AFJKR",
-    "AFJKU",
-    "AFK",
-    "AFL",
-    "AFLG",
-    "AFMC",
-    "AFMD",
-    "AFRI",
-    "AFRIW",
-    "AFRM",
-    "AFSM",
-    "AFYA",
-    "AG",
-    "AGAE",
-    "AGCO",
-    "AGD",
-    "AGEN",
-    "AGFY",
-    "AGG",
-    "AGGH",
-    "AGGS",
-    "AGGY",
-    "AGI",
-    "AGIH",
-    "AGIO",
-    "AGIX",
-    "AGL",
-    "AGM",
-    "AGM$D",
-    "AGM$E",
-    "AGM$F",
-    "AGM$G",
-    "AGM.A",
-    "AGMH",
-    "AGMI",
-    "AGNC",
-    "AGNCL",
-    "AGNCM",
-    "AGNCN",
-    "AGNCO",
-    "AGNCP",
-    "AGNG",
-    "AGO",
-    "AGOX",
-    "AGQ",
-    "AGQI",
-    "AGR",
-    "AGRH",
-    "AGRI",
-    "AGRO",
-    "AGS",
-    "AGX",
-    "AGYS",
-    "AGZ",
-    "AGZD",
-    "AHCO",
-    "AHG",
-    "AHH",
-    "AHH$A",
-    "AHL$C",
-    "AHL$D",
-    "AHL$E",
-    "AHLT",
-    "AHOY",
-    "AHR",
-    "AHT",
-    "AHT$D",
-    "AHT$F",
-    "AHT$G",
-    "AHT$H",
-    "AHT$I",
-    "AHYB",
-    "AI",
-    "AIA",
-    "AIBD",
-    "AIBU",
-    "AIEQ",
-    "AIEV",
-    "AIFD",
-    "AIFF",
-    "AIFU",
-    "AIG",
-    "AIHS",
-    "AILE",
-    "AILEW",
-    "AIM",
-    "AIMAU",
-    "AIMAW",
-    "AIMBU",
-    "AIMD",
-    "AIMDW",
-    "AIN",
-    "AIO",
-    "AIOT",
-    "AIP",
-    "AIPI",
-    "AIQ",
-    "AIR",
-    "AIRE",
-    "AIRG",
-    "AIRI",
-    "AIRJ",
-    "AIRJW",
-    "AIRL",
-    "AIRR",
-    "AIRS",
-    "AIRT",
-    "AIRTP",
-    "AISP",
-    "AISPW",
-    "AIT",
-    "AITR",
-    "AITRR",
-    "AITRU",
-    "AIV",
-    "AIVC",
-    "AIVI",
-    "AIVL",
-    "AIXI",
-    "AIYY",
-    "AIZ",
-    "AIZN",
-    "AJAN",
-    "AJG",
-    "AJUL",
-    "AJX",
-    "AKA",
-    "AKAM",
-    "AKAN",
-    "AKBA",
-    "AKO.A",
-    "AKO.B",
-    "AKR",
-    "AKRO",
-    "AKTS",
-    "AKTX",
-    "AKYA",
-    "AL",
-    "ALAB",
-    "ALAI",
-    "ALAR",
-    "ALB",
-    "ALB$A",
-    "ALBT",
-    "ALC",
-    "ALCE",
-    "ALCO",
-    "ALCY",
-    "ALCYU",
-    "ALCYW",
-    "ALDFU",
-    "ALDX",
-    "ALE",
-    "ALEC",
-    "ALEX",
-    "ALF",
-    "ALFUU",
-    "ALFUW",
-    "ALG",
-    "ALGM",
-    "ALGN",
-    "ALGS",
-    "ALGT",
-    "ALHC",
-    "ALIT",
-    "ALK",
-    "ALKS",
-    "ALKT",
-    "ALL",
-    "ALL$B",
-    "ALL$H",
-    "ALL$I",
-    "ALL$J",
-    "ALLE",
-    "ALLK",
-    "ALLO",
-    "ALLR",
-    "ALLT",
-    "ALLY",
-    "ALMS",
-    "ALNT",
-    "ALNY",
-    "ALOT",
-    "ALRM",
-    "ALRN",
-    "ALRS",
-    "ALSA",
-    "ALSAR",
-    "ALSAU",
-    "ALSAW",
-    "ALSN",
-    "ALT",
-    "ALTG",
-    "ALTG$A",
-    "ALTI",
-    "ALTL",
-    "ALTM",
-    "ALTO",
-    "ALTR",
-    "ALTS",
-    "ALTY",
-    "ALUR",
-    "ALUR.W",
-    "ALV",
-    "ALVO",
-    "ALVOW",
-    "ALVR",
-    "ALX",
-    "ALXO",
-    "ALZN",
-    "AM",
-    "AMAL",
-    "AMAT",
-    "AMAX",
-    "AMBA",
-    "AMBC",
-    "AMBI",
-    "AMBI.W",
-    "AMBO",
-    "AMBP",
-    "AMBP.W",
-    "AMC",
-    "AMCR",
-    "AMCX",
-    "AMD",
-    "AMDL",
-    "AMDS",
-    "AMDY",
-    "AME",
-    "AMED",
-    "AMG",
-    "AMGN",
-    "AMH",
-    "AMH$G",
-    "AMH$H",
-    "AMID",
-    "AMIX",
-    "AMJB",
-    "AMKR",
-    "AMLI",
-    "AMLP",
-    "AMLX",
-    "AMN",
-    "AMNA",
-    "AMND",
-    "AMOM",
-    "AMP",
-    "AMPD",
-    "AMPG",
-    "AMPGW",
-    "AMPH",
-    "AMPL",
-    "AMPS",
-    "AMPX",
-    "AMPX.W",
-    "AMPY",
-    "AMR",
-    "AMRC",
-    "AMRK",
-    "AMRN",
-    "AMRX",
-    "AMS",
-    "AMSC",
-    "AMSF",
-    "AMST",
-    "AMT",
-    "AMTB",
-    "AMTD",
-    "AMTM",
-    "AMTR",
-    "AMTX",
-    "AMUB",
-    "AMWD",
-    "AMWL",
-    "AMX",
-    "AMZA",
-    "AMZD",
-    "AMZN",
-    "AMZP",
-    "AMZU",
-    "AMZY",
-    "AMZZ",
-    "AN",
-    "ANAB",
-    "ANDE",
-    "ANEB",
-    "ANET",
-    "ANEW",
-    "ANF",
-    "ANG$A",
-    "ANG$B",
-    "ANGH",
-    "ANGHW",
-    "ANGI",
-    "ANGL",
-    "ANGO",
-    "ANIK",
-    "ANIP",
-    "ANIX",
-    "ANL",
-    "ANNX",
-    "ANRO",
-    "ANSC",
-    "ANSCU",
-    "ANSCW",
-    "ANSS",
-    "ANTE",
-    "ANTX",
-    "ANVS",
-    "ANY",
-    "AOA",
-    "AOCT",
-    "AOD",
-    "AOHY",
-    "AOK",
-    "AOM",
-    "AOMN",
-    "AOMR",
-    "AON",
-    "AOR",
-    "AORT",
-    "AOS",
-    "AOSL",
-    "AOTG",
-    "AOUT",
-    "AP",
-    "AP.W",
-    "APA",
-    "APAM",
-    "APCB",
-    "APCX",
-    "APCXW",
-    "APD",
-    "APDN",
-    "APEI",
-    "APG",
-    "APGE",
-    "APH",
-    "API",
-    "APIE",
-    "APLD",
-    "APLE",
-    "APLM",
-    "APLMW",
-    "APLS",
-    "APLT",
-    "APLY",
-    "APM",
-    "APMU",
-    "APO",
-    "APO$A",
-    "APOC",
-    "APOG",
-    "APOS",
-    "APP",
-    "APPF",
-    "APPN",
-    "APPS",
-    "APRD",
-    "APRE",
-    "APRH",
-    "APRJ",
-    "APRP",
-    "APRQ",
-    "APRT",
-    "APRW",
-    "APRZ",
-    "APT",
-    "APTO",
-    "APTV",
-    "APUE",
-    "APVO",
-    "APWC",
-    "APXI",
-    "APYX",
-    "AQB",
-    "AQMS",
-    "AQN",
-    "AQNB",
-    "AQST",
-    "AQU",
-    "AQUNR",
-    "AQUNU",
-    "AQWA",
-    "AR",
-    "ARAY",
-    "ARB",
-    "ARBB",
-    "ARBE",
-    "ARBEW",
-    "ARBK",
-    "ARBKL",
-    "ARC",
-    "ARCB",
-    "ARCC",
-    "ARCH",
-    "ARCM",
-    "ARCO",
-    "ARCT",
-    "ARDC",
-    "ARDT",
-    "ARDX",
-    "ARE",
-    "AREA",
-    "AREB",
-    "AREBW",
-    "AREC",
-    "AREN",
-    "ARES",
-    "ARES$B",
-    "ARGD",
-    "ARGO$A",
-    "ARGT",
-    "ARGX",
-    "ARHS",
-    "ARI",
-    "ARIS",
-    "ARKA",
-    "ARKB",
-    "ARKC",
-    "ARKD",
-    "ARKF",
-    "ARKG",
-    "ARKK",
-    "ARKO",
-    "ARKOW",
-    "ARKQ",
-    "ARKR",
-    "ARKW",
-    "ARKX",
-    "ARKY",
-    "ARKZ",
-    "ARL",
-    "ARLO",
-    "ARLP",
-    "ARLU",
-    "ARM",
-    "ARMK",
-    "ARMN",
-    "ARMP",
-    "AROC",
-    "AROW",
-    "ARP",
-    "ARQ",
-    "ARQQ",
-    "ARQQW",
-    "ARQT",
-    "ARR",
-    "ARR$C",
-    "ARRY",
-    "ARTL",
-    "ARTNA",
-    "ARTV",
-    "ARTW",
-    "ARTY",
-    "ARVN",
-    "ARVR",
-    "ARW",
-    "ARWR",
-    "AS",
-    "ASA",
-    "ASAI",
-    "ASAN",
-    "ASB",
-    "ASB$E",
-    "ASB$F",
-    "ASBA",
-    "ASC",
-    "ASEA",
-    "ASET",
-    "ASG",
-    "ASGI",
-    "ASGN",
-    "ASH",
-    "ASHR",
-    "ASHS",
-    "ASIA",
-    "ASIX",
-    "ASLE",
-    "ASM",
-    "ASMB",
-    "ASMF",
-    "ASML",
-    "ASND",
-    "ASNS",
-    "ASO",
-    "ASPCU",
-    "ASPI",
-    "ASPN",
-    "ASPS",
-    "ASR",
-    "ASRT",
-    "ASRV",
-    "ASST",
-    "ASTC",
-    "ASTE",
-    "ASTH",
-    "ASTI",
-    "ASTL",
-    "ASTLW",
-    "ASTS",
-    "ASUR",
-    "ASX",
-    "ASYS",
-    "ATAI",
-    "ATAT",
-    "ATCH",
-    "ATCO$D",
-    "ATCO$H",
-    "ATCOL",
-    "ATEC",
-    "ATEK",
-    "ATEK.U",
-    "ATEK.W",
-    "ATEN",
-    "ATER",
-    "ATEST",
-    "ATEST.A",
-    "ATEST.B",
-    "ATEST.C",
-    "ATEX",
-    "ATFV",
-    "ATGE",
-    "ATGL",
-    "ATH$A",
-    "ATH$B",
-    "ATH$C",
-    "ATH$D",
-    "ATH$E",
-    "ATHA",
-    "ATHE",
-    "ATHM",
-    "ATHS",
-    "ATI",
-    "ATIF",
-    "ATIP",
-    "ATKR",
-    "ATLC",
-    "ATLCL",
-    "ATLCP",
-    "ATLCZ",
-    "ATLO",
-    "ATLX",
-    "ATMC",
-    "ATMCR",
-    "ATMCU",
-    "ATMCW",
-    "ATMP",
-    "ATMU",
-    "ATMV",
-    "ATMVR",
-    "ATMVU",
-    "ATNF",
-    "ATNFW",
-    "ATNI",
-    "ATNM",
-    "ATO",
-    "ATOM",
-    "ATOS",
-    "ATPC",
-    "ATR",
-    "ATRA",
-    "ATRC",
-    "ATRO",
-    "ATS",
-    "ATSG",
-    "ATUS",
-    "ATXG",
-    "ATXI",
-    "ATXS",
-    "ATYR",
-    "AU",
-    "AUB",
-    "AUB$A",
-    "AUBN",
-    "AUDC",
-    "AUGM",
-    "AUGP",
-    "AUGT",
-    "AUGU",
-    "AUGW",
-    "AUGZ",
-    "AUID",
-    "AUMI",
-    "AUMN",
-    "AUNA",
-    "AUPH",
-    "AUR",
-    "AURA",
-    "AUROW",
-    "AUSF",
-    "AUST",
-    "AUTL",
-    "AUUD",
-    "AUUDW",
-    "AVA",
-    "AVAH",
-    "AVAL",
-    "AVAV",
-    "AVB",
-    "AVBP",
-    "AVD",
-    "AVDE",
-    "AVDL",
-    "AVDS",
-    "AVDV",
-    "AVDX",
-    "AVEE",
-    "AVEM",
-    "AVES",
-    "AVGE",
-    "AVGO",
-    "AVGR",
-    "AVGV",
-    "AVGX",
-    "AVIE",
-    "AVIG",
-    "AVIR",
-    "AVIV",
-    "AVK",
-    "AVL",
-    "AVLC",
-    "AVLV",
-    "AVMA",
-    "AVMC",
-    "AVMU",
-    "AVMV",
-    "AVNM",
-    "AVNS",
-    "AVNT",
-    "AVNV",
-    "AVNW",
-    "AVO",
-    "AVPT",
-    "AVPTW",
-    "AVRE",
-    "AVS",
-    "AVSC",
-    "AVSD",
-    "AVSE",
-    "AVSF",
-    "AVSU",
-    "AVT",
-    "AVTE",
-    "AVTR",
-    "AVTX",
-    "AVUS",
-    "AVUV",
-    "AVXC",
-    "AVXL",
-    "AVY",
-    "AWAY",
-    "AWEG",
-    "AWF",
-    "AWH",
-    "AWI",
-    "AWK",
-    "AWP",
-    "AWR",
-    "AWRE",
-    "AWX",
-    "AX",
-    "AXDX",
-    "AXGN",
-    "AXIL",
-    "AXL",
-    "AXON",
-    "AXP",
-    "AXR",
-    "AXS",
-    "AXS$E",
-    "AXSM",
-    "AXTA",
-    "AXTI",
-    "AY",
-    "AYI",
-    "AYRO",
-    "AYTU",
-    "AZ",
-    "AZEK",
-    "AZI",
-    "AZN",
-    "AZNH",
-    "AZO",
-    "AZPN",
-    "AZTA",
-    "AZTD",
-    "AZTR",
-    "AZUL",
-    "AZZ",
-    "B",
-    "BA",
-    "BA$A",
-    "BAB",
-    "BABA",
-    "BABO",
-    "BABX",
-    "BAC",
-    "BAC$B",
-    "BAC$E",
-    "BAC$K",
-    "BAC$L",
-    "BAC$M",
-    "BAC$N",
-    "BAC$O",
-    "BAC$P",
-    "BAC$Q",
-    "BAC$S",
-    "BACK",
-    "BACQU",
-    "BAER",
-    "BAERW",
-    "BAFE",
-    "BAFN",
-    "BAH",
-    "BAI",
-    "BAK",
-    "BALI",
-    "BALL",
-    "BALT",
-    "BALY",
-    "BAM",
-    "BAMA",
-    "BAMB",
-    "BAMD",
-    "BAMG",
-    "BAMO",
-    "BAMU",
-    "BAMV",
-    "BAMY",
-    "BANC",
-    "BANC$F",
-    "BAND",
-    "BANF",
-    "BANFP",
-    "BANL",
-    "BANR",
-    "BANX",
-    "BAOS",
-    "BAP",
-    "BAPR",
-    "BAR",
-    "BARK",
-    "BARK.W",
-    "BASE",
-    "BATL",
-    "BATRA",
-    "BATRK",
-    "BATT",
-    "BAUG",
-    "BAX",
-    "BAYA",
-    "BAYAR",
-    "BAYAU",
-    "BB",
-    "BBAG",
-    "BBAI",
-    "BBAI.W",
-    "BBAR",
-    "BBAX",
-    "BBBI",
-    "BBBL",
-    "BBBS",
-    "BBC",
-    "BBCA",
-    "BBCB",
-    "BBCP",
-    "BBD",
-    "BBDC",
-    "BBDO",
-    "BBEM",
-    "BBEU",
-    "BBGI",
-    "BBH",
-    "BBHY",
-    "BBIB",
-    "BBIN",
-    "BBIO",
-    "BBJP",
-    "BBLB",
-    "BBLG",
-    "BBLGW",
-    "BBLU",
-    "BBMC",
-    "BBN",
-    "BBP",
-    "BBRE",
-    "BBSB",
-    "BBSC",
-    "BBSI",
-    "BBU",
-    "BBUC",
-    "BBUS",
-    "BBVA",
-    "BBW",
-    "BBWI",
-    "BBY",
-    "BC",
-    "BC$A",
-    "BC$B",
-    "BC$C",
-    "BCAB",
-    "BCAL",
-    "BCAN",
-    "BCAT",
-    "BCAX",
-    "BCBP",
-    "BCC",
-    "BCD",
-    "BCDA",
-    "BCDF",
-    "BCE",
-    "BCG",
-    "BCGWW",
-    "BCH",
-    "BCHP",
-    "BCI",
-    "BCIL",
-    "BCIM",
-    "BCLI",
-    "BCML",
-    "BCO",
-    "BCOV",
-    "BCOW",
-    "BCPC",
-    "BCRX",
-    "BCS",
-    "BCSF",
-    "BCTX",
-    "BCTXW",
-    "BCUS",
-    "BCV",
-    "BCV$A",
-    "BCX",
-    "BCYC",
-    "BDC",
-    "BDCX",
-    "BDCZ",
-    "BDEC",
-    "BDGS",
-    "BDIV",
-    "BDJ",
-    "BDL",
-    "BDMD",
-    "BDMDW",
-    "BDN",
-    "BDRX",
-    "BDRY",
-    "BDSX",
-    "BDTX",
-    "BDVG",
-    "BDX",
-    "BE",
-    "BEAGU",
-    "BEAM",
-    "BEAT",
-    "BEATW",
-    "BECN",
-    "BEDU",
-    "BEDZ",
-    "BEEM",
-    "BEEP",
-    "BEEZ",
-    "BEKE",
-    "BELFA",
-    "BELFB",
-    "BELT",
-    "BEMB",
-    "BEN",
-    "BENF",
-    "BENFW",
-    "BEP",
-    "BEP$A",
-    "BEPC",
-    "BEPH",
-    "BEPI",
-    "BEPJ",
-    "BERY",
-    "BERZ",
-    "BEST",
-    "BETE",
-    "BETH",
-    "BETR",
-    "BETRW",
-    "BETZ",
-    "BF.A",
-    "BF.B",
-    "BFAC",
-    "BFAC.U",
-    "BFAC.W",
-    "BFAM",
-    "BFC",
-    "BFEB",
-    "BFH",
-    "BFIN",
-    "BFIX",
-    "BFK",
-    "BFLY",
-    "BFLY.W",
-    "BFOR",
-    "BFRG",
-    "BFRGW",
-    "BFRI",
-    "BFRIW",
-    "BFS",
-    "BFS$D",
-    "BFS$E",
-    "BFST",
-    "BFZ",
-    "BG",
-    "BGB",
-    "BGC",
-    "BGFV",
-    "BGH",
-    "BGI",
-    "BGIG",
-    "BGLC",
-    "BGLD",
-    "BGM",
-    "BGNE",
-    "BGR",
-    "BGRN",
-    "BGRO",
-    "BGS",
-    "BGSF",
-    "BGT",
-    "BGX",
-    "BGY",
-    "BH",
-    "BH.A",
-    "BHAT",
-    "BHB",
-    "BHC",
-    "BHE",
-    "BHF",
-    "BHFAL",
-    "BHFAM",
-    "BHFAN",
-    "BHFAO",
-    "BHFAP",
-    "BHIL",
-    "BHK",
-    "BHLB",
-    "BHM",
-    "BHP",
-    "BHR",
-    "BHR$B",
-    "BHR$D",
-    "BHRB",
-    "BHST",
-    "BHV",
-    "BHVN",
-    "BHYB",
-    "BIAF",
-    "BIAFW",
-    "BIB",
-    "BIBL",
-    "BIDD",
-    "BIDU",
-    "BIGC",
-    "BIGZ",
-    "BIIB",
-    "BIL",
-    "BILD",
-    "BILI",
-    "BILL",
-    "BILS",
-    "BILZ",
-    "BINC",
-    "BINV",
-    "BIO",
-    "BIO.B",
-    "BIOA",
-    "BIOR",
-    "BIOX",
-    "BIP",
-    "BIP$A",
-    "BIP$B",
-    "BIPC",
-    "BIPH",
-    "BIPI",
-    "BIPJ",
-    "BIRD",
-    "BIRK",
-    "BIS",
-    "BIT",
-    "BITB",
-    "BITC",
-    "BITF",
-    "BITI",
-    "BITO",
-    "BITQ",
-    "BITS",
-    "BITU",
-    "BITX",
-    "BIV",
-    "BIVI",
-    "BIZD",
-    "BJ",
-    "BJAN",
-    "BJDX",
-    "BJK",
-    "BJRI",
-    "BJUL",
-    "BJUN",
-    "BK",
-    "BKAG",
-    "BKCH",
-    "BKCI",
-    "BKD",
-    "BKDT",
-    "BKDV",
-    "BKE",
-    "BKEM",
-    "BKF",
-    "BKGI",
-    "BKH",
-    "BKHA",
-    "BKHAR",
-    "BKHAU",
-    "BKHY",
-    "BKIE",
-    "BKIV",
-    "BKKT",
-    "BKKT.W",
-    "BKLC",
-    "BKLN",
-    "BKMC",
-    "BKN",
-    "BKNG",
-    "BKR",
-    "BKSE",
-    "BKSY",
-    "BKSY.W",
-    "BKT",
-    "BKTI",
-    "BKU",
-    "BKUI",
-    "BKV",
-    "BKWO",
-    "BKYI",
-    "BL",
-    "BLAC",
-    "BLACR",
-    "BLACU",
-    "BLACW",
-    "BLBD",
-    "BLBX",
-    "BLCN",
-    "BLCO",
-    "BLCR",
-    "BLCV",
-    "BLD",
-    "BLDE",
-    "BLDEW",
-    "BLDG",
-    "BLDP",
-    "BLDR",
-    "BLE",
-    "BLES",
-    "BLEU",
-    "BLEUR",
-    "BLEUU",
-    "BLEUW",
-    "BLFS",
-    "BLFY",
-    "BLIN",
-    "BLK",
-    "BLKB",
-    "BLKC",
-    "BLLD",
-    "BLMN",
-    "BLMZ",
-    "BLND",
-    "BLNK",
-    "BLOK",
-    "BLRX",
-    "BLTE",
-    "BLUE",
-    "BLV",
-    "BLW",
-    "BLX",
-    "BLZE",
-    "BMA",
-    "BMAR",
-    "BMAY",
-    "BMBL",
-    "BMDL",
-    "BME",
-    "BMEA",
-    "BMED",
-    "BMEZ",
-    "BMI",
-    "BML$G",
-    "BML$H",
-    "BML$J",
-    "BML$L",
-    "BMN",
-    "BMO",
-    "BMR",
-    "BMRA",
-    "BMRC",
-    "BMRN",
-    "BMTX",
-    "BMTX.W",
-    "BMVP",
-    "BMY",
-    "BN",
-    "BNAI",
-    "BNAIW",
-    "BND",
-    "BNDC",
-    "BNDD",
-    "BNDI",
-    "BNDW",
-    "BNDX",
-    "BNED",
-    "BNGE",
-    "BNGO",
-    "BNH",
-    "BNIX",
-    "BNIXR",
-    "BNIXW",
-    "BNJ",
-    "BNL",
-    "BNO",
-    "BNOV",
-    "BNOX",
-    "BNR",
-    "BNRG",
-    "BNS",
-    "BNT",
-    "BNTC",
-    "BNTX",
-    "BNY",
-    "BNZI",
-    "BNZIW",
-    "BOAT",
-    "BOC",
-    "BOCN",
-    "BOCNU",
-    "BOCNW",
-    "BOCT",
-    "BODI",
-    "BOE",
-    "BOF",
-    "BOH",
-    "BOH$A",
-    "BOH$B",
-    "BOIL",
-    "BOKF",
-    "BOLD",
-    "BOLT",
-    "BON",
-    "BOND",
-    "BOOM",
-    "BOOT",
-    "BORR",
-    "BOSC",
-    "BOTJ",
-    "BOTT",
-    "BOTZ",
-    "BOUT",
-    "BOW",
-    "BOWL",
-    "BOWN",
-    "BOWNR",
-    "BOWNU",
-    "BOX",
-    "BOXL",
-    "BOXX",
-    "BP",
-    "BPAY",
-    "BPMC",
-    "BPOP",
-    "BPOPM",
-    "BPRN",
-    "BPT",
-    "BPTH",
-    "BPYPM",
-    "BPYPN",
-    "BPYPO",
-    "BPYPP",
-    "BQ",
-    "BR",
-    "BRAC",
-    "BRACR",
-    "BRACU",
-    "BRAG",
-    "BRAZ",
-    "BRBR",
-    "BRBS",
-    "BRC",
-    "BRCC",
-    "BRDG",
-    "BREA",
-    "BRF",
-    "BRFH",
-    "BRFS",
-    "BRHY",
-    "BRID",
-    "BRK.A",
-    "BRK.B",
-    "BRKH",
-    "BRKHU",
-    "BRKHW",
-    "BRKL",
-    "BRKR",
-    "BRLN",
-    "BRLS",
-    "BRLSW",
-    "BRLT",
-    "BRN",
-    "BRNS",
-    "BRNY",
-    "BRO",
-    "BROG",
-    "BROGW",
-    "BROS",
-    "BRRR",
-    "BRSP",
-    "BRT",
-    "BRTR",
-    "BRTX",
-    "BRW",
-    "BRX",
-    "BRY",
-    "BRZE",
-    "BRZU",
-    "BSAC",
-    "BSBK",
-    "BSBR",
-    "BSCO",
-    "BSCP",
-    "BSCQ",
-    "BSCR",
-    "BSCS",
-    "BSCT",
-    "BSCU",
-    "BSCV",
-    "BSCW",
-    "BSCX",
-    "BSCY",
-    "BSEP",
-    "BSET",
-    "BSFC",
-    "BSGM",
-    "BSIG",
-    "BSII",
-    "BSIIU",
-    "BSIIW",
-    "BSJO",
-    "BSJP",
-    "BSJQ",
-    "BSJR",
-    "BSJS",
-    "BSJT",
-    "BSJU",
-    "BSJV",
-    "BSJW",
-    "BSL",
-    "BSLK",
-    "BSLKW",
-    "BSM",
-    "BSMC",
-    "BSMO",
-    "BSMP",
-    "BSMQ",
-    "BSMR",
-    "BSMS",
-    "BSMT",
-    "BSMU",
-    "BSMV",
-    "BSMW",
-    "BSMY",
-    "BSR",
-    "BSRR",
-    "BSSX",
-    "BST",
-    "BSTP",
-    "BSTZ",
-    "BSV",
-    "BSVN",
-    "BSVO",
-    "BSX",
-    "BSY",
-    "BTA",
-    "BTAI",
-    "BTAL",
-    "BTBD",
-    "BTBDW",
-    "BTBT",
-    "BTC",
-    "BTCI",
-    "BTCL",
-    "BTCM",
-    "BTCO",
-    "BTCS",
-    "BTCT",
-    "BTCTW",
-    "BTCW",
-    "BTCZ",
-    "BTDR",
-    "BTE",
-    "BTF",
-    "BTFX",
-    "BTG",
-    "BTGD",
-    "BTI",
-    "BTM",
-    "BTMD",
-    "BTMWW",
-    "BTO",
-    "BTOC",
-    "BTOG",
-    "BTOP",
-    "BTR",
-    "BTRN",
-    "BTSG",
-    "BTSGU",
-    "BTT",
-    "BTTR",
-    "BTU",
-    "BTZ",
-    "BUCK",
-    "BUD",
-    "BUFB",
-    "BUFC",
-    "BUFD",
-    "BUFF",
-    "BUFG",
-    "BUFP",
-    "BUFQ",
-    "BUFR",
-    "BUFS",
-    "BUFT",
-    "BUFY",
-    "BUFZ",
-    "BUG",
-    "BUI",
-    "BUJA",
-    "BUJAR",
-    "BUJAU",
-    "BUJAW",
-    "BUL",
-    "BULD",
-    "BULZ",
-    "BUR",
-    "BURL",
-    "BURU",
-    "BUSA",
-    "BUSE",
-    "BUXX",
-    "BUYO",
-    "BUYW",
-    "BUYZ",
-    "BUZZ",
-    "BV",
-    "BVFL",
-    "BVN",
-    "BVS",
-    "BW",
-    "BW$A",
-    "BWA",
-    "BWAY",
-    "BWB",
-    "BWBBP",
-    "BWEB",
-    "BWEN",
-    "BWET",
-    "BWFG",
-    "BWG",
-    "BWIN",
-    "BWLP",
-    "BWMN",
-    "BWMX",
-    "BWNB",
-    "BWSN",
-    "BWTG",
-    "BWX",
-    "BWXT",
-    "BWZ",
-    "BX",
-    "BXC",
-    "BXMT",
-    "BXMX",
-    "BXP",
-    "BXSL",
-    "BY",
-    "BYD",
-    "BYFC",
-    "BYLD",
-    "BYM",
-    "BYND",
-    "BYNO",
-    "BYNOU",
-    "BYNOW",
-    "BYON",
-    "BYRE",
-    "BYRN",
-    "BYSI",
-    "BYU",
-    "BZ",
-    "BZFD",
-    "BZFDW",
-    "BZH",
-    "BZQ",
-    "BZUN",
-    "C",
-    "C$N",
-    "CA",
-    "CAAA",
-    "CAAP",
-    "CAAS",
-    "CABA",
-    "CABO",
-    "CAC",
-    "CACC",
-    "CACI",
-    "CADE",
-    "CADE$A",
-    "CADL",
-    "CAE",
-    "CAF",
-    "CAFG",
-    "CAFX",
-    "CAG",
-    "CAH",
-    "CAKE",
-    "CAL",
-    "CALC",
-    "CALF",
-    "CALI",
-    "CALM",
-    "CALX",
-    "CAML",
-    "CAMP",
-    "CAMT",
-    "CAMX",
-    "CAN",
-    "CANC",
-    "CANE",
-    "CANF",
-    "CANG",
-    "CANQ",
-    "CAOS",
-    "CAPE",
-    "CAPL",
-    "CAPN",
-    "CAPNR",
-    "CAPNU",
-    "CAPR",
-    "CAPT",
-    "CAPTW",
-    "CAR",
-    "CARA",
-    "CARD",
-    "CARE",
-    "CARG",
-    "CARK",
-    "CARM",
-    "CARR",
-    "CARS",
-    "CART",
-    "CARU",
-    "CARV",
-    "CARY",
-    "CARZ",
-    "CASH",
-    "CASI",
-    "CASS",
-    "CASY",
-    "CAT",
-    "CATF",
-    "CATH",
-    "CATO",
-    "CATX",
-    "CATY",
-    "CAVA",
-    "CB",
-    "CBAN",
-    "CBAT",
-    "CBFV",
-    "CBL",
-    "CBLL",
-    "CBLS",
-    "CBNA",
-    "CBNK",
-    "CBO",
-    "CBOE",
-    "CBON",
-    "CBRE",
-    "CBRL",
-    "CBSE",
-    "CBSH",
-    "CBT",
-    "CBU",
-    "CBUS",
-    "CBX",
-    "CBZ",
-    "CC",
-    "CCAP",
-    "CCB",
-    "CCBG",
-    "CCCC",
-    "CCCS",
-    "CCD",
-    "CCEC",
-    "CCEF",
-    "CCEL",
-    "CCEP",
-    "CCG",
-    "CCGWW",
-    "CCI",
-    "CCIA",
-    "CCIF",
-    "CCIRU",
-    "CCIX",
-    "CCIXU",
-    "CCIXW",
-    "CCJ",
-    "CCK",
-    "CCL",
-    "CCLD",
-    "CCLDO",
-    "CCLDP",
-    "CCM",
-    "CCMG",
-    "CCNE",
-    "CCNEP",
-    "CCNR",
-    "CCO",
-    "CCOI",
-    "CCOR",
-    "CCRD",
-    "CCRN",
-    "CCRV",
-    "CCS",
-    "CCSB",
-    "CCSI",
-    "CCSO",
-    "CCTG",
-    "CCU",
-    "CCZ",
-    "CDC",
-    "CDE",
-    "CDEI",
-    "CDIO",
-    "CDIOW",
-    "CDL",
-    "CDLR",
-    "CDLX",
-    "CDMO",
-    "CDNA",
-    "CDNS",
-    "CDP",
-    "CDR$B",
-    "CDR$C",
-    "CDRE",
-    "CDRO",
-    "CDROW",
-    "CDT",
-    "CDTG",
-    "CDTTW",
-    "CDTX",
-    "CDW",
-    "CDX",
-    "CDXC",
-    "CDXS",
-    "CDZI",
-    "CDZIP",
-    "CE",
-    "CEAD",
-    "CEADW",
-    "CECO",
-    "CEE",
-    "CEF",
-    "CEFA",
-    "CEFD",
-    "CEFS",
-    "CEG",
-    "CEIX",
-    "CELC",
-    "CELG.R",
-    "CELH",
-    "CELU",
-    "CELUW",
-    "CELZ",
-    "CEMB",
-    "CENN",
-    "CENT",
-    "CENTA",
-    "CENX",
-    "CEP",
-    "CEPU",
-    "CERO",
-    "CEROW",
-    "CERS",
-    "CERT",
-    "CERY",
-    "CET",
-    "CETH",
-    "CETX",
-    "CETY",
-    "CEV",
-    "CEVA",
-    "CEW",
-    "CF",
-    "CFA",
-    "CFB",
-    "CFBK",
-    "CFFI",
-    "CFFN",
-    "CFFS",
-    "CFFSU",
-    "CFFSW",
-    "CFG",
-    "CFG$E",
-    "CFG$H",
-    "CFLT",
-    "CFO",
-    "CFR",
-    "CFR$B",
-    "CFSB",
-    "CG",
-    "CGA",
-    "CGABL",
-    "CGAU",
-    "CGBD",
-    "CGBDL",
-    "CGBL",
-    "CGBS",
-    "CGBSW",
-    "CGC",
-    "CGCB",
-    "CGCP",
-    "CGCV",
-    "CGDG",
-    "CGDV",
-    "CGEM",
-    "CGEN",
-    "CGGE",
-    "CGGO",
-    "CGGR",
-    "CGHM",
-    "CGIB",
-    "CGIC",
-    "CGIE",
-    "CGMS",
-    "CGMU",
-    "CGNG",
-    "CGNT",
-    "CGNX",
-    "CGO",
-    "CGON",
-    "CGRO",
-    "CGSD",
-    "CGSM",
-    "CGTX",
-    "CGUI",
-    "CGUS",
-    "CGV",
-    "CGW",
-    "CGXU",
-    "CHARU",
-    "CHAT",
-    "CHAU",
-    "CHCI",
-    "CHCO",
-    "CHCT",
-    "CHD",
-    "CHDN",
-    "CHE",
-    "CHEB",
-    "CHEB.U",
-    "CHEB.W",
-    "CHEF",
-    "CHEK",
-    "CHGG",
-    "CHGX",
-    "CHH",
-    "CHI",
-    "CHIQ",
-    "CHKP",
-    "CHMG",
-    "CHMI",
-    "CHMI$A",
-    "CHMI$B",
-    "CHN",
-    "CHNR",
-    "CHPS",
-    "CHPT",
-    "CHR",
-    "CHRD",
-    "CHRO",
-    "CHRS",
-    "CHRW",
-    "CHSCL",
-    "CHSCM",
-    "CHSCN",
-    "CHSCO",
-    "CHSCP",
-    "CHSN",
-    "CHT",
-    "CHTR",
-    "CHW",
-    "CHWY",
-    "CHX",
-    "CHY",
-    "CI",
-    "CIA",
-    "CIB",
-    "CIBR",
-    "CICB",
-    "CIEN",
-    "CIF",
-    "CIFR",
-    "CIFRW",
-    "CIG",
-    "CIG.C",
-    "CIGI",
-    "CII",
-    "CIK",
-    "CIL",
-    "CIM",
-    "CIM$A",
-    "CIM$B",
-    "CIM$C",
-    "CIM$D",
-    "CIMN",
-    "CIMO",
-    "CINF",
-    "CING",
-    "CINGW",
-    "CINT",
-    "CIO",
-    "CIO$A",
-    "CION",
-    "CISO",
-    "CISS",
-    "CITE",
-    "CITEU",
-    "CITEW",
-    "CIVB",
-    "CIVI",
-    "CIX",
-    "CJET",
-    "CJJD",
-    "CKPT",
-    "CKX",
-    "CL",
-    "CLAR",
-    "CLB",
-    "CLBK",
-    "CLBR",
-    "CLBR.U",
-    "CLBR.W",
-    "CLBT",
-    "CLCO",
-    "CLDI",
-    "CLDL",
-    "CLDT",
-    "CLDT$A",
-    "CLDX",
-    "CLEU",
-    "CLF",
-    "CLFD",
-    "CLGN",
-    "CLH",
-    "CLIK",
-    "CLIP",
-    "CLIR",
-    "CLIX",
-    "CLLS",
-    "CLM",
-    "CLMB",
-    "CLMT",
-    "CLNE",
-    "CLNN",
-    "CLNNW",
-    "CLNR",
-    "CLOA",
-    "CLOB",
-    "CLOD",
-    "CLOI",
-    "CLOU",
-    "CLOV",
-    "CLOX",
-    "CLOZ",
-    "CLPR",
-    "CLPS",
-    "CLPT",
-    "CLRB",
-    "CLRC",
-    "CLRCR",
-    "CLRCU",
-    "CLRCW",
-    "CLRO",
-    "CLS",
-    "CLSD",
-    "CLSE",
-    "CLSK",
-    "CLSKW",
-    "CLSM",
-    "CLST",
-    "CLVT",
-    "CLW",
-    "CLWT",
-    "CLX",
-    "CLYM",
-    "CM",
-    "CMA",
-    "CMAX",
-    "CMAXW",
-    "CMBM",
-    "CMBS",
-    "CMBT",
-    "CMC",
-    "CMCI",
-    "CMCL",
-    "CMCM",
-    "CMCO",
-    "CMCSA",
-    "CMCT",
-    "CMDT",
-    "CMDY",
-    "CME",
-    "CMF",
-    "CMG",
-    "CMI",
-    "CMLS",
-    "CMMB",
-    "CMND",
-    "CMP",
-    "CMPO",
-    "CMPOW",
-    "CMPR",
-    "CMPS",
-    "CMPX",
-    "CMRE",
-    "CMRE$B",
-    "CMRE$C",
-    "CMRE$D",
-    "CMRX",
-    "CMS",
-    "CMS$B",
-    "CMS$C",
-    "CMSA",
-    "CMSC",
-    "CMSD",
-    "CMT",
-    "CMTG",
-    "CMTL",
-    "CMU",
-    "CNA",
-    "CNAV",
-    "CNBS",
-    "CNC",
-    "CNCR",
-    "CNDT",
-    "CNEQ",
-    "CNET",
-    "CNEY",
-    "CNF",
-    "CNFR",
-    "CNFRZ",
-    "CNH",
-    "CNI",
-    "CNK",
-    "CNL",
-    "CNM",
-    "CNMD",
-    "CNNE",
-    "CNO",
-    "CNO$A",
-    "CNOB",
-    "CNOBP",
-    "CNP",
-    "CNQ",
-    "CNRG",
-    "CNS",
-    "CNSL",
-    "CNSP",
-    "CNTA",
-    "CNTB",
-    "CNTM",
-    "CNTX",
-    "CNTY",
-    "CNVS",
-    "CNX",
-    "CNXC",
-    "CNXN",
-    "CNXT",
-    "CNYA",
-    "COAL",
-    "COCH",
-    "COCHW",
-    "COCO",
-    "COCP",
-    "CODA",
-    "CODI",
-    "CODI$A",
-    "CODI$B",
-    "CODI$C",
-    "CODX",
-    "COE",
-    "COEP",
-    "COEPW",
-    "COF",
-    "COF$I",
-    "COF$J",
-    "COF$K",
-    "COF$L",
-    "COF$N",
-    "COFS",
-    "COGT",
-    "COHN",
-    "COHR",
-    "COHU",
-    "COIN",
-    "COKE",
-    "COLB",
-    "COLD",
-    "COLL",
-    "COLM",
-    "COM",
-    "COMB",
-    "COMM",
-    "COMP",
-    "COMT",
-    "CON",
-    "CONI",
-    "CONL",
-    "CONY",
-    "COO",
-    "COOK",
-    "COOP",
-    "COOT",
-    "COOTW",
-    "COP",
-    "COPA",
-    "COPJ",
-    "COPP",
-    "COPX",
-    "COR",
-    "CORN",
-    "CORP",
-    "CORT",
-    "CORZ",
-    "CORZW",
-    "CORZZ",
-    "COSM",
-    "COST",
-    "COTY",
-    "COUR",
-    "COWG",
-    "COWS",
-    "COWZ",
-    "COYA",
-    "CP",
-    "CPA",
-    "CPAC",
-    "CPAI",
-    "CPAY",
-    "CPB",
-    "CPBI",
-    "CPER",
-    "CPF",
-    "CPHC",
-    "CPHI",
-    "CPII",
-    "CPIX",
-    "CPK",
-    "CPLS",
-    "CPNG",
-    "CPNJ",
-    "CPNS",
-    "CPOP",
-    "CPRI",
-    "CPRJ",
-    "CPRO",
-    "CPRT",
-    "CPRX",
-    "CPS",
-    "CPSA",
-    "CPSH",
-    "CPSJ",
-    "CPSL",
-    "CPSM",
-    "CPSN",
-    "CPSO",
-    "CPSS",
-    "CPST",
-    "CPT",
-    "CPTN",
-    "CPTNW",
-    "CPZ",
-    "CQP",
-    "CQQQ",
-    "CR",
-    "CRAI",
-    "CRAK",
-    "CRBG",
-    "CRBN",
-    "CRBP",
-    "CRBU",
-    "CRC",
-    "CRCT",
-    "CRD.A",
-    "CRD.B",
-    "CRDF",
-    "CRDL",
-    "CRDO",
-    "CRDT",
-    "CRED",
-    "CREG",
-    "CRESW",
-    "CRESY",
-    "CREV",
-    "CREVW",
-    "CREX",
-    "CRF",
-    "CRGO",
-    "CRGOW",
-    "CRGX",
-    "CRGY",
-    "CRH",
-    "CRI",
-    "CRIS",
-    "CRIT",
-    "CRK",
-    "CRKN",
-    "CRL",
-    "CRM",
-    "CRMD",
-    "CRML",
-    "CRMLW",
-    "CRMT",
-    "CRNC",
-    "CRNT",
-    "CRNX",
-    "CRON",
-    "CROX",
-    "CRPT",
-    "CRS",
-    "CRSH",
-    "CRSP",
-    "CRSR",
-    "CRT",
-    "CRTC",
-    "CRTO",
-    "CRUS",
-    "CRUZ",
-    "CRVL",
-    "CRVO",
-    "CRVS",
-    "CRWD",
-    "CRWL",
-    "CRWS",
-    "CSA",
-    "CSAN",
-    "CSB",
-    "CSBR",
-    "CSCI",
-    "CSCO",
-    "CSD",
-    "CSF",
-    "CSGP",
-    "CSGS",
-    "CSHI",
-    "CSHP",
-    "CSIQ",
-    "CSL",
-    "CSLM",
-    "CSLMR",
-    "CSLMU",
-    "CSLMW",
-    "CSLR",
-    "CSLRW",
-    "CSM",
-    "CSMD",
-    "CSPI",
-    "CSQ",
-    "CSR",
-    "CSTE",
-    "CSTL",
-    "CSTM",
-    "CSV",
-    "CSWC",
-    "CSWCZ",
-    "CSWI",
-    "CSX",
-    "CTA",
-    "CTA$A",
-    "CTA$B",
-    "CTAS",
-    "CTBB",
-    "CTBI",
-    "CTCX",
-    "CTCXW",
-    "CTDD",
-    "CTEC",
-    "CTEST",
-    "CTEST.E",
-    "CTEST.G",
-    "CTEST.L",
-    "CTEST.O",
-    "CTEST.S",
-    "CTEST.V",
-    "CTEX",
-    "CTGO",
-    "CTHR",
-    "CTKB",
-    "CTLP",
-    "CTLT",
-    "CTM",
-    "CTMX",
-    "CTNM",
-    "CTNT",
-    "CTO",
-    "CTO$A",
-    "CTOR",
-    "CTOS",
-    "CTRA",
-    "CTRE",
-    "CTRI",
-    "CTRM",
-    "CTRN",
-    "CTS",
-    "CTSH",
-    "CTSO",
-    "CTV",
-    "CTV.W",
-    "CTVA",
-    "CTXR",
-    "CUB",
-    "CUBA",
-    "CUBB",
-    "CUBE",
-    "CUBI",
-    "CUBI$E",
-    "CUBI$F",
-    "CUBWU",
-    "CUBWW",
-    "CUE",
-    "CUK",
-    "CULP",
-    "CURB",
-    "CURE",
-    "CURI",
-    "CURIW",
-    "CURR",
-    "CURV",
-    "CUT",
-    "CUTR",
-    "CUZ",
-    "CVAC",
-    "CVAR",
-    "CVBF",
-    "CVCO",
-    "CVE",
-    "CVE.W",
-    "CVEO",
-    "CVGI",
-    "CVGW",
-    "CVI",
-    "CVIE",
-    "CVKD",
-    "CVLC",
-    "CVLG",
-    "CVLT",
-    "CVM",
-    "CVMC",
-    "CVNA",
-    "CVR",
-    "CVRD",
-    "CVRT",
-    "CVRX",
-    "CVS",
-    "CVSB",
-    "CVSE",
-    "CVU",
-    "CVV",
-    "CVX",
-    "CVY",
-    "CW",
-    "CWAN",
-    "CWB",
-    "CWBC",
-    "CWCO",
-    "CWD",
-    "CWEB",
-    "CWEN",
-    "CWEN.A",
-    "CWH",
-    "CWI",
-    "CWK",
-    "CWS",
-    "CWST",
-    "CWT",
-    "CX",
-    "CXAI",
-    "CXAIW",
-    "CXDO",
-    "CXE",
-    "CXH",
-    "CXM",
-    "CXSE",
-    "CXT",
-    "CXW",
-    "CYBN",
-    "CYBR",
-    "CYCC",
-    "CYCCP",
-    "CYCN",
-    "CYD",
-    "CYH",
-    "CYN",
-    "CYRX",
-    "CYTH",
-    "CYTHW",
-    "CYTK",
-    "CYTO",
-    "CZA",
-    "CZAR",
-    "CZFS",
-    "CZNC",
-    "CZR",
-    "CZWI",
-    "D",
-    "DAC",
-    "DADA",
-    "DAIO",
-    "DAKT",
-    "DAL",
-    "DALI",
-    "DALN",
-    "DAN",
-    "DAO",
-    "DAPP",
-    "DAPR",
-    "DAR",
-    "DARE",
-    "DARP",
-    "DASH",
-    "DAT",
-    "DATS",
-    "DATSW",
-    "DAUG",
-    "DAVA",
-    "DAVE",
-    "DAVEW",
-    "DAWN",
-    "DAX",
-    "DAY",
-    "DB",
-    "DBA",
-    "DBAW",
-    "DBB",
-    "DBC",
-    "DBD",
-    "DBE",
-    "DBEF",
-    "DBEM",
-    "DBEU",
-    "DBEZ",
-    "DBGI",
-    "DBGIW",
-    "DBI",
-    "DBJP",
-    "DBL",
-    "DBMF",
-    "DBND",
-    "DBO",
-    "DBP",
-    "DBRG",
-    "DBRG$H",
-    "DBRG$I",
-    "DBRG$J",
-    "DBVT",
-    "DBX",
-    "DC",
-    "DC.W",
-    "DCAP",
-    "DCBO",
-    "DCF",
-    "DCGO",
-    "DCI",
-    "DCMT",
-    "DCO",
-    "DCOM",
-    "DCOMG",
-    "DCOMP",
-    "DCOR",
-    "DCRE",
-    "DCTH",
-    "DD",
-    "DDC",
-    "DDD",
-    "DDEC",
-    "DDI",
-    "DDIV",
-    "DDL",
-    "DDLS",
-    "DDM",
-    "DDOG",
-    "DDS",
-    "DDT",
-    "DDWM",
-    "DE",
-    "DEA",
-    "DEC",
-    "DECA",
-    "DECAU",
-    "DECAW",
-    "DECK",
-    "DECO",
-    "DECP",
-    "DECT",
-    "DECW",
-    "DECZ",
-    "DEED",
-    "DEEF",
-    "DEEP",
-    "DEFI",
-    "DEHP",
-    "DEI",
-    "DELL",
-    "DEM",
-    "DEMZ",
-    "DENN",
-    "DEO",
-    "DERM",
-    "DES",
-    "DESK",
-    "DESP",
-    "DEUS",
-    "DEVS",
-    "DEW",
-    "DEXC",
-    "DFAC",
-    "DFAE",
-    "DFAI",
-    "DFAR",
-    "DFAS",
-    "DFAT",
-    "DFAU",
-    "DFAW",
-    "DFAX",
-    "DFCA",
-    "DFCF",
-    "DFE",
-    "DFEB",
-    "DFEM",
-    "DFEN",
-    "DFEV",
-    "DFGP",
-    "DFGR",
-    "DFGX",
-    "DFH",
-    "DFHY",
-    "DFIC",
-    "DFIN",
-    "DFIP",
-    "DFIS",
-    "DFIV",
-    "DFJ",
-    "DFLI",
-    "DFLIW",
-    "DFLV",
-    "DFND",
-    "DFNL",
-    "DFNM",
-    "DFNV",
-    "DFP",
-    "DFRA",
-    "DFS",
-    "DFSB",
-    "DFSD",
-    "DFSE",
-    "DFSI",
-    "DFSU",
-    "DFSV",
-    "DFUS",
-    "DFUV",
-    "DFVE",
-    "DFVX",
-    "DG",
-    "DGCB",
-    "DGHI",
-    "DGICA",
-    "DGICB",
-    "DGII",
-    "DGIN",
-    "DGLY",
-    "DGP",
-    "DGRE",
-    "DGRO",
-    "DGRS",
-    "DGRW",
-    "DGS",
-    "DGT",
-    "DGX",
-    "DGZ",
-    "DH",
-    "DHAI",
-    "DHAIW",
-    "DHC",
-    "DHCNI",
-    "DHCNL",
-    "DHDG",
-    "DHF",
-    "DHI",
-    "DHIL",
-    "DHR",
-    "DHS",
-    "DHT",
-    "DHX",
-    "DHY",
-    "DIA",
-    "DIAL",
-    "DIAX",
-    "DIBS",
-    "DIEM",
-    "DIG",
-    "DIHP",
-    "DIM",
-    "DIN",
-    "DINO",
-    "DINT",
-    "DIOD",
-    "DIPS",
-    "DIS",
-    "DISO",
-    "DIST",
-    "DISTR",
-    "DISTW",
-    "DISV",
-    "DIT",
-    "DIV",
-    "DIVB",
-    "DIVD",
-    "DIVG",
-    "DIVI",
-    "DIVL",
-    "DIVO",
-    "DIVP",
-    "DIVS",
-    "DIVY",
-    "DIVZ",
-    "DJAN",
-    "DJCB",
-    "DJCO",
-    "DJD",
-    "DJIA",
-    "DJP",
-    "DJT",
-    "DJTWW",
-    "DJUL",
-    "DJUN",
-    "DK",
-    "DKL",
-    "DKNG",
-    "DKS",
-    "DLB",
-    "DLHC",
-    "DLN",
-    "DLNG",
-    "DLNG$A",
-    "DLNG$B",
-    "DLO",
-    "DLPN",
-    "DLR",
-    "DLR$J",
-    "DLR$K",
-    "DLR$L",
-    "DLS",
-    "DLTH",
-    "DLTR",
-    "DLX",
-    "DLY",
-    "DM",
-    "DMA",
-    "DMAC",
-    "DMAR",
-    "DMAT",
-    "DMAY",
-    "DMB",
-    "DMBS",
-    "DMCY",
-    "DMF",
-    "DMLP",
-    "DMN",
-    "DMO",
-    "DMRC",
-    "DMXF",
-    "DMYY",
-    "DMYY.U",
-    "DMYY.W",
-    "DNA",
-    "DNB",
-    "DNL",
-    "DNLI",
-    "DNMR",
-    "DNN",
-    "DNOV",
-    "DNOW",
-    "DNP",
-    "DNTH",
-    "DNUT",
-    "DOC",
-    "DOCN",
-    "DOCS",
-    "DOCT",
-    "DOCU",
-    "DOG",
-    "DOGG",
-    "DOGZ",
-    "DOL",
-    "DOLE",
-    "DOMH",
-    "DOMO",
-    "DON",
-    "DOOO",
-    "DORM",
-    "DOUG",
-    "DOV",
-    "DOW",
-    "DOX",
-    "DOYU",
-    "DPG",
-    "DPRO",
-    "DPST",
-    "DPZ",
-    "DQ",
-    "DRAG",
-    "DRAI",
-    "DRCT",
-    "DRD",
-    "DRH",
-    "DRH$A",
-    "DRI",
-    "DRIO",
-    "DRIP",
-    "DRIV",
-    "DRLL",
-    "DRMA",
-    "DRMAW",
-    "DRN",
-    "DRRX",
-    "DRS",
-    "DRSK",
-    "DRTS",
-    "DRTSW",
-    "DRUG",
-    "DRUP",
-    "DRV",
-    "DRVN",
-    "DSCF",
-    "DSEP",
-    "DSGN",
-    "DSGR",
-    "DSGX",
-    "DSI",
-    "DSL",
-    "DSM",
-    "DSMC",
-    "DSP",
-    "DSS",
-    "DSTL",
-    "DSTX",
-    "DSU",
-    "DSWL",
-    "DSX",
-    "DSX$B",
-    "DSX.W",
-    "DSY",
-    "DSYWW",
-    "DT",
-    "DTAN",
-    "DTB",
-    "DTC",
-    "DTCK",
-    "DTCR",
-    "DTD",
-    "DTE",
-    "DTEC",
-    "DTF",
-    "DTG",
-    "DTH",
-    "DTI",
-    "DTIL",
-    "DTM",
-    "DTRE",
-    "DTSQ",
-    "DTSQR",
-    "DTSQU",
-    "DTSS",
-    "DTST",
-    "DTSTW",
-    "DTW",
-    "DUBS",
-    "DUET",
-    "DUETU",
-    "DUETW",
-    "DUG",
-    "DUHP",
-    "DUK",
-    "DUK$A",
-    "DUKB",
-    "DUKH",
-    "DUKQ",
-    "DUKX",
-    "DUKZ",
-    "DULL",
-    "DUO",
-    "DUOL",
-    "DUOT",
-    "DURA",
-    "DUSA",
-    "DUSB",
-    "DUSL",
-    "DUST",
-    "DV",
-    "DVA",
-    "DVAL",
-    "DVAX",
-    "DVDN",
-    "DVLU",
-    "DVN",
-    "DVND",
-    "DVOL",
-    "DVY",
-    "DVYA",
-    "DVYE",
-    "DWAS",
-    "DWAT",
-    "DWAW",
-    "DWCR",
-    "DWLD",
-    "DWM",
-    "DWMF",
-    "DWSH",
-    "DWSN",
-    "DWTX",
-    "DWUS",
-    "DWX",
-    "DX",
-    "DX$C",
-    "DXC",
-    "DXCM",
-    "DXD",
-    "DXIV",
-    "DXJ",
-    "DXJS",
-    "DXLG",
-    "DXPE",
-    "DXR",
-    "DXUV",
-    "DXYZ",
-    "DY",
-    "DYAI",
-    "DYCQ",
-    "DYCQR",
-    "DYCQU",
-    "DYFI",
-    "DYLD",
-    "DYLG",
-    "DYN",
-    "DYNF",
-    "DYNI",
-    "DYTA",
-    "DZZ",
-    "E",
-    "EA",
-    "EAD",
-    "EAF",
-    "EAFG",
-    "EAGG",
-    "EAGL",
-    "EAI",
-    "EALT",
-    "EAOA",
-    "EAOK",
-    "EAOM",
-    "EAOR",
-    "EAPR",
-    "EARN",
-    "EASG",
-    "EAST",
-    "EAT",
-    "EATV",
-    "EATZ",
-    "EB",
-    "EBAY",
-    "EBC",
-    "EBF",
-    "EBIT",
-    "EBIZ",
-    "EBMT",
-    "EBND",
-    "EBON",
-    "EBR",
-    "EBR.B",
-    "EBS",
-    "EBTC",
-    "EBUF",
-    "EC",
-    "ECAT",
-    "ECBK",
-    "ECC",
-    "ECC$D",
-    "ECCC",
-    "ECCF",
-    "ECCV",
-    "ECCW",
-    "ECCX",
-    "ECDA",
-    "ECDAW",
-    "ECF",
-    "ECF$A",
-    "ECG",
-    "ECH",
-    "ECL",
-    "ECLN",
-    "ECML",
-    "ECNS",
-    "ECO",
-    "ECON",
-    "ECOR",
-    "ECOW",
-    "ECPG",
-    "ECVT",
-    "ECX",
-    "ECXWW",
-    "ED",
-    "EDAP",
-    "EDBL",
-    "EDBLW",
-    "EDC",
-    "EDD",
-    "EDEN",
-    "EDF",
-    "EDGF",
-    "EDGH",
-    "EDGI",
-    "EDGU",
-    "EDIT",
-    "EDIV",
-    "EDN",
-    "EDOC",
-    "EDOG",
-    "EDOW",
-    "EDR",
-    "EDRY",
-    "EDSA",
-    "EDTK",
-    "EDU",
-    "EDUC",
-    "EDV",
-    "EDZ",
-    "EE",
-    "EEA",
-    "EEFT",
-    "EEIQ",
-    "EELV",
-    "EEM",
-    "EEMA",
-    "EEMO",
-    "EEMS",
-    "EEMV",
-    "EEMX",
-    "EES",
-    "EET",
-    "EETH",
-    "EEV",
-    "EEX",
-    "EFA",
-    "EFAA",
-    "EFAD",
-    "EFAS",
-    "EFAV",
-    "EFAX",
-    "EFC",
-    "EFC$A",
-    "EFC$B",
-    "EFC$C",
-    "EFC$D",
-    "EFC$E",
-    "EFG",
-    "EFIV",
-    "EFIX",
-    "EFNL",
-    "EFO",
-    "EFOI",
-    "EFR",
-    "EFRA",
-    "EFSC",
-    "EFSCP",
-    "EFSH",
-    "EFT",
-    "EFU",
-    "EFV",
-    "EFX",
-    "EFXT",
-    "EFZ",
-    "EG",
-    "EGAN",
-    "EGBN",
-    "EGF",
-    "EGHT",
-    "EGO",
-    "EGP",
-    "EGUS",
-    "EGY",
-    "EH",
-    "EHAB",
-    "EHC",
-    "EHGO",
-    "EHI",
-    "EHLS",
-    "EHTH",
-    "EIC",
-    "EICA",
-    "EICB",
-    "EICC",
-    "EIDO",
-    "EIG",
-    "EIIA",
-    "EIM",
-    "EINC",
-    "EIPI",
-    "EIPX",
-    "EIRL",
-    "EIS",
-    "EIX",
-    "EJAN",
-    "EJH",
-    "EJUL",
-    "EKG",
-    "EKSO",
-    "EL",
-    "ELA",
-    "ELAB",
-    "ELAN",
-    "ELBM",
-    "ELC",
-    "ELCV",
-    "ELD",
-    "ELDN",
-    "ELEV",
-    "ELF",
-    "ELLO",
-    "ELMD",
-    "ELME",
-    "ELP",
-    "ELPC",
-    "ELQD",
-    "ELS",
-    "ELSE",
-    "ELTK",
-    "ELTX",
-    "ELUT",
-    "ELV",
-    "ELVA",
-    "ELVN",
-    "ELWS",
-    "EM",
-    "EMB",
-    "EMBC",
-    "EMBD",
-    "EMC",
-    "EMCB",
-    "EMCC",
-    "EMCG",
-    "EMCGR",
-    "EMCGU",
-    "EMCGW",
-    "EMCR",
-    "EMCS",
-    "EMD",
-    "EMDM",
-    "EMDV",
-    "EME",
-    "EMEQ",
-    "EMF",
-    "EMGF",
-    "EMHC",
-    "EMHY",
-    "EMIF",
-    "EMKR",
-    "EML",
-    "EMLC",
-    "EMLP",
-    "EMM",
-    "EMMF",
-    "EMN",
-    "EMNT",
-    "EMO",
-    "EMOT",
-    "EMP",
-    "EMQQ",
-    "EMR",
-    "EMSF",
-    "EMTL",
-    "EMTY",
-    "EMX",
-    "EMXC",
-    "EMXF",
-    "ENB",
-    "ENFN",
-    "ENFR",
-    "ENG",
-    "ENGN",
-    "ENGNW",
-    "ENIC",
-    "ENJ",
-    "ENLC",
-    "ENLT",
-    "ENLV",
-    "ENO",
-    "ENOR",
-    "ENOV",
-    "ENPH",
-    "ENR",
-    "ENS",
-    "ENSC",
-    "ENSG",
-    "ENTA",
-    "ENTG",
-    "ENTO",
-    "ENTX",
-    "ENV",
-    "ENVA",
-    "ENVB",
-    "ENVX",
-    "ENX",
-    "ENZ",
-    "ENZL",
-    "EOCT",
-    "EOD",
-    "EOG",
-    "EOI",
-    "EOLS",
-    "EONR",
-    "EONR.W",
-    "EOS",
-    "EOSE",
-    "EOSEW",
-    "EOT",
-    "EP",
-    "EP$C",
-    "EPAC",
-    "EPAM",
-    "EPC",
-    "EPD",
-    "EPHE",
-    "EPI",
-    "EPIX",
-    "EPM",
-    "EPOL",
-    "EPOW",
-    "EPP",
-    "EPR",
-    "EPR$C",
-    "EPR$E",
-    "EPR$G",
-    "EPRF",
-    "EPRT",
-    "EPRX",
-    "EPS",
-    "EPSN",
-    "EPU",
-    "EPV",
-    "EQ",
-    "EQAL",
-    "EQBK",
-    "EQC",
-    "EQC$D",
-    "EQH",
-    "EQH$A",
-    "EQH$C",
-    "EQIN",
-    "EQIX",
-    "EQL",
-    "EQLS",
-    "EQLT",
-    "EQNR",
-    "EQR",
-    "EQRR",
-    "EQS",
-    "EQT",
-    "EQTY",
-    "EQUL",
-    "EQV",
-    "EQV.U",
-    "EQV.W",
-    "EQWL",
-    "EQX",
-    "ERAS",
-    "ERC",
-    "ERET",
-    "ERH",
-    "ERIC",
-    "ERIE",
-    "ERII",
-    "ERJ",
-    "ERNA",
-    "ERNZ",
-    "ERO",
-    "ERTH",
-    "ERX",
-    "ERY",
-    "ES",
-    "ESAB",
-    "ESBA",
-    "ESCA",
-    "ESE",
-    "ESEA",
-    "ESG",
-    "ESGA",
-    "ESGB",
-    "ESGD",
-    "ESGE",
-    "ESGG",
-    "ESGL",
-    "ESGLW",
-    "ESGR",
-    "ESGRO",
-    "ESGRP",
-    "ESGU",
-    "ESGV",
-    "ESGX",
-    "ESGY",
-    "ESHA",
-    "ESHAR",
-    "ESI",
-    "ESIX",
-    "ESLA",
-    "ESLAW",
-    "ESLT",
-    "ESML",
-    "ESMV",
-    "ESN",
-    "ESNT",
-    "ESOA",
-    "ESP",
-    "ESPO",
-    "ESPR",
-    "ESQ",
-    "ESRT",
-    "ESS",
-    "ESSA",
-    "ESTA",
-    "ESTC",
-    "ESUS",
-    "ET",
-    "ET$I",
-    "ETB",
-    "ETD",
-    "ETEC",
-    "ETG",
-    "ETH",
-    "ETHA",
-    "ETHD",
-    "ETHE",
-    "ETHO",
-    "ETHT",
-    "ETHU",
-    "ETHV",
-    "ETHW",
-    "ETI$",
-    "ETJ",
-    "ETN",
-    "ETNB",
-    "ETO",
-    "ETON",
-    "ETQ",
-    "ETR",
-    "ETSY",
-    "ETU",
-    "ETV",
-    "ETW",
-    "ETWO",
-    "ETWO.W",
-    "ETX",
-    "ETY",
-    "EU",
-    "EUAD",
-    "EUDA",
-    "EUDAW",
-    "EUDG",
-    "EUDV",
-    "EUFN",
-    "EUM",
-    "EUO",
-    "EURK",
-    "EURKR",
-    "EURKU",
-    "EURL",
-    "EUSA",
-    "EUSB",
-    "EUSC",
-    "EV",
-    "EVAV",
-    "EVAX",
-    "EVBN",
-    "EVC",
-    "EVCM",
-    "EVE",
-    "EVE.U",
-    "EVE.W",
-    "EVER",
-    "EVEX",
-    "EVEX.W",
-    "EVF",
-    "EVG",
-    "EVGN",
-    "EVGO",
-    "EVGOW",
-    "EVGR",
-    "EVGRU",
-    "EVGRW",
-    "EVH",
-    "EVHY",
-    "EVI",
-    "EVIM",
-    "EVLN",
-    "EVLU",
-    "EVLV",
-    "EVLVW",
-    "EVM",
-    "EVMT",
-    "EVN",
-    "EVNT",
-    "EVO",
-    "EVOK",
-    "EVR",
-    "EVRG",
-    "EVRI",
-    "EVSB",
-    "EVSD",
-    "EVSM",
-    "EVT",
-    "EVTC",
-    "EVTL",
-    "EVTR",
-    "EVTV",
-    "EVUS",
-    "EVV",
-    "EVX",
-    "EW",
-    "EWA",
-    "EWBC",
-    "EWC",
-    "EWCZ",
-    "EWD",
-    "EWG",
-    "EWH",
-    "EWI",
-    "EWJ",
-    "EWJV",
-    "EWK",
-    "EWL",
-    "EWM",
-    "EWN",
-    "EWO",
-    "EWP",
-    "EWQ",
-    "EWS",
-    "EWT",
-    "EWTX",
-    "EWU",
-    "EWUS",
-    "EWV",
-    "EWW",
-    "EWX",
-    "EWY",
-    "EWZ",
-    "EWZS",
-    "EXAI",
-    "EXAS",
-    "EXC",
-    "EXE",
-    "EXEEL",
-    "EXEEW",
-    "EXEEZ",
-    "EXEL",
-    "EXFY",
-    "EXG",
-    "EXI",
-    "EXK",
-    "EXLS",
-    "EXP",
-    "EXPD",
-    "EXPE",
-    "EXPI",
-    "EXPO",
-    "EXR",
-    "EXTO",
-    "EXTR",
-    "EYE",
-    "EYEG",
-    "EYEN",
-    "EYLD",
-    "EYPT",
-    "EZA",
-    "EZBC",
-    "EZET",
-    "EZFL",
-    "EZGO",
-    "EZJ",
-    "EZM",
-    "EZPW",
-    "EZU",
-    "F",
-    "F$B",
-    "F$C",
-    "F$D",
-    "FA",
-    "FAAR",
-    "FAAS",
-    "FAASW",
-    "FAB",
-    "FAD",
-    "FAF",
-    "FAIL",
-    "FALN",
-    "FAMI",
-    "FAN",
-    "FANG",
-    "FAPR",
-    "FARM",
-    "FARO",
-    "FAS",
-    "FAST",
-    "FAT",
-    "FATBB",
-    "FATBP",
-    "FATBW",
-    "FATE",
-    "FAUG",
-    "FAX",
-    "FAZ",
-    "FBCG",
-    "FBCV",
-    "FBIN",
-    "FBIO",
-    "FBIOP",
-    "FBIZ",
-    "FBK",
-    "FBL",
-    "FBLA",
-    "FBLG",
-    "FBMS",
-    "FBNC",
-    "FBND",
-    "FBOT",
-    "FBP",
-    "FBRT",
-    "FBRT$E",
-    "FBRX",
-    "FBT",
-    "FBTC",
-    "FBUF",
-    "FBY",
-    "FBYD",
-    "FBYDW",
-    "FBZ",
-    "FC",
-    "FCA",
-    "FCAL",
-    "FCAP",
-    "FCBC",
-    "FCCO",
-    "FCEF",
-    "FCEL",
-    "FCF",
-    "FCFS",
-    "FCFY",
-    "FCG",
-    "FCLD",
-    "FCN",
-    "FCNCA",
-    "FCNCO",
-    "FCNCP",
-    "FCO",
-    "FCOM",
-    "FCOR",
-    "FCPI",
-    "FCPT",
-    "FCRX",
-    "FCSH",
-    "FCT",
-    "FCTE",
-    "FCTR",
-    "FCUS",
-    "FCUV",
-    "FCVT",
-    "FCX",
-    "FDAT",
-    "FDBC",
-    "FDCE",
-    "FDCF",
-    "FDD",
-    "FDEC",
-    "FDEM",
-    "FDEV",
-    "FDFF",
-    "FDG",
-    "FDGR",
-    "FDHT",
-    "FDHY",
-    "FDIF",
-    "FDIG",
-    "FDIS",
-    "FDIV",
-    "FDL",
-    "FDLO",
-    "FDLS",
-    "FDM",
-    "FDMO",
-    "FDMT",
-    "FDN",
-    "FDND",
-    "FDNI",
-    "FDP",
-    "FDRR",
-    "FDRV",
-    "FDS",
-    "FDSB",
-    "FDT",
-    "FDTB",
-    "FDTS",
-    "FDTX",
-    "FDUS",
-    "FDV",
-    "FDVL",
-    "FDVV",
-    "FDWM",
-    "FDX",
-    "FE",
-    "FEAM",
-    "FEBO",
-    "FEBP",
-    "FEBT",
-    "FEBW",
-    "FEBZ",
-    "FEDL",
-    "FEDM",
-    "FEDU",
-    "FEIG",
-    "FEIM",
-    "FELC",
-    "FELE",
-    "FELG",
-    "FELV",
-    "FEM",
-    "FEMB",
-    "FEMS",
-    "FEMY",
-    "FENC",
-    "FENG",
-    "FENI",
-    "FENY",
-    "FEP",
-    "FEPI",
-    "FER",
-    "FERG",
-    "FESM",
-    "FET",
-    "FETH",
-    "FEUS",
-    "FEUZ",
-    "FEX",
-    "FEZ",
-    "FF",
-    "FFA",
-    "FFBC",
-    "FFC",
-    "FFEB",
-    "FFIC",
-    "FFIE",
-    "FFIEW",
-    "FFIN",
-    "FFIU",
-    "FFIV",
-    "FFLC",
-    "FFLG",
-    "FFLS",
-    "FFLV",
-    "FFND",
-    "FFNW",
-    "FFOG",
-    "FFSM",
-    "FFTY",
-    "FFWM",
-    "FG",
-    "FGB",
-    "FGBI",
-    "FGBIP",
-    "FGD",
-    "FGDL",
-    "FGEN",
-    "FGF",
-    "FGFPP",
-    "FGI",
-    "FGIWW",
-    "FGL",
-    "FGM",
-    "FGN",
-    "FHB",
-    "FHDG",
-    "FHEQ",
-    "FHI",
-    "FHLC",
-    "FHN",
-    "FHN$B",
-    "FHN$C",
-    "FHN$E",
-    "FHN$F",
-    "FHTX",
-    "FHYS",
-    "FI",
-    "FIAT",
-    "FIAX",
-    "FIBK",
-    "FIBR",
-    "FICO",
-    "FICS",
-    "FID",
-    "FIDI",
-    "FIDU",
-    "FIG",
-    "FIGB",
-    "FIGS",
-    "FIHL",
-    "FIIG",
-    "FILL",
-    "FINE",
-    "FINS",
-    "FINV",
-    "FINW",
-    "FINX",
-    "FIP",
-    "FIRI",
-    "FIRS",
-    "FIS",
-    "FISI",
-    "FISK",
-    "FISR",
-    "FITB",
-    "FITBI",
-    "FITBO",
-    "FITBP",
-    "FITE",
-    "FIVA",
-    "FIVE",
-    "FIVN",
-    "FIW",
-    "FIX",
-    "FIXD",
-    "FIZZ",
-    "FJAN",
-    "FJP",
-    "FJUL",
-    "FJUN",
-    "FKU",
-    "FKWL",
-    "FL",
-    "FLAO",
-    "FLAU",
-    "FLAX",
-    "FLBL",
-    "FLBR",
-    "FLC",
-    "FLCA",
-    "FLCB",
-    "FLCC",
-    "FLCG",
-    "FLCH",
-    "FLCO",
-    "FLCV",
-    "FLD",
-    "FLDB",
-    "FLDDU",
-    "FLDDW",
-    "FLDR",
-    "FLDZ",
-    "FLEE",
-    "FLEU",
-    "FLEX",
-    "FLG",
-    "FLG$A",
-    "FLG$U",
-    "FLGB",
-    "FLGC",
-    "FLGR",
-    "FLGT",
-    "FLGV",
-    "FLHK",
-    "FLHY",
-    "FLIA",
-    "FLIC",
-    "FLIN",
-    "FLJH",
-    "FLJJ",
-    "FLJP",
-    "FLKR",
-    "FLL",
-    "FLLA",
-    "FLMB",
-    "FLMI",
-    "FLMX",
-    "FLN",
-    "FLNC",
-    "FLNG",
-    "FLNT",
-    "FLO",
-    "FLOT",
-    "FLOW",
-    "FLQL",
-    "FLQM",
-    "FLQS",
-    "FLR",
-    "FLRG",
-    "FLRN",
-    "FLRT",
-    "FLS",
-    "FLSA",
-    "FLSP",
-    "FLSW",
-    "FLTB",
-    "FLTR",
-    "FLTW",
-    "FLUD",
-    "FLUT",
-    "FLUX",
-    "FLV",
-    "FLWS",
-    "FLX",
-    "FLXR",
-    "FLXS",
-    "FLYD",
-    "FLYE",
-    "FLYU",
-    "FLYW",
-    "FLYX",
-    "FLYX.W",
-    "FM",
-    "FMAG",
-    "FMAO",
-    "FMAR",
-    "FMAT",
-    "FMAY",
-    "FMB",
-    "FMBH",
-    "FMC",
-    "FMCE",
-    "FMCX",
-    "FMDE",
-    "FMED",
-    "FMET",
-    "FMF",
-    "FMHI",
-    "FMN",
-    "FMNB",
-    "FMNY",
-    "FMQQ",
-    "FMS",
-    "FMST",
-    "FMSTW",
-    "FMX",
-    "FMY",
-    "FN",
-    "FNA",
-    "FNB",
-    "FNCL",
-    "FND",
-    "FNDA",
-    "FNDB",
-    "FNDC",
-    "FNDE",
-    "FNDF",
-    "FNDX",
-    "FNF",
-    "FNGD",
-    "FNGG",
-    "FNGO",
-    "FNGR",
-    "FNGS",
-    "FNGU",
-    "FNK",
-    "FNKO",
-    "FNLC",
-    "FNOV",
-    "FNV",
-    "FNWB",
-    "FNWD",
-    "FNX",
-    "FNY",
-    "FOA",
-    "FOCT",
-    "FOF",
-    "FOLD",
-    "FONR",
-    "FOR",
-    "FORA",
-    "FORD",
-    "FORH",
-    "FORL",
-    "FORLU",
-    "FORLW",
-    "FORM",
-    "FORR",
-    "FORTY",
-    "FOSL",
-    "FOSLL",
-    "FOUR",
-    "FOVL",
-    "FOX",
-    "FOXA",
-    "FOXF",
-    "FOXO",
-    "FOXX",
-    "FOXXW",
-    "FPA",
-    "FPAG",
-    "FPAS",
-    "FPAY",
-    "FPE",
-    "FPEI",
-    "FPF",
-    "FPFD",
-    "FPH",
-    "FPI",
-    "FPRO",
-    "FPX",
-    "FPXE",
-    "FPXI",
-    "FQAL",
-    "FR",
-    "FRA",
-    "FRAF",
-    "FRBA",
-    "FRD",
-    "FRDM",
-    "FREL",
-    "FRES",
-    "FREY",
-    "FREY.W",
-    "FRGE",
-    "FRGT",
-    "FRHC",
-    "FRI",
-    "FRME",
-    "FRMEP",
-    "FRNW",
-    "FRO",
-    "FROG",
-    "FRPH",
-    "FRPT",
-    "FRSH",
-    "FRST",
-    "FRSX",
-    "FRT",
-    "FRT$C",
-    "FRTY",
-    "FSBC",
-    "FSBD",
-    "FSBW",
-    "FSCC",
-    "FSCO",
-    "FSCS",
-    "FSEA",
-    "FSEC",
-    "FSEP",
-    "FSFG",
-    "FSHP",
-    "FSHPR",
-    "FSHPU",
-    "FSI",
-    "FSIG",
-    "FSK",
-    "FSLD",
-    "FSLR",
-    "FSLY",
-    "FSM",
-    "FSMB",
-    "FSMD",
-    "FSP",
-    "FSS",
-    "FSST",
-    "FSTA",
-    "FSTR",
-    "FSUN",
-    "FSV",
-    "FSYD",
-    "FSZ",
-    "FT",
-    "FTA",
-    "FTAG",
-    "FTAI",
-    "FTAIM",
-    "FTAIN",
-    "FTAIO",
-    "FTBD",
-    "FTC",
-    "FTCB",
-    "FTCE",
-    "FTCI",
-    "FTCS",
-    "FTDR",
-    "FTDS",
-    "FTEC",
-    "FTEK",
-    "FTEL",
-    "FTF",
-    "FTFT",
-    "FTGC",
-    "FTGS",
-    "FTHF",
-    "FTHI",
-    "FTHM",
-    "FTHY",
-    "FTI",
-    "FTIF",
-    "FTII",
-    "FTIIU",
-    "FTIIW",
-    "FTK",
-    "FTLF",
-    "FTLS",
-    "FTNT",
-    "FTQI",
-    "FTRB",
-    "FTRE",
-    "FTRI",
-    "FTS",
-    "FTSD",
-    "FTSL",
-    "FTSM",
-    "FTV",
-    "FTWO",
-    "FTXG",
-    "FTXH",
-    "FTXL",
-    "FTXN",
-    "FTXO",
-    "FTXR",
-    "FUBO",
-    "FUFU",
-    "FUFUW",
-    "FUL",
-    "FULC",
-    "FULT",
-    "FULTP",
-    "FUMB",
-    "FUN",
-    "FUNC",
-    "FUND",
-    "FUNL",
-    "FURY",
-    "FUSB",
-    "FUSI",
-    "FUTU",
-    "FUTY",
-    "FV",
-    "FVAL",
-    "FVC",
-    "FVCB",
-    "FVD",
-    "FVN",
-    "FVNNR",
-    "FVNNU",
-    "FVR",
-    "FVRR",
-    "FWD",
-    "FWONA",
-    "FWONK",
-    "FWRD",
-    "FWRG",
-    "FXA",
-    "FXB",
-    "FXC",
-    "FXD",
-    "FXE",
-    "FXED",
-    "FXF",
-    "FXG",
-    "FXH",
-    "FXI",
-    "FXL",
-    "FXN",
-    "FXNC",
-    "FXO",
-    "FXP",
-    "FXR",
-    "FXU",
-    "FXY",
-    "FXZ",
-    "FYBR",
-    "FYC",
-    "FYEE",
-    "FYLD",
-    "FYLG",
-    "FYT",
-    "FYX",
-    "G",
-    "GAA",
-    "GAB",
-    "GAB$G",
-    "GAB$H",
-    "GAB$K",
-    "GABC",
-    "GABF",
-    "GAEM",
-    "GAIA",
-    "GAIN",
-    "GAINL",
-    "GAINN",
-    "GAINZ",
-    "GAL",
-    "GALT",
-    "GAM",
-    "GAM$B",
-    "GAMB",
-    "GAME",
-    "GAMR",
-    "GAN",
-    "GANX",
-    "GAP",
-    "GAPR",
-    "GARP",
-    "GASS",
-    "GAST",
-    "GATE",
-    "GATEU",
-    "GATEW",
-    "GATO",
-    "GATX",
-    "GAU",
-    "GAUG",
-    "GAUZ",
-    "GB",
-    "GB.W",
-    "GBAB",
-    "GBBK",
-    "GBBKR",
-    "GBBKW",
-    "GBCI",
-    "GBDC",
-    "GBF",
-    "GBIL",
-    "GBIO",
-    "GBLD",
-    "GBLI",
-    "GBR",
-    "GBTC",
-    "GBTG",
-    "GBUY",
-    "GBX",
-    "GCAD",
-    "GCAL",
-    "GCBC",
-    "GCC",
-    "GCI",
-    "GCLN",
-    "GCMG",
-    "GCMGW",
-    "GCO",
-    "GCOR",
-    "GCOW",
-    "GCT",
-    "GCTK",
-    "GCTS",
-    "GCTS.W",
-    "GCV",
-    "GD",
-    "GDC",
-    "GDDY",
-    "GDE",
-    "GDEC",
-    "GDEN",
-    "GDEV",
-    "GDEVW",
-    "GDHG",
-    "GDIV",
-    "GDL",
-    "GDL$C",
-    "GDMA",
-    "GDMN",
-    "GDO",
-    "GDOC",
-    "GDOT",
-    "GDRX",
-    "GDS",
-    "GDST",
-    "GDSTR",
-    "GDSTU",
-    "GDSTW",
-    "GDTC",
-    "GDV",
-    "GDV$H",
-    "GDV$K",
-    "GDX",
-    "GDXD",
-    "GDXJ",
-    "GDXU",
-    "GDXY",
-    "GDYN",
-    "GE",
-    "GECC",
-    "GECCH",
-    "GECCI",
-    "GECCO",
-    "GECCZ",
-    "GEF",
-    "GEF.B",
-    "GEG",
-    "GEGGL",
-    "GEHC",
-    "GEL",
-    "GELS",
-    "GEM",
-    "GEMD",
-    "GEN",
-    "GENC",
-    "GENE",
-    "GENI",
-    "GENK",
-    "GENM",
-    "GENT",
-    "GEO",
-    "GEOS",
-    "GERN",
-    "GES",
-    "GETY",
-    "GEV",
-    "GEVO",
-    "GF",
-    "GFAI",
-    "GFAIW",
-    "GFEB",
-    "GFF",
-    "GFGF",
-    "GFI",
-    "GFL",
-    "GFOF",
-    "GFR",
-    "GFS",
-    "GGAL",
-    "GGB",
-    "GGG",
-    "GGLL",
-    "GGLS",
-    "GGM",
-    "GGME",
-    "GGN",
-    "GGN$B",
-    "GGR",
-    "GGROW",
-    "GGRW",
-    "GGT",
-    "GGT$E",
-    "GGT$G",
-    "GGUS",
-    "GGZ",
-    "GH",
-    "GHC",
-    "GHG",
-    "GHI",
-    "GHIX",
-    "GHIXU",
-    "GHIXW",
-    "GHLD",
-    "GHM",
-    "GHMS",
-    "GHRS",
-    "GHTA",
-    "GHY",
-    "GHYB",
-    "GHYG",
-    "GIAX",
-    "GIB",
-    "GIC",
-    "GIFI",
-    "GIFT",
-    "GIG",
-    "GIGB",
-    "GIGGU",
-    "GIGGW",
-    "GIGM",
-    "GII",
-    "GIII",
-    "GIL",
-    "GILD",
-    "GILT",
-    "GINN",
-    "GINX",
-    "GIPR",
-    "GIPRW",
-    "GIS",
-    "GJAN",
-    "GJH",
-    "GJO",
-    "GJP",
-    "GJR",
-    "GJS",
-    "GJT",
-    "GJUL",
-    "GJUN",
-    "GK",
-    "GKOS",
-    "GL",
-    "GL$D",
-    "GLAC",
-    "GLACR",
-    "GLACU",
-    "GLAD",
-    "GLADZ",
-    "GLBE",
-    "GLBL",
-    "GLBS",
-    "GLBZ",
-    "GLD",
-    "GLDD",
-    "GLDG",
-    "GLDI",
-    "GLDM",
-    "GLE",
-    "GLIN",
-    "GLL",
-    "GLLI",
-    "GLLIR",
-    "GLLIU",
-    "GLLIW",
-    "GLMD",
-    "GLNG",
-    "GLO",
-    "GLOB",
-    "GLOF",
-    "GLOP$A",
-    "GLOP$B",
-    "GLOP$C",
-    "GLOV",
-    "GLOW",
-    "GLP",
-    "GLP$B",
-    "GLPG",
-    "GLPI",
-    "GLQ",
-    "GLRE",
-    "GLRY",
-    "GLSI",
-    "GLST",
-    "GLSTR",
-    "GLSTU",
-    "GLSTW",
-    "GLTO",
-    "GLTR",
-    "GLU",
-    "GLU$A",
-    "GLU$B",
-    "GLUE",
-    "GLV",
-    "GLW",
-    "GLXG",
-    "GLYC",
-    "GM",
-    "GMAB",
-    "GMAR",
-    "GMAY",
-    "GME",
-    "GMED",
-    "GMET",
-    "GMF",
-    "GMGI",
-    "GMM",
-    "GMMA",
-    "GMNY",
-    "GMOI",
-    "GMOM",
-    "GMOV",
-    "GMRE",
-    "GMRE$A",
-    "GMS",
-    "GMUB",
-    "GMUN",
-    "GNE",
-    "GNFT",
-    "GNK",
-    "GNL",
-    "GNL$A",
-    "GNL$B",
-    "GNL$D",
-    "GNL$E",
-    "GNLN",
-    "GNLX",
-    "GNMA",
-    "GNOM",
-    "GNOV",
-    "GNPX",
-    "GNR",
-    "GNRC",
-    "GNS",
-    "GNSS",
-    "GNT",
-    "GNT$A",
-    "GNTA",
-    "GNTX",
-    "GNTY",
-    "GNW",
-    "GO",
-    "GOAU",
-    "GOCO",
-    "GOCT",
-    "GODN",
-    "GODNR",
-    "GODNU",
-    "GOEV",
-    "GOEVW",
-    "GOEX",
-    "GOF",
-    "GOGL",
-    "GOGO",
-    "GOLD",
-    "GOLF",
-    "GOLY",
-    "GOOD",
-    "GOODN",
-    "GOODO",
-    "GOOG",
-    "GOOGL",
-    "GOOP",
-    "GOOS",
-    "GOOX",
-    "GOOY",
-    "GORO",
-    "GORV",
-    "GOSS",
-    "GOTU",
-    "GOVI",
-    "GOVT",
-    "GOVX",
-    "GOVXW",
-    "GOVZ",
-    "GP",
-    "GPAT",
-    "GPATU",
-    "GPATW",
-    "GPC",
-    "GPCR",
-    "GPI",
-    "GPIQ",
-    "GPIX",
-    "GPJA",
-    "GPK",
-    "GPMT",
-    "GPMT$A",
-    "GPN",
-    "GPOR",
-    "GPOW",
-    "GPRE",
-    "GPRF",
-    "GPRK",
-    "GPRO",
-    "GPUS",
-    "GPUS$D",
-    "GQI",
-    "GQQQ",
-    "GQRE",
-    "GRAB",
-    "GRABW",
-    "GRAF",
-    "GRAF.U",
-    "GRAF.W",
-    "GRAL",
-    "GRBK",
-    "GRBK$A",
-    "GRC",
-    "GRCE",
-    "GRDN",
-    "GREE",
-    "GREEL",
-    "GREI",
-    "GREK",
-    "GRF",
-    "GRFS",
-    "GRFX",
-    "GRI",
-    "GRID",
-    "GRMN",
-    "GRN",
-    "GRNB",
-    "GRND",
-    "GRND.W",
-    "GRNQ",
-    "GRNT",
-    "GRNY",
-    "GROV",
-    "GROW",
-    "GROY",
-    "GROY.W",
-    "GRP.U",
-    "GRPM",
-    "GRPN",
-    "GRPZ",
-    "GRRR",
-    "GRRRW",
-    "GRVY",
-    "GRW",
-    "GRWG",
-    "GRX",
-    "GRYP",
-    "GS",
-    "GS$A",
-    "GS$C",
-    "GS$D",
-    "GSAT",
-    "GSBC",
-    "GSBD",
-    "GSC",
-    "GSEE",
-    "GSEP",
-    "GSEU",
-    "GSEW",
-    "GSFP",
-    "GSG",
-    "GSHD",
-    "GSIB",
-    "GSID",
-    "GSIE",
-    "GSIG",
-    "GSIT",
-    "GSIW",
-    "GSJY",
-    "GSK",
-    "GSL",
-    "GSL$B",
-    "GSLC",
-    "GSM",
-    "GSMGW",
-    "GSPY",
-    "GSRTU",
-    "GSSC",
-    "GSST",
-    "GSUN",
-    "GSUS",
-    "GSY",
-    "GT",
-    "GTBP",
-    "GTE",
-    "GTEC",
-    "GTEK",
-    "GTES",
-    "GTI",
-    "GTIM",
-    "GTIP",
-    "GTLB",
-    "GTLS",
-    "GTLS$B",
-    "GTN",
-    "GTN.A",
-    "GTO",
-    "GTR",
-    "GTX",
-    "GTY",
-    "GUG",
-    "GUMI",
-    "GUNR",
-    "GUNZ",
-    "GURE",
-    "GURU",
-    "GUSA",
-    "GUSH",
-    "GUT",
-    "GUT$C",
-    "GUTS",
-    "GV",
-    "GVA",
-    "GVAL",
-    "GVH",
-    "GVI",
-    "GVIP",
-    "GVLU",
-    "GVUS",
-    "GWAV",
-    "GWH",
-    "GWH.W",
-    "GWRE",
-    "GWRS",
-    "GWW",
-    "GWX",
-    "GXAI",
-    "GXC",
-    "GXG",
-    "GXO",
-    "GXTG",
-    "GXUS",
-    "GYLD",
-    "GYRE",
-    "GYRO",
-    "H",
-    "HACK",
-    "HAE",
-    "HAFC",
-    "HAFN",
-    "HAIA",
-    "HAIAU",
-    "HAIAW",
-    "HAIL",
-    "HAIN",
-    "HAL",
-    "HALO",
-    "HAO",
-    "HAP",
-    "HAPI",
-    "HAPR",
-    "HAPS",
-    "HAPY",
-    "HARD",
-    "HART",
-    "HAS",
-    "HASI",
-    "HAUS",
-    "HAUZ",
-    "HAWX",
-    "HAYN",
-    "HAYW",
-    "HBAN",
-    "HBANL",
-    "HBANM",
-    "HBANP",
-    "HBB",
-    "HBCP",
-    "HBI",
-    "HBIO",
-    "HBM",
-    "HBNC",
-    "HBT",
-    "HCA",
-    "HCAT",
-    "HCC",
-    "HCI",
-    "HCKT",
-    "HCM",
-    "HCMT",
-    "HCOM",
-    "HCOW",
-    "HCP",
-    "HCRB",
-    "HCSG",
-    "HCTI",
-    "HCVI",
-    "HCVIU",
-    "HCVIW",
-    "HCWB",
-    "HCWC",
-    "HCXY",
-    "HD",
-    "HDB",
-    "HDEF",
-    "HDG",
-    "HDGE",
-    "HDL",
-    "HDLB",
-    "HDMV",
-    "HDRO",
-    "HDSN",
-    "HDUS",
-    "HDV",
-    "HE",
-    "HEAR",
-    "HEAT",
-    "HECO",
-    "HEDJ",
-    "HEEM",
-    "HEES",
-    "HEFA",
-    "HEGD",
-    "HEI",
-    "HEI.A",
-    "HEJD",
-    "HELE",
-    "HELO",
-    "HELX",
-    "HEPA",
-    "HEPS",
-    "HEQ",
-    "HEQT",
-    "HERD",
-    "HERO",
-    "HES",
-    "HESM",
-    "HEWJ",
-    "HEZU",
-    "HF",
-    "HFBL",
-    "HFFG",
-    "HFGO",
-    "HFND",
-    "HFRO",
-    "HFRO$A",
-    "HFSP",
-    "HFWA",
-    "HFXI",
-    "HG",
-    "HGBL",
-    "HGER",
-    "HGLB",
-    "HGTY",
-    "HGV",
-    "HHH",
-    "HHS",
-    "HI",
-    "HIBL",
-    "HIBS",
-    "HIDE",
-    "HIDV",
-    "HIE",
-    "HIFS",
-    "HIG",
-    "HIG$G",
-    "HIGH",
-    "HIHO",
-    "HII",
-    "HIMS",
-    "HIMX",
-    "HIO",
-    "HIPO",
-    "HIPS",
-    "HISF",
-    "HITI",
-    "HIVE",
-    "HIW",
-    "HIX",
-    "HIYS",
-    "HJAN",
-    "HJUL",
-    "HKD",
-    "HKIT",
-    "HKND",
-    "HL",
-    "HL$B",
-    "HLAL",
-    "HLF",
-    "HLGE",
-    "HLI",
-    "HLIO",
-    "HLIT",
-    "HLLY",
-    "HLLY.W",
-    "HLMN",
-    "HLN",
-    "HLNE",
-    "HLP",
-    "HLT",
-    "HLVX",
-    "HLX",
-    "HLXB",
-    "HMC",
-    "HMN",
-    "HMOP",
-    "HMST",
-    "HMY",
-    "HNDL",
-    "HNI",
-    "HNNA",
-    "HNNAZ",
-    "HNRG",
-    "HNST",
-    "HNVR",
-    "HNW",
-    "HOCT",
-    "HODL",
-    "HOFT",
-    "HOFV",
-    "HOFVW",
-    "HOG",
-    "HOLO",
-    "HOLOW",
-    "HOLX",
-    "HOMB",
-    "HOMZ",
-    "HON",
-    "HOND",
-    "HONDU",
-    "HONDW",
-    "HONE",
-    "HOOD",
-    "HOOK",
-    "HOPE",
-    "HOTH",
-    "HOUR",
-    "HOUS",
-    "HOV",
-    "HOVNP",
-    "HOVR",
-    "HOVRW",
-    "HOWL",
-    "HP",
-    "HPAI",
-    "HPAIW",
-    "HPE",
-    "HPE$C",
-    "HPF",
-    "HPH",
-    "HPI",
-    "HPK",
-    "HPKEW",
-    "HPP",
-    "HPP$C",
-    "HPQ",
-    "HPS",
-    "HQGO",
-    "HQH",
-    "HQI",
-    "HQL",
-    "HQY",
-    "HR",
-    "HRB",
-    "HRI",
-    "HRL",
-    "HRMY",
-    "HROW",
-    "HROWL",
-    "HROWM",
-    "HRTG",
-    "HRTS",
-    "HRTX",
-    "HRYU",
-    "HRZN",
-    "HSAI",
-    "HSBC",
-    "HSBH",
-    "HSCS",
-    "HSCSW",
-    "HSCZ",
-    "HSDT",
-    "HSHP",
-    "HSIC",
-    "HSII",
-    "HSMV",
-    "HSON",
-    "HSPO",
-    "HSPOR",
-    "HSPOU",
-    "HSPOW",
-    "HSPTU",
-    "HSRT",
-    "HST",
-    "HSTM",
-    "HSUN",
-    "HSY",
-    "HTAB",
-    "HTBI",
-    "HTBK",
-    "HTCO",
-    "HTCR",
-    "HTD",
-    "HTEC",
-    "HTFB",
-    "HTFC",
-    "HTGC",
-    "HTH",
-    "HTHT",
-    "HTIA",
-    "HTIBP",
-    "HTLD",
-    "HTLF",
-    "HTLFP",
-    "HTLM",
-    "HTOO",
-    "HTOOW",
-    "HTRB",
-    "HTUS",
-    "HTZ",
-    "HTZWW",
-    "HUBB",
-    "HUBC",
-    "HUBCW",
-    "HUBCZ",
-    "HUBG",
-    "HUBS",
-    "HUDA",
-    "HUDAR",
-    "HUDAU",
-    "HUDI",
-    "HUHU",
-    "HUIZ",
-    "HUM",
-    "HUMA",
-    "HUMAW",
-    "HUN",
-    "HURA",
-    "HURC",
-    "HURN",
-    "HUSA",
-    "HUSV",
-    "HUT",
-    "HUYA",
-    "HVT",
-    "HVT.A",
-    "HWAY",
-    "HWBK",
-    "HWC",
-    "HWCPZ",
-    "HWH",
-    "HWKN",
-    "HWM",
-    "HWM$",
-    "HXL",
-    "HY",
-    "HYAC",
-    "HYAC.U",
-    "HYAC.W",
-    "HYB",
-    "HYBB",
-    "HYBI",
-    "HYBL",
-    "HYBX",
-    "HYD",
-    "HYDB",
-    "HYDR",
-    "HYDW",
-    "HYEM",
-    "HYFI",
-    "HYFM",
-    "HYG",
-    "HYGH",
-    "HYGI",
-    "HYGV",
-    "HYGW",
-    "HYHG",
-    "HYI",
-    "HYIN",
-    "HYKE",
-    "HYLB",
-    "HYLG",
-    "HYLN",
-    "HYLS",
-    "HYMB",
-    "HYMC",
-    "HYMCL",
-    "HYMCW",
-    "HYMU",
-    "HYPR",
-    "HYRM",
-    "HYS",
-    "HYSA",
-    "HYSD",
-    "HYT",
-    "HYTR",
-    "HYUP",
-    "HYXF",
-    "HYXU",
-    "HYZD",
-    "HYZN",
-    "HYZNW",
-    "HZO",
-    "IAC",
-    "IAE",
-    "IAF",
-    "IAG",
-    "IAGG",
-    "IAI",
-    "IAK",
-    "IAPR",
-    "IART",
-    "IAS",
-    "IAT",
-    "IAU",
-    "IAUG",
-    "IAUM",
-    "IAUX",
-    "IBAC",
-    "IBACR",
-    "IBAT",
-    "IBB",
-    "IBBQ",
-    "IBCP",
-    "IBD",
-    "IBDP",
-    "IBDQ",
-    "IBDR",
-    "IBDS",
-    "IBDT",
-    "IBDU",
-    "IBDV",
-    "IBDW",
-    "IBDX",
-    "IBDY",
-    "IBDZ",
-    "IBEX",
-    "IBG",
-    "IBGA",
-    "IBGK",
-    "IBHD",
-    "IBHE",
-    "IBHF",
-    "IBHG",
-    "IBHH",
-    "IBHI",
-    "IBHJ",
-    "IBHK",
-    "IBIB",
-    "IBIC",
-    "IBID",
-    "IBIE",
-    "IBIF",
-    "IBIG",
-    "IBIH",
-    "IBII",
-    "IBIJ",
-    "IBIK",
-    "IBIO",
-    "IBIT",
-    "IBKR",
-    "IBLC",
-    "IBM",
-    "IBMM",
-    "IBMN",
-    "IBMO",
-    "IBMP",
-    "IBMQ",
-    "IBMR",
-    "IBMS",
-    "IBN",
-    "IBND",
-    "IBO",
-    "IBOC",
-    "IBOT",
-    "IBP",
-    "IBRN",
-    "IBRX",
-    "IBTA",
-    "IBTE",
-    "IBTF",
-    "IBTG",
-    "IBTH",
-    "IBTI",
-    "IBTJ",
-    "IBTK",
-    "IBTL",
-    "IBTM",
-    "IBTO",
-    "IBTP",
-    "IBTX",
-    "IBUF",
-    "IBUY",
-    "ICAD",
-    "ICAP",
-    "ICCC",
-    "ICCH",
-    "ICCM",
-    "ICCT",
-    "ICE",
-    "ICF",
-    "ICFI",
-    "ICG",
-    "ICHR",
-    "ICL",
-    "ICLK",
-    "ICLN",
-    "ICLO",
-    "ICLR",
-    "ICMB",
-    "ICON",
-    "ICOP",
-    "ICOW",
-    "ICR$A",
-    "ICSH",
-    "ICU",
-    "ICUCW",
-    "ICUI",
-    "ICVT",
-    "IDA",
-    "IDAI",
-    "IDAT",
-    "IDCC",
-    "IDE",
-    "IDEC",
-    "IDEV",
-    "IDGT",
-    "IDHQ",
-    "IDLV",
-    "IDMO",
-    "IDN",
-    "IDNA",
-    "IDOG",
-    "IDR",
-    "IDRV",
-    "IDT",
-    "IDU",
-    "IDUB",
-    "IDV",
-    "IDVO",
-    "IDX",
-    "IDXX",
-    "IDYA",
-    "IE",
-    "IEDI",
-    "IEF",
-    "IEFA",
-    "IEI",
-    "IEMG",
-    "IEO",
-    "IEP",
-    "IESC",
-    "IETC",
-    "IEUR",
-    "IEUS",
-    "IEV",
-    "IEX",
-    "IEZ",
-    "IFBD",
-    "IFEB",
-    "IFED",
-    "IFF",
-    "IFGL",
-    "IFN",
-    "IFRA",
-    "IFRX",
-    "IFS",
-    "IFV",
-    "IG",
-    "IGA",
-    "IGBH",
-    "IGC",
-    "IGCB",
-    "IGD",
-    "IGE",
-    "IGEB",
-    "IGF",
-    "IGHG",
-    "IGI",
-    "IGIB",
-    "IGIC",
-    "IGLB",
-    "IGLD",
-    "IGM",
-    "IGMS",
-    "IGOV",
-    "IGPT",
-    "IGR",
-    "IGRO",
-    "IGSB",
-    "IGT",
-    "IGTA",
-    "IGTAR",
-    "IGTAU",
-    "IGTAW",
-    "IGTR",
-    "IGV",
-    "IGZ",
-    "IH",
-    "IHAK",
-    "IHD",
-    "IHDG",
-    "IHE",
-    "IHF",
-    "IHG",
-    "IHI",
-    "IHRT",
-    "IHS",
-    "IHT",
-    "IHTA",
-    "IHY",
-    "IHYF",
-    "IIF",
-    "IIGD",
-    "III",
-    "IIIN",
-    "IIIV",
-    "IIM",
-    "IINN",
-    "IINNW",
-    "IIPR",
-    "IIPR$A",
-    "IJAN",
-    "IJH",
-    "IJJ",
-    "IJK",
-    "IJR",
-    "IJS",
-    "IJT",
-    "IJUL",
-    "IJUN",
-    "IKNA",
-    "IKT",
-    "ILAG",
-    "ILCB",
-    "ILCG",
-    "ILCV",
-    "ILDR",
-    "ILF",
-    "ILIT",
-    "ILLR",
-    "ILLRW",
-    "ILMN",
-    "ILOW",
-    "ILPT",
-    "ILTB",
-    "IMAB",
-    "IMAR",
-    "IMAX",
-    "IMAY",
-    "IMCB",
-    "IMCC",
-    "IMCG",
-    "IMCR",
-    "IMCV",
-    "IMFL",
-    "IMG",
-    "IMKTA",
-    "IMMP",
-    "IMMR",
-    "IMMX",
-    "IMNM",
-    "IMNN",
-    "IMO",
-    "IMOM",
-    "IMOS",
-    "IMPP",
-    "IMPPP",
-    "IMRN",
-    "IMRX",
-    "IMSI",
-    "IMTB",
-    "IMTE",
-    "IMTM",
-    "IMTX",
-    "IMTXW",
-    "IMUX",
-    "IMVT",
-    "IMXI",
-    "INAB",
-    "INAQ",
-    "INAQU",
-    "INAQW",
-    "INBK",
-    "INBKZ",
-    "INBS",
-    "INBX",
-    "INCE",
-    "INCM",
-    "INCO",
-    "INCR",
-    "INCY",
-    "INDA",
-    "INDB",
-    "INDE",
-    "INDF",
-    "INDH",
-    "INDI",
-    "INDL",
-    "INDO",
-    "INDP",
-    "INDS",
-    "INDV",
-    "INDY",
-    "INEQ",
-    "INFA",
-    "INFL",
-    "INFN",
-    "INFO",
-    "INFR",
-    "INFU",
-    "INFY",
-    "ING",
-    "INGM",
-    "INGN",
-    "INGR",
-    "INHD",
-    "INKM",
-    "INKT",
-    "INLX",
-    "INM",
-    "INMB",
-    "INMD",
-    "INMU",
-    "INN",
-    "INN$E",
-    "INN$F",
-    "INNO",
-    "INNV",
-    "INO",
-    "INOD",
-    "INOV",
-    "INQQ",
-    "INRO",
-    "INSE",
-    "INSG",
-    "INSI",
-    "INSM",
-    "INSP",
-    "INSW",
-    "INTA",
-    "INTC",
-    "INTF",
-    "INTG",
-    "INTJ",
-    "INTL",
-    "INTR",
-    "INTS",
-    "INTT",
-    "INTU",
-    "INTZ",
-    "INUV",
-    "INV",
-    "INVA",
-    "INVE",
-    "INVH",
-    "INVX",
-    "INVZ",
-    "INVZW",
-    "INZY",
-    "IOBT",
-    "IOCT",
-    "ION",
-    "IONQ",
-    "IONQ.W",
-    "IONR",
-    "IONS",
-    "IOO",
-    "IOPP",
-    "IOR",
-    "IOSP",
-    "IOT",
-    "IOVA",
-    "IP",
-    "IPA",
-    "IPAC",
-    "IPAR",
-    "IPAV",
-    "IPAY",
-    "IPB",
-    "IPDN",
-    "IPDP",
-    "IPG",
-    "IPGP",
-    "IPHA",
-    "IPI",
-    "IPKW",
-    "IPO",
-    "IPOS",
-    "IPPP",
-    "IPSC",
-    "IPW",
-    "IPWR",
-    "IPX",
-    "IPXX",
-    "IPXXU",
-    "IPXXW",
-    "IQ",
-    "IQDE",
-    "IQDF",
-    "IQDG",
-    "IQDY",
-    "IQHI",
-    "IQI",
-    "IQIN",
-    "IQLT",
-    "IQM",
-    "IQQQ",
-    "IQRA",
-    "IQSI",
-    "IQSM",
-    "IQSU",
-    "IQV",
-    "IR",
-    "IRBT",
-    "IRD",
-    "IRDM",
-    "IREN",
-    "IRET",
-    "IRIX",
-    "IRM",
-    "IRMD",
-    "IROH",
-    "IROHR",
-    "IROHU",
-    "IROHW",
-    "IRON",
-    "IROQ",
-    "IRS",
-    "IRS.W",
-    "IRT",
-    "IRTC",
-    "IRTR",
-    "IRVH",
-    "IRWD",
-    "ISCB",
-    "ISCF",
-    "ISCG",
-    "ISCV",
-    "ISD",
-    "ISDB",
-    "ISDR",
-    "ISEP",
-    "ISHG",
-    "ISHP",
-    "ISMD",
-    "ISPC",
-    "ISPO",
-    "ISPOW",
-    "ISPR",
-    "ISPY",
-    "ISRA",
-    "ISRG",
-    "ISRL",
-    "ISRLU",
-    "ISRLW",
-    "ISSC",
-    "ISTB",
-    "ISTR",
-    "ISVL",
-    "ISWN",
-    "IT",
-    "ITA",
-    "ITAN",
-    "ITB",
-    "ITCI",
-    "ITDB",
-    "ITDC",
-    "ITDD",
-    "ITDE",
-    "ITDF",
-    "ITDG",
-    "ITDH",
-    "ITDI",
-    "ITDJ",
-    "ITEQ",
-    "ITGR",
-    "ITIC",
-    "ITM",
-    "ITOS",
-    "ITOT",
-    "ITP",
-    "ITRG",
-    "ITRI",
-    "ITRM",
-    "ITRN",
-    "ITT",
-    "ITUB",
-    "ITW",
-    "ITWO",
-    "IUS",
-    "IUSB",
-    "IUSG",
-    "IUSV",
-    "IVA",
-    "IVAC",
-    "IVAL",
-    "IVCA",
-    "IVCAU",
-    "IVCAW",
-    "IVCB",
-    "IVCBU",
-    "IVCBW",
-    "IVCP",
-    "IVCPU",
-    "IVCPW",
-    "IVDA",
-    "IVDAW",
-    "IVE",
-    "IVEG",
-    "IVLU",
-    "IVOG",
-    "IVOL",
-    "IVOO",
-    "IVOV",
-    "IVP",
-    "IVR",
-    "IVR$B",
-    "IVR$C",
-    "IVRA",
-    "IVRS",
-    "IVT",
-    "IVV",
-    "IVVB",
-    "IVVD",
-    "IVVM",
-    "IVVW",
-    "IVW",
-    "IVZ",
-    "IWB",
-    "IWC",
-    "IWD",
-    "IWDL",
-    "IWF",
-    "IWFG",
-    "IWFL",
-    "IWL",
-    "IWLG",
-    "IWM",
-    "IWMI",
-    "IWML",
-    "IWMW",
-    "IWMY",
-    "IWN",
-    "IWO",
-    "IWP",
-    "IWR",
-    "IWS",
-    "IWTR",
-    "IWV",
-    "IWX",
-    "IWY",
-    "IX",
-    "IXC",
-    "IXG",
-    "IXHL",
-    "IXJ",
-    "IXN",
-    "IXP",
-    "IXUS",
-    "IYC",
-    "IYE",
-    "IYF",
-    "IYG",
-    "IYH",
-    "IYJ",
-    "IYK",
-    "IYLD",
-    "IYM",
-    "IYR",
-    "IYT",
-    "IYW",
-    "IYY",
-    "IYZ",
-    "IZEA",
-    "IZM",
-    "IZRL",
-    "IZTC",
-    "J",
-    "JAAA",
-    "JACK",
-    "JADE",
-    "JAGX",
-    "JAJL",
-    "JAKK",
-    "JAMF",
-    "JAND",
-    "JANH",
-    "JANJ",
-    "JANP",
-    "JANQ",
-    "JANT",
-    "JANW",
-    "JANX",
-    "JANZ",
-    "JAVA",
-    "JAZZ",
-    "JBBB",
-    "JBDI",
-    "JBGS",
-    "JBHT",
-    "JBI",
-    "JBK",
-    "JBL",
-    "JBLU",
-    "JBND",
-    "JBSS",
-    "JBT",
-    "JCE",
-    "JCHI",
-    "JCI",
-    "JCPB",
-    "JCPI",
-    "JCSE",
-    "JCTC",
-    "JCTR",
-    "JD",
-    "JDIV",
-    "JDOC",
-    "JDST",
-    "JDVI",
-    "JDZG",
-    "JEF",
-    "JELD",
-    "JEMA",
-    "JEMB",
-    "JEPI",
-    "JEPQ",
-    "JEQ",
-    "JETD",
-    "JETS",
-    "JETU",
-    "JFBR",
-    "JFBRW",
-    "JFIN",
-    "JFR",
-    "JFU",
-    "JFWD",
-    "JG",
-    "JGH",
-    "JGLO",
-    "JGRO",
-    "JGRW",
-    "JHAC",
-    "JHCB",
-    "JHDV",
-    "JHEM",
-    "JHG",
-    "JHHY",
-    "JHI",
-    "JHID",
-    "JHMB",
-    "JHMD",
-    "JHML",
-    "JHMM",
-    "JHMU",
-    "JHPI",
-    "JHS",
-    "JHSC",
-    "JHX",
-    "JIG",
-    "JIII",
-    "JILL",
-    "JIRE",
-    "JIVE",
-    "JJSF",
-    "JKHY",
-    "JKS",
-    "JL",
-    "JLL",
-    "JLQD",
-    "JLS",
-    "JMBS",
-    "JMEE",
-    "JMHI",
-    "JMIA",
-    "JMID",
-    "JMM",
-    "JMOM",
-    "JMSB",
-    "JMSI",
-    "JMST",
-    "JMUB",
-    "JNEU",
-    "JNJ",
-    "JNK",
-    "JNPR",
-    "JNUG",
-    "JNVR",
-    "JOB",
-    "JOBY",
-    "JOBY.W",
-    "JOE",
-    "JOET",
-    "JOF",
-    "JOJO",
-    "JOUT",
-    "JPAN",
-    "JPC",
-    "JPEF",
-    "JPEM",
-    "JPI",
-    "JPIB",
-    "JPIE",
-    "JPIN",
-    "JPLD",
-    "JPM",
-    "JPM$C",
-    "JPM$D",
-    "JPM$J",
-    "JPM$K",
-    "JPM$L",
-    "JPM$M",
-    "JPMB",
-    "JPME",
-    "JPMO",
-    "JPRE",
-    "JPSE",
-    "JPST",
-    "JPSV",
-    "JPUS",
-    "JPXN",
-    "JQC",
-    "JQUA",
-    "JRE",
-    "JRI",
-    "JRS",
-    "JRSH",
-    "JRVR",
-    "JSCP",
-    "JSI",
-    "JSM",
-    "JSMD",
-    "JSML",
-    "JSPR",
-    "JSPRW",
-    "JSTC",
-    "JTAI",
-    "JTEK",
-    "JUCY",
-    "JULD",
-    "JULH",
-    "JULJ",
-    "JULM",
-    "JULP",
-    "JULQ",
-    "JULT",
-    "JULU",
-    "JULW",
-    "JULZ",
-    "JUNE",
-    "JUNM",
-    "JUNP",
-    "JUNT",
-    "JUNW",
-    "JUNZ",
-    "JUST",
-    "JVA",
-    "JVAL",
-    "JVSA",
-    "JVSAR",
-    "JVSAU",
-    "JWEL",
-    "JWN",
-    "JXI",
-    "JXJT",
-    "JXN",
-    "JXN$A",
-    "JYD",
-    "JYNT",
-    "JZ",
-    "JZXN",
-    "K",
-    "KACL",
-    "KACLR",
-    "KACLU",
-    "KACLW",
-    "KAI",
-    "KALA",
-    "KALL",
-    "KALU",
-    "KALV",
-    "KAPA",
-    "KAPR",
-    "KAR",
-    "KARO",
-    "KARS",
-    "KAUG",
-    "KAVL",
-    "KB",
-    "KBA",
-    "KBDC",
-    "KBE",
-    "KBH",
-    "KBR",
-    "KBUF",
-    "KBWB",
-    "KBWD",
-    "KBWP",
-    "KBWR",
-    "KBWY",
-    "KC",
-    "KCAI",
-    "KCCA",
-    "KCE",
-    "KCSH",
-    "KD",
-    "KDLY",
-    "KDLYW",
-    "KDP",
-    "KDRN",
-    "KE",
-    "KEAT",
-    "KELYA",
-    "KELYB",
-    "KEM",
-    "KEMQ",
-    "KEMX",
-    "KEN",
-    "KEP",
-    "KEQU",
-    "KEUA",
-    "KEX",
-    "KEY",
-    "KEY$I",
-    "KEY$J",
-    "KEY$K",
-    "KEY$L",
-    "KEYS",
-    "KF",
-    "KFFB",
-    "KFRC",
-    "KFS",
-    "KFY",
-    "KGC",
-    "KGEI",
-    "KGRN",
-    "KGS",
-    "KHC",
-    "KHPI",
-    "KHYB",
-    "KIDS",
-    "KIE",
-    "KIM",
-    "KIM$L",
-    "KIM$M",
-    "KIM$N",
-    "KIND",
-    "KINS",
-    "KIO",
-    "KIRK",
-    "KITT",
-    "KITTW",
-    "KJAN",
-    "KJUL",
-    "KJUN",
-    "KKR",
-    "KKRS",
-    "KLAC",
-    "KLC",
-    "KLG",
-    "KLIC",
-    "KLIP",
-    "KLMT",
-    "KLTO",
-    "KLTOW",
-    "KLTR",
-    "KLXE",
-    "KLXY",
-    "KMB",
-    "KMDA",
-    "KMI",
-    "KMID",
-    "KMLM",
-    "KMPB",
-    "KMPR",
-    "KMT",
-    "KMX",
-    "KN",
-    "KNCT",
-    "KNDI",
-    "KNF",
-    "KNG",
-    "KNGS",
-    "KNGZ",
-    "KNO",
-    "KNOP",
-    "KNOV",
-    "KNOW",
-    "KNSA",
-    "KNSL",
-    "KNTK",
-    "KNW",
-    "KNX",
-    "KO",
-    "KOCG",
-    "KOCT",
-    "KOD",
-    "KODK",
-    "KOF",
-    "KOKU",
-    "KOLD",
-    "KOMP",
-    "KONG",
-    "KOOL",
-    "KOP",
-    "KOPN",
-    "KORE",
-    "KORP",
-    "KORU",
-    "KOS",
-    "KOSS",
-    "KPLT",
-    "KPLTW",
-    "KPOP",
-    "KPRO",
-    "KPRX",
-    "KPTI",
-    "KQQQ",
-    "KR",
-    "KRBN",
-    "KRC",
-    "KRE",
-    "KREF",
-    "KREF$A",
-    "KRG",
-    "KRKR",
-    "KRMA",
-    "KRMD",
-    "KRNT",
-    "KRNY",
-    "KRO",
-    "KRON",
-    "KROP",
-    "KROS",
-    "KRP",
-    "KRRO",
-    "KRT",
-    "KRUS",
-    "KRUZ",
-    "KRYS",
-    "KSA",
-    "KSCP",
-    "KSEA",
-    "KSEP",
-    "KSPI",
-    "KSPY",
-    "KSS",
-    "KSTR",
-    "KT",
-    "KTB",
-    "KTCC",
-    "KTEC",
-    "KTF",
-    "KTH",
-    "KTN",
-    "KTOS",
-    "KTTA",
-    "KTTAW",
-    "KUKE",
-    "KULR",
-    "KURA",
-    "KURE",
-    "KVAC",
-    "KVACU",
-    "KVACW",
-    "KVHI",
-    "KVLE",
-    "KVUE",
-    "KVYO",
-    "KW",
-    "KWE",
-    "KWEB",
-    "KWESW",
-    "KWR",
-    "KWT",
-    "KXI",
-    "KXIN",
-    "KYMR",
-    "KYN",
-    "KYTX",
-    "KZIA",
-    "KZR",
-    "L",
-    "LAAC",
-    "LAB",
-    "LABD",
-    "LABU",
-    "LAC",
-    "LAD",
-    "LADR",
-    "LAES",
-    "LAKE",
-    "LALT",
-    "LAMR",
-    "LANC",
-    "LAND",
-    "LANDM",
-    "LANDO",
-    "LANDP",
-    "LANV",
-    "LANV.W",
-    "LAPR",
-    "LARK",
-    "LASE",
-    "LASR",
-    "LATG",
-    "LATGU",
-    "LAUR",
-    "LAW",
-    "LAZ",
-    "LAZR",
-    "LB",
-    "LBAY",
-    "LBGJ",
-    "LBO",
-    "LBPH",
-    "LBRDA",
-    "LBRDK",
-    "LBRDP",
-    "LBRT",
-    "LBTYA",
-    "LBTYB",
-    "LBTYK",
-    "LC",
-    "LCDS",
-    "LCF",
-    "LCFY",
-    "LCFYW",
-    "LCG",
-    "LCID",
-    "LCII",
-    "LCLG",
-    "LCNB",
-    "LCR",
-    "LCTD",
-    "LCTU",
-    "LCTX",
-    "LCUT",
-    "LDEM",
-    "LDI",
-    "LDOS",
-    "LDP",
-    "LDRC",
-    "LDRH",
-    "LDRI",
-    "LDRT",
-    "LDSF",
-    "LDTC",
-    "LDTCW",
-    "LDUR",
-    "LDWY",
-    "LE",
-    "LEA",
-    "LEAD",
-    "LECO",
-    "LEDS",
-    "LEE",
-    "LEG",
-    "LEGH",
-    "LEGN",
-    "LEGR",
-    "LEGT",
-    "LEGT.U",
-    "LEGT.W",
-    "LEMB",
-    "LEN",
-    "LEN.B",
-    "LENZ",
-    "LEO",
-    "LESL",
-    "LEU",
-    "LEV",
-    "LEV.A",
-    "LEV.W",
-    "LEVI",
-    "LEXI",
-    "LEXX",
-    "LEXXW",
-    "LFAE",
-    "LFAF",
-    "LFAI",
-    "LFAJ",
-    "LFAK",
-    "LFAL",
-    "LFAN",
-    "LFAO",
-    "LFAQ",
-    "LFAR",
-    "LFAU",
-    "LFAV",
-    "LFAW",
-    "LFAX",
-    "LFAZ",
-    "LFBB",
-    "LFCR",
-    "LFEQ",
-    "LFLY",
-    "LFLYW",
-    "LFMD",
-    "LFMDP",
-    "LFSC",
-    "LFST",
-    "LFT",
-    "LFT$A",
-    "LFUS",
-    "LFVN",
-    "LFWD",
-    "LGCB",
-    "LGCL",
-    "LGCY",
-    "LGF.A",
-    "LGF.B",
-    "LGH",
-    "LGHL",
-    "LGHLW",
-    "LGHT",
-    "LGI",
-    "LGIH",
-    "LGL",
-    "LGL.W",
-    "LGLV",
-    "LGMK",
-    "LGND",
-    "LGO",
-    "LGOV",
-    "LGRO",
-    "LGTY",
-    "LGVN",
-    "LH",
-    "LHX",
-    "LI",
-    "LIAB",
-    "LIAC",
-    "LIAE",
-    "LIAF",
-    "LIAG",
-    "LIAJ",
-    "LIAK",
-    "LIAM",
-    "LIAO",
-    "LIAP",
-    "LIAQ",
-    "LIAT",
-    "LIAU",
-    "LIAV",
-    "LIAW",
-    "LIAX",
-    "LICN",
-    "LICY",
-    "LIDR",
-    "LIDRW",
-    "LIEN",
-    "LIF",
-    "LIFW",
-    "LIFWW",
-    "LIFWZ",
-    "LII",
-    "LILA",
-    "LILAK",
-    "LIMI",
-    "LIN",
-    "LINC",
-    "LIND",
-    "LINE",
-    "LINK",
-    "LION",
-    "LIPO",
-    "LIQT",
-    "LIT",
-    "LITB",
-    "LITE",
-    "LITM",
-    "LITP",
-    "LIVE",
-    "LIVN",
-    "LIVR",
-    "LIXT",
-    "LIXTW",
-    "LJAN",
-    "LJUL",
-    "LKCO",
-    "LKFN",
-    "LKOR",
-    "LKQ",
-    "LLDR",
-    "LLY",
-    "LLYVA",
-    "LLYVK",
-    "LLYX",
-    "LMAT",
-    "LMB",
-    "LMBO",
-    "LMBS",
-    "LMFA",
-    "LMND",
-    "LMND.W",
-    "LMNR",
-    "LMT",
-    "LNC",
-    "LNC$D",
-    "LND",
-    "LNG",
-    "LNGG",
-    "LNGZ",
-    "LNKB",
-    "LNN",
-    "LNSR",
-    "LNT",
-    "LNTH",
-    "LNW",
-    "LNZA",
-    "LNZAW",
-    "LOAN",
-    "LOAR",
-    "LOB",
-    "LOBO",
-    "LOCL",
-    "LOCO",
-    "LOCT",
-    "LODE",
-    "LOGC",
-    "LOGI",
-    "LOMA",
-    "LONZ",
-    "LOOP",
-    "LOPE",
-    "LOPP",
-    "LOT",
-    "LOTWW",
-    "LOUP",
-    "LOVE",
-    "LOW",
-    "LOWV",
-    "LPA",
-    "LPAA",
-    "LPAAU",
-    "LPAAW",
-    "LPBBU",
-    "LPCN",
-    "LPG",
-    "LPL",
-    "LPLA",
-    "LPRO",
-    "LPSN",
-    "LPTH",
-    "LPTX",
-    "LPX",
-    "LQAI",
-    "LQD",
-    "LQDA",
-    "LQDB",
-    "LQDH",
-    "LQDI",
-    "LQDT",
-    "LQDW",
-    "LQIG",
-    "LQR",
-    "LRCX",
-    "LRE",
-    "LRFC",
-    "LRGC",
-    "LRGE",
-    "LRGF",
-    "LRGG",
-    "LRHC",
-    "LRMR",
-    "LRN",
-    "LRND",
-    "LRNZ",
-    "LSAF",
-    "LSAK",
-    "LSAT",
-    "LSB",
-    "LSBK",
-    "LSBPW",
-    "LSCC",
-    "LSEA",
-    "LSEAW",
-    "LSEQ",
-    "LSF",
-    "LSGR",
-    "LSH",
-    "LSPD",
-    "LSTA",
-    "LSTR",
-    "LTBR",
-    "LTC",
-    "LTH",
-    "LTL",
-    "LTM",
-    "LTPZ",
-    "LTRN",
-    "LTRX",
-    "LTRY",
-    "LTRYW",
-    "LU",
-    "LUCD",
-    "LUCY",
-    "LUCYW",
-    "LULU",
-    "LUMN",
-    "LUMO",
-    "LUNA",
-    "LUNG",
-    "LUNR",
-    "LUNRW",
-    "LUV",
-    "LUX",
-    "LUXH",
-    "LUXHP",
-    "LUXX",
-    "LVHD",
-    "LVHI",
-    "LVLU",
-    "LVO",
-    "LVOL",
-    "LVRO",
-    "LVROW",
-    "LVS",
-    "LVTX",
-    "LVWR",
-    "LVWR.W",
-    "LW",
-    "LWAY",
-    "LWLG",
-    "LX",
-    "LXEH",
-    "LXEO",
-    "LXFR",
-    "LXP",
-    "LXP$C",
-    "LXRX",
-    "LXU",
-    "LYB",
-    "LYEL",
-    "LYFT",
-    "LYG",
-    "LYLD",
-    "LYRA",
-    "LYT",
-    "LYTS",
-    "LYV",
-    "LZ",
-    "LZB",
-    "LZM",
-    "LZM.W",
-    "M",
-    "MA",
-    "MAA",
-    "MAA$I",
-    "MAC",
-    "MACI",
-    "MACIU",
-    "MACIW",
-    "MADE",
-    "MAG",
-    "MAGA",
-    "MAGG",
-    "MAGN",
-    "MAGQ",
-    "MAGS",
-    "MAGX",
-    "MAIA",
-    "MAIN",
-    "MAKX",
-    "MAMA",
-    "MAMB",
-    "MAMO",
-    "MAN",
-    "MANH",
-    "MANU",
-    "MAPP",
-    "MAPS",
-    "MAPSW",
-    "MAR",
-    "MARA",
-    "MARB",
-    "MARM",
-    "MARPS",
-    "MART",
-    "MARW",
-    "MARX",
-    "MARXR",
-    "MARXU",
-    "MARZ",
-    "MAS",
-    "MASI",
-    "MASS",
-    "MAT",
-    "MATH",
-    "MATV",
-    "MATW",
-    "MATX",
-    "MAV",
-    "MAX",
-    "MAXI",
-    "MAXJ",
-    "MAXN",
-    "MAYP",
-    "MAYS",
-    "MAYT",
-    "MAYU",
-    "MAYW",
-    "MAYZ",
-    "MBAV",
-    "MBAVU",
-    "MBAVW",
-    "MBB",
-    "MBBB",
-    "MBC",
-    "MBCC",
-    "MBCN",
-    "MBI",
-    "MBIN",
-    "MBINM",
-    "MBINN",
-    "MBINO",
-    "MBIO",
-    "MBLY",
-    "MBND",
-    "MBNE",
-    "MBNKP",
-    "MBOT",
-    "MBOX",
-    "MBRX",
-    "MBS",
-    "MBSD",
-    "MBSF",
-    "MBUU",
-    "MBWM",
-    "MBX",
-    "MC",
-    "MCAG",
-    "MCAGR",
-    "MCAGU",
-    "MCB",
-    "MCBS",
-    "MCD",
-    "MCDS",
-    "MCFT",
-    "MCH",
-    "MCHI",
-    "MCHP",
-    "MCHS",
-    "MCHX",
-    "MCI",
-    "MCK",
-    "MCN",
-    "MCO",
-    "MCR",
-    "MCRB",
-    "MCRI",
-    "MCS",
-    "MCSE",
-    "MCVT",
-    "MCW",
-    "MCY",
-    "MD",
-    "MDAI",
-    "MDAIW",
-    "MDB",
-    "MDBH",
-    "MDCP",
-    "MDCX",
-    "MDCXW",
-    "MDEV",
-    "MDGL",
-    "MDIA",
-    "MDIV",
-    "MDJH",
-    "MDLV",
-    "MDLZ",
-    "MDPL",
-    "MDRR",
-    "MDRRP",
-    "MDST",
-    "MDT",
-    "MDU",
-    "MDV",
-    "MDV$A",
-    "MDWD",
-    "MDXG",
-    "MDXH",
-    "MDY",
-    "MDYG",
-    "MDYV",
-    "ME",
-    "MEAR",
-    "MEC",
-    "MED",
-    "MEDI",
-    "MEDP",
-    "MEDX",
-    "MEG",
-    "MEGI",
-    "MEGL",
-    "MEI",
-    "MEIP",
-    "MELI",
-    "MEM",
-    "MEMS",
-    "MEMX",
-    "MEOH",
-    "MER$K",
-    "MERC",
-    "MESA",
-    "MESO",
-    "MET",
-    "MET$A",
-    "MET$E",
-    "MET$F",
-    "META",
-    "METC",
-    "METCB",
-    "METCL",
-    "METD",
-    "METU",
-    "METV",
-    "MEXX",
-    "MFA",
-    "MFA$B",
-    "MFA$C",
-    "MFAN",
-    "MFAO",
-    "MFC",
-    "MFDX",
-    "MFEM",
-    "MFG",
-    "MFH",
-    "MFI",
-    "MFIC",
-    "MFICL",
-    "MFIN",
-    "MFLX",
-    "MFM",
-    "MFUL",
-    "MFUS",
-    "MFUT",
-    "MG",
-    "MGA",
-    "MGC",
-    "MGEE",
-    "MGF",
-    "MGIC",
-    "MGIH",
-    "MGK",
-    "MGLD",
-    "MGM",
-    "MGMT",
-    "MGNI",
-    "MGNR",
-    "MGNX",
-    "MGOL",
-    "MGOV",
-    "MGPI",
-    "MGR",
-    "MGRB",
-    "MGRC",
-    "MGRD",
-    "MGRE",
-    "MGRM",
-    "MGRO",
-    "MGRX",
-    "MGTX",
-    "MGV",
-    "MGX",
-    "MGY",
-    "MGYR",
-    "MHD",
-    "MHF",
-    "MHH",
-    "MHI",
-    "MHK",
-    "MHLA",
-    "MHLD",
-    "MHN",
-    "MHNC",
-    "MHO",
-    "MHUA",
-    "MI",
-    "MID",
-    "MIDD",
-    "MIDE",
-    "MIDU",
-    "MIG",
-    "MIGI",
-    "MILN",
-    "MIN",
-    "MIND",
-    "MINN",
-    "MINO",
-    "MINT",
-    "MINV",
-    "MIO",
-    "MIR",
-    "MIRA",
-    "MIRM",
-    "MISL",
-    "MIST",
-    "MITA",
-    "MITAU",
-    "MITAW",
-    "MITK",
-    "MITN",
-    "MITP",
-    "MITQ",
-    "MITT",
-    "MITT$A",
-    "MITT$B",
-    "MITT$C",
-    "MIY",
-    "MJ",
-    "MJUS",
-    "MKAM",
-    "MKC",
-    "MKC.V",
-    "MKDW",
-    "MKDWW",
-    "MKFG",
-    "MKL",
-    "MKOR",
-    "MKSI",
-    "MKTW",
-    "MKTX",
-    "MKZR",
-    "ML",
-    "ML.W",
-    "MLAB",
-    "MLCO",
-    "MLDR",
-    "MLEC",
-    "MLECW",
-    "MLGO",
-    "MLI",
-    "MLKN",
-    "MLM",
-    "MLN",
-    "MLNK",
-    "MLP",
-    "MLPA",
-    "MLPB",
-    "MLPD",
-    "MLPR",
-    "MLPX",
-    "MLR",
-    "MLSS",
-    "MLTX",
-    "MLYS",
-    "MMA",
-    "MMC",
-    "MMCA",
-    "MMD",
-    "MMI",
-    "MMIN",
-    "MMIT",
-    "MMKT",
-    "MMLG",
-    "MMLP",
-    "MMM",
-    "MMS",
-    "MMSC",
-    "MMSI",
-    "MMT",
-    "MMTM",
-    "MMU",
-    "MMV",
-    "MMVWW",
-    "MMYT",
-    "MNA",
-    "MNBD",
-    "MNDO",
-    "MNDR",
-    "MNDY",
-    "MNKD",
-    "MNMD",
-    "MNOV",
-    "MNPR",
-    "MNR",
-    "MNRO",
-    "MNSB",
-    "MNSBP",
-    "MNSO",
-    "MNST",
-    "MNTK",
-    "MNTL",
-    "MNTN",
-    "MNTN.U",
-    "MNTN.W",
-    "MNTS",
-    "MNTSW",
-    "MNTX",
-    "MNY",
-    "MNYWW",
-    "MO",
-    "MOAT",
-    "MOB",
-    "MOBBW",
-    "MOBX",
-    "MOBXW",
-    "MOD",
-    "MODD",
-    "MODG",
-    "MODL",
-    "MODV",
-    "MOFG",
-    "MOG.A",
-    "MOG.B",
-    "MOGO",
-    "MOGU",
-    "MOH",
-    "MOLN",
-    "MOMO",
-    "MOND",
-    "MOO",
-    "MOOD",
-    "MORN",
-    "MORT",
-    "MOS",
-    "MOTE",
-    "MOTG",
-    "MOTI",
-    "MOTO",
-    "MOV",
-    "MOVE",
-    "MP",
-    "MPA",
-    "MPAA",
-    "MPAY",
-    "MPB",
-    "MPC",
-    "MPLN",
-    "MPLX",
-    "MPRO",
-    "MPTI",
-    "MPU",
-    "MPV",
-    "MPW",
-    "MPWR",
-    "MPX",
-    "MQ",
-    "MQQQ",
-    "MQT",
-    "MQY",
-    "MRAM",
-    "MRBK",
-    "MRC",
-    "MRCC",
-    "MRCP",
-    "MRCY",
-    "MREO",
-    "MRGR",
-    "MRIN",
-    "MRK",
-    "MRKR",
-    "MRM",
-    "MRNA",
-    "MRNO",
-    "MRNOW",
-    "MRNS",
-    "MRNY",
-    "MRO",
-    "MRSK",
-    "MRSN",
-    "MRT",
-    "MRTN",
-    "MRUS",
-    "MRVI",
-    "MRVL",
-    "MRX",
-    "MS",
-    "MS$A",
-    "MS$E",
-    "MS$F",
-    "MS$I",
-    "MS$K",
-    "MS$L",
-    "MS$O",
-    "MS$P",
-    "MS$Q",
-    "MSA",
-    "MSAI",
-    "MSAIW",
-    "MSB",
-    "MSBI",
-    "MSBIP",
-    "MSC",
-    "MSCI",
-    "MSD",
-    "MSDL",
-    "MSEX",
-    "MSFD",
-    "MSFL",
-    "MSFO",
-    "MSFT",
-    "MSFU",
-    "MSFX",
-    "MSFY",
-    "MSGE",
-    "MSGM",
-    "MSGS",
-    "MSI",
-    "MSM",
-    "MSMR",
-    "MSN",
-    "MSOS",
-    "MSOX",
-    "MSS",
-    "MSSA",
-    "MSSAR",
-    "MSSAU",
-    "MSSAW",
-    "MSSS",
-    "MSTB",
-    "MSTI",
-    "MSTQ",
-    "MSTR",
-    "MSTU",
-    "MSTX",
-    "MSTY",
-    "MSTZ",
-    "MSVX",
-    "MT",
-    "MTA",
-    "MTAL",
-    "MTB",
-    "MTB$H",
-    "MTB$J",
-    "MTBA",
-    "MTC",
-    "MTCH",
-    "MTD",
-    "MTDR",
-    "MTEK",
-    "MTEKW",
-    "MTEM",
-    "MTEN",
-    "MTEX",
-    "MTG",
-    "MTGP",
-    "MTH",
-    "MTLS",
-    "MTN",
-    "MTNB",
-    "MTR",
-    "MTRN",
-    "MTRX",
-    "MTSI",
-    "MTTR",
-    "MTUL",
-    "MTUM",
-    "MTUS",
-    "MTW",
-    "MTX",
-    "MTZ",
-    "MU",
-    "MUA",
-    "MUB",
-    "MUC",
-    "MUD",
-    "MUE",
-    "MUFG",
-    "MUI",
-    "MUJ",
-    "MULL",
-    "MULN",
-    "MUNI",
-    "MUR",
-    "MURA",
-    "MUSA",
-    "MUSE",
-    "MUSI",
-    "MUSQ",
-    "MUST",
-    "MUU",
-    "MUX",
-    "MVAL",
-    "MVBF",
-    "MVF",
-    "MVFD",
-    "MVFG",
-    "MVIS",
-    "MVO",
-    "MVPA",
-    "MVPL",
-    "MVPS",
-    "MVRL",
-    "MVST",
-    "MVSTW",
-    "MVT",
-    "MVV",
-    "MWA",
-    "MWG",
-    "MX",
-    "MXC",
-    "MXCT",
-    "MXE",
-    "MXF",
-    "MXI",
-    "MXL",
-    "MYCF",
-    "MYCG",
-    "MYCH",
-    "MYCI",
-    "MYCJ",
-    "MYCK",
-    "MYCL",
-    "MYCM",
-    "MYCN",
-    "MYD",
-    "MYE",
-    "MYFW",
-    "MYGN",
-    "MYI",
-    "MYLD",
-    "MYMF",
-    "MYMG",
-    "MYMH",
-    "MYMI",
-    "MYMJ",
-    "MYN",
-    "MYNA",
-    "MYND",
-    "MYNZ",
-    "MYO",
-    "MYPS",
-    "MYPSW",
-    "MYRG",
-    "MYSZ",
-    "MYTE",
-    "MYY",
-    "MZZ",
-    "NAAS",
-    "NABL",
-    "NAC",
-    "NACP",
-    "NAD",
-    "NAII",
-    "NAIL",
-    "NAK",
-    "NAMS",
-    "NAMSW",
-    "NAN",
-    "NANC",
-    "NANR",
-    "NAOV",
-    "NAPA",
-    "NAPR",
-    "NARI",
-    "NAT",
-    "NATH",
-    "NATL",
-    "NATO",
-    "NATR",
-    "NAUG",
-    "NAUT",
-    "NAVI",
-    "NAYA",
-    "NAZ",
-    "NB",
-    "NBB",
-    "NBBK",
-    "NBCC",
-    "NBCE",
-    "NBCM",
-    "NBCR",
-    "NBDS",
-    "NBET",
-    "NBFC",
-    "NBGR",
-    "NBH",
-    "NBHC",
-    "NBIS",
-    "NBIX",
-    "NBJP",
-    "NBN",
-    "NBOS",
-    "NBR",
-    "NBSD",
-    "NBSM",
-    "NBTB",
-    "NBTX",
-    "NBXG",
-    "NBY",
-    "NC",
-    "NCA",
-    "NCDL",
-    "NCI",
-    "NCL",
-    "NCLH",
-    "NCMI",
-    "NCNA",
-    "NCNC",
-    "NCNCW",
-    "NCNO",
-    "NCPB",
-    "NCPL",
-    "NCPLW",
-    "NCRA",
-    "NCSM",
-    "NCTY",
-    "NCV",
-    "NCV$A",
-    "NCZ",
-    "NCZ$A",
-    "NDAA",
-    "NDAQ",
-    "NDIA",
-    "NDIV",
-    "NDLS",
-    "NDMO",
-    "NDOW",
-    "NDP",
-    "NDRA",
-    "NDSN",
-    "NDVG",
-    "NE",
-    "NE.A",
-    "NE.W",
-    "NEA",
-    "NEAR",
-    "NECB",
-    "NEE",
-    "NEE$N",
-    "NEE$R",
-    "NEE$S",
-    "NEE$T",
-    "NEGG",
-    "NEM",
-    "NEN",
-    "NEO",
-    "NEOG",
-    "NEON",
-    "NEOV",
-    "NEOVW",
-    "NEP",
-    "NEPH",
-    "NERD",
-    "NERV",
-    "NESR",
-    "NESRW",
-    "NET",
-    "NETD",
-    "NETDU",
-    "NETDW",
-    "NETL",
-    "NETZ",
-    "NEU",
-    "NEUE",
-    "NEWP",
-    "NEWT",
-    "NEWTG",
-    "NEWTH",
-    "NEWTI",
-    "NEWTZ",
-    "NEWZ",
-    "NEXA",
-    "NEXN",
-    "NEXT",
-    "NFBK",
-    "NFE",
-    "NFG",
-    "NFGC",
-    "NFJ",
-    "NFLP",
-    "NFLT",
-    "NFLU",
-    "NFLX",
-    "NFLY",
-    "NFRA",
-    "NFTY",
-    "NFXL",
-    "NFXS",
-    "NG",
-    "NGD",
-    "NGG",
-    "NGL",
-    "NGL$B",
-    "NGL$C",
-    "NGNE",
-    "NGS",
-    "NGVC",
-    "NGVT",
-    "NHC",
-    "NHI",
-    "NHS",
-    "NHTC",
-    "NI",
-    "NIC",
-    "NICE",
-    "NIE",
-    "NIKL",
-    "NIM",
-    "NINE",
-    "NIO",
-    "NIOBW",
-    "NIPG",
-    "NISN",
-    "NITE",
-    "NITO",
-    "NIU",
-    "NIVF",
-    "NIVFW",
-    "NIXT",
-    "NIXX",
-    "NIXXW",
-    "NJAN",
-    "NJNK",
-    "NJR",
-    "NJUL",
-    "NJUN",
-    "NKE",
-    "NKGN",
-    "NKGNW",
-    "NKLA",
-    "NKSH",
-    "NKTR",
-    "NKTX",
-    "NKX",
-    "NL",
-    "NLOP",
-    "NLR",
-    "NLSP",
-    "NLSPW",
-    "NLY",
-    "NLY$F",
-    "NLY$G",
-    "NLY$I",
-    "NMAI",
-    "NMB",
-    "NMCO",
-    "NMFC",
-    "NMFCZ",
-    "NMG",
-    "NMHI",
-    "NMHIW",
-    "NMI",
-    "NMIH",
-    "NML",
-    "NMM",
-    "NMR",
-    "NMRA",
-    "NMRK",
-    "NMS",
-    "NMT",
-    "NMTC",
-    "NMZ",
-    "NN",
-    "NNAVW",
-    "NNBR",
-    "NNDM",
-    "NNE",
-    "NNI",
-    "NNN",
-    "NNOV",
-    "NNOX",
-    "NNVC",
-    "NNY",
-    "NOA",
-    "NOAH",
-    "NOBL",
-    "NOC",
-    "NOCT",
-    "NODK",
-    "NOG",
-    "NOK",
-    "NOM",
-    "NOMD",
-    "NORW",
-    "NOTE",
-    "NOTE.W",
-    "NOTV",
-    "NOV",
-    "NOVA",
-    "NOVM",
-    "NOVP",
-    "NOVT",
-    "NOVV",
-    "NOVVR",
-    "NOVVU",
-    "NOVVW",
-    "NOVZ",
-    "NOW",
-    "NPCE",
-    "NPCT",
-    "NPFD",
-    "NPFI",
-    "NPK",
-    "NPO",
-    "NPV",
-    "NPWR",
-    "NPWR.W",
-    "NQP",
-    "NR",
-    "NRBO",
-    "NRC",
-    "NRDS",
-    "NRDY",
-    "NREF",
-    "NREF$A",
-    "NRES",
-    "NRG",
-    "NRGV",
-    "NRIM",
-    "NRIX",
-    "NRK",
-    "NRO",
-    "NRP",
-    "NRSH",
-    "NRSN",
-    "NRSNW",
-    "NRT",
-    "NRUC",
-    "NRXP",
-    "NRXPW",
-    "NRXS",
-    "NSA",
-    "NSA$A",
-    "NSA$B",
-    "NSC",
-    "NSCR",
-    "NSCS",
-    "NSEP",
-    "NSI",
-    "NSIT",
-    "NSP",
-    "NSPR",
-    "NSSC",
-    "NSTS",
-    "NSYS",
-    "NTAP",
-    "NTB",
-    "NTCT",
-    "NTES",
-    "NTEST",
-    "NTEST.A",
-    "NTEST.B",
-    "NTEST.C",
-    "NTG",
-    "NTGR",
-    "NTIC",
-    "NTIP",
-    "NTLA",
-    "NTNX",
-    "NTR",
-    "NTRA",
-    "NTRB",
-    "NTRBW",
-    "NTRP",
-    "NTRS",
-    "NTRSO",
-    "NTSE",
-    "NTSI",
-    "NTST",
-    "NTSX",
-    "NTWK",
-    "NTWOU",
-    "NTZ",
-    "NU",
-    "NUAG",
-    "NUBD",
-    "NUDM",
-    "NUDV",
-    "NUE",
-    "NUEM",
-    "NUGO",
-    "NUGT",
-    "NUHY",
-    "NUKK",
-    "NUKKW",
-    "NUKZ",
-    "NULC",
-    "NULG",
-    "NULV",
-    "NUMG",
-    "NUMV",
-    "NURE",
-    "NURO",
-    "NUS",
-    "NUSA",
-    "NUSB",
-    "NUSC",
-    "NUSI",
-    "NUTX",
-    "NUV",
-    "NUVB",
-    "NUVB.W",
-    "NUVL",
-    "NUW",
-    "NUWE",
-    "NVA",
-    "NVAC",
-    "NVACR",
-    "NVACW",
-    "NVAWW",
-    "NVAX",
-    "NVBT",
-    "NVBU",
-    "NVBW",
-    "NVCR",
-    "NVCT",
-    "NVD",
-    "NVDA",
-    "NVDD",
-    "NVDL",
-    "NVDQ",
-    "NVDS",
-    "NVDU",
-    "NVDW",
-    "NVDX",
-    "NVDY",
-    "NVEC",
-    "NVEE",
-    "NVFY",
-    "NVG",
-    "NVGS",
-    "NVIR",
-    "NVMI",
-    "NVNI",
-    "NVNIW",
-    "NVNO",
-    "NVO",
-    "NVR",
-    "NVRI",
-    "NVRO",
-    "NVS",
-    "NVST",
-    "NVT",
-    "NVTS",
-    "NVVE",
-    "NVVEW",
-    "NVX",
-    "NWBI",
-    "NWE",
-    "NWFL",
-    "NWG",
-    "NWGL",
-    "NWL",
-    "NWLG",
-    "NWN",
-    "NWPX",
-    "NWS",
-    "NWSA",
-    "NWTN",
-    "NWTNW",
-    "NX",
-    "NXC",
-    "NXDT",
-    "NXDT$A",
-    "NXE",
-    "NXG",
-    "NXGL",
-    "NXGLW",
-    "NXJ",
-    "NXL",
-    "NXLIW",
-    "NXN",
-    "NXP",
-    "NXPI",
-    "NXPL",
-    "NXPLW",
-    "NXRT",
-    "NXST",
-    "NXT",
-    "NXTC",
-    "NXTE",
-    "NXTG",
-    "NXTI",
-    "NXTT",
-    "NXTV",
-    "NXU",
-    "NYAX",
-    "NYC",
-    "NYF",
-    "NYMT",
-    "NYMTI",
-    "NYMTL",
-    "NYMTM",
-    "NYMTN",
-    "NYMTZ",
-    "NYT",
-    "NYXH",
-    "NZAC",
-    "NZF",
-    "NZUS",
-    "O",
-    "OABI",
-    "OABIW",
-    "OACCU",
-    "OACP",
-    "OAEM",
-    "OAIM",
-    "OAK$A",
-    "OAK$B",
-    "OAKU",
-    "OAKUR",
-    "OAKUU",
-    "OAKUW",
-    "OALC",
-    "OARK",
-    "OASC",
-    "OB",
-    "OBDC",
-    "OBDE",
-    "OBE",
-    "OBIL",
-    "OBIO",
-    "OBK",
-    "OBLG",
-    "OBND",
-    "OBOR",
-    "OBT",
-    "OC",
-    "OCC",
-    "OCCI",
-    "OCCIM",
-    "OCCIN",
-    "OCCIO",
-    "OCEA",
-    "OCEAW",
-    "OCEN",
-    "OCFC",
-    "OCFCP",
-    "OCFS",
-    "OCFT",
-    "OCG",
-    "OCGN",
-    "OCIO",
-    "OCS",
-    "OCSAW",
-    "OCSL",
-    "OCTA",
-    "OCTD",
-    "OCTH",
-    "OCTJ",
-    "OCTM",
-    "OCTO",
-    "OCTP",
-    "OCTQ",
-    "OCTT",
-    "OCTU",
-    "OCTW",
-    "OCTZ",
-    "OCUL",
-    "OCX",
-    "ODC",
-    "ODD",
-    "ODDS",
-    "ODFL",
-    "ODP",
-    "ODV",
-    "ODVWZ",
-    "OEC",
-    "OEF",
-    "OESX",
-    "OEUR",
-    "OFG",
-    "OFIX",
-    "OFLX",
-    "OFOS",
-    "OFS",
-    "OFSSH",
-    "OGCP",
-    "OGE",
-    "OGEN",
-    "OGI",
-    "OGIG",
-    "OGN",
-    "OGS",
-    "OGSP",
-    "OHI",
-    "OI",
-    "OIA",
-    "OIH",
-    "OII",
-    "OILD",
-    "OILK",
-    "OILT",
-    "OILU",
-    "OIS",
-    "OKE",
-    "OKLO",
-    "OKTA",
-    "OKUR",
-    "OKYO",
-    "OLB",
-    "OLED",
-    "OLLI",
-    "OLMA",
-    "OLN",
-    "OLO",
-    "OLP",
-    "OLPX",
-    "OM",
-    "OMAB",
-    "OMC",
-    "OMCC",
-    "OMCL",
-    "OMER",
-    "OMEX",
-    "OMF",
-    "OMFL",
-    "OMFS",
-    "OMGA",
-    "OMH",
-    "OMI",
-    "OMIC",
-    "ON",
-    "ONB",
-    "ONBPO",
-    "ONBPP",
-    "ONCO",
-    "ONCT",
-    "ONCY",
-    "OND",
-    "ONDS",
-    "ONEO",
-    "ONEQ",
-    "ONEV",
-    "ONEW",
-    "ONEY",
-    "ONFO",
-    "ONFOW",
-    "ONIT",
-    "ONL",
-    "ONLN",
-    "ONMD",
-    "ONMDW",
-    "ONOF",
-    "ONON",
-    "ONTF",
-    "ONTO",
-    "ONVO",
-    "OOMA",
-    "OOSP",
-    "OOTO",
-    "OP",
-    "OPAD",
-    "OPAL",
-    "OPBK",
-    "OPCH",
-    "OPEN",
-    "OPER",
-    "OPFI",
-    "OPFI.W",
-    "OPHC",
-    "OPI",
-    "OPINL",
-    "OPK",
-    "OPOF",
-    "OPP",
-    "OPP$A",
-    "OPP$B",
-    "OPRA",
-    "OPRT",
-    "OPRX",
-    "OPT",
-    "OPTN",
-    "OPTT",
-    "OPTX",
-    "OPTXW",
-    "OPTZ",
-    "OPXS",
-    "OPY",
-    "OR",
-    "ORA",
-    "ORC",
-    "ORCL",
-    "ORGN",
-    "ORGNW",
-    "ORGO",
-    "ORI",
-    "ORIC",
-    "ORIS",
-    "ORKA",
-    "ORKT",
-    "ORLA",
-    "ORLY",
-    "ORMP",
-    "ORN",
-    "ORRF",
-    "OS",
-    "OSBC",
-    "OSCR",
-    "OSCV",
-    "OSEA",
-    "OSIS",
-    "OSK",
-    "OSPN",
-    "OSS",
-    "OST",
-    "OSTX",
-    "OSUR",
-    "OSW",
-    "OTEX",
-    "OTIS",
-    "OTLK",
-    "OTLY",
-    "OTRK",
-    "OTTR",
-    "OUNZ",
-    "OUSA",
-    "OUSM",
-    "OUST",
-    "OUST.A",
-    "OUST.W",
-    "OUT",
-    "OVB",
-    "OVBC",
-    "OVF",
-    "OVID",
-    "OVL",
-    "OVLH",
-    "OVLY",
-    "OVM",
-    "OVS",
-    "OVT",
-    "OVV",
-    "OWL",
-    "OWLT",
-    "OWNS",
-    "OXBR",
-    "OXBRW",
-    "OXLC",
-    "OXLCI",
-    "OXLCL",
-    "OXLCN",
-    "OXLCO",
-    "OXLCP",
-    "OXLCZ",
-    "OXM",
-    "OXSQ",
-    "OXSQG",
-    "OXSQZ",
-    "OXY",
-    "OXY.W",
-    "OZ",
-    "OZEM",
-    "OZK",
-    "OZKAP",
-    "PAA",
-    "PAAA",
-    "PAAS",
-    "PAB",
-    "PABD",
-    "PABU",
-    "PAC",
-    "PACB",
-    "PACK",
-    "PACS",
-    "PAG",
-    "PAGP",
-    "PAGS",
-    "PAHC",
-    "PAI",
-    "PAL",
-    "PALC",
-    "PALI",
-    "PALL",
-    "PALT",
-    "PAM",
-    "PAMC",
-    "PAMT",
-    "PANL",
-    "PANW",
-    "PAPI",
-    "PAPL",
-    "PAPR",
-    "PAR",
-    "PARA",
-    "PARAA",
-    "PARR",
-    "PASG",
-    "PATH",
-    "PATK",
-    "PATN",
-    "PAUG",
-    "PAVE",
-    "PAVM",
-    "PAVMZ",
-    "PAVS",
-    "PAWZ",
-    "PAX",
-    "PAXS",
-    "PAY",
-    "PAYC",
-    "PAYO",
-    "PAYS",
-    "PAYX",
-    "PB",
-    "PBA",
-    "PBAP",
-    "PBAU",
-    "PBBK",
-    "PBD",
-    "PBDC",
-    "PBDE",
-    "PBE",
-    "PBF",
-    "PBFB",
-    "PBFR",
-    "PBFS",
-    "PBH",
-    "PBHC",
-    "PBI",
-    "PBI$B",
-    "PBJ",
-    "PBJA",
-    "PBJL",
-    "PBJN",
-    "PBL",
-    "PBM",
-    "PBMR",
-    "PBMWW",
-    "PBMY",
-    "PBNV",
-    "PBOC",
-    "PBP",
-    "PBPB",
-    "PBR",
-    "PBR.A",
-    "PBSE",
-    "PBT",
-    "PBTP",
-    "PBUS",
-    "PBW",
-    "PBYI",
-    "PC",
-    "PCAR",
-    "PCB",
-    "PCCE",
-    "PCEF",
-    "PCEM",
-    "PCF",
-    "PCG",
-    "PCG$A",
-    "PCG$B",
-    "PCG$C",
-    "PCG$D",
-    "PCG$E",
-    "PCG$G",
-    "PCG$H",
-    "PCG$I",
-    "PCGG",
-    "PCH",
-    "PCIG",
-    "PCK",
-    "PCM",
-    "PCN",
-    "PCOR",
-    "PCQ",
-    "PCRB",
-    "PCRX",
-    "PCSA",
-    "PCSC",
-    "PCT",
-    "PCTTU",
-    "PCTTW",
-    "PCTY",
-    "PCVX",
-    "PCY",
-    "PCYO",
-    "PD",
-    "PDBA",
-    "PDBC",
-    "PDCC",
-    "PDCO",
-    "PDD",
-    "PDEC",
-    "PDEX",
-    "PDFS",
-    "PDI",
-    "PDLB",
-    "PDM",
-    "PDN",
-    "PDO",
-    "PDP",
-    "PDS",
-    "PDSB",
-    "PDT",
-    "PDX",
-    "PDYN",
-    "PDYNW",
-    "PEB",
-    "PEB$E",
-    "PEB$F",
-    "PEB$G",
-    "PEB$H",
-    "PEBK",
-    "PEBO",
-    "PECO",
-    "PED",
-    "PEG",
-    "PEGA",
-    "PEJ",
-    "PEMX",
-    "PEN",
-    "PENG",
-    "PENN",
-    "PEO",
-    "PEP",
-    "PEPG",
-    "PEPS",
-    "PERF",
-    "PERF.W",
-    "PERI",
-    "PESI",
-    "PET",
-    "PETS",
-    "PETWW",
-    "PETZ",
-    "PEV",
-    "PEX",
-    "PEXL",
-    "PEY",
-    "PEZ",
-    "PFBC",
-    "PFC",
-    "PFD",
-    "PFE",
-    "PFEB",
-    "PFF",
-    "PFFA",
-    "PFFD",
-    "PFFL",
-    "PFFR",
-    "PFFV",
-    "PFG",
-    "PFGC",
-    "PFH",
-    "PFI",
-    "PFIE",
-    "PFIG",
-    "PFIS",
-    "PFIX",
-    "PFL",
-    "PFLD",
-    "PFLT",
-    "PFM",
-    "PFMT",
-    "PFN",
-    "PFO",
-    "PFRL",
-    "PFS",
-    "PFSI",
-    "PFTA",
-    "PFTAU",
-    "PFTAW",
-    "PFUT",
-    "PFX",
-    "PFXF",
-    "PFXNZ",
-    "PG",
-    "PGC",
-    "PGEN",
-    "PGF",
-    "PGHL",
-    "PGHY",
-    "PGJ",
-    "PGNY",
-    "PGP",
-    "PGR",
-    "PGRE",
-    "PGRO",
-    "PGRU",
-    "PGX",
-    "PGY",
-    "PGYWW",
-    "PGZ",
-    "PH",
-    "PHAR",
-    "PHAT",
-    "PHB",
-    "PHD",
-    "PHDG",
-    "PHEQ",
-    "PHG",
-    "PHGE",
-    "PHI",
-    "PHIN",
-    "PHIO",
-    "PHK",
-    "PHM",
-    "PHO",
-    "PHR",
-    "PHT",
-    "PHUN",
-    "PHVS",
-    "PHX",
-    "PHYD",
-    "PHYL",
-    "PHYS",
-    "PI",
-    "PICB",
-    "PICK",
-    "PID",
-    "PIE",
-    "PIEQ",
-    "PIFI",
-    "PII",
-    "PIII",
-    "PIIIW",
-    "PIK",
-    "PILL",
-    "PIM",
-    "PIN",
-    "PINC",
-    "PINE",
-    "PINK",
-    "PINS",
-    "PIO",
-    "PIPR",
-    "PIRS",
-    "PIT",
-    "PITA",
-    "PITAW",
-    "PIZ",
-    "PJAN",
-    "PJBF",
-    "PJFG",
-    "PJFM",
-    "PJFV",
-    "PJIO",
-    "PJP",
-    "PJT",
-    "PJUL",
-    "PJUN",
-    "PK",
-    "PKB",
-    "PKBK",
-    "PKE",
-    "PKG",
-    "PKOH",
-    "PKST",
-    "PKW",
-    "PKX",
-    "PL",
-    "PL.W",
-    "PLAB",
-    "PLAG",
-    "PLAO",
-    "PLAY",
-    "PLBC",
-    "PLBY",
-    "PLCE",
-    "PLD",
-    "PLDR",
-    "PLG",
-    "PLL",
-    "PLMJ",
-    "PLMJU",
-    "PLMJW",
-    "PLMR",
-    "PLNT",
-    "PLOW",
-    "PLPC",
-    "PLRX",
-    "PLRZ",
-    "PLSE",
-    "PLTK",
-    "PLTM",
-    "PLTR",
-    "PLTY",
-    "PLUG",
-    "PLUR",
-    "PLUS",
-    "PLX",
-    "PLXS",
-    "PLYA",
-    "PLYM",
-    "PM",
-    "PMAR",
-    "PMAX",
-    "PMAY",
-    "PMBS",
-    "PMCB",
-    "PMD",
-    "PMEC",
-    "PMF",
-    "PMIO",
-    "PML",
-    "PMM",
-    "PMN",
-    "PMNT",
-    "PMO",
-    "PMT",
-    "PMT$A",
-    "PMT$B",
-    "PMT$C",
-    "PMTS",
-    "PMTU",
-    "PMVP",
-    "PMX",
-    "PNBK",
-    "PNC",
-    "PNF",
-    "PNFP",
-    "PNFPP",
-    "PNI",
-    "PNNT",
-    "PNOV",
-    "PNQI",
-    "PNR",
-    "PNRG",
-    "PNST",
-    "PNST.W",
-    "PNTG",
-    "PNW",
-    "POAI",
-    "POCI",
-    "POCT",
-    "PODC",
-    "PODD",
-    "POET",
-    "POLA",
-    "POLE",
-    "POLEU",
-    "POLEW",
-    "POOL",
-    "POR",
-    "POST",
-    "POWA",
-    "POWI",
-    "POWL",
-    "POWW",
-    "POWWP",
-    "PP",
-    "PPA",
-    "PPBI",
-    "PPBT",
-    "PPC",
-    "PPEM",
-    "PPG",
-    "PPH",
-    "PPI",
-    "PPIE",
-    "PPIH",
-    "PPL",
-    "PPLT",
-    "PPSI",
-    "PPT",
-    "PPTA",
-    "PPTY",
-    "PPYA",
-    "PPYAU",
-    "PPYAW",
-    "PQDI",
-    "PR",
-    "PRA",
-    "PRAA",
-    "PRAE",
-    "PRAX",
-    "PRAY",
-    "PRCH",
-    "PRCT",
-    "PRDO",
-    "PRE",
-    "PREF",
-    "PRENW",
-    "PRF",
-    "PRFD",
-    "PRFX",
-    "PRFZ",
-    "PRG",
-    "PRGO",
-    "PRGS",
-    "PRH",
-    "PRI",
-    "PRIF$D",
-    "PRIF$F",
-    "PRIF$G",
-    "PRIF$H",
-    "PRIF$I",
-    "PRIF$J",
-    "PRIF$K",
-    "PRIF$L",
-    "PRIM",
-    "PRK",
-    "PRKS",
-    "PRLB",
-    "PRLD",
-    "PRLH",
-    "PRLHU",
-    "PRLHW",
-    "PRM",
-    "PRMB",
-    "PRME",
-    "PRMN",
-    "PRN",
-    "PRNT",
-    "PRO",
-    "PROC",
-    "PROCW",
-    "PROF",
-    "PROK",
-    "PROP",
-    "PROV",
-    "PRPH",
-    "PRPL",
-    "PRPO",
-    "PRQR",
-    "PRS",
-    "PRSO",
-    "PRT",
-    "PRTA",
-    "PRTC",
-    "PRTG",
-    "PRTH",
-    "PRTS",
-    "PRU",
-    "PRVA",
-    "PRZO",
-    "PSA",
-    "PSA$F",
-    "PSA$G",
-    "PSA$H",
-    "PSA$I",
-    "PSA$J",
-    "PSA$K",
-    "PSA$L",
-    "PSA$M",
-    "PSA$N",
-    "PSA$O",
-    "PSA$P",
-    "PSA$Q",
-    "PSA$R",
-    "PSA$S",
-    "PSBD",
-    "PSC",
-    "PSCC",
-    "PSCD",
-    "PSCE",
-    "PSCF",
-    "PSCH",
-    "PSCI",
-    "PSCJ",
-    "PSCM",
-    "PSCQ",
-    "PSCT",
-    "PSCU",
-    "PSCW",
-    "PSCX",
-    "PSDM",
-    "PSEC",
-    "PSEC$A",
-    "PSEP",
-    "PSET",
-    "PSF",
-    "PSFD",
-    "PSFE",
-    "PSFE.W",
-    "PSFF",
-    "PSFJ",
-    "PSFM",
-    "PSFO",
-    "PSH",
-    "PSHG",
-    "PSI",
-    "PSIG",
-    "PSIL",
-    "PSK",
-    "PSL",
-    "PSLV",
-    "PSMD",
-    "PSMJ",
-    "PSMO",
-    "PSMR",
-    "PSMT",
-    "PSN",
-    "PSNL",
-    "PSNY",
-    "PSNYW",
-    "PSO",
-    "PSP",
-    "PSQ",
-    "PSQA",
-    "PSQH",
-    "PSQH.W",
-    "PSQO",
-    "PSR",
-    "PST",
-    "PSTG",
-    "PSTL",
-    "PSTP",
-    "PSTR",
-    "PSTV",
-    "PSTX",
-    "PSWD",
-    "PSX",
-    "PT",
-    "PTA",
-    "PTBD",
-    "PTC",
-    "PTCT",
-    "PTEC",
-    "PTEN",
-    "PTEU",
-    "PTF",
-    "PTGX",
-    "PTH",
-    "PTHL",
-    "PTIN",
-    "PTIR",
-    "PTIX",
-    "PTIXW",
-    "PTL",
-    "PTLC",
-    "PTLE",
-    "PTLO",
-    "PTMC",
-    "PTMN",
-    "PTN",
-    "PTNQ",
-    "PTON",
-    "PTPI",
-    "PTRB",
-    "PTVE",
-    "PTY",
-    "PUBM",
-    "PUI",
-    "PUK",
-    "PULM",
-    "PULS",
-    "PULT",
-    "PUMP",
-    "PUSH",
-    "PUTD",
-    "PUTW",
-    "PVAL",
-    "PVBC",
-    "PVH",
-    "PVI",
-    "PVL",
-    "PW",
-    "PW$A",
-    "PWB",
-    "PWER",
-    "PWM",
-    "PWOD",
-    "PWP",
-    "PWR",
-    "PWS",
-    "PWUP",
-    "PWUPU",
-    "PWUPW",
-    "PWV",
-    "PWZ",
-    "PX",
-    "PXE",
-    "PXF",
-    "PXH",
-    "PXI",
-    "PXJ",
-    "PXLW",
-    "PXS",
-    "PXSAW",
-    "PY",
-    "PYCR",
-    "PYLD",
-    "PYN",
-    "PYPD",
-    "PYPL",
-    "PYPY",
-    "PYT",
-    "PYXS",
-    "PYZ",
-    "PZA",
-    "PZC",
-    "PZG",
-    "PZT",
-    "PZZA",
-    "QABA",
-    "QAI",
-    "QARP",
-    "QAT",
-    "QBER",
-    "QBTS",
-    "QBTS.W",
-    "QBUF",
-    "QBUL",
-    "QCAP",
-    "QCJL",
-    "QCLN",
-    "QCLR",
-    "QCOC",
-    "QCOM",
-    "QCON",
-    "QCRH",
-    "QD",
-    "QDCC",
-    "QDEC",
-    "QDEF",
-    "QDEL",
-    "QDF",
-    "QDIV",
-    "QDPL",
-    "QDTE",
-    "QDVO",
-    "QEFA",
-    "QEMM",
-    "QETA",
-    "QETAR",
-    "QETAU",
-    "QETH",
-    "QFIN",
-    "QFLR",
-    "QGEN",
-    "QGRO",
-    "QGRW",
-    "QH",
-    "QHDG",
-    "QHY",
-    "QID",
-    "QIG",
-    "QINT",
-    "QIPT",
-    "QIS",
-    "QJUN",
-    "QLC",
-    "QLD",
-    "QLGN",
-    "QLTA",
-    "QLTI",
-    "QLTY",
-    "QLV",
-    "QLVD",
-    "QLVE",
-    "QLYS",
-    "QMAG",
-    "QMAR",
-    "QMCO",
-    "QMID",
-    "QMMM",
-    "QMMY",
-    "QMNV",
-    "QMOM",
-    "QNCX",
-    "QNRX",
-    "QNST",
-    "QNTM",
-    "QNXT",
-    "QOMO",
-    "QOMOR",
-    "QOMOU",
-    "QOMOW",
-    "QOWZ",
-    "QPFF",
-    "QPX",
-    "QQA",
-    "QQEW",
-    "QQH",
-    "QQJG",
-    "QQMG",
-    "QQQ",
-    "QQQA",
-    "QQQD",
-    "QQQE",
-    "QQQG",
-    "QQQI",
-    "QQQJ",
-    "QQQM",
-    "QQQP",
-    "QQQS",
-    "QQQT",
-    "QQQU",
-    "QQQW",
-    "QQQX",
-    "QQQY",
-    "QQXT",
-    "QRFT",
-    "QRHC",
-    "QRMI",
-    "QRTEA",
-    "QRTEB",
-    "QRTEP",
-    "QRVO",
-    "QS",
-    "QSG",
-    "QSI",
-    "QSIAW",
-    "QSIG",
-    "QSIX",
-    "QSML",
-    "QSPT",
-    "QSR",
-    "QSWN",
-    "QTAP",
-    "QTEC",
-    "QTI",
-    "QTJA",
-    "QTJL",
-    "QTOC",
-    "QTOP",
-    "QTR",
-    "QTRX",
-    "QTTB",
-    "QTUM",
-    "QTWO",
-    "QUAD",
-    "QUAL",
-    "QUBT",
-    "QUIK",
-    "QULL",
-    "QURE",
-    "QUS",
-    "QUVU",
-    "QVAL",
-    "QVCC",
-    "QVCD",
-    "QVML",
-    "QVMM",
-    "QVMS",
-    "QVOY",
-    "QWLD",
-    "QXO",
-    "QXQ",
-    "QYLD",
-    "QYLE",
-    "QYLG",
-    "R",
-    "RA",
-    "RAAX",
-    "RACE",
-    "RAFE",
-    "RAIL",
-    "RAMP",
-    "RAND",
-    "RANI",
-    "RAPP",
-    "RAPT",
-    "RARE",
-    "RATE",
-    "RAVE",
-    "RAVI",
-    "RAY",
-    "RAYA",
-    "RAYC",
-    "RAYD",
-    "RAYE",
-    "RAYJ",
-    "RAYS",
-    "RBA",
-    "RBB",
-    "RBBN",
-    "RBC",
-    "RBCAA",
-    "RBKB",
-    "RBLD",
-    "RBLX",
-    "RBOT",
-    "RBOT.W",
-    "RBRK",
-    "RBUF",
-    "RC",
-    "RC$C",
-    "RC$E",
-    "RCAT",
-    "RCB",
-    "RCC",
-    "RCEL",
-    "RCG",
-    "RCI",
-    "RCKT",
-    "RCKTW",
-    "RCKY",
-    "RCL",
-    "RCM",
-    "RCMT",
-    "RCON",
-    "RCS",
-    "RCUS",
-    "RDACU",
-    "RDCM",
-    "RDDT",
-    "RDFI",
-    "RDFN",
-    "RDHL",
-    "RDI",
-    "RDIB",
-    "RDIV",
-    "RDN",
-    "RDNT",
-    "RDOG",
-    "RDTE",
-    "RDUS",
-    "RDVI",
-    "RDVT",
-    "RDVY",
-    "RDW",
-    "RDW.W",
-    "RDWR",
-    "RDY",
-    "RDZN",
-    "RDZNW",
-    "REAI",
-    "REAL",
-    "REAX",
-    "REBN",
-    "RECS",
-    "RECT",
-    "REE",
-    "REET",
-    "REFI",
-    "REFR",
-    "REG",
-    "REGCO",
-    "REGCP",
-    "REGL",
-    "REGN",
-    "REI",
-    "REIT",
-    "REK",
-    "REKR",
-    "REKT",
-    "RELI",
-    "RELIW",
-    "RELL",
-    "RELX",
-    "RELY",
-    "REM",
-    "REMX",
-    "RENB",
-    "RENE",
-    "RENEU",
-    "RENEW",
-    "RENT",
-    "RENW",
-    "REPL",
-    "REPX",
-    "RERE",
-    "RES",
-    "RETL",
-    "RETO",
-    "REVB",
-    "REVBW",
-    "REVG",
-    "REVS",
-    "REW",
-    "REX",
-    "REXR",
-    "REXR$B",
-    "REXR$C",
-    "REYN",
-    "REZ",
-    "REZI",
-    "RF",
-    "RF$C",
-    "RF$E",
-    "RF$F",
-    "RFAC",
-    "RFACR",
-    "RFACU",
-    "RFACW",
-    "RFAI",
-    "RFAIR",
-    "RFAIU",
-    "RFCI",
-    "RFDA",
-    "RFDI",
-    "RFEM",
-    "RFEU",
-    "RFFC",
-    "RFG",
-    "RFI",
-    "RFIL",
-    "RFL",
-    "RFLR",
-    "RFM",
-    "RFMZ",
-    "RFV",
-    "RGA",
-    "RGC",
-    "RGCO",
-    "RGEF",
-    "RGEN",
-    "RGF",
-    "RGLD",
-    "RGLS",
-    "RGNX",
-    "RGP",
-    "RGR",
-    "RGS",
-    "RGT",
-    "RGTI",
-    "RGTIW",
-    "RH",
-    "RHCB",
-    "RHE",
-    "RHE$A",
-    "RHI",
-    "RHP",
-    "RHRX",
-    "RHTX",
-    "RICK",
-    "RIET",
-    "RIG",
-    "RIGL",
-    "RIGS",
-    "RILY",
-    "RILYG",
-    "RILYK",
-    "RILYL",
-    "RILYM",
-    "RILYN",
-    "RILYP",
-    "RILYT",
-    "RILYZ",
-    "RIME",
-    "RINC",
-    "RINF",
-    "RING",
-    "RIO",
-    "RIOT",
-    "RISN",
-    "RISR",
-    "RITA",
-    "RITM",
-    "RITM$A",
-    "RITM$B",
-    "RITM$C",
-    "RITM$D",
-    "RITR",
-    "RIV",
-    "RIV$A",
-    "RIVN",
-    "RJF",
-    "RJF$B",
-    "RJMG",
-    "RKDA",
-    "RKLB",
-    "RKT",
-    "RL",
-    "RLAY",
-    "RLGT",
-    "RLI",
-    "RLJ",
-    "RLJ$A",
-    "RLMD",
-    "RLTY",
-    "RLX",
-    "RLY",
-    "RLYB",
-    "RM",
-    "RMAX",
-    "RMBI",
-    "RMBL",
-    "RMBS",
-    "RMCA",
-    "RMCF",
-    "RMCO",
-    "RMCOW",
-    "RMD",
-    "RMI",
-    "RMIF",
-    "RMM",
-    "RMMZ",
-    "RMNI",
-    "RMNY",
-    "RMOP",
-    "RMR",
-    "RMT",
-    "RMTI",
-    "RNA",
-    "RNAC",
-    "RNAZ",
-    "RND",
-    "RNEM",
-    "RNEW",
-    "RNG",
-    "RNGR",
-    "RNP",
-    "RNR",
-    "RNR$F",
-    "RNR$G",
-    "RNRG",
-    "RNSC",
-    "RNST",
-    "RNW",
-    "RNWWW",
-    "RNWZ",
-    "RNXT",
-    "ROAD",
-    "ROAM",
-    "ROBO",
-    "ROBT",
-    "ROCK",
-    "ROCL",
-    "ROCLU",
-    "ROCLW",
-    "RODE",
-    "RODM",
-    "ROE",
-    "ROG",
-    "ROIC",
-    "ROIS",
-    "ROIV",
-    "ROK",
-    "ROKT",
-    "ROKU",
-    "ROL",
-    "ROLR",
-    "ROM",
-    "ROMA",
-    "ROMO",
-    "ROOF",
-    "ROOT",
-    "ROP",
-    "RORO",
-    "ROSC",
-    "ROST",
-    "ROUS",
-    "RPAR",
-    "RPAY",
-    "RPD",
-    "RPG",
-    "RPHS",
-    "RPID",
-    "RPM",
-    "RPRX",
-    "RPTX",
-    "RPV",
-    "RQI",
-    "RR",
-    "RRBI",
-    "RRC",
-    "RRGB",
-    "RRR",
-    "RRX",
-    "RS",
-    "RSBT",
-    "RSBY",
-    "RSEE",
-    "RSF",
-    "RSG",
-    "RSHO",
-    "RSI",
-    "RSJN",
-    "RSKD",
-    "RSLS",
-    "RSMC",
-    "RSP",
-    "RSPA",
-    "RSPC",
-    "RSPD",
-    "RSPE",
-    "RSPF",
-    "RSPG",
-    "RSPH",
-    "RSPM",
-    "RSPN",
-    "RSPR",
-    "RSPS",
-    "RSPT",
-    "RSPU",
-    "RSSB",
-    "RSSE",
-    "RSSL",
-    "RSSS",
-    "RSST",
-    "RSSY",
-    "RSVR",
-    "RSVRW",
-    "RTAI",
-    "RTC",
-    "RTH",
-    "RTO",
-    "RTRE",
-    "RTX",
-    "RULE",
-    "RUM",
-    "RUMBW",
-    "RUN",
-    "RUNN",
-    "RUSHA",
-    "RUSHB",
-    "RVER",
-    "RVLV",
-    "RVMD",
-    "RVMDW",
-    "RVNC",
-    "RVNU",
-    "RVP",
-    "RVPH",
-    "RVPHW",
-    "RVRB",
-    "RVSB",
-    "RVSN",
-    "RVSNW",
-    "RVT",
-    "RVTY",
-    "RVYL",
-    "RWAY",
-    "RWAYL",
-    "RWAYZ",
-    "RWJ",
-    "RWK",
-    "RWL",
-    "RWM",
-    "RWO",
-    "RWR",
-    "RWT",
-    "RWT$A",
-    "RWTN",
-    "RWTO",
-    "RWX",
-    "RXD",
-    "RXI",
-    "RXL",
-    "RXO",
-    "RXRX",
-    "RXST",
-    "RXT",
-    "RY",
-    "RYAAY",
-    "RYAM",
-    "RYAN",
-    "RYDE",
-    "RYI",
-    "RYLD",
-    "RYLG",
-    "RYN",
-    "RYSE",
-    "RYTM",
-    "RZB",
-    "RZC",
-    "RZG",
-    "RZLT",
-    "RZLV",
-    "RZLVW",
-    "RZV",
-    "S",
-    "SA",
-    "SAA",
-    "SABA",
-    "SABR",
-    "SABS",
-    "SABSW",
-    "SACC",
-    "SACH",
-    "SACH$A",
-    "SAEF",
-    "SAFE",
-    "SAFT",
-    "SAG",
-    "SAGE",
-    "SAGP",
-    "SAH",
-    "SAIA",
-    "SAIC",
-    "SAIH",
-    "SAIHW",
-    "SAJ",
-    "SAM",
-    "SAMG",
-    "SAMM",
-    "SAMT",
-    "SAN",
-    "SANA",
-    "SAND",
-    "SANG",
-    "SANM",
-    "SANW",
-    "SAP",
-    "SAR",
-    "SARK",
-    "SARO",
-    "SASR",
-    "SAT",
-    "SATL",
-    "SATLW",
-    "SATO",
-    "SATS",
-    "SATX",
-    "SAUG",
-    "SAVA",
-    "SAWG",
-    "SAWS",
-    "SAY",
-    "SAZ",
-    "SB",
-    "SB$C",
-    "SB$D",
-    "SBAC",
-    "SBB",
-    "SBBA",
-    "SBC",
-    "SBCF",
-    "SBCWW",
-    "SBET",
-    "SBEV",
-    "SBEV.W",
-    "SBFG",
-    "SBFM",
-    "SBFMW",
-    "SBGI",
-    "SBH",
-    "SBI",
-    "SBIO",
-    "SBIT",
-    "SBLK",
-    "SBND",
-    "SBR",
-    "SBRA",
-    "SBS",
-    "SBSI",
-    "SBSW",
-    "SBT",
-    "SBUX",
-    "SBXD",
-    "SBXD.U",
-    "SBXD.W",
-    "SCAP",
-    "SCC",
-    "SCCC",
-    "SCCD",
-    "SCCE",
-    "SCCF",
-    "SCCG",
-    "SCCO",
-    "SCD",
-    "SCDL",
-    "SCDS",
-    "SCE$G",
-    "SCE$H",
-    "SCE$J",
-    "SCE$K",
-    "SCE$L",
-    "SCE$M",
-    "SCE$N",
-    "SCHA",
-    "SCHB",
-    "SCHC",
-    "SCHD",
-    "SCHE",
-    "SCHF",
-    "SCHG",
-    "SCHH",
-    "SCHI",
-    "SCHJ",
-    "SCHK",
-    "SCHL",
-    "SCHM",
-    "SCHO",
-    "SCHP",
-    "SCHQ",
-    "SCHR",
-    "SCHV",
-    "SCHW",
-    "SCHW$D",
-    "SCHW$J",
-    "SCHX",
-    "SCHY",
-    "SCHZ",
-    "SCI",
-    "SCIO",
-    "SCJ",
-    "SCKT",
-    "SCL",
-    "SCLX",
-    "SCLXW",
-    "SCLZ",
-    "SCM",
-    "SCMB",
-    "SCNI",
-    "SCNX",
-    "SCO",
-    "SCOR",
-    "SCPH",
-    "SCPX",
-    "SCS",
-    "SCSC",
-    "SCUS",
-    "SCVL",
-    "SCWO",
-    "SCWX",
-    "SCYB",
-    "SCYX",
-    "SCZ",
-    "SD",
-    "SDA",
-    "SDAWW",
-    "SDCI",
-    "SDCP",
-    "SDD",
-    "SDEM",
-    "SDFI",
-    "SDG",
-    "SDGR",
-    "SDHC",
-    "SDHY",
-    "SDIG",
-    "SDIV",
-    "SDOG",
-    "SDOT",
-    "SDOW",
-    "SDP",
-    "SDRL",
-    "SDS",
-    "SDSI",
-    "SDST",
-    "SDSTW",
-    "SDVD",
-    "SDVY",
-    "SDY",
-    "SE",
-    "SEA",
-    "SEAL$A",
-    "SEAL$B",
-    "SEAT",
-    "SEATW",
-    "SEB",
-    "SECR",
-    "SECT",
-    "SEDG",
-    "SEE",
-    "SEED",
-    "SEEM",
-    "SEER",
-    "SEF",
-    "SEG",
-    "SEI",
-    "SEIC",
-    "SEIE",
-    "SEIM",
-    "SEIQ",
-    "SEIS",
-    "SEIV",
-    "SEIX",
-    "SELF",
-    "SELV",
-    "SELX",
-    "SEM",
-    "SEMI",
-    "SEMR",
-    "SENEA",
-    "SENEB",
-    "SENS",
-    "SEPM",
-    "SEPN",
-    "SEPP",
-    "SEPT",
-    "SEPU",
-    "SEPW",
-    "SEPZ",
-    "SER",
-    "SERA",
-    "SERV",
-    "SES",
-    "SES.W",
-    "SETH",
-    "SETM",
-    "SEVN",
-    "SEZL",
-    "SF",
-    "SF$B",
-    "SF$C",
-    "SF$D",
-    "SFB",
-    "SFBC",
-    "SFBS",
-    "SFEB",
-    "SFHG",
-    "SFIX",
-    "SFL",
-    "SFLO",
-    "SFLR",
-    "SFM",
-    "SFNC",
-    "SFST",
-    "SFWL",
-    "SFY",
-    "SFYF",
-    "SFYX",
-    "SG",
-    "SGA",
-    "SGBX",
-    "SGC",
-    "SGD",
-    "SGDJ",
-    "SGDM",
-    "SGHC",
-    "SGHT",
-    "SGLC",
-    "SGLY",
-    "SGMA",
-    "SGML",
-    "SGMO",
-    "SGMT",
-    "SGN",
-    "SGOL",
-    "SGOV",
-    "SGRP",
-    "SGRY",
-    "SGU",
-    "SH",
-    "SHAG",
-    "SHAK",
-    "SHBI",
-    "SHC",
-    "SHCO",
-    "SHDG",
-    "SHE",
-    "SHEH",
-    "SHEL",
-    "SHEN",
-    "SHFS",
-    "SHFSW",
-    "SHG",
-    "SHIM",
-    "SHIP",
-    "SHLD",
-    "SHLS",
-    "SHLT",
-    "SHM",
-    "SHMD",
-    "SHMDW",
-    "SHNY",
-    "SHO",
-    "SHO$H",
-    "SHO$I",
-    "SHOC",
-    "SHOO",
-    "SHOP",
-    "SHOT",
-    "SHOTW",
-    "SHPH",
-    "SHPP",
-    "SHRT",
-    "SHRY",
-    "SHUS",
-    "SHV",
-    "SHW",
-    "SHY",
-    "SHYD",
-    "SHYF",
-    "SHYG",
-    "SHYL",
-    "SIBN",
-    "SID",
-    "SIDU",
-    "SIEB",
-    "SIF",
-    "SIFI",
-    "SIFY",
-    "SIG",
-    "SIGA",
-    "SIGI",
-    "SIGIP",
-    "SIHY",
-    "SII",
-    "SIJ",
-    "SIL",
-    "SILA",
-    "SILC",
-    "SILJ",
-    "SILO",
-    "SILV",
-    "SIM",
-    "SIMA",
-    "SIMAU",
-    "SIMAW",
-    "SIMO",
-    "SIMS",
-    "SINT",
-    "SIO",
-    "SIRI",
-    "SISI",
-    "SITC",
-    "SITC$A",
-    "SITE",
-    "SITM",
-    "SIVR",
-    "SIXA",
-    "SIXD",
-    "SIXF",
-    "SIXG",
-    "SIXH",
-    "SIXJ",
-    "SIXL",
-    "SIXO",
-    "SIXP",
-    "SIXS",
-    "SIXZ",
-    "SIZE",
-    "SJ",
-    "SJB",
-    "SJCP",
-    "SJLD",
-    "SJM",
-    "SJNK",
-    "SJT",
-    "SJW",
-    "SKE",
-    "SKF",
-    "SKGR",
-    "SKGRU",
-    "SKGRW",
-    "SKIL",
-    "SKIN",
-    "SKK",
-    "SKLZ",
-    "SKM",
-    "SKOR",
-    "SKRE",
-    "SKT",
-    "SKWD",
-    "SKX",
-    "SKY",
-    "SKYE",
-    "SKYH",
-    "SKYH.W",
-    "SKYQ",
-    "SKYT",
-    "SKYU",
-    "SKYW",
-    "SKYX",
-    "SKYY",
-    "SLAB",
-    "SLB",
-    "SLDB",
-    "SLDP",
-    "SLDPW",
-    "SLDR",
-    "SLE",
-    "SLF",
-    "SLG",
-    "SLG$I",
-    "SLGL",
-    "SLGN",
-    "SLI",
-    "SLM",
-    "SLMBP",
-    "SLN",
-    "SLND",
-    "SLND.W",
-    "SLNG",
-    "SLNH",
-    "SLNHP",
-    "SLNO",
-    "SLNZ",
-    "SLP",
-    "SLQD",
-    "SLQT",
-    "SLRC",
-    "SLRN",
-    "SLRX",
-    "SLS",
-    "SLSR",
-    "SLV",
-    "SLVM",
-    "SLVO",
-    "SLVP",
-    "SLX",
-    "SLXN",
-    "SLXNW",
-    "SLYG",
-    "SLYV",
-    "SM",
-    "SMAP",
-    "SMAR",
-    "SMAX",
-    "SMAY",
-    "SMB",
-    "SMBC",
-    "SMBK",
-    "SMBS",
-    "SMC",
-    "SMCF",
-    "SMCI",
-    "SMCO",
-    "SMCP",
-    "SMCX",
-    "SMCY",
-    "SMDD",
-    "SMDV",
-    "SMFG",
-    "SMG",
-    "SMH",
-    "SMHB",
-    "SMHI",
-    "SMHX",
-    "SMI",
-    "SMID",
-    "SMIG",
-    "SMIN",
-    "SMIZ",
-    "SMLF",
-    "SMLL",
-    "SMLR",
-    "SMLV",
-    "SMMD",
-    "SMMT",
-    "SMMU",
-    "SMMV",
-    "SMN",
-    "SMOG",
-    "SMOT",
-    "SMP",
-    "SMPL",
-    "SMR",
-    "SMR.W",
-    "SMRI",
-    "SMRT",
-    "SMSI",
-    "SMST",
-    "SMTC",
-    "SMTH",
-    "SMTI",
-    "SMTK",
-    "SMWB",
-    "SMX",
-    "SMXT",
-    "SMXWW",
-    "SN",
-    "SNA",
-    "SNAL",
-    "SNAP",
-    "SNAV",
-    "SNAX",
-    "SNAXW",
-    "SNBR",
-    "SNCR",
-    "SNCRL",
-    "SNCY",
-    "SND",
-    "SNDA",
-    "SNDL",
-    "SNDR",
-    "SNDX",
-    "SNES",
-    "SNEX",
-    "SNFCA",
-    "SNGX",
-    "SNN",
-    "SNOA",
-    "SNOV",
-    "SNOW",
-    "SNOY",
-    "SNPD",
-    "SNPE",
-    "SNPG",
-    "SNPS",
-    "SNPV",
-    "SNPX",
-    "SNRE",
-    "SNSE",
-    "SNSR",
-    "SNT",
-    "SNTG",
-    "SNTI",
-    "SNV",
-    "SNV$D",
-    "SNV$E",
-    "SNX",
-    "SNY",
-    "SNYR",
-    "SO",
-    "SOAR",
-    "SOBO",
-    "SOBR",
-    "SOC",
-    "SOCL",
-    "SOFI",
-    "SOFR",
-    "SOGP",
-    "SOHO",
-    "SOHOB",
-    "SOHON",
-    "SOHOO",
-    "SOHU",
-    "SOJC",
-    "SOJD",
-    "SOJE",
-    "SOL",
-    "SOLR",
-    "SOLV",
-    "SON",
-    "SOND",
-    "SONDW",
-    "SONM",
-    "SONN",
-    "SONO",
-    "SONY",
-    "SOPA",
-    "SOPH",
-    "SOR",
-    "SOS",
-    "SOTK",
-    "SOUN",
-    "SOUNW",
-    "SOVF",
-    "SOWG",
-    "SOXL",
-    "SOXM",
-    "SOXQ",
-    "SOXS",
-    "SOXW",
-    "SOXX",
-    "SOYB",
-    "SPAB",
-    "SPAI",
-    "SPAM",
-    "SPAQ",
-    "SPAX",
-    "SPB",
-    "SPBC",
-    "SPBO",
-    "SPC",
-    "SPCB",
-    "SPCE",
-    "SPCX",
-    "SPCZ",
-    "SPD",
-    "SPDG",
-    "SPDN",
-    "SPDV",
-    "SPDW",
-    "SPE",
-    "SPE$C",
-    "SPEM",
-    "SPEU",
-    "SPFF",
-    "SPFI",
-    "SPG",
-    "SPG$J",
-    "SPGC",
-    "SPGI",
-    "SPGM",
-    "SPGP",
-    "SPH",
-    "SPHB",
-    "SPHD",
-    "SPHL",
-    "SPHQ",
-    "SPHR",
-    "SPHY",
-    "SPI",
-    "SPIB",
-    "SPIN",
-    "SPIP",
-    "SPIR",
-    "SPKL",
-    "SPKLU",
-    "SPKLW",
-    "SPLB",
-    "SPLG",
-    "SPLP",
-    "SPLP$A",
-    "SPLV",
-    "SPMA",
-    "SPMB",
-    "SPMC",
-    "SPMD",
-    "SPMO",
-    "SPMV",
-    "SPNS",
-    "SPNT",
-    "SPNT$B",
-    "SPOK",
-    "SPOT",
-    "SPPL",
-    "SPPP",
-    "SPQ",
-    "SPR",
-    "SPRB",
-    "SPRC",
-    "SPRE",
-    "SPRO",
-    "SPRU",
-    "SPRX",
-    "SPRY",
-    "SPSB",
-    "SPSC",
-    "SPSK",
-    "SPSM",
-    "SPT",
-    "SPTB",
-    "SPTE",
-    "SPTI",
-    "SPTL",
-    "SPTM",
-    "SPTN",
-    "SPTS",
-    "SPUC",
-    "SPUS",
-    "SPUU",
-    "SPVM",
-    "SPVU",
-    "SPWH",
-    "SPWO",
-    "SPXC",
-    "SPXE",
-    "SPXL",
-    "SPXN",
-    "SPXS",
-    "SPXT",
-    "SPXU",
-    "SPXV",
-    "SPXX",
-    "SPY",
-    "SPYB",
-    "SPYC",
-    "SPYD",
-    "SPYG",
-    "SPYI",
-    "SPYM",
-    "SPYQ",
-    "SPYT",
-    "SPYU",
-    "SPYV",
-    "SPYX",
-    "SQ",
-    "SQEW",
-    "SQFT",
-    "SQFTP",
-    "SQFTW",
-    "SQLV",
-    "SQM",
-    "SQNS",
-    "SQQQ",
-    "SQY",
-    "SR",
-    "SR$A",
-    "SRAD",
-    "SRBK",
-    "SRCE",
-    "SRDX",
-    "SRE",
-    "SREA",
-    "SRET",
-    "SRFM",
-    "SRG",
-    "SRG$A",
-    "SRHQ",
-    "SRHR",
-    "SRI",
-    "SRL",
-    "SRLN",
-    "SRM",
-    "SROI",
-    "SRPT",
-    "SRRK",
-    "SRS",
-    "SRTS",
-    "SRTY",
-    "SRV",
-    "SRVR",
-    "SRZN",
-    "SRZNW",
-    "SSB",
-    "SSBI",
-    "SSBK",
-    "SSD",
-    "SSFI",
-    "SSG",
-    "SSKN",
-    "SSL",
-    "SSNC",
-    "SSO",
-    "SSP",
-    "SSPX",
-    "SSPY",
-    "SSRM",
-    "SSSS",
-    "SSSSL",
-    "SST",
-    "SST.W",
-    "SSTI",
-    "SSTK",
-    "SSUS",
-    "SSXU",
-    "SSY",
-    "SSYS",
-    "ST",
-    "STAA",
-    "STAF",
-    "STAG",
-    "STAX",
-    "STBA",
-    "STBF",
-    "STBX",
-    "STC",
-    "STCE",
-    "STCN",
-    "STE",
-    "STEC",
-    "STEL",
-    "STEM",
-    "STEP",
-    "STEW",
-    "STFS",
-    "STG",
-    "STGW",
-    "STHO",
-    "STI",
-    "STIM",
-    "STIP",
-    "STK",
-    "STKH",
-    "STKL",
-    "STKS",
-    "STLA",
-    "STLD",
-    "STM",
-    "STN",
-    "STNC",
-    "STNE",
-    "STNG",
-    "STOK",
-    "STOT",
-    "STPZ",
-    "STR",
-    "STRA",
-    "STRL",
-    "STRM",
-    "STRO",
-    "STRR",
-    "STRRP",
-    "STRS",
-    "STRT",
-    "STRV",
-    "STRW",
-    "STSB",
-    "STSS",
-    "STSSW",
-    "STT",
-    "STT$G",
-    "STTK",
-    "STVN",
-    "STWD",
-    "STX",
-    "STXD",
-    "STXE",
-    "STXG",
-    "STXI",
-    "STXK",
-    "STXM",
-    "STXS",
-    "STXT",
-    "STXV",
-    "STZ",
-    "SU",
-    "SUB",
-    "SUGP",
-    "SUI",
-    "SUM",
-    "SUN",
-    "SUNE",
-    "SUNS",
-    "SUP",
-    "SUPL",
-    "SUPN",
-    "SUPP",
-    "SUPV",
-    "SURE",
-    "SURG",
-    "SURI",
-    "SUSA",
-    "SUSB",
-    "SUSC",
-    "SUSL",
-    "SUUN",
-    "SUZ",
-    "SVA",
-    "SVAL",
-    "SVC",
-    "SVCO",
-    "SVII",
-    "SVIIR",
-    "SVIIU",
-    "SVIIW",
-    "SVIX",
-    "SVM",
-    "SVMH",
-    "SVMHW",
-    "SVOL",
-    "SVRA",
-    "SVRE",
-    "SVREW",
-    "SVT",
-    "SVV",
-    "SVXY",
-    "SW",
-    "SWAG",
-    "SWAGW",
-    "SWAN",
-    "SWBI",
-    "SWI",
-    "SWIM",
-    "SWIN",
-    "SWK",
-    "SWKH",
-    "SWKHL",
-    "SWKS",
-    "SWP",
-    "SWTX",
-    "SWVL",
-    "SWVLW",
-    "SWX",
-    "SWZ",
-    "SXC",
-    "SXI",
-    "SXQG",
-    "SXT",
-    "SXTC",
-    "SXTP",
-    "SXTPW",
-    "SY",
-    "SYBT",
-    "SYBX",
-    "SYF",
-    "SYF$A",
-    "SYF$B",
-    "SYFI",
-    "SYK",
-    "SYLD",
-    "SYM",
-    "SYNA",
-    "SYNB",
-    "SYNX",
-    "SYPR",
-    "SYRA",
-    "SYRE",
-    "SYRS",
-    "SYT",
-    "SYTA",
-    "SYTAW",
-    "SYY",
-    "SZK",
-    "SZNE",
-    "T",
-    "T$A",
-    "T$C",
-    "TAC",
-    "TACK",
-    "TACT",
-    "TAFI",
-    "TAFL",
-    "TAFM",
-    "TAGG",
-    "TAGS",
-    "TAIL",
-    "TAIT",
-    "TAK",
-    "TAL",
-    "TALK",
-    "TALKW",
-    "TALO",
-    "TAN",
-    "TANH",
-    "TAOP",
-    "TAP",
-    "TAP.A",
-    "TARA",
-    "TARK",
-    "TARS",
-    "TASK",
-    "TATT",
-    "TAXE",
-    "TAXF",
-    "TAXX",
-    "TAYD",
-    "TBB",
-    "TBBB",
-    "TBBK",
-    "TBC",
-    "TBF",
-    "TBFC",
-    "TBFG",
-    "TBG",
-    "TBI",
-    "TBIL",
-    "TBJL",
-    "TBLA",
-    "TBLAW",
-    "TBLD",
-    "TBLL",
-    "TBLU",
-    "TBMC",
-    "TBMCR",
-    "TBN",
-    "TBNK",
-    "TBPH",
-    "TBRG",
-    "TBT",
-    "TBUX",
-    "TBX",
-    "TC",
-    "TCAF",
-    "TCBI",
-    "TCBIO",
-    "TCBK",
-    "TCBP",
-    "TCBPW",
-    "TCBS",
-    "TCBX",
-    "TCHI",
-    "TCHP",
-    "TCI",
-    "TCMD",
-    "TCOM",
-    "TCPC",
-    "TCRT",
-    "TCRX",
-    "TCS",
-    "TCTM",
-    "TCX",
-    "TD",
-    "TDC",
-    "TDF",
-    "TDG",
-    "TDI",
-    "TDIV",
-    "TDOC",
-    "TDS",
-    "TDS$U",
-    "TDS$V",
-    "TDSB",
-    "TDSC",
-    "TDTF",
-    "TDTH",
-    "TDTT",
-    "TDUP",
-    "TDV",
-    "TDVG",
-    "TDVI",
-    "TDW",
-    "TDY",
-    "TEAF",
-    "TEAM",
-    "TECB",
-    "TECH",
-    "TECK",
-    "TECL",
-    "TECS",
-    "TECTP",
-    "TECX",
-    "TEF",
-    "TEI",
-    "TEK",
-    "TEKX",
-    "TEL",
-    "TELA",
-    "TELO",
-    "TEM",
-    "TEMP",
-    "TEN",
-    "TEN$E",
-    "TEN$F",
-    "TENB",
-    "TENX",
-    "TEO",
-    "TEQI",
-    "TER",
-    "TERN",
-    "TETE",
-    "TETEU",
-    "TETEW",
-    "TEVA",
-    "TEX",
-    "TFC",
-    "TFC$I",
-    "TFC$O",
-    "TFC$R",
-    "TFFP",
-    "TFI",
-    "TFII",
-    "TFIN",
-    "TFINP",
-    "TFJL",
-    "TFLO",
-    "TFLR",
-    "TFPM",
-    "TFPN",
-    "TFSA",
-    "TFSL",
-    "TFX",
-    "TG",
-    "TGAA",
-    "TGAAU",
-    "TGAAW",
-    "TGB",
-    "TGI",
-    "TGL",
-    "TGLR",
-    "TGLS",
-    "TGNA",
-    "TGRT",
-    "TGRW",
-    "TGS",
-    "TGT",
-    "TGTX",
-    "TH",
-    "THAR",
-    "THC",
-    "THCH",
-    "THCP",
-    "THCPU",
-    "THCPW",
-    "THD",
-    "THFF",
-    "THG",
-    "THIR",
-    "THLV",
-    "THM",
-    "THNQ",
-    "THNR",
-    "THO",
-    "THQ",
-    "THR",
-    "THRD",
-    "THRM",
-    "THRO",
-    "THRY",
-    "THS",
-    "THTA",
-    "THTX",
-    "THW",
-    "THY",
-    "THYF",
-    "TIGO",
-    "TIGR",
-    "TIL",
-    "TILE",
-    "TILL",
-    "TILT",
-    "TIMB",
-    "TIME",
-    "TINT",
-    "TINY",
-    "TIP",
-    "TIPT",
-    "TIPX",
-    "TIPZ",
-    "TIRX",
-    "TISI",
-    "TITN",
-    "TIVC",
-    "TIXT",
-    "TJUL",
-    "TJX",
-    "TK",
-    "TKC",
-    "TKLF",
-    "TKNO",
-    "TKO",
-    "TKR",
-    "TLF",
-    "TLGY",
-    "TLGYU",
-    "TLGYW",
-    "TLH",
-    "TLK",
-    "TLN",
-    "TLPH",
-    "TLRY",
-    "TLS",
-    "TLSA",
-    "TLSI",
-    "TLSIW",
-    "TLT",
-    "TLTD",
-    "TLTE",
-    "TLTM",
-    "TLTP",
-    "TLTQ",
-    "TLTW",
-    "TLX",
-    "TLYS",
-    "TM",
-    "TMAT",
-    "TMC",
-    "TMCI",
-    "TMCWW",
-    "TMDV",
-    "TMDX",
-    "TME",
-    "TMET",
-    "TMF",
-    "TMFC",
-    "TMFE",
-    "TMFG",
-    "TMFM",
-    "TMFS",
-    "TMFX",
-    "TMHC",
-    "TMO",
-    "TMP",
-    "TMQ",
-    "TMSL",
-    "TMTC",
-    "TMTCR",
-    "TMTCU",
-    "TMUS",
-    "TMV",
-    "TNA",
-    "TNC",
-    "TNDM",
-    "TNET",
-    "TNFA",
-    "TNGX",
-    "TNK",
-    "TNL",
-    "TNON",
-    "TNONW",
-    "TNXP",
-    "TNYA",
-    "TOAK",
-    "TOGA",
-    "TOI",
-    "TOIIW",
-    "TOK",
-    "TOKE",
-    "TOL",
-    "TOLL",
-    "TOLZ",
-    "TOMZ",
-    "TOON",
-    "TOP",
-    "TOPS",
-    "TOPT",
-    "TORO",
-    "TOST",
-    "TOTL",
-    "TOTR",
-    "TOUR",
-    "TOUS",
-    "TOVX",
-    "TOWN",
-    "TOYO",
-    "TPB",
-    "TPC",
-    "TPCS",
-    "TPET",
-    "TPG",
-    "TPGXL",
-    "TPH",
-    "TPHD",
-    "TPHE",
-    "TPIC",
-    "TPIF",
-    "TPL",
-    "TPLC",
-    "TPLE",
-    "TPMN",
-    "TPOR",
-    "TPR",
-    "TPSC",
-    "TPST",
-    "TPTA",
-    "TPVG",
-    "TPX",
-    "TPYP",
-    "TPZ",
-    "TQQQ",
-    "TR",
-    "TRAK",
-    "TRAW",
-    "TRC",
-    "TRDA",
-    "TREE",
-    "TREX",
-    "TRFK",
-    "TRFM",
-    "TRGP",
-    "TRI",
-    "TRIB",
-    "TRIN",
-    "TRINI",
-    "TRINL",
-    "TRINZ",
-    "TRIP",
-    "TRMB",
-    "TRMD",
-    "TRMK",
-    "TRML",
-    "TRN",
-    "TRND",
-    "TRNO",
-    "TRNR",
-    "TRNS",
-    "TROO",
-    "TROW",
-    "TROX",
-    "TRP",
-    "TRS",
-    "TRSG",
-    "TRST",
-    "TRSY",
-    "TRT",
-    "TRTN$A",
-    "TRTN$B",
-    "TRTN$C",
-    "TRTN$D",
-    "TRTN$E",
-    "TRTX",
-    "TRTX$C",
-    "TRTY",
-    "TRU",
-    "TRUE",
-    "TRUG",
-    "TRUP",
-    "TRV",
-    "TRVG",
-    "TRVI",
-    "TRX",
-    "TS",
-    "TSAT",
-    "TSBK",
-    "TSBX",
-    "TSCO",
-    "TSDD",
-    "TSE",
-    "TSEC",
-    "TSEM",
-    "TSEP",
-    "TSHA",
-    "TSI",
-    "TSL",
-    "TSLA",
-    "TSLL",
-    "TSLP",
-    "TSLQ",
-    "TSLR",
-    "TSLS",
-    "TSLT",
-    "TSLW",
-    "TSLX",
-    "TSLY",
-    "TSLZ",
-    "TSM",
-    "TSME",
-    "TSMU",
-    "TSMX",
-    "TSMY",
-    "TSMZ",
-    "TSN",
-    "TSPA",
-    "TSPY",
-    "TSQ",
-    "TSSI",
-    "TSVT",
-    "TT",
-    "TTAC",
-    "TTAI",
-    "TTC",
-    "TTD",
-    "TTE",
-    "TTEC",
-    "TTEK",
-    "TTEQ",
-    "TTGT",
-    "TTI",
-    "TTMI",
-    "TTNP",
-    "TTOO",
-    "TTP",
-    "TTSH",
-    "TTT",
-    "TTWO",
-    "TU",
-    "TUA",
-    "TUG",
-    "TUGN",
-    "TUR",
-    "TURB",
-    "TURN",
-    "TUSI",
-    "TUSK",
-    "TUYA",
-    "TV",
-    "TVAL",
-    "TVC",
-    "TVE",
-    "TVGN",
-    "TVGNW",
-    "TVTX",
-    "TW",
-    "TWFG",
-    "TWG",
-    "TWI",
-    "TWIN",
-    "TWIO",
-    "TWLO",
-    "TWM",
-    "TWN",
-    "TWO",
-    "TWO$A",
-    "TWO$B",
-    "TWO$C",
-    "TWST",
-    "TX",
-    "TXG",
-    "TXMD",
-    "TXN",
-    "TXNM",
-    "TXO",
-    "TXRH",
-    "TXS",
-    "TXSS",
-    "TXT",
-    "TY",
-    "TY$",
-    "TYA",
-    "TYD",
-    "TYG",
-    "TYGO",
-    "TYL",
-    "TYLD",
-    "TYLG",
-    "TYO",
-    "TYRA",
-    "TZA",
-    "TZOO",
-    "TZUP",
-    "U",
-    "UA",
-    "UAA",
-    "UAE",
-    "UAL",
-    "UAMY",
-    "UAN",
-    "UAPR",
-    "UAUG",
-    "UAVS",
-    "UBCP",
-    "UBER",
-    "UBFO",
-    "UBND",
-    "UBOT",
-    "UBR",
-    "UBRL",
-    "UBS",
-    "UBSI",
-    "UBT",
-    "UBX",
-    "UBXG",
-    "UCAR",
-    "UCB",
-    "UCB$I",
-    "UCC",
-    "UCIB",
-    "UCL",
-    "UCO",
-    "UCON",
-    "UCRD",
-    "UCTT",
-    "UCYB",
-    "UDEC",
-    "UDI",
-    "UDIV",
-    "UDMY",
-    "UDN",
-    "UDOW",
-    "UDR",
-    "UE",
-    "UEC",
-    "UEIC",
-    "UEVM",
-    "UFCS",
-    "UFEB",
-    "UFI",
-    "UFIV",
-    "UFO",
-    "UFPI",
-    "UFPT",
-    "UG",
-    "UGA",
-    "UGE",
-    "UGI",
-    "UGL",
-    "UGP",
-    "UGRO",
-    "UHAL",
-    "UHAL.B",
-    "UHG",
-    "UHGWW",
-    "UHS",
-    "UHT",
-    "UI",
-    "UIS",
-    "UITB",
-    "UIVM",
-    "UJAN",
-    "UJB",
-    "UJUL",
-    "UJUN",
-    "UK",
-    "UKOMW",
-    "UL",
-    "ULBI",
-    "ULCC",
-    "ULE",
-    "ULH",
-    "ULS",
-    "ULST",
-    "ULTA",
-    "ULTY",
-    "ULVM",
-    "ULY",
-    "UMAC",
-    "UMAR",
-    "UMAY",
-    "UMBF",
-    "UMC",
-    "UMDD",
-    "UMH",
-    "UMH$D",
-    "UMI",
-    "UMMA",
-    "UNB",
-    "UNCY",
-    "UNF",
-    "UNFI",
-    "UNG",
-    "UNH",
-    "UNIT",
-    "UNIY",
-    "UNL",
-    "UNM",
-    "UNMA",
-    "UNOV",
-    "UNP",
-    "UNTY",
-    "UOCT",
-    "UONE",
-    "UONEK",
-    "UP",
-    "UPAR",
-    "UPB",
-    "UPBD",
-    "UPC",
-    "UPGD",
-    "UPGR",
-    "UPLD",
-    "UPRO",
-    "UPS",
-    "UPST",
-    "UPV",
-    "UPW",
-    "UPWK",
-    "UPXI",
-    "URA",
-    "URAA",
-    "URAN",
-    "URAX",
-    "URBN",
-    "URE",
-    "URG",
-    "URGN",
-    "URI",
-    "URNJ",
-    "URNM",
-    "UROY",
-    "URTH",
-    "URTY",
-    "USA",
-    "USAC",
-    "USAI",
-    "USAP",
-    "USAS",
-    "USAU",
-    "USB",
-    "USB$A",
-    "USB$H",
-    "USB$P",
-    "USB$Q",
-    "USB$R",
-    "USB$S",
-    "USCA",
-    "USCB",
-    "USCF",
-    "USCI",
-    "USCL",
-    "USD",
-    "USDU",
-    "USDX",
-    "USE",
-    "USEA",
-    "USEG",
-    "USEP",
-    "USFD",
-    "USFI",
-    "USFR",
-    "USG",
-    "USGO",
-    "USGOW",
-    "USHY",
-    "USIG",
-    "USIN",
-    "USIO",
-    "USL",
-    "USLM",
-    "USM",
-    "USMC",
-    "USMF",
-    "USML",
-    "USMV",
-    "USNA",
-    "USNZ",
-    "USO",
-    "USOI",
-    "USOY",
-    "USPH",
-    "USPX",
-    "USRD",
-    "USRT",
-    "USSE",
-    "USSG",
-    "USSH",
-    "UST",
-    "USTB",
-    "USVM",
-    "USVN",
-    "USXF",
-    "UTEN",
-    "UTES",
-    "UTF",
-    "UTG",
-    "UTHR",
-    "UTHY",
-    "UTI",
-    "UTL",
-    "UTMD",
-    "UTRE",
-    "UTRN",
-    "UTSI",
-    "UTSL",
-    "UTWO",
-    "UTWY",
-    "UTZ",
-    "UUP",
-    "UUU",
-    "UUUU",
-    "UVE",
-    "UVIX",
-    "UVSP",
-    "UVV",
-    "UVXY",
-    "UWM",
-    "UWMC",
-    "UWMC.W",
-    "UXI",
-    "UXIN",
-    "UXOC",
-    "UYG",
-    "UYLD",
-    "UYM",
-    "UZD",
-    "UZE",
-    "UZF",
-    "V",
-    "VABK",
-    "VABS",
-    "VAC",
-    "VACH",
-    "VACHU",
-    "VACHW",
-    "VAL",
-    "VAL.W",
-    "VALE",
-    "VALN",
-    "VALQ",
-    "VALU",
-    "VAMO",
-    "VANI",
-    "VATE",
-    "VAW",
-    "VB",
-    "VBF",
-    "VBFC",
-    "VBK",
-    "VBND",
-    "VBNK",
-    "VBR",
-    "VBTX",
-    "VC",
-    "VCAR",
-    "VCEB",
-    "VCEL",
-    "VCIC",
-    "VCICU",
-    "VCICW",
-    "VCIG",
-    "VCIT",
-    "VCLN",
-    "VCLT",
-    "VCNX",
-    "VCR",
-    "VCRB",
-    "VCSA",
-    "VCSH",
-    "VCTR",
-    "VCV",
-    "VCYT",
-    "VDC",
-    "VDE",
-    "VEA",
-    "VECO",
-    "VEEA",
-    "VEEAW",
-    "VEEE",
-    "VEEV",
-    "VEGA",
-    "VEGI",
-    "VEGN",
-    "VEL",
-    "VEMY",
-    "VEON",
-    "VERA",
-    "VERB",
-    "VERI",
-    "VERO",
-    "VERS",
-    "VERU",
-    "VERV",
-    "VERX",
-    "VET",
-    "VETZ",
-    "VEU",
-    "VFC",
-    "VFF",
-    "VFH",
-    "VFL",
-    "VFLO",
-    "VFMF",
-    "VFMO",
-    "VFMV",
-    "VFQY",
-    "VFS",
-    "VFSWW",
-    "VFVA",
-    "VGAS",
-    "VGASW",
-    "VGI",
-    "VGIT",
-    "VGK",
-    "VGLT",
-    "VGM",
-    "VGSH",
-    "VGSR",
-    "VGT",
-    "VGZ",
-    "VHC",
-    "VHI",
-    "VHT",
-    "VIASP",
-    "VIAV",
-    "VICE",
-    "VICI",
-    "VICR",
-    "VIDI",
-    "VIG",
-    "VIGI",
-    "VIGL",
-    "VIK",
-    "VINC",
-    "VINE",
-    "VINO",
-    "VINP",
-    "VIOG",
-    "VIOO",
-    "VIOT",
-    "VIOV",
-    "VIPS",
-    "VIR",
-    "VIRC",
-    "VIRT",
-    "VIRX",
-    "VIS",
-    "VISL",
-    "VIST",
-    "VITL",
-    "VIV",
-    "VIVK",
-    "VIXM",
-    "VIXY",
-    "VKI",
-    "VKQ",
-    "VKTX",
-    "VLCN",
-    "VLGEA",
-    "VLLU",
-    "VLN",
-    "VLN.W",
-    "VLO",
-    "VLRS",
-    "VLT",
-    "VLTO",
-    "VLU",
-    "VLUE",
-    "VLY",
-    "VLYPN",
-    "VLYPO",
-    "VLYPP",
-    "VMAR",
-    "VMAX",
-    "VMBS",
-    "VMC",
-    "VMCA",
-    "VMCAU",
-    "VMCAW",
-    "VMD",
-    "VMEO",
-    "VMI",
-    "VMO",
-    "VMOT",
-    "VNAM",
-    "VNCE",
-    "VNDA",
-    "VNET",
-    "VNLA",
-    "VNM",
-    "VNO",
-    "VNO$L",
-    "VNO$M",
-    "VNO$N",
-    "VNO$O",
-    "VNOM",
-    "VNQ",
-    "VNQI",
-    "VNRX",
-    "VNSE",
-    "VNT",
-    "VO",
-    "VOC",
-    "VOD",
-    "VOE",
-    "VONE",
-    "VONG",
-    "VONV",
-    "VOO",
-    "VOOG",
-    "VOOV",
-    "VOR",
-    "VOT",
-    "VOTE",
-    "VOX",
-    "VOXR",
-    "VOXX",
-    "VOYA",
-    "VOYA$B",
-    "VPC",
-    "VPG",
-    "VPL",
-    "VPLS",
-    "VPU",
-    "VPV",
-    "VRA",
-    "VRAI",
-    "VRAR",
-    "VRAX",
-    "VRCA",
-    "VRDN",
-    "VRE",
-    "VREX",
-    "VRIG",
-    "VRM",
-    "VRME",
-    "VRMEW",
-    "VRN",
-    "VRNA",
-    "VRNS",
-    "VRNT",
-    "VRP",
-    "VRPX",
-    "VRRM",
-    "VRSK",
-    "VRSN",
-    "VRT",
-    "VRTS",
-    "VRTX",
-    "VS",
-    "VSAT",
-    "VSCO",
-    "VSDA",
-    "VSEC",
-    "VSEE",
-    "VSEEW",
-    "VSGX",
-    "VSH",
-    "VSHY",
-    "VSLU",
-    "VSME",
-    "VSMV",
-    "VSS",
-    "VSSYW",
-    "VST",
-    "VSTA",
-    "VSTE",
-    "VSTEW",
-    "VSTM",
-    "VSTO",
-    "VSTS",
-    "VT",
-    "VTAK",
-    "VTC",
-    "VTEB",
-    "VTEC",
-    "VTEI",
-    "VTES",
-    "VTEX",
-    "VTGN",
-    "VTHR",
-    "VTI",
-    "VTIP",
-    "VTLE",
-    "VTMX",
-    "VTN",
-    "VTOL",
-    "VTR",
-    "VTRS",
-    "VTS",
-    "VTSI",
-    "VTV",
-    "VTVT",
-    "VTWG",
-    "VTWO",
-    "VTWV",
-    "VTYX",
-    "VUG",
-    "VUSB",
-    "VUSE",
-    "VUZI",
-    "VV",
-    "VVI",
-    "VVOS",
-    "VVPR",
-    "VVR",
-    "VVV",
-    "VVX",
-    "VWI",
-    "VWID",
-    "VWO",
-    "VWOB",
-    "VXF",
-    "VXRT",
-    "VXUS",
-    "VXX",
-    "VXZ",
-    "VYGR",
-    "VYM",
-    "VYMI",
-    "VYNE",
-    "VYX",
-    "VZ",
-    "VZIO",
-    "VZLA",
-    "W",
-    "WAB",
-    "WABC",
-    "WABF",
-    "WAFD",
-    "WAFDP",
-    "WAFU",
-    "WAI",
-    "WAL",
-    "WAL$A",
-    "WALD",
-    "WALDW",
-    "WANT",
-    "WASH",
-    "WAT",
-    "WATT",
-    "WAVE",
-    "WAVS",
-    "WAVSU",
-    "WAVSW",
-    "WAY",
-    "WB",
-    "WBA",
-    "WBAT",
-    "WBD",
-    "WBIF",
-    "WBIG",
-    "WBIL",
-    "WBIY",
-    "WBND",
-    "WBS",
-    "WBS$F",
-    "WBS$G",
-    "WBTN",
-    "WBUY",
-    "WBX",
-    "WBX.W",
-    "WCBR",
-    "WCC",
-    "WCC$A",
-    "WCEO",
-    "WCLD",
-    "WCME",
-    "WCMI",
-    "WCN",
-    "WCT",
-    "WD",
-    "WDAY",
-    "WDC",
-    "WDFC",
-    "WDH",
-    "WDI",
-    "WDIV",
-    "WDNA",
-    "WDS",
-    "WDTE",
-    "WEA",
-    "WEAT",
-    "WEAV",
-    "WEBL",
-    "WEBS",
-    "WEC",
-    "WEED",
-    "WEEI",
-    "WEEL",
-    "WEIX",
-    "WEL",
-    "WEL.U",
-    "WEL.W",
-    "WELL",
-    "WEN",
-    "WERN",
-    "WES",
-    "WEST",
-    "WETH",
-    "WEX",
-    "WEYS",
-    "WF",
-    "WFC",
-    "WFC$A",
-    "WFC$C",
-    "WFC$D",
-    "WFC$L",
-    "WFC$Y",
-    "WFC$Z",
-    "WFCF",
-    "WFG",
-    "WFH",
-    "WFRD",
-    "WGMI",
-    "WGO",
-    "WGS",
-    "WGSWW",
-    "WH",
-    "WHD",
-    "WHF",
-    "WHFCL",
-    "WHG",
-    "WHLM",
-    "WHLR",
-    "WHLRD",
-    "WHLRL",
-    "WHLRP",
-    "WHR",
-    "WIA",
-    "WILC",
-    "WIMI",
-    "WINA",
-    "WINC",
-    "WING",
-    "WINN",
-    "WINT",
-    "WINV",
-    "WINVR",
-    "WINVU",
-    "WINVW",
-    "WIP",
-    "WISA",
-    "WISE",
-    "WIT",
-    "WIW",
-    "WIX",
-    "WK",
-    "WKC",
-    "WKEY",
-    "WKHS",
-    "WKSP",
-    "WLACU",
-    "WLDN",
-    "WLDR",
-    "WLDS",
-    "WLDSW",
-    "WLFC",
-    "WLGS",
-    "WLK",
-    "WLKP",
-    "WLTG",
-    "WLY",
-    "WLYB",
-    "WM",
-    "WMB",
-    "WMG",
-    "WMK",
-    "WMPN",
-    "WMS",
-    "WMT",
-    "WNC",
-    "WNDY",
-    "WNEB",
-    "WNS",
-    "WNW",
-    "WOK",
-    "WOLF",
-    "WOMN",
-    "WOOD",
-    "WOOF",
-    "WOR",
-    "WORX",
-    "WOW",
-    "WPC",
-    "WPM",
-    "WPP",
-    "WPRT",
-    "WRAP",
-    "WRB",
-    "WRB$E",
-    "WRB$F",
-    "WRB$G",
-    "WRB$H",
-    "WRBY",
-    "WRD",
-    "WRLD",
-    "WRN",
-    "WRND",
-    "WS",
-    "WSBC",
-    "WSBCP",
-    "WSBF",
-    "WSC",
-    "WSFS",
-    "WSM",
-    "WSO",
-    "WSO.B",
-    "WSR",
-    "WST",
-    "WT",
-    "WTAI",
-    "WTBA",
-    "WTBN",
-    "WTFC",
-    "WTFCM",
-    "WTFCP",
-    "WTI",
-    "WTID",
-    "WTIU",
-    "WTM",
-    "WTMA",
-    "WTMAR",
-    "WTMAU",
-    "WTMF",
-    "WTO",
-    "WTRE",
-    "WTRG",
-    "WTS",
-    "WTTR",
-    "WTV",
-    "WTW",
-    "WU",
-    "WUCT",
-    "WUGI",
-    "WULF",
-    "WUSA",
-    "WVE",
-    "WVVI",
-    "WVVIP",
-    "WW",
-    "WWD",
-    "WWJD",
-    "WWR",
-    "WWW",
-    "WY",
-    "WYNN",
-    "WYY",
-    "X",
-    "XAIR",
-    "XAIX",
-    "XAPR",
-    "XAR",
-    "XAUG",
-    "XB",
-    "XBAP",
-    "XBB",
-    "XBI",
-    "XBIL",
-    "XBIO",
-    "XBIT",
-    "XBJA",
-    "XBJL",
-    "XBOC",
-    "XBP",
-    "XBPEW",
-    "XC",
-    "XCCC",
-    "XCEM",
-    "XCH",
-    "XCLR",
-    "XCNY",
-    "XCOR",
-    "XCUR",
-    "XDAP",
-    "XDAT",
-    "XDEC",
-    "XDJA",
-    "XDJL",
-    "XDOC",
-    "XDQQ",
-    "XDSQ",
-    "XDTE",
-    "XEL",
-    "XELB",
-    "XEMD",
-    "XENE",
-    "XERS",
-    "XES",
-    "XFEB",
-    "XFIV",
-    "XFIX",
-    "XFLT",
-    "XFLT$A",
-    "XFLX",
-    "XFOR",
-    "XGN",
-    "XHB",
-    "XHE",
-    "XHG",
-    "XHLF",
-    "XHR",
-    "XHS",
-    "XHYC",
-    "XHYD",
-    "XHYE",
-    "XHYF",
-    "XHYH",
-    "XHYI",
-    "XHYT",
-    "XIDE",
-    "XIJN",
-    "XIMR",
-    "XIN",
-    "XISE",
-    "XITK",
-    "XJAN",
-    "XJH",
-    "XJR",
-    "XJUL",
-    "XJUN",
-    "XLB",
-    "XLC",
-    "XLE",
-    "XLF",
-    "XLG",
-    "XLI",
-    "XLK",
-    "XLO",
-    "XLP",
-    "XLRE",
-    "XLSR",
-    "XLU",
-    "XLV",
-    "XLY",
-    "XMAG",
-    "XMAR",
-    "XMAY",
-    "XME",
-    "XMHQ",
-    "XMLV",
-    "XMMO",
-    "XMPT",
-    "XMTR",
-    "XMVM",
-    "XNAV",
-    "XNCR",
-    "XNET",
-    "XNOV",
-    "XNTK",
-    "XOCT",
-    "XOM",
-    "XOMA",
-    "XOMAO",
-    "XOMAP",
-    "XOMO",
-    "XONE",
-    "XOP",
-    "XOS",
-    "XOSWW",
-    "XOVR",
-    "XP",
-    "XPAY",
-    "XPEL",
-    "XPER",
-    "XPEV",
-    "XPH",
-    "XPL",
-    "XPND",
-    "XPO",
-    "XPOF",
-    "XPON",
-    "XPP",
-    "XPRO",
-    "XRAY",
-    "XRLV",
-    "XRLX",
-    "XRMI",
-    "XRT",
-    "XRTX",
-    "XRX",
-    "XSD",
-    "XSEP",
-    "XSHD",
-    "XSHQ",
-    "XSLV",
-    "XSMO",
-    "XSOE",
-    "XSVM",
-    "XSVN",
-    "XSW",
-    "XT",
-    "XTAP",
-    "XTEN",
-    "XTIA",
-    "XTJA",
-    "XTJL",
-    "XTKG",
-    "XTL",
-    "XTLB",
-    "XTN",
-    "XTNT",
-    "XTOC",
-    "XTR",
-    "XTRE",
-    "XTWO",
-    "XTWY",
-    "XUSP",
-    "XVOL",
-    "XVV",
-    "XWEL",
-    "XXCH",
-    "XXII",
-    "XYF",
-    "XYL",
-    "XYLD",
-    "XYLE",
-    "XYLG",
-    "XYLO",
-    "YALA",
-    "YALL",
-    "YANG",
-    "YBIT",
-    "YBTC",
-    "YCBD",
-    "YCBD$A",
-    "YCL",
-    "YCS",
-    "YDEC",
-    "YEAR",
-    "YELP",
-    "YETH",
-    "YETI",
-    "YEXT",
-    "YGMZ",
-    "YHGJ",
-    "YHNA",
-    "YHNAR",
-    "YHNAU",
-    "YI",
-    "YIBO",
-    "YINN",
-    "YJ",
-    "YJUN",
-    "YLD",
-    "YLDE",
-    "YMAB",
-    "YMAG",
-    "YMAR",
-    "YMAX",
-    "YMM",
-    "YOLO",
-    "YORW",
-    "YOSH",
-    "YOTA",
-    "YOTAR",
-    "YOTAU",
-    "YOTAW",
-    "YOU",
-    "YPF",
-    "YQ",
-    "YQQQ",
-    "YRD",
-    "YSEP",
-    "YSG",
-    "YTRA",
-    "YUM",
-    "YUMC",
-    "YXI",
-    "YXT",
-    "YY",
-    "YYAI",
-    "YYGH",
-    "YYY",
-    "Z",
-    "ZALT",
-    "ZAPP",
-    "ZAPPW",
-    "ZAUG",
-    "ZAZZT",
-    "ZBAO",
-    "ZBH",
-    "ZBIO",
-    "ZBRA",
-    "ZBZX",
-    "ZBZZT",
-    "ZCAR",
-    "ZCARW",
-    "ZCMD",
-    "ZCZZT",
-    "ZD",
-    "ZDGE",
-    "ZECP",
-    "ZENA",
-    "ZENV",
-    "ZEO",
-    "ZEOWW",
-    "ZEPP",
-    "ZETA",
-    "ZEUS",
-    "ZEXIT",
-    "ZG",
-    "ZGN",
-    "ZH",
-    "ZHDG",
-    "ZI",
-    "ZIEXT",
-    "ZIG",
-    "ZIM",
-    "ZIMV",
-    "ZION",
-    "ZIONL",
-    "ZIONO",
-    "ZIONP",
-    "ZIP",
-    "ZIVB",
-    "ZJK",
-    "ZJUL",
-    "ZJYL",
-    "ZJZZT",
-    "ZK",
-    "ZKH",
-    "ZKIN",
-    "ZLAB",
-    "ZM",
-    "ZNOV",
-    "ZNTL",
-    "ZOCT",
-    "ZOM",
-    "ZONE",
-    "ZOOZ",
-    "ZOOZW",
-    "ZROZ",
-    "ZS",
-    "ZSB",
-    "ZSC",
-    "ZSEP",
-    "ZSL",
-    "ZTAX",
-    "ZTEK",
-    "ZTEN",
-    "ZTEST",
-    "ZTO",
-    "ZTR",
-    "ZTRE",
-    "ZTS",
-    "ZTWO",
-    "ZUMZ",
-    "ZUO",
-    "ZURA",
-    "ZVIA",
-    "ZVRA",
-    "ZVSA",
-    "ZVV",
-    "ZVZZT",
-    "ZWS",
-    "ZWZZT",
-    "ZXIET",
-    "ZXYZ.A",
-    "ZXZZT",
-    "ZYME",
-    "ZYXI",
-    "ZZZ",
-]
+if __name__ == '__main__':
+    for name in stock_list_name_list:
+        print(name, len(__getattr__(name)))
@@ -0,0 +1,242 @@
+"""
+
+USED BY:
+    database_update/general_terminal_model.py
+    core_stock_update/core_update_controller.py
+    stock_price_update/price_update_controller.py
+
+A list update used to be resumed by typing a start index or a symbol, the failed symbols in the middle of the list were lost.
+A list update is a job now, every symbol of the job is a row of the job_state table:
+    pending     the symbol has not started yet
+    running     the symbol has started, it is still running or the job was interrupted
+    done        the table function of the symbol finished, a buffered row of guru_stock, zacks_stock or stock_option is written
+    failed      the table function of the symbol raised or returned a SymbolFailure, or its buffered row failed to be written, the error text is kept
+
+A buffered symbol stays running after its table function returns, the flush of its row marks it done or failed,
+so a job interrupted before the flush resumes the symbols whose rows were lost.
+
+Resuming a job runs its pending and running symbols in the original order, retrying a job runs its failed symbols.
+Both of them reuse the job_id, so the rows of the same job are updated.
+
+Create the table first in the database menu: create_table('job_state')
+A database error of the job_state table never stops the update, the update just runs without job tracking.
+
+"""
+
+# STANDARD LIBS
+
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# THIRD PARTY LIBS
+import psycopg
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.postgres_connection_model import pooled_psycopg_connection
+from pizzapy.general_update.list_runner_model import is_symbol_failure
+
+
+
+resume_status_tuple: Tuple[str, ...] = ('pending', 'running')
+retry_status_tuple: Tuple[str, ...] = ('failed',)
+
+
+
+def make_job_id(table: str) -> str:
+    """
+    * INDEPENDENT *
+    USED BY: create_job()
+
+    like 'guru_stock_20231022_101500_123456', the order of the job ids is the order of creation.
+    """
+    return f'{table}_{datetime.now():%Y%m%d_%H%M%S_%f}'
+
+
+
+def create_job(table: str, list_name: Optional[str], symbols: List[str]) -> Optional[str]:
+    """
+    DEPENDS ON: make_job_id()
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: upsert_symbols_terminal(), call_upsert()
+
+    Every symbol is inserted as pending with its position in the list, a repeated symbol keeps its first position.
+    returns None when the job_state table cannot be written.
+    """
+    job_id: str = make_job_id(table)
+    created: datetime = datetime.now().replace(microsecond=0)
+    cmd: str = """
+        INSERT INTO job_state (job_id, table_name, list_name, position, symbol, status, created) VALUES (%s, %s, %s, %s, %s, 'pending', %s)
+        ON CONFLICT (job_id, symbol) DO NOTHING
+        """
+    values: List[Tuple[Any, ...]] = [(job_id, table, list_name, position, symbol, created) for position, symbol in enumerate(symbols, start=1)]
+    try:
+        with pooled_psycopg_connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(cmd, values)
+    except psycopg.Error as error:
+        print(f'job_state table skipped: {error}')
+        return None
+    return job_id
+
+
+
+def mark_symbol(job_id: str, symbol: str, status: str, error: Optional[str] = None) -> None:
+    """
+    * INDEPENDENT *
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: run_tracked_symbol()
+
+    running sets the started time, done and failed set the finished time.
+    """
+    now: datetime = datetime.now().replace(microsecond=0)
+    if status == 'running':
+        cmd: str = 'UPDATE job_state SET status = %s, started = %s, finished = NULL, error = NULL WHERE job_id = %s AND symbol = %s'
+        values: Tuple[Any, ...] = (status, now, job_id, symbol)
+    else:
+        cmd = 'UPDATE job_state SET status = %s, finished = %s, error = %s WHERE job_id = %s AND symbol = %s'
+        values = (status, now, error, job_id, symbol)
+    try:
+        with pooled_psycopg_connection() as conn:
+            conn.execute(cmd, values)
+    except psycopg.Error as db_error:
+        print(f'job_state table skipped: {db_error}')
+
+
+
+def run_tracked_symbol(job_id: Optional[str], func: Callable[[str], Any], symbol: str, is_buffered: bool = False) -> Any:
+    """
+    DEPENDS ON: mark_symbol()
+    IMPORTS: is_symbol_failure()
+    USED BY: upsert_symbols_terminal(), call_upsert()
+
+    The exception of func is raised again after the symbol is marked failed, so the callers count the failure as before.
+    A SymbolFailure result is marked failed too.
+    When func only adds the row to an UpsertBuffer (is_buffered), the symbol stays running, mark_flushed_symbols() marks it after the flush.
+    Without a job_id, it is only func(symbol).
+    """
+    if job_id is None:
+        return func(symbol)
+    mark_symbol(job_id, symbol, 'running')
+    try:
+        result: Any = func(symbol)
+    except Exception as error:
+        mark_symbol(job_id, symbol, 'failed', f'{type(error).__name__}: {error}')
+        raise
+    if is_symbol_failure(result):
+        mark_symbol(job_id, symbol, 'failed', str(result)[-500:])
+    elif not is_buffered:
+        mark_symbol(job_id, symbol, 'done')
+    return result
+
+
+
+def mark_flushed_symbols(job_id: str, upserted_symbols: List[str], failed_dict: Dict[str, str]) -> None:
+    """
+    * INDEPENDENT *
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: make_flush_marker()
+
+    The on_flush callback of UpsertBuffer, the written rows become done and the failed rows become failed with their error, in one executemany().
+    """
+    now: datetime = datetime.now().replace(microsecond=0)
+    cmd: str = 'UPDATE job_state SET status = %s, finished = %s, error = %s WHERE job_id = %s AND symbol = %s'
+    values: List[Tuple[Any, ...]] = [('done', now, None, job_id, symbol) for symbol in upserted_symbols]
+    values += [('failed', now, error, job_id, symbol) for symbol, error in failed_dict.items()]
+    if not values:
+        return
+    try:
+        with pooled_psycopg_connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(cmd, values)
+    except psycopg.Error as db_error:
+        print(f'job_state table skipped: {db_error}')
+
+
+
+def make_flush_marker(job_id: Optional[str]) -> Optional[Callable[[List[str], Dict[str, str]], None]]:
+    """
+    DEPENDS ON: mark_flushed_symbols()
+    USED BY: upsert_symbols_terminal(), call_upsert()
+
+    returns the on_flush callback of the UpsertBuffer of a job, an untracked update has no callback.
+    """
+    return None if job_id is None else partial(mark_flushed_symbols, job_id)
+
+
+
+def find_latest_job(table: str, statuses: Tuple[str, ...]) -> Optional[str]:
+    """
+    * INDEPENDENT *
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: resume_job_interactive(), resume_core_job(), resume_price_job()
+
+    returns the latest job of the table which still has a symbol in one of the statuses.
+    """
+    cmd: str = 'SELECT job_id FROM job_state WHERE table_name = %s AND status = ANY(%s) ORDER BY job_id DESC LIMIT 1'
+    try:
+        with pooled_psycopg_connection() as conn:
+            row = conn.execute(cmd, (table, list(statuses))).fetchone()
+    except psycopg.Error as error:
+        print(f'job_state table skipped: {error}')
+        return None
+    return None if row is None else row[0]
+
+
+
+def get_job_symbols(job_id: str, statuses: Tuple[str, ...]) -> List[str]:
+    """
+    * INDEPENDENT *
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: resume_job_interactive(), resume_core_job(), resume_price_job()
+
+    The symbols are in the original order of the list.
+    """
+    cmd: str = 'SELECT symbol FROM job_state WHERE job_id = %s AND status = ANY(%s) ORDER BY position'
+    try:
+        with pooled_psycopg_connection() as conn:
+            rows = conn.execute(cmd, (job_id, list(statuses))).fetchall()
+    except psycopg.Error as error:
+        print(f'job_state table skipped: {error}')
+        return []
+    return [row[0] for row in rows]
+
+
+
+def get_job_summaries(table: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    * INDEPENDENT *
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: show_jobs_terminal()
+
+    returns the latest jobs of the table, like:
+        {'job_id': 'guru_stock_20231022_101500_123456', 'list_name': 'S&P 500 (503)', 'total': 503, 'pending': 0, 'running': 1, 'done': 499, 'failed': 3, 'created': ..., 'finished': ...}
+    """
+    cmd: str = """
+        SELECT job_id, MAX(list_name), COUNT(*),
+            COUNT(*) FILTER (WHERE status = 'pending'), COUNT(*) FILTER (WHERE status = 'running'),
+            COUNT(*) FILTER (WHERE status = 'done'), COUNT(*) FILTER (WHERE status = 'failed'),
+            MIN(created), MAX(finished)
+        FROM job_state WHERE table_name = %s GROUP BY job_id ORDER BY job_id DESC LIMIT %s
+        """
+    keys: List[str] = ['job_id', 'list_name', 'total', 'pending', 'running', 'done', 'failed', 'created', 'finished']
+    try:
+        with pooled_psycopg_connection() as conn:
+            rows = conn.execute(cmd, (table, limit)).fetchall()
+    except psycopg.Error as error:
+        print(f'job_state table skipped: {error}')
+        return []
+    return [dict(zip(keys, row)) for row in rows]
+
+
+
+
+if __name__ == '__main__':
+    job_id = create_job('stock_option', 'test', ['MCD', 'GS'])
+    print(job_id)
+    if job_id is not None:
+        print(run_tracked_symbol(job_id, str.lower, 'MCD'))
+        print(get_job_symbols(job_id, resume_status_tuple))
+        print(get_job_summaries('stock_option', limit=3))
@@ -0,0 +1,197 @@
+"""
+
+USED BY:
+    guru_stock_update/guru_update_database_model.py,
+    zacks_stock_update/zacks_update_database_model.py,
+    stock_option_update/option_update_database_model.py,
+    database_update/general_terminal_model.py,
+    core_stock_update/core_update_controller.py
+
+A list update used to commit one single-row upsert per symbol, that is one round-trip and one fsync per symbol.
+UpsertBuffer collects finished proxies and writes them with one executemany() per flush, psycopg 3 sends executemany() in pipeline mode, so the whole batch is one round-trip and one commit.
+
+brewing/reference_examples/executemany_success.py shows the same make_upsert_psycopg_query() + executemany() technique.
+
+"""
+
+# STANDARD LIBS
+
+from threading import Lock
+from timeit import default_timer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# THIRD PARTY LIBS
+from psycopg import Connection
+
+
+# CUSTOM LIBS
+from dimsumpy.database.postgres import make_upsert_psycopg_query
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.postgres_command_model import table_list_dict
+from pizzapy.database_update.postgres_connection_model import pooled_psycopg_connection
+
+
+
+def group_rows_by_columns(rows: List[Dict]) -> Dict[Tuple[str, ...], List[Dict]]:
+    """
+    * INDEPENDENT *
+    USED BY: upsert_rows_isolated()
+
+    One upsert query has a fixed column list, a proxy might miss a few keys when one of its web pages failed, so rows with the same keys share one query.
+    """
+    groups: Dict[Tuple[str, ...], List[Dict]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row.keys()), []).append(row)
+    return groups
+
+
+
+def upsert_group_isolated(conn: Connection, query: str, columns: Tuple[str, ...], rows: List[Dict]) -> Tuple[List[str], Dict[str, str]]:
+    """
+    * INDEPENDENT *
+    USED BY: upsert_rows_isolated()
+
+    The whole group is tried in one transaction first.
+    If any row fails, that transaction is rolled back and the rows are retried one by one in their own transactions, so one bad proxy does not drop the other rows of the batch.
+    returns the symbols of the upserted rows and {symbol: error message} of the failed rows.
+    """
+    values: List[Tuple[Any, ...]] = [tuple(row[column] for column in columns) for row in rows]
+    try:
+        with conn.transaction():
+            with conn.cursor() as cur:
+                cur.executemany(query, values)
+        return [row.get('symbol') for row in rows], {}
+    except Exception:
+        pass
+
+    upserted_symbols: List[str] = []
+    failed_dict: Dict[str, str] = {}
+    for row, value in zip(rows, values):
+        try:
+            with conn.transaction():
+                conn.execute(query, value)
+            upserted_symbols.append(row.get('symbol'))
+        except Exception as error:
+            failed_dict[row.get('symbol')] = str(error)
+    return upserted_symbols, failed_dict
+
+
+
+def upsert_rows_isolated(rows: List[Dict], table: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    DEPENDS ON: group_rows_by_columns(), upsert_group_isolated()
+    IMPORTS: dimsumpy(make_upsert_psycopg_query), table_list_dict, pooled_psycopg_connection()
+    USED BY: UpsertBuffer.flush_rows()
+
+    returns the symbols of the upserted rows and {symbol: error message} of the failed rows.
+    """
+    pk_list: List[str] = table_list_dict[table].get('primary_key_list')
+    upserted_symbols: List[str] = []
+    failed_dict: Dict[str, str] = {}
+    with pooled_psycopg_connection() as conn:
+        for columns, group_rows in group_rows_by_columns(rows).items():
+            query: str = make_upsert_psycopg_query(table, columns=list(columns), primary_key_list=pk_list)
+            group_symbols, group_failed_dict = upsert_group_isolated(conn, query, columns, group_rows)
+            upserted_symbols += group_symbols
+            failed_dict.update(group_failed_dict)
+    return upserted_symbols, failed_dict
+
+
+
+class UpsertBuffer:
+    """
+    DEPENDS ON: upsert_rows_isolated()
+    USED BY: upsert_guru_by_proxy(), upsert_zacks_by_proxy(), upsert_option_by_proxy(), upsert_symbols_terminal(), core_update_controller.py
+
+    The buffer is flushed when it holds max_rows rows, or when max_seconds have passed since the last flush, the check runs whenever a row is added.
+    I must call flush() at the end of a list update, using the buffer in a with block flushes it automatically.
+
+        with UpsertBuffer('guru_stock') as buffer:
+            for symbol in symbols:
+                upsert_guru(symbol, buffer=buffer)
+
+    The lock makes add() and flush() safe when several threads share one buffer.
+
+    on_flush(upserted_symbols, failed_dict) is called after every flush, a list update marks its job_state rows there,
+    a buffered symbol is only done when its row is written.
+    """
+    def __init__(self, table: str, max_rows: int = 50, max_seconds: float = 30.0, on_flush: Optional[Callable[[List[str], Dict[str, str]], None]] = None) -> None:
+        self.table: str = table
+        self.max_rows: int = max_rows
+        self.max_seconds: float = max_seconds
+        self.on_flush: Optional[Callable[[List[str], Dict[str, str]], None]] = on_flush
+        self.rows: List[Dict] = []
+        self.last_flush: float = default_timer()
+        self.upserted: int = 0
+        self.errors: List[str] = []
+        self.lock: Lock = Lock()
+
+    def add(self, row: Dict) -> str:
+        """
+        A DictProxy is copied into a plain dict, because the Manager process of the DictProxy may be gone before the flush.
+        """
+        with self.lock:
+            self.rows.append(dict(row))
+            is_due: bool = len(self.rows) >= self.max_rows or default_timer() - self.last_flush >= self.max_seconds
+            if not is_due:
+                return f'buffered ({len(self.rows)} rows in {self.table} buffer)'
+            upserted_symbols, failed_dict = self.flush_rows()
+        return f'flushed {len(upserted_symbols)} rows to {self.table}' + (f', {len(failed_dict)} failed: {list(failed_dict)}' if failed_dict else '')
+
+    def flush_rows(self) -> Tuple[List[str], Dict[str, str]]:
+        """
+        USED BY: add(), flush()
+        The caller must hold self.lock.
+        returns the symbols of the upserted rows and {symbol: error message} of the failed rows.
+        """
+        rows: List[Dict] = self.rows
+        self.rows = []
+        self.last_flush = default_timer()
+        if not rows:
+            return [], {}
+        upserted_symbols, failed_dict = upsert_rows_isolated(rows, self.table)
+        self.upserted += len(upserted_symbols)
+        self.errors += [f'{symbol} {error}' for symbol, error in failed_dict.items()]
+        if self.on_flush is not None:
+            self.on_flush(upserted_symbols, failed_dict)
+        return upserted_symbols, failed_dict
+
+    def flush(self) -> List[str]:
+        """
+        returns the error messages of this flush, an empty list means all buffered rows are upserted.
+        """
+        with self.lock:
+            _, failed_dict = self.flush_rows()
+        return [f'{symbol} {error}' for symbol, error in failed_dict.items()]
+
+    def __enter__(self) -> 'UpsertBuffer':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.flush()
+
+
+
+
+def make_upsert_buffer(table: str, on_flush: Optional[Callable[[List[str], Dict[str, str]], None]] = None) -> Optional[UpsertBuffer]:
+    """
+    DEPENDS ON: UpsertBuffer
+    USED BY: upsert_symbols_terminal(), core_update_controller.py
+
+    Only tables in buffered_table_list accept a buffer argument in their upsert functions, other tables get None.
+    """
+    return UpsertBuffer(table, on_flush=on_flush) if table in buffered_table_list else None
+
+
+
+# guru, zacks and option upsert functions accept the buffer keyword argument
+buffered_table_list: List[str] = ['guru_stock', 'zacks_stock', 'stock_option']
+
+
+
+
+if __name__ == '__main__':
+    print('done')
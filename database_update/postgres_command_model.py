@@ -6,7 +6,7 @@ USED BY:
 
 This module contains variables and dictionaries only, line below is for copy and paste:
 
-                guru_stock_create_table_command, zacks_stock_create_table_command, stock_option_create_table_command, stock_price_create_table_command, stock_technical_create_table_command, futures_option_create_table_command
+                guru_stock_create_table_command, zacks_stock_create_table_command, stock_option_create_table_command, stock_price_create_table_command, stock_technical_create_table_command, futures_option_create_table_command, price_cap_create_table_command, job_state_create_table_command
 
     
 I cannot place postgres execution functions in this module, as it will led to circular imports.
@@ -271,6 +271,36 @@ stock_option_create_table_command: str = """
 
 
 
+# barchart price and market cap snapshot, shared by the guru and option updates of the same trading day
+price_cap_create_table_command: str = """
+    CREATE TABLE IF NOT EXISTS price_cap (
+    t   TIMESTAMP,                    
+    td   DATE  NOT NULL,        
+    symbol   VARCHAR(10) NOT NULL,         
+    price   FLOAT8,    
+    cap   FLOAT8,    
+    PRIMARY KEY (symbol, td) 
+    )
+    """
+
+
+
+# one row per symbol of a list update, so an interrupted update can be resumed and the failed symbols can be retried
+job_state_create_table_command: str = """
+    CREATE TABLE IF NOT EXISTS job_state (
+    job_id   VARCHAR(60) NOT NULL,
+    table_name   VARCHAR(30) NOT NULL,
+    list_name   VARCHAR(60),
+    position   INTEGER NOT NULL,
+    symbol   VARCHAR(10) NOT NULL,
+    status   VARCHAR(10) NOT NULL,
+    created   TIMESTAMP NOT NULL,
+    started   TIMESTAMP,
+    finished   TIMESTAMP,
+    error   TEXT,
+    PRIMARY KEY (job_id, symbol)
+    )
+    """
 
 
 
@@ -310,6 +340,14 @@ table_list_dict: Dict[str, Any] = {
 }
 
 
+# The bookkeeping tables of the update programs, not stock data, create_table() creates them from here.
+# They are kept out of table_list_dict, because the Core Updater and Core Browser comboboxes list table_list_dict.
+bookkeeping_table_dict: Dict[str, Any] = {
+    'price_cap': {'primary_key_list': ['symbol', 'td'], 'command': price_cap_create_table_command},
+    'job_state': {'primary_key_list': ['job_id', 'symbol'], 'command': job_state_create_table_command},
+}
+
+
 
 
 if __name__ == '__main__':
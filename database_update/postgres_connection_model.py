@@ -9,30 +9,49 @@ I cannot place postgres execution functions in this module, as it will led to ci
 
 # STANDARD LIB
 
+import atexit
+from contextlib import contextmanager
 import json
-from typing import Any, Dict, List, Union
+from threading import Lock
+from typing import Any, Dict, Generator, List, Optional, Union
 
 # THIRD PARTY LIB
 import pandas
 from pandas.core.frame import DataFrame
 from psycopg import connect, Connection, Cursor
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 from sqlalchemy import create_engine
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.url import URL
 import requests
 from requests.models import Response
 
 # CUSTOM LIBS
 from dimsumpy.database.postgres import make_upsert_psycopg_query, upsert_psycopg
 
+# PROGRAM MODULES
+from pizzapy.general_update.config_model import get_config_flag, get_config_value, read_config
+
+
+# the process-wide pool is created lazily by get_psycopg_pool(), so importing this module does not connect to the server
+shared_psycopg_pool: Optional[ConnectionPool] = None
+psycopg_pool_lock: Lock = Lock()
+
+# the process-wide engine is created lazily by get_sqlalchemy_engine(), pandas reads share its connection pool
+shared_sqlalchemy_engine: Optional[Engine] = None
+sqlalchemy_engine_lock: Lock = Lock()
+
 
 
 def make_psycopg_connection() -> Connection:
     """
-    DEPENDS: json, /etc/config.json FILE
+    DEPENDS: read_config(), /etc/config.json FILE
     DO NOT put with open config.json at the global scope, other it will run everytime we import this module
+
+    This function opens a brand-new connection, upsert functions should use pooled_psycopg_connection() instead.
     """
-    with open('/etc/config.json', 'r') as f:
-        config: Dict[str, Union[str, int]] = json.load(f)
+    config: Dict[str, Union[str, int]] = read_config()
     pg_host: str = config.get('POSTGRESQL_MASTER_HOST')
     pg_port: int = config.get('POSTGRESQL_PORT_NUMBER')
     pg_db: str = config.get('POSTGRESQL_DATABASE')
@@ -41,6 +60,94 @@ def make_psycopg_connection() -> Connection:
     return connect(dbname=pg_db, user=pg_user, password=pg_pass, host=pg_host, port=pg_port)
 
 
+
+def make_psycopg_conninfo() -> str:
+    """
+    DEPENDS: read_config(), /etc/config.json FILE
+    USED BY: get_psycopg_pool()
+
+    ConnectionPool needs a conninfo string rather than keyword arguments, the values are the same as make_psycopg_connection().
+    make_conninfo() quotes the values, so a password with spaces or quotes is still valid.
+    """
+    config: Dict[str, Union[str, int]] = read_config()
+    pg_host: str = config.get('POSTGRESQL_MASTER_HOST')
+    pg_port: int = config.get('POSTGRESQL_PORT_NUMBER')
+    pg_db: str = config.get('POSTGRESQL_DATABASE')
+    pg_user: str = config.get('POSTGRESQL_USERNAME')
+    pg_pass: str = config.get('POSTGRESQL_PASSWORD')
+    return make_conninfo(dbname=pg_db, user=pg_user, password=pg_pass, host=pg_host, port=pg_port)
+
+
+
+def get_psycopg_pool() -> ConnectionPool:
+    """
+    DEPENDS: make_psycopg_conninfo(), get_config_value()
+    IMPORTS: psycopg_pool(ConnectionPool)
+    USED BY: pooled_psycopg_connection()
+
+    The pool is created on the first call and shared by the whole process, so a list update reuses a few connections instead of making a new TCP + auth handshake per symbol.
+
+    Optional keys in /etc/config.json:
+        POSTGRESQL_POOL_MIN_SIZE    (default 1)
+        POSTGRESQL_POOL_MAX_SIZE    (default 10)
+        POSTGRESQL_POOL_MAX_IDLE    (default 300 seconds, idle connections above min_size are closed)
+        POSTGRESQL_POOL_TIMEOUT     (default 30 seconds to wait for a free connection)
+
+    check=ConnectionPool.check_connection runs a quick health check before a connection is given out, so a connection dropped by the server is replaced instead of failing the upsert.
+
+    The lock prevents two threads from creating two pools at the same time.
+    """
+    global shared_psycopg_pool
+    with psycopg_pool_lock:
+        if shared_psycopg_pool is None or shared_psycopg_pool.closed:
+            shared_psycopg_pool = ConnectionPool(
+                conninfo=make_psycopg_conninfo(),
+                min_size=int(get_config_value('POSTGRESQL_POOL_MIN_SIZE', 1)),
+                max_size=int(get_config_value('POSTGRESQL_POOL_MAX_SIZE', 10)),
+                max_idle=float(get_config_value('POSTGRESQL_POOL_MAX_IDLE', 300)),
+                timeout=float(get_config_value('POSTGRESQL_POOL_TIMEOUT', 30)),
+                check=ConnectionPool.check_connection,
+                name='pizzapy',
+                open=True,
+            )
+        return shared_psycopg_pool
+
+
+
+@contextmanager
+def pooled_psycopg_connection() -> Generator[Connection, None, None]:
+    """
+    DEPENDS: get_psycopg_pool()
+    USED BY: guru, zacks, option, price and technical *_update_database_model.py, execute_psycopg_command()
+
+    usage:
+        with pooled_psycopg_connection() as conn:
+            upsert_psycopg(dict=proxy, table=table_name, primary_key_list=pk_list, connection=conn)
+
+    The connection goes back to the pool at the end of the with block, an open transaction is committed, or rolled back when there is an exception.
+    """
+    with get_psycopg_pool().connection() as conn:
+        yield conn
+
+
+
+def close_psycopg_pool() -> None:
+    """
+    * INDEPENDENT *
+    USED BY: atexit
+
+    It is safe to call this function more than once, get_psycopg_pool() will create a new pool if it is needed again.
+    """
+    global shared_psycopg_pool
+    with psycopg_pool_lock:
+        if shared_psycopg_pool is not None and not shared_psycopg_pool.closed:
+            shared_psycopg_pool.close()
+        shared_psycopg_pool = None
+
+
+atexit.register(close_psycopg_pool)
+
+
 def make_psycopg_cursor() -> Cursor: 
     """
     DEPENDS: make_postgres_connection()
@@ -52,7 +159,7 @@ def make_psycopg_cursor() -> Cursor:
 
 def execute_psycopg_command(cmd: str) -> None: 
     """
-    DEPENDS: make_psycopg_connection()
+    DEPENDS: pooled_psycopg_connection()
 
     I must include conn.commit(), otherwise the cmd will not be executed.
     cur.excute(cmd) returns None
@@ -67,37 +174,105 @@ def execute_psycopg_command(cmd: str) -> None:
     compare with - pandas.read_sql(sql=cmd, con=make_postgres_connection())
     pandas.read_sql returns a DataFrame which contains results.
     """
-    with make_psycopg_connection() as conn:
+    with pooled_psycopg_connection() as conn:
         conn.execute(cmd)
         conn.commit()
         
 
 def make_sqlalchemy_engine() -> Engine:
     """
-    DEPENDS: sqlalchemy, json, FILE /etc/config.json
+    DEPENDS: sqlalchemy, read_config(), get_config_value(), FILE /etc/config.json
     DO NOT put with open config.json at the global scope, other it will run everytime we import this module
     used in pandas - read_sql() ; echo='debug' is for verbose debugging; echo=None to surpress verbose terminal info.
+
+    This function builds a brand-new Engine with its own connection pool, pandas reads should use get_sqlalchemy_engine() instead.
+
+    Optional keys in /etc/config.json:
+        SQLALCHEMY_POOL_SIZE        (default 5)
+        SQLALCHEMY_MAX_OVERFLOW     (default 5)
+        SQLALCHEMY_POOL_RECYCLE     (default 1800 seconds, older connections are replaced)
+        SQLALCHEMY_POOL_PRE_PING    (default true, test a connection before using it)
+    
+    URL.create() quotes the password, so special characters in the password are still valid.
     """
-    with open('/etc/config.json', 'r') as f:
-        config: Dict[str, Union[str, int]] = json.load(f)
+    config: Dict[str, Union[str, int]] = read_config()
     pg_host: str = config.get('POSTGRESQL_HOST')
     pg_port: int = config.get('POSTGRESQL_PORT_NUMBER')
     pg_db: str = config.get('POSTGRESQL_DATABASE')
     pg_user: str = config.get('POSTGRESQL_USERNAME')
     pg_pass: str = config.get('POSTGRESQL_PASSWORD')
-    postgres_engine: Engine = create_engine(f'postgresql+psycopg://{pg_user}:{pg_pass}@{pg_host}:{pg_port}/{pg_db}', echo=None)
+    postgres_url: URL = URL.create('postgresql+psycopg', username=pg_user, password=pg_pass, host=pg_host, port=pg_port, database=pg_db)
+    postgres_engine: Engine = create_engine(
+        postgres_url,
+        echo=None,
+        pool_size=int(get_config_value('SQLALCHEMY_POOL_SIZE', 5)),
+        max_overflow=int(get_config_value('SQLALCHEMY_MAX_OVERFLOW', 5)),
+        pool_recycle=int(get_config_value('SQLALCHEMY_POOL_RECYCLE', 1800)),
+        pool_pre_ping=get_config_flag('SQLALCHEMY_POOL_PRE_PING', True),
+    )
     return postgres_engine
 
 
 
-def execute_pandas_read(cmd: str) -> DataFrame:
+def get_sqlalchemy_engine() -> Engine:
+    """
+    DEPENDS: make_sqlalchemy_engine()
+    USED BY: execute_pandas_read()
+
+    The engine is created on the first call and shared by the whole process, so browsing hundreds of symbols does not build an Engine and make a new connection for every read.
+    """
+    global shared_sqlalchemy_engine
+    with sqlalchemy_engine_lock:
+        if shared_sqlalchemy_engine is None:
+            shared_sqlalchemy_engine = make_sqlalchemy_engine()
+        return shared_sqlalchemy_engine
+
+
+
+def dispose_sqlalchemy_engine() -> None:
     """
+    * INDEPENDENT *
+    USED BY: atexit
+
+    dispose() closes all checked-in connections of the engine pool. 
+    It is safe to call this function more than once, get_sqlalchemy_engine() will create a new engine if it is needed again.
+    """
+    global shared_sqlalchemy_engine
+    with sqlalchemy_engine_lock:
+        if shared_sqlalchemy_engine is not None:
+            shared_sqlalchemy_engine.dispose()
+        shared_sqlalchemy_engine = None
+
+
+atexit.register(dispose_sqlalchemy_engine)
+
+
+
+def close_database_resources() -> None:
+    """
+    DEPENDS: close_psycopg_pool(), dispose_sqlalchemy_engine()
+    USED BY: cli.py, main_dock_controller.py
+
+    atexit closes them too, I call this function on the quit paths so the connections are closed before the interpreter starts to tear down its threads.
+    """
+    close_psycopg_pool()
+    dispose_sqlalchemy_engine()
+
+
+
+def execute_pandas_read(cmd: str, params: Optional[Dict[str, Any]] = None) -> DataFrame:
+    """
+    DEPENDS: get_sqlalchemy_engine()
+
     psycopg Connection can be used in pandas.read_sql, it will have warnings in the terminal when I run it.
     pandas recommend SQLAlchemy connection
 
     we do not need to add semicolon to the end of the sql command used in read_sql
+
+    params are passed to the psycopg driver, so the placeholders in cmd are like %(symbols)s, a python list becomes a Postgres array:
+        execute_pandas_read('SELECT * FROM stock_price WHERE symbol = ANY(%(symbols)s)', params={'symbols': ['AMD', 'NVDA']})
     """
-    dataframe: DataFrame = pandas.read_sql(sql=cmd, con=make_sqlalchemy_engine())
+    dataframe: DataFrame = pandas.read_sql(sql=cmd, con=get_sqlalchemy_engine(), params=params)
     return dataframe
 
 
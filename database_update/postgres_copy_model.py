@@ -0,0 +1,147 @@
+"""
+
+USED BY:
+    stock_price_update/price_update_database_model.py,
+    stock_price_update/technical_update_database_model.py
+
+upsert_many_dataframe() sends one upsert per row, a full price history is about 5,000 rows per symbol.
+This module streams a DataFrame into a temporary table with a binary COPY (psycopg 3 cursor.copy()), then merges the temporary table into the target table with ONE INSERT ... ON CONFLICT DO UPDATE statement on the server side.
+
+"""
+
+# STANDARD LIBS
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+
+# THIRD PARTY LIBS
+import pandas
+from pandas import DataFrame, Series
+from pandas.api.types import is_datetime64_any_dtype
+from psycopg import Connection
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.postgres_command_model import table_list_dict
+
+
+
+def coerce_integer(value: Any) -> int:
+    """
+    * INDEPENDENT *
+    A BIGINT column like volume becomes float64 in pandas when it has a missing value, binary COPY needs a real int.
+    """
+    return int(value)
+
+
+def coerce_date(value: Any) -> date:
+    """
+    * INDEPENDENT *
+    yahoo csv gives td as a '2023-09-22' string, binary COPY needs a date object.
+    """
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def coerce_timestamp(value: Any) -> datetime:
+    """
+    * INDEPENDENT *
+    pandas Timestamp is converted to a plain datetime.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value.to_pydatetime() if hasattr(value, 'to_pydatetime') else value
+
+
+# Postgres type oid: int2, int4, int8, date, timestamp
+coerce_function_dict: Dict[int, Callable[[Any], Any]] = {
+    21: coerce_integer,
+    23: coerce_integer,
+    20: coerce_integer,
+    1082: coerce_date,
+    1114: coerce_timestamp,
+}
+
+
+
+def convert_series(series: Series, type_oid: int) -> List[Any]:
+    """
+    DEPENDS ON: coerce_function_dict
+    USED BY: make_copy_rows()
+
+    tolist() converts numpy scalars to python objects, missing values (nan, NaT) become None.
+    """
+    values: List[Any] = series.astype(object).tolist() if is_datetime64_any_dtype(series) else series.tolist()
+    coerce: Callable[[Any], Any] = coerce_function_dict.get(type_oid, lambda x: x)
+    return [None if pandas.isna(value) else coerce(value) for value in values]
+
+
+
+def make_copy_rows(df: DataFrame, columns: List[str], type_oids: List[int]) -> Iterator[Tuple[Any, ...]]:
+    """
+    DEPENDS ON: convert_series()
+    USED BY: copy_upsert_dataframe()
+    """
+    converted_columns: List[List[Any]] = [convert_series(df[column], type_oid) for column, type_oid in zip(columns, type_oids)]
+    return zip(*converted_columns)
+
+
+
+def make_merge_query(table: str, temp_table: str, columns: List[str], primary_key_list: List[str]) -> str:
+    """
+    * INDEPENDENT *
+    USED BY: copy_upsert_dataframe()
+
+    DISTINCT ON keeps only one row per primary key, otherwise ON CONFLICT DO UPDATE fails when the same key appears twice in one statement.
+    """
+    column_str: str = ', '.join(columns)
+    pk_str: str = ', '.join(primary_key_list)
+    update_columns: List[str] = [column for column in columns if column not in primary_key_list]
+    update_str: str = ', '.join(f'{column} = EXCLUDED.{column}' for column in update_columns)
+    conflict_action: str = f'DO UPDATE SET {update_str}' if update_columns else 'DO NOTHING'
+    query: str = f"""
+        INSERT INTO {table} ({column_str})
+        SELECT DISTINCT ON ({pk_str}) {column_str} FROM {temp_table} ORDER BY {pk_str}
+        ON CONFLICT ({pk_str}) {conflict_action}
+        """
+    return query
+
+
+
+def copy_upsert_dataframe(df: DataFrame, table: str, connection: Connection) -> str:
+    """
+    DEPENDS ON: make_copy_rows(), make_merge_query()
+    IMPORTS: table_list_dict
+    USED BY: upsert_price_by_copy(), upsert_technical_by_copy()
+
+    The DataFrame column names must be columns of the target table.
+    The temporary table has the same column types as the target table, ON COMMIT DROP removes it at the end of the transaction.
+    cur.description of an empty SELECT gives the column type oids, set_types() needs them for the binary format.
+
+    returns a short message with the number of merged rows.
+    """
+    if df.empty:
+        return f'0 rows copied into {table}'
+    pk_list: List[str] = table_list_dict[table].get('primary_key_list')
+    columns: List[str] = list(df.columns)
+    column_str: str = ', '.join(columns)
+    temp_table: str = f'copy_{table}'
+
+    with connection.transaction():
+        with connection.cursor() as cur:
+            cur.execute(f'CREATE TEMP TABLE {temp_table} ON COMMIT DROP AS SELECT {column_str} FROM {table} WITH NO DATA')
+            cur.execute(f'SELECT {column_str} FROM {temp_table} LIMIT 0')
+            type_oids: List[int] = [column.type_code for column in cur.description]
+            with cur.copy(f'COPY {temp_table} ({column_str}) FROM STDIN (FORMAT BINARY)') as copy:
+                copy.set_types(type_oids)
+                for row in make_copy_rows(df, columns, type_oids):
+                    copy.write_row(row)
+            cur.execute(make_merge_query(table, temp_table, columns, pk_list))
+            row_count: int = cur.rowcount
+    return f'{row_count} rows copied into {table}'
+
+
+
+
+if __name__ == '__main__':
+    print(make_merge_query('stock_price', 'copy_stock_price', ['symbol', 'td', 'close'], ['symbol', 'td']))
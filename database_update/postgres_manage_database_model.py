@@ -24,7 +24,7 @@ import pandas
 from pandas.core.frame import DataFrame
 
 # PROGRAM MODULES
-from pizzapy.database_update.postgres_command_model import table_list_dict
+from pizzapy.database_update.postgres_command_model import bookkeeping_table_dict, table_list_dict
 
 from pizzapy.database_update.postgres_connection_model import execute_pandas_read, execute_psycopg_command
 
@@ -170,10 +170,11 @@ def loop_execute_sql() -> None:
 def create_table(table_name:str) -> None:
     """
     DEPENDS ON: show_table(), show_tables()
-    IMPORTS: table_list_dict, execute_psycopg_command()
+    IMPORTS: table_list_dict, bookkeeping_table_dict, execute_psycopg_command()
     """
-    if table_name in table_list_dict:
-        cmd: str = table_list_dict[table_name].get('command')
+    create_table_dict: Dict[str, Any] = {**table_list_dict, **bookkeeping_table_dict}
+    if table_name in create_table_dict:
+        cmd: str = create_table_dict[table_name].get('command')
         execute_psycopg_command(cmd)
         print(f"\nTable {table_name} columns: \n")
         print(show_table(table_name))
@@ -198,7 +199,7 @@ def create_table(table_name:str) -> None:
 def loop_drop_table():
     """
     DEPENDS ON: show_tables()
-    IMPORTS:  table_list_dict, execute_psycopg_command()
+    IMPORTS:  table_list_dict, bookkeeping_table_dict, execute_psycopg_command()
     """
     while True:
         print('\nLatest available tables in Postgresql database: \n')
@@ -207,8 +208,8 @@ def loop_drop_table():
         drop_table_cmd: str = f'DROP TABLE IF EXISTS {table_name}'
         if table_name == '0':
             break
-        elif table_name in table_list_dict:
-            reply = input(f"\nYou are going to DROP TABLE '{table_name}', it is a CRITICAL TABLE in table_list_dict, do you really want to drop this table (y/N)?")
+        elif table_name in table_list_dict or table_name in bookkeeping_table_dict:
+            reply = input(f"\nYou are going to DROP TABLE '{table_name}', it is a CRITICAL TABLE in table_list_dict or bookkeeping_table_dict, do you really want to drop this table (y/N)?")
             if reply == 'y':
                 execute_psycopg_command(drop_table_cmd)
         elif table_name:
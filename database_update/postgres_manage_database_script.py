@@ -31,6 +31,8 @@ postgres_menu_text: str = """\n
         14) create_table('stock_price')
         15) create_table('stock_technical')
         16) create_table('technical_one')
+        17) create_table('price_cap')
+        18) create_table('job_state')
         
         0) quit
     Choose your action: """
@@ -52,6 +54,8 @@ actions_dict: Dict[str, Any] = {
     '14': lambda: create_table('stock_price'),
     '15': lambda: create_table('stock_technical'),
     '16': lambda: create_table('technical_one'),
+    '17': lambda: create_table('price_cap'),
+    '18': lambda: create_table('job_state'),
     }
 
 
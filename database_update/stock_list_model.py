@@ -7,59 +7,182 @@ USED BY:
 """
 
 # STANDARD LIBS
+from collections.abc import Mapping
+from functools import lru_cache
 from timeit import timeit
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, Iterator, List, Set, Union
 
 
 # THIRD PARTY LIBS
 
 # CUSTOM LIBS
-from dimsumpy.web.crawler import get_html_dataframes, get_html_soup
 
 # PROGRAM MODULES
-from pizzapy.database_update.generated_stock_list import nasdaq_100_stocks, nasdaq_listed_stocks, nasdaq_traded_stocks, sp_400_stocks, sp_500_stocks, sp_nasdaq_stocks
+from pizzapy.database_update import generated_stock_list
+from pizzapy.general_update.lazy_callable_model import LazyCallable
 
 
-from pizzapy.guru_stock_update.guru_update_database_model import upsert_guru
-from pizzapy.stock_option_update.option_update_database_model import upsert_option
-from pizzapy.zacks_stock_update.zacks_update_database_model import upsert_zacks
-from pizzapy.stock_price_update.price_update_database_model import upsert_latest_price
-from pizzapy.stock_price_update.technical_update_database_model import upsert_recent_technical, upsert_technical_one
 
 
+# short list names for the command line, like: python3 -m pizzapy.batch update --table guru_stock --list sp500
+# the values are the names in generated_stock_list.py, 'all' is made by get_all_stocks()
+slug_name_dict: Dict[str, str] = {
+    'nasdaq100': 'nasdaq_100_stocks',
+    'sp500': 'sp_500_stocks',
+    'sp400': 'sp_400_stocks',
+    'sp_nasdaq': 'sp_nasdaq_stocks',
+    'nasdaq_listed': 'nasdaq_listed_stocks',
+    'nasdaq_traded': 'nasdaq_traded_stocks',
+    'option': 'option_traded_stocks',
+    'all': 'all_stocks',
+}
 
 
+# the GUI combobox labels of the slugs, the label also shows the length of the list
+slug_label_dict: Dict[str, str] = {
+    'nasdaq100': 'Nasdaq 100',
+    'sp500': 'S&P 500',
+    'sp400': 'S&P 400',
+    'sp_nasdaq': 'S&P 500, 400 + Nasdaq 100',
+    'option': 'Option Stocks',
+    'nasdaq_listed': 'Nasdaq Listed',
+    'nasdaq_traded': 'Nasdaq Traded',
+    'all': 'All Stocks',
+}
 
 
-# need to comment out all_stocks when I use code to generate 
-all_stocks: List[str] = nasdaq_traded_stocks + ['FNMA', 'FMCC']
+# the lists which can be empty, like option_traded_stocks of a generated_stock_list.json made before it was added
+# an empty list is hidden from the slugs and the labels, an update of no symbols is not a list update
+optional_slug_set: Set[str] = {'option'}
+
+
+
+@lru_cache(maxsize=None)
+def get_all_stocks() -> List[str]:
+    """
+    * INDEPENDENT *
+    IMPORTS: generated_stock_list
+    USED BY: get_stock_list(), __getattr__()
+    """
+    return generated_stock_list.nasdaq_traded_stocks + ['FNMA', 'FMCC']
+
+
+
+def get_stock_list(slug: str) -> List[str]:
+    """
+    DEPENDS ON: slug_name_dict, get_all_stocks()
+    IMPORTS: generated_stock_list
+    USED BY: StockListSlugDict, get_stock_list_dict()
+
+    generated_stock_list.json is read on the first call, not when this module is imported.
+    """
+    if slug == 'all':
+        return get_all_stocks()
+    return getattr(generated_stock_list, slug_name_dict[slug])
+
+
+
+def is_listed_slug(slug: str) -> bool:
+    """
+    DEPENDS ON: slug_name_dict, optional_slug_set, get_stock_list()
+    USED BY: StockListSlugDict, get_stock_list_dict()
+
+    Only an optional slug reads its list here, the other slugs are always listed.
+    """
+    return slug in slug_name_dict and (slug not in optional_slug_set or bool(get_stock_list(slug)))
+
+
+
+class StockListSlugDict(Mapping):
+    """
+    DEPENDS ON: slug_name_dict, is_listed_slug(), get_stock_list()
+    USED BY: list_slug_dict
+
+    The keys are slug_name_dict without the empty optional lists, so `sorted(list_slug_dict)` for the argparse choices only reads generated_stock_list.json
+    to check the optional lists, the lists themselves are returned by list_slug_dict[slug].
+    """
+    def __getitem__(self, slug: str) -> List[str]:
+        if not is_listed_slug(slug):
+            raise KeyError(slug)
+        return get_stock_list(slug)
+
+    def __iter__(self) -> Iterator[str]:
+        return (slug for slug in slug_name_dict if is_listed_slug(slug))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+list_slug_dict: Mapping[str, List[str]] = StockListSlugDict()
+
+
+
+@lru_cache(maxsize=None)
+def get_stock_list_dict() -> Dict[str, List[str]]:
+    """
+    DEPENDS ON: slug_label_dict, is_listed_slug(), get_stock_list()
+    USED BY: __getattr__()
+
+    The keys are the labels with the list lengths like 'S&P 500 (503)', so the lists have to be read to make this dict.
+    An empty optional list has no label, the combobox would offer an update of no symbols.
+    """
+    stock_list_dict: Dict[str, List[str]] = {}
+    for slug, label in slug_label_dict.items():
+        if not is_listed_slug(slug):
+            continue
+        stock_list: List[str] = get_stock_list(slug)
+        stock_list_dict[f'{label} ({len(stock_list)})'] = stock_list
+    return stock_list_dict
 
-stock_list_dict: Dict[str, List[str]] = {
-    f'Nasdaq 100 ({len(nasdaq_100_stocks)})': nasdaq_100_stocks,
-    f'S&P 500 ({len(sp_500_stocks)})': sp_500_stocks,
-    f'S&P 400 ({len(sp_400_stocks)})': sp_400_stocks,
-    f'S&P 500, 400 + Nasdaq 100 ({len(sp_nasdaq_stocks)})': sp_nasdaq_stocks,
-    #f'Option Stocks ({len(option_traded_stocks)})': option_traded_stocks,
-    f'Nasdaq Listed ({len(nasdaq_listed_stocks)})': nasdaq_listed_stocks,
-    f'Nasdaq Traded ({len(nasdaq_traded_stocks)})': nasdaq_traded_stocks,
-    f'All Stocks ({len(all_stocks)})': all_stocks,
-}
 
 
 # This dictionary can be used to compose upsert commands
 # option, price and technicals are from yahoo
-table_function_dict: Dict[str, Any] = {
-    'guru_stock': upsert_guru ,
-    'zacks_stock': upsert_zacks,
-    'stock_option': upsert_option,
-    'stock_price': upsert_latest_price,
-    'stock_technical': upsert_recent_technical,
-    'technical_one': upsert_technical_one,
+# the update module of a table is imported on the first call of its function, so the menus start without loading every pipeline
+table_function_dict: Dict[str, LazyCallable] = {
+    'guru_stock': LazyCallable('pizzapy.guru_stock_update.guru_update_database_model', 'upsert_guru'),
+    'zacks_stock': LazyCallable('pizzapy.zacks_stock_update.zacks_update_database_model', 'upsert_zacks'),
+    'stock_option': LazyCallable('pizzapy.stock_option_update.option_update_database_model', 'upsert_option'),
+    'stock_price': LazyCallable('pizzapy.stock_price_update.price_update_database_model', 'upsert_incremental_price'),
+    'stock_technical': LazyCallable('pizzapy.stock_price_update.technical_update_database_model', 'upsert_recent_technical'),
+    'technical_one': LazyCallable('pizzapy.stock_price_update.technical_update_database_model', 'upsert_technical_one'),
     #'futures_option': upsert_guru ,
 }
 
 
-    
+# The web site of each table, a list update waits for the SYMBOL_RATE_LIMITS limit of the host before every symbol
+# the HOST_RATE_LIMITS limit of a host is applied to every request by http_client_model.py
+table_host_dict: Dict[str, str] = {
+    'guru_stock': 'www.gurufocus.com',
+    'zacks_stock': 'www.zacks.com',
+    'stock_option': 'finance.yahoo.com',
+    'stock_price': 'query1.finance.yahoo.com',
+    'stock_technical': 'query1.finance.yahoo.com',
+    'technical_one': 'query1.finance.yahoo.com',
+}
+
+
+# A list update calls the prepare function of its table once with the whole list before the symbol loop
+# stock_price gets the latest stored td of all symbols in one grouped query
+table_prepare_dict: Dict[str, LazyCallable] = {
+    'stock_price': LazyCallable('pizzapy.stock_price_update.price_update_database_model', 'prime_latest_price_dates'),
+}
+
+
+
+
+def __getattr__(name: str) -> Any:
+    """
+    DEPENDS ON: get_all_stocks(), get_stock_list_dict()
+    all_stocks and stock_list_dict are made on the first access, like the names of generated_stock_list.py.
+    """
+    if name == 'all_stocks':
+        return get_all_stocks()
+    if name == 'stock_list_dict':
+        return get_stock_list_dict()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 
 def test() -> None:
     print('hi')
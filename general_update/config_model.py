@@ -0,0 +1,68 @@
+"""
+* INDEPENDENT MODULE *
+
+USED BY: postgres_connection_model.py
+
+This module reads /etc/config.json once per process, so that connection pools and other long-lived objects do not re-read the file for every symbol.
+
+Optional keys in /etc/config.json can tune the program, every optional key has a default value in the module which uses it.
+
+"""
+
+# STANDARD LIBS
+
+from functools import lru_cache
+import json
+from typing import Any, Dict, Union
+
+
+CONFIG_PATH: str = '/etc/config.json'
+
+
+
+@lru_cache(maxsize=None)
+def read_config() -> Dict[str, Union[str, int]]:
+    """
+    * INDEPENDENT *
+    IMPORTS: json, lru_cache, /etc/config.json FILE
+    USED BY: get_config_value()
+
+    DO NOT put with open config.json at the global scope, otherwise it will run everytime we import this module.
+    lru_cache() makes the file being read only once on the first call, I can call read_config.cache_clear() after editing the file.
+    """
+    with open(CONFIG_PATH, 'r') as f:
+        config: Dict[str, Union[str, int]] = json.load(f)
+    return config
+
+
+
+def get_config_value(key: str, default: Any = None) -> Any:
+    """
+    DEPENDS ON: read_config()
+    USED BY: postgres_connection_model.py
+
+    The default value is returned when the key is not in /etc/config.json.
+    """
+    return read_config().get(key, default)
+
+
+
+def get_config_flag(key: str, default: bool) -> bool:
+    """
+    DEPENDS ON: get_config_value()
+    USED BY: postgres_connection_model.py, price_cap_cache_model.py
+
+    bool('false') is True, so a flag accepts only a JSON true / false or the strings "true" / "false" in any case.
+    Any other value is a mistake in /etc/config.json, it raises ValueError instead of being read as True.
+    """
+    value: Any = get_config_value(key, default)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ('true', 'false'):
+        return value.strip().lower() == 'true'
+    raise ValueError(f'{key} in {CONFIG_PATH} must be true or false, not {value!r}')
+
+
+
+if __name__ == '__main__':
+    print(read_config())
@@ -0,0 +1,106 @@
+"""
+
+USED BY:
+    stock_price_update/technical_analysis_model.py,
+    stock_option_update/option_money_model.py,
+    cli.py,
+    gui_dock/main_dock_controller.py
+
+construct_technical_proxies() and get_total_premiums() used to create a multiprocessing Pool inside every call, so a list update forked the workers again for every symbol.
+This module keeps ONE long-lived executor per name, created on the first call and shared by the whole program, shutdown_executors() stops them when the program quits.
+
+Optional keys in /etc/config.json, NAME is the executor name in upper case, like TECHNICAL or OPTION:
+    NAME_EXECUTOR_KIND      'process' or 'thread' (default is the kind given by the caller)
+    NAME_EXECUTOR_WORKERS   number of workers (default is the number given by the caller)
+
+"""
+
+# STANDARD LIBS
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+import os
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# PROGRAM MODULES
+from pizzapy.general_update.config_model import get_config_value
+
+
+
+# executor name => executor, filled by get_executor()
+executor_dict: Dict[str, Executor] = {}
+executor_lock: Lock = Lock()
+
+executor_class_dict: Dict[str, Callable[..., Executor]] = {
+    'process': ProcessPoolExecutor,
+    'thread': ThreadPoolExecutor,
+}
+
+
+
+def get_executor(name: str, kind: str = 'process', max_workers: Optional[int] = None) -> Executor:
+    """
+    DEPENDS ON: executor_dict, executor_class_dict
+    IMPORTS: get_config_value()
+    USED BY: make_technical_proxies(), get_total_premiums()
+
+    kind and max_workers are only the defaults, the /etc/config.json keys win, and they are only used when the executor is created.
+    """
+    with executor_lock:
+        if name not in executor_dict:
+            kind = get_config_value(f'{name.upper()}_EXECUTOR_KIND', kind)
+            max_workers = int(get_config_value(f'{name.upper()}_EXECUTOR_WORKERS', max_workers or os.cpu_count()))
+            executor_dict[name] = executor_class_dict[kind](max_workers=max_workers)
+        return executor_dict[name]
+
+
+
+def run_chunk(func: Callable[..., Any], shared: Tuple[Any, ...], chunk: Sequence[Any]) -> List[Any]:
+    """
+    * INDEPENDENT *
+    USED BY: map_with_shared()
+
+    This function runs in the worker, it must be a module level function so that a process executor can pickle it.
+    """
+    return [func(*shared, item) for item in chunk]
+
+
+
+def map_with_shared(executor: Executor, func: Callable[..., Any], shared: Tuple[Any, ...], items: Sequence[Any], chunk_count: Optional[int] = None) -> List[Any]:
+    """
+    DEPENDS ON: run_chunk()
+    USED BY: make_technical_proxies()
+
+    func(*shared, item) is called for every item, the results keep the order of items.
+    The items are cut into chunk_count chunks (default is the number of workers), so the read-only shared data like the price odict is pickled once per chunk, not once per item.
+    """
+    if not items:
+        return []
+    chunk_count = chunk_count or getattr(executor, '_max_workers', None) or os.cpu_count()
+    chunk_size: int = -(-len(items) // chunk_count)
+    chunks: List[Sequence[Any]] = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    futures = [executor.submit(run_chunk, func, shared, chunk) for chunk in chunks]
+    return list(chain.from_iterable(future.result() for future in futures))
+
+
+
+def shutdown_executors() -> None:
+    """
+    * INDEPENDENT *
+    USED BY: cli.py, main_dock_controller.py
+
+    It is safe to call this function more than once, get_executor() will create a new executor if it is needed again.
+    """
+    with executor_lock:
+        for executor in executor_dict.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        executor_dict.clear()
+
+
+
+
+if __name__ == '__main__':
+    print(map_with_shared(get_executor('test', kind='thread'), pow, (2,), list(range(10))))
+    shutdown_executors()
@@ -20,14 +20,18 @@ import requests
 from batterypy.string.json import extract_nested_values
 from batterypy.string.read import formatlarge, readf
 from batterypy.time.cal import get_trading_day_utc
-from dimsumpy.web.crawler import get_html_soup
+
+
+# PROGRAM MODULES
+from pizzapy.general_update.http_client_model import get_html_soup
+from pizzapy.general_update.price_cap_cache_model import get_price_cap
 
 
 def get_barchart_price_cap(symbol: str) -> Tuple[Optional[float], Optional[float]] :
     """
     * INDEPENDENT *
 
-    IMPORTS: json, beautifulsoup4, batterypy, dimsumpy
+    IMPORTS: json, beautifulsoup4, batterypy, get_html_soup()
         
     I can use this function to display the marketcap dictionary in formatted string:
         json_cap_pretty: str = json.dumps(json_cap, indent=2)
@@ -51,9 +55,12 @@ def get_barchart_price_cap(symbol: str) -> Tuple[Optional[float], Optional[float
 def make_price_cap_proxy(symbol: str, proxy: DictProxy={}) -> DictProxy:
     """
     DEPENDS ON: get_barchart_price_cap()
+    IMPORTS: get_price_cap()
     I write `is not None` for testing below since price, cap might be 0, which is a false value.
+
+    The barchart page is downloaded once per symbol and trading day, the guru and option updates share the snapshot.
     """
-    price, cap = get_barchart_price_cap(symbol)    
+    price, cap = get_price_cap(symbol, get_barchart_price_cap)
     proxy['price'] = price
     proxy['cap'] = cap
     proxy['cap_str'] = formatlarge(cap) if cap is not None else None
@@ -76,6 +83,22 @@ def initialize_proxy(symbol: str) -> DictProxy:
 
 
 
+def initialize_dict(symbol: str) -> Dict[str, Any]:
+    """
+        * INDEPENDENT *
+        IMPORTS: get_trading_day_utc()
+        USED BY: process_guru()
+
+        Same keys as initialize_proxy(), a plain dict is enough when the fields are filled by threads of the same process.
+    """
+    proxy: Dict[str, Any] = {}
+    proxy['symbol'] = symbol
+    proxy['td'] = get_trading_day_utc()
+    proxy['t'] = datetime.now().replace(second=0, microsecond=0)
+    return proxy
+
+
+
 if __name__ == '__main__':
 
     s = input('which str to you want to input? ')
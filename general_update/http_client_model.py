@@ -0,0 +1,218 @@
+"""
+
+USED BY: every guru, zacks, option, price and stock list model which downloads a web page.
+
+The dimsumpy crawler functions open a new connection for every request, one guru symbol used to make 14 TLS handshakes to gurufocus.com.
+This module keeps ONE requests.Session per host for the whole process, the session keeps the connections alive in a urllib3 pool, and retries a failed request with backoff.
+Every request of a session waits for the HOST_RATE_LIMITS limit of its host first, see rate_limit_model.py, a response cache hit sends no request and does not wait.
+The functions have the same names and return types as the dimsumpy crawler functions, so a model module only changes its import line.
+
+Optional keys in /etc/config.json:
+    HTTP_POOL_MAXSIZE       connections kept alive per host (default 16)
+    HTTP_RETRIES            retries of a failed connection or a 429 / 5xx response (default 3)
+    HTTP_BACKOFF_FACTOR     the retries wait 0.5, 1, 2 ... seconds with the default 0.5
+    HTTP_TIMEOUT            seconds to wait for the server response (default 30)
+    RESPONSE_CACHE_PATH     SQLite file of the on-disk response cache, see response_cache_model.py (default off)
+
+"""
+
+# STANDARD LIBS
+
+import atexit
+from io import StringIO
+from threading import Lock
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+# THIRD PARTY LIBS
+from bs4 import BeautifulSoup
+import pandas
+from pandas import DataFrame
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# CUSTOM LIBS
+from batterypy.time.cal import get_trading_day_utc
+
+
+# PROGRAM MODULES
+from pizzapy.general_update.config_model import get_config_value
+from pizzapy.general_update.rate_limit_model import wait_for_host
+from pizzapy.general_update.response_cache_model import ResponseCache, close_response_cache, fetch_cached_text, get_response_cache
+
+
+
+# Yahoo Finance refuses requests without the Accept field, gurufocus and zacks refuse the default python-requests User-Agent
+default_headers: Dict[str, str] = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+# host => requests.Session, filled by get_session()
+session_dict: Dict[str, requests.Session] = {}
+session_lock: Lock = Lock()
+
+
+
+class RateLimitedSession(requests.Session):
+    """
+    IMPORTS: wait_for_host()
+    USED BY: make_session()
+
+    Session.get() and every other method go through request(), so no request to the host skips the limit.
+    The retries of urllib3 happen inside one request() call, they wait for their backoff instead.
+    """
+    def __init__(self, host: str) -> None:
+        super().__init__()
+        self.host: str = host
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        wait_for_host(self.host)
+        return super().request(method, url, *args, **kwargs)
+
+
+
+def make_session(host: str) -> requests.Session:
+    """
+    DEPENDS ON: RateLimitedSession
+    IMPORTS: HTTPAdapter, Retry, get_config_value()
+    USED BY: get_session()
+    """
+    pool_maxsize: int = int(get_config_value('HTTP_POOL_MAXSIZE', 16))
+    retry: Retry = Retry(
+        total=int(get_config_value('HTTP_RETRIES', 3)),
+        backoff_factor=float(get_config_value('HTTP_BACKOFF_FACTOR', 0.5)),
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET', 'HEAD'),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter: HTTPAdapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+    session: requests.Session = RateLimitedSession(host)
+    session.headers.update(default_headers)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    DEPENDS ON: make_session()
+    USED BY: fetch_response()
+
+    The session of a host is created on the first request to the host and shared by all threads.
+    """
+    host: str = urlsplit(url).netloc
+    with session_lock:
+        if host not in session_dict:
+            session_dict[host] = make_session(host)
+        return session_dict[host]
+
+
+
+def fetch_response(url: str, **kwargs: Any) -> requests.Response:
+    """
+    DEPENDS ON: get_session()
+    IMPORTS: get_config_value()
+    USED BY: fetch_text()
+
+    kwargs are passed to Session.get(), like headers or params.
+    A 4xx or 5xx response after all retries does not raise, like the dimsumpy crawler functions, the text of the error page is returned
+    and the parsing of the model finds nothing, a guru page with a 404 leaves its columns empty.
+    A connection error or a timeout still raises.
+    """
+    kwargs.setdefault('timeout', float(get_config_value('HTTP_TIMEOUT', 30)))
+    response: requests.Response = get_session(url).get(url, **kwargs)
+    return response
+
+
+
+def fetch_text(url: str, **kwargs: Any) -> str:
+    """
+    DEPENDS ON: get_session(), fetch_response()
+    IMPORTS: get_response_cache(), fetch_cached_text(), get_trading_day_utc(), get_config_value()
+    USED BY: get_html_text(), get_csv_dataframe()
+
+    With RESPONSE_CACHE_PATH, the text of the url is served from the response cache for the rest of the trading day.
+    A request with kwargs, like headers or params, skips the cache, because the same url can return a different page.
+    """
+    cache: Optional[ResponseCache] = get_response_cache()
+    if cache is None or kwargs:
+        return fetch_response(url, **kwargs).text
+    td: str = str(get_trading_day_utc())
+    return fetch_cached_text(get_session(url), url, td, cache, timeout=float(get_config_value('HTTP_TIMEOUT', 30)))
+
+
+
+def get_html_text(url: str, **kwargs: Any) -> str:
+    """
+    DEPENDS ON: fetch_text()
+    USED BY: get_html_soup(), get_html_dataframes(), guru_revenue_model.py, option_money_model.py, zacks_scores_model.py
+    """
+    return fetch_text(url, **kwargs)
+
+
+
+def get_html_soup(url: str, parser: str = 'html.parser', **kwargs: Any) -> BeautifulSoup:
+    """
+    DEPENDS ON: get_html_text()
+    IMPORTS: BeautifulSoup
+    """
+    return BeautifulSoup(get_html_text(url, **kwargs), parser)
+
+
+
+def get_html_dataframes(url: str, **kwargs: Any) -> List[DataFrame]:
+    """
+    DEPENDS ON: get_html_text()
+    IMPORTS: pandas
+
+    pandas.read_html() raises ValueError when the page has no table, an empty list is returned instead, the callers check the length of the list.
+    """
+    html_text: str = get_html_text(url, **kwargs)
+    try:
+        return pandas.read_html(StringIO(html_text))
+    except ValueError:
+        return []
+
+
+
+def get_csv_dataframe(url: str, **kwargs: Any) -> DataFrame:
+    """
+    DEPENDS ON: fetch_text()
+    IMPORTS: pandas
+    USED BY: raw_price_model.py
+
+    kwargs are passed to pandas.read_csv(), like header=0.
+    """
+    return pandas.read_csv(StringIO(fetch_text(url)), **kwargs)
+
+
+
+def close_http_sessions() -> None:
+    """
+    IMPORTS: close_response_cache()
+    USED BY: atexit, cli.py, main_dock_controller.py
+
+    It is safe to call this function more than once, get_session() creates a new session if it is needed again.
+    """
+    with session_lock:
+        for session in session_dict.values():
+            session.close()
+        session_dict.clear()
+    close_response_cache()
+
+
+atexit.register(close_http_sessions)
+
+
+
+
+if __name__ == '__main__':
+    soup = get_html_soup('https://www.gurufocus.com/term/zscore/NVDA')
+    print(soup.title)
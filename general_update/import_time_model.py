@@ -0,0 +1,104 @@
+"""
+*** INDEPENDENT MODULE ***
+
+USED BY:
+    tests/test_import_time.py
+
+Measures the start of a module with `python -X importtime`, which writes one line per imported module to stderr:
+    import time: self [us] | cumulative | imported package
+The cumulative time of the top-level module is its whole import time.
+
+I can run this module directly to see the slowest imports:
+
+    (venv) $ python3 -m pizzapy.general_update.import_time_model pizzapy.cli
+    (venv) $ python3 -m pizzapy.general_update.import_time_model pizzapy.main --top 30
+
+import_budget_dict is the budget of the menus in milliseconds, with PIZZAPY_BENCHMARK=1 tests/test_import_time.py fails when a start becomes slower than its budget.
+pipeline_module_list are the update pipelines imported only by the LazyCallable functions of table_function_dict, the menus must not import them.
+
+"""
+
+# STANDARD LIBS
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+
+import_budget_dict: Dict[str, int] = {
+    'pizzapy.cli': 1500,
+    'pizzapy.batch': 1500,
+    'pizzapy.main': 4000,
+}
+
+
+pipeline_module_list: List[str] = [
+    'pizzapy.guru_stock_update.guru_update_database_model',
+    'pizzapy.zacks_stock_update.zacks_update_database_model',
+    'pizzapy.stock_option_update.option_update_database_model',
+    'pizzapy.stock_price_update.price_update_database_model',
+    'pizzapy.stock_price_update.technical_update_database_model',
+]
+
+
+
+def parse_import_time(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    * INDEPENDENT *
+    USED BY: measure_import_time()
+
+    returns (module, self microseconds, cumulative microseconds) of every imported module, the other stderr lines are ignored.
+    """
+    rows: List[Tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+
+def measure_import_time(module: str) -> List[Tuple[str, int, int]]:
+    """
+    DEPENDS ON: parse_import_time()
+    USED BY: get_import_ms(), main()
+
+    A new interpreter imports the module, so nothing is imported already, the .pyc files are used like a normal start.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(f'import {module} failed: {process.stderr.splitlines()[-1:]}')
+    return parse_import_time(process.stderr)
+
+
+
+def get_import_ms(rows: List[Tuple[str, int, int]], module: str) -> float:
+    """
+    * INDEPENDENT *
+    USED BY: tests/test_import_time.py, main()
+    """
+    return next(cumulative_us for name, self_us, cumulative_us in rows if name == module) / 1000
+
+
+
+def main() -> None:
+    """
+    DEPENDS ON: measure_import_time(), get_import_ms(), import_budget_dict
+    """
+    parser = argparse.ArgumentParser(description='Show the import time of a pizzapy module.')
+    parser.add_argument('module', nargs='?', default='pizzapy.cli')
+    parser.add_argument('--top', type=int, default=20, help='number of the slowest modules by self time')
+    args: argparse.Namespace = parser.parse_args()
+    rows: List[Tuple[str, int, int]] = measure_import_time(args.module)
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[1], reverse=True)[:args.top]:
+        print(f'{self_us / 1000:10.1f} ms {cumulative_us / 1000:10.1f} ms  {name}')
+    budget: str = f', budget {import_budget_dict[args.module]} ms' if args.module in import_budget_dict else ''
+    print(f'{args.module}: {get_import_ms(rows, args.module):.1f} ms, {len(rows)} modules{budget}')
+
+
+
+
+if __name__ == '__main__':
+    main()
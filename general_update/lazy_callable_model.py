@@ -0,0 +1,54 @@
+"""
+*** INDEPENDENT MODULE ***
+
+USED BY:
+    database_update/stock_list_model.py
+
+A LazyCallable stands for a function of another module, the module is imported on the first call, not when the registry is made.
+The terminal menu and the batch parser only need the table names of table_function_dict, importing every update pipeline (pandas, bs4, lxml, sqlalchemy and the 13 guru models) before the first menu made the start slow.
+
+    upsert_guru = LazyCallable('pizzapy.guru_stock_update.guru_update_database_model', 'upsert_guru')
+    upsert_guru('NVDA')             # imports guru_update_database_model now
+    partial(upsert_guru, buffer=buffer)('NVDA')
+
+"""
+
+# STANDARD LIBS
+from importlib import import_module
+from typing import Any, Callable, Optional
+
+
+
+class LazyCallable:
+    """
+    * INDEPENDENT *
+    USED BY: table_function_dict, table_prepare_dict
+
+    import_module() holds the import lock, so two threads calling at the same time still import the module once.
+    """
+    def __init__(self, module_name: str, function_name: str) -> None:
+        self.module_name: str = module_name
+        self.function_name: str = function_name
+        self.function: Optional[Callable[..., Any]] = None
+
+    @property
+    def __name__(self) -> str:
+        return self.function_name
+
+    def resolve(self) -> Callable[..., Any]:
+        if self.function is None:
+            self.function = getattr(import_module(self.module_name), self.function_name)
+        return self.function
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'LazyCallable({self.module_name!r}, {self.function_name!r})'
+
+
+
+
+if __name__ == '__main__':
+    dumps = LazyCallable('json', 'dumps')
+    print(dumps, dumps({'a': 1}), dumps.function)
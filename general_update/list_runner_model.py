@@ -0,0 +1,115 @@
+"""
+
+USED BY:
+    database_update/general_terminal_model.py
+
+A list update used to call the upsert function of one symbol after another, so the network latency of 500 to 11,000 symbols added up.
+run_symbols_concurrently() runs the same function for several symbols at the same time in threads, every symbol waits for the symbol rate limit of its host first,
+every HTTP request of the symbol waits for the request rate limit of its host in http_client_model.py.
+
+A table function returns a string, the invalid proxy of a symbol used to be a string like any other result and counted as a success.
+It returns a SymbolFailure now, which is still a string for the callers which print it, run_symbols_concurrently() counts it as a failed symbol.
+
+Optional keys in /etc/config.json:
+    LIST_UPDATE_WORKERS     number of symbols updated at the same time (default 4), 1 keeps the original one-by-one order.
+    SYMBOL_RATE_LIMITS      host => symbols started per second, see rate_limit_model.py, the requests are limited by HOST_RATE_LIMITS
+
+"""
+
+# STANDARD LIBS
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from timeit import default_timer
+from typing import Any, Callable, Dict, List, Optional
+
+
+# PROGRAM MODULES
+from pizzapy.general_update.config_model import get_config_value
+from pizzapy.general_update.rate_limit_model import wait_for_symbol
+
+
+
+class SymbolFailure(str):
+    """
+    * INDEPENDENT *
+    USED BY: upsert_guru(), upsert_zacks(), upsert_option(), run_symbols_concurrently(), run_tracked_symbol()
+
+    The result of a symbol which did not raise but was not updated either, like: return SymbolFailure(f'{symbol} {proxy} proxy missed wealth_pc')
+    """
+
+
+
+def is_symbol_failure(result: Any) -> bool:
+    """
+    * INDEPENDENT *
+    USED BY: run_symbols_concurrently(), run_tracked_symbol(), core_update_controller.py
+    """
+    return isinstance(result, SymbolFailure)
+
+
+
+def run_symbol(func: Callable[[str], Any], symbol: str, host: Optional[str]) -> Any:
+    """
+    DEPENDS ON: wait_for_symbol()
+    USED BY: run_symbols_concurrently()
+    """
+    wait_for_symbol(host)
+    return func(symbol)
+
+
+
+def print_symbol_result(i: int, length: int, symbol: str, result: str) -> None:
+    """
+    * INDEPENDENT *
+    USED BY: run_symbols_concurrently()
+
+    The default on_result callback, same output as the original loop, the counter is the completion order.
+    """
+    print(f'{i} / {length} {symbol} {result}')
+
+
+
+def run_symbols_concurrently(func: Callable[[str], Any], symbols: List[str], host: Optional[str] = None, workers: Optional[int] = None, on_result: Callable[[int, int, str, str], None] = print_symbol_result) -> Dict[str, Any]:
+    """
+    DEPENDS ON: run_symbol(), print_symbol_result()
+    IMPORTS: get_config_value()
+    USED BY: upsert_symbols_terminal()
+
+    host is the web site of the table, like 'www.gurufocus.com', it selects the SYMBOL_RATE_LIMITS RateLimiter.
+    on_result(i, length, symbol, result) is called in the calling thread as soon as a symbol finishes, so the results can be out of order.
+    A symbol fails when func raises, the error message becomes its result, a SymbolFailure result is a failure too.
+
+    returns a summary like:
+        {'total': 500, 'succeeded': 497, 'failed': 3, 'failed_symbols': {'XYZ': 'error message'}, 'seconds': 312.5}
+    """
+    start: float = default_timer()
+    workers = workers or int(get_config_value('LIST_UPDATE_WORKERS', 4))
+    length: int = len(symbols)
+    failed_symbols: Dict[str, str] = {}
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        future_dict: Dict[Future, str] = {executor.submit(run_symbol, func, symbol, host): symbol for symbol in symbols}
+        for i, future in enumerate(as_completed(future_dict), start=1):
+            symbol: str = future_dict[future]
+            error: Optional[BaseException] = future.exception()
+            result: str = str(error) if error is not None else str(future.result())
+            if error is not None or is_symbol_failure(future.result()):
+                failed_symbols[symbol] = result
+            on_result(i, length, symbol, result)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    summary: Dict[str, Any] = {
+        'total': length,
+        'succeeded': length - len(failed_symbols),
+        'failed': len(failed_symbols),
+        'failed_symbols': failed_symbols,
+        'seconds': round(default_timer() - start, 1),
+    }
+    return summary
+
+
+
+
+if __name__ == '__main__':
+    print(run_symbols_concurrently(str.lower, ['AMD', 'NVDA', 'MMM'], workers=2))
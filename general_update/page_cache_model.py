@@ -0,0 +1,218 @@
+"""
+
+USED BY: guru_stock_update/guru_revenue_model.py
+
+proxy_guru_revenue() and proxy_guru_revenue_growths() read the same gurufocus revenue-per-share page, they used to download it twice for every symbol.
+The page cache keeps the downloaded text and the parsed soup of a URL, so every model which needs the same page in the same run shares one download and one parse.
+
+When two threads ask for the same URL at the same time, the second thread waits for the download of the first thread instead of downloading it again.
+The cache is bounded by the total text size, the least recently used pages are removed first, and a page expires after a few minutes, so the next list update downloads fresh pages.
+
+Optional keys in /etc/config.json:
+    PAGE_CACHE_MAX_BYTES    (default 64 MB of page text)
+    PAGE_CACHE_SECONDS      (default 600 seconds)
+
+"""
+
+# STANDARD LIBS
+
+from collections import OrderedDict
+import json
+import os
+import re
+from threading import Lock
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# THIRD PARTY LIBS
+from bs4 import BeautifulSoup
+
+
+# PROGRAM MODULES
+from pizzapy.general_update.config_model import get_config_value
+from pizzapy.general_update.http_client_model import get_html_text
+
+
+
+class PageCache:
+    """
+    * INDEPENDENT *
+    USED BY: get_page_cache()
+
+    entry_dict is url => {'text': str, 'soup': Optional[BeautifulSoup], 'soup_lock': Lock, 'time': float}, its order is the order of use, the last one is the most recently used.
+    A soup is parsed on the first get_soup() call and shared afterwards, the callers only read from it.
+    self.lock guards entry_dict and the counters only, no download or parse runs under it.
+    """
+    def __init__(self, max_bytes: int, max_seconds: float) -> None:
+        self.max_bytes: int = max_bytes
+        self.max_seconds: float = max_seconds
+        self.entry_dict: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self.total_bytes: int = 0
+        self.lock: Lock = Lock()
+        self.url_lock_dict: Dict[str, Lock] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def find_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        The caller must hold self.lock, an expired entry is removed.
+        """
+        entry: Optional[Dict[str, Any]] = self.entry_dict.get(url)
+        if entry is not None and time.monotonic() - entry['time'] > self.max_seconds:
+            self.remove_entry(url)
+            entry = None
+        if entry is not None:
+            self.entry_dict.move_to_end(url)
+        return entry
+
+    def remove_entry(self, url: str) -> None:
+        """
+        The caller must hold self.lock.
+        """
+        entry: Dict[str, Any] = self.entry_dict.pop(url)
+        self.total_bytes -= len(entry['text'])
+
+    def add_entry(self, url: str, text: str) -> Dict[str, Any]:
+        """
+        The caller must hold self.lock, the least recently used entries are removed until the new text fits.
+        """
+        if url in self.entry_dict:
+            self.remove_entry(url)
+        entry: Dict[str, Any] = {'text': text, 'soup': None, 'soup_lock': Lock(), 'time': time.monotonic()}
+        self.entry_dict[url] = entry
+        self.total_bytes += len(text)
+        while self.total_bytes > self.max_bytes and len(self.entry_dict) > 1:
+            self.remove_entry(next(iter(self.entry_dict)))
+        return entry
+
+    def get_entry(self, url: str) -> Dict[str, Any]:
+        """
+        The url lock makes the other threads wait for the running download of the same url.
+        The entry is added before the url lock is removed, so a thread which comes after the removal finds the entry and does not download again.
+        """
+        with self.lock:
+            entry: Optional[Dict[str, Any]] = self.find_entry(url)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            url_lock: Lock = self.url_lock_dict.setdefault(url, Lock())
+        with url_lock:
+            try:
+                with self.lock:
+                    entry = self.find_entry(url)
+                    if entry is not None:
+                        self.hits += 1
+                        return entry
+                text: str = get_html_text(url)
+                with self.lock:
+                    self.misses += 1
+                    return self.add_entry(url, text)
+            finally:
+                with self.lock:
+                    if self.url_lock_dict.get(url) is url_lock:
+                        del self.url_lock_dict[url]
+
+    def get_text(self, url: str) -> str:
+        return self.get_entry(url)['text']
+
+    def get_soup(self, url: str) -> BeautifulSoup:
+        """
+        The page is parsed under the lock of its entry, the other urls of the cache are not blocked by a slow parse.
+        """
+        entry: Dict[str, Any] = self.get_entry(url)
+        with entry['soup_lock']:
+            if entry['soup'] is None:
+                entry['soup'] = BeautifulSoup(entry['text'], 'html.parser')
+            return entry['soup']
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entry_dict.clear()
+            self.total_bytes = 0
+
+    def snapshot(self) -> List[Tuple[Dict[str, Any], str]]:
+        """
+        returns the url, size, age and parse status of every page with its text, the most recently used page is the last.
+        """
+        with self.lock:
+            now: float = time.monotonic()
+            return [({'url': url, 'bytes': len(entry['text']), 'seconds': round(now - entry['time'], 1), 'parsed': entry['soup'] is not None}, entry['text']) for url, entry in self.entry_dict.items()]
+
+    def describe(self) -> List[Dict[str, Any]]:
+        return [info for info, _ in self.snapshot()]
+
+
+
+shared_page_cache: Optional[PageCache] = None
+page_cache_lock: Lock = Lock()
+
+
+
+def get_page_cache() -> PageCache:
+    """
+    DEPENDS ON: PageCache
+    IMPORTS: get_config_value()
+    USED BY: get_cached_html_text(), get_cached_html_soup(), dump_page_cache()
+    """
+    global shared_page_cache
+    with page_cache_lock:
+        if shared_page_cache is None:
+            shared_page_cache = PageCache(
+                max_bytes=int(get_config_value('PAGE_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+                max_seconds=float(get_config_value('PAGE_CACHE_SECONDS', 600)),
+            )
+        return shared_page_cache
+
+
+
+def get_cached_html_text(url: str) -> str:
+    """
+    DEPENDS ON: get_page_cache()
+    USED BY: get_guru_revenue_growths()
+    """
+    return get_page_cache().get_text(url)
+
+
+
+def get_cached_html_soup(url: str) -> BeautifulSoup:
+    """
+    DEPENDS ON: get_page_cache()
+    USED BY: get_guru_revenue_per_share()
+
+    The soup is shared with the other callers of the same url, I must not modify it, like soup.decompose() or tag.extract().
+    """
+    return get_page_cache().get_soup(url)
+
+
+
+def dump_page_cache(directory: str) -> str:
+    """
+    DEPENDS ON: get_page_cache()
+    IMPORTS: json, os, re
+
+    For debugging, every cached page is written to an html file in the directory, index.json lists the url of every file.
+    returns the path of index.json.
+    """
+    page_cache: PageCache = get_page_cache()
+    os.makedirs(directory, exist_ok=True)
+    pages: List[Dict[str, Any]] = []
+    for number, (info, text) in enumerate(page_cache.snapshot(), start=1):
+        file_name: str = f"{number:04d}_{re.sub(r'[^A-Za-z0-9]+', '_', info['url'])[-100:]}.html"
+        with open(os.path.join(directory, file_name), 'w', encoding='utf-8') as f:
+            f.write(text)
+        pages.append({**info, 'file': file_name})
+    index: Dict[str, Any] = {'hits': page_cache.hits, 'misses': page_cache.misses, 'pages': pages}
+    index_path: str = os.path.join(directory, 'index.json')
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    return index_path
+
+
+
+
+if __name__ == '__main__':
+    url = 'https://www.gurufocus.com/term/revenue-per-share/NVDA'
+    print(get_cached_html_soup(url).title)
+    print(len(get_cached_html_text(url)))
+    print(get_page_cache().describe())
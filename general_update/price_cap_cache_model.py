@@ -0,0 +1,156 @@
+"""
+
+USED BY: general_update/general_model.py
+
+process_guru() and make_option_proxy() both call make_price_cap_proxy(), so a guru update and an option update of the same list downloaded the same barchart page twice per symbol.
+The price and market cap of a symbol are kept for the current trading day of get_trading_day_utc(), a new trading day makes every snapshot stale.
+
+Optional keys in /etc/config.json:
+    PRICE_CAP_TABLE         (default false) true keeps the snapshots in the price_cap table too, so the CLI, the GUI and the next run of the same day share them.
+                            create the table first in the database menu: create_table('price_cap')
+    PRICE_CAP_MAX_SECONDS   (default no limit) a snapshot older than this is downloaded again even on the same trading day.
+
+"""
+
+# STANDARD LIBS
+
+from datetime import date, datetime
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+
+# THIRD PARTY LIBS
+import psycopg
+
+
+# CUSTOM LIBS
+from batterypy.time.cal import get_trading_day_utc
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.postgres_connection_model import pooled_psycopg_connection
+from pizzapy.general_update.config_model import get_config_flag, get_config_value
+
+
+
+# symbol => (td, t, price, cap), filled by get_price_cap()
+price_cap_dict: Dict[str, Tuple[date, datetime, Optional[float], Optional[float]]] = {}
+price_cap_lock: Lock = Lock()
+symbol_lock_dict: Dict[str, Lock] = {}
+
+
+
+def is_snapshot_valid(td: date, t: datetime, current_td: date) -> bool:
+    """
+    * INDEPENDENT *
+    IMPORTS: get_config_value()
+    USED BY: find_price_cap()
+    """
+    max_seconds: Optional[float] = get_config_value('PRICE_CAP_MAX_SECONDS')
+    is_fresh: bool = max_seconds is None or (datetime.now() - t).total_seconds() <= float(max_seconds)
+    return td == current_td and is_fresh
+
+
+
+def read_price_cap_table(symbol: str, td: date) -> Optional[Tuple[datetime, Optional[float], Optional[float]]]:
+    """
+    * INDEPENDENT *
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: find_price_cap()
+    """
+    with pooled_psycopg_connection() as conn:
+        row = conn.execute('SELECT t, price, cap FROM price_cap WHERE symbol = %s AND td = %s', (symbol, td)).fetchone()
+    return row
+
+
+
+def write_price_cap_table(symbol: str, td: date, t: datetime, price: Optional[float], cap: Optional[float]) -> None:
+    """
+    * INDEPENDENT *
+    IMPORTS: pooled_psycopg_connection()
+    USED BY: get_price_cap()
+    """
+    cmd: str = """
+        INSERT INTO price_cap (t, td, symbol, price, cap) VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT (symbol, td) DO UPDATE SET t = EXCLUDED.t, price = EXCLUDED.price, cap = EXCLUDED.cap
+        """
+    with pooled_psycopg_connection() as conn:
+        conn.execute(cmd, (t, td, symbol, price, cap))
+
+
+
+def find_price_cap(symbol: str, td: date, use_table: bool) -> Optional[Tuple[Optional[float], Optional[float]]]:
+    """
+    DEPENDS ON: price_cap_dict, is_snapshot_valid(), read_price_cap_table()
+    USED BY: get_price_cap()
+
+    The memory is checked first, then the price_cap table, a table row is copied into the memory.
+    A database error makes the table being skipped, the page is downloaded instead.
+    """
+    with price_cap_lock:
+        snapshot = price_cap_dict.get(symbol)
+    if snapshot is not None and is_snapshot_valid(snapshot[0], snapshot[1], td):
+        return snapshot[2], snapshot[3]
+    if not use_table:
+        return None
+    try:
+        row = read_price_cap_table(symbol, td)
+    except psycopg.Error as error:
+        print(f'price_cap table skipped: {error}')
+        return None
+    if row is None or not is_snapshot_valid(td, row[0], td):
+        return None
+    t, price, cap = row
+    with price_cap_lock:
+        price_cap_dict[symbol] = (td, t, price, cap)
+    return price, cap
+
+
+
+def get_price_cap(symbol: str, fetch: Callable[[str], Tuple[Optional[float], Optional[float]]]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    DEPENDS ON: find_price_cap(), write_price_cap_table()
+    IMPORTS: get_trading_day_utc(), get_config_flag()
+    USED BY: make_price_cap_proxy()
+
+    fetch is get_barchart_price_cap(), it is only called when there is no valid snapshot.
+    The symbol lock makes a guru thread and an option thread of the same symbol share one download.
+    A failed download (both None) is not kept, so the next call tries again.
+    """
+    td: date = get_trading_day_utc()
+    use_table: bool = get_config_flag('PRICE_CAP_TABLE', False)
+    with price_cap_lock:
+        symbol_lock: Lock = symbol_lock_dict.setdefault(symbol, Lock())
+    with symbol_lock:
+        found = find_price_cap(symbol, td, use_table)
+        if found is not None:
+            return found
+        price, cap = fetch(symbol)
+        if price is None and cap is None:
+            return price, cap
+        t: datetime = datetime.now().replace(microsecond=0)
+        with price_cap_lock:
+            price_cap_dict[symbol] = (td, t, price, cap)
+        if use_table:
+            try:
+                write_price_cap_table(symbol, td, t, price, cap)
+            except psycopg.Error as error:
+                print(f'price_cap table skipped: {error}')
+    return price, cap
+
+
+
+def clear_price_caps() -> None:
+    """
+    * INDEPENDENT *
+    The memory snapshots are removed, the price_cap table is not changed.
+    """
+    with price_cap_lock:
+        price_cap_dict.clear()
+
+
+
+
+if __name__ == '__main__':
+    print(get_price_cap('NVDA', lambda symbol: (100.0, 1e12)))
+    print(get_price_cap('NVDA', lambda symbol: (0.0, 0.0)))
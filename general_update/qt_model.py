@@ -2,6 +2,9 @@
 
 USED BY: core_browser_controller.py
 
+MySortFilterProxyModel compares the display strings of the cells, DataFrameSortFilterProxyModel compares the typed DataFrame columns with numpy masks,
+see dataframe_filter_model.py, it is used by Core Browser because MySortFilterProxyModel stalls on the 11k rows of All Stocks.
+
 QSortFilterProxyModel API:
     https://doc.qt.io/qtforpython-6/PySide6/QtCore/QSortFilterProxyModel.html
 
@@ -12,17 +15,22 @@ Custom Sort Filter Example:
 """
 # STANDARD LIBS
 import sys;sys.path.append('..')
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, List, Set, Tuple, Union
 
 
 # THIRD PARTY LIBS
-from PySide6.QtCore import (QModelIndex, QRegularExpression ,QSortFilterProxyModel)
+from pandas import DataFrame
+from PySide6.QtCore import (QModelIndex, QRegularExpression ,QSortFilterProxyModel, QTimer)
 
 
 # CUSTOM LIBS
 from batterypy.string.read import is_floatable
 
 
+# PROGRAM MODULES
+from pizzapy.general_update.dataframe_filter_model import DataFrameFilter
+
+
 
 class MySortFilterProxyModel(QSortFilterProxyModel):
     """
@@ -133,6 +141,46 @@ class MySortFilterProxyModel(QSortFilterProxyModel):
 
 
 
+class DataFrameSortFilterProxyModel(QSortFilterProxyModel):
+    """
+    DEPENDS ON: DataFrameFilter
+    USED BY: core_browser_controller.py
+
+    The source model must show df in the same row and column order, like DataFrameModel(df) of dimsumpy.
+    setFilterByColumn() has the same arguments as MySortFilterProxyModel, the CaseInsensitiveOption still marks the floor filter.
+
+    Every key typed in a lineedit calls setFilterByColumn(), the filter is only kept in pending_filter_dict and filter_timer restarts,
+    when the typing stops for debounce_ms, the masks of the changed filters are computed and the rows are filtered ONCE.
+    """
+    def __init__(self, df: DataFrame, debounce_ms: int = 250) -> None:
+        super().__init__()
+        self.data_filter: DataFrameFilter = DataFrameFilter(df)
+        self.pending_filter_dict: Dict[Tuple[int, bool], str] = {}
+        self.filter_timer: QTimer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(debounce_ms)
+        self.filter_timer.timeout.connect(self.apply_pending_filters)
+
+    def setFilterByColumn(self, regex: QRegularExpression, column: int) -> None:
+        is_floor_filter: bool = regex.patternOptions() == QRegularExpression.CaseInsensitiveOption
+        self.pending_filter_dict[(column, is_floor_filter)] = regex.pattern()
+        self.filter_timer.start()
+
+    def apply_pending_filters(self) -> None:
+        for (column, is_floor_filter), text in self.pending_filter_dict.items():
+            self.data_filter.set_filter(column, text, is_floor_filter)
+        self.pending_filter_dict.clear()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return self.data_filter.accepts_row(source_row)
+
+    def lessThan(self, source_left: QModelIndex, source_right: QModelIndex) -> bool:
+        return self.data_filter.less_than(source_left.column(), source_left.row(), source_right.row())
+
+
+
+
 if __name__ == '__main__':
     x = MySortFilterProxyModel()
     print('done')
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+
+USED BY:
+    general_update/http_client_model.py
+    general_update/list_runner_model.py
+
+When many symbols are updated at the same time, gurufocus, zacks and yahoo would see a burst of requests from one address and start to refuse them.
+A RateLimiter spaces the calls to one host, all threads of the process share the same RateLimiter of a host.
+
+One guru symbol downloads 13 pages, a limit per symbol still let 13 requests through at once, so the two limits are separate settings:
+    wait_for_host() is called by the http session of the host before EVERY request, this is the limit the web sites see
+    wait_for_symbol() is called by a list update before every symbol, it only spaces the start of the symbols
+
+Optional keys in /etc/config.json:
+    HOST_RATE_LIMITS    a JSON object of host => HTTP requests per second, like {"www.gurufocus.com": 4, "www.zacks.com": 2}
+                        hosts which are not in the object are not limited.
+    SYMBOL_RATE_LIMITS  a JSON object of host => symbols started per second in a list update, like {"www.gurufocus.com": 0.5}
+                        the host is the one of the table in table_host_dict, hosts which are not in the object are not limited.
+
+"""
+
+# STANDARD LIBS
+
+from threading import Lock
+import time
+from typing import Dict, Optional, Tuple
+
+
+# PROGRAM MODULES
+from pizzapy.general_update.config_model import get_config_value
+
+
+
+class RateLimiter:
+    """
+    * INDEPENDENT *
+    USED BY: get_rate_limiter()
+
+    wait() blocks until at least 1 / calls_per_second seconds have passed since the previous call got its turn.
+    The next turn is reserved inside the lock and the sleep happens outside, so waiting threads do not block each other longer than needed.
+    """
+    def __init__(self, calls_per_second: float) -> None:
+        self.interval: float = 1.0 / calls_per_second
+        self.next_time: float = time.monotonic()
+        self.lock: Lock = Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now: float = time.monotonic()
+            turn: float = max(now, self.next_time)
+            self.next_time = turn + self.interval
+        time.sleep(max(turn - now, 0.0))
+
+
+
+# (config key, host) => RateLimiter, filled by get_rate_limiter()
+rate_limiter_dict: Dict[Tuple[str, str], Optional[RateLimiter]] = {}
+rate_limiter_lock: Lock = Lock()
+
+
+
+def get_rate_limiter(config_key: str, host: str) -> Optional[RateLimiter]:
+    """
+    DEPENDS ON: RateLimiter
+    IMPORTS: get_config_value()
+    USED BY: wait_for_host(), wait_for_symbol()
+
+    config_key is HOST_RATE_LIMITS or SYMBOL_RATE_LIMITS, the two limits of a host are two RateLimiters.
+    returns None when the host has no limit in the config key.
+    """
+    key: Tuple[str, str] = (config_key, host)
+    with rate_limiter_lock:
+        if key not in rate_limiter_dict:
+            calls_per_second: Optional[float] = get_config_value(config_key, {}).get(host)
+            rate_limiter_dict[key] = RateLimiter(float(calls_per_second)) if calls_per_second else None
+        return rate_limiter_dict[key]
+
+
+
+def wait_for_host(host: Optional[str]) -> None:
+    """
+    DEPENDS ON: get_rate_limiter()
+    USED BY: RateLimitedSession.request() in http_client_model.py
+
+    Called before every HTTP request to the host.
+    """
+    limiter: Optional[RateLimiter] = get_rate_limiter('HOST_RATE_LIMITS', host) if host else None
+    if limiter is not None:
+        limiter.wait()
+
+
+
+def wait_for_symbol(host: Optional[str]) -> None:
+    """
+    DEPENDS ON: get_rate_limiter()
+    USED BY: run_symbol()
+
+    Called before every symbol of a list update, the requests of the symbol still wait for wait_for_host().
+    """
+    limiter: Optional[RateLimiter] = get_rate_limiter('SYMBOL_RATE_LIMITS', host) if host else None
+    if limiter is not None:
+        limiter.wait()
+
+
+
+
+if __name__ == '__main__':
+    limiter = RateLimiter(5)
+    start = time.monotonic()
+    for _ in range(10):
+        limiter.wait()
+    print(f'{time.monotonic() - start:.2f} seconds for 10 calls at 5 calls per second')
@@ -0,0 +1,191 @@
+"""
+
+USED BY: general_update/http_client_model.py
+
+Re-running a list update after a crash downloaded every page of the symbols which were already done.
+The response cache keeps the body of every successful GET in a SQLite file, keyed by url and trading day, the bodies are zlib compressed.
+    the same url on the same trading day is served from the file, without any request.
+    on a new trading day, the ETag and Last-Modified of the latest stored response are sent as If-None-Match and If-Modified-Since,
+    a 304 Not Modified response copies the stored body to the new trading day.
+
+Optional key in /etc/config.json:
+    RESPONSE_CACHE_PATH     path of the SQLite file, like "/var/tmp/pizzapy_responses.sqlite", the cache is off when the key is missing.
+
+This module only uses the standard library, the session argument is a requests.Session or any object with the same get() method,
+tests/test_response_cache_model.py uses a fake session with recorded responses.
+
+"""
+
+# STANDARD LIBS
+
+import sqlite3
+from threading import Lock
+import time
+from typing import Any, Dict, Optional, Tuple
+import zlib
+
+
+# PROGRAM MODULES
+from pizzapy.general_update.config_model import get_config_value
+
+
+
+response_create_table_command: str = """
+    CREATE TABLE IF NOT EXISTS response (
+    url  TEXT NOT NULL,
+    td  TEXT NOT NULL,
+    etag  TEXT,
+    last_modified  TEXT,
+    encoding  TEXT,
+    body  BLOB NOT NULL,
+    fetched_at  REAL NOT NULL,
+    PRIMARY KEY (url, td)
+    )
+    """
+
+
+
+class ResponseCache:
+    """
+    * INDEPENDENT *
+    USED BY: get_response_cache(), fetch_cached_text()
+
+    One sqlite3 connection is shared by all threads, the lock serializes the statements.
+    A stored response is a tuple of (etag, last_modified, encoding, body bytes).
+    """
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.lock: Lock = Lock()
+        self.connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute(response_create_table_command)
+
+    def get(self, url: str, td: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[str], bytes]]:
+        with self.lock:
+            row = self.connection.execute('SELECT etag, last_modified, encoding, body FROM response WHERE url = ? AND td = ?', (url, td)).fetchone()
+        return None if row is None else (row[0], row[1], row[2], zlib.decompress(row[3]))
+
+    def get_latest(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[str], bytes]]:
+        """
+        The latest stored response of any trading day, its validators are used for the conditional request.
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT etag, last_modified, encoding, body FROM response WHERE url = ? ORDER BY td DESC LIMIT 1', (url,)).fetchone()
+        return None if row is None else (row[0], row[1], row[2], zlib.decompress(row[3]))
+
+    def put(self, url: str, td: str, etag: Optional[str], last_modified: Optional[str], encoding: Optional[str], body: bytes) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO response (url, td, etag, last_modified, encoding, body, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, td, etag, last_modified, encoding, zlib.compress(body), time.time()),
+            )
+
+    def purge(self, before_td: str) -> int:
+        """
+        removes the responses of the trading days before before_td, returns the number of removed rows.
+        """
+        with self.lock, self.connection:
+            cursor = self.connection.execute('DELETE FROM response WHERE td < ?', (before_td,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+
+def decode_body(body: bytes, encoding: Optional[str]) -> str:
+    """
+    * INDEPENDENT *
+    USED BY: fetch_cached_text()
+    """
+    return body.decode(encoding or 'utf-8', errors='replace')
+
+
+
+def make_conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> Dict[str, str]:
+    """
+    * INDEPENDENT *
+    USED BY: fetch_cached_text()
+    """
+    headers: Dict[str, str] = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+
+def fetch_cached_text(session: Any, url: str, td: str, cache: ResponseCache, **kwargs: Any) -> str:
+    """
+    DEPENDS ON: ResponseCache, decode_body(), make_conditional_headers()
+    USED BY: http_client_model.py
+
+    kwargs are passed to session.get(), like timeout.
+    Only successful responses are stored, the text of a 4xx or 5xx error page is returned without raising, like fetch_response(), and nothing is stored.
+    """
+    stored = cache.get(url, td)
+    if stored is not None:
+        return decode_body(stored[3], stored[2])
+
+    latest = cache.get_latest(url)
+    headers: Dict[str, str] = make_conditional_headers(latest[0], latest[1]) if latest is not None else {}
+    response = session.get(url, headers=headers, **kwargs)
+    if response.status_code == 304 and latest is not None:
+        etag: Optional[str] = response.headers.get('ETag') or latest[0]
+        last_modified: Optional[str] = response.headers.get('Last-Modified') or latest[1]
+        cache.put(url, td, etag, last_modified, latest[2], latest[3])
+        return decode_body(latest[3], latest[2])
+
+    if response.status_code >= 400:
+        return response.text
+    encoding: Optional[str] = response.encoding or getattr(response, 'apparent_encoding', None)
+    cache.put(url, td, response.headers.get('ETag'), response.headers.get('Last-Modified'), encoding, response.content)
+    return response.text
+
+
+
+shared_response_cache: Optional[ResponseCache] = None
+response_cache_lock: Lock = Lock()
+
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    DEPENDS ON: ResponseCache
+    IMPORTS: get_config_value()
+    USED BY: http_client_model.py
+
+    returns None when RESPONSE_CACHE_PATH is not in /etc/config.json.
+    """
+    global shared_response_cache
+    path: Optional[str] = get_config_value('RESPONSE_CACHE_PATH')
+    if not path:
+        return None
+    with response_cache_lock:
+        if shared_response_cache is None:
+            shared_response_cache = ResponseCache(path)
+        return shared_response_cache
+
+
+
+def close_response_cache() -> None:
+    """
+    * INDEPENDENT *
+    USED BY: close_http_sessions()
+    """
+    global shared_response_cache
+    with response_cache_lock:
+        if shared_response_cache is not None:
+            shared_response_cache.close()
+        shared_response_cache = None
+
+
+
+
+if __name__ == '__main__':
+    cache = ResponseCache(':memory:')
+    cache.put('https://example.com', '2023-09-22', '"abc"', None, 'utf-8', b'<html></html>')
+    print(cache.get('https://example.com', '2023-09-22'))
@@ -17,6 +17,12 @@ from PySide6.QtGui import QCloseEvent
 from dimsumpy.qt.functions import closeEvent
 
 # PROGRAM MODULES
+from pizzapy.database_update.postgres_connection_model import close_database_resources
+
+from pizzapy.general_update.executor_model import shutdown_executors
+
+from pizzapy.general_update.http_client_model import close_http_sessions
+
 from pizzapy.gui_dock.main_dock_view import MainDockView
 
 from pizzapy.core_stock_update.core_update_controller import CoreUpdateController
@@ -63,6 +69,9 @@ class MainDockController(MainDockView):
 
 def main() -> None:
     app: QApplication = QApplication(sys.argv)
+    app.aboutToQuit.connect(shutdown_executors)  # the shared worker executors, http sessions and database connections are closed when the last window is closed
+    app.aboutToQuit.connect(close_http_sessions)
+    app.aboutToQuit.connect(close_database_resources)
     win: MainDockController = MainDockController()
     win.show()
     sys.exit(app.exec())
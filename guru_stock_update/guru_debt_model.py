@@ -15,9 +15,9 @@ import requests
 # CUSTOM LIBRARIES
 from batterypy.string.read import readf
 
-from dimsumpy.web.crawler import get_html_dataframes
 
 # PROGRAM MODULES
+from pizzapy.general_update.http_client_model import get_html_dataframes
 from pizzapy.general_update.general_model import make_price_cap_proxy
 
 
@@ -1,10 +1,9 @@
 # STANDARD LIBS
 
 
-from typing import Any, List, Optional, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from timeit import default_timer
-from multiprocessing.managers import DictProxy, SyncManager
-from multiprocessing import Manager, Process
 from datetime import datetime
 
 
@@ -15,7 +14,9 @@ from batterypy.time.cal import get_trading_day_utc
 
 
 # PROGRAM MODULES
-from pizzapy.general_update.general_model import initialize_proxy, make_price_cap_proxy
+from pizzapy.general_update.config_model import get_config_value
+from pizzapy.general_update.executor_model import get_executor
+from pizzapy.general_update.general_model import initialize_dict, make_price_cap_proxy
 from pizzapy.guru_stock_update.guru_book_value_model import proxy_guru_book_value   # dataframes
 from pizzapy.guru_stock_update.guru_debt_model import proxy_guru_debt   # dataframes
 from pizzapy.guru_stock_update.guru_earn_model import proxy_guru_earn
@@ -32,72 +33,105 @@ from pizzapy.guru_stock_update.guru_zscore_model import proxy_guru_zscore
 
 
 
-def process_guru(SYMBOL: str) -> DictProxy:
+# every function fills a few guru_stock columns of the proxy from one or two gurufocus pages
+guru_proxy_function_list: List[Callable[[str, Dict[str, Any]], Any]] = [
+    proxy_guru_book_value,
+    proxy_guru_debt,
+    proxy_guru_earn,
+    proxy_guru_equity,
+    proxy_guru_interest,
+    proxy_guru_net_capital,
+    proxy_guru_net_margin,
+    proxy_guru_lynch,
+    proxy_guru_research,
+    proxy_guru_revenue,
+    proxy_guru_revenue_growths,
+    proxy_guru_strength,
+    proxy_guru_zscore,
+]
+
+
+
+def run_guru_proxy_function(proxy_function: Callable[[str, Dict[str, Any]], Any], SYMBOL: str, base: Dict[str, Any], start_dict: Dict[str, float]) -> Dict[str, Any]:
     """
-    IMPORTS: initialize_proxy(), make_price_cap_proxy(), proxy_guru_book_value() TO proxy_guru_zscore()
+    * INDEPENDENT *
+    USED BY: process_guru()
+
+    Each thread fills its own copy of the base dict, so no two threads write the same dict.
+    The start time is written to start_dict when a worker picks the task up, the time queued behind other symbols is not part of its timeout.
+    """
+    start_dict[proxy_function.__name__] = default_timer()
+    proxy: Dict[str, Any] = dict(base)
+    proxy_function(SYMBOL, proxy)
+    return proxy
+
+
+
+def wait_guru_futures(future_dict: Dict[Future, str], start_dict: Dict[str, float], timeout: float) -> List[str]:
+    """
+    * INDEPENDENT *
+    USED BY: process_guru()
+
+    Waits until every future is done, or until a started function has run for timeout seconds.
+    returns the names of the functions which ran out of time, an empty list when all futures are done.
     """
-    proxy: DictProxy = initialize_proxy(SYMBOL)
+    pending: Set[Future] = set(future_dict)
+    while pending:
+        now: float = default_timer()
+        expired: List[str] = [future_dict[future] for future in pending if future_dict[future] in start_dict and now - start_dict[future_dict[future]] >= timeout]
+        if expired:
+            return expired
+        started_left: List[float] = [timeout - (now - start_dict[future_dict[future]]) for future in pending if future_dict[future] in start_dict]
+        _, pending = wait(pending, timeout=min(started_left + [1.0]), return_when=FIRST_COMPLETED)
+    return []
+
+
+
+def process_guru(SYMBOL: str) -> Dict[str, Any]:
+    """
+    DEPENDS ON: guru_proxy_function_list, run_guru_proxy_function(), wait_guru_futures()
+    IMPORTS: initialize_dict(), make_price_cap_proxy(), get_executor(), get_config_value()
+
+    It used to start a Manager process and 13 Processes per symbol only to wait for 13 web pages, now the 13 functions run in the shared 'guru' thread executor.
+    The price and cap are fetched first, because most guru functions divide by them.
+
+    Optional keys in /etc/config.json:
+        GURU_EXECUTOR_WORKERS   (default LIST_UPDATE_WORKERS x 13, the number of pages fetched at the same time across all symbols)
+        GURU_FETCH_TIMEOUT      (default 60 seconds for one page, counted from the start of the page, not from the submit)
+
+    The symbols of a list update share the executor, with 4 symbols at once 52 pages are queued,
+    so the default size gives every symbol its 13 workers and the timeout does not include the time queued behind other symbols.
+
+    Like the 13 Processes, a function that raises or does not finish in time only leaves its columns out of the proxy, the missed pages are printed.
+    The queued functions of a symbol with a timed out page are cancelled.
+    upsert_guru() fails the symbol only when the wealth_pc inputs are missing.
+    The results are merged in the order of guru_proxy_function_list, so every proxy has the same key order.
+    """
+    proxy: Dict[str, Any] = initialize_dict(SYMBOL)
     make_price_cap_proxy(SYMBOL, proxy)
-    p1 = Process(target=proxy_guru_book_value, args=(SYMBOL, proxy))
-    p2 = Process(target=proxy_guru_debt, args=(SYMBOL, proxy))
-    p3 = Process(target=proxy_guru_earn, args=(SYMBOL, proxy))
-    p4 = Process(target=proxy_guru_equity, args=(SYMBOL, proxy))
-    p5 = Process(target=proxy_guru_interest, args=(SYMBOL, proxy))
-    p6 = Process(target=proxy_guru_net_capital, args=(SYMBOL, proxy))
-    p7 = Process(target=proxy_guru_net_margin, args=(SYMBOL, proxy))
-    p8 = Process(target=proxy_guru_lynch, args=(SYMBOL, proxy))
-    p9 = Process(target=proxy_guru_research, args=(SYMBOL, proxy))
-    p10 = Process(target=proxy_guru_revenue, args=(SYMBOL, proxy))
-    p11 = Process(target=proxy_guru_revenue_growths, args=(SYMBOL, proxy))
-    p12 = Process(target=proxy_guru_strength, args=(SYMBOL, proxy))
-    p13 = Process(target=proxy_guru_zscore, args=(SYMBOL, proxy))
-
-    p1.start()
-    p2.start()
-    p3.start()
-    p4.start()
-    p5.start()
-    p6.start()
-    p7.start()
-    p8.start()
-    p9.start()
-    p10.start()
-    p11.start()
-    p12.start()
-    p13.start()
-
-    p1.join()
-    p2.join()
-    p3.join()
-    p4.join()
-    p5.join()
-    p6.join()
-    p7.join()
-    p8.join()
-    p9.join()
-    p10.join()
-    p11.join()
-    p12.join()
-    p13.join()
-    
-    p1.close()
-    p2.close()
-    p3.close()
-    p4.close()
-    p5.close()
-    p6.close()
-    p7.close()
-    p8.close()
-    p9.close()
-    p10.close()
-    p11.close()
-    p12.close()
-    p13.close()
+    max_workers: int = int(get_config_value('LIST_UPDATE_WORKERS', 4)) * len(guru_proxy_function_list)
+    executor = get_executor('guru', kind='thread', max_workers=max_workers)
+    start_dict: Dict[str, float] = {}
+    future_dict: Dict[Future, str] = {executor.submit(run_guru_proxy_function, proxy_function, SYMBOL, proxy, start_dict): proxy_function.__name__ for proxy_function in guru_proxy_function_list}
+    expired: List[str] = wait_guru_futures(future_dict, start_dict, float(get_config_value('GURU_FETCH_TIMEOUT', 60)))
+    missed: Dict[str, str] = {}
+    for future, name in future_dict.items():
+        if not future.done():
+            future.cancel()
+            missed[name] = 'TIMEOUT' if name in expired else 'CANCELLED'
+        elif future.cancelled():
+            missed[name] = 'CANCELLED'
+        elif future.exception() is not None:
+            missed[name] = str(future.exception())
+        else:
+            proxy.update(future.result())
+    if missed:
+        print(f'{SYMBOL} guru pages missed: {missed}')
     return proxy
 
 
 
-def get_guru_wealth_pc(proxy: DictProxy) -> Optional[float]:
+def get_guru_wealth_pc(proxy: Dict[str, Any]) -> Optional[float]:
     """
     wealth_pc is the sum of NET CAPITAL + TANGIBLE BOOK VALUE + NEXT 5 YEARS EARNINGS, in percentage of market capitalization.
     """
@@ -108,11 +142,11 @@ def get_guru_wealth_pc(proxy: DictProxy) -> Optional[float]:
     return wealth_pc
 
 
-def make_guru_proxy(symbol: str) -> DictProxy:
+def make_guru_proxy(symbol: str) -> Dict[str, Any]:
     """
     DEPENDS: process_guru(), get_guru_wealth_pc()
     """
-    proxy: DictProxy = process_guru(symbol)
+    proxy: Dict[str, Any] = process_guru(symbol)
     wealth_pc: Optional[float] = get_guru_wealth_pc(proxy)
     proxy['wealth_pc'] = wealth_pc
     return proxy
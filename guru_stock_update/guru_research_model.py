@@ -22,10 +22,10 @@ import requests
 
 # CUSTOM LIBRARIES
 from batterypy.string.read import readf
-from dimsumpy.web.crawler import get_html_soup
 
 
 # PROGRAM MODULES
+from pizzapy.general_update.http_client_model import get_html_soup
 from pizzapy.general_update.general_model import make_price_cap_proxy
 
 
@@ -25,9 +25,9 @@ import requests
 
 # CUSTOM LIBRARIES
 from batterypy.string.read import readf
-from dimsumpy.web.crawler import get_html_soup, get_html_text
 
 # PROGRAM MODULES
+from pizzapy.general_update.page_cache_model import get_cached_html_soup, get_cached_html_text
 from pizzapy.general_update.general_model import make_price_cap_proxy
 
 
@@ -36,9 +36,11 @@ def get_guru_revenue_per_share(symbol: str) -> Optional[float]:
     returns Revenue Per Share
 
     https://www.gurufocus.com/term/revenue-per-share/NVDA
+
+    get_guru_revenue_growths() reads the same page, the page cache downloads and parses it only once.
     """
     revenue_url: str = f'https://www.gurufocus.com/term/revenue-per-share/{symbol}'
-    revenue_soup: BeautifulSoup = get_html_soup(revenue_url)
+    revenue_soup: BeautifulSoup = get_cached_html_soup(revenue_url)
     soup_items: ResultSet = revenue_soup.find_all('meta', attrs={'name': 'description'})
     content: str = '' if not soup_items else soup_items[0].get('content')
     strlist: List[str] = content.split()
@@ -67,7 +69,7 @@ def get_guru_revenue_growths(symbol: str) -> Tuple[Optional[float], Optional[flo
     returns Revenue Growths in years
     """
     revenue_url: str = f'https://www.gurufocus.com/term/revenue-per-share/{symbol}'
-    html_text: str = get_html_text(revenue_url)
+    html_text: str = get_cached_html_text(revenue_url)
     # the + sign matches multiple occurrence of the same character, such as <<, >>, %%%, commonly use when there are spaces.
     # strlist is the result of spliting a whole page of html text.
     strlist: List[str] = re.split('[<>%]+', html_text)
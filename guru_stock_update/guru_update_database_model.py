@@ -13,7 +13,7 @@ USED BY:
 from multiprocessing import Pool
 from multiprocessing.managers import DictProxy
 from timeit import default_timer
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 # THIRD PARTY LIBS
@@ -24,17 +24,19 @@ from dimsumpy.database.postgres import upsert_psycopg, execute_psycopg
 
 # PROGRAM MODULES
 from pizzapy.guru_stock_update.guru_proxy_model import make_guru_proxy
+from pizzapy.database_update.postgres_buffer_model import UpsertBuffer
+from pizzapy.general_update.list_runner_model import SymbolFailure
 from pizzapy.database_update.postgres_command_model import table_list_dict
-from pizzapy.database_update.postgres_connection_model import make_psycopg_connection
+from pizzapy.database_update.postgres_connection_model import pooled_psycopg_connection
 
 
 
 
 
-def upsert_guru_by_proxy(proxy: DictProxy) -> str:
+def upsert_guru_by_proxy(proxy: DictProxy, buffer: Optional[UpsertBuffer] = None) -> str:
     """
     * INDEPENDENT *
-    IMPORTS: dimsumpy(upsert_psycopg), table_list_dict, make_psycopg_connection()
+    IMPORTS: dimsumpy(upsert_psycopg), table_list_dict, pooled_psycopg_connection(), UpsertBuffer
     USED BY: upsert_guru()
     
     This function already commits the upsert action. 
@@ -44,30 +46,37 @@ def upsert_guru_by_proxy(proxy: DictProxy) -> str:
     Make sure the DictProxy parameter is valid before running this upsert function.
 
     upsert_psycopg returns the query_and_values string as a result.
+
+    When a buffer is given, the proxy is added to the buffer and written in the next batch flush instead of its own upsert.
     """
+    if buffer is not None:
+        return buffer.add(proxy)
     table_name: str = 'guru_stock'
     pk_list: List[str] = table_list_dict[table_name].get('primary_key_list')
-    query_result: str = upsert_psycopg(dict=proxy, table=table_name, primary_key_list=pk_list, connection=make_psycopg_connection())
+    with pooled_psycopg_connection() as conn:
+        query_result: str = upsert_psycopg(dict=proxy, table=table_name, primary_key_list=pk_list, connection=conn)
     return query_result
 
 
 
-def upsert_guru(symbol: str) -> str:
+def upsert_guru(symbol: str, buffer: Optional[UpsertBuffer] = None) -> str:
     """
     DEPENDS ON: upsert_guru_by_proxy
-    IMPORTS: make_guru_proxy()
+    IMPORTS: make_guru_proxy(), SymbolFailure
     USED BY: upsert_gurus_by_terminal(), core_stock_update/core_update_controller.py
     I could wrap this function into try_str(upsert, symbol).
+    An invalid proxy returns a SymbolFailure, so a list update counts the symbol as failed.
+    A guru page which fails or times out only misses its columns, the symbol fails when the missing columns are the inputs of wealth_pc.
     """
     SYMBOL: str = symbol.upper()
-    proxy: DictProxy = make_guru_proxy(SYMBOL)
+    proxy: Dict[str, Any] = make_guru_proxy(SYMBOL)
     valid_data: bool = proxy.get('wealth_pc') is not None
 
     if valid_data:
-        upsert_result: str = upsert_guru_by_proxy(proxy)
+        upsert_result: str = upsert_guru_by_proxy(proxy, buffer=buffer)
         return f'{SYMBOL} {proxy} {upsert_result}'
     else:
-        return f'{symbol} {proxy} DictProxy missed wealth_pc'
+        return SymbolFailure(f'{symbol} {proxy} proxy missed wealth_pc')
 
 
 
@@ -18,7 +18,7 @@ Run the program:
 
 3. Generate new S&P 500 and Nasdaq 100 components:
 
-    (venv) $ python3 generate_file_model.py
+    (venv) $ python3 -m pizzapy.database_update.generate_file_model
     
 """
 
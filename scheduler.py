@@ -0,0 +1,365 @@
+"""
+Run the daily list updates after the US market close, as a long-running service:
+
+    (venv) $ python3 -m pizzapy.scheduler
+    (venv) $ python3 -m pizzapy.scheduler --run-now stock_option
+    (venv) $ python3 -m pizzapy.scheduler stats
+
+A job runs once per trading day, after its time of day in New York, so a restart in the evening still runs the jobs which have not run yet.
+Weekends and market holidays are skipped by the trading-day helpers of batterypy.
+A job which is still running is never started again, a slow job is only skipped, it does not delay the other jobs.
+
+After every run, the duration and throughput of every job are written to the stats file, a warning is printed when a run uses more than
+SCHEDULER_WARN_FRACTION of the time until the same window on the next day.
+The stats file keeps the last_day and the run history of every job, they are loaded at startup before the first check of the due jobs,
+so a restart neither runs a job of the day again nor wipes the history.
+
+Optional keys in /etc/config.json:
+    SCHEDULER_JOBS              a JSON list which replaces default_job_list, like [{"name": "guru", "table": "guru_stock", "list": "sp500", "at": "20:00"}]
+                                "workers" and "force" are optional, "list" is a key of list_slug_dict in stock_list_model.py.
+    SCHEDULER_TIMEZONE          (default "America/New_York") the timezone of the "at" times
+    SCHEDULER_STATS_PATH        (default "/tmp/pizzapy_scheduler_stats.json")
+    SCHEDULER_WARN_FRACTION     (default 0.5)
+
+"""
+
+# STANDARD LIBS
+
+import argparse
+from collections import deque
+from datetime import date, datetime, time as day_time
+import json
+import os
+import sys
+from threading import Lock, Thread
+import time
+from typing import Any, Deque, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+
+# THIRD PARTY LIBS
+import schedule
+
+
+# CUSTOM LIBS
+from batterypy.time.cal import add_trading_days
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.general_terminal_model import upsert_symbols_terminal
+from pizzapy.database_update.postgres_connection_model import close_database_resources
+from pizzapy.database_update.stock_list_model import list_slug_dict
+from pizzapy.general_update.config_model import get_config_value
+from pizzapy.general_update.executor_model import shutdown_executors
+from pizzapy.general_update.http_client_model import close_http_sessions
+
+
+
+# the US market closes at 16:00 New York time, options first, technical_one after the prices it is calculated from
+default_job_list: List[Dict[str, Any]] = [
+    {'name': 'stock_option', 'table': 'stock_option', 'list': 'sp_nasdaq', 'at': '16:30'},
+    {'name': 'stock_price', 'table': 'stock_price', 'list': 'sp_nasdaq', 'at': '17:00'},
+    {'name': 'technical_one', 'table': 'technical_one', 'list': 'sp_nasdaq', 'at': '18:00'},
+    {'name': 'zacks_stock', 'table': 'zacks_stock', 'list': 'sp_nasdaq', 'at': '19:00'},
+]
+
+
+
+def is_trading_day(d: date) -> bool:
+    """
+    * INDEPENDENT *
+    IMPORTS: add_trading_days()
+    USED BY: ScheduledJob.is_due()
+
+    add_trading_days() only lands on trading days, so a date is a trading day when one trading day back and forth returns to it.
+    """
+    return add_trading_days(add_trading_days(d, -1), 1) == d
+
+
+
+class ScheduledJob:
+    """
+    DEPENDS ON: is_trading_day()
+    USED BY: make_scheduled_jobs(), start_due_jobs()
+
+    last_day is the New York date of the latest started run, it makes the job run once per trading day.
+    The lock is held for the whole run, a second run of the same job is skipped when the lock is taken.
+    history keeps the stats of the latest 30 runs.
+    last_day and history are written to the stats file by get_stats() and loaded back by load_stats() after a restart.
+    """
+    def __init__(self, name: str, table: str, list_slug: str, at: str, workers: Optional[int] = None, force: bool = False) -> None:
+        self.name: str = name
+        self.table: str = table
+        self.list_slug: str = list_slug
+        self.at: day_time = day_time.fromisoformat(at)
+        self.workers: Optional[int] = workers
+        self.force: bool = force
+        self.lock: Lock = Lock()
+        self.last_day: Optional[date] = None
+        self.started: Optional[datetime] = None
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=30)
+
+    def load_stats(self, stats: Dict[str, Any]) -> None:
+        """
+        stats is the dict of this job in the stats file, a file written before last_day was kept only has the latest run.
+        """
+        last_day: Optional[str] = stats.get('last_day') or (stats.get('latest') or {}).get('started', '')[:10] or None
+        self.last_day = date.fromisoformat(last_day) if last_day else None
+        self.history = deque(stats.get('history') or ([stats['latest']] if stats.get('latest') else []), maxlen=30)
+
+    def is_due(self, now: datetime) -> bool:
+        return now.time() >= self.at and self.last_day != now.date() and is_trading_day(now.date())
+
+    def run(self, now: datetime) -> None:
+        """
+        IMPORTS: upsert_symbols_terminal(), list_slug_dict
+        A failed run is recorded with its error, the job runs again on the next trading day.
+        """
+        if not self.lock.acquire(blocking=False):
+            print(f'{now:%Y-%m-%d %H:%M} {self.name} is still running since {self.started:%Y-%m-%d %H:%M}, skipped.')
+            return
+        try:
+            self.last_day = now.date()
+            self.started = now
+            start: float = time.monotonic()
+            print(f'{now:%Y-%m-%d %H:%M} {self.name} started: {self.table} {self.list_slug}')
+            try:
+                summary: Dict[str, Any] = upsert_symbols_terminal(self.table, list_slug_dict[self.list_slug], workers=self.workers, list_name=self.list_slug, force=self.force)
+                error: Optional[str] = None
+            except Exception as e:
+                summary = {'total': 0, 'succeeded': 0, 'failed': 0, 'job_id': None}
+                error = f'{type(e).__name__}: {e}'
+            seconds: float = round(time.monotonic() - start, 1)
+            self.history.append({
+                'started': now.isoformat(timespec='minutes'),
+                'seconds': seconds,
+                'total': summary['total'],
+                'succeeded': summary['succeeded'],
+                'failed': summary['failed'],
+                'symbols_per_minute': round(summary['total'] / seconds * 60, 1) if seconds else None,
+                'job_id': summary.get('job_id'),
+                'error': error,
+            })
+        finally:
+            self.started = None
+            self.lock.release()
+
+    def seconds_to_next_window(self, day: date) -> float:
+        """
+        The time from the window of day to the window of the next trading day, a Friday window has the whole weekend.
+        """
+        next_day: date = add_trading_days(day, 1)
+        return (datetime.combine(next_day, self.at) - datetime.combine(day, self.at)).total_seconds()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        window_fraction is the part of the time until the next window which the latest run used, it creeps toward 1 when the job gets slower.
+        """
+        runs: List[Dict[str, Any]] = list(self.history)
+        stats: Dict[str, Any] = {'name': self.name, 'table': self.table, 'list': self.list_slug, 'at': self.at.isoformat(timespec='minutes'), 'running_since': self.started.isoformat(timespec='minutes') if self.started else None, 'runs': len(runs)}
+        stats['last_day'] = self.last_day.isoformat() if self.last_day else None
+        if runs:
+            latest: Dict[str, Any] = runs[-1]
+            stats.update({
+                'latest': latest,
+                'average_seconds': round(sum(run['seconds'] for run in runs) / len(runs), 1),
+                'max_seconds': max(run['seconds'] for run in runs),
+                'window_fraction': round(latest['seconds'] / self.seconds_to_next_window(date.fromisoformat(latest['started'][:10])), 3),
+            })
+        stats['history'] = runs
+        return stats
+
+
+
+def make_scheduled_jobs() -> List[ScheduledJob]:
+    """
+    DEPENDS ON: ScheduledJob, default_job_list
+    IMPORTS: get_config_value()
+    USED BY: main()
+    """
+    job_list: List[Dict[str, Any]] = get_config_value('SCHEDULER_JOBS', default_job_list)
+    return [ScheduledJob(job['name'], job['table'], job['list'], job['at'], job.get('workers'), job.get('force', False)) for job in job_list]
+
+
+
+def get_scheduler_now() -> datetime:
+    """
+    * INDEPENDENT *
+    IMPORTS: get_config_value(), ZoneInfo
+    USED BY: start_due_jobs(), run_job_now()
+
+    returns a naive datetime of the scheduler timezone, so it can be compared with the "at" times directly.
+    """
+    return datetime.now(ZoneInfo(get_config_value('SCHEDULER_TIMEZONE', 'America/New_York'))).replace(tzinfo=None, second=0, microsecond=0)
+
+
+
+def get_stats_path() -> str:
+    """
+    * INDEPENDENT *
+    IMPORTS: get_config_value()
+    USED BY: read_stats(), write_stats(), print_stats()
+    """
+    return get_config_value('SCHEDULER_STATS_PATH', '/tmp/pizzapy_scheduler_stats.json')
+
+
+
+def read_stats() -> List[Dict[str, Any]]:
+    """
+    DEPENDS ON: get_stats_path()
+    USED BY: load_stats()
+
+    A missing or broken stats file is an empty list, the scheduler starts without history like the first time.
+    """
+    try:
+        with open(get_stats_path()) as f:
+            stats_list: Any = json.load(f)
+    except (OSError, ValueError) as error:
+        print(f'scheduler stats not loaded: {error}')
+        return []
+    return stats_list if isinstance(stats_list, list) else []
+
+
+
+def load_stats(jobs: List[ScheduledJob]) -> None:
+    """
+    DEPENDS ON: read_stats(), ScheduledJob.load_stats()
+    USED BY: main()
+
+    The stats are matched by the job name, a job which is new in SCHEDULER_JOBS starts without history.
+    """
+    stats_dict: Dict[str, Dict[str, Any]] = {stats.get('name'): stats for stats in read_stats() if isinstance(stats, dict)}
+    for job in jobs:
+        if job.name in stats_dict:
+            job.load_stats(stats_dict[job.name])
+
+
+
+stats_lock: Lock = Lock()
+
+
+
+def write_stats(jobs: List[ScheduledJob]) -> None:
+    """
+    DEPENDS ON: get_stats_path()
+    IMPORTS: get_config_value()
+    USED BY: run_job_thread()
+
+    A run using more than SCHEDULER_WARN_FRACTION of the time until its next window is printed as a warning.
+    The file is written to a temporary file and renamed, so a crash while writing never leaves a broken file for the next start to load,
+    stats_lock keeps two finishing jobs from writing at the same time.
+    """
+    stats_list: List[Dict[str, Any]] = [job.get_stats() for job in jobs]
+    path: str = get_stats_path()
+    with stats_lock:
+        with open(f'{path}.tmp', 'w') as f:
+            json.dump(stats_list, f, indent=2)
+        os.replace(f'{path}.tmp', path)
+    warn_fraction: float = float(get_config_value('SCHEDULER_WARN_FRACTION', 0.5))
+    for stats in stats_list:
+        if stats.get('window_fraction', 0) > warn_fraction:
+            print(f"WARNING {stats['name']} took {stats['latest']['seconds']} seconds, {stats['window_fraction']:.0%} of the time until its next window.")
+
+
+
+def run_job_thread(job: ScheduledJob, jobs: List[ScheduledJob], now: datetime) -> None:
+    """
+    DEPENDS ON: ScheduledJob.run(), write_stats()
+    USED BY: start_due_jobs(), run_job_now()
+    """
+    job.run(now)
+    latest: Dict[str, Any] = job.history[-1] if job.history else {}
+    print(f"{get_scheduler_now():%Y-%m-%d %H:%M} {job.name} finished: {latest.get('succeeded')} / {latest.get('total')} in {latest.get('seconds')} seconds {latest.get('error') or ''}")
+    write_stats(jobs)
+
+
+
+def start_due_jobs(jobs: List[ScheduledJob]) -> None:
+    """
+    DEPENDS ON: run_job_thread(), get_scheduler_now()
+    USED BY: run_scheduler()
+
+    Every due job runs in its own thread, so a long job does not hold up the check of the other jobs.
+    last_day is set before the thread starts, so the next check cannot start the same job again before the thread takes the lock.
+    """
+    now: datetime = get_scheduler_now()
+    for job in jobs:
+        if job.is_due(now) and not job.lock.locked():
+            job.last_day = now.date()
+            Thread(target=run_job_thread, args=(job, jobs, now), name=f'scheduler-{job.name}', daemon=True).start()
+
+
+
+def run_scheduler(jobs: List[ScheduledJob], check_seconds: int = 30) -> None:
+    """
+    DEPENDS ON: start_due_jobs()
+    IMPORTS: schedule
+    USED BY: main()
+    """
+    schedule.every(check_seconds).seconds.do(start_due_jobs, jobs)
+    for job in jobs:
+        print(f'{job.name}: {job.table} {job.list_slug} at {job.at:%H:%M} on trading days')
+    start_due_jobs(jobs)
+    while True:
+        schedule.run_pending()
+        time.sleep(1)
+
+
+
+def run_job_now(jobs: List[ScheduledJob], name: str) -> None:
+    """
+    DEPENDS ON: run_job_thread(), get_scheduler_now()
+    USED BY: main()
+
+    For testing a job, it runs in the foreground on any day, the stats are written the same way.
+    """
+    job_dict: Dict[str, ScheduledJob] = {job.name: job for job in jobs}
+    if name not in job_dict:
+        print(f'INVALID JOB {name}, the jobs are {list(job_dict)}')
+        return
+    run_job_thread(job_dict[name], jobs, get_scheduler_now())
+
+
+
+def print_stats() -> None:
+    """
+    DEPENDS ON: get_stats_path()
+    USED BY: main()
+    """
+    with open(get_stats_path()) as f:
+        print(f.read())
+
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    DEPENDS ON: make_scheduled_jobs(), load_stats(), run_scheduler(), run_job_now(), print_stats()
+    IMPORTS: shutdown_executors(), close_http_sessions(), close_database_resources()
+
+    The stats of the previous process are loaded before the first check, a job which already ran today is not due again.
+    """
+    parser = argparse.ArgumentParser(prog='python3 -m pizzapy.scheduler', description='Run the daily pizzapy list updates after the US market close.')
+    parser.add_argument('command', nargs='?', choices=['run', 'stats'], default='run')
+    parser.add_argument('--run-now', metavar='JOB', help='run one job now in the foreground and exit')
+    args: argparse.Namespace = parser.parse_args(argv)
+    if args.command == 'stats':
+        print_stats()
+        return
+    jobs: List[ScheduledJob] = make_scheduled_jobs()
+    load_stats(jobs)
+    try:
+        if args.run_now:
+            run_job_now(jobs, args.run_now)
+        else:
+            run_scheduler(jobs)
+    except KeyboardInterrupt:
+        print('scheduler stopped')
+    finally:
+        shutdown_executors()
+        close_http_sessions()
+        close_database_resources()
+
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
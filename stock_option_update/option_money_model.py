@@ -9,8 +9,6 @@ USED BY: option_proxy_model.py
 # STANDARD LIBS
 from itertools import dropwhile
 
-from multiprocessing import Pool
-
 from multiprocessing.managers import DictProxy
 
 import os
@@ -29,11 +27,12 @@ from bs4 import BeautifulSoup
 # CUSTOM LIBS
 from batterypy.string.read import float0
 
-from dimsumpy.web.crawler import get_html_dataframes, get_html_text, get_selenium_text
+from dimsumpy.web.crawler import get_selenium_text
 
 
 # PROGRAM MODULES
-
+from pizzapy.general_update.http_client_model import get_html_dataframes, get_html_text
+from pizzapy.general_update.executor_model import get_executor
 
 
 
@@ -162,10 +161,10 @@ def prepare_urls(symbol: str) -> List[str]:
 def get_total_premiums(price: Optional[float], symbol: str) -> Tuple[float, float, float, float, float, float, float, float]:
     """
         DEPENDS ON: calculate_page_premiums(), prepare_urls()
-        IMPORTS: multiprocessing(Pool), os
+        IMPORTS: get_executor()
         USED BY: proxy_option_money()
         
-        This function runs in PARALLEL
+        This function runs in PARALLEL, the 'option' executor is a process executor (8 workers at most) shared by all symbols.
 
         You don't need to use dill explicitly in your code, just importing it before using the pool.map method will make it the default serializer for the multiprocessing module. This will allow you to use lambda functions or other objects that are not serializable by pickle. You can learn more about how dill works from [this web page]. blush
     """
@@ -173,9 +172,8 @@ def get_total_premiums(price: Optional[float], symbol: str) -> Tuple[float, floa
     urls: List[str] = prepare_urls(symbol)
     expiry_urls = [[url, price] for url in urls]
 
-    cpu_count: int = min(os.cpu_count(), 8)                  
-    with Pool(processes=cpu_count) as pool:
-        result = pool.map(calculate_page_premiums, expiry_urls)
+    executor = get_executor('option', kind='process', max_workers=min(os.cpu_count(), 8))
+    result = list(executor.map(calculate_page_premiums, expiry_urls))
     
     call_money = sum(call_premium for call_premium, _, _, _,            _, _, _, _ in result)
     put_money = sum(put_premium for _, put_premium, _, _,               _, _, _, _ in result) 
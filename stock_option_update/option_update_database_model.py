@@ -25,17 +25,19 @@ from dimsumpy.database.postgres import upsert_psycopg
 
 # PROGRAM MODULES
 from pizzapy.stock_option_update.option_proxy_model import make_option_proxy
+from pizzapy.database_update.postgres_buffer_model import UpsertBuffer
+from pizzapy.general_update.list_runner_model import SymbolFailure
 from pizzapy.database_update.postgres_command_model import table_list_dict
-from pizzapy.database_update.postgres_connection_model import make_psycopg_connection
+from pizzapy.database_update.postgres_connection_model import pooled_psycopg_connection
 
 
 
 
 
-def upsert_option_by_proxy(proxy: DictProxy) -> str:
+def upsert_option_by_proxy(proxy: DictProxy, buffer: Optional[UpsertBuffer] = None) -> str:
     """
     * INDEPENDENT *
-    IMPORTS: dimsumpy(upsert_psycopg), table_list_dict, make_psycopg_connection()
+    IMPORTS: dimsumpy(upsert_psycopg), table_list_dict, pooled_psycopg_connection(), UpsertBuffer
     USED BY: upsert_option()
     
     This function will not test whether the input DictProxy contains valid data, 
@@ -48,30 +50,36 @@ def upsert_option_by_proxy(proxy: DictProxy) -> str:
     Make sure the DictProxy parameter is valid before running this upsert function.
 
     upsert_psycopg returns the query_and_values string as a result.
+
+    When a buffer is given, the proxy is added to the buffer and written in the next batch flush instead of its own upsert.
     """
+    if buffer is not None:
+        return buffer.add(proxy)
     table_name: str = 'stock_option'
     pk_list: List[str] = table_list_dict[table_name].get('primary_key_list')
-    query_result: str = upsert_psycopg(dict=proxy, table=table_name, primary_key_list=pk_list, connection=make_psycopg_connection())
+    with pooled_psycopg_connection() as conn:
+        query_result: str = upsert_psycopg(dict=proxy, table=table_name, primary_key_list=pk_list, connection=conn)
     return query_result
 
 
 
-def upsert_option(symbol: str) -> str:
+def upsert_option(symbol: str, buffer: Optional[UpsertBuffer] = None) -> str:
     """
     DEPENDS ON: upsert_option_by_proxy()
-    IMPORTS: make_option_proxy()
+    IMPORTS: make_option_proxy(), SymbolFailure
     USED BY: upsert_symbols_terminal(), core_stock_update/core_update_controller.py
     I could wrap this function into try_str(upsert_option, symbol).
+    An invalid proxy returns a SymbolFailure, so a list update counts the symbol as failed.
     """
     SYMBOL: str = symbol.upper()
     proxy: DictProxy = make_option_proxy(SYMBOL)
     valid_data: bool = proxy.get('call_pc') is not None
 
     if valid_data:
-        upsert_result: str = upsert_option_by_proxy(proxy)
+        upsert_result: str = upsert_option_by_proxy(proxy, buffer=buffer)
         return f'{SYMBOL} {proxy} {upsert_result}'
     else:
-        return f'{symbol} {proxy} DictProxy data does not have call_pc, it is invalid'
+        return SymbolFailure(f'{symbol} {proxy} DictProxy data does not have call_pc, it is invalid')
 
 
 
@@ -0,0 +1,113 @@
+"""
+AIM:
+To get a td => adjclose OrderedDict from the stock_price table, and download from yahoo only when the table is missing dates.
+
+USED BY: technical_analysis_model.py
+
+make_odict() used to download FROM-1000 to TO+51 from yahoo for every 3-day window of upsert_technical(), although stock_price already holds that history.
+The database source is one range scan on the (symbol, td) primary key index.
+
+The database is considered missing dates when:
+    it has no row of the symbol in the date range.
+    its latest td is earlier than the latest trading day the web source would return.
+    two neighbouring stored td are more than 5 calendar days apart, a long weekend plus a holiday is 4 days, the longest closure since 2005 is 5 days (hurricane Sandy).
+I cannot tell a young stock from a history missing its earliest rows, so the start of the range is not checked, the web source starts at the IPO date too.
+
+"""
+# STANDARD LIBS
+
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, List
+
+
+# THIRD PARTY LIBS
+from pandas import DataFrame
+
+
+# CUSTOM LIBS
+from batterypy.time.cal import add_trading_days, get_trading_day_utc
+
+
+# PROGRAM MODULES
+from pizzapy.database_update.postgres_connection_model import execute_pandas_read
+from pizzapy.stock_price_update.raw_price_model import get_price_odict
+
+
+
+def get_database_price_odict(FROM: date, TO: date, SYMBOL: str, ascending: bool = True) -> OrderedDict[date, float]:
+    """
+    * INDEPENDENT *
+    IMPORTS: execute_pandas_read()
+    USED BY: get_auto_price_odict(), price_source_dict
+
+    Same result set as get_price_odict(), it DOES NOT include TO date.
+    """
+    order: str = 'ASC' if ascending else 'DESC'
+    cmd: str = f'SELECT td, adjclose FROM stock_price WHERE symbol = %(symbol)s AND td >= %(from_date)s AND td < %(to_date)s AND adjclose IS NOT NULL ORDER BY td {order}'
+    df: DataFrame = execute_pandas_read(cmd, params={'symbol': SYMBOL, 'from_date': FROM, 'to_date': TO})
+    odict: OrderedDict[date, float] = OrderedDict(zip(df['td'].tolist(), df['adjclose'].tolist()))
+    return odict
+
+
+
+def get_expected_latest_td(TO: date) -> date:
+    """
+    * INDEPENDENT *
+    IMPORTS: add_trading_days(), get_trading_day_utc()
+    USED BY: is_price_odict_complete()
+
+    The web source does not include TO date, and it has nothing after the latest trading day.
+    """
+    return min(add_trading_days(TO, -1), get_trading_day_utc())
+
+
+
+def is_price_odict_complete(odict: OrderedDict[date, float], TO: date, max_gap_days: int = 5) -> bool:
+    """
+    DEPENDS ON: get_expected_latest_td()
+    USED BY: get_auto_price_odict()
+
+    odict can be ascending or descending.
+    """
+    if not odict:
+        return False
+    tds: List[date] = sorted(odict)
+    if tds[-1] < get_expected_latest_td(TO):
+        return False
+    return all((later - earlier).days <= max_gap_days for earlier, later in zip(tds, tds[1:]))
+
+
+
+def get_auto_price_odict(FROM: date, TO: date, SYMBOL: str, ascending: bool = True) -> OrderedDict[date, float]:
+    """
+    DEPENDS ON: get_database_price_odict(), is_price_odict_complete()
+    IMPORTS: get_price_odict()
+    USED BY: price_source_dict
+
+    The database odict is used when it is complete, otherwise the whole range is downloaded from yahoo.
+    """
+    odict: OrderedDict[date, float] = get_database_price_odict(FROM, TO, SYMBOL, ascending=ascending)
+    return odict if is_price_odict_complete(odict, TO) else get_price_odict(FROM, TO, SYMBOL, ascending=ascending)
+
+
+
+# 'web' always downloads from yahoo, 'database' only reads stock_price, 'auto' reads stock_price and downloads when it is missing dates
+price_source_dict: Dict[str, Callable[..., OrderedDict[date, float]]] = {
+    'web': get_price_odict,
+    'database': get_database_price_odict,
+    'auto': get_auto_price_odict,
+}
+
+
+
+def test():
+    FROM = date(2023, 1, 3)
+    TO = date(2023, 9, 22)
+    odict = get_auto_price_odict(FROM, TO, 'AMD', ascending=False)
+    print(len(odict), next(iter(odict.items())))
+
+
+
+if __name__ == '__main__':
+    test()
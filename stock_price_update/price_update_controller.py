@@ -16,10 +16,13 @@ I can start a 2nd operation when the 1st operation is still running by using thr
 
 # STANDARD LIBS
 
+from collections import deque
 from datetime import date
+from functools import partial
 from itertools import dropwhile
 import re
 import time
+from types import GeneratorType
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
 
@@ -38,16 +41,39 @@ from dimsumpy.qt.threads import MyThread
 
 
 # PROGRAM MODULES
+from pizzapy.database_update.job_state_model import create_job, find_latest_job, get_job_symbols, resume_status_tuple, retry_status_tuple, run_tracked_symbol
 from pizzapy.database_update.stock_list_model import stock_list_dict
 
 from pizzapy.stock_price_update.price_update_view import PriceUpdateView
 
 from pizzapy.stock_price_update.price_update_database_model import upsert_price
 
-from pizzapy.stock_price_update.technical_update_database_model import upsert_technical
+from pizzapy.stock_price_update.technical_update_database_model import upsert_technical_backfill
 
 
 
+# the accessibleName of an update button => the table it updates
+button_table_dict: Dict[str, str] = {
+    'update_price_list_button': 'stock_price',
+    'update_price_button': 'stock_price',
+    'update_technical_list_button': 'stock_technical',
+    'update_technical_button': 'stock_technical',
+}
+
+table_upsert_dict: Dict[str, Any] = {
+    'stock_price': upsert_price,
+    'stock_technical': upsert_technical_backfill,
+}
+
+# the accessibleName of a job button => (table, statuses of the symbols to run)
+job_button_dict: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'resume_price_job_button': ('stock_price', resume_status_tuple),
+    'retry_price_job_button': ('stock_price', retry_status_tuple),
+    'resume_technical_job_button': ('stock_technical', resume_status_tuple),
+    'retry_technical_job_button': ('stock_technical', retry_status_tuple),
+}
+
+
 
 
 
@@ -85,12 +111,25 @@ def get_calendar_dates(self) -> Tuple[date, date]:
     return FROM, TO
 
 
-def call_upsert(self, FROM: date, TO: date, stockgen: Generator[str, None, None], progress_bar, progress_label) -> None:  
-    
+def consume_upsert(func: Any, FROM: date, TO: date, symbol: str) -> str:
     """
     * INDEPENDENT *
-    IMPORTS: upsert_price(), upsert_technical(), try_str()
-    USED BY: start_thread()
+    USED BY: call_upsert()
+
+    upsert_technical_backfill() returns a generator, it does nothing until it is consumed, so I cannot pass it to try_str() directly.
+    The last progress message is returned, the result of upsert_price() is returned as it is.
+    """
+    result = func(FROM, TO, symbol)
+    return next(iter(deque(result, maxlen=1)), 'NO TRADING DAYS') if isinstance(result, GeneratorType) else result
+
+
+
+def call_upsert(self, FROM: date, TO: date, stockgen: Generator[str, None, None], progress_bar, progress_label, table: str, list_name: Optional[str], job_id: Optional[str]) -> None:  
+    
+    """
+    DEPENDS ON: consume_upsert(), table_upsert_dict
+    IMPORTS: upsert_price(), upsert_technical_backfill(), try_str(), create_job(), run_tracked_symbol()
+    USED BY: launch_thread()
     
     # return type is not None
     This func runs in the QThread
@@ -100,18 +139,17 @@ def call_upsert(self, FROM: date, TO: date, stockgen: Generator[str, None, None]
     
         debug_text: str = f"{i} / {self.list_length} {symbol} {result}"
             #QCoreApplication.processEvents()  # this line will crash the progrom for 2+ active threads
+
+    table is chosen by the button in start_thread(), self.sender() is not the button any more in the QThread.
+    A list update becomes a new job of the job_state table, a resumed job passes its job_id, the dates are the calendar dates of the resumed run.
     """
-    sender = self.sender().accessibleName()
-    if sender == 'update_price_list_button' or sender == 'update_price_button':
-        func = upsert_price
-    elif sender == 'update_technical_list_button' or sender == 'update_technical_button':
-        func = upsert_technical
-    else:
-        print(f'INVALID SENDER: {sender}')
-        return
-    
-    for i, symbol in enumerate(stockgen, start=1): # if the list is too long, program will have Segmentation fault
-        result = try_str(func, FROM, TO, symbol)
+    symbols: List[str] = list(stockgen)
+    if job_id is None and list_name is not None:
+        job_id = create_job(table, list_name, symbols)
+    func = partial(consume_upsert, table_upsert_dict[table], FROM, TO)
+
+    for i, symbol in enumerate(symbols, start=1): # if the list is too long, program will have Segmentation fault
+        result = try_str(run_tracked_symbol, job_id, func, symbol)
         progress_bar.setValue(i)
         progress_label.setText(f'{i}  {symbol} ')
 
@@ -123,11 +161,28 @@ def call_upsert(self, FROM: date, TO: date, stockgen: Generator[str, None, None]
 @list_confirmation
 def start_thread(self, stock_list: List[str]) -> None:
     """
-    DEPENDS ON: self.calendar_get_dates(), self.call_upsert(), self.thread_finished()
-    IMPORTS: MyThread, list_confiramtion()
+    DEPENDS ON: launch_thread(), button_table_dict
+    IMPORTS: list_confiramtion()
     USED BY: update_symbols_lineedit(), update_price_list()
 
-    [FROM, TO, stockgen] is the arguments for self.call_upsert in MyThread
+    Only the list buttons make a job in the job_state table, the symbols in the lineedit are not tracked.
+    """
+    sender: str = self.sender().accessibleName()
+    if sender not in button_table_dict:
+        print(f'INVALID SENDER: {sender}')
+        return
+    list_name: Optional[str] = self.stock_list_combobox.currentText() if sender.endswith('_list_button') else None
+    launch_thread(self, stock_list, button_table_dict[sender], list_name, None)
+
+
+
+def launch_thread(self, stock_list: List[str], table: str, list_name: Optional[str], job_id: Optional[str]) -> None:
+    """
+    DEPENDS ON: self.calendar_get_dates(), self.call_upsert(), self.thread_finished()
+    IMPORTS: MyThread
+    USED BY: start_thread(), resume_price_job()
+
+    [FROM, TO, stockgen, progress_bar, progress_label, table, list_name, job_id] is the arguments for self.call_upsert in MyThread
 
     thread_id should NOT be self.thread_id as I may have multiple threads. If I use self.thread_id, it will overwrite the previous one.
 
@@ -138,11 +193,11 @@ def start_thread(self, stock_list: List[str]) -> None:
     The hbox, progress_bar and progress_label will be deleted on thread_finished() call back function.
     """
     thread_id: float = time.time()
-    job_id: str = str(thread_id)[-3:]  
+    thread_job_id: str = str(thread_id)[-3:]  
     list_length = len(stock_list)
     progress_bar = QProgressBar()
     progress_bar.setRange(0, list_length)
-    progress_job_label = QLabel(f'JOB {job_id}: ')
+    progress_job_label = QLabel(f'JOB {thread_job_id}: ')
     progress_label = QLabel('               ')
     hbox = QHBoxLayout()
 
@@ -153,11 +208,11 @@ def start_thread(self, stock_list: List[str]) -> None:
 
     FROM, TO = self.get_calendar_dates()
     stockgen = (x for x in stock_list)
-    thread: MyThread = MyThread(self.call_upsert, lambda tid=thread_id, box=hbox: self.thread_finished(tid, box), [FROM, TO, stockgen, progress_bar, progress_label])
+    thread: MyThread = MyThread(self.call_upsert, lambda tid=thread_id, box=hbox: self.thread_finished(tid, box), [FROM, TO, stockgen, progress_bar, progress_label, table, list_name, job_id])
     self.threads_dict[thread_id] = thread # added this line in 2019
     thread.start()  # start the run() in QThread
     thread.wait(2) # prevent crash
-    message = f'JOB {job_id}: Updating {list_length} stocks, {FROM} to {TO} ({self.sender().accessibleName()}) \n'
+    message = f'JOB {thread_job_id}: Updating {list_length} stocks, {FROM} to {TO} ({table}) \n'
     self.browser.append(message)
     self.statusbar.showMessage(message)
 
@@ -195,6 +250,27 @@ def update_list(self) -> None:
 
 
 
+def resume_price_job(self) -> None:
+    """
+    DEPENDS ON: launch_thread(), job_button_dict
+    IMPORTS: find_latest_job(), get_job_symbols(), QMessageBox
+
+    The resume buttons continue the latest interrupted price or technical job, the retry buttons run the failed symbols of the latest job again.
+    The FROM and TO dates are taken from the calendars again, they are not kept in the job.
+    """
+    table, statuses = job_button_dict[self.sender().accessibleName()]
+    job_id: Optional[str] = find_latest_job(table, statuses)
+    stock_list: List[str] = get_job_symbols(job_id, statuses) if job_id is not None else []
+    if not stock_list:
+        self.statusbar.showMessage(f'No {" or ".join(statuses)} symbols in the {table} jobs')
+        return
+    question: str = f'Update {len(stock_list)} {" or ".join(statuses)} stocks of job {job_id} ({table}), starting from {stock_list[0]}?'
+    reply = QMessageBox.question(self, 'Resume Job', question, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+    if reply == QMessageBox.StandardButton.Yes:
+        launch_thread(self, stock_list, table, None, job_id)
+
+
+
 def reset_calendar(self) -> None:
     sender: str = self.sender().accessibleName()
     today_: date = date.today()
@@ -274,6 +350,11 @@ class MakeUpdateConnects:
         
         self.update_price_button.clicked.connect(self.update_symbols_lineedit)
         self.update_technical_button.clicked.connect(self.update_symbols_lineedit)
+
+        self.resume_price_job_button.clicked.connect(self.resume_price_job)
+        self.retry_price_job_button.clicked.connect(self.resume_price_job)
+        self.resume_technical_job_button.clicked.connect(self.resume_price_job)
+        self.retry_technical_job_button.clicked.connect(self.resume_price_job)
         
 
 
@@ -316,8 +397,8 @@ class PriceUpdateController(PriceUpdateView):
     def get_calendar_dates(self) -> Tuple[date, date]:
         return get_calendar_dates(self)
 
-    def call_upsert(self, FROM: date, TO: date, stockgen: Generator[str, None, None], progress_bar, progress_label) -> None:  
-        return call_upsert(self, FROM, TO, stockgen, progress_bar, progress_label)  
+    def call_upsert(self, FROM: date, TO: date, stockgen: Generator[str, None, None], progress_bar, progress_label, table: str, list_name: Optional[str], job_id: Optional[str]) -> None:  
+        return call_upsert(self, FROM, TO, stockgen, progress_bar, progress_label, table, list_name, job_id)  
         
     def thread_finished(self, thread_id: float, box) -> None:
         return thread_finished(self, thread_id, box)
@@ -328,6 +409,9 @@ class PriceUpdateController(PriceUpdateView):
     def update_list(self) -> None:
         return update_list(self)
 
+    def resume_price_job(self) -> None:
+        return resume_price_job(self)
+
 
 
 def main() -> None:
@@ -11,7 +11,7 @@ from datetime import date, datetime, timezone
 from multiprocessing import Pool
 from multiprocessing.managers import DictProxy
 from timeit import default_timer
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 
 # THIRD PARTY LIBS
@@ -21,12 +21,15 @@ from pandas import DataFrame
 
 # CUSTOM LIBS
 from batterypy.control.trys import try_str
+from batterypy.time.cal import add_trading_days
 from dimsumpy.database.postgres import upsert_many_dataframe
 
 
 # PROGRAM MODULES
 from pizzapy.database_update.postgres_command_model import table_list_dict
-from pizzapy.database_update.postgres_connection_model import make_psycopg_connection
+from pizzapy.database_update.postgres_copy_model import copy_upsert_dataframe
+from pizzapy.database_update.postgres_connection_model import execute_pandas_read, pooled_psycopg_connection
+from pizzapy.general_update.config_model import get_config_value
 from pizzapy.stock_price_update.raw_price_model import get_price_dataframe, get_price_dataframe_odict
 
 
@@ -34,20 +37,43 @@ from pizzapy.stock_price_update.raw_price_model import get_price_dataframe, get_
 def upsert_price_by_dataframe(df: DataFrame) -> str:
     """
     * INDEPENDENT *
-    IMPORTS: dimsumpy(upsert_many_dataframe), table_list_dict, make_psycopg_connection()
+    IMPORTS: dimsumpy(upsert_many_dataframe), table_list_dict, pooled_psycopg_connection()
     USED BY: upsert_price()
     
     """
     table_name: str = 'stock_price'
     pk_list: List[str] = table_list_dict[table_name].get('primary_key_list')
-    query_result: str = upsert_many_dataframe(df, table=table_name, primary_key_list=pk_list, connection=make_psycopg_connection())
+    with pooled_psycopg_connection() as conn:
+        query_result: str = upsert_many_dataframe(df, table=table_name, primary_key_list=pk_list, connection=conn)
     return query_result
 
 
 
-def upsert_price(FROM: date, TO: date, SYMBOL: str) -> str:
+def upsert_price_by_copy(df: DataFrame) -> str:
     """
-    DEPENDS ON: upsert_price_by_dataframe()
+    * INDEPENDENT *
+    IMPORTS: copy_upsert_dataframe(), pooled_psycopg_connection()
+    USED BY: upsert_price()
+
+    The whole DataFrame is streamed by a binary COPY into a temporary table, then merged into stock_price by one INSERT ... ON CONFLICT statement.
+    """
+    with pooled_psycopg_connection() as conn:
+        query_result: str = copy_upsert_dataframe(df, table='stock_price', connection=conn)
+    return query_result
+
+
+
+# 'many' is the original row-by-row upsert, 'copy' is much faster for long date ranges
+price_loader_dict: Dict[str, Callable[[DataFrame], str]] = {
+    'many': upsert_price_by_dataframe,
+    'copy': upsert_price_by_copy,
+}
+
+
+
+def upsert_price(FROM: date, TO: date, SYMBOL: str, loader: str = 'many') -> str:
+    """
+    DEPENDS ON: price_loader_dict
     IMPORTS: get_price_dataframe()
     USED BY:
     
@@ -56,13 +82,15 @@ def upsert_price(FROM: date, TO: date, SYMBOL: str) -> str:
 
     I should wrap upsert_price into a try block when I call it, because getting dataframe might have error when the date range has no data.
         result = try_str(upsert_price, d1, d2, symbol)
+
+    loader is a key of price_loader_dict, 'many' or 'copy'.
     """
     df: DataFrame = get_price_dataframe(FROM, TO, SYMBOL)
-    result: str = upsert_price_by_dataframe(df)
+    result: str = price_loader_dict[loader](df)
     return result
 
 
-def upsert_latest_price(SYMBOL: str) -> str:
+def upsert_latest_price(SYMBOL: str, loader: str = 'many') -> str:
     """
     DEPENDS ON: upsert_price_by_dataframe()
     IMPORTS: get_price_dataframe()
@@ -73,14 +101,114 @@ def upsert_latest_price(SYMBOL: str) -> str:
 
     I should wrap upsert_price into a try block when I call it, because getting dataframe might have error when the date range has no data.
         result = try_str(upsert_price, d1, d2, symbol)
+
+    The full history is about 5,000 rows, loader='copy' writes it much faster, 'many' stays the default like upsert_price().
     """
     FROM: date = date(2005, 7, 1)
     TO: date = date.today()
-    result: str = upsert_price(FROM, TO, SYMBOL)
+    result: str = upsert_price(FROM, TO, SYMBOL, loader=loader)
     return result
 
 
 
+# latest stock_price td of each symbol, filled by prime_latest_price_dates() before a list update, each entry is used once by upsert_incremental_price()
+latest_price_date_dict: Dict[str, date] = {}
+
+
+
+def get_latest_price_dates(symbols: List[str]) -> Dict[str, date]:
+    """
+    * INDEPENDENT *
+    IMPORTS: execute_pandas_read()
+    USED BY: prime_latest_price_dates(), upsert_incremental_price()
+
+    ONE grouped query for the whole list, symbols without any row in stock_price are not in the result.
+    """
+    cmd: str = 'SELECT symbol, MAX(td) AS latest_td FROM stock_price WHERE symbol = ANY(%(symbols)s) GROUP BY symbol'
+    df: DataFrame = execute_pandas_read(cmd, params={'symbols': list(symbols)})
+    latest_dates: Dict[str, date] = dict(zip(df['symbol'], df['latest_td']))
+    return latest_dates
+
+
+
+def prime_latest_price_dates(symbols: List[str]) -> None:
+    """
+    DEPENDS ON: get_latest_price_dates()
+    USED BY: upsert_incremental_prices(), table_prepare_dict in stock_list_model.py
+    """
+    latest_price_date_dict.update(get_latest_price_dates(symbols))
+
+
+
+def get_stored_adjcloses(SYMBOL: str, FROM: date) -> Dict[date, float]:
+    """
+    * INDEPENDENT *
+    IMPORTS: execute_pandas_read()
+    USED BY: is_adjclose_revised()
+    """
+    cmd: str = 'SELECT td, adjclose FROM stock_price WHERE symbol = %(symbol)s AND td >= %(from_date)s'
+    df: DataFrame = execute_pandas_read(cmd, params={'symbol': SYMBOL, 'from_date': FROM})
+    stored_adjcloses: Dict[date, float] = dict(zip(df['td'], df['adjclose']))
+    return stored_adjcloses
+
+
+
+def is_adjclose_revised(df: DataFrame, stored_adjcloses: Dict[date, float], tolerance: float = 0.0001) -> bool:
+    """
+    * INDEPENDENT *
+    USED BY: upsert_incremental_price()
+
+    yahoo adjusts all previous adjclose after a split or a dividend, if the downloaded adjclose of an overlap day differs from the stored one, the stored history is out of date.
+    df td column is a '2023-09-22' string from yahoo csv.
+    """
+    for td_str, adjclose in zip(df['td'], df['adjclose']):
+        stored: Optional[float] = stored_adjcloses.get(date.fromisoformat(td_str))
+        if stored and abs(adjclose - stored) / stored > tolerance:
+            return True
+    return False
+
+
+
+def upsert_incremental_price(SYMBOL: str, latest_td: Optional[date] = None, overlap_days: Optional[int] = None, loader: str = 'many') -> str:
+    """
+    DEPENDS ON: latest_price_date_dict, get_latest_price_dates(), get_stored_adjcloses(), is_adjclose_revised(), upsert_latest_price()
+    IMPORTS: get_price_dataframe(), add_trading_days()
+    USED BY: upsert_incremental_prices(), stock_list_model.py
+
+    Only the days after the latest stored td are downloaded, plus an overlap of a few trading days before it.
+    The overlap picks up revised adjclose, when an overlap adjclose is revised by a split or a dividend, the whole history is downloaded again by upsert_latest_price().
+
+    The optional /etc/config.json key PRICE_OVERLAP_DAYS sets the default overlap (5 trading days).
+    A symbol without any stored row gets the whole history.
+    """
+    latest_td = latest_td or latest_price_date_dict.pop(SYMBOL, None) or get_latest_price_dates([SYMBOL]).get(SYMBOL)
+    if latest_td is None:
+        return f'FULL HISTORY {upsert_latest_price(SYMBOL, loader=loader)}'
+    overlap_days = overlap_days if overlap_days is not None else int(get_config_value('PRICE_OVERLAP_DAYS', 5))
+    FROM: date = add_trading_days(latest_td, -overlap_days)
+    TO: date = date.today()
+    df: DataFrame = get_price_dataframe(FROM, TO, SYMBOL)
+    if is_adjclose_revised(df, get_stored_adjcloses(SYMBOL, FROM)):
+        return f'ADJCLOSE REVISED, FULL HISTORY {upsert_latest_price(SYMBOL, loader=loader)}'
+    result: str = price_loader_dict[loader](df)
+    return f'FROM {FROM} {result}'
+
+
+
+def upsert_incremental_prices(symbols: List[str]) -> Generator[str, None, None]:
+    """
+    DEPENDS ON: prime_latest_price_dates(), upsert_incremental_price()
+    IMPORTS: try_str()
+
+    ONE grouped query gets the latest td of all symbols before the downloads start.
+    """
+    prime_latest_price_dates(symbols)
+    for symbol in symbols:
+        result: str = try_str(upsert_incremental_price, symbol)
+        yield f'{symbol} {result}'
+
+
+
 def test():
     d1 = date(2023, 2, 4)
     d2 = date(2023, 2, 4)
@@ -93,6 +93,15 @@ class UpdateGrid:
         self.update_technical_button = QPushButton('Update Technical')
         self.update_technical_button.setAccessibleName('update_technical_button')
 
+        self.resume_price_job_button = QPushButton('Resume Price Job')
+        self.resume_price_job_button.setAccessibleName('resume_price_job_button')
+        self.retry_price_job_button = QPushButton('Retry Failed Prices')
+        self.retry_price_job_button.setAccessibleName('retry_price_job_button')
+        self.resume_technical_job_button = QPushButton('Resume Technical Job')
+        self.resume_technical_job_button.setAccessibleName('resume_technical_job_button')
+        self.retry_technical_job_button = QPushButton('Retry Failed Technicals')
+        self.retry_technical_job_button.setAccessibleName('retry_technical_job_button')
+
         self.clear_button = QPushButton('Clear')
         self.quit_button = QPushButton('Quit')
 
@@ -107,8 +116,13 @@ class UpdateGrid:
         update_grid.addWidget(self.update_price_button,1, 2)
         update_grid.addWidget(self.update_technical_button, 1, 3)
         
-        update_grid.addWidget(self.clear_button, 2, 2)
-        update_grid.addWidget(self.quit_button,  2, 3)
+        update_grid.addWidget(self.resume_price_job_button, 2, 0)
+        update_grid.addWidget(self.retry_price_job_button, 2, 1)
+        update_grid.addWidget(self.resume_technical_job_button, 2, 2)
+        update_grid.addWidget(self.retry_technical_job_button, 2, 3)
+
+        update_grid.addWidget(self.clear_button, 3, 2)
+        update_grid.addWidget(self.quit_button,  3, 3)
 
         self.mainbox.addLayout(update_grid)
 
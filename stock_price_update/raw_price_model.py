@@ -15,9 +15,9 @@ from typing import Any, Dict, List, Tuple, Optional
 from pandas import DataFrame, to_datetime
 
 # CUSTOM LIBS
-from dimsumpy.web.crawler import get_csv_dataframe
 
 # PROGRAM MODULES
+from pizzapy.general_update.http_client_model import get_csv_dataframe
 
 
 def make_price_url(FROM: date, TO: date, SYMBOL: str) -> str:
@@ -14,10 +14,6 @@ When I prepare an OrderedDict data source, I should use TODAY, not last trading
 
 from collections import OrderedDict
 from datetime import date, datetime
-from functools import partial
-
-from multiprocessing import Pool
-import os
 from timeit import default_timer
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -33,7 +29,8 @@ from dimsumpy.finance.technical import quantile, convert_to_changes, calculate_r
 
 
 # PROGRAM MODULES
-from pizzapy.stock_price_update.raw_price_model import get_price_odict
+from pizzapy.general_update.executor_model import get_executor, map_with_shared
+from pizzapy.stock_price_update.price_source_model import price_source_dict
 
 
 
@@ -224,12 +221,24 @@ def compute_technical_values(odict: OrderedDict[date, float], td: date) -> Any:
 
 def make_technical_proxy(odict: OrderedDict[date, float], SYMBOL: str, td: date) -> Dict:
     """
-    DEPENDS ON: compute_technical_values()
-    IMPORTS: datetime
-    USED BY: 
+    DEPENDS ON: compute_technical_values(), make_technical_values_proxy()
+    USED BY: construct_technical_proxies()
 
     pairs argument is a dataset of extended dates, it is FROM-1000 till TO+50
     """
+    technical_values: Any = compute_technical_values(odict, td)
+    return make_technical_values_proxy(technical_values, SYMBOL, td)
+
+
+
+def make_technical_values_proxy(technical_values: Any, SYMBOL: str, td: date) -> Dict:
+    """
+    * INDEPENDENT *
+    IMPORTS: datetime
+    USED BY: make_technical_proxy(), technical_vector_model.py
+
+    technical_values is the 30-item tuple returned by compute_technical_values(), the proxy keys are the stock_technical columns.
+    """
     
     ma20, ma50, ma250, steep20, \
         steep50, steep250, ma50_distance, ma250_distance, \
@@ -237,7 +246,7 @@ def make_technical_proxy(odict: OrderedDict[date, float], SYMBOL: str, td: date)
         td_price, p20, p50, p100, p200, p500, \
         increase20, decrease20, increase50, decrease50, \
         best20, worst20, best50, worst50, \
-        gain20, fall20, gain50, fall50 = compute_technical_values(odict, td)
+        gain20, fall20, gain50, fall50 = technical_values
         
     proxy: Dict = {}
     proxy['symbol'] = SYMBOL
@@ -286,38 +295,47 @@ def make_technical_proxy(odict: OrderedDict[date, float], SYMBOL: str, td: date)
 
 
 
-def make_odict(FROM: date, TO: date, SYMBOL: str) -> OrderedDict[date, float]:
+def make_odict(FROM: date, TO: date, SYMBOL: str, source: str = 'auto') -> OrderedDict[date, float]:
     """
-    IMPORTS: get_price_odict()
-    USED BY: 
+    IMPORTS: price_source_dict
+    USED BY: construct_technical_proxies(), construct_vector_technical_proxies()
 
+    source is a key of price_source_dict, 'web', 'database' or 'auto'.
     """
     earlier_from = add_trading_days(FROM, -1000)
     later_to = add_trading_days(TO, 51)
-    odict: OrderedDict[date, float] = get_price_odict(earlier_from, later_to, SYMBOL, ascending=False)
+    odict: OrderedDict[date, float] = price_source_dict[source](earlier_from, later_to, SYMBOL, ascending=False)
     return odict
 
 
 
-def construct_technical_proxies(FROM: date, TO: date, SYMBOL: str) -> List[Any]:
+def make_technical_proxies(odict: OrderedDict[date, float], SYMBOL: str, FROM: date, TO: date) -> List[Any]:
     """
-    DEPENDS ON: make_odict(), make_technical_proxy()
-    IMPORTS: os, partial()
-    do not use kwargs in partial()
+    DEPENDS ON: make_technical_proxy()
+    IMPORTS: get_executor(), map_with_shared()
+    USED BY: construct_technical_proxies(), technical_engine_dict in technical_update_database_model.py
 
-    td_adjclose_pairs is a dataset of extended dates, it is FROM-1000 till TO+50
+    odict is a dataset of extended dates, it is FROM-1000 till TO+50, the proxies have the order of odict.
 
+    The 'technical' executor is a process executor shared by all symbols, the odict is sent to the workers once per chunk of dates.
     """
-    odict = make_odict(FROM, TO, SYMBOL)
-    
     from_to_trading_dates: List[date] = [key for (key, _) in odict.items() if FROM <= key <= TO]
     
-    with Pool(os.cpu_count()) as pool:
-        proxies: List[Any] = pool.map(partial(make_technical_proxy, odict, SYMBOL), from_to_trading_dates) 
+    proxies: List[Any] = map_with_shared(get_executor('technical', kind='process'), make_technical_proxy, (odict, SYMBOL), from_to_trading_dates)
     return proxies
 
 
 
+def construct_technical_proxies(FROM: date, TO: date, SYMBOL: str, source: str = 'auto') -> List[Any]:
+    """
+    DEPENDS ON: make_odict(), make_technical_proxies()
+    USED BY: upsert_technical_one()
+    """
+    odict = make_odict(FROM, TO, SYMBOL, source=source)
+    return make_technical_proxies(odict, SYMBOL, FROM, TO)
+
+
+
 def test():
     FROM = date(2023, 9, 19)
     TO = date(2023, 9, 22)
@@ -5,12 +5,13 @@
 
 # STANDARD LIBS
 
+from collections import OrderedDict
 from datetime import date
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 
 # THIRD PARTY LIBS
-
+from pandas import DataFrame
 
 # CUSTOM LIBS
 from batterypy.time.cal import get_trading_day_utc
@@ -21,29 +22,65 @@ from dimsumpy.database.postgres import upsert_many_dicts
 
 # PROGRAM MODULES
 from pizzapy.database_update.postgres_command_model import table_list_dict
-from pizzapy.database_update.postgres_connection_model import make_psycopg_connection
-from pizzapy.stock_price_update.technical_analysis_model import construct_technical_proxies
+from pizzapy.database_update.postgres_copy_model import copy_upsert_dataframe
+from pizzapy.database_update.postgres_connection_model import pooled_psycopg_connection
+from pizzapy.general_update.config_model import get_config_value
+from pizzapy.stock_price_update.technical_analysis_model import construct_technical_proxies, make_odict, make_technical_proxies
+from pizzapy.stock_price_update.technical_vector_model import make_vector_technical_proxies
 
 
 
 def upsert_technical_by_dicts(table_name: str, dicts: List[Dict]) -> str:
     """
     * INDEPENDENT *
-    IMPORTS: dimsumpy(upsert_many_dataframe), table_list_dict, make_psycopg_connection()
+    IMPORTS: dimsumpy(upsert_many_dataframe), table_list_dict, pooled_psycopg_connection()
     USED BY: upsert_technical()
     
     """
     #table_name: str = 'stock_technical'
     pk_list: List[str] = table_list_dict[table_name].get('primary_key_list')
-    query_result: str = upsert_many_dicts(dicts, table=table_name, primary_key_list=pk_list, connection=make_psycopg_connection())
+    with pooled_psycopg_connection() as conn:
+        query_result: str = upsert_many_dicts(dicts, table=table_name, primary_key_list=pk_list, connection=conn)
     return query_result
 
 
 
-def upsert_technical(FROM: date, TO: date, SYMBOL: str) -> Generator[str, None, None]:
+def upsert_technical_by_copy(table_name: str, dicts: List[Dict]) -> str:
     """
-    DEPENDS ON: upsert_technical_by_dicts()
-    IMPORTS: get_technical_proxies()
+    * INDEPENDENT *
+    IMPORTS: copy_upsert_dataframe(), pooled_psycopg_connection()
+    USED BY: upsert_technical()
+
+    The proxies are streamed by a binary COPY into a temporary table, then merged into the table by one INSERT ... ON CONFLICT statement.
+    """
+    with pooled_psycopg_connection() as conn:
+        query_result: str = copy_upsert_dataframe(DataFrame(dicts), table=table_name, connection=conn)
+    return query_result
+
+
+
+# 'many' is the original row-by-row upsert, 'copy' is much faster for long date ranges
+technical_loader_dict: Dict[str, Callable[[str, List[Dict]], str]] = {
+    'many': upsert_technical_by_dicts,
+    'copy': upsert_technical_by_copy,
+}
+
+
+
+# 'date' is the original per-date path in the 'technical' process executor, 'vector' computes all dates from numpy arrays
+# every engine is called as engine(odict, SYMBOL, FROM, TO) and returns the proxies of FROM..TO in descending dates
+# 'date' is the default of every caller, the vector engine is only used when it is asked for, see technical_vector_model.py
+technical_engine_dict: Dict[str, Callable[[OrderedDict, str, date, date], List[Dict]]] = {
+    'date': make_technical_proxies,
+    'vector': make_vector_technical_proxies,
+}
+
+
+
+def upsert_technical(FROM: date, TO: date, SYMBOL: str, loader: str = 'many', engine: str = 'date', source: str = 'auto') -> Generator[str, None, None]:
+    """
+    DEPENDS ON: technical_loader_dict, technical_engine_dict
+    IMPORTS: make_odict()
     USED BY:
     
     small letter 'from' is a reserved keyword
@@ -51,19 +88,52 @@ def upsert_technical(FROM: date, TO: date, SYMBOL: str) -> Generator[str, None,
 
     I should wrap upsert_technical into a try block when I call it, because getting dicts might have error when the date range has no data.
         result = try_str(upsert_technical, from_date, to_date, symbol)
+
+    loader is a key of technical_loader_dict, 'many' or 'copy'.
+    engine is a key of technical_engine_dict, 'date' or 'vector'.
+    source is a key of price_source_dict, 'auto' reads stock_price and downloads from yahoo only when the table is missing dates.
     """
     date_ranges = make_date_ranges(FROM, TO, 3)
     #generator = (x for x in [])
     for start, end in date_ranges:
-        proxies: List[Dict] = construct_technical_proxies(start, end, SYMBOL)
-        result: str = upsert_technical_by_dicts('stock_technical', proxies)
+        odict: OrderedDict[date, float] = make_odict(start, end, SYMBOL, source=source)
+        proxies: List[Dict] = technical_engine_dict[engine](odict, SYMBOL, start, end)
+        result: str = technical_loader_dict[loader]('stock_technical', proxies)
         yield result
     
 
+def upsert_technical_backfill(FROM: date, TO: date, SYMBOL: str, loader: str = 'copy', engine: str = 'date', source: str = 'auto', batch_size: Optional[int] = None) -> Generator[str, None, None]:
+    """
+    DEPENDS ON: technical_loader_dict, technical_engine_dict
+    IMPORTS: make_odict(), get_config_value()
+    USED BY: upsert_recent_technical(), price_update_controller.py
+
+    upsert_technical() rebuilds the price odict for every 3-day window, a 2-year backfill is about 170 windows per symbol.
+    Here the odict is built ONCE for the whole FROM..TO range, the proxies of batch_size dates are computed by the engine and written, then the next batch.
+    engine is a key of technical_engine_dict, 'date' is the same per-date computation as upsert_technical().
+
+    The optional /etc/config.json key TECHNICAL_BATCH_SIZE sets the default batch size (250 rows, about one year).
+    Each yielded string is the progress of one batch, like '250/502 2023-09-29..2022-09-30 250 rows copied into stock_technical'.
+    Nothing is computed until the generator is consumed.
+    """
+    batch_size = batch_size or int(get_config_value('TECHNICAL_BATCH_SIZE', 250))
+    odict: OrderedDict[date, float] = make_odict(FROM, TO, SYMBOL, source=source)
+    td_list: List[date] = sorted((td for td in odict if FROM <= td <= TO), reverse=True)
+    total: int = len(td_list)
+    done: int = 0
+    for start in range(0, total, batch_size):
+        batch_dates: List[date] = td_list[start:start + batch_size]
+        batch: List[Dict] = technical_engine_dict[engine](odict, SYMBOL, batch_dates[-1], batch_dates[0])
+        result: str = technical_loader_dict[loader]('stock_technical', batch)
+        done += len(batch)
+        yield f"{done}/{total} {batch[0]['td']}..{batch[-1]['td']} {result}"
+
+
+
 def upsert_technical_one(SYMBOL: str) -> str:
     """
     DEPENDS ON: upsert_technical_by_dicts()
-    IMPORTS: get_technical_proxies()
+    IMPORTS: construct_technical_proxies()
     USED BY:
     
     small letter 'from' is a reserved keyword
@@ -81,7 +151,7 @@ def upsert_technical_one(SYMBOL: str) -> str:
 
 def upsert_recent_technical(SYMBOL: str) -> None:
     """
-    DEPENDS ON: upsert_technical_by_dicts()
+    DEPENDS ON: upsert_technical_backfill()
     IMPORTS: get_technical_proxies()
     USED BY:
     
@@ -93,7 +163,7 @@ def upsert_recent_technical(SYMBOL: str) -> None:
     """
     TO: date = date.today()
     FROM: date = date(TO.year - 2, TO.month, TO.day)
-    result_gen = upsert_technical(FROM, TO, SYMBOL)
+    result_gen = upsert_technical_backfill(FROM, TO, SYMBOL)
     for result in result_gen:
         print(result)
 
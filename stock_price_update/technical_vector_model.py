@@ -0,0 +1,271 @@
+"""
+
+USED BY: stock_price_update/technical_update_database_model.py
+
+technical_analysis_model.compute_technical_values() filters the whole OrderedDict for every single date, so one symbol costs O(days x history) python work, and add_trading_days() is called once per key in check_top_bottom().
+This engine converts the OrderedDict into two ascending numpy arrays once, then:
+    the trading-day offsets (-20, -50 ... -999, +51) of every date are read from ONE trading calendar of the series, add_trading_days() is not called per date.
+    p20, p50, p100, p200, p500 and the bounds of the 500, 1000 and +50 day windows are arrays made from those offsets by binary search on the date array.
+    is_weekly_close() runs once per date of the series, the weekly closes of a date are a slice of one index array.
+    is_top, is_bottom compare td price with the max and min of the next 50 days slice.
+
+ma, steep, rsi, weekly_rsi and the quantile columns still call the dimsumpy functions, but only on the slice each of them reads, at most 1000 prices, never the whole history.
+The moving averages are sma() itself, so they add the prices in the same order as the per-date path.
+rsi is cut to RSI_LENGTH prices, that is the 14 * 14 + 1 days input of calculate_rsi() noted in get_weekly_rsi().
+tests/test_technical_vector_model.py checks that every column is EQUAL to the per-date path, until that holds with the real dimsumpy the per-date engine stays the default of every caller.
+
+"""
+# STANDARD LIBS
+
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# THIRD PARTY LIBS
+import numpy
+from numpy import ndarray
+
+
+# CUSTOM LIBS
+from batterypy.time.cal import add_trading_days, is_weekly_close
+from batterypy.number.format import round1, round2, round4
+from dimsumpy.finance.technical import calculate_rsi, sma, steep
+
+
+# PROGRAM MODULES
+from pizzapy.stock_price_update.technical_analysis_model import calculate_changes, make_odict, make_technical_values_proxy
+
+
+
+# calculate_rsi(14, prices) reads the latest 14 * 14 + 1 prices, steep(n, prices) reads the latest n * 3 + 5 prices
+RSI_LENGTH: int = 14 * 14 + 1
+
+
+
+def make_price_arrays(odict: OrderedDict[date, float]) -> Tuple[ndarray, ndarray]:
+    """
+    * INDEPENDENT *
+    IMPORTS: numpy
+    USED BY: make_vector_technical_proxies()
+
+    odict can be descending or ascending, the returned date and price arrays are ascending.
+    """
+    pairs: List[Tuple[date, float]] = sorted(odict.items())
+    dates: ndarray = numpy.array([key for key, _ in pairs], dtype='datetime64[D]')
+    prices: ndarray = numpy.array([value for _, value in pairs], dtype=numpy.float64)
+    return dates, prices
+
+
+
+def to_float(value: Any) -> Optional[float]:
+    """
+    * INDEPENDENT *
+    numpy float64 is converted to a python float, so that psycopg can adapt it, NaN becomes None.
+    """
+    return None if value is None or numpy.isnan(value) else float(value)
+
+
+
+def make_trading_calendar(dates: ndarray, before: int, after: int) -> ndarray:
+    """
+    * INDEPENDENT *
+    IMPORTS: add_trading_days()
+    USED BY: make_offset_dates()
+
+    The trading days from `before` trading days before the first date to `after` trading days after the last date, ascending.
+    One add_trading_days() call per calendar day, instead of one per offset per date.
+    """
+    d: date = add_trading_days(dates[0].astype(object), -before)
+    last: date = add_trading_days(dates[-1].astype(object), after)
+    calendar: List[date] = [d]
+    while d < last:
+        d = add_trading_days(d, 1)
+        calendar.append(d)
+    return numpy.array(calendar, dtype='datetime64[D]')
+
+
+
+def make_offset_dates(dates: ndarray, offsets: Tuple[int, ...]) -> Dict[int, ndarray]:
+    """
+    DEPENDS ON: make_trading_calendar()
+    IMPORTS: add_trading_days()
+    USED BY: make_window_arrays()
+
+    returns {offset: array of add_trading_days(date, offset) for every date}.
+    A date which is not a trading day of the calendar, like a price of a market holiday, gets its offsets from add_trading_days() itself.
+    """
+    calendar: ndarray = make_trading_calendar(dates, -min(offsets), max(offsets))
+    positions: ndarray = numpy.searchsorted(calendar, dates)
+    on_calendar: ndarray = calendar[numpy.minimum(positions, len(calendar) - 1)] == dates
+    offset_dict: Dict[int, ndarray] = {}
+    for offset in offsets:
+        offset_dates: ndarray = calendar[numpy.clip(positions + offset, 0, len(calendar) - 1)]
+        for i in numpy.flatnonzero(~on_calendar):
+            offset_dates[i] = numpy.datetime64(add_trading_days(dates[i].astype(object), offset), 'D')
+        offset_dict[offset] = offset_dates
+    return offset_dict
+
+
+
+def lookup_prices(dates: ndarray, prices: ndarray, targets: ndarray) -> ndarray:
+    """
+    * INDEPENDENT *
+    USED BY: make_window_arrays()
+
+    returns the price of every target date, NaN when the target date is not a key of the odict, like odict.get().
+    """
+    indexes: ndarray = numpy.searchsorted(dates, targets)
+    clipped: ndarray = numpy.minimum(indexes, len(dates) - 1)
+    return numpy.where(dates[clipped] == targets, prices[clipped], numpy.nan)
+
+
+
+def make_window_arrays(dates: ndarray, prices: ndarray) -> Dict[str, ndarray]:
+    """
+    DEPENDS ON: make_offset_dates(), lookup_prices()
+    USED BY: iterate_vector_technical_proxies()
+
+    The lookups of calculate_historical_prices() for every date at once, p20 and p50 fall back to the price one trading day earlier.
+    start500, start1000 and end50 are the slice bounds of the 500 days, 1000 days and the next 50 days windows of every date.
+    """
+    offset_dict: Dict[int, ndarray] = make_offset_dates(dates, (-20, -21, -50, -51, -100, -250, -500, -999, 51))
+    p20: ndarray = lookup_prices(dates, prices, offset_dict[-20])
+    p50: ndarray = lookup_prices(dates, prices, offset_dict[-50])
+    return {
+        'p20': numpy.where(numpy.isnan(p20), lookup_prices(dates, prices, offset_dict[-21]), p20),
+        'p50': numpy.where(numpy.isnan(p50), lookup_prices(dates, prices, offset_dict[-51]), p50),
+        'p100': lookup_prices(dates, prices, offset_dict[-100]),
+        'p250': lookup_prices(dates, prices, offset_dict[-250]),
+        'p500': lookup_prices(dates, prices, offset_dict[-500]),
+        'start500': numpy.searchsorted(dates, offset_dict[-500]),
+        'start1000': numpy.searchsorted(dates, offset_dict[-999]),
+        'end50': numpy.searchsorted(dates, offset_dict[51]),
+    }
+
+
+
+def make_weekly_indexes(dates: ndarray) -> ndarray:
+    """
+    * INDEPENDENT *
+    IMPORTS: is_weekly_close()
+    USED BY: iterate_vector_technical_proxies()
+
+    The ascending indexes of the weekly closes in the date array, the weekly closes of any window are one slice of it.
+    """
+    return numpy.flatnonzero([is_weekly_close(d) for d in dates.astype(object)])
+
+
+
+def compute_vector_technical_values(dates: ndarray, prices: ndarray, weekly_indexes: ndarray, window_dict: Dict[str, ndarray], i: int) -> Any:
+    """
+    IMPORTS: sma(), steep(), calculate_rsi(), calculate_changes(), round1(), round2(), round4()
+    USED BY: iterate_vector_technical_proxies()
+
+    i is the index of td in the ascending arrays, the returned tuple has the same order as compute_technical_values().
+    recent_prices(n) is the head of td_prices of the per-date path, descending, latest price first, so each dimsumpy call gets the n prices it reads.
+    window_dict is made by make_window_arrays(), there is no trading-day arithmetic left in here.
+    """
+    def recent_prices(n: int) -> List[float]:
+        return prices[max(i - n + 1, 0):i + 1][::-1].tolist()
+
+    td_price: float = float(prices[i])
+
+    ma20, ma50, ma250 = (sma(n, recent_prices(n)) for n in (20, 50, 250))
+    steep20, steep50, steep250 = (steep(n, recent_prices(n * 3 + 5)) for n in (20, 50, 250))
+    ma50_distance = (td_price - ma50) / ma50 if td_price and ma50 else None
+    ma250_distance = (td_price - ma250) / ma250 if td_price and ma250 else None
+
+    rsi: Optional[float] = calculate_rsi(14, recent_prices(RSI_LENGTH))
+
+    first_week, last_week = numpy.searchsorted(weekly_indexes, (window_dict['start1000'][i], i))
+    weekly_prices: List[float] = [td_price] + prices[weekly_indexes[first_week:last_week][::-1]].tolist()
+    weekly_rsi: Optional[float] = calculate_rsi(14, weekly_prices)
+
+    end50: int = int(window_dict['end50'][i])
+    plus_50_prices: ndarray = prices[i + 1:end50]
+    has_plus_50: bool = len(plus_50_prices) > 48 and bool(td_price)
+    is_top: Optional[int] = int(bool(td_price > plus_50_prices.max())) if has_plus_50 else None
+    is_bottom: Optional[int] = int(bool(td_price < plus_50_prices.min())) if has_plus_50 else None
+
+    p20, p50, p100, p200, p500 = (to_float(window_dict[key][i]) for key in ('p20', 'p50', 'p100', 'p250', 'p500'))
+    length500: int = i - int(window_dict['start500'][i]) + 1
+    prices_500: List[float] = recent_prices(length500) if length500 > 497 else []
+    increase20, decrease20, increase50, decrease50, best20, worst20, best50, worst50 = calculate_changes(prices_500, p20, p50)
+
+    gain20 = (best20 - td_price) / td_price if td_price and best20 else None
+    fall20 = (td_price - worst20) / td_price if td_price and worst20 else None
+    gain50 = (best50 - td_price) / td_price if td_price and best50 else None
+    fall50 = (td_price - worst50) / td_price if td_price and worst50 else None
+
+    technical_values = round2(ma20), round2(ma50), round2(ma250), round4(steep20), \
+        round4(steep50), round4(steep250), round4(ma50_distance), round4(ma250_distance), \
+        round2(rsi), round2(weekly_rsi), is_top, is_bottom, \
+        round2(td_price), round2(p20), round2(p50), round2(p100), round2(p200), round2(p500), \
+        round2(increase20), round2(decrease20), round2(increase50), round2(decrease50), \
+        round1(best20), round1(worst20), round1(best50), round1(worst50), \
+        round4(gain20), round4(fall20), round4(gain50), round4(fall50)
+
+    return technical_values
+
+
+
+def iterate_vector_technical_proxies(odict: OrderedDict[date, float], SYMBOL: str, FROM: date, TO: date) -> Iterator[Dict]:
+    """
+    DEPENDS ON: make_price_arrays(), make_weekly_indexes(), make_window_arrays(), compute_vector_technical_values()
+    IMPORTS: make_technical_values_proxy()
+    USED BY: make_vector_technical_proxies()
+
+    The proxies are descending in dates, the same order as construct_technical_proxies().
+    The arrays are built once, then one proxy is computed at a time, so a long backfill can be written in batches while it is being computed.
+    """
+    if not odict:
+        return
+    dates, prices = make_price_arrays(odict)
+    weekly_indexes: ndarray = make_weekly_indexes(dates)
+    window_dict: Dict[str, ndarray] = make_window_arrays(dates, prices)
+
+    start: int = int(numpy.searchsorted(dates, numpy.datetime64(FROM, 'D'), side='left'))
+    end: int = int(numpy.searchsorted(dates, numpy.datetime64(TO, 'D'), side='right'))
+    for i in range(end - 1, start - 1, -1):
+        technical_values: Any = compute_vector_technical_values(dates, prices, weekly_indexes, window_dict, i)
+        yield make_technical_values_proxy(technical_values, SYMBOL, dates[i].astype(object))
+
+
+
+def make_vector_technical_proxies(odict: OrderedDict[date, float], SYMBOL: str, FROM: date, TO: date) -> List[Dict]:
+    """
+    DEPENDS ON: iterate_vector_technical_proxies()
+    USED BY: construct_vector_technical_proxies(), technical_engine_dict in technical_update_database_model.py
+    """
+    return list(iterate_vector_technical_proxies(odict, SYMBOL, FROM, TO))
+
+
+
+def construct_vector_technical_proxies(FROM: date, TO: date, SYMBOL: str, source: str = 'auto') -> List[Dict]:
+    """
+    DEPENDS ON: make_vector_technical_proxies()
+    IMPORTS: make_odict()
+    USED BY: technical_update_database_model.py
+
+    No multiprocessing Pool here, a whole year of one symbol is computed faster in one process than the Pool can pickle the odict to its workers.
+    """
+    odict: OrderedDict[date, float] = make_odict(FROM, TO, SYMBOL, source=source)
+    return make_vector_technical_proxies(odict, SYMBOL, FROM, TO)
+
+
+
+def test():
+    FROM = date(2023, 9, 19)
+    TO = date(2023, 9, 22)
+
+    xs = construct_vector_technical_proxies(FROM, TO, 'AMD')
+
+    for d in xs:
+        print(d)
+        print('\n\n')
+
+
+
+if __name__ == '__main__':
+    test()
@@ -0,0 +1,20 @@
+import pytest
+from pizzapy.general_update import config_model
+
+
+@pytest.mark.parametrize('value, expected', [(True, True), (False, False), ('false', False), ('TRUE', True), (' False ', False)])
+def test_get_config_flag_parses_booleans_and_strings(monkeypatch, value, expected):
+    monkeypatch.setattr(config_model, 'read_config', lambda: {'FLAG': value})
+    assert config_model.get_config_flag('FLAG', True) is expected
+
+
+@pytest.mark.parametrize('value', ['no', 0, 1, None])
+def test_get_config_flag_rejects_other_values(monkeypatch, value):
+    monkeypatch.setattr(config_model, 'read_config', lambda: {'FLAG': value})
+    with pytest.raises(ValueError):
+        config_model.get_config_flag('FLAG', True)
+
+
+def test_get_config_flag_default(monkeypatch):
+    monkeypatch.setattr(config_model, 'read_config', lambda: {})
+    assert config_model.get_config_flag('FLAG', False) is False
@@ -0,0 +1,24 @@
+from pizzapy.core_stock_browser.core_browser_query_model import make_count_query, make_select_query, make_where_clause
+
+
+column_type_dict = {'symbol': 'text', 'td': 'date', 'zscore': 'double precision', 'sector': 'text'}
+
+
+def test_where_clause_keeps_null_cells_of_numeric_filters():
+    clause, params = make_where_clause(column_type_dict, ['AMD', 'NVDA'], {'zscore': '3', 'sector': ''}, {'zscore': '9.5'})
+    assert clause == ' WHERE symbol = ANY(%(symbols)s) AND ("zscore" >= %(floor_0)s OR "zscore" IS NULL) AND ("zscore" <= %(ceiling_0)s OR "zscore" IS NULL)'
+    assert params == {'symbols': ['AMD', 'NVDA'], 'floor_0': 3.0, 'ceiling_0': 9.5}
+
+
+def test_where_clause_text_and_nan_filters():
+    clause, params = make_where_clause(column_type_dict, ['AMD'], {'sector': 'Energy', 'zscore': 'nan', 'unknown': '1'}, {})
+    assert clause == ' WHERE symbol = ANY(%(symbols)s) AND "sector"::text IS DISTINCT FROM %(floor_0)s AND "zscore" IS NOT NULL'
+    assert params == {'symbols': ['AMD'], 'floor_0': 'Energy'}
+
+
+def test_select_query_selects_checked_columns_and_one_page():
+    cmd, params = make_select_query('guru_stock', column_type_dict, ['zscore'], ['AMD'], {}, {}, ('symbol', 'td'), 2, 100)
+    assert cmd == 'SELECT "symbol", "zscore" FROM "guru_stock" WHERE symbol = ANY(%(symbols)s) ORDER BY "symbol", "td" LIMIT %(limit)s OFFSET %(offset)s'
+    assert params == {'symbols': ['AMD'], 'limit': 101, 'offset': 200}
+    count_cmd, count_params = make_count_query('guru_stock', column_type_dict, ['AMD'], {}, {})
+    assert count_cmd == 'SELECT count(*) FROM "guru_stock" WHERE symbol = ANY(%(symbols)s)'
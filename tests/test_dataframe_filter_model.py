@@ -0,0 +1,37 @@
+import numpy as np
+from pandas import DataFrame
+from pizzapy.general_update.dataframe_filter_model import DataFrameFilter
+
+
+def make_filter():
+    df = DataFrame({'symbol': ['AMD', 'NVDA', 'MMM', 'WBA'], 'zscore': [3.5, 9.1, np.nan, 1.2]})
+    return DataFrameFilter(df)
+
+
+def shown_rows(data_filter):
+    return [row for row in range(len(data_filter.df)) if data_filter.accepts_row(row)]
+
+
+def test_floor_and_ceiling_keep_nan_cells():
+    data_filter = make_filter()
+    data_filter.set_filter(1, '2', True)
+    assert shown_rows(data_filter) == [0, 1, 2]
+    data_filter.set_filter(1, '5', False)
+    assert shown_rows(data_filter) == [0, 2]
+    data_filter.set_filter(1, '', True)
+    data_filter.set_filter(1, '', False)
+    assert shown_rows(data_filter) == [0, 1, 2, 3]
+
+
+def test_text_filters_hide_matching_cells():
+    data_filter = make_filter()
+    data_filter.set_filter(0, 'NVDA', True)
+    data_filter.set_filter(1, 'nan', False)
+    assert shown_rows(data_filter) == [0, 3]
+
+
+def test_sort_puts_numbers_before_nan_cells():
+    data_filter = make_filter()
+    rows = sorted(range(4), key=lambda row: data_filter.get_rank_array(1)[row])
+    assert rows == [3, 0, 1, 2]
+    assert data_filter.less_than(0, 0, 1)
@@ -0,0 +1,21 @@
+from pizzapy.database_update.generate_file_model import diff_stock_lists, read_option_roots
+
+
+def test_read_option_roots_keeps_unique_root_symbols():
+    lines = iter([
+        b'Root Symbol|Options Closing Type|Options Type|Expiration Date|Explicit Strike Price|Underlying Symbol|Underlying Issue Name|Pending\r\n',
+        b'AAPL|N|C|12/20/2024|150|AAPL|Apple Inc. - Common Stock|N\r\n',
+        b'AAPL|N|P|12/20/2024|150|AAPL|Apple Inc. - Common Stock|N\r\n',
+        b'NVDA|N|C|12/20/2024|140|NVDA|NVIDIA Corporation - Common Stock|N\r\n',
+        b'File Creation Time: 1119202417:14||||||\r\n',
+    ])
+    assert read_option_roots(lines) == {'AAPL', 'NVDA'}
+
+
+def test_diff_stock_lists_reports_added_and_removed_symbols():
+    old_data = {'generated': '2024-11-19 17:14:00', 'sp_500_stocks': ['AAPL', 'NVDA', 'WBA'], 'sp_500_dict': {}}
+    new_data = {'generated': '2024-12-23 09:00:00', 'sp_500_stocks': ['AAPL', 'NVDA', 'PLTR'], 'sp_500_dict': {}, 'option_traded_stocks': ['AAPL']}
+    assert diff_stock_lists(old_data, new_data) == {
+        'sp_500_stocks': {'added': ['PLTR'], 'removed': ['WBA']},
+        'option_traded_stocks': {'added': ['AAPL'], 'removed': []},
+    }
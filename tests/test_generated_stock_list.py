@@ -0,0 +1,17 @@
+import json
+
+import pytest
+from pizzapy.database_update import generated_stock_list
+
+
+def test_names_are_read_from_json():
+    with open(generated_stock_list.STOCK_LIST_PATH) as f:
+        data = json.load(f)
+    for name in generated_stock_list.stock_list_name_list:
+        assert getattr(generated_stock_list, name) == data.get(name, [])
+    assert generated_stock_list.sp_500_stocks == list(generated_stock_list.sp_500_dict)
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        generated_stock_list.russell_2000_stocks
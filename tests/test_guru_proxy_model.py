@@ -0,0 +1,53 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pizzapy.guru_stock_update import guru_proxy_model
+
+
+def proxy_fast(SYMBOL, proxy):
+    proxy['fast'] = 1
+
+
+def proxy_slow(SYMBOL, proxy):
+    time.sleep(0.3)
+    proxy['slow'] = 2
+
+
+def proxy_stuck(SYMBOL, proxy):
+    time.sleep(1.5)
+    proxy['stuck'] = 3
+
+
+def proxy_broken(SYMBOL, proxy):
+    raise ValueError('page changed')
+
+
+@pytest.fixture
+def guru(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(guru_proxy_model, 'initialize_dict', lambda SYMBOL: {'symbol': SYMBOL})
+    monkeypatch.setattr(guru_proxy_model, 'make_price_cap_proxy', lambda SYMBOL, proxy: None)
+    monkeypatch.setattr(guru_proxy_model, 'get_executor', lambda name, kind, max_workers: executor)
+    yield monkeypatch
+    executor.shutdown(wait=True)
+
+
+def test_timeout_counts_from_the_start_of_each_page(guru):
+    guru.setattr(guru_proxy_model, 'guru_proxy_function_list', [proxy_slow, proxy_slow, proxy_fast])
+    guru.setattr(guru_proxy_model, 'get_config_value', lambda key, default: 0.5 if key == 'GURU_FETCH_TIMEOUT' else default)
+    assert guru_proxy_model.process_guru('NVDA') == {'symbol': 'NVDA', 'slow': 2, 'fast': 1}
+
+
+def test_failed_page_keeps_the_other_columns(guru, capsys):
+    guru.setattr(guru_proxy_model, 'guru_proxy_function_list', [proxy_fast, proxy_broken])
+    assert guru_proxy_model.process_guru('NVDA') == {'symbol': 'NVDA', 'fast': 1}
+    assert "proxy_broken': 'page changed'" in capsys.readouterr().out
+
+
+def test_timed_out_page_keeps_the_other_columns(guru, capsys):
+    guru.setattr(guru_proxy_model, 'guru_proxy_function_list', [proxy_fast, proxy_stuck])
+    guru.setattr(guru_proxy_model, 'get_config_value', lambda key, default: 0.1 if key == 'GURU_FETCH_TIMEOUT' else default)
+    assert guru_proxy_model.process_guru('NVDA') == {'symbol': 'NVDA', 'fast': 1}
+    assert "proxy_stuck': 'TIMEOUT'" in capsys.readouterr().out
@@ -0,0 +1,13 @@
+import requests
+
+from pizzapy.general_update import http_client_model
+
+
+def test_every_request_waits_for_its_host(monkeypatch):
+    waits = []
+    monkeypatch.setattr(http_client_model, 'wait_for_host', waits.append)
+    monkeypatch.setattr(requests.Session, 'request', lambda self, method, url, *args, **kwargs: url)
+    session = http_client_model.RateLimitedSession('www.gurufocus.com')
+    for page in ('zscore', 'wealth_pc', 'rank'):
+        session.get(f'https://www.gurufocus.com/term/{page}/NVDA')
+    assert waits == ['www.gurufocus.com'] * 3
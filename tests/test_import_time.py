@@ -0,0 +1,23 @@
+import os
+
+import pytest
+from pizzapy.general_update.import_time_model import get_import_ms, import_budget_dict, measure_import_time, parse_import_time, pipeline_module_list
+
+
+def test_parse_import_time():
+    stderr = 'import time: self [us] | cumulative | imported package\nimport time:       120 |        350 | pizzapy.cli\nsome warning\n'
+    assert parse_import_time(stderr) == [('pizzapy.cli', 120, 350)]
+
+
+@pytest.mark.parametrize('module', ['pizzapy.cli', 'pizzapy.batch'])
+def test_menus_do_not_import_pipelines(module):
+    imported = {name for name, self_us, cumulative_us in measure_import_time(module)}
+    assert not imported & set(pipeline_module_list)
+
+
+# wall-clock time depends on the machine and its load, the budgets are checked only when PIZZAPY_BENCHMARK=1 is set
+@pytest.mark.skipif(os.environ.get('PIZZAPY_BENCHMARK') != '1', reason='import time benchmark, set PIZZAPY_BENCHMARK=1 to run it')
+@pytest.mark.parametrize('module', sorted(import_budget_dict))
+def test_import_time_budget(module):
+    rows = measure_import_time(module)
+    assert get_import_ms(rows, module) < import_budget_dict[module]
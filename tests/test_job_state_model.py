@@ -0,0 +1,34 @@
+import pytest
+
+from pizzapy.database_update import job_state_model, postgres_buffer_model
+from pizzapy.database_update.postgres_buffer_model import UpsertBuffer
+from pizzapy.general_update.list_runner_model import SymbolFailure
+
+
+@pytest.fixture
+def marks(monkeypatch):
+    marks = []
+    monkeypatch.setattr(job_state_model, 'mark_symbol', lambda job_id, symbol, status, error=None: marks.append((symbol, status)))
+    monkeypatch.setattr(job_state_model, 'mark_flushed_symbols', lambda job_id, symbols, failed_dict: marks.extend([(symbol, 'done') for symbol in symbols] + [(symbol, 'failed') for symbol in failed_dict]))
+    return marks
+
+
+def test_soft_failure_is_marked_failed(marks):
+    result = job_state_model.run_tracked_symbol('job', lambda symbol: SymbolFailure(f'{symbol} proxy missed wealth_pc'), 'AMD')
+    assert result == 'AMD proxy missed wealth_pc'
+    assert marks == [('AMD', 'running'), ('AMD', 'failed')]
+
+
+def test_buffered_symbol_is_done_after_its_flush(marks, monkeypatch):
+    monkeypatch.setattr(postgres_buffer_model, 'upsert_rows_isolated', lambda rows, table: (['AMD'], {'NVDA': 'bad value'}))
+    buffer = UpsertBuffer('guru_stock', on_flush=job_state_model.make_flush_marker('job'))
+    for symbol in ('AMD', 'NVDA'):
+        job_state_model.run_tracked_symbol('job', lambda symbol: buffer.add({'symbol': symbol}), symbol, is_buffered=True)
+    assert marks == [('AMD', 'running'), ('NVDA', 'running')]
+    assert buffer.flush() == ['NVDA bad value']
+    assert marks[2:] == [('AMD', 'done'), ('NVDA', 'failed')]
+    assert buffer.upserted == 1 and buffer.errors == ['NVDA bad value']
+
+
+def test_untracked_update_has_no_flush_marker():
+    assert job_state_model.make_flush_marker(None) is None
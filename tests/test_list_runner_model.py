@@ -0,0 +1,22 @@
+from pizzapy.general_update.list_runner_model import SymbolFailure, run_symbols_concurrently
+
+
+def upsert_test(symbol):
+    if symbol == 'BAD':
+        raise ValueError('no page')
+    if symbol == 'SOFT':
+        return SymbolFailure(f'{symbol} proxy missed wealth_pc')
+    return f'{symbol} ok'
+
+
+def test_soft_failure_is_counted_as_failed():
+    results = []
+    summary = run_symbols_concurrently(upsert_test, ['AMD', 'BAD', 'SOFT'], workers=2, on_result=lambda i, length, symbol, result: results.append(result))
+    assert summary['succeeded'] == 1
+    assert summary['failed'] == 2
+    assert summary['failed_symbols'] == {'BAD': 'no page', 'SOFT': 'SOFT proxy missed wealth_pc'}
+    assert sorted(results) == ['AMD ok', 'SOFT proxy missed wealth_pc', 'no page']
+
+
+def test_symbol_failure_is_still_a_string():
+    assert SymbolFailure('x') == 'x' and isinstance(SymbolFailure('x'), str)
@@ -0,0 +1,26 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pizzapy.general_update import page_cache_model
+
+
+URL = 'https://www.gurufocus.com/term/revenue-per-share/NVDA'
+
+
+def test_same_url_is_downloaded_once(monkeypatch):
+    downloads = []
+
+    def slow_download(url):
+        downloads.append(url)
+        time.sleep(0.2)
+        return '<html><title>NVDA Revenue per Share</title></html>'
+
+    monkeypatch.setattr(page_cache_model, 'get_html_text', slow_download)
+    page_cache = page_cache_model.PageCache(max_bytes=1024 * 1024, max_seconds=600)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        soups = list(executor.map(lambda _: page_cache.get_soup(URL), range(8)))
+    page_cache.get_text(URL)
+    assert downloads == [URL]
+    assert all(soup is soups[0] for soup in soups)
+    assert page_cache.misses == 1 and page_cache.hits == 8
+    assert page_cache.url_lock_dict == {}
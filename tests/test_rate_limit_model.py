@@ -0,0 +1,9 @@
+from pizzapy.general_update import rate_limit_model
+
+
+def test_request_and_symbol_limits_are_separate(monkeypatch):
+    limits = {'HOST_RATE_LIMITS': {'www.zacks.com': 2}, 'SYMBOL_RATE_LIMITS': {}}
+    monkeypatch.setattr(rate_limit_model, 'get_config_value', lambda key, default: limits[key])
+    monkeypatch.setattr(rate_limit_model, 'rate_limiter_dict', {})
+    assert rate_limit_model.get_rate_limiter('HOST_RATE_LIMITS', 'www.zacks.com').interval == 0.5
+    assert rate_limit_model.get_rate_limiter('SYMBOL_RATE_LIMITS', 'www.zacks.com') is None
@@ -0,0 +1,75 @@
+import pytest
+from pizzapy.general_update.response_cache_model import ResponseCache, fetch_cached_text
+
+
+URL = 'https://www.gurufocus.com/term/zscore/NVDA'
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b'', headers=None, encoding='utf-8'):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+
+
+class FakeSession:
+    """
+    replays the recorded responses in order and records the request headers, no network is used.
+    """
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+recorded_page = '<html><title>NVDA Altman Z-Score</title><td>Z-Score: 12.5</td></html>'.encode('utf-8')
+
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / 'responses.sqlite'))
+    yield response_cache
+    response_cache.close()
+
+
+def test_same_trading_day_is_served_from_cache(cache):
+    session = FakeSession([FakeResponse(200, recorded_page, {'ETag': '"v1"'})])
+    first = fetch_cached_text(session, URL, '2023-09-22', cache)
+    second = fetch_cached_text(session, URL, '2023-09-22', cache)
+    assert first == second == recorded_page.decode('utf-8')
+    assert len(session.requests) == 1
+
+
+def test_new_trading_day_revalidates_with_etag(cache):
+    session = FakeSession([
+        FakeResponse(200, recorded_page, {'ETag': '"v1"', 'Last-Modified': 'Fri, 22 Sep 2023 20:00:00 GMT'}),
+        FakeResponse(304),
+    ])
+    fetch_cached_text(session, URL, '2023-09-22', cache)
+    text = fetch_cached_text(session, URL, '2023-09-25', cache)
+    assert text == recorded_page.decode('utf-8')
+    assert session.requests[1][1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Fri, 22 Sep 2023 20:00:00 GMT'}
+    assert cache.get(URL, '2023-09-25')[3] == recorded_page
+
+
+def test_changed_page_replaces_body_and_errors_are_not_stored(cache):
+    changed_page = recorded_page.replace(b'12.5', b'13.1')
+    session = FakeSession([
+        FakeResponse(200, recorded_page, {'ETag': '"v1"'}),
+        FakeResponse(200, changed_page, {'ETag': '"v2"'}),
+        FakeResponse(503, b'Service Unavailable'),
+    ])
+    fetch_cached_text(session, URL, '2023-09-22', cache)
+    assert fetch_cached_text(session, URL, '2023-09-25', cache) == changed_page.decode('utf-8')
+    assert cache.get_latest(URL)[0] == '"v2"'
+    assert fetch_cached_text(session, URL, '2023-09-26', cache) == 'Service Unavailable'
+    assert cache.get(URL, '2023-09-26') is None
+    assert cache.purge('2023-09-25') == 1
@@ -0,0 +1,39 @@
+from datetime import date, datetime
+
+import pytest
+
+from pizzapy import scheduler
+from pizzapy.general_update import config_model
+
+
+@pytest.fixture(autouse=True)
+def no_config_file(monkeypatch):
+    """
+    write_stats() reads SCHEDULER_WARN_FRACTION, the tests must not need /etc/config.json.
+    """
+    monkeypatch.setattr(config_model, 'read_config', lambda: {})
+
+
+def make_job():
+    return scheduler.ScheduledJob('guru', 'guru_stock', 'sp500', '16:30')
+
+
+def test_restart_keeps_last_day_and_history(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler, 'get_stats_path', lambda: str(tmp_path / 'stats.json'))
+    job = make_job()
+    job.last_day = date(2023, 9, 29)
+    job.history.append({'started': '2023-09-29T16:30', 'seconds': 60.0, 'total': 503, 'succeeded': 500, 'failed': 3, 'symbols_per_minute': 503.0, 'job_id': None, 'error': None})
+    scheduler.write_stats([job])
+
+    restarted = make_job()
+    scheduler.load_stats([restarted])
+    assert restarted.last_day == date(2023, 9, 29)
+    assert list(restarted.history) == list(job.history)
+    assert not restarted.is_due(datetime(2023, 9, 29, 18, 0))
+
+
+def test_missing_stats_file_starts_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler, 'get_stats_path', lambda: str(tmp_path / 'missing.json'))
+    job = make_job()
+    scheduler.load_stats([job])
+    assert job.last_day is None and not job.history
@@ -0,0 +1,24 @@
+from pizzapy.database_update import stock_list_model
+from pizzapy.database_update.postgres_command_model import bookkeeping_table_dict, table_list_dict
+
+
+def test_empty_option_list_is_hidden(monkeypatch):
+    monkeypatch.setattr(stock_list_model, 'get_stock_list', lambda slug: [] if slug == 'option' else ['AMD'])
+    assert 'option' not in list(stock_list_model.list_slug_dict)
+    assert 'option' not in stock_list_model.list_slug_dict
+    assert not any(label.startswith('Option Stocks') for label in stock_list_model.get_stock_list_dict.__wrapped__())
+
+
+def test_option_list_is_shown_when_generated(monkeypatch):
+    monkeypatch.setattr(stock_list_model, 'get_stock_list', lambda slug: ['AMD'])
+    assert 'option' in list(stock_list_model.list_slug_dict)
+    assert stock_list_model.list_slug_dict['option'] == ['AMD']
+    assert 'Option Stocks (1)' in stock_list_model.get_stock_list_dict.__wrapped__()
+
+
+def test_every_updater_table_has_a_function():
+    """
+    the Core Updater combobox lists table_list_dict, the bookkeeping tables like job_state must not be listed.
+    """
+    assert set(table_list_dict) == set(stock_list_model.table_function_dict)
+    assert not set(bookkeeping_table_dict) & set(table_list_dict)
@@ -0,0 +1,17 @@
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from pizzapy.stock_price_update import technical_update_database_model as model
+
+
+def test_backfill_uses_the_date_engine_in_batches(monkeypatch):
+    days = [date(2023, 9, 29) - timedelta(days=k) for k in range(7)]
+    odict = OrderedDict((d, 100.0) for d in days)
+    calls = []
+    fake_engine = lambda odict, SYMBOL, FROM, TO: calls.append((FROM, TO)) or [{'td': d} for d in odict if FROM <= d <= TO]
+    monkeypatch.setattr(model, 'make_odict', lambda FROM, TO, SYMBOL, source: odict)
+    monkeypatch.setitem(model.technical_engine_dict, 'date', fake_engine)
+    monkeypatch.setitem(model.technical_loader_dict, 'copy', lambda table, dicts: f'{len(dicts)} rows')
+    results = list(model.upsert_technical_backfill(days[-1], days[0], 'TEST', batch_size=3))
+    assert calls == [(days[2], days[0]), (days[5], days[3]), (days[6], days[6])]
+    assert results[-1] == f'7/7 {days[6]}..{days[6]} 1 rows'
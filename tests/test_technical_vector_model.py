@@ -0,0 +1,49 @@
+import math
+from collections import OrderedDict
+from datetime import date
+import numpy
+from batterypy.time.cal import add_trading_days
+from pizzapy.stock_price_update.technical_analysis_model import make_technical_proxy
+from pizzapy.stock_price_update.technical_vector_model import make_offset_dates, make_vector_technical_proxies
+
+
+def make_synthetic_odict(TO: date, length: int) -> OrderedDict:
+    """
+    descending odict like get_price_odict(ascending=False), a few trading days are missing like a real price history.
+    """
+    odict = OrderedDict()
+    d = TO
+    for k in range(length):
+        if k % 389 != 13:
+            odict[d] = round(100.0 + 15.0 * math.sin(k / 23.0) + 4.0 * math.cos(k / 7.0) - k * 0.02, 2)
+        d = add_trading_days(d, -1)
+    return odict
+
+
+def test_vector_engine_matches_per_date_path():
+    """
+    Every stock_technical column of the vector engine must equal the per-date path, except the timestamp column t.
+    """
+    FROM = date(2023, 4, 3)
+    TO = date(2023, 9, 29)
+    odict = make_synthetic_odict(add_trading_days(TO, 51), 1400)
+    expected = [make_technical_proxy(odict, 'TEST', td) for td in odict if FROM <= td <= TO]
+    actual = make_vector_technical_proxies(odict, 'TEST', FROM, TO)
+    assert len(actual) == len(expected) > 0
+    for a, e in zip(actual, expected):
+        a.pop('t')
+        e.pop('t')
+        assert a.keys() == e.keys()
+        for key in e:
+            assert a[key] == e[key], f"{e['td']} {key}"
+
+
+def test_offset_dates_match_add_trading_days():
+    """
+    2023-09-30 is a Saturday, a date off the trading calendar gets its offsets from add_trading_days() itself.
+    """
+    days = [date(2023, 9, 27), date(2023, 9, 28), date(2023, 9, 29), date(2023, 9, 30)]
+    dates = numpy.array(days, dtype='datetime64[D]')
+    offset_dict = make_offset_dates(dates, (-999, -21, -20, 51))
+    for offset, offset_dates in offset_dict.items():
+        assert offset_dates.astype(object).tolist() == [add_trading_days(d, offset) for d in days], offset
@@ -15,7 +15,7 @@ from pandas import DataFrame
 # CUSTOM LIBS
 from batterypy.string.read import readf
 # PROGRAM MODULES
-from dimsumpy.web.crawler import get_html_dataframes
+from pizzapy.general_update.http_client_model import get_html_dataframes
 
 
 
@@ -39,7 +39,7 @@ def get_next_earning_date(dfs: List[DataFrame]) -> Optional[date]:
 def get_zacks_earnings(symbol: str) -> Tuple[Optional[date], Optional[float], Optional[float], Optional[float], Optional[float]]:
     """
     DEPENDS ON: get_earning_date()
-    IMPORTS: dimsumpy(get_html_dataframes), batterypy(readf)
+    IMPORTS: get_html_dataframes(), batterypy(readf)
     USED BY: proxy_zacks_earings()
 
     eps_ttm is the DILUTED eps for the past 12 months.
@@ -31,7 +31,7 @@ from batterypy.string.read import readf, readi
 from batterypy.time.cal import get_trading_day, get_trading_day_utc
 
 # PROGRAM MODULES
-from dimsumpy.web.crawler import get_html_dataframes, get_html_text
+from pizzapy.general_update.http_client_model import get_html_dataframes, get_html_text
 
 
 
@@ -146,7 +146,7 @@ def get_zacks_scores(symbol: str) -> Tuple[Optional[str], Optional[str], Optiona
     """
     DEPENDS ON: get_grades(), get_price_ratios(), get_changes()
 
-    IMPORTS: dimsumpy(get_html_dataframes)
+    IMPORTS: get_html_dataframes()
     
     USED BY: proxy_zacks_scores()
 